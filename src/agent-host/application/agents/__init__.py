@@ -27,6 +27,7 @@ from application.agents.llm_provider import (
     LlmConfig,
     LlmMessage,
     LlmMessageRole,
+    LlmPriority,
     LlmProvider,
     LlmProviderError,
     LlmProviderType,
@@ -65,6 +66,7 @@ __all__ = [
     "validate_response",
     "extract_widget_payload",
     # LLM Provider
+    "LlmPriority",
     "LlmProvider",
     "LlmProviderError",
     "LlmProviderType",
@@ -32,6 +32,18 @@ class LlmProviderType(str, Enum):
 
     OLLAMA = "ollama"
     OPENAI = "openai"
+    SCRIPTED = "scripted"  # Deterministic fake for load tests
+
+
+class LlmPriority(str, Enum):
+    """Admission priority of an LLM request when a model is saturated.
+
+    INTERACTIVE requests (a user waiting on the response) are admitted ahead
+    of BACKGROUND requests (scoring, item generation).
+    """
+
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
 
 
 # =============================================================================
@@ -321,11 +333,13 @@ class LlmToolDefinition:
         name: Unique name of the tool
         description: Human-readable description of what the tool does
         parameters: JSON Schema defining the tool's parameters
+        tags: Categorization tags (used for tool selection, not sent to the LLM)
     """
 
     name: str
     description: str
     parameters: dict[str, Any] = field(default_factory=dict)
+    tags: list[str] = field(default_factory=list)
 
     def to_openai_format(self) -> dict[str, Any]:
         """Convert to OpenAI function calling format."""
@@ -359,6 +373,7 @@ class LlmConfig:
         temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
         top_p: Top-p (nucleus) sampling parameter
         max_tokens: Maximum tokens to generate (None = model default)
+        seed: Fixed sampling seed for reproducible output (None = random)
         timeout: Request timeout in seconds
         base_url: Base URL for the API (if applicable)
         api_key: API key (if applicable)
@@ -369,6 +384,7 @@ class LlmConfig:
     temperature: float = 0.7
     top_p: float = 0.9
     max_tokens: int | None = None
+    seed: int | None = None
     timeout: float = 120.0
     base_url: str | None = None
     api_key: str | None = None
@@ -385,6 +401,7 @@ class LlmProvider(ABC):
     Implementations:
     - OllamaLlmProvider: For local Ollama deployments (development)
     - OpenAiLlmProvider: For OpenAI API (production option)
+    - ScriptedLlmProvider: Synthetic responses with configurable timing (load tests)
     - (Future) AnthropicLlmProvider, AzureOpenAiLlmProvider, etc.
 
     Usage:
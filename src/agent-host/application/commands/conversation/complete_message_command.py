@@ -129,6 +129,7 @@ class CompleteMessageCommandHandler(
             messages=conversation.state.messages,
             created_at=conversation.state.created_at,
             updated_at=conversation.state.updated_at,
+            version=conversation.state.state_version,
         )
 
         return self.ok(dto)
@@ -32,6 +32,7 @@ class MessageResponseDto:
     assistant_content: str
     tool_calls: list[dict[str, Any]] = field(default_factory=list)
     tool_results: list[dict[str, Any]] = field(default_factory=list)
+    conversation_version: int = 0  # Conversation state_version after the save
 
 
 @dataclass
@@ -113,6 +114,7 @@ class SendMessageCommandHandler(
             assistant_content="",  # Empty for now - streaming fills this
             tool_calls=[],
             tool_results=[],
+            conversation_version=conversation.state.state_version,
         )
 
         return self.ok(response)
@@ -5,6 +5,12 @@ Domain events are still published via CloudEventPublisher for external consumers
 but there are no internal projection handlers to maintain separate read models.
 
 All repositories now use the AggregateRoot directly for both reads and writes.
+The only handlers here keep in-process caches of aggregates consistent.
 """
 
-__all__: list[str] = []
+from application.events.domain.definition_cache_invalidation_handlers import AgentDefinitionCacheInvalidationHandler, ConversationTemplateCacheInvalidationHandler
+
+__all__: list[str] = [
+    "AgentDefinitionCacheInvalidationHandler",
+    "ConversationTemplateCacheInvalidationHandler",
+]
@@ -0,0 +1,91 @@
+"""Definition cache invalidation handlers.
+
+Drop cached AgentDefinition and ConversationTemplate DTOs when their
+aggregates change. The Repository publishes domain events to the Mediator
+after persistence, so the next GetDefinitionQuery / GetTemplateQuery
+reloads the new version.
+"""
+
+from neuroglia.mediation import DomainEventHandler
+
+from application.services.definition_cache import DEFINITION, TEMPLATE, DefinitionCache
+from domain.events.agent_definition import (
+    AgentDefinitionAccessUpdatedDomainEvent,
+    AgentDefinitionCreatedDomainEvent,
+    AgentDefinitionDeletedDomainEvent,
+    AgentDefinitionNameUpdatedDomainEvent,
+    AgentDefinitionSystemPromptUpdatedDomainEvent,
+    AgentDefinitionTemplateLinkUpdatedDomainEvent,
+    AgentDefinitionToolsUpdatedDomainEvent,
+    AgentDefinitionUpdatedDomainEvent,
+)
+from domain.events.conversation_template import (
+    ConversationTemplateCreatedDomainEvent,
+    ConversationTemplateDeletedDomainEvent,
+    ConversationTemplateDisplayUpdatedDomainEvent,
+    ConversationTemplateFlowUpdatedDomainEvent,
+    ConversationTemplateItemAddedDomainEvent,
+    ConversationTemplateItemRemovedDomainEvent,
+    ConversationTemplateItemsReorderedDomainEvent,
+    ConversationTemplateItemUpdatedDomainEvent,
+    ConversationTemplateMessagesUpdatedDomainEvent,
+    ConversationTemplateScoringUpdatedDomainEvent,
+    ConversationTemplateTimingUpdatedDomainEvent,
+    ConversationTemplateUpdatedDomainEvent,
+)
+
+AgentDefinitionChangedDomainEvent = (
+    AgentDefinitionCreatedDomainEvent
+    | AgentDefinitionUpdatedDomainEvent
+    | AgentDefinitionDeletedDomainEvent
+    | AgentDefinitionNameUpdatedDomainEvent
+    | AgentDefinitionSystemPromptUpdatedDomainEvent
+    | AgentDefinitionToolsUpdatedDomainEvent
+    | AgentDefinitionTemplateLinkUpdatedDomainEvent
+    | AgentDefinitionAccessUpdatedDomainEvent
+)
+
+ConversationTemplateChangedDomainEvent = (
+    ConversationTemplateCreatedDomainEvent
+    | ConversationTemplateUpdatedDomainEvent
+    | ConversationTemplateDeletedDomainEvent
+    | ConversationTemplateItemAddedDomainEvent
+    | ConversationTemplateItemUpdatedDomainEvent
+    | ConversationTemplateItemRemovedDomainEvent
+    | ConversationTemplateItemsReorderedDomainEvent
+    | ConversationTemplateFlowUpdatedDomainEvent
+    | ConversationTemplateTimingUpdatedDomainEvent
+    | ConversationTemplateDisplayUpdatedDomainEvent
+    | ConversationTemplateMessagesUpdatedDomainEvent
+    | ConversationTemplateScoringUpdatedDomainEvent
+)
+
+
+class AgentDefinitionCacheInvalidationHandler(DomainEventHandler[AgentDefinitionChangedDomainEvent]):  # type: ignore[type-var]
+    """Invalidates the cached AgentDefinitionDto of a changed definition."""
+
+    def __init__(self, definition_cache: DefinitionCache):
+        self._definition_cache = definition_cache
+
+    async def handle_async(self, event: AgentDefinitionChangedDomainEvent) -> None:  # type: ignore[override]
+        """Drop the cached definition.
+
+        Args:
+            event: The domain event
+        """
+        self._definition_cache.invalidate(DEFINITION, event.aggregate_id)
+
+
+class ConversationTemplateCacheInvalidationHandler(DomainEventHandler[ConversationTemplateChangedDomainEvent]):  # type: ignore[type-var]
+    """Invalidates the cached ConversationTemplateDto of a changed template."""
+
+    def __init__(self, definition_cache: DefinitionCache):
+        self._definition_cache = definition_cache
+
+    async def handle_async(self, event: ConversationTemplateChangedDomainEvent) -> None:  # type: ignore[override]
+        """Drop the cached template.
+
+        Args:
+            event: The domain event
+        """
+        self._definition_cache.invalidate(TEMPLATE, event.aggregate_id)
@@ -7,7 +7,7 @@ Architecture:
     application/orchestrator/
     ├── __init__.py           # Package exports
     ├── orchestrator.py       # Main Orchestrator coordinator
-    ├── context.py            # ConversationContext, ItemExecutionState, OrchestratorState
+    ├── context.py            # ConversationContext, ConversationHistory, ItemExecutionState, OrchestratorState
     ├── handlers/             # Event/message handlers
     │   ├── message_handler.py  # User text message handling
     │   ├── widget_handler.py   # Widget response handling
@@ -21,6 +21,7 @@ Architecture:
     ├── agent/                # Agent execution
     │   ├── agent_runner.py     # Agent invocation and event handling
     │   ├── tool_executor.py    # Tool execution via ToolProviderClient
+    │   ├── tool_selector.py    # Relevance-based tool pruning per turn
     │   └── stream_handler.py   # Content streaming to clients
     └── protocol/             # Protocol message senders
         ├── config_sender.py  # Configuration and flow control
@@ -32,9 +33,11 @@ from application.orchestrator.agent import (
     AgentRunner,
     StreamHandler,
     ToolExecutor,
+    ToolSelector,
 )
 from application.orchestrator.context import (
     ConversationContext,
+    ConversationHistory,
     ItemExecutionState,
     OrchestratorState,
 )
@@ -62,12 +65,14 @@ __all__ = [
     "Orchestrator",
     # Context and state
     "ConversationContext",
+    "ConversationHistory",
     "ItemExecutionState",
     "OrchestratorState",
     # Agent execution
     "AgentRunner",
     "StreamHandler",
     "ToolExecutor",
+    "ToolSelector",
     # Handlers
     "FlowHandler",
     "MessageHandler",
@@ -5,6 +5,7 @@ tool execution, and streaming response handling:
 
 - AgentRunner: Executes agents and streams events to clients
 - ToolExecutor: Creates tool execution functions for agent use
+- ToolSelector: Ranks tools against the turn and prunes the ones sent to the LLM
 - StreamHandler: Handles streaming content to WebSocket clients
 
 Agent Execution Architecture:
@@ -17,6 +18,10 @@ Agent Execution Architecture:
     ├── Creates tool executor functions
     └── Calls Tools Provider service
 
+    ToolSelector
+    ├── Ranks tools with BM25 (optionally blended with embeddings)
+    └── Keeps the top-K and pinned tools
+
     StreamHandler
     ├── Streams content in chunks
     └── Sends completion messages
@@ -25,9 +30,13 @@ Agent Execution Architecture:
 from application.orchestrator.agent.agent_runner import AgentRunner
 from application.orchestrator.agent.stream_handler import StreamHandler
 from application.orchestrator.agent.tool_executor import ToolExecutor
+from application.orchestrator.agent.tool_selector import Bm25ToolIndex, ToolEmbeddingBackend, ToolSelector
 
 __all__ = [
     "AgentRunner",
+    "Bm25ToolIndex",
     "StreamHandler",
+    "ToolEmbeddingBackend",
     "ToolExecutor",
+    "ToolSelector",
 ]
@@ -11,11 +11,12 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from application.agents import Agent, AgentEventType, AgentRunContext
 from application.orchestrator.agent.tool_executor import ToolExecutor
-from application.orchestrator.context import ConversationContext
+from application.orchestrator.context import ConversationContext, ConversationHistory
 from application.protocol.core import ProtocolMessage, create_message
 from application.protocol.data import ContentChunkPayload, ContentCompletePayload, ToolCallPayload, ToolResultPayload
 
 if TYPE_CHECKING:
+    from application.orchestrator.agent.tool_selector import ToolSelector
     from application.websocket.connection import Connection
 
 log = logging.getLogger(__name__)
@@ -69,6 +70,7 @@ class AgentRunner:
         tool_executor: ToolExecutor,
         send_chat_input_enabled: Any = None,
         send_error: Any = None,
+        tool_selector: "ToolSelector | None" = None,
     ) -> None:
         """Initialize the AgentRunner.
 
@@ -80,6 +82,7 @@ class AgentRunner:
             tool_executor: Executor for tool calls
             send_chat_input_enabled: Callback for enabling/disabling chat input
             send_error: Callback for sending error messages
+            tool_selector: Optional selector pruning the tools sent to the LLM per turn
         """
         self._agent = agent
         self._mediator = mediator
@@ -88,6 +91,7 @@ class AgentRunner:
         self._tool_executor = tool_executor
         self._send_chat_input_enabled = send_chat_input_enabled
         self._send_error = send_error
+        self._tool_selector = tool_selector
 
     async def run_stream(
         self,
@@ -200,8 +204,8 @@ class AgentRunner:
     ) -> AgentRunContext:
         """Build AgentRunContext from conversation history.
 
-        Loads the conversation messages from the read model and constructs
-        an AgentRunContext for agent execution.
+        Uses the context's in-memory message history, (re)loading it from the
+        conversation only when it is missing or stale.
 
         Args:
             context: The orchestrator's conversation context
@@ -210,33 +214,28 @@ class AgentRunner:
         Returns:
             AgentRunContext ready for agent.run_stream()
         """
-        from application.agents import LlmMessage
         from application.queries import GetConversationQuery
 
-        # Load conversation to get message history
-        user_info = {"sub": context.user_id}
-        result = await self._mediator.execute_async(
-            GetConversationQuery(
-                conversation_id=context.conversation_id,
-                user_info=user_info,
+        if context.history is None or context.history.stale:
+            # Load conversation to get message history
+            user_info = {"sub": context.user_id}
+            result = await self._mediator.execute_async(
+                GetConversationQuery(
+                    conversation_id=context.conversation_id,
+                    user_info=user_info,
+                )
             )
-        )
+            if result.is_success and result.data:
+                context.history = ConversationHistory.from_messages(result.data.messages, result.data.version)
+                log.debug(f"📜 Reloaded history of {context.conversation_id} at version {context.history.version}")
+
+        history = list(context.history.messages) if context.history is not None and not context.history.stale else []
 
-        history: list[LlmMessage] = []
-        if result.is_success and result.data:
-            conv_dto = result.data
-            # Convert stored messages to LlmMessage format
-            for msg in conv_dto.messages:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-
-                if role == "user":
-                    history.append(LlmMessage.user(content))
-                elif role == "assistant":
-                    history.append(LlmMessage.assistant(content))
-                elif role == "system":
-                    history.append(LlmMessage.system(content))
-                # Skip tool messages for now - they're included in context implicitly
+        # Send only the tools relevant to this turn (selected once, used by every iteration)
+        tools = context.tools  # Tools loaded from ToolProviderClient
+        if self._tool_selector is not None and tools:
+            tools = await self._tool_selector.select(tools, user_message, history, previous=context.selected_tool_names)
+            context.selected_tool_names = [tool.name for tool in tools]
 
         # Create tool executor function
         tool_executor_fn = self._tool_executor.create_executor(access_token=context.access_token)
@@ -244,7 +243,7 @@ class AgentRunner:
         return AgentRunContext(
             user_message=user_message,
             conversation_history=history,
-            tools=context.tools,  # Tools loaded from ToolProviderClient
+            tools=tools,
             tool_executor=tool_executor_fn,
             access_token=context.access_token,
             metadata={
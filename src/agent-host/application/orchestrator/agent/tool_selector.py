@@ -0,0 +1,257 @@
+"""Relevance-based tool selection for agent turns.
+
+Every tool definition sent to the LLM costs prompt tokens on every ReAct
+iteration. With hundreds of tools the definitions alone dominate the prompt,
+so the ToolSelector ranks the user's tools against the current message (and
+the most recent turns) and only the top-K, plus pinned tools, are sent.
+
+Ranking:
+- Lexical: Okapi BM25 over tool name, tags and description (names and tags
+  weigh more than descriptions). One index per distinct tool set, shared by
+  all users with that set.
+- Optional hybrid: cosine similarity from a ToolEmbeddingBackend, blended
+  with the normalized BM25 score. Embedding failures fall back to BM25.
+
+Selection happens once per user turn; all iterations of the turn use it.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Protocol
+
+from application.agents import LlmMessage, LlmToolDefinition
+from observability import tool_selection_time, tools_selected
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.abstractions import ApplicationBuilderBase
+
+log = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+_STOP_WORDS = frozenset("a an and are as at be by can could do for from has have how in is it me my of on or please the this to what when which with would you your".split())
+
+# Field weights: a term in the tool name or tags counts as several description terms
+_NAME_WEIGHT = 3
+_TAG_WEIGHT = 2
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms (snake_case, camelCase and dotted names are split)."""
+    return [term for term in (word.lower() for word in _WORD_PATTERN.findall(text)) if len(term) > 1 and term not in _STOP_WORDS]
+
+
+class ToolEmbeddingBackend(Protocol):
+    """Protocol for text embedding backends used for hybrid ranking."""
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts into vectors (one per text, in order)."""
+        ...
+
+
+class Bm25ToolIndex:
+    """Okapi BM25 index over a fixed list of tools."""
+
+    def __init__(self, tools: Sequence[LlmToolDefinition], k1: float = 1.5, b: float = 0.75) -> None:
+        """Build the index.
+
+        Args:
+            tools: Tools to index (scores are returned in the same order)
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self._k1 = k1
+        self._b = b
+        self._documents = [Counter(self._terms(tool)) for tool in tools]
+        self._lengths = [sum(document.values()) for document in self._documents]
+        self._average_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        document_frequency: Counter[str] = Counter()
+        for document in self._documents:
+            document_frequency.update(document.keys())
+        count = len(self._documents)
+        self._idf = {term: math.log(1 + (count - df + 0.5) / (df + 0.5)) for term, df in document_frequency.items()}
+
+    @staticmethod
+    def _terms(tool: LlmToolDefinition) -> list[str]:
+        return tokenize(tool.name) * _NAME_WEIGHT + tokenize(" ".join(tool.tags)) * _TAG_WEIGHT + tokenize(tool.description)
+
+    def score(self, query: str) -> list[float]:
+        """Score every indexed tool against a query."""
+        terms = [term for term in set(tokenize(query)) if term in self._idf]
+        scores = []
+        for document, length in zip(self._documents, self._lengths, strict=True):
+            score = 0.0
+            for term in terms:
+                frequency = document.get(term, 0)
+                if frequency:
+                    norm = self._k1 * (1 - self._b + self._b * length / self._average_length)
+                    score += self._idf[term] * frequency * (self._k1 + 1) / (frequency + norm)
+            scores.append(score)
+        return scores
+
+
+class ToolSelector:
+    """Selects the tools sent to the LLM for a user turn."""
+
+    def __init__(
+        self,
+        top_k: int = 12,
+        min_tools: int = 20,
+        pinned_tools: list[str] | None = None,
+        history_messages: int = 2,
+        embedding_backend: ToolEmbeddingBackend | None = None,
+        embedding_weight: float = 0.5,
+        max_indexes: int = 64,
+        max_embeddings: int = 4096,
+    ) -> None:
+        """Initialize the selector.
+
+        Args:
+            top_k: Number of ranked tools to select (pinned tools come on top)
+            min_tools: Tool sets of this size or smaller are not pruned
+            pinned_tools: Tool names that are always selected
+            history_messages: Recent conversation messages added to the query
+            embedding_backend: Optional backend for hybrid (lexical + semantic) ranking
+            embedding_weight: Share of the embedding similarity in the hybrid score (0-1)
+            max_indexes: Maximum number of cached BM25 indexes (one per distinct tool set)
+            max_embeddings: Maximum number of cached tool embeddings (least recently used are dropped)
+        """
+        self._top_k = top_k
+        self._min_tools = min_tools
+        self._pinned_tools = set(pinned_tools or [])
+        self._history_messages = history_messages
+        self._embedding_backend = embedding_backend
+        self._embedding_weight = embedding_weight
+        self._max_indexes = max_indexes
+        self._max_embeddings = max_embeddings
+        self._indexes: OrderedDict[str, Bm25ToolIndex] = OrderedDict()
+        self._embeddings: OrderedDict[str, list[float]] = OrderedDict()
+
+    async def select(
+        self,
+        tools: list[LlmToolDefinition],
+        user_message: str,
+        history: list[LlmMessage] | None = None,
+        previous: list[str] | None = None,
+    ) -> list[LlmToolDefinition]:
+        """Select the tools for a user turn.
+
+        Args:
+            tools: All tools available to the user
+            user_message: The current user message
+            history: Conversation history (the most recent messages join the query)
+            previous: Tool names selected in the previous turn, reused when nothing matches
+
+        Returns:
+            The selected tools, in their original order (all tools when nothing
+            matches and there is no previous selection to reuse)
+        """
+        if len(tools) <= max(self._min_tools, self._top_k):
+            return tools
+
+        started = time.perf_counter()
+        earlier = list(history or [])
+        if earlier and earlier[-1].content == user_message:
+            earlier.pop()  # The history may already hold the current message
+        recent = [message.content for message in earlier[-self._history_messages :]] if self._history_messages > 0 else []
+        query = " ".join([*recent, user_message])
+        scores = self._index(tools).score(query)
+        if self._embedding_backend is not None:
+            scores = await self._blend_embedding_scores(tools, query, scores)
+
+        ranked = sorted((index for index, score in enumerate(scores) if score > 0), key=lambda index: scores[index], reverse=True)
+        chosen = set(ranked[: self._top_k])
+        if not chosen and previous:
+            # Nothing matched (e.g. "yes, do it"): keep the previous turn's tools
+            chosen = {index for index, tool in enumerate(tools) if tool.name in previous}
+        if not chosen:
+            # No basis for pruning: send every tool rather than only the pinned ones
+            chosen = set(range(len(tools)))
+        chosen.update(index for index, tool in enumerate(tools) if tool.name in self._pinned_tools)
+
+        selected = [tool for index, tool in enumerate(tools) if index in chosen]
+        tool_selection_time.record((time.perf_counter() - started) * 1000)
+        tools_selected.record(len(selected))
+        log.debug(f"🔧 Selected {len(selected)}/{len(tools)} tools: {[tool.name for tool in selected]}")
+        return selected
+
+    def _index(self, tools: list[LlmToolDefinition]) -> Bm25ToolIndex:
+        key = hashlib.sha256("\x00".join(f"{tool.name}\x01{tool.description}\x01{','.join(tool.tags)}" for tool in tools).encode()).hexdigest()
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = Bm25ToolIndex(tools)
+            while len(self._indexes) > self._max_indexes:
+                self._indexes.popitem(last=False)
+        self._indexes.move_to_end(key)
+        return index
+
+    async def _blend_embedding_scores(self, tools: list[LlmToolDefinition], query: str, scores: list[float]) -> list[float]:
+        assert self._embedding_backend is not None  # nosec B101 - checked by caller
+        texts = {tool.name: f"{tool.name}: {tool.description}" for tool in tools}
+        embeddings: dict[str, list[float]] = {}
+        for text in texts.values():
+            if text in self._embeddings:
+                embeddings[text] = self._embeddings[text]
+                self._embeddings.move_to_end(text)
+        try:
+            missing = [text for text in texts.values() if text not in embeddings]
+            vectors = await self._embedding_backend.embed([query, *missing])
+        except Exception as e:
+            log.warning(f"Tool embedding failed, ranking with BM25 only: {e}")
+            return scores
+        for text, vector in zip(missing, vectors[1:], strict=True):
+            embeddings[text] = self._embeddings[text] = vector
+        while len(self._embeddings) > self._max_embeddings:
+            self._embeddings.popitem(last=False)
+        query_vector = vectors[0]
+
+        top = max(scores) or 1.0
+        weight = self._embedding_weight
+        return [(1 - weight) * score / top + weight * max(0.0, _cosine(query_vector, embeddings[texts[tool.name]])) for tool, score in zip(tools, scores, strict=True)]
+
+    @staticmethod
+    def configure(builder: "ApplicationBuilderBase") -> "ToolSelector | None":
+        """Configure the ToolSelector singleton.
+
+        Args:
+            builder: The application builder
+
+        Returns:
+            The selector, or None if disabled
+        """
+        from application.settings import app_settings
+
+        if not app_settings.tool_selection_enabled:
+            log.info("⏭️ ToolSelector disabled")
+            return None
+
+        embedding_backend = None
+        if app_settings.tool_selection_embedding_model:
+            from infrastructure.adapters.ollama_embedding_backend import OllamaEmbeddingBackend
+
+            embedding_backend = OllamaEmbeddingBackend(base_url=app_settings.ollama_url, model=app_settings.tool_selection_embedding_model)
+
+        selector = ToolSelector(
+            top_k=app_settings.tool_selection_top_k,
+            min_tools=app_settings.tool_selection_min_tools,
+            pinned_tools=app_settings.tool_selection_pinned_tools,
+            history_messages=app_settings.tool_selection_history_messages,
+            embedding_backend=embedding_backend,
+            embedding_weight=app_settings.tool_selection_embedding_weight,
+        )
+        builder.services.add_singleton(ToolSelector, singleton=selector)
+        log.info(
+            f"✅ Configured ToolSelector: top_k={app_settings.tool_selection_top_k}, min_tools={app_settings.tool_selection_min_tools}, "
+            f"embeddings={app_settings.tool_selection_embedding_model or 'off'}"
+        )
+        return selector
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b, strict=False))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
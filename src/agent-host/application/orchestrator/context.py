@@ -3,6 +3,7 @@
 This module contains the core data structures used by the orchestrator:
 - OrchestratorState: Enum defining the state machine states
 - ItemExecutionState: Tracks execution of a single template item
+- ConversationHistory: Converted message history of a live conversation
 - ConversationContext: Full context for an active conversation
 
 These dataclasses are designed to be:
@@ -278,6 +279,103 @@ class ItemExecutionState:
         )
 
 
+@dataclass
+class ConversationHistory:
+    """Converted LLM message history of a live conversation.
+
+    Loaded once when the orchestrator initializes and then kept in step with
+    the writes this connection makes, so agent turns do not re-read and
+    re-convert the whole conversation.
+
+    Every save of the Conversation aggregate increments its state_version.
+    A write is applied only if it directly follows the version this history
+    reflects; otherwise the conversation was changed elsewhere (another
+    node, another code path) and the history is marked stale to be reloaded.
+
+    Attributes:
+        version: Persisted state_version this history reflects
+        messages: LlmMessage list in conversation order
+        message_ids: Persisted message ID of each entry in messages
+        stale: Whether the history must be reloaded before use
+    """
+
+    version: int = 0
+    messages: list[Any] = field(default_factory=list)
+    message_ids: list[str] = field(default_factory=list)
+    stale: bool = False
+
+    @classmethod
+    def from_messages(cls, messages: list[dict[str, Any]], version: int) -> "ConversationHistory":
+        """Build the history from persisted conversation messages.
+
+        Args:
+            messages: Serialized messages of the Conversation aggregate
+            version: The conversation's state_version
+
+        Returns:
+            A new ConversationHistory
+        """
+        history = cls(version=version)
+        for msg in messages:
+            history._append(msg.get("id", ""), msg.get("role", "user"), msg.get("content", ""))
+        return history
+
+    def append(self, version: int, *entries: tuple[str, str, str]) -> bool:
+        """Apply a write that added messages.
+
+        Args:
+            version: state_version returned by the write
+            entries: (message_id, role, content) of each added message, in order
+
+        Returns:
+            True if applied, False if the history is now stale
+        """
+        if not self._follows(version):
+            return False
+        for message_id, role, content in entries:
+            self._append(message_id, role, content)
+        return True
+
+    def update_content(self, version: int, message_id: str, content: str) -> bool:
+        """Apply a write that replaced the content of a message.
+
+        Args:
+            version: state_version returned by the write
+            message_id: The updated message
+            content: Its new content
+
+        Returns:
+            True if applied, False if the history is now stale
+        """
+        if not self._follows(version):
+            return False
+        if message_id in self.message_ids:
+            index = self.message_ids.index(message_id)
+            self.messages[index].content = content
+        return True
+
+    def _follows(self, version: int) -> bool:
+        if self.stale or version != self.version + 1:
+            self.stale = True
+            return False
+        self.version = version
+        return True
+
+    def _append(self, message_id: str, role: str, content: str) -> None:
+        from application.agents import LlmMessage
+
+        if role == "user":
+            self.messages.append(LlmMessage.user(content))
+        elif role == "assistant":
+            self.messages.append(LlmMessage.assistant(content))
+        elif role == "system":
+            self.messages.append(LlmMessage.system(content))
+        else:
+            # Skip tool messages for now - they're included in context implicitly
+            return
+        self.message_ids.append(message_id)
+
+
 @dataclass
 class ConversationContext:
     """Context for an active conversation orchestration.
@@ -309,7 +407,9 @@ class ConversationContext:
         last_activity: Timestamp of last user/agent activity
         client_capabilities: Capabilities declared by the client
         tools: Available tools for this conversation
+        selected_tool_names: Tools sent to the LLM in the last agent turn
         access_token: User's access token for tool execution
+        history: Converted message history (None until loaded)
         pending_widget_id: Widget awaiting response
         pending_tool_call_id: Tool call awaiting result
     """
@@ -351,8 +451,12 @@ class ConversationContext:
 
     # Tools and authentication
     tools: list[Any] = field(default_factory=list)
+    selected_tool_names: list[str] = field(default_factory=list)
     access_token: str | None = None
 
+    # Message history (kept in step with this connection's writes)
+    history: ConversationHistory | None = None
+
     # Pending operations
     pending_widget_id: str | None = None
     pending_tool_call_id: str | None = None
@@ -30,6 +30,7 @@ class MessageHandler:
     - Persists user message via domain command
     - Delegates to agent runner for response generation
     - Persists assistant response
+    - Keeps the context's message history in step with these writes
 
     This handler coordinates the full message processing flow while
     delegating actual agent execution to the provided callback.
@@ -135,11 +136,20 @@ class MessageHandler:
 
         if not send_result.is_success:
             log.warning(f"Failed to persist user message: {send_result.errors}")
+            self._mark_history_stale(context)
             return None
 
         if send_result.data:
-            return send_result.data.assistant_message_id
-
+            response = send_result.data
+            if context.history is not None:
+                context.history.append(
+                    response.conversation_version,
+                    (response.user_message_id, "user", content),
+                    (response.assistant_message_id, "assistant", ""),
+                )
+            return response.assistant_message_id
+
+        self._mark_history_stale(context)
         return None
 
     async def _complete_assistant_message(
@@ -162,3 +172,13 @@ class MessageHandler:
 
         if not complete_result.is_success:
             log.warning(f"Failed to complete assistant message: {complete_result.errors}")
+            self._mark_history_stale(context)
+            return
+
+        if context.history is not None and complete_result.data:
+            context.history.update_content(complete_result.data.version, message_id, content)
+
+    def _mark_history_stale(self, context: ConversationContext) -> None:
+        """Force a history reload after a write whose outcome is unknown."""
+        if context.history is not None:
+            context.history.stale = True
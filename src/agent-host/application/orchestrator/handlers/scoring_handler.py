@@ -8,13 +8,14 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from application.agents.llm_provider import LlmMessage, LlmResponse
+from application.agents.llm_provider import LlmMessage, LlmPriority, LlmResponse
 from application.orchestrator.context import ConversationContext, ItemExecutionState
 
 if TYPE_CHECKING:
     from application.websocket.connection import Connection
     from application.websocket.manager import ConnectionManager
     from infrastructure.llm_provider_factory import LlmProviderFactory
+    from infrastructure.llm_response_cache import LlmResponseCache
 
 log = logging.getLogger(__name__)
 
@@ -47,15 +48,18 @@ class ScoringHandler:
         self,
         connection_manager: "ConnectionManager",
         llm_provider_factory: "LlmProviderFactory",
+        llm_response_cache: "LlmResponseCache | None" = None,
     ):
         """Initialize the scoring handler.
 
         Args:
             connection_manager: WebSocket connection manager for sending messages
             llm_provider_factory: Factory for creating LLM providers
+            llm_response_cache: Optional cache for score reports (reused on reconnect)
         """
         self._connection_manager = connection_manager
         self._llm_provider_factory = llm_provider_factory
+        self._llm_response_cache = llm_response_cache
 
     async def score_item_response(
         self,
@@ -81,9 +85,9 @@ class ScoringHandler:
             # Build the scoring prompt
             prompt = self._build_scoring_prompt(item_state)
 
-            # Get LLM provider for this conversation
+            # Get LLM provider for this conversation (scoring yields to interactive chat)
             model_id = context.model or "default"
-            provider = self._llm_provider_factory.get_provider_for_model(model_id)
+            provider = self._llm_provider_factory.get_provider_for_model(model_id, priority=LlmPriority.BACKGROUND)
 
             if not provider:
                 log.warning(f"No LLM provider available for scoring (model={model_id})")
@@ -95,8 +99,11 @@ class ScoringHandler:
                 LlmMessage.user(prompt),
             ]
 
-            # Send request to LLM using chat()
-            response = await provider.chat(messages=messages)
+            # Send request to LLM using chat() (a regenerated report is served from the cache when enabled)
+            if self._llm_response_cache and self._llm_response_cache.is_enabled_for_template(context.template_id):
+                response = await self._llm_response_cache.chat(provider, messages, scope="score_report")
+            else:
+                response = await provider.chat(messages=messages)
 
             # Parse the response
             result = self._parse_scoring_response(response, item_state)
@@ -19,6 +19,7 @@ keeping this class focused on coordination and routing.
 
 import asyncio
 import logging
+import time
 import uuid
 from typing import TYPE_CHECKING, Any
 
@@ -26,18 +27,21 @@ from neuroglia.mediation import Mediator
 
 from application.agents import Agent
 from application.orchestrator.agent import AgentRunner, StreamHandler, ToolExecutor
-from application.orchestrator.context import ConversationContext, OrchestratorState
+from application.orchestrator.context import ConversationContext, ConversationHistory, OrchestratorState
 from application.orchestrator.handlers import FlowHandler, MessageHandler, ModelHandler, ScoringHandler, WidgetHandler
 from application.orchestrator.protocol import ConfigSender, ContentSender, WidgetSender
 from application.orchestrator.template import ContentGenerator, FlowRunner, ItemPresenter, JinjaRenderer
 from application.protocol.core import create_message
 from application.protocol.data import ContentChunkPayload, ContentCompletePayload
+from observability import conversation_bootstrap_time
 
 if TYPE_CHECKING:
+    from application.orchestrator.agent.tool_selector import ToolSelector
     from application.services.tool_provider_client import ToolProviderClient
     from application.websocket.connection import Connection
     from application.websocket.manager import ConnectionManager
     from infrastructure.llm_provider_factory import LlmProviderFactory
+    from infrastructure.llm_response_cache import LlmResponseCache
 
 log = logging.getLogger(__name__)
 
@@ -79,6 +83,8 @@ class Orchestrator:
         agent: Agent,
         llm_provider_factory: "LlmProviderFactory",
         tool_provider_client: "ToolProviderClient | None" = None,
+        llm_response_cache: "LlmResponseCache | None" = None,
+        tool_selector: "ToolSelector | None" = None,
     ):
         """Initialize the orchestrator with all dependencies.
 
@@ -88,6 +94,8 @@ class Orchestrator:
             agent: The Agent instance for LLM interactions
             llm_provider_factory: Factory for creating LLM providers
             tool_provider_client: Optional client for tool execution
+            llm_response_cache: Optional cache for template content and score report generation
+            tool_selector: Optional selector pruning the tools sent to the LLM per turn
         """
         self._mediator = mediator
         self._connection_manager = connection_manager
@@ -100,7 +108,7 @@ class Orchestrator:
         self._widget_handler = WidgetHandler(mediator, connection_manager)
         self._flow_handler = FlowHandler(connection_manager)
         self._model_handler = ModelHandler(llm_provider_factory)
-        self._scoring_handler = ScoringHandler(connection_manager, llm_provider_factory)
+        self._scoring_handler = ScoringHandler(connection_manager, llm_provider_factory, llm_response_cache)
 
         # Initialize protocol senders
         self._config_sender = ConfigSender(connection_manager)
@@ -109,7 +117,7 @@ class Orchestrator:
 
         # Initialize template processors
         self._jinja_renderer = JinjaRenderer()
-        self._content_generator = ContentGenerator(llm_provider_factory, self._jinja_renderer)
+        self._content_generator = ContentGenerator(llm_provider_factory, self._jinja_renderer, llm_response_cache)
 
         # Note: ItemPresenter and FlowRunner need callbacks that are methods of self.
         # We initialize them here and they can access self's methods via bound method references.
@@ -134,6 +142,7 @@ class Orchestrator:
             tool_executor=self._tool_executor,
             send_chat_input_enabled=self._send_chat_input_enabled,
             send_error=self._send_error,
+            tool_selector=tool_selector,
         )
 
         # Initialize flow runner
@@ -167,6 +176,8 @@ class Orchestrator:
         """Initialize orchestrator for a new connection.
 
         Loads conversation context, tools, and prepares for message handling.
+        The conversation, the tools and (when the connection already names it)
+        the definition with its template are loaded concurrently.
 
         Args:
             connection: The WebSocket connection
@@ -175,10 +186,18 @@ class Orchestrator:
         from application.queries import GetConversationQuery
 
         log.info(f"🎭 Initializing orchestrator for conversation {conversation_id}")
+        started = time.perf_counter()
 
-        # Load conversation from read model
+        # Load conversation, tools and the connection's definition concurrently
         user_info = {"sub": connection.user_id}
-        result = await self._mediator.execute_async(GetConversationQuery(conversation_id=conversation_id, user_info=user_info))
+        prefetched_definition_id = connection.definition_id
+        loads: list[Any] = [
+            self._mediator.execute_async(GetConversationQuery(conversation_id=conversation_id, user_info=user_info)),
+            self._fetch_tools(connection.access_token),
+        ]
+        if prefetched_definition_id:
+            loads.append(self._fetch_definition(prefetched_definition_id, user_info))
+        result, tools, *prefetched = await asyncio.gather(*loads)
 
         if not result.is_success or not result.data:
             raise ValueError(f"Conversation {conversation_id} not found")
@@ -196,21 +215,27 @@ class Orchestrator:
         )
 
         # If conversation has persisted template_config from domain, store it
-        # This will be overwritten by _load_definition_context if definition exists
+        # This will be overwritten by _apply_definition_context if definition exists
         if conv_dto.template_config:
             context.template_config = conv_dto.template_config
 
-        # Load definition for template info
+        # Load definition for template info (the prefetch is reused unless the conversation names another one)
         if conv_dto.definition_id:
-            await self._load_definition_context(context, conv_dto.definition_id, user_info)
+            if prefetched and conv_dto.definition_id == prefetched_definition_id:
+                def_dto, template = prefetched[0]
+            else:
+                def_dto, template = await self._fetch_definition(conv_dto.definition_id, user_info)
+            self._apply_definition_context(context, conv_dto.definition_id, def_dto, template)
 
-        # Load tools
-        await self._load_tools(context)
+        context.tools = tools
+        context.history = ConversationHistory.from_messages(conv_dto.messages, conv_dto.version)
 
         # Store context
         self._contexts[connection.connection_id] = context
 
-        log.info(f"✅ Orchestrator initialized: {context}")
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        conversation_bootstrap_time.record(elapsed_ms, {"proactive": str(context.is_proactive).lower()})
+        log.info(f"✅ Orchestrator initialized in {elapsed_ms:.0f}ms: {context}")
 
     async def start_conversation_flow(self, connection: "Connection") -> None:
         """Start the conversation flow after initialization.
@@ -724,50 +749,67 @@ class Orchestrator:
         )
         await self._connection_manager.send_to_connection(connection.connection_id, complete_message)
 
-    async def _load_definition_context(
-        self,
-        context: ConversationContext,
-        definition_id: str,
-        user_info: dict[str, Any],
-    ) -> None:
-        """Load definition and template information into context.
+    async def _fetch_definition(self, definition_id: str, user_info: dict[str, Any]) -> tuple[Any | None, Any | None]:
+        """Load a definition and, if it links one, its full template.
 
         Args:
-            context: The conversation context to update
             definition_id: The definition ID
             user_info: User info dict for authorization
+
+        Returns:
+            Tuple of (definition DTO, template DTO), None for whichever could not be loaded
         """
         from application.queries import GetDefinitionQuery, GetTemplateQuery
 
         result = await self._mediator.execute_async(GetDefinitionQuery(definition_id=definition_id, user_info=user_info))
-
         if not result.is_success or not result.data:
+            return None, None
+
+        def_dto = result.data
+        if not def_dto.conversation_template_id:
+            return def_dto, None
+
+        template_result = await self._mediator.execute_async(
+            GetTemplateQuery(
+                template_id=def_dto.conversation_template_id,
+                user_info=user_info,
+                for_client=False,  # Full template for server-side processing
+            )
+        )
+        return def_dto, template_result.data if template_result.is_success else None
+
+    def _apply_definition_context(
+        self,
+        context: ConversationContext,
+        definition_id: str,
+        def_dto: Any | None,
+        template: Any | None,
+    ) -> None:
+        """Apply definition and template information to the context.
+
+        Args:
+            context: The conversation context to update
+            definition_id: The definition ID
+            def_dto: The definition DTO, or None if it could not be loaded
+            template: The template DTO, or None if there is none or it could not be loaded
+        """
+        if def_dto is None:
             log.warning(f"Failed to load definition {definition_id}")
             context.is_proactive = False
             context.has_template = False
             return
 
-        def_dto = result.data
         context.model = def_dto.model
         context.definition_id = def_dto.id
         context.definition_name = def_dto.name
         context.allow_model_selection = def_dto.allow_model_selection
         context.has_template = def_dto.has_template
 
-        # If definition has a template, load it to determine proactive flow
+        # If definition has a template, it determines the proactive flow
         if def_dto.conversation_template_id:
             context.template_id = def_dto.conversation_template_id
 
-            template_result = await self._mediator.execute_async(
-                GetTemplateQuery(
-                    template_id=def_dto.conversation_template_id,
-                    user_info=user_info,
-                    for_client=False,  # Full template for server-side processing
-                )
-            )
-
-            if template_result.is_success and template_result.data:
-                template = template_result.data
+            if template is not None:
                 context.is_proactive = template.agent_starts_first
                 context.total_items = template.item_count
                 context.template_config = {
@@ -790,23 +832,26 @@ class Orchestrator:
 
         log.debug(f"✅ Definition loaded: {definition_id}, name={context.definition_name}, model={context.model}, proactive={context.is_proactive}")
 
-    async def _load_tools(self, context: ConversationContext) -> None:
-        """Load available tools for the context.
+    async def _fetch_tools(self, access_token: str | None) -> list[Any]:
+        """Load the tools available to the user as LLM tool definitions.
 
         Args:
-            context: The conversation context to update
+            access_token: The user's access token
+
+        Returns:
+            List of LlmToolDefinition (empty if tools could not be loaded)
         """
-        if not self._tool_provider_client or not context.access_token:
+        if not self._tool_provider_client or not access_token:
             log.debug("No tool provider client or access token - skipping tool load")
-            return
+            return []
 
         try:
             from application.agents import LlmToolDefinition
             from domain.models.tool import Tool
 
-            # Fetch tools from Tools Provider
+            # Fetch tools from Tools Provider (cached per token, revalidated by ETag)
             tool_data = await self._tool_provider_client.get_tools(
-                access_token=context.access_token,
+                access_token=access_token,
             )
             tools = [Tool.from_bff_response(t) for t in tool_data]
 
@@ -828,11 +873,12 @@ class Orchestrator:
                         "properties": {p.name: p.to_json_schema() for p in tool.parameters},
                         "required": [p.name for p in tool.parameters if p.required],
                     },
+                    tags=tool.tags,
                 )
                 llm_tools.append(llm_tool)
 
-            context.tools = llm_tools
             log.info(f"🔧 Loaded {len(llm_tools)} tools for conversation")
+            return llm_tools
         except Exception as e:
             log.warning(f"Failed to load tools: {e}")
-            context.tools = []
+            return []
@@ -16,6 +16,7 @@ from application.orchestrator.template.jinja_renderer import JinjaRenderer
 
 if TYPE_CHECKING:
     from application.agents.llm_provider import LlmMessage
+    from infrastructure.llm_response_cache import LlmResponseCache
 
 log = logging.getLogger(__name__)
 
@@ -113,6 +114,7 @@ class ContentGenerator:
         self,
         llm_provider_factory: LlmProviderFactoryProtocol,
         jinja_renderer: JinjaRenderer | None = None,
+        llm_response_cache: "LlmResponseCache | None" = None,
     ) -> None:
         """Initialize the ContentGenerator.
 
@@ -120,9 +122,11 @@ class ContentGenerator:
             llm_provider_factory: Factory for creating LLM providers
             jinja_renderer: Optional renderer for Jinja templates in instructions.
                            Creates a default one if not provided.
+            llm_response_cache: Optional cache for identical generation prompts
         """
         self._llm_provider_factory = llm_provider_factory
         self._jinja_renderer = jinja_renderer or JinjaRenderer()
+        self._llm_response_cache = llm_response_cache
 
     async def generate(
         self,
@@ -251,8 +255,12 @@ class ContentGenerator:
                 LlmMessage(role=LlmMessageRole.USER, content=prompt),
             ]
 
-            # Generate response (non-streaming for simplicity)
-            response = await llm_provider.chat(messages)
+            # Generate response (non-streaming for simplicity); identical prompts of
+            # cache-enabled templates are served from the response cache
+            if self._llm_response_cache and self._llm_response_cache.is_enabled_for_template(context.template_id):
+                response = await self._llm_response_cache.chat(llm_provider, messages, scope="template_content")  # type: ignore[arg-type]
+            else:
+                response = await llm_provider.chat(messages)
 
             if not response or not response.content:
                 return None
@@ -0,0 +1,83 @@
+"""
+Agent Host WebSocket Protocol v1.0.0 - Message Encoding
+
+Protocol messages travel as text frames of compact JSON, exactly as Starlette's
+``WebSocket.send_json`` writes them: ``model_dump(by_alias=True, exclude_none=True)``
+followed by ``json.dumps(..., separators=(",", ":"), ensure_ascii=False)``.
+
+``encode_message`` produces the same text with orjson. The envelope is built
+directly and its payload is handed to orjson as is: payloads are usually dicts
+already dumped from their payload model. Models and dataclasses found inside a
+payload are dumped by the TypeAdapter of the payload field (``Any``), as
+``model_dump`` would. Anything orjson does not encode like the json module
+(non-string keys, integers beyond 64 bits, sets, datetimes, ...) falls back to
+the json module, so the output never depends on the path taken.
+
+Two float renderings differ between the encoders, both equivalent JSON:
+magnitudes between 1e-9 and 1e-4 (``0.00001`` instead of ``1e-05``), and
+non-finite values (``null`` instead of the invalid ``NaN`` / ``Infinity``).
+"""
+
+import json
+from dataclasses import is_dataclass
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from .core import ProtocolMessage
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a regular dependency
+    orjson = None  # type: ignore[assignment]
+
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+# Serializer of ProtocolMessage.payload, built once: dumps nested models and dataclasses like model_dump
+_PAYLOAD_ADAPTER: TypeAdapter[Any] = TypeAdapter(Any)
+
+
+def message_to_dict(message: ProtocolMessage[Any]) -> dict[str, Any]:
+    """The wire form of a message, as a dict (aliases, ``None`` fields left out)."""
+    return message.model_dump(by_alias=True, exclude_none=True)
+
+
+def encode_message(message: ProtocolMessage[Any], fast: bool = True) -> str:
+    """Encode a message as the text of a WebSocket frame.
+
+    Args:
+        message: The message to encode
+        fast: Use orjson when it is installed (``False`` always uses the json module)
+
+    Returns:
+        Compact JSON text
+    """
+    if fast and orjson is not None:
+        try:
+            return orjson.dumps(_envelope(message), default=_dump_nested, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass  # Not encodable like the json module would: let the json module decide
+    return json.dumps(message_to_dict(message), separators=(",", ":"), ensure_ascii=False)
+
+
+def _envelope(message: ProtocolMessage[Any]) -> dict[str, Any]:
+    # Same keys, in the same order, as message_to_dict (ProtocolMessage field order)
+    envelope: dict[str, Any] = {
+        "id": message.id,
+        "type": message.type,
+        "version": message.version,
+        "timestamp": message.timestamp,
+        "source": message.source,
+    }
+    if message.conversation_id is not None:
+        envelope["conversationId"] = message.conversation_id
+    if message.payload is not None:
+        envelope["payload"] = message.payload
+    return envelope
+
+
+def _dump_nested(value: Any) -> Any:
+    # orjson calls this for values it does not encode itself (or is told to pass through)
+    if isinstance(value, BaseModel) or (is_dataclass(value) and not isinstance(value, type)):
+        return _PAYLOAD_ADAPTER.dump_python(value, by_alias=True, exclude_none=True)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
@@ -67,4 +67,5 @@ def _map_conversation_to_dto(conv: Conversation) -> ConversationDto:
         template_config=state.template_config,
         created_at=state.created_at,
         updated_at=state.updated_at,
+        version=state.state_version,
     )
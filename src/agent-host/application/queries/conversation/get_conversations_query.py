@@ -65,4 +65,5 @@ def _map_conversation_to_dto(conv: Conversation) -> ConversationDto:
         message_count=len(state.messages),
         created_at=state.created_at,
         updated_at=state.updated_at,
+        version=state.state_version,
     )
@@ -11,6 +11,7 @@ from typing import Any
 from neuroglia.core import OperationResult
 from neuroglia.mediation import Query, QueryHandler
 
+from application.services.definition_cache import DEFINITION, DefinitionCache
 from domain.entities import AgentDefinition
 from domain.repositories import AgentDefinitionRepository
 from integration.models.definition_dto import AgentDefinitionDto
@@ -106,19 +107,26 @@ class GetDefinitionsQueryHandler(QueryHandler[GetDefinitionsQuery, OperationResu
 
 
 class GetDefinitionQueryHandler(QueryHandler[GetDefinitionQuery, OperationResult[AgentDefinitionDto | None]]):
-    """Handler for GetDefinitionQuery."""
+    """Handler for GetDefinitionQuery.
+
+    Definitions are served from the DefinitionCache; the access check runs
+    on every request.
+    """
 
     def __init__(
         self,
         definition_repository: AgentDefinitionRepository,
+        definition_cache: DefinitionCache,
     ) -> None:
         """Initialize the handler.
 
         Args:
             definition_repository: Repository for AgentDefinitions
+            definition_cache: In-process cache of definition DTOs
         """
         super().__init__()
         self._repository = definition_repository
+        self._cache = definition_cache
 
     async def handle_async(self, query: GetDefinitionQuery) -> OperationResult[AgentDefinitionDto | None]:
         """Get a specific definition by ID.
@@ -128,41 +136,42 @@ class GetDefinitionQueryHandler(QueryHandler[GetDefinitionQuery, OperationResult
         user_id = query.user_info.get("sub", "unknown")
         user_roles = query.user_info.get("realm_access", {}).get("roles", [])
 
-        try:
+        async def load() -> AgentDefinitionDto | None:
             defn = await self._repository.get_async(query.definition_id)
+            return _map_definition_to_dto(defn) if defn is not None else None
+
+        try:
+            dto = await self._cache.get_or_load(DEFINITION, query.definition_id, load)
 
-            if defn is None:
+            if dto is None:
                 return self.not_found(AgentDefinition, query.definition_id)
 
-            state = defn.state
             # Check access
             has_access = False
 
             # System definitions are accessible to all
-            if state.owner_user_id is None:
+            if dto.owner_user_id is None:
                 has_access = True
 
             # User owns the definition
-            elif state.owner_user_id == user_id:
+            elif dto.owner_user_id == user_id:
                 has_access = True
 
             # Public definitions
-            elif state.is_public:
+            elif dto.is_public:
                 has_access = True
 
             # Role-based access
-            elif state.required_roles and any(role in user_roles for role in state.required_roles):
+            elif dto.required_roles and any(role in user_roles for role in dto.required_roles):
                 has_access = True
 
             # Explicit user access
-            elif state.allowed_users and user_id in state.allowed_users:
+            elif dto.allowed_users and user_id in dto.allowed_users:
                 has_access = True
 
             if not has_access:
                 return self.forbidden("Access denied to this definition")
 
-            # Map aggregate to DTO
-            dto = _map_definition_to_dto(defn)
             return self.ok(dto)
 
         except Exception as e:
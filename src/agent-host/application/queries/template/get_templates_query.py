@@ -5,6 +5,7 @@ All authenticated users can list templates; admin-only access is enforced
 at the controller level if needed.
 """
 
+import copy
 import logging
 from dataclasses import dataclass
 from typing import Any
@@ -12,6 +13,7 @@ from typing import Any
 from neuroglia.core import OperationResult
 from neuroglia.mediation import Query, QueryHandler
 
+from application.services.definition_cache import TEMPLATE, DefinitionCache
 from domain.entities import ConversationTemplate
 from domain.repositories import ConversationTemplateRepository
 from integration.models.template_dto import ConversationItemDto, ConversationTemplateDto, ItemContentDto
@@ -120,19 +122,26 @@ class GetTemplatesQueryHandler(QueryHandler[GetTemplatesQuery, OperationResult[l
 
 
 class GetTemplateQueryHandler(QueryHandler[GetTemplateQuery, OperationResult[ConversationTemplateDto | None]]):
-    """Handler for GetTemplateQuery."""
+    """Handler for GetTemplateQuery.
+
+    Templates are served from the DefinitionCache; client copies are
+    stripped from a deep copy so the cached DTO keeps its answers.
+    """
 
     def __init__(
         self,
         template_repository: ConversationTemplateRepository,
+        definition_cache: DefinitionCache,
     ) -> None:
         """Initialize the handler.
 
         Args:
             template_repository: Repository for ConversationTemplates
+            definition_cache: In-process cache of template DTOs
         """
         super().__init__()
         self._repository = template_repository
+        self._cache = definition_cache
 
     async def handle_async(self, query: GetTemplateQuery) -> OperationResult[ConversationTemplateDto | None]:
         """Get a specific template by ID.
@@ -140,18 +149,20 @@ class GetTemplateQueryHandler(QueryHandler[GetTemplateQuery, OperationResult[Con
         If for_client=True, returns a version with sensitive data removed
         (correct answers stripped from item contents).
         """
-        try:
+
+        async def load() -> ConversationTemplateDto | None:
             template = await self._repository.get_async(query.template_id)
+            return _map_template_to_dto(template) if template is not None else None
 
-            if template is None:
-                return self.not_found(ConversationTemplate, query.template_id)
+        try:
+            dto = await self._cache.get_or_load(TEMPLATE, query.template_id, load)
 
-            # Map aggregate to DTO
-            dto = _map_template_to_dto(template)
+            if dto is None:
+                return self.not_found(ConversationTemplate, query.template_id)
 
             # If for_client, strip sensitive data (correct answers)
             if query.for_client:
-                dto = _strip_sensitive_data(dto)
+                dto = _strip_sensitive_data(copy.deepcopy(dto))
 
             return self.ok(dto)
 
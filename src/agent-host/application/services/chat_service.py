@@ -227,6 +227,7 @@ class ChatService:
                 "properties": {p.name: p.to_json_schema() for p in tool.parameters},
                 "required": [p.name for p in tool.parameters if p.required],
             },
+            tags=tool.tags,
         )
         logger.debug(f"tool_to_llm_definition for '{tool.name}': {len(tool.parameters)} params -> {llm_def.parameters}")
         return llm_def
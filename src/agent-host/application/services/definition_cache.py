@@ -0,0 +1,113 @@
+"""In-process cache for AgentDefinition and ConversationTemplate DTOs.
+
+Every WebSocket connect resolves the conversation's definition and template,
+and the same few definitions and templates are shared by all users. This
+cache keeps their mapped DTOs in memory so reconnects do not hit MongoDB.
+
+Key Features:
+- Versioned: an entry is never replaced by an older version of the same DTO
+- Invalidated by the definition and template domain events of this instance
+  (see application.events.domain.definition_cache_invalidation_handlers)
+- TTL bounds staleness for changes made through other replicas
+- A load that raced with an invalidation does not repopulate the entry
+
+Access checks are not part of the cache: handlers apply them to the cached
+DTO for every request.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from neuroglia.hosting.abstractions import ApplicationBuilderBase
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFINITION = "definition"
+TEMPLATE = "template"
+
+
+class DefinitionCache:
+    """Bounded, versioned TTL cache of definition and template DTOs."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 1000) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: How long an entry is served without reloading (0 disables the cache)
+            max_entries: Maximum number of cached DTOs (least recently used are evicted)
+        """
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._generations: dict[tuple[str, str], int] = {}
+        self._hits = 0
+        self._misses = 0
+
+    async def get_or_load(self, kind: str, key: str, loader: Callable[[], Awaitable[T | None]]) -> T | None:
+        """Get a cached DTO, loading and caching it on a miss.
+
+        Args:
+            kind: DEFINITION or TEMPLATE
+            key: Aggregate ID
+            loader: Coroutine factory returning the DTO, or None if it does not exist
+
+        Returns:
+            The DTO, or None if the loader found nothing (not cached)
+        """
+        cache_key = (kind, key)
+        entry = self._entries.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(cache_key)
+            self._hits += 1
+            return entry[1]
+
+        self._misses += 1
+        generation = self._generations.get(cache_key, 0)
+        value = await loader()
+        if value is not None and self._ttl_seconds > 0 and self._generations.get(cache_key, 0) == generation:
+            self._put(cache_key, value)
+        return value
+
+    def _put(self, cache_key: tuple[str, str], value: Any) -> None:
+        current = self._entries.get(cache_key)
+        if current is not None and getattr(current[1], "version", 0) > getattr(value, "version", 0):
+            return
+        self._entries[cache_key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, kind: str, key: str) -> None:
+        """Drop a cached DTO after its aggregate changed."""
+        cache_key = (kind, key)
+        self._generations[cache_key] = self._generations.get(cache_key, 0) + 1
+        if self._entries.pop(cache_key, None) is not None:
+            logger.debug(f"Invalidated cached {kind} {key}")
+
+    def clear(self) -> None:
+        """Drop all cached DTOs (e.g. after a database reset)."""
+        for cache_key in self._entries:
+            self._generations[cache_key] = self._generations.get(cache_key, 0) + 1
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics for health checks."""
+        return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses, "ttl_seconds": self._ttl_seconds}
+
+    @staticmethod
+    def configure(builder: ApplicationBuilderBase) -> None:
+        """Register DefinitionCache as a singleton in the DI container.
+
+        Args:
+            builder: The application builder
+        """
+        from application.settings import app_settings
+
+        cache = DefinitionCache(ttl_seconds=app_settings.definition_cache_ttl_seconds, max_entries=app_settings.definition_cache_max_entries)
+        builder.services.add_singleton(DefinitionCache, singleton=cache)
+        logger.info(f"Configured DefinitionCache (ttl={app_settings.definition_cache_ttl_seconds}s)")
@@ -13,7 +13,7 @@ import logging
 import random
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from application.agents.base_agent import ToolExecutionRequest, ToolExecutionResult
 from application.agents.llm_provider import LlmProvider, LlmToolDefinition
@@ -22,6 +22,9 @@ from application.services.item_generator_service import ItemGeneratorService
 from domain.models.blueprint_models import DifficultyLevel, ExamBlueprint
 from domain.models.generated_item import DomainResult, EvaluationResults, GeneratedItem, ItemPlanEntry
 
+if TYPE_CHECKING:
+    from infrastructure.llm_response_cache import LlmResponseCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -540,15 +543,17 @@ class EvaluationSessionManager:
 def create_evaluation_manager(
     blueprint_store: BlueprintStore,
     llm_provider: LlmProvider,
+    llm_response_cache: "LlmResponseCache | None" = None,
 ) -> EvaluationSessionManager:
     """Create an evaluation session manager.
 
     Args:
         blueprint_store: Shared blueprint store
         llm_provider: LLM provider for item generation
+        llm_response_cache: Optional response cache for item generation
 
     Returns:
         New EvaluationSessionManager instance
     """
-    item_generator = ItemGeneratorService(blueprint_store, llm_provider)
+    item_generator = ItemGeneratorService(blueprint_store, llm_provider, llm_response_cache)
     return EvaluationSessionManager(blueprint_store, item_generator)
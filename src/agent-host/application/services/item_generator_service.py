@@ -8,13 +8,16 @@ The backend stores and verifies - it does NOT compute answers.
 import json
 import logging
 import random
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from application.agents.llm_provider import LlmMessage, LlmProvider
 from application.services.blueprint_store import BlueprintStore
 from domain.models.blueprint_models import DifficultyLevel, ItemType, Skill
 from domain.models.generated_item import GeneratedItem
 
+if TYPE_CHECKING:
+    from infrastructure.llm_response_cache import LlmResponseCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -93,15 +96,20 @@ class ItemGeneratorService:
         self,
         blueprint_store: BlueprintStore,
         llm_provider: LlmProvider,
+        llm_response_cache: "LlmResponseCache | None" = None,
     ):
         """Initialize the item generator.
 
         Args:
             blueprint_store: Service for loading blueprints
-            llm_provider: The LLM provider for generation
+            llm_provider: The LLM provider for generation (from LlmProviderFactory.get_provider_for_model
+                with priority=LlmPriority.BACKGROUND, so generation yields to interactive chat)
+            llm_response_cache: Optional cache for identical generation prompts
+                (only used when the provider is deterministic)
         """
         self._blueprint_store = blueprint_store
         self._llm = llm_provider
+        self._llm_response_cache = llm_response_cache
 
     async def generate_item(
         self,
@@ -245,7 +253,10 @@ Respond with JSON only."""
         ]
 
         # Use non-streaming for item generation
-        response = await self._llm.chat(messages=messages, tools=None)
+        if self._llm_response_cache:
+            response = await self._llm_response_cache.chat(self._llm, messages, scope="item_generation")
+        else:
+            response = await self._llm.chat(messages=messages, tools=None)
 
         return response.content
 
@@ -1,12 +1,15 @@
 """Tools Provider client for fetching tools and executing tool calls."""
 
+import hashlib
 import logging
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 from neuroglia.hosting.abstractions import ApplicationBuilderBase
-from observability import tool_execution_count, tool_execution_errors, tool_execution_time, tools_fetched
+from observability import tool_cache_hits, tool_cache_misses, tool_execution_count, tool_execution_errors, tool_execution_time, tools_fetched
 from opentelemetry import trace
 
 from application.settings import Settings
@@ -15,12 +18,21 @@ logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
 
+@dataclass
+class _CachedManifest:
+    """Tool list fetched for one access token."""
+
+    etag: str | None
+    tools: list[dict[str, Any]]
+    fresh_until: float
+
+
 class ToolProviderClient:
     """
     HTTP client for communicating with the Tools Provider BFF API.
 
     Handles:
-    - Fetching available tools
+    - Fetching available tools (cached per access token, revalidated with ETag)
     - Executing tool calls with user tokens
     """
 
@@ -28,6 +40,8 @@ class ToolProviderClient:
         self,
         base_url: str,
         timeout: float = 30.0,
+        manifest_cache_ttl_seconds: float = 30.0,
+        manifest_cache_max_entries: int = 1000,
     ) -> None:
         """
         Initialize the Tools Provider client.
@@ -35,10 +49,16 @@ class ToolProviderClient:
         Args:
             base_url: Base URL of the Tools Provider (e.g., http://tools-provider:8080)
             timeout: HTTP timeout in seconds
+            manifest_cache_ttl_seconds: How long a token's tool list is reused without
+                revalidation (0 = always revalidate with If-None-Match)
+            manifest_cache_max_entries: Maximum number of cached tool lists (one per token)
         """
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
         self._client: httpx.AsyncClient | None = None
+        self._manifest_cache_ttl_seconds = manifest_cache_ttl_seconds
+        self._manifest_cache_max_entries = manifest_cache_max_entries
+        self._manifests: OrderedDict[str, _CachedManifest] = OrderedDict()
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
@@ -60,28 +80,50 @@ class ToolProviderClient:
         """
         Fetch available tools from the Tools Provider.
 
+        The tool list of each access token is cached: within the TTL it is
+        returned without a request, afterwards it is revalidated with
+        If-None-Match and only downloaded again if it changed.
+
         Args:
             access_token: User's access token for authentication
 
         Returns:
             List of tool definitions from the BFF API
         """
+        cache_key = hashlib.sha256(access_token.encode()).hexdigest()
+        cached = self._manifests.get(cache_key)
+        if cached is not None and cached.fresh_until > time.monotonic():
+            self._manifests.move_to_end(cache_key)
+            tool_cache_hits.add(1, {"cache": "manifest", "outcome": "fresh"})
+            return cached.tools
+
         client = await self._get_client()
 
         with tracer.start_as_current_span("tools_provider.get_tools") as span:
             try:
-                response = await client.get(
-                    "/api/agent/tools",
-                    headers={"Authorization": f"Bearer {access_token}"},
-                )
+                headers = {"Authorization": f"Bearer {access_token}"}
+                if cached is not None and cached.etag:
+                    headers["If-None-Match"] = cached.etag
+
+                response = await client.get("/api/agent/tools", headers=headers)
+
+                if response.status_code == 304 and cached is not None:
+                    span.set_attribute("tools.cache", "revalidated")
+                    tool_cache_hits.add(1, {"cache": "manifest", "outcome": "revalidated"})
+                    self._store_manifest(cache_key, cached.etag, cached.tools)
+                    return cached.tools
+
                 response.raise_for_status()
 
                 data = response.json()
                 tools = data.get("data", data) if isinstance(data, dict) else data
+                self._store_manifest(cache_key, response.headers.get("ETag"), tools)
 
                 # Record metrics
                 tools_fetched.add(1, {"tool_count": str(len(tools))})
                 span.set_attribute("tools.count", len(tools))
+                span.set_attribute("tools.cache", "miss")
+                tool_cache_misses.add(1, {"cache": "manifest"})
 
                 logger.debug(f"Fetched {len(tools)} tools from Tools Provider")
 
@@ -98,6 +140,7 @@ class ToolProviderClient:
                 span.set_attribute("error", True)
                 span.set_attribute("error.message", str(e))
                 logger.error(f"HTTP error fetching tools: {e.response.status_code} - {e.response.text}")
+                self._manifests.pop(cache_key, None)
                 raise
             except httpx.RequestError as e:
                 span.set_attribute("error", True)
@@ -105,6 +148,13 @@ class ToolProviderClient:
                 logger.error(f"Request error fetching tools: {e}")
                 raise
 
+    def _store_manifest(self, cache_key: str, etag: str | None, tools: list[dict[str, Any]]) -> None:
+        """Cache a token's tool list, evicting the least recently used entries."""
+        self._manifests[cache_key] = _CachedManifest(etag=etag, tools=tools, fresh_until=time.monotonic() + self._manifest_cache_ttl_seconds)
+        self._manifests.move_to_end(cache_key)
+        while len(self._manifests) > self._manifest_cache_max_entries:
+            self._manifests.popitem(last=False)
+
     async def execute_tool(
         self,
         tool_name: str,
@@ -247,6 +297,7 @@ class ToolProviderClient:
         client = ToolProviderClient(
             base_url=settings.tools_provider_url,
             timeout=settings.tools_provider_timeout,
+            manifest_cache_ttl_seconds=settings.tool_manifest_cache_ttl_seconds,
         )
 
         builder.services.add_singleton(ToolProviderClient, singleton=client)
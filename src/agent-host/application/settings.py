@@ -24,6 +24,7 @@ class Settings(ApplicationSettings):
     # Database Configuration (for Neuroglia DataAccessLayer)
     database_name: str = "agent_host"
     consumer_group: str = "agent-host-consumer-group"  # EventStoreDB consumer group (when using event sourcing)
+    mongo_ensure_indexes: bool = True  # Create the indexes declared by the repositories at startup
 
     # Connection Strings - override from ApplicationSettings base class
     # Set via CONNECTION_STRINGS env var as JSON (no prefix):
@@ -111,6 +112,20 @@ class Settings(ApplicationSettings):
     tools_provider_url: str = "http://tools-provider:8080"  # Internal Docker network URL
     tools_provider_external_url: str = "http://localhost:8040"  # External/browser-accessible URL
     tools_provider_timeout: float = 30.0  # HTTP timeout for Tools Provider calls
+    tool_manifest_cache_ttl_seconds: float = 30.0  # Reuse a token's tool list without revalidation for this long (0 = always revalidate with ETag)
+
+    # Definition Cache Configuration (AgentDefinition / ConversationTemplate DTOs)
+    definition_cache_ttl_seconds: float = 300.0  # Upper bound on staleness for changes made through other replicas (0 = disabled)
+    definition_cache_max_entries: int = 1000  # Maximum number of cached definitions and templates
+
+    # Tool Selection Configuration (relevance-based pruning of the tools sent to the LLM)
+    tool_selection_enabled: bool = True
+    tool_selection_min_tools: int = 20  # Only prune when the user has more tools than this
+    tool_selection_top_k: int = 12  # Most relevant tools sent per turn (in addition to pinned ones)
+    tool_selection_pinned_tools: list[str] = []  # Tool names that are always sent
+    tool_selection_history_messages: int = 2  # Recent messages added to the ranking query
+    tool_selection_embedding_model: str = ""  # Ollama embedding model for hybrid ranking (empty = BM25 only)
+    tool_selection_embedding_weight: float = 0.5  # Share of the embedding similarity in the hybrid score
 
     # ==========================================================================
     # Ollama LLM Configuration
@@ -125,6 +140,7 @@ class Settings(ApplicationSettings):
     ollama_temperature: float = 0.7
     ollama_top_p: float = 0.9
     ollama_num_ctx: int = 8192  # Context window size
+    ollama_seed: int | None = None  # Fixed sampling seed (reproducible output)
 
     # ==========================================================================
     # OpenAI LLM Configuration
@@ -139,6 +155,7 @@ class Settings(ApplicationSettings):
     openai_temperature: float = 0.7
     openai_top_p: float = 0.9
     openai_max_tokens: int = 4096  # Max tokens to generate
+    openai_seed: int | None = None  # Fixed sampling seed (reproducible output)
 
     # OpenAI Authentication - API Key mode (mutually exclusive with OAuth2)
     openai_auth_type: str = "api_key"  # "api_key" or "oauth2"
@@ -158,6 +175,18 @@ class Settings(ApplicationSettings):
     # JSON array of strings, e.g., '["<|im_end|>"]'
     openai_stop_sequences: str = ""  # Empty means no custom stop sequences
 
+    # ==========================================================================
+    # Scripted LLM Configuration (deterministic fake provider for load tests)
+    # ==========================================================================
+    # Never enable in production: every response is synthetic
+    scripted_llm_enabled: bool = False  # Enable the scripted provider
+    scripted_llm_model: str = "scripted"
+    scripted_llm_response_tokens: int = 50  # Tokens per text response
+    scripted_llm_first_token_ms: float = 300.0  # Delay before the first token
+    scripted_llm_token_interval_ms: float = 20.0  # Delay between tokens
+    scripted_llm_tool_call_every: int = 0  # Call a tool on every Nth user turn (0 = never)
+    scripted_llm_tool_name: str = ""  # Tool to call (empty = the first tool offered)
+
     # ==========================================================================
     # Model Selection Configuration
     # ==========================================================================
@@ -179,12 +208,38 @@ class Settings(ApplicationSettings):
     allow_model_selection: bool = True
 
     # Default provider to use when no model is explicitly selected
-    default_llm_provider: str = "ollama"  # "ollama" or "openai"
+    default_llm_provider: str = "ollama"  # "ollama", "openai" or "scripted"
+
+    # ==========================================================================
+    # LLM Gateway Configuration (admission control in front of the providers)
+    # ==========================================================================
+    llm_gateway_enabled: bool = True
+    llm_max_concurrency: int = 8  # Concurrent requests per model
+    # Per-model overrides keyed by qualified model ID, e.g. '{"ollama:qwen2.5:7b": 2}'
+    llm_model_concurrency: dict[str, int] = {}
+    llm_interactive_weight: int = 4  # Interactive admissions per background admission when both wait
+    llm_queue_timeout_seconds: float = 60.0  # Max wait for a slot (0 = wait indefinitely)
+    llm_max_retries: int = 3  # Retries on 429/503 (with jittered exponential backoff)
+    llm_retry_base_delay_seconds: float = 0.5
+    llm_retry_max_delay_seconds: float = 8.0
+
+    # ==========================================================================
+    # LLM Response Cache (opt-in; only used with temperature 0 or a fixed seed)
+    # ==========================================================================
+    llm_response_cache_enabled: bool = False
+    llm_response_cache_ttl_seconds: int = 3600
+    llm_response_cache_max_entries: int = 500  # Local LRU tier size
+    llm_response_cache_redis_enabled: bool = True  # Shared tier in Redis (requires redis_enabled)
+    # Templates whose generated content and score reports may be cached ('["*"]' = all)
+    llm_response_cache_template_ids: list[str] = []
 
     # Conversation Configuration
     conversation_history_max_messages: int = 50  # Max messages to retain in context
     conversation_session_ttl_seconds: int = 3600  # 1 hour session TTL
 
+    # WebSocket Message Encoding
+    fast_json_enabled: bool = True  # Encode protocol messages with orjson (byte-identical to the json module, faster)
+
     # ==========================================================================
     # Agent Configuration
     # ==========================================================================
@@ -2,7 +2,7 @@
 
 Manages all active WebSocket connections, providing:
 - Connection lifecycle management (connect, disconnect)
-- Message sending (to connection, user, conversation, broadcast)
+- Message sending (to connection, user, conversation, broadcast), JSON encoded with orjson
 - Heartbeat (ping/pong) mechanism
 - Stale connection cleanup
 - Integration with ConversationOrchestrator for agent execution
@@ -20,6 +20,7 @@ from neuroglia.hosting.abstractions import ApplicationBuilderBase, HostedService
 from starlette.websockets import WebSocket, WebSocketState
 
 from application.protocol.core import ProtocolMessage, create_message
+from application.protocol.encoding import encode_message
 from application.protocol.enums import SERVER_CAPABILITIES, ConnectionCloseReason
 from application.protocol.system import SystemConnectionClosePayload, SystemConnectionEstablishedPayload, SystemPingPongPayload
 from application.websocket.connection import Connection
@@ -53,6 +54,7 @@ class ConnectionManager(HostedService):
         max_missed_pongs: int = 3,
         cleanup_interval_seconds: float = 60.0,
         idle_timeout_seconds: float = 300.0,
+        fast_json: bool = True,
     ):
         """Initialize the ConnectionManager.
 
@@ -62,6 +64,7 @@ class ConnectionManager(HostedService):
             max_missed_pongs: Max missed pongs before disconnect (default: 3)
             cleanup_interval_seconds: Interval for stale connection cleanup (default: 60s)
             idle_timeout_seconds: Idle time before connection is considered stale (default: 300s)
+            fast_json: Encode messages with orjson instead of the json module (same output)
         """
         self._connections: dict[str, Connection] = {}  # TODO: PubSub for scaling
         self._user_connections: dict[str, set[str]] = {}  # user_id -> set of connection_ids
@@ -73,6 +76,7 @@ class ConnectionManager(HostedService):
         self._max_missed_pongs = max_missed_pongs
         self._cleanup_interval = cleanup_interval_seconds
         self._idle_timeout = idle_timeout_seconds
+        self._fast_json = fast_json
 
         # Background tasks
         self._heartbeat_task: asyncio.Task | None = None
@@ -118,6 +122,7 @@ class ConnectionManager(HostedService):
             max_missed_pongs=getattr(app_settings, "ws_max_missed_pongs", 3),
             cleanup_interval_seconds=getattr(app_settings, "ws_cleanup_interval", 60.0),
             idle_timeout_seconds=getattr(app_settings, "ws_idle_timeout", 300.0),
+            fast_json=app_settings.fast_json_enabled,
         )
 
         # Register as singleton for DI
@@ -450,8 +455,8 @@ class ConnectionManager(HostedService):
             return False
 
         try:
-            message_dict = message.model_dump(by_alias=True, exclude_none=True)
-            await connection.websocket.send_json(message_dict)
+            # Same text frame as websocket.send_json(message_to_dict(message))
+            await connection.websocket.send_text(encode_message(message, fast=self._fast_json))
             connection.last_sent_message_id = message.id
             connection.update_activity()
             log.debug(f"📤 Sent {message.type} to {connection.connection_id[:8]}...")
@@ -0,0 +1,8 @@
+"""Load-test harness for the agent-host WebSocket chat path.
+
+Boots agent-host against local stand-ins (a scripted LLM provider, a
+synthetic tool catalog, in-memory sessions and repositories) and holds
+hundreds to thousands of concurrent conversations, measuring time to first
+token and server memory and CPU per connection. See
+docs/development/benchmarks.md.
+"""
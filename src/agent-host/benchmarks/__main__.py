@@ -0,0 +1,78 @@
+"""Run the WebSocket benchmark.
+
+Usage:
+    PYTHONPATH=. python -m benchmarks --profile baseline --save main
+    PYTHONPATH=. python -m benchmarks --profile baseline --compare main
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+from benchmarks.runner import PROFILES, baseline_path, build_report, compare, format_comparison, format_results, free_port, raise_open_files_limit, run_benchmark, save_report, service_process
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark agent-host WebSocket conversations against a scripted LLM")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="smoke", help="Connection profile (default: smoke)")
+    parser.add_argument("--connections", help="Comma-separated concurrent conversations per step, overriding the profile")
+    parser.add_argument("--messages", type=int, help="Messages per conversation, overriding the profile")
+    parser.add_argument("--think-time", type=float, help="Seconds between the turns of a conversation, overriding the profile")
+    parser.add_argument("--response-tokens", type=int, default=50, help="Tokens per scripted response (default: 50)")
+    parser.add_argument("--first-token-ms", type=float, default=300.0, help="Scripted time to first token (default: 300)")
+    parser.add_argument("--token-interval-ms", type=float, default=20.0, help="Scripted time between tokens (default: 20)")
+    parser.add_argument("--tool-call-every", type=int, default=0, help="Call a tool on every Nth turn, 0 for never (default: 0)")
+    parser.add_argument("--tool-latency-ms", type=float, default=50.0, help="Simulated tools-provider latency of a tool call (default: 50)")
+    parser.add_argument("--server-log-level", default="WARNING", help="Log level of the benchmark server (default: WARNING)")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this path")
+    parser.add_argument("--save", metavar="NAME", help="Save the report as baseline NAME")
+    parser.add_argument("--compare", metavar="NAME", help="Compare to baseline NAME and exit 1 on regression")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed growth of TTFT p95, CPU/message or memory/connection before a step regresses (default: 0.10)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    profile = PROFILES[args.profile]
+    if args.messages is not None or args.think_time is not None:
+        profile = replace(
+            profile,
+            messages_per_connection=args.messages if args.messages is not None else profile.messages_per_connection,
+            think_time_seconds=args.think_time if args.think_time is not None else profile.think_time_seconds,
+        )
+    connections = tuple(int(level) for level in args.connections.split(",")) if args.connections else profile.connections
+    scripted = {"response_tokens": args.response_tokens, "first_token_ms": args.first_token_ms, "token_interval_ms": args.token_interval_ms, "tool_call_every": args.tool_call_every}
+    settings = {**scripted, "tool_latency_ms": args.tool_latency_ms, "connections": list(connections), "messages": profile.messages_per_connection, "think_time": profile.think_time_seconds}
+
+    # Each conversation holds a socket on both sides; the server process inherits the raised limit
+    raise_open_files_limit(2 * max(connections) + 1024)
+
+    server_port = free_port()
+    server_url = f"http://127.0.0.1:{server_port}"
+    env = {"PYTHONPATH": os.pathsep.join(filter(None, [".", os.getenv("PYTHONPATH")])), "AGENT_HOST_LOG_LEVEL": args.server_log_level, "OTEL_ENABLED": os.getenv("OTEL_ENABLED", "false")}
+    server_args = ["--port", str(server_port), "--tool-latency-ms", str(args.tool_latency_ms)]
+    server_args += [arg for name, value in scripted.items() for arg in (f"--{name.replace('_', '-')}", str(value))]
+
+    with service_process("benchmarks.server", server_args, f"{server_url}/bench/ready", env) as server:
+        results = asyncio.run(run_benchmark(server_url, server.pid, profile, connections))
+
+    report = build_report(results, profile, settings)
+    print(format_results(results))
+    if args.output:
+        save_report(report, args.output)
+    if args.save:
+        print(f"\nSaved baseline {save_report(report, baseline_path(args.save))}")
+    if args.compare:
+        rows = compare(report, json.loads(baseline_path(args.compare).read_text()), args.threshold)
+        print(f"\nCompared to baseline '{args.compare}' (threshold {args.threshold:.0%}):\n{format_comparison(rows)}")
+        if any(row["regressed"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Micro-benchmark of the WebSocket frame encoding of protocol messages.
+
+Encodes typical messages two ways:
+
+- ``json``: encode_message(fast=False), which is what WebSocket.send_json does
+- ``orjson``: encode_message(), the default
+
+and checks that both write the same text.
+
+Usage:
+    PYTHONPATH=. python -m benchmarks.json_encoding --records 200
+"""
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from application.protocol.core import ProtocolMessage, create_message
+from application.protocol.data import ContentChunkPayload
+from application.protocol.encoding import encode_message
+
+
+def build_messages(record_count: int) -> dict[str, ProtocolMessage[Any]]:
+    """Messages of the chat path, from the most frequent (content chunks) to the largest (tool results)."""
+    return {
+        "content chunk": create_message(
+            "data.content.chunk",
+            ContentChunkPayload(content="The quick brown fox jumps over the lazy dog, ", messageId="msg_3f2a9c1d0b7e", final=False).model_dump(by_alias=True, exclude_none=True),
+            conversation_id="8d0f7a52-2f4c-4b4f-9f57-3c2a1d9e0b6a",
+        ),
+        "tool call": create_message(
+            "data.tool.call",
+            {"callId": "call_01", "toolName": "records:list_records", "arguments": {"query": "invoices", "status": "active", "page": 1, "page_size": 20}},
+            conversation_id="8d0f7a52-2f4c-4b4f-9f57-3c2a1d9e0b6a",
+        ),
+        f"tool result ({record_count} records)": create_message(
+            "data.tool.result",
+            {
+                "callId": "call_01",
+                "toolName": "records:list_records",
+                "success": True,
+                "result": {
+                    "items": [
+                        {"id": index, "title": f"Invoice {index} – Société Générale", "amount": index * 12.5, "paid": index % 3 == 0, "tags": ["finance", "q3"], "owner": None}
+                        for index in range(record_count)
+                    ],
+                    "total": record_count,
+                },
+                "executionTimeMs": 48.2,
+            },
+            conversation_id="8d0f7a52-2f4c-4b4f-9f57-3c2a1d9e0b6a",
+        ),
+    }
+
+
+def measure(encode: Callable[[], object]) -> float:
+    """Best time per call in microseconds, over five repeats of about 0.2 s each."""
+    timer = timeit.Timer(encode)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1_000_000
+
+
+def run(record_count: int) -> bool:
+    """Print the encoding times per message. Returns whether both encoders wrote the same text."""
+    identical = True
+    print(f"{'message':<26}  {'bytes':>7}  {'json us':>9}  {'orjson us':>9}  {'speedup':>7}  identical")
+    for name, message in build_messages(record_count).items():
+        fast, slow = encode_message(message), encode_message(message, fast=False)
+        identical &= fast == slow
+        json_us = measure(lambda: encode_message(message, fast=False))
+        orjson_us = measure(lambda: encode_message(message))
+        print(f"{name:<26}  {len(fast.encode()):>7}  {json_us:>9.1f}  {orjson_us:>9.1f}  {json_us / orjson_us:>6.1f}x  {'yes' if fast == slow else 'NO'}")
+    return identical
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.json_encoding", description="Benchmark the WebSocket frame encoding of protocol messages")
+    parser.add_argument("--records", type=int, default=200, help="Records in the tool result message (default: 200)")
+    args = parser.parse_args()
+    sys.exit(0 if run(args.records) else 1)
+
+
+if __name__ == "__main__":
+    main()
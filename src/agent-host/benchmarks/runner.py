@@ -0,0 +1,431 @@
+"""Load generation, statistics and baselines for the WebSocket benchmark.
+
+The runner starts the benchmark server as a subprocess, so the load
+generator doesn't share an event loop or a GIL with the code it measures.
+Each step of a profile holds N concurrent conversations:
+
+1. Ramp: N users create a conversation (``POST /api/chat/new``) and open its
+   WebSocket, a bounded number at a time, until the server enables chat input
+2. Messaging: every connection sends its messages one turn at a time, with
+   a think time between turns, and records ack, first-token and completion
+   latencies
+3. Teardown: every connection closes
+
+Server memory is sampled before and after the ramp (memory per connection),
+and server CPU time over the messaging phase (CPU per message). Both come
+from psutil when it is installed, or from /proc otherwise.
+"""
+
+import asyncio
+import json
+import math
+import os
+import random
+import resource
+import socket
+import subprocess  # nosec B404 - starts the benchmark's own server process
+import sys
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+from websockets.asyncio.client import ClientConnection, connect
+
+from benchmarks.stand_ins import BENCH_DEFINITION_ID
+
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None  # type: ignore[assignment]
+    PSUTIL_AVAILABLE = False
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASELINES_DIR = BENCHMARKS_DIR / "baselines"
+
+
+@dataclass(frozen=True)
+class Profile:
+    """A connection profile: the concurrent conversations of each step and the turns each one sends."""
+
+    name: str
+    connections: tuple[int, ...]
+    messages_per_connection: int
+    think_time_seconds: float
+    ramp_concurrency: int = 50
+
+
+PROFILES: dict[str, Profile] = {
+    "smoke": Profile("smoke", connections=(10, 50), messages_per_connection=2, think_time_seconds=0.5),
+    "baseline": Profile("baseline", connections=(100, 500, 1000), messages_per_connection=3, think_time_seconds=2.0),
+    "stress": Profile("stress", connections=(1000, 2000, 5000), messages_per_connection=3, think_time_seconds=5.0, ramp_concurrency=100),
+}
+
+
+@dataclass
+class StepResult:
+    """Measurements of one step (N concurrent conversations)."""
+
+    connections: int
+    connected: int
+    errors: int
+    messages: int
+    duration_seconds: float
+    frames_per_second: float
+    setup_ms: dict[str, dict[str, float]]
+    message_ms: dict[str, dict[str, float]]
+    server: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"ws@{self.connections}"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (0 when empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Count, mean, p50/p95/p99 and max of a list of durations."""
+    return {
+        "count": len(samples),
+        "mean": round(sum(samples) / len(samples), 3) if samples else 0.0,
+        "p50": round(percentile(samples, 50), 3),
+        "p95": round(percentile(samples, 95), 3),
+        "p99": round(percentile(samples, 99), 3),
+        "max": round(max(samples), 3) if samples else 0.0,
+    }
+
+
+# =============================================================================
+# Server resource sampling
+# =============================================================================
+
+
+def sample_process(pid: int) -> tuple[int, float]:
+    """Resident memory (KB) and CPU time (seconds, user + system) of a process."""
+    if PSUTIL_AVAILABLE:
+        process = psutil.Process(pid)
+        cpu = process.cpu_times()
+        return process.memory_info().rss // 1024, cpu.user + cpu.system
+    rss_kb = 0
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            rss_kb = int(line.split()[1])
+            break
+    # Fields after the ")" closing the command name: utime and stime are the 12th and 13th
+    fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    return rss_kb, (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def raise_open_files_limit(wanted: int) -> int:
+    """Raise the soft RLIMIT_NOFILE towards ``wanted`` (capped by the hard limit); return the new soft limit."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+    if target > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        return target
+    return soft
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+
+def envelope(message_type: str, conversation_id: str, payload: dict[str, Any]) -> str:
+    """Serialize a client message in the protocol envelope."""
+    return json.dumps(
+        {
+            "id": str(uuid.uuid4()),
+            "type": message_type,
+            "version": "1.0",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "source": "client",
+            "conversationId": conversation_id,
+            "payload": payload,
+        }
+    )
+
+
+class ChatClient:
+    """One simulated user: a conversation, its WebSocket, and the timings of each turn."""
+
+    def __init__(self, base_url: str, session_id: str, cookie_name: str) -> None:
+        self._base_url = base_url
+        self._cookie = f"{cookie_name}={session_id}"
+        self._socket: ClientConnection | None = None
+        self._reader: asyncio.Task | None = None
+        self._ready = asyncio.Event()
+        self._turn: dict[str, float] = {}
+        self.conversation_id = ""
+        self.frames = 0
+        self.setup_ms: dict[str, float] = {}
+        self.turns: list[dict[str, float]] = []
+        self.errors = 0
+
+    async def open(self, http: httpx.AsyncClient, timeout_seconds: float) -> None:
+        """Create a conversation, connect its WebSocket and wait until chat input is enabled."""
+        started = time.perf_counter()
+        response = await http.post("/api/chat/new", json={"definition_id": BENCH_DEFINITION_ID}, headers={"Cookie": self._cookie})
+        response.raise_for_status()
+        created = response.json()
+        self.conversation_id = created["conversation_id"]
+        self.setup_ms["create"] = (time.perf_counter() - started) * 1000
+
+        ws_path = urlsplit(created["ws_url"])
+        url = f"{self._base_url.replace('http', 'ws', 1)}{ws_path.path}?{ws_path.query}"
+        self._socket = await connect(url, additional_headers={"Cookie": self._cookie}, max_size=None, open_timeout=timeout_seconds)
+        self.setup_ms["connect"] = (time.perf_counter() - started) * 1000
+        self._reader = asyncio.create_task(self._read())
+        await asyncio.wait_for(self._ready.wait(), timeout_seconds)
+        self.setup_ms["ready"] = (time.perf_counter() - started) * 1000
+
+    async def send(self, content: str, timeout_seconds: float) -> None:
+        """Send one user message and wait for the end of the agent's turn."""
+        assert self._socket is not None  # nosec B101
+        self._ready.clear()
+        self._turn = {"sent": time.perf_counter()}
+        await self._socket.send(envelope("data.message.send", self.conversation_id, {"content": content}))
+        await asyncio.wait_for(self._ready.wait(), timeout_seconds)
+        sent = self._turn.pop("sent")
+        if "complete" not in self._turn:
+            raise RuntimeError("turn ended without data.content.complete")
+        self.turns.append({stage: (at - sent) * 1000 for stage, at in self._turn.items()})
+
+    async def close(self) -> None:
+        if self._socket is not None:
+            with suppress(Exception):
+                await self._socket.close()
+        if self._reader is not None:
+            self._reader.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader
+
+    async def _read(self) -> None:
+        assert self._socket is not None  # nosec B101
+        with suppress(Exception):
+            async for raw in self._socket:
+                self.frames += 1
+                message = json.loads(raw)
+                message_type, payload = message.get("type"), message.get("payload") or {}
+                now = time.perf_counter()
+                if message_type == "system.ping":
+                    await self._socket.send(envelope("system.pong", self.conversation_id, {"timestamp": datetime.now(UTC).isoformat()}))
+                elif message_type == "data.message.ack":
+                    self._turn.setdefault("ack", now)
+                elif message_type == "data.content.chunk":
+                    self._turn.setdefault("first_token", now)
+                elif message_type == "data.content.complete":
+                    self._turn["complete"] = now
+                elif message_type == "control.flow.chatInput" and payload.get("enabled"):
+                    self._ready.set()
+                elif message_type == "system.error":
+                    self.errors += 1
+                    self._ready.set()
+
+
+# =============================================================================
+# Load generation
+# =============================================================================
+
+
+async def run_step(base_url: str, pid: int, connections: int, profile: Profile, offset: int = 0, timeout_seconds: float = 120.0) -> StepResult:
+    """Hold ``connections`` concurrent conversations through a ramp, a messaging phase and a teardown."""
+    limits = httpx.Limits(max_connections=profile.ramp_concurrency, max_keepalive_connections=profile.ramp_concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout_seconds) as http:
+        created = (await http.post("/bench/sessions", params={"count": connections, "offset": offset})).json()
+        clients = [ChatClient(base_url, session_id, created["cookie"]) for session_id in created["sessions"]]
+        rss_before_kb, _ = sample_process(pid)
+
+        gate = asyncio.Semaphore(profile.ramp_concurrency)
+        errors = 0
+
+        async def open_client(client: ChatClient) -> bool:
+            nonlocal errors
+            async with gate:
+                try:
+                    await client.open(http, timeout_seconds)
+                    return True
+                except Exception:
+                    errors += 1
+                    return False
+
+        opened = await asyncio.gather(*(open_client(client) for client in clients))
+        connected = [client for client, ok in zip(clients, opened, strict=True) if ok]
+
+    await asyncio.sleep(1.0)  # Let connection setup garbage settle before sampling
+    rss_connected_kb, cpu_before = sample_process(pid)
+    frames_before = sum(client.frames for client in connected)
+
+    async def converse(client: ChatClient) -> None:
+        nonlocal errors
+        await asyncio.sleep(random.uniform(0, profile.think_time_seconds))  # nosec B311 - desynchronizes the first turns
+        for turn in range(profile.messages_per_connection):
+            if turn:
+                await asyncio.sleep(profile.think_time_seconds)
+            try:
+                await client.send(f"Benchmark question {turn} from {client.conversation_id}", timeout_seconds)
+            except Exception:
+                errors += 1
+                return
+
+    started = time.perf_counter()
+    await asyncio.gather(*(converse(client) for client in connected))
+    elapsed = time.perf_counter() - started
+    rss_after_kb, cpu_after = sample_process(pid)
+    frames = sum(client.frames for client in connected) - frames_before
+
+    await asyncio.gather(*(client.close() for client in clients))
+
+    turns = [turn for client in connected for turn in client.turns]
+    cpu_seconds = cpu_after - cpu_before
+    return StepResult(
+        connections=connections,
+        connected=len(connected),
+        errors=errors + sum(client.errors for client in connected),
+        messages=len(turns),
+        duration_seconds=round(elapsed, 3),
+        frames_per_second=round(frames / elapsed, 1) if elapsed else 0.0,
+        setup_ms={stage: summarize([client.setup_ms[stage] for client in connected]) for stage in ("create", "connect", "ready")},
+        message_ms={stage: summarize([turn[stage] for turn in turns if stage in turn]) for stage in ("ack", "first_token", "complete")},
+        server={
+            "rss_mb": round(rss_after_kb / 1024, 1),
+            "rss_kb_per_connection": round((rss_connected_kb - rss_before_kb) / len(connected), 1) if connected else 0.0,
+            "cpu_percent": round(cpu_seconds / elapsed * 100, 1) if elapsed else 0.0,
+            "cpu_ms_per_message": round(cpu_seconds * 1000 / len(turns), 3) if turns else 0.0,
+        },
+    )
+
+
+async def run_benchmark(base_url: str, pid: int, profile: Profile, connections: tuple[int, ...] | None = None) -> list[StepResult]:
+    """Run every step of the profile, each with a fresh set of users."""
+    results: list[StepResult] = []
+    offset = 0
+    for level in connections or profile.connections:
+        results.append(await run_step(base_url, pid, level, profile, offset=offset))
+        offset += level
+        await asyncio.sleep(1.0)  # Let the server finish closing the previous step's connections
+    return results
+
+
+# =============================================================================
+# Processes
+# =============================================================================
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def service_process(module: str, args: list[str], ready_url: str, env: dict[str, str] | None = None, timeout_seconds: float = 60.0) -> Iterator[subprocess.Popen]:
+    """Run ``python -m module`` until the context exits, once ``ready_url`` answers 200."""
+    process = subprocess.Popen([sys.executable, "-m", module, *args], cwd=BENCHMARKS_DIR.parent, env={**os.environ, **(env or {})})  # nosec B603
+    try:
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"{module} exited with code {process.returncode} during startup")
+            try:
+                if httpx.get(ready_url, timeout=1.0).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{module} not ready after {timeout_seconds}s")
+            time.sleep(0.2)
+        yield process
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+# =============================================================================
+# Reports and baselines
+# =============================================================================
+
+
+def build_report(results: list[StepResult], profile: Profile, settings: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "profile": profile.name,
+        "settings": settings,
+        "python": sys.version.split()[0],
+        "steps": [asdict(result) for result in results],
+    }
+
+
+def save_report(report: dict[str, Any], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
+    return path
+
+
+def baseline_path(name: str) -> Path:
+    return BASELINES_DIR / f"{name}.json"
+
+
+def format_results(results: list[StepResult]) -> str:
+    """Render results as a table with one row per step."""
+    lines = [f"{'step':<10}{'conn':>6}{'err':>5}{'ready p95':>11}{'ack p95':>9}{'ttft p50':>10}{'ttft p95':>10}{'done p95':>10}{'frames/s':>10}{'KB/conn':>9}{'cpu ms/msg':>12}{'cpu %':>7}"]
+    for result in results:
+        setup, message, server = result.setup_ms, result.message_ms, result.server
+        lines.append(
+            f"{result.key:<10}{result.connected:>6}{result.errors:>5}{setup['ready']['p95']:>11.1f}{message['ack']['p95']:>9.1f}"
+            f"{message['first_token']['p50']:>10.1f}{message['first_token']['p95']:>10.1f}{message['complete']['p95']:>10.1f}"
+            f"{result.frames_per_second:>10.1f}{server['rss_kb_per_connection']:>9.1f}{server['cpu_ms_per_message']:>12.2f}{server['cpu_percent']:>7.1f}"
+        )
+    return "\n".join(lines)
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.10) -> list[dict[str, Any]]:
+    """Compare a report to a baseline, step by step.
+
+    A step regresses when its p95 time to first token, its server CPU per
+    message or its memory per connection grew by more than ``threshold``
+    (a fraction). Steps missing from either side are skipped.
+    """
+    previous = {step["connections"]: step for step in baseline["steps"]}
+    rows = []
+    for step in report["steps"]:
+        if step["connections"] not in previous:
+            continue
+        before = previous[step["connections"]]
+        changes = {
+            "ttft_p95_change": _relative_change(before["message_ms"]["first_token"]["p95"], step["message_ms"]["first_token"]["p95"]),
+            "cpu_change": _relative_change(before["server"]["cpu_ms_per_message"], step["server"]["cpu_ms_per_message"]),
+            "memory_change": _relative_change(before["server"]["rss_kb_per_connection"], step["server"]["rss_kb_per_connection"]),
+        }
+        rows.append({"step": f"ws@{step['connections']}", **changes, "regressed": any(change > threshold for change in changes.values())})
+    return rows
+
+
+def _relative_change(before: float, after: float) -> float:
+    return (after - before) / before if before else 0.0
+
+
+def format_comparison(rows: list[dict[str, Any]]) -> str:
+    lines = [f"{'step':<10}{'ttft p95':>10}{'cpu/msg':>10}{'KB/conn':>10}"]
+    for row in rows:
+        flag = "  REGRESSED" if row["regressed"] else ""
+        lines.append(f"{row['step']:<10}{row['ttft_p95_change']:>+10.1%}{row['cpu_change']:>+10.1%}{row['memory_change']:>+10.1%}{flag}")
+    return "\n".join(lines)
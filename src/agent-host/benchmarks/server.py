@@ -0,0 +1,191 @@
+"""Benchmark build of the agent-host application.
+
+Composes the same services as ``main.create_app`` for the chat path, with a
+few of them swapped for the stand-ins in ``benchmarks.stand_ins``:
+
+- conversations, definitions and templates are kept in memory
+- RedisSessionStore keeps sessions in a dict
+- ToolProviderClient serves a synthetic tool catalog
+- the only LLM provider is ScriptedLlmProvider
+
+The chat path itself is the real one: AuthService, ChatController,
+WebSocketController, ConnectionManager, the Orchestrator, ReActAgent, the
+LlmGateway and the mediator with its handlers. ``/bench/*`` routes expose
+readiness, session creation and connection statistics.
+
+Usage:
+    PYTHONPATH=. python -m benchmarks.server --port 8030 --first-token-ms 300
+"""
+
+import argparse
+import logging
+
+import uvicorn
+from fastapi import FastAPI
+from neuroglia.data.infrastructure.abstractions import Repository
+from neuroglia.eventing.cloud_events.infrastructure.cloud_event_publisher import CloudEventPublisher
+from neuroglia.hosting.web import SubAppConfig, WebApplicationBuilder
+from neuroglia.mapping import Mapper
+from neuroglia.mediation import Mediator
+from neuroglia.serialization.json import JsonSerializer
+
+from api.services.auth_service import AuthService
+from application.services.chat_service import ChatService
+from application.services.definition_cache import DefinitionCache
+from application.services.tool_provider_client import ToolProviderClient
+from application.settings import app_settings, configure_logging
+from application.websocket.manager import ConnectionManager
+from benchmarks.stand_ins import (
+    BenchToolProviderClient,
+    InMemoryAgentDefinitionRepository,
+    InMemoryConversationTemplateRepository,
+    InMemorySessionStore,
+    bench_definition,
+    create_bench_session,
+)
+from domain.entities import AgentDefinition, Conversation, ConversationTemplate
+from domain.repositories import AgentDefinitionRepository, ConversationRepository, ConversationTemplateRepository
+from infrastructure.repositories import InMemoryConversationRepository
+from infrastructure.session_store import RedisSessionStore
+
+log = logging.getLogger(__name__)
+
+
+def create_bench_app(
+    response_tokens: int = 50,
+    first_token_ms: float = 300.0,
+    token_interval_ms: float = 20.0,
+    tool_call_every: int = 0,
+    tool_count: int = 20,
+    tool_latency_ms: float = 50.0,
+) -> FastAPI:
+    """Create the agent-host app wired to the benchmark stand-ins.
+
+    Args:
+        response_tokens: Tokens per scripted LLM response
+        first_token_ms: Scripted delay before the first token
+        token_interval_ms: Scripted delay between tokens
+        tool_call_every: Call a tool on every Nth user turn (0 = never)
+        tool_count: Number of tools in the synthetic catalog
+        tool_latency_ms: Simulated tools-provider latency of a tool call
+
+    Returns:
+        The FastAPI application
+    """
+    # Only the scripted provider, without a per-model cap: the benchmark measures agent-host, not admission control
+    app_settings.ollama_enabled = False
+    app_settings.openai_enabled = False
+    app_settings.scripted_llm_enabled = True
+    app_settings.default_llm_provider = "scripted"
+    app_settings.scripted_llm_response_tokens = response_tokens
+    app_settings.scripted_llm_first_token_ms = first_token_ms
+    app_settings.scripted_llm_token_interval_ms = token_interval_ms
+    app_settings.scripted_llm_tool_call_every = tool_call_every
+    app_settings.llm_max_concurrency = 100_000
+
+    builder = WebApplicationBuilder(app_settings=app_settings)
+
+    # Core services
+    Mediator.configure(builder, ["application.commands", "application.queries", "application.events", "application.events.domain", "application.events.websocket"])
+    Mapper.configure(builder, ["application.commands", "application.queries", "application.mapping", "integration.models"])
+    JsonSerializer.configure(builder, ["domain.entities", "domain.models", "integration.models"])
+    CloudEventPublisher.configure(builder)
+
+    # Repositories (registered like MotorRepository.configure: generic and domain interfaces)
+    conversations = InMemoryConversationRepository()
+    definitions = InMemoryAgentDefinitionRepository()
+    templates = InMemoryConversationTemplateRepository()
+    definition = bench_definition(f"scripted:{app_settings.scripted_llm_model}")
+    definitions.entities[definition.id()] = definition
+    for service_type, repository in (
+        (Repository[Conversation, str], conversations),
+        (ConversationRepository, conversations),
+        (Repository[AgentDefinition, str], definitions),
+        (AgentDefinitionRepository, definitions),
+        (Repository[ConversationTemplate, str], templates),
+        (ConversationTemplateRepository, templates),
+    ):
+        builder.services.add_singleton(service_type, singleton=repository)
+
+    # Infrastructure services, in main._configure_infrastructure_services order, with the stand-ins
+    session_store = InMemorySessionStore(session_timeout_seconds=app_settings.session_timeout_hours * 3600, key_prefix=app_settings.redis_key_prefix)
+    builder.services.add_singleton(RedisSessionStore, singleton=session_store)
+    builder.services.add_singleton(AuthService, singleton=AuthService(session_store=session_store, settings=app_settings))
+    tool_provider_client = BenchToolProviderClient(tool_count=tool_count, latency_ms=tool_latency_ms)
+    builder.services.add_singleton(ToolProviderClient, singleton=tool_provider_client)
+    DefinitionCache.configure(builder)
+
+    from application.agents.react_agent import ReActAgent
+    from application.orchestrator.agent.tool_selector import ToolSelector
+    from infrastructure.adapters.scripted_llm_provider import ScriptedLlmProvider
+    from infrastructure.llm_gateway import LlmGateway
+    from infrastructure.llm_provider_factory import LlmProviderFactory, set_provider_factory
+    from infrastructure.llm_response_cache import LlmResponseCache
+
+    ToolSelector.configure(builder)
+    ScriptedLlmProvider.configure(builder)
+    LlmGateway.configure(builder)
+    set_provider_factory(LlmProviderFactory.configure(builder))
+    LlmResponseCache.configure(builder)
+    ReActAgent.configure(builder)
+    ChatService.configure(builder)
+    ConnectionManager.configure(builder)
+
+    def api_sub_app_setup(app: FastAPI, settings) -> None:
+        app.state.auth_service = app.state.services.get_required_service(AuthService)
+
+        from api.controllers.websocket_controller import WebSocketController
+
+        app.include_router(WebSocketController.get_router(), prefix="/chat", tags=["WebSocket"])
+
+    builder.add_sub_app(SubAppConfig(path="/api", name="api", title="agent-host benchmark API", controllers=["api.controllers"], custom_setup=api_sub_app_setup, docs_url=None))
+    app = builder.build_app_with_lifespan(title="agent-host benchmark", version=app_settings.app_version)
+
+    from main import _wire_orchestrator
+
+    _wire_orchestrator(app)
+    AuthService.configure_middleware(app)
+    manager = app.state.services.get_required_service(ConnectionManager)
+
+    @app.get("/bench/ready")
+    async def ready() -> dict:
+        return {"definition_id": definition.id(), "model": definition.state.model, "tools": tool_count}
+
+    @app.post("/bench/sessions")
+    async def sessions(count: int = 1, offset: int = 0) -> dict:
+        """Create ``count`` user sessions, as the OAuth2 callback would."""
+        return {"cookie": app_settings.session_cookie_name, "sessions": [create_bench_session(session_store, offset + index) for index in range(count)]}
+
+    @app.get("/bench/stats")
+    async def stats() -> dict:
+        return {"connections": manager.get_stats(), "conversations": len(await conversations.get_all_async()), "tool_calls": tool_provider_client.call_count}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve agent-host against the benchmark stand-ins")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8030)
+    parser.add_argument("--response-tokens", type=int, default=50)
+    parser.add_argument("--first-token-ms", type=float, default=300.0)
+    parser.add_argument("--token-interval-ms", type=float, default=20.0)
+    parser.add_argument("--tool-call-every", type=int, default=0)
+    parser.add_argument("--tools", type=int, default=20)
+    parser.add_argument("--tool-latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    configure_logging(log_level=app_settings.log_level)
+    app = create_bench_app(
+        response_tokens=args.response_tokens,
+        first_token_ms=args.first_token_ms,
+        token_interval_ms=args.token_interval_ms,
+        tool_call_every=args.tool_call_every,
+        tool_count=args.tools,
+        tool_latency_ms=args.tool_latency_ms,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False, ws_max_queue=1024)
+
+
+if __name__ == "__main__":
+    main()
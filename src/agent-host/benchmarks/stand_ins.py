@@ -0,0 +1,158 @@
+"""In-process stand-ins for the infrastructure agent-host depends on.
+
+The benchmark server swaps these in for MongoDB, Redis, Keycloak and the
+tools-provider, so WebSocket capacity can be measured on a laptop or CI runner:
+
+- In-memory definition and template repositories (conversations use InMemoryConversationRepository)
+- A session store backed by a dict instead of Redis
+- Locally minted session tokens (only ever decoded without verification)
+- A tools-provider client serving a synthetic tool catalog with simulated latency
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import jwt
+from neuroglia.data.infrastructure.memory import MemoryRepository
+
+from application.services.tool_provider_client import ToolProviderClient
+from domain.entities import AgentDefinition, ConversationTemplate
+from domain.repositories import AgentDefinitionRepository, ConversationTemplateRepository
+from infrastructure.session_store import RedisSessionStore
+
+log = logging.getLogger(__name__)
+
+BENCH_DEFINITION_ID = "bench-agent"
+BENCH_TOKEN_KEY = "agent-host-benchmark"  # Session tokens are never verified, only decoded
+
+
+# =============================================================================
+# Definitions and templates
+# =============================================================================
+
+
+class InMemoryAgentDefinitionRepository(MemoryRepository[AgentDefinition, str], AgentDefinitionRepository):
+    """In-memory AgentDefinition repository."""
+
+    async def get_all_async(self) -> list[AgentDefinition]:
+        return list(self.entities.values())
+
+    async def get_by_owner_async(self, owner_user_id: str) -> list[AgentDefinition]:
+        return list(self.find(lambda d: d.state.owner_user_id == owner_user_id))
+
+    async def get_public_async(self) -> list[AgentDefinition]:
+        return list(self.find(lambda d: d.state.is_public))
+
+
+class InMemoryConversationTemplateRepository(MemoryRepository[ConversationTemplate, str], ConversationTemplateRepository):
+    """In-memory ConversationTemplate repository."""
+
+    async def get_all_async(self) -> list[ConversationTemplate]:
+        return list(self.entities.values())
+
+    async def get_proactive_async(self) -> list[ConversationTemplate]:
+        return list(self.find(lambda t: t.state.agent_starts_first))
+
+    async def get_assessments_async(self) -> list[ConversationTemplate]:
+        return list(self.find(lambda t: t.state.agent_starts_first and t.state.passing_score_percent is not None))
+
+    async def get_by_creator_async(self, created_by: str) -> list[ConversationTemplate]:
+        return list(self.find(lambda t: t.state.created_by == created_by))
+
+
+def bench_definition(model: str) -> AgentDefinition:
+    """The reactive agent every benchmark conversation talks to."""
+    return AgentDefinition(
+        definition_id=BENCH_DEFINITION_ID,
+        name="Benchmark Agent",
+        system_prompt="You are a helpful assistant.",
+        description="Reactive agent backed by the scripted LLM provider",
+        model=model,
+        allow_model_selection=False,
+        created_by="benchmark",
+    )
+
+
+# =============================================================================
+# Sessions
+# =============================================================================
+
+
+class _DictRedis:
+    """The subset of the redis client used by RedisSessionStore (TTLs are not enforced)."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[str, int]] = {}
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self._values[key] = (value, ttl)
+
+    def get(self, key: str) -> str | None:
+        entry = self._values.get(key)
+        return entry[0] if entry else None
+
+    def ttl(self, key: str) -> int:
+        entry = self._values.get(key)
+        return entry[1] if entry else -2
+
+    def delete(self, key: str) -> None:
+        self._values.pop(key, None)
+
+    def ping(self) -> bool:
+        return True
+
+
+class InMemorySessionStore(RedisSessionStore):
+    """RedisSessionStore keeping sessions in process memory."""
+
+    def __init__(self, session_timeout_seconds: int = 3600, key_prefix: str = "agent-host:session:") -> None:
+        self._client = _DictRedis()
+        self._session_timeout_seconds = session_timeout_seconds
+        self._key_prefix = key_prefix
+
+
+def mint_token(claims: dict[str, Any], ttl_seconds: int = 86400) -> str:
+    """Mint a session token (agent-host only decodes session tokens to read their expiry)."""
+    now = int(time.time())
+    return jwt.encode({"iat": now, "exp": now + ttl_seconds, **claims}, BENCH_TOKEN_KEY, algorithm="HS256")
+
+
+def create_bench_session(session_store: RedisSessionStore, index: int) -> str:
+    """Create the session of benchmark user ``index``, as the OAuth2 callback would."""
+    user_info = {"sub": f"bench-user-{index}", "preferred_username": f"bench{index}", "name": f"Bench User {index}", "roles": ["user"]}
+    tokens = {"access_token": mint_token({"sub": user_info["sub"], "typ": "Bearer"}), "refresh_token": mint_token({"sub": user_info["sub"], "typ": "Refresh"})}
+    return session_store.create_session(tokens, user_info)
+
+
+# =============================================================================
+# Tools provider
+# =============================================================================
+
+
+class BenchToolProviderClient(ToolProviderClient):
+    """ToolProviderClient serving a synthetic tool catalog instead of calling the tools-provider."""
+
+    def __init__(self, tool_count: int = 20, latency_ms: float = 50.0) -> None:
+        super().__init__(base_url="http://tools-provider.invalid")
+        self._latency_seconds = latency_ms / 1000
+        self._tools = [
+            {
+                "name": f"bench:lookup_{index:03d}",
+                "description": f"Look up records of catalog {index}",
+                "input_schema": {"type": "object", "properties": {"query": {"type": "string", "description": "Search terms"}}, "required": ["query"]},
+                "tags": ["benchmark", f"catalog-{index % 5}"],
+                "source_id": "bench",
+            }
+            for index in range(tool_count)
+        ]
+        self.call_count = 0
+
+    async def get_tools(self, access_token: str) -> list[dict[str, Any]]:
+        return self._tools
+
+    async def execute_tool(self, tool_name: str, arguments: dict[str, Any], access_token: str) -> dict[str, Any]:
+        self.call_count += 1
+        await asyncio.sleep(self._latency_seconds)
+        return {"success": True, "result": {"tool": tool_name, "arguments": arguments, "items": [{"id": index, "title": f"Record {index}"} for index in range(5)]}}
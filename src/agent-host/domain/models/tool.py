@@ -95,6 +95,7 @@ class Tool:
     parameters: list[ToolParameter] = field(default_factory=list)
     service_id: str | None = None
     category: str | None = None
+    tags: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def to_ollama_function(self) -> dict[str, Any]:
@@ -135,6 +136,7 @@ class Tool:
             "parameters": [p.to_dict() for p in self.parameters],
             "service_id": self.service_id,
             "category": self.category,
+            "tags": self.tags,
             "metadata": self.metadata,
         }
 
@@ -207,5 +209,6 @@ class Tool:
             parameters=parameters,
             service_id=data.get("source_id") or data.get("serviceId"),
             category=data.get("category"),
+            tags=data.get("tags") or [],
             metadata=data.get("metadata", {}),
         )
@@ -7,6 +7,8 @@ Contains:
 - app_settings_service.py: MongoDB-based settings storage
 - openai_token_cache.py: OAuth2 token caching for OpenAI
 - llm_provider_factory.py: Factory for runtime LLM provider selection
+- llm_gateway.py: Admission control, priority queueing and retries for LLM calls
+- llm_response_cache.py: Prompt-hash response cache for deterministic generation
 - database_seeder.py: YAML-based database seeding
 - skill_loader.py: Skill template loading
 - yaml_exporter.py: Export to seed-compatible YAML
@@ -18,7 +20,9 @@ from infrastructure.adapters.openai_llm_provider import OpenAiLlmProvider
 from infrastructure.app_settings_service import AppSettingsService, get_settings_service
 from infrastructure.database_seeder import DatabaseSeeder, DatabaseSeederService, get_database_seeder
 from infrastructure.definition_store_initializer import DefinitionRepositoryInitializer  # Deprecated
+from infrastructure.llm_gateway import GatewayLlmProvider, LlmGateway
 from infrastructure.llm_provider_factory import LlmProviderFactory, get_provider_factory, set_provider_factory
+from infrastructure.llm_response_cache import LlmResponseCache
 from infrastructure.openai_token_cache import CachedToken, OpenAiTokenCache, get_openai_token_cache, set_openai_token_cache
 from infrastructure.session_store import RedisSessionStore
 from infrastructure.skill_loader import SkillLoader, get_skill_loader, set_skill_loader
@@ -47,6 +51,11 @@ __all__ = [
     "OllamaError",
     "OllamaLlmProvider",
     "OpenAiLlmProvider",
+    # LLM Gateway
+    "GatewayLlmProvider",
+    "LlmGateway",
+    # LLM Response Cache
+    "LlmResponseCache",
     # LLM Provider Factory
     "LlmProviderFactory",
     "get_provider_factory",
@@ -1,12 +1,16 @@
 """Infrastructure adapters for Agent Host."""
 
 from infrastructure.adapters.ollama_adapter import OllamaAdapter
+from infrastructure.adapters.ollama_embedding_backend import OllamaEmbeddingBackend
 from infrastructure.adapters.ollama_llm_provider import OllamaError, OllamaLlmProvider
 from infrastructure.adapters.openai_llm_provider import OpenAiLlmProvider
+from infrastructure.adapters.scripted_llm_provider import ScriptedLlmProvider
 
 __all__ = [
     "OllamaAdapter",
+    "OllamaEmbeddingBackend",
     "OllamaError",
     "OllamaLlmProvider",
     "OpenAiLlmProvider",
+    "ScriptedLlmProvider",
 ]
@@ -0,0 +1,68 @@
+"""Ollama text embedding backend.
+
+Embeds texts with an Ollama embedding model (e.g. nomic-embed-text) through
+the /api/embed endpoint. Used by the ToolSelector for hybrid tool ranking.
+"""
+
+import logging
+
+import httpx
+
+from application.agents.llm_provider import LlmProviderError
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaEmbeddingBackend:
+    """ToolEmbeddingBackend implementation backed by Ollama."""
+
+    def __init__(self, base_url: str, model: str, timeout: float = 30.0) -> None:
+        """Initialize the backend.
+
+        Args:
+            base_url: Ollama API URL
+            model: Embedding model name
+            timeout: Request timeout in seconds
+        """
+        self._base_url = (base_url or "http://localhost:11434").rstrip("/")
+        self._model = model
+        self._timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(base_url=self._base_url, timeout=self._timeout)
+        return self._client
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts into vectors (one per text, in order).
+
+        Raises:
+            LlmProviderError: If Ollama returns an error
+        """
+        client = await self._get_client()
+        try:
+            response = await client.post("/api/embed", json={"model": self._model, "input": texts})
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise LlmProviderError(
+                message=f"Ollama embedding failed: {e.response.text}",
+                error_code="ollama_embedding_error",
+                provider="ollama",
+                details={"status_code": e.response.status_code, "model": self._model},
+            ) from e
+        except httpx.HTTPError as e:
+            raise LlmProviderError(
+                message=f"Cannot reach Ollama for embeddings: {e}",
+                error_code="ollama_connection_error",
+                provider="ollama",
+                is_retryable=True,
+            ) from e
+        return response.json()["embeddings"]
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
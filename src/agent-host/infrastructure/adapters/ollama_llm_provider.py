@@ -191,6 +191,8 @@ class OllamaLlmProvider(LlmProvider):
                 "num_ctx": self._num_ctx,
             },
         }
+        if self._config.seed is not None:
+            payload["options"]["seed"] = self._config.seed
 
         ollama_tools = self._convert_tools(tools)
         if ollama_tools:
@@ -251,6 +253,7 @@ class OllamaLlmProvider(LlmProvider):
                 message=f"AI model error: {error_text[:200]}",
                 error_code="ollama_error",
                 is_retryable=e.response.status_code >= 500,
+                details={"status_code": e.response.status_code},
             )
         except httpx.RequestError as e:
             logger.error(f"Ollama request error: {e}")
@@ -291,6 +294,8 @@ class OllamaLlmProvider(LlmProvider):
                 "num_ctx": self._num_ctx,
             },
         }
+        if self._config.seed is not None:
+            payload["options"]["seed"] = self._config.seed
 
         ollama_tools = self._convert_tools(tools)
         if ollama_tools:
@@ -339,6 +344,7 @@ class OllamaLlmProvider(LlmProvider):
                             message=f"AI model error: {error_text[:200]}",
                             error_code="ollama_error",
                             is_retryable=response.status_code >= 500,
+                            details={"status_code": response.status_code},
                         )
 
                     chunk_count = 0
@@ -449,6 +455,7 @@ class OllamaLlmProvider(LlmProvider):
                     message=f"AI model error: {error_text[:200]}",
                     error_code="ollama_error",
                     is_retryable=e.response.status_code >= 500,
+                    details={"status_code": e.response.status_code},
                 )
             except httpx.RequestError as e:
                 span.set_attribute("error", True)
@@ -578,6 +585,7 @@ class OllamaLlmProvider(LlmProvider):
             model=settings.ollama_model,
             temperature=settings.ollama_temperature,
             top_p=settings.ollama_top_p,
+            seed=settings.ollama_seed,
             timeout=settings.ollama_timeout,
             base_url=settings.ollama_url,
             extra={"num_ctx": settings.ollama_num_ctx},
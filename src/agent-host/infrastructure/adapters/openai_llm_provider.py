@@ -297,6 +297,9 @@ class OpenAiLlmProvider(LlmProvider):
         if self._config.max_tokens:
             body["max_tokens"] = self._config.max_tokens
 
+        if self._config.seed is not None:
+            body["seed"] = self._config.seed
+
         # Add tools if provided
         openai_tools = self._convert_tools(tools)
         if openai_tools:
@@ -663,6 +666,7 @@ class OpenAiLlmProvider(LlmProvider):
                 error_code="openai_rate_limit",
                 provider=self.PROVIDER_NAME,
                 is_retryable=True,
+                details={"status_code": status_code},
             )
         elif status_code >= 500:
             return LlmProviderError(
@@ -670,6 +674,7 @@ class OpenAiLlmProvider(LlmProvider):
                 error_code="openai_server_error",
                 provider=self.PROVIDER_NAME,
                 is_retryable=True,
+                details={"status_code": status_code},
             )
         else:
             return LlmProviderError(
@@ -677,6 +682,7 @@ class OpenAiLlmProvider(LlmProvider):
                 error_code="openai_api_error",
                 provider=self.PROVIDER_NAME,
                 is_retryable=status_code >= 500,
+                details={"status_code": status_code},
             )
 
     async def health_check(self) -> bool:
@@ -815,6 +821,7 @@ class OpenAiLlmProvider(LlmProvider):
             temperature=settings.openai_temperature,
             top_p=settings.openai_top_p,
             max_tokens=settings.openai_max_tokens,
+            seed=settings.openai_seed,
             timeout=settings.openai_timeout,
             base_url=settings.openai_api_endpoint,
             api_key=settings.openai_api_key,
@@ -0,0 +1,213 @@
+"""Scripted LLM Provider implementation.
+
+This module provides a deterministic implementation of the LlmProvider
+interface that plays back synthetic responses with configurable timing,
+instead of calling a model. It lets agent-host be load-tested (WebSocket
+fan-out, orchestration, persistence) without GPUs or API quotas.
+
+Never enable it in production: every response is synthetic.
+
+Script:
+- Each response streams a fixed number of tokens: the first one after a
+  first-token delay, the others one per token interval
+- Every Nth user turn, the first response requests a tool call instead,
+  and the response to the tool result is text
+- The tokens depend only on the user message, so runs are reproducible
+"""
+
+import asyncio
+import logging
+import zlib
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
+
+from application.agents.llm_provider import LlmConfig, LlmMessage, LlmMessageRole, LlmProvider, LlmProviderType, LlmResponse, LlmStreamChunk, LlmToolCall, LlmToolDefinition
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.abstractions import ApplicationBuilderBase
+
+logger = logging.getLogger(__name__)
+
+VOCABULARY = "the agent reviewed your request and found a few relevant details about this topic which should help you decide on next steps".split()
+
+
+class ScriptedLlmProvider(LlmProvider):
+    """Scripted implementation of the LLM provider interface.
+
+    Configuration:
+        - model: Model name reported by the provider (any name is accepted at call time)
+        - response_tokens: Tokens per text response
+        - first_token_ms / token_interval_ms: Streaming timing
+        - tool_call_every: Call a tool on every Nth user turn (0 = never)
+        - tool_name: Tool to call (default: the first tool offered)
+
+    Usage:
+        provider = ScriptedLlmProvider(LlmConfig(model="scripted"), response_tokens=20, first_token_ms=200)
+        async for chunk in provider.chat_stream([LlmMessage.user("Hello!")]):
+            print(chunk.content, end="")
+    """
+
+    def __init__(
+        self,
+        config: LlmConfig,
+        response_tokens: int = 50,
+        first_token_ms: float = 300.0,
+        token_interval_ms: float = 20.0,
+        tool_call_every: int = 0,
+        tool_name: str = "",
+    ) -> None:
+        """Initialize the scripted provider.
+
+        Args:
+            config: LLM configuration (only the model is used)
+            response_tokens: Tokens per text response (at least 1)
+            first_token_ms: Delay before the first token of a response
+            token_interval_ms: Delay between tokens
+            tool_call_every: Call a tool on every Nth user turn (0 = never)
+            tool_name: Tool to call, or empty for the first tool offered
+        """
+        super().__init__(config)
+        self._response_tokens = max(1, response_tokens)
+        self._first_token_seconds = first_token_ms / 1000
+        self._token_interval_seconds = token_interval_ms / 1000
+        self._tool_call_every = tool_call_every
+        self._tool_name = tool_name
+
+    @property
+    def provider_type(self) -> LlmProviderType:
+        """Get the provider type identifier."""
+        return LlmProviderType.SCRIPTED
+
+    # =========================================================================
+    # Script
+    # =========================================================================
+
+    def _tokens(self, messages: list[LlmMessage]) -> list[str]:
+        """Get the tokens of a text response (seeded by the last user message)."""
+        last_user = next((m.content for m in reversed(messages) if m.role == LlmMessageRole.USER), "")
+        offset = zlib.crc32(last_user.encode())
+        return [f"{VOCABULARY[(offset + i) % len(VOCABULARY)]} " for i in range(self._response_tokens)]
+
+    def _tool_call(self, messages: list[LlmMessage], tools: list[LlmToolDefinition] | None) -> LlmToolCall | None:
+        """Get the tool call of this response, if the script calls one.
+
+        Only the first response of a turn calls a tool: once the last message
+        is a tool result (or anything but a user message), the response is text.
+        """
+        if not tools or self._tool_call_every <= 0 or not messages or messages[-1].role != LlmMessageRole.USER:
+            return None
+        turn = sum(1 for m in messages if m.role == LlmMessageRole.USER)
+        if turn % self._tool_call_every:
+            return None
+        tool = next((t for t in tools if t.name == self._tool_name), tools[0])
+        return LlmToolCall(id=f"call_{turn}_{zlib.crc32(tool.name.encode()):08x}", name=tool.name, arguments=_sample_arguments(tool.parameters))
+
+    # =========================================================================
+    # LlmProvider
+    # =========================================================================
+
+    async def chat(
+        self,
+        messages: list[LlmMessage],
+        tools: list[LlmToolDefinition] | None = None,
+    ) -> LlmResponse:
+        """Return the scripted response after its full streaming time.
+
+        Args:
+            messages: Conversation messages
+            tools: Optional list of available tools
+
+        Returns:
+            The scripted response
+        """
+        tool_call = self._tool_call(messages, tools)
+        if tool_call is not None:
+            await asyncio.sleep(self._first_token_seconds)
+            return LlmResponse(content="", tool_calls=[tool_call], finish_reason="tool_calls", usage=self._usage(messages, 1))
+
+        tokens = self._tokens(messages)
+        await asyncio.sleep(self._first_token_seconds + self._token_interval_seconds * (len(tokens) - 1))
+        return LlmResponse(content="".join(tokens), finish_reason="stop", usage=self._usage(messages, len(tokens)))
+
+    async def chat_stream(
+        self,
+        messages: list[LlmMessage],
+        tools: list[LlmToolDefinition] | None = None,
+    ) -> AsyncIterator[LlmStreamChunk]:
+        """Stream the scripted response with its configured timing.
+
+        Args:
+            messages: Conversation messages
+            tools: Optional list of available tools
+
+        Yields:
+            One chunk per token, then a final chunk (carrying the tool call, if any)
+        """
+        await asyncio.sleep(self._first_token_seconds)
+
+        tool_call = self._tool_call(messages, tools)
+        if tool_call is not None:
+            yield LlmStreamChunk(tool_calls=[tool_call], done=True, finish_reason="tool_calls")
+            return
+
+        for index, token in enumerate(self._tokens(messages)):
+            if index:
+                await asyncio.sleep(self._token_interval_seconds)
+            yield LlmStreamChunk(content=token)
+        yield LlmStreamChunk(done=True, finish_reason="stop")
+
+    def _usage(self, messages: list[LlmMessage], completion_tokens: int) -> dict[str, int]:
+        """Approximate token usage (prompt tokens counted as words)."""
+        prompt_tokens = sum(len(m.content.split()) for m in messages)
+        return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens}
+
+    async def health_check(self) -> bool:
+        """The scripted provider is always available."""
+        return True
+
+    async def close(self) -> None:
+        """Nothing to close."""
+
+    @staticmethod
+    def configure(builder: "ApplicationBuilderBase") -> None:
+        """Configure ScriptedLlmProvider in the service collection.
+
+        Args:
+            builder: The application builder
+        """
+        from application.settings import Settings, app_settings
+
+        settings: Settings | None = None
+        for desc in builder.services:
+            if desc.service_type is Settings and desc.singleton:
+                settings = desc.singleton
+                break
+
+        if settings is None:
+            settings = app_settings
+
+        provider = ScriptedLlmProvider(
+            LlmConfig(model=settings.scripted_llm_model, temperature=0.0),
+            response_tokens=settings.scripted_llm_response_tokens,
+            first_token_ms=settings.scripted_llm_first_token_ms,
+            token_interval_ms=settings.scripted_llm_token_interval_ms,
+            tool_call_every=settings.scripted_llm_tool_call_every,
+            tool_name=settings.scripted_llm_tool_name,
+        )
+
+        # Register as both concrete type and abstract interface
+        builder.services.add_singleton(ScriptedLlmProvider, singleton=provider)
+        builder.services.add_singleton(LlmProvider, singleton=provider)
+
+        logger.warning(
+            f"⚠️ Configured ScriptedLlmProvider (synthetic responses, for load tests only): "
+            f"tokens={settings.scripted_llm_response_tokens}, first_token={settings.scripted_llm_first_token_ms}ms, "
+            f"interval={settings.scripted_llm_token_interval_ms}ms, tool_call_every={settings.scripted_llm_tool_call_every}"
+        )
+
+
+def _sample_arguments(parameters: dict[str, Any]) -> dict[str, Any]:
+    """Build placeholder values for the required parameters of a tool schema."""
+    samples: dict[str, Any] = {"string": "sample", "integer": 1, "number": 1, "boolean": True, "array": [], "object": {}}
+    properties = parameters.get("properties", {})
+    return {name: samples.get(properties.get(name, {}).get("type", "string"), "sample") for name in parameters.get("required", [])}
@@ -134,6 +134,13 @@ class DatabaseResetter:
             cleared_write_model = True  # Both are in MongoDB now
             messages.append("MongoDB collections cleared")
             logger.info("✅ MongoDB cleared")
+
+            # Drop cached definitions and templates of the cleared aggregates
+            from application.services.definition_cache import DefinitionCache
+
+            definition_cache = self._service_provider.get_service(DefinitionCache)
+            if definition_cache is not None:
+                definition_cache.clear()
         except Exception as e:
             logger.error(f"❌ Failed to clear MongoDB: {e}")
             messages.append(f"MongoDB clear failed: {str(e)}")
@@ -0,0 +1,341 @@
+"""LLM Gateway: admission control in front of the LLM providers.
+
+Agent turns, template content generation, scoring and item generation all
+reach the providers through a GatewayLlmProvider handed out by
+LlmProviderFactory. The gateway decides when a request may use its provider:
+
+- Per-model concurrency limits (llm_max_concurrency, llm_model_concurrency)
+- Fair queueing: FIFO within a priority class; while both classes wait,
+  INTERACTIVE requests get `interactive_weight` slots per BACKGROUND slot,
+  so background work is slowed down but never starved
+- Retry with full-jitter exponential backoff on 429 and 503 responses
+  (a stream is only retried before its first chunk was yielded)
+- Queue wait and time-to-first-token histograms
+
+The providers keep their persistent httpx client (and its connection pool);
+the gateway only governs admission to it.
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from application.agents.llm_provider import (
+    LlmConfig,
+    LlmMessage,
+    LlmPriority,
+    LlmProvider,
+    LlmProviderError,
+    LlmProviderType,
+    LlmResponse,
+    LlmStreamChunk,
+    LlmToolDefinition,
+)
+from observability import llm_queue_wait_time, llm_retries, llm_time_to_first_token
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.abstractions import ApplicationBuilderBase
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = frozenset({429, 503})
+
+
+class _ModelLane:
+    """Concurrency slots and wait queues of one model."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+        self.waiters: dict[LlmPriority, deque[asyncio.Future[None]]] = {priority: deque() for priority in LlmPriority}
+        self.interactive_streak = 0
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(queue) for queue in self.waiters.values())
+
+
+class LlmGateway:
+    """Per-model admission control, fair queueing and retries for LLM calls."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        model_concurrency: dict[str, int] | None = None,
+        interactive_weight: int = 4,
+        queue_timeout_seconds: float = 60.0,
+        max_retries: int = 3,
+        retry_base_delay_seconds: float = 0.5,
+        retry_max_delay_seconds: float = 8.0,
+    ) -> None:
+        """Initialize the gateway.
+
+        Args:
+            max_concurrency: Concurrent requests per model
+            model_concurrency: Per-model overrides keyed by qualified model ID ("ollama:qwen2.5:7b")
+            interactive_weight: Interactive admissions per background admission while both wait
+            queue_timeout_seconds: Max wait for a slot (0 = wait indefinitely)
+            max_retries: Retries on 429/503 responses
+            retry_base_delay_seconds: Backoff ceiling of the first retry
+            retry_max_delay_seconds: Upper bound of the backoff ceiling
+        """
+        self._max_concurrency = max(1, max_concurrency)
+        self._model_concurrency = model_concurrency or {}
+        self._interactive_weight = max(1, interactive_weight)
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._max_retries = max_retries
+        self._retry_base_delay_seconds = retry_base_delay_seconds
+        self._retry_max_delay_seconds = retry_max_delay_seconds
+        self._lanes: dict[str, _ModelLane] = {}
+
+    def bind(self, provider: LlmProvider, model: str | None = None, priority: LlmPriority = LlmPriority.INTERACTIVE) -> "GatewayLlmProvider":
+        """Get a governed view of a provider for one model and priority.
+
+        Args:
+            provider: The underlying (shared) provider
+            model: Model to use, or None for the provider's configured model
+            priority: Admission priority of requests made through the view
+
+        Returns:
+            A GatewayLlmProvider
+        """
+        return GatewayLlmProvider(self, provider, model, priority)
+
+    # =========================================================================
+    # Admission
+    # =========================================================================
+
+    @contextlib.asynccontextmanager
+    async def admit(self, model_key: str, priority: LlmPriority) -> AsyncIterator[None]:
+        """Hold a concurrency slot of a model for the duration of the block.
+
+        Args:
+            model_key: Qualified model ID
+            priority: Admission priority
+
+        Raises:
+            LlmProviderError: If no slot became available within the queue timeout
+        """
+        lane = self._lane(model_key)
+        started = time.perf_counter()
+        if lane.active < lane.limit and lane.waiting == 0:
+            lane.active += 1
+        else:
+            await self._wait_for_slot(lane, model_key, priority)
+        llm_queue_wait_time.record((time.perf_counter() - started) * 1000, {"model": model_key, "priority": priority.value})
+        try:
+            yield
+        finally:
+            self._release(lane)
+
+    async def _wait_for_slot(self, lane: _ModelLane, model_key: str, priority: LlmPriority) -> None:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue = lane.waiters[priority]
+        queue.append(future)
+        try:
+            if self._queue_timeout_seconds > 0:
+                await asyncio.wait_for(future, self._queue_timeout_seconds)
+            else:
+                await future
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as we gave up: pass it on
+                self._release(lane)
+            with contextlib.suppress(ValueError):
+                queue.remove(future)
+            if isinstance(e, TimeoutError):
+                raise LlmProviderError(
+                    message="The AI model is busy. Please try again in a moment.",
+                    error_code="llm_queue_timeout",
+                    provider="gateway",
+                    is_retryable=True,
+                    details={"model": model_key, "priority": priority.value, "waiting": lane.waiting},
+                ) from None
+            raise
+
+    def _release(self, lane: _ModelLane) -> None:
+        """Hand the slot to the next waiter, or free it."""
+        while (future := self._next_waiter(lane)) is not None:
+            if not future.done():
+                future.set_result(None)
+                return
+        lane.active -= 1
+
+    def _next_waiter(self, lane: _ModelLane) -> asyncio.Future[None] | None:
+        interactive = lane.waiters[LlmPriority.INTERACTIVE]
+        background = lane.waiters[LlmPriority.BACKGROUND]
+        if interactive and (not background or lane.interactive_streak < self._interactive_weight):
+            lane.interactive_streak += 1
+            return interactive.popleft()
+        if background:
+            lane.interactive_streak = 0
+            return background.popleft()
+        return None
+
+    def _lane(self, model_key: str) -> _ModelLane:
+        lane = self._lanes.get(model_key)
+        if lane is None:
+            lane = self._lanes[model_key] = _ModelLane(self._model_concurrency.get(model_key, self._max_concurrency))
+        return lane
+
+    # =========================================================================
+    # Retries
+    # =========================================================================
+
+    def should_retry(self, error: LlmProviderError, attempt: int) -> bool:
+        """Whether a failed attempt is retried (429/503 within the retry budget)."""
+        return attempt < self._max_retries and error.details.get("status_code") in RETRY_STATUS_CODES
+
+    async def backoff(self, model_key: str, error: LlmProviderError, attempt: int) -> None:
+        """Sleep before retry `attempt` (1-based), using full-jitter exponential backoff."""
+        ceiling = min(self._retry_max_delay_seconds, self._retry_base_delay_seconds * 2 ** (attempt - 1))
+        delay = random.uniform(0, ceiling)  # nosec B311 - jitter, not security
+        llm_retries.add(1, {"model": model_key, "status_code": str(error.details.get("status_code"))})
+        logger.warning(f"⏳ {model_key} returned {error.details.get('status_code')}, retry {attempt}/{self._max_retries} in {delay:.2f}s")
+        await asyncio.sleep(delay)
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """Get active and waiting requests per model."""
+        return {key: {"limit": lane.limit, "active": lane.active, "waiting": lane.waiting} for key, lane in self._lanes.items()}
+
+    # =========================================================================
+    # Configuration
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "ApplicationBuilderBase") -> "LlmGateway | None":
+        """Configure the LlmGateway singleton.
+
+        Must be called before LlmProviderFactory.configure(), which binds the
+        providers it hands out to the gateway.
+
+        Args:
+            builder: The application builder
+
+        Returns:
+            The gateway, or None if disabled
+        """
+        from application.settings import app_settings
+
+        if not app_settings.llm_gateway_enabled:
+            logger.info("⏭️ LlmGateway disabled")
+            return None
+
+        gateway = LlmGateway(
+            max_concurrency=app_settings.llm_max_concurrency,
+            model_concurrency=app_settings.llm_model_concurrency,
+            interactive_weight=app_settings.llm_interactive_weight,
+            queue_timeout_seconds=app_settings.llm_queue_timeout_seconds,
+            max_retries=app_settings.llm_max_retries,
+            retry_base_delay_seconds=app_settings.llm_retry_base_delay_seconds,
+            retry_max_delay_seconds=app_settings.llm_retry_max_delay_seconds,
+        )
+        builder.services.add_singleton(LlmGateway, singleton=gateway)
+        logger.info(f"✅ Configured LlmGateway: max_concurrency={app_settings.llm_max_concurrency}, overrides={app_settings.llm_model_concurrency}")
+        return gateway
+
+
+class GatewayLlmProvider(LlmProvider):
+    """LlmProvider view that routes one model's requests through the LlmGateway.
+
+    Views are cheap and per caller: the model and priority live on the view,
+    the underlying provider (and its HTTP connection pool) is shared.
+    """
+
+    def __init__(self, gateway: LlmGateway, provider: LlmProvider, model: str | None, priority: LlmPriority) -> None:
+        super().__init__(provider.config)
+        self._gateway = gateway
+        self._provider = provider
+        self._model_override = model
+        self._priority = priority
+
+    @property
+    def provider_type(self) -> LlmProviderType:
+        """Get the underlying provider type."""
+        return self._provider.provider_type
+
+    @property
+    def config(self) -> LlmConfig:
+        """Get the underlying provider's (current) configuration."""
+        return self._provider.config
+
+    @property
+    def model(self) -> str:
+        """Get the underlying provider's configured model."""
+        return self._provider.config.model
+
+    @property
+    def current_model(self) -> str:
+        """Get the model this view uses."""
+        return self._model_override or self._provider.config.model
+
+    @property
+    def priority(self) -> LlmPriority:
+        """Get the admission priority of this view."""
+        return self._priority
+
+    @property
+    def model_key(self) -> str:
+        """Get the qualified model ID the concurrency limit applies to."""
+        return f"{self.provider_type.value}:{self.current_model}"
+
+    async def chat(
+        self,
+        messages: list[LlmMessage],
+        tools: list[LlmToolDefinition] | None = None,
+    ) -> LlmResponse:
+        """Send a chat completion request once admitted, retrying on 429/503."""
+        model_key = self.model_key
+        async with self._gateway.admit(model_key, self._priority):
+            started = time.perf_counter()
+            attempt = 0
+            while True:
+                self._provider.set_model_override(self._model_override)
+                try:
+                    response = await self._provider.chat(messages, tools)
+                except LlmProviderError as e:
+                    if not self._gateway.should_retry(e, attempt):
+                        raise
+                    attempt += 1
+                    await self._gateway.backoff(model_key, e, attempt)
+                    continue
+                llm_time_to_first_token.record((time.perf_counter() - started) * 1000, {"model": model_key, "priority": self._priority.value, "stream": "false"})
+                return response
+
+    async def chat_stream(
+        self,
+        messages: list[LlmMessage],
+        tools: list[LlmToolDefinition] | None = None,
+    ) -> AsyncIterator[LlmStreamChunk]:
+        """Stream a chat completion once admitted, retrying on 429/503 before the first chunk."""
+        model_key = self.model_key
+        async with self._gateway.admit(model_key, self._priority):
+            started = time.perf_counter()
+            attempt = 0
+            while True:
+                self._provider.set_model_override(self._model_override)
+                streamed = False
+                try:
+                    async for chunk in self._provider.chat_stream(messages, tools):
+                        if not streamed:
+                            streamed = True
+                            llm_time_to_first_token.record((time.perf_counter() - started) * 1000, {"model": model_key, "priority": self._priority.value, "stream": "true"})
+                        yield chunk
+                    return
+                except LlmProviderError as e:
+                    if streamed or not self._gateway.should_retry(e, attempt):
+                        raise
+                    attempt += 1
+                    await self._gateway.backoff(model_key, e, attempt)
+
+    async def health_check(self) -> bool:
+        """Check the underlying provider (not subject to admission control)."""
+        return await self._provider.health_check()
+
+    async def close(self) -> None:
+        """No-op: the underlying provider is shared and closed by its owner."""
@@ -3,11 +3,14 @@
 This module provides a factory pattern for selecting the appropriate LLM provider
 at runtime based on model specification. It supports multiple providers (Ollama, OpenAI)
 and handles model routing via qualified model IDs (e.g., "openai:gpt-4o", "ollama:llama3.2:3b").
+A scripted provider ("scripted:<name>") can be registered for load tests.
 
 Design Pattern:
 - Factory Pattern: Creates appropriate provider based on model prefix
 - Strategy Pattern: Each provider implements the same interface
 - Singleton Registry: Providers are registered once and reused
+- Gateway: With an LlmGateway, providers are handed out as governed per-call
+  views (per-model concurrency limits, priority queueing, 429/503 retries)
 
 Usage:
     factory = LlmProviderFactory(settings)
@@ -17,6 +20,9 @@ Usage:
     # Get provider for a specific model
     provider = factory.get_provider_for_model("openai:gpt-4o")
 
+    # Background work yields to interactive chat when the model is saturated
+    provider = factory.get_provider_for_model("openai:gpt-4o", priority=LlmPriority.BACKGROUND)
+
     # Or use the default provider
     provider = factory.get_default_provider()
 """
@@ -25,11 +31,13 @@ import json
 import logging
 from typing import TYPE_CHECKING
 
-from application.agents.llm_provider import LlmProvider, LlmProviderError, LlmProviderType, ModelDefinition
+from application.agents.llm_provider import LlmPriority, LlmProvider, LlmProviderError, LlmProviderType, ModelDefinition
 
 if TYPE_CHECKING:
     from neuroglia.hosting.abstractions import ApplicationBuilderBase
 
+    from infrastructure.llm_gateway import LlmGateway
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,14 +67,16 @@ class LlmProviderFactory:
         response = await provider.chat(messages)
     """
 
-    def __init__(self, default_provider: LlmProviderType = LlmProviderType.OLLAMA) -> None:
+    def __init__(self, default_provider: LlmProviderType = LlmProviderType.OLLAMA, gateway: "LlmGateway | None" = None) -> None:
         """Initialize the factory.
 
         Args:
             default_provider: Default provider type when model doesn't specify
+            gateway: Optional gateway that governs the providers handed out by get_provider_for_model
         """
         self._providers: dict[LlmProviderType, LlmProvider] = {}
         self._default_provider_type = default_provider
+        self._gateway = gateway
         self._available_models: list[ModelDefinition] = []
 
     @property
@@ -146,7 +156,7 @@ class LlmProviderFactory:
             is_retryable=False,
         )
 
-    def get_provider_for_model(self, model_id: str) -> LlmProvider:
+    def get_provider_for_model(self, model_id: str, priority: LlmPriority = LlmPriority.INTERACTIVE) -> LlmProvider:
         """Get the appropriate provider for a model ID.
 
         The model ID can be:
@@ -155,9 +165,10 @@ class LlmProviderFactory:
 
         Args:
             model_id: The model identifier (qualified or unqualified)
+            priority: Admission priority when the model is saturated (gateway only)
 
         Returns:
-            Appropriate provider for the model
+            Appropriate provider for the model (a gateway view if a gateway is configured)
 
         Raises:
             LlmProviderError: If provider not available
@@ -189,6 +200,9 @@ class LlmProviderFactory:
                 details={"requested_provider": provider_type.value, "available": [p.value for p in self._providers.keys()]},
             )
 
+        if self._gateway is not None:
+            return self._gateway.bind(provider, actual_model_id, priority)
+
         # Set model override on the provider
         provider.set_model_override(actual_model_id)
 
@@ -332,7 +346,15 @@ class LlmProviderFactory:
             logger.warning(f"Unknown default_llm_provider '{settings.default_llm_provider}', using ollama")
             default_provider = LlmProviderType.OLLAMA
 
-        factory = LlmProviderFactory(default_provider=default_provider)
+        from infrastructure.llm_gateway import LlmGateway
+
+        gateway: LlmGateway | None = None
+        for desc in builder.services:
+            if desc.service_type is LlmGateway and desc.singleton:
+                gateway = desc.singleton
+                break
+
+        factory = LlmProviderFactory(default_provider=default_provider, gateway=gateway)
 
         # Load model definitions
         factory.load_models_from_settings(settings.available_models)
@@ -340,6 +362,7 @@ class LlmProviderFactory:
         # Register available providers
         from infrastructure.adapters.ollama_llm_provider import OllamaLlmProvider
         from infrastructure.adapters.openai_llm_provider import OpenAiLlmProvider
+        from infrastructure.adapters.scripted_llm_provider import ScriptedLlmProvider
 
         # Check for Ollama provider
         ollama_provider: OllamaLlmProvider | None = None
@@ -361,6 +384,16 @@ class LlmProviderFactory:
         if openai_provider:
             factory.register_provider(LlmProviderType.OPENAI, openai_provider)
 
+        # Check for the scripted provider (load tests)
+        scripted_provider: ScriptedLlmProvider | None = None
+        for desc in builder.services:
+            if desc.service_type is ScriptedLlmProvider and desc.singleton:
+                scripted_provider = desc.singleton
+                break
+
+        if scripted_provider:
+            factory.register_provider(LlmProviderType.SCRIPTED, scripted_provider)
+
         # Register factory
         builder.services.add_singleton(LlmProviderFactory, singleton=factory)
 
@@ -368,6 +401,8 @@ class LlmProviderFactory:
         # This maintains backward compatibility with code expecting a single provider
         try:
             default = factory.get_default_provider()
+            if gateway is not None:
+                default = gateway.bind(default)
             builder.services.add_singleton(LlmProvider, singleton=default)
             logger.info(f"Registered default LlmProvider: {default.provider_type.value}")
         except LlmProviderError:
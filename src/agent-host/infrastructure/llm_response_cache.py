@@ -0,0 +1,228 @@
+"""Prompt-hash response cache for deterministic LLM generation paths.
+
+Templated item content, final score reports and blueprint item generation
+send one-shot prompts that are often byte-identical across users and
+reconnects. LlmResponseCache serves repeated prompts from a cache instead
+of paying for another completion.
+
+Key Features:
+- Opt-in (llm_response_cache_enabled) and, for template content and score
+  reports, per template (llm_response_cache_template_ids)
+- Only used when the provider is deterministic: temperature 0 or a fixed seed
+- Keyed by sha256 of (model, temperature, seed, normalized messages, tools)
+- Two tiers: a local LRU in front of a shared Redis tier, both with TTLs
+- Responses with tool calls or a non-"stop" finish reason are never cached
+- Cache failures fall back to calling the provider
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from application.agents.llm_provider import (
+    LlmMessage,
+    LlmProvider,
+    LlmResponse,
+    LlmToolDefinition,
+)
+from observability import llm_response_cache_hits, llm_response_cache_misses
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.abstractions import ApplicationBuilderBase
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None  # type: ignore[assignment]
+    REDIS_AVAILABLE = False
+
+ALL_TEMPLATES = "*"
+
+
+class LlmResponseCache:
+    """Two-tier (local LRU + Redis) cache of one-shot LLM responses."""
+
+    KEY_PREFIX = "agent-host:llm-response:"
+
+    def __init__(
+        self,
+        redis_client: Any | None = None,
+        ttl_seconds: int = 3600,
+        max_entries: int = 500,
+        template_ids: list[str] | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            redis_client: Async Redis client for the shared tier (None = local tier only)
+            ttl_seconds: Time to live of cached responses in both tiers
+            max_entries: Maximum entries of the local tier (least recently used are evicted)
+            template_ids: Templates whose content and score reports may be cached ("*" = all)
+        """
+        self._redis = redis_client
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._template_ids = set(template_ids or [])
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def is_enabled_for_template(self, template_id: str | None) -> bool:
+        """Check whether responses generated for a template may be cached."""
+        return ALL_TEMPLATES in self._template_ids or (template_id is not None and template_id in self._template_ids)
+
+    @staticmethod
+    def is_deterministic(provider: LlmProvider) -> bool:
+        """Check whether a provider generates reproducible output (temperature 0 or a fixed seed)."""
+        config = provider.config
+        return config.temperature == 0 or config.seed is not None
+
+    @staticmethod
+    def make_key(provider: LlmProvider, messages: list[LlmMessage], tools: list[LlmToolDefinition] | None = None) -> str:
+        """Build the cache key of a request.
+
+        Messages are normalized (surrounding whitespace stripped) so that
+        formatting-only differences of rendered prompts share an entry.
+        """
+        config = provider.config
+        payload = {
+            "model": f"{provider.provider_type.value}:{provider.current_model}",
+            "temperature": config.temperature,
+            "top_p": config.top_p,
+            "seed": config.seed,
+            "messages": [{**message.to_dict(), "content": message.content.strip()} for message in messages],
+            "tools": hashlib.sha256(json.dumps([tool.to_openai_format() for tool in tools or []], sort_keys=True).encode()).hexdigest(),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    async def chat(
+        self,
+        provider: LlmProvider,
+        messages: list[LlmMessage],
+        tools: list[LlmToolDefinition] | None = None,
+        scope: str = "default",
+    ) -> LlmResponse:
+        """Get a chat completion, served from the cache when possible.
+
+        Non-deterministic providers are always called directly.
+
+        Args:
+            provider: The provider to call on a miss
+            messages: Conversation messages
+            tools: Optional tool definitions
+            scope: Generation path, used as metric attribute ("template_content", "score_report", ...)
+
+        Returns:
+            The (possibly cached) LlmResponse
+        """
+        if not self.is_deterministic(provider):
+            return await provider.chat(messages, tools)
+
+        key = self.make_key(provider, messages, tools)
+        cached = await self._get(key, scope)
+        if cached is not None:
+            return LlmResponse(content=cached["content"], finish_reason=cached["finish_reason"])
+
+        self._misses += 1
+        llm_response_cache_misses.add(1, {"scope": scope})
+        response = await provider.chat(messages, tools)
+        if response.content and not response.has_tool_calls and response.finish_reason == "stop":
+            await self._set(key, {"content": response.content, "finish_reason": response.finish_reason})
+        return response
+
+    async def _get(self, key: str, scope: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._record_hit(scope, "local")
+                return entry[1]
+            del self._entries[key]
+
+        if self._redis is None:
+            return None
+        try:
+            data = await self._redis.get(f"{self.KEY_PREFIX}{key}")
+        except Exception as e:
+            logger.warning(f"LLM response cache lookup failed: {e}")
+            return None
+        if not data:
+            return None
+        value = json.loads(data)
+        self._put_local(key, value)
+        self._record_hit(scope, "redis")
+        return value
+
+    async def _set(self, key: str, value: dict[str, Any]) -> None:
+        self._put_local(key, value)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(f"{self.KEY_PREFIX}{key}", json.dumps(value), ex=self._ttl_seconds)
+        except Exception as e:
+            logger.warning(f"LLM response cache write failed: {e}")
+
+    def _put_local(self, key: str, value: dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _record_hit(self, scope: str, tier: str) -> None:
+        self._hits += 1
+        llm_response_cache_hits.add(1, {"scope": scope, "tier": tier})
+
+    def clear(self) -> None:
+        """Drop all entries of the local tier (Redis entries expire by TTL)."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics for health checks."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "redis": self._redis is not None,
+        }
+
+    @staticmethod
+    def configure(builder: "ApplicationBuilderBase") -> "LlmResponseCache | None":
+        """Configure the LlmResponseCache singleton.
+
+        Args:
+            builder: The application builder
+
+        Returns:
+            The cache, or None if disabled
+        """
+        from application.settings import app_settings
+
+        if not app_settings.llm_response_cache_enabled:
+            logger.info("⏭️ LlmResponseCache disabled")
+            return None
+
+        redis_client = None
+        if app_settings.redis_enabled and app_settings.llm_response_cache_redis_enabled:
+            if REDIS_AVAILABLE:
+                redis_client = redis.from_url(app_settings.redis_url, decode_responses=True)
+            else:
+                logger.warning("redis package not installed, LlmResponseCache uses the local tier only")
+
+        cache = LlmResponseCache(
+            redis_client=redis_client,
+            ttl_seconds=app_settings.llm_response_cache_ttl_seconds,
+            max_entries=app_settings.llm_response_cache_max_entries,
+            template_ids=app_settings.llm_response_cache_template_ids,
+        )
+        builder.services.add_singleton(LlmResponseCache, singleton=cache)
+        logger.info(f"✅ Configured LlmResponseCache: ttl={app_settings.llm_response_cache_ttl_seconds}s, redis={redis_client is not None}, templates={app_settings.llm_response_cache_template_ids}")
+        return cache
@@ -0,0 +1,124 @@
+"""MongoDB Index Bootstrapper.
+
+This module provides a hosted service that creates the indexes declared by
+the Motor aggregate repositories (``INDEXES`` class attribute) on startup.
+
+Implements HostedService for proper lifecycle management:
+- start_async(): Creates missing indexes in the background
+- stop_async(): Cancels index creation if still running
+
+Indexes are created one at a time: an index that conflicts with an existing
+one (same name or keys, other options) is logged and skipped, and never
+prevents the application from starting.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from neuroglia.hosting.abstractions import HostedService
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+logger = logging.getLogger(__name__)
+
+
+class MongoIndexBootstrapper(HostedService):
+    """Hosted service that ensures repository indexes exist on startup."""
+
+    def __init__(self, client: "AsyncIOMotorClient", database_name: str, repositories: dict[str, type]) -> None:
+        """Initialize the index bootstrapper.
+
+        Args:
+            client: Shared Motor client
+            database_name: Database holding the collections
+            repositories: Repository types declaring INDEXES, keyed by collection name
+        """
+        self._client = client
+        self._database_name = database_name
+        self._repositories = repositories
+        self._task: asyncio.Task | None = None
+
+    # =========================================================================
+    # HostedService Lifecycle Methods
+    # =========================================================================
+
+    async def start_async(self) -> None:
+        """Start index creation without delaying application startup."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.ensure_indexes_async())
+
+    async def stop_async(self) -> None:
+        """Cancel index creation if it is still running."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    # =========================================================================
+    # Index Creation
+    # =========================================================================
+
+    async def ensure_indexes_async(self) -> list[str]:
+        """Create every declared index that does not exist yet.
+
+        Returns:
+            Names of the indexes ensured, as "collection.index"
+        """
+        database = self._client[self._database_name]
+        ensured = []
+        for collection_name, repository_type in self._repositories.items():
+            for model in getattr(repository_type, "INDEXES", []):
+                name = f"{collection_name}.{model.document['name']}"
+                try:
+                    await database[collection_name].create_indexes([model])
+                    ensured.append(name)
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not create index {name}: {e}")
+
+        logger.info(f"✅ Ensured {len(ensured)} MongoDB indexes")
+        return ensured
+
+    # =========================================================================
+    # Configuration
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder", repositories: dict[str, type]) -> "WebApplicationBuilder":
+        """Configure and register the index bootstrapper service.
+
+        Must be called after MotorRepository.configure(), which registers the
+        shared AsyncIOMotorClient.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+            repositories: Repository types declaring INDEXES, keyed by collection name
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        from application.settings import app_settings
+
+        if not app_settings.mongo_ensure_indexes:
+            logger.info("⏭️ MongoIndexBootstrapper disabled")
+            return builder
+
+        client: AsyncIOMotorClient | None = None
+        for desc in builder.services:
+            if desc.service_type == AsyncIOMotorClient and desc.singleton is not None:
+                client = desc.singleton
+                break
+        if client is None:
+            logger.warning("⚠️ AsyncIOMotorClient not registered, MongoDB indexes will not be ensured")
+            return builder
+
+        bootstrapper = MongoIndexBootstrapper(client=client, database_name=app_settings.database_name, repositories=repositories)
+        builder.services.add_singleton(HostedService, singleton=bootstrapper)
+        builder.services.add_singleton(MongoIndexBootstrapper, singleton=bootstrapper)
+
+        logger.info("✅ MongoIndexBootstrapper configured")
+        return builder
@@ -26,3 +26,4 @@ class ConversationDto(Identifiable[str]):
     template_config: dict[str, Any] | None = None  # Template configuration (continue_after_completion, etc.)
     created_at: datetime.datetime | None = None
     updated_at: datetime.datetime | None = None
+    version: int = 0  # Aggregate state_version (incremented on every save)
@@ -1,6 +1,9 @@
 """MongoDB repository implementation for AgentDefinition aggregate."""
 
+from typing import ClassVar
+
 from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, IndexModel
 
 from domain.entities import AgentDefinition
 from domain.repositories.definition_repository import AgentDefinitionRepository
@@ -14,8 +17,18 @@ class MotorAgentDefinitionRepository(MotorRepository[AgentDefinition, str], Agen
 
     Configured via MotorRepository.configure() in main.py.
     AggregateState fields are stored at the document root level.
+
+    Indexes (created at startup by MongoIndexBootstrapper):
+    - id (unique)
+    - owner_user_id, is_public (definition listings)
     """
 
+    INDEXES: ClassVar[list[IndexModel]] = [
+        IndexModel([("id", ASCENDING)], name="id", unique=True),
+        IndexModel([("owner_user_id", ASCENDING)], name="owner"),
+        IndexModel([("is_public", ASCENDING)], name="public"),
+    ]
+
     async def get_all_async(self) -> list[AgentDefinition]:
         """Retrieve all definitions from MongoDB."""
         cursor = self.collection.find({})
@@ -1,6 +1,9 @@
 """MongoDB repository implementation for Conversation aggregate."""
 
+from typing import ClassVar
+
 from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from domain.entities.conversation import Conversation
 from domain.repositories.conversation_repository import ConversationRepository
@@ -15,8 +18,17 @@ class MotorConversationRepository(MotorRepository[Conversation, str], Conversati
 
     Configured via MotorRepository.configure() in main.py.
     AggregateState fields are stored at the document root level.
+
+    Indexes (created at startup by MongoIndexBootstrapper):
+    - id (unique)
+    - user_id + updated_at (a user's conversations, most recent first)
     """
 
+    INDEXES: ClassVar[list[IndexModel]] = [
+        IndexModel([("id", ASCENDING)], name="id", unique=True),
+        IndexModel([("user_id", ASCENDING), ("updated_at", DESCENDING)], name="user_updated"),
+    ]
+
     async def get_all_async(self) -> list[Conversation]:
         """Retrieve all conversations from MongoDB.
 
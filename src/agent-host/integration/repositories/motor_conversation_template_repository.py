@@ -1,6 +1,9 @@
 """MongoDB repository implementation for ConversationTemplate aggregate."""
 
+from typing import ClassVar
+
 from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, IndexModel
 
 from domain.entities import ConversationTemplate
 from domain.repositories.template_repository import ConversationTemplateRepository
@@ -14,8 +17,18 @@ class MotorConversationTemplateRepository(MotorRepository[ConversationTemplate,
 
     Configured via MotorRepository.configure() in main.py.
     AggregateState fields are stored at the document root level.
+
+    Indexes (created at startup by MongoIndexBootstrapper):
+    - id (unique)
+    - created_by, agent_starts_first (template listings)
     """
 
+    INDEXES: ClassVar[list[IndexModel]] = [
+        IndexModel([("id", ASCENDING)], name="id", unique=True),
+        IndexModel([("created_by", ASCENDING)], name="created_by"),
+        IndexModel([("agent_starts_first", ASCENDING)], name="agent_starts_first"),
+    ]
+
     async def get_all_async(self) -> list[ConversationTemplate]:
         """Retrieve all templates from MongoDB."""
         cursor = self.collection.find({})
@@ -18,6 +18,7 @@ from neuroglia.serialization.json import JsonSerializer
 from api.services.auth_service import AuthService
 from api.services.openapi_config import configure_api_openapi, configure_mounted_apps_openapi_prefix
 from application.services.chat_service import ChatService
+from application.services.definition_cache import DefinitionCache
 from application.services.tool_provider_client import ToolProviderClient
 from application.settings import app_settings, configure_logging
 from application.websocket.manager import ConnectionManager
@@ -104,6 +105,18 @@ def create_app() -> FastAPI:
         implementation_type=MotorConversationTemplateRepository,
     )
 
+    # Ensure the indexes declared by the repositories (HostedService, runs in the background)
+    from infrastructure.mongo_index_bootstrapper import MongoIndexBootstrapper
+
+    MongoIndexBootstrapper.configure(
+        builder,
+        {
+            "conversations": MotorConversationRepository,
+            "agent_definitions": MotorAgentDefinitionRepository,
+            "conversation_templates": MotorConversationTemplateRepository,
+        },
+    )
+
     # Configure infrastructure services
     _configure_infrastructure_services(builder)
 
@@ -202,9 +215,10 @@ def _wire_orchestrator(app: FastAPI) -> None:
     from neuroglia.mediation import Mediator
 
     from application.agents import Agent
-    from application.orchestrator import Orchestrator
+    from application.orchestrator import Orchestrator, ToolSelector
     from application.services.tool_provider_client import ToolProviderClient
     from infrastructure.llm_provider_factory import LlmProviderFactory
+    from infrastructure.llm_response_cache import LlmResponseCache
 
     services = app.state.services
     manager = services.get_required_service(ConnectionManager)
@@ -212,6 +226,8 @@ def _wire_orchestrator(app: FastAPI) -> None:
     agent = services.get_required_service(Agent)
     llm_provider_factory = services.get_required_service(LlmProviderFactory)
     tool_provider_client = services.get_required_service(ToolProviderClient)
+    llm_response_cache = services.get_service(LlmResponseCache)
+    tool_selector = services.get_service(ToolSelector)
 
     # Create and wire the new modular orchestrator
     orchestrator = Orchestrator(
@@ -220,6 +236,8 @@ def _wire_orchestrator(app: FastAPI) -> None:
         agent=agent,
         llm_provider_factory=llm_provider_factory,
         tool_provider_client=tool_provider_client,
+        llm_response_cache=llm_response_cache,
+        tool_selector=tool_selector,
     )
     manager.set_orchestrator(orchestrator)
 
@@ -264,9 +282,18 @@ def _configure_infrastructure_services(builder: WebApplicationBuilder) -> None:
     tool_provider_client = ToolProviderClient(
         base_url=app_settings.tools_provider_url,
         timeout=app_settings.tools_provider_timeout,
+        manifest_cache_ttl_seconds=app_settings.tool_manifest_cache_ttl_seconds,
     )
     builder.services.add_singleton(ToolProviderClient, singleton=tool_provider_client)
 
+    # Definition Cache (AgentDefinition / ConversationTemplate DTOs, invalidated by domain events)
+    DefinitionCache.configure(builder)
+
+    # Tool Selector (relevance-based pruning of the tools sent to the LLM)
+    from application.orchestrator.agent.tool_selector import ToolSelector
+
+    ToolSelector.configure(builder)
+
     # ==========================================================================
     # LLM Provider Configuration (multi-provider support)
     # ==========================================================================
@@ -294,12 +321,28 @@ def _configure_infrastructure_services(builder: WebApplicationBuilder) -> None:
 
         OpenAiLlmProvider.configure(builder, token_cache=token_cache)
 
-    # 3. Configure LLM Provider Factory (manages provider selection)
+    # 3. Configure the scripted provider (load tests only, never in production)
+    if app_settings.scripted_llm_enabled:
+        from infrastructure.adapters.scripted_llm_provider import ScriptedLlmProvider
+
+        ScriptedLlmProvider.configure(builder)
+
+    # 4. Configure LLM Gateway (per-model admission control, priority queueing, retries)
+    from infrastructure.llm_gateway import LlmGateway
+
+    LlmGateway.configure(builder)
+
+    # 5. Configure LLM Provider Factory (manages provider selection)
     from infrastructure.llm_provider_factory import LlmProviderFactory, set_provider_factory
 
     factory = LlmProviderFactory.configure(builder)
     set_provider_factory(factory)
 
+    # 6. Configure LLM Response Cache (opt-in, deterministic one-shot generation only)
+    from infrastructure.llm_response_cache import LlmResponseCache
+
+    LlmResponseCache.configure(builder)
+
     # ==========================================================================
     # App Settings Initializer (HostedService)
     # ==========================================================================
@@ -4,10 +4,16 @@ from .metrics import (
     chat_messages_received,
     chat_messages_sent,
     chat_session_duration,
+    conversation_bootstrap_time,
     conversations_created,
     conversations_deleted,
+    llm_queue_wait_time,
     llm_request_count,
     llm_request_time,
+    llm_response_cache_hits,
+    llm_response_cache_misses,
+    llm_retries,
+    llm_time_to_first_token,
     llm_token_count,
     llm_tool_calls,
     tool_cache_hits,
@@ -15,7 +21,9 @@ from .metrics import (
     tool_execution_count,
     tool_execution_errors,
     tool_execution_time,
+    tool_selection_time,
     tools_fetched,
+    tools_selected,
 )
 
 __all__ = [
@@ -26,11 +34,17 @@ __all__ = [
     # Conversation metrics
     "conversations_created",
     "conversations_deleted",
+    "conversation_bootstrap_time",
     # LLM metrics
     "llm_request_count",
     "llm_request_time",
     "llm_token_count",
     "llm_tool_calls",
+    "llm_queue_wait_time",
+    "llm_time_to_first_token",
+    "llm_retries",
+    "llm_response_cache_hits",
+    "llm_response_cache_misses",
     # Tool metrics
     "tools_fetched",
     "tool_cache_hits",
@@ -38,4 +52,6 @@ __all__ = [
     "tool_execution_count",
     "tool_execution_time",
     "tool_execution_errors",
+    "tool_selection_time",
+    "tools_selected",
 ]
@@ -49,6 +49,12 @@ conversations_deleted = meter.create_counter(
     unit="1",
 )
 
+conversation_bootstrap_time = meter.create_histogram(
+    name="agent_host.conversations.bootstrap_time",
+    description="Time to load conversation, definition, template and tools on WebSocket connect",
+    unit="ms",
+)
+
 # =============================================================================
 # LLM METRICS
 # =============================================================================
@@ -77,6 +83,36 @@ llm_tool_calls = meter.create_counter(
     unit="1",
 )
 
+llm_queue_wait_time = meter.create_histogram(
+    name="agent_host.llm.queue_wait_time",
+    description="Time LLM requests waited for a model concurrency slot",
+    unit="ms",
+)
+
+llm_time_to_first_token = meter.create_histogram(
+    name="agent_host.llm.time_to_first_token",
+    description="Time from admission to the first streamed chunk (or full response)",
+    unit="ms",
+)
+
+llm_retries = meter.create_counter(
+    name="agent_host.llm.retries",
+    description="LLM requests retried after a 429/503 response",
+    unit="1",
+)
+
+llm_response_cache_hits = meter.create_counter(
+    name="agent_host.llm.response_cache_hits",
+    description="LLM responses served from the response cache",
+    unit="1",
+)
+
+llm_response_cache_misses = meter.create_counter(
+    name="agent_host.llm.response_cache_misses",
+    description="Cacheable LLM requests that had to call the provider",
+    unit="1",
+)
+
 # =============================================================================
 # TOOL METRICS
 # =============================================================================
@@ -111,6 +147,18 @@ tool_execution_time = meter.create_histogram(
     unit="ms",
 )
 
+tool_selection_time = meter.create_histogram(
+    name="agent_host.tools.selection_time",
+    description="Time to rank and select the tools sent to the LLM for a turn",
+    unit="ms",
+)
+
+tools_selected = meter.create_histogram(
+    name="agent_host.tools.selected",
+    description="Number of tools sent to the LLM after relevance-based selection",
+    unit="1",
+)
+
 tool_execution_errors = meter.create_counter(
     name="agent_host.tools.execution_errors",
     description="Total tool execution errors",
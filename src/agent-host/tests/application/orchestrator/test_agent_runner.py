@@ -13,7 +13,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from application.orchestrator.agent.agent_runner import AgentRunner
-from application.orchestrator.context import ConversationContext
+from application.orchestrator.context import ConversationContext, ConversationHistory
 
 
 @pytest.fixture
@@ -128,6 +128,46 @@ class TestAgentRunnerBuildContext:
         # Should execute query to get conversation history
         mock_mediator.execute_async.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_build_context_reuses_loaded_history(self, agent_runner, sample_context, mock_mediator):
+        """Test that a current in-memory history is used without a query."""
+        sample_context.history = ConversationHistory.from_messages([{"id": "m1", "role": "user", "content": "Earlier"}], version=2)
+
+        context = await agent_runner._build_agent_context(sample_context, "Hi")
+
+        mock_mediator.execute_async.assert_not_called()
+        assert [m.content for m in context.conversation_history] == ["Earlier"]
+
+    @pytest.mark.asyncio
+    async def test_build_context_reloads_stale_history(self, agent_runner, sample_context, mock_mediator):
+        """Test that a stale history is replaced by the persisted conversation."""
+        sample_context.history = ConversationHistory(version=2, stale=True)
+        conversation = MagicMock(messages=[{"id": "m1", "role": "user", "content": "From another node"}], version=7)
+        mock_mediator.execute_async.return_value = MagicMock(is_success=True, data=conversation)
+
+        context = await agent_runner._build_agent_context(sample_context, "Hi")
+
+        assert [m.content for m in context.conversation_history] == ["From another node"]
+        assert sample_context.history.version == 7
+        assert sample_context.history.stale is False
+
+    @pytest.mark.asyncio
+    async def test_build_context_sends_selected_tools(self, agent_runner, sample_context):
+        """Test that only the tools chosen by the ToolSelector are sent."""
+        from application.agents import LlmToolDefinition
+
+        sample_context.tools = [LlmToolDefinition(name=f"tool_{i}", description="") for i in range(3)]
+        sample_context.selected_tool_names = ["tool_0"]
+        selector = MagicMock()
+        selector.select = AsyncMock(return_value=sample_context.tools[1:2])
+        agent_runner._tool_selector = selector
+
+        context = await agent_runner._build_agent_context(sample_context, "Hi")
+
+        assert [t.name for t in context.tools] == ["tool_1"]
+        assert selector.select.await_args.kwargs["previous"] == ["tool_0"]
+        assert sample_context.selected_tool_names == ["tool_1"]
+
 
 class TestAgentRunnerStreamEvents:
     """Test agent stream event handling."""
@@ -6,6 +6,7 @@ Tests cover:
 - Missing instructions and source_id handling
 - LLM generation errors
 - Prompt building with Jinja variables
+- Response cache routing
 """
 
 from unittest.mock import AsyncMock, MagicMock
@@ -209,6 +210,27 @@ class TestContentGeneratorModelSelection:
         mock_llm_factory.get_provider_for_model.assert_called_once_with("openai:gpt-4o-mini")
 
 
+class TestContentGeneratorResponseCache:
+    """Test routing through the LLM response cache."""
+
+    @pytest.mark.asyncio
+    async def test_uses_cache_only_for_enabled_templates(self, mock_llm_factory, mock_llm_provider, sample_context, sample_content, sample_item):
+        """Test that generation goes through the cache only when the template opted in."""
+        cache = MagicMock()
+        cache.chat = AsyncMock(return_value=mock_llm_provider.chat.return_value)
+        cache.is_enabled_for_template = MagicMock(side_effect=lambda template_id: template_id == "cached-template")
+        generator = ContentGenerator(mock_llm_factory, JinjaRenderer(), cache)
+
+        sample_context.template_id = "cached-template"
+        await generator.generate(sample_context, sample_content, sample_item)
+        sample_context.template_id = "other-template"
+        await generator.generate(sample_context, sample_content, sample_item)
+
+        cache.chat.assert_awaited_once()
+        assert cache.chat.await_args.kwargs["scope"] == "template_content"
+        mock_llm_provider.chat.assert_awaited_once()
+
+
 class TestContentGeneratorErrorHandling:
     """Test error handling scenarios."""
 
@@ -6,10 +6,12 @@ Tests cover:
 - Template progress tracking
 - Item lifecycle management
 - Serialization
+- Message history versioning
 """
 
 from application.orchestrator.context import (
     ConversationContext,
+    ConversationHistory,
     OrchestratorState,
 )
 
@@ -477,3 +479,45 @@ class TestConversationContextEdgeCases:
 
         assert ctx.is_template_complete is True
         assert ctx.current_item_index == 3
+
+
+class TestConversationHistory:
+    """Test the in-memory message history."""
+
+    def test_from_messages_converts_and_skips_tool_messages(self):
+        """Test persisted messages are converted once, tool messages skipped."""
+        history = ConversationHistory.from_messages(
+            [
+                {"id": "m1", "role": "system", "content": "Be brief"},
+                {"id": "m2", "role": "user", "content": "Hi"},
+                {"id": "m3", "role": "tool", "content": "{}"},
+                {"id": "m4", "role": "assistant", "content": "Hello"},
+            ],
+            version=4,
+        )
+
+        assert [(m.role.value, m.content) for m in history.messages] == [("system", "Be brief"), ("user", "Hi"), ("assistant", "Hello")]
+        assert history.message_ids == ["m1", "m2", "m4"]
+        assert history.version == 4
+
+    def test_writes_following_the_version_are_applied(self):
+        """Test consecutive writes update the history in place."""
+        history = ConversationHistory.from_messages([], version=1)
+
+        assert history.append(2, ("u1", "user", "Question"), ("a1", "assistant", "")) is True
+        assert history.update_content(3, "a1", "Answer") is True
+
+        assert [m.content for m in history.messages] == ["Question", "Answer"]
+        assert history.version == 3
+        assert history.stale is False
+
+    def test_version_gap_marks_history_stale(self):
+        """Test a write from elsewhere in between forces a reload."""
+        history = ConversationHistory.from_messages([], version=1)
+
+        assert history.append(3, ("u1", "user", "Question")) is False
+
+        assert history.stale is True
+        assert history.messages == []
+        # Stays stale until reloaded
+        assert history.update_content(4, "u1", "x") is False
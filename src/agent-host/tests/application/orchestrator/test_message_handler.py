@@ -6,13 +6,14 @@ Tests cover:
 - Message acknowledgment sending
 - User message persistence
 - Assistant message completion
+- Message history updates
 """
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from application.orchestrator.context import ConversationContext, OrchestratorState
+from application.orchestrator.context import ConversationContext, ConversationHistory, OrchestratorState
 from application.orchestrator.handlers.message_handler import MessageHandler
 
 
@@ -195,6 +196,38 @@ class TestMessageHandlerPersistence:
         mock_agent_runner.assert_called_once()
 
 
+class TestMessageHandlerHistory:
+    """Test the context's message history follows the handler's writes."""
+
+    @pytest.mark.asyncio
+    async def test_history_follows_own_writes(self, handler, mock_connection, sample_context, mock_agent_runner, mock_error_sender, mock_mediator):
+        """Test the user message and completed answer are applied without a reload."""
+        sample_context.history = ConversationHistory.from_messages([], version=1)
+        mock_mediator.execute_async.side_effect = [
+            MagicMock(is_success=True, data=MagicMock(user_message_id="msg-122", assistant_message_id="msg-123", conversation_version=2)),
+            MagicMock(is_success=True, data=MagicMock(version=3)),
+        ]
+
+        await handler.handle_user_message(mock_connection, sample_context, "Hello", mock_agent_runner, mock_error_sender)
+
+        assert [m.content for m in sample_context.history.messages] == ["Hello", "Agent response content"]
+        assert sample_context.history.message_ids == ["msg-122", "msg-123"]
+        assert sample_context.history.stale is False
+
+    @pytest.mark.asyncio
+    async def test_foreign_write_marks_history_stale(self, handler, mock_connection, sample_context, mock_agent_runner, mock_error_sender, mock_mediator):
+        """Test a version gap (write from another node) forces a reload."""
+        sample_context.history = ConversationHistory.from_messages([], version=1)
+        mock_mediator.execute_async.side_effect = [
+            MagicMock(is_success=True, data=MagicMock(user_message_id="msg-122", assistant_message_id="msg-123", conversation_version=5)),
+            MagicMock(is_success=True, data=MagicMock(version=6)),
+        ]
+
+        await handler.handle_user_message(mock_connection, sample_context, "Hello", mock_agent_runner, mock_error_sender)
+
+        assert sample_context.history.stale is True
+
+
 class TestMessageHandlerStateTransitions:
     """Test state machine transitions during message handling."""
 
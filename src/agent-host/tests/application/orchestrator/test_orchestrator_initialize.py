@@ -0,0 +1,140 @@
+"""Unit tests for Orchestrator.initialize.
+
+Tests cover:
+- Conversation, tools and definition loaded concurrently
+- Prefetched definition discarded when the conversation names another one
+- Missing conversation and tool load failures
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.orchestrator.orchestrator import Orchestrator
+from application.queries import GetConversationQuery, GetDefinitionQuery, GetTemplateQuery
+
+
+def ok(data: Any) -> SimpleNamespace:
+    return SimpleNamespace(is_success=True, data=data)
+
+
+def make_definition(definition_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=definition_id,
+        name=f"Definition {definition_id}",
+        model="openai:gpt-4o",
+        allow_model_selection=False,
+        has_template=True,
+        conversation_template_id="tpl-1",
+    )
+
+
+TEMPLATE = SimpleNamespace(
+    name="Quiz",
+    agent_starts_first=True,
+    item_count=3,
+    allow_navigation=False,
+    allow_backward_navigation=False,
+    enable_chat_input_initially=False,
+    display_progress_indicator=True,
+    display_final_score_report=True,
+    continue_after_completion=False,
+    introduction_message=None,
+    completion_message=None,
+)
+
+TOOLS = [{"name": "get_users", "description": "List users", "input_schema": {"type": "object", "properties": {}}}]
+
+
+@pytest.fixture
+def connection() -> MagicMock:
+    conn = MagicMock()
+    conn.connection_id = "conn-1"
+    conn.user_id = "user-1"
+    conn.definition_id = "def-1"
+    conn.access_token = "token"  # nosec B105
+    return conn
+
+
+def make_orchestrator(conversation_definition_id: str | None, started: list[str], tools: Any = TOOLS) -> Orchestrator:
+    """Create an orchestrator whose queries record their start and yield before answering."""
+    conversation = SimpleNamespace(definition_id=conversation_definition_id, status="active", template_config=None, messages=[], version=1)
+
+    async def execute_async(query: Any) -> SimpleNamespace:
+        if isinstance(query, GetConversationQuery):
+            started.append("conversation")
+            await asyncio.sleep(0.01)
+            return ok(conversation)
+        if isinstance(query, GetDefinitionQuery):
+            started.append(f"definition:{query.definition_id}")
+            await asyncio.sleep(0.01)
+            return ok(make_definition(query.definition_id))
+        if isinstance(query, GetTemplateQuery):
+            started.append("template")
+            return ok(TEMPLATE)
+        raise AssertionError(f"Unexpected query {query}")
+
+    async def get_tools(access_token: str) -> Any:
+        started.append("tools")
+        await asyncio.sleep(0.01)
+        if isinstance(tools, Exception):
+            raise tools
+        return tools
+
+    mediator = MagicMock()
+    mediator.execute_async = AsyncMock(side_effect=execute_async)
+    agent = MagicMock()
+    agent.config.tool_whitelist = None
+    agent.config.tool_blacklist = None
+    tool_provider_client = MagicMock()
+    tool_provider_client.get_tools = AsyncMock(side_effect=get_tools)
+    return Orchestrator(mediator=mediator, connection_manager=MagicMock(), agent=agent, llm_provider_factory=MagicMock(), tool_provider_client=tool_provider_client)
+
+
+class TestOrchestratorInitialize:
+    """Tests for Orchestrator.initialize."""
+
+    @pytest.mark.asyncio
+    async def test_loads_run_concurrently(self, connection: MagicMock) -> None:
+        """All three loads start before the conversation load completes."""
+        started: list[str] = []
+        orchestrator = make_orchestrator("def-1", started)
+
+        await orchestrator.initialize(connection, "conv-1")
+
+        context = orchestrator._contexts["conn-1"]
+        assert started[:3] == ["conversation", "tools", "definition:def-1"]
+        assert started.count("definition:def-1") == 1
+        assert context.is_proactive is True
+        assert context.total_items == 3
+        assert [t.name for t in context.tools] == ["get_users"]
+
+    @pytest.mark.asyncio
+    async def test_conversation_definition_wins_over_prefetch(self, connection: MagicMock) -> None:
+        """The conversation's own definition is loaded if it differs from the connection's."""
+        started: list[str] = []
+        orchestrator = make_orchestrator("def-2", started)
+
+        await orchestrator.initialize(connection, "conv-1")
+
+        assert "definition:def-2" in started
+        assert orchestrator._contexts["conn-1"].definition_id == "def-2"
+
+    @pytest.mark.asyncio
+    async def test_tool_failure_leaves_empty_tool_list(self, connection: MagicMock) -> None:
+        orchestrator = make_orchestrator("def-1", [], tools=RuntimeError("down"))
+
+        await orchestrator.initialize(connection, "conv-1")
+
+        assert orchestrator._contexts["conn-1"].tools == []
+
+    @pytest.mark.asyncio
+    async def test_missing_conversation_raises(self, connection: MagicMock) -> None:
+        orchestrator = make_orchestrator("def-1", [])
+        orchestrator._mediator.execute_async.side_effect = AsyncMock(return_value=SimpleNamespace(is_success=False, data=None))
+
+        with pytest.raises(ValueError):
+            await orchestrator.initialize(connection, "conv-1")
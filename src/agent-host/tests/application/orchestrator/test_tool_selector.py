@@ -0,0 +1,153 @@
+"""Unit tests for ToolSelector.
+
+Tests cover:
+- Tokenization of tool names
+- BM25 ranking over name, tags and description
+- Top-K, pinned tools and small tool sets
+- Fallback to the previous selection, or to all tools
+- Hybrid ranking with an embedding backend
+"""
+
+import pytest
+
+from application.agents import LlmMessage, LlmToolDefinition
+from application.orchestrator.agent.tool_selector import Bm25ToolIndex, ToolSelector, tokenize
+
+
+def make_tools() -> list[LlmToolDefinition]:
+    """Create 30 tools: a few meaningful ones and filler."""
+    tools = [
+        LlmToolDefinition(name="get_weather_forecast", description="Get the weather forecast for a city", tags=["weather"]),
+        LlmToolDefinition(name="listKubernetesPods", description="List the pods of a namespace", tags=["kubernetes", "cluster"]),
+        LlmToolDefinition(name="create_invoice", description="Create a customer invoice", tags=["billing"]),
+        LlmToolDefinition(name="search_documents", description="Full text search in the document store", tags=["search"]),
+    ]
+    tools += [LlmToolDefinition(name=f"filler_{i}", description=f"Unrelated operation number {i}") for i in range(26)]
+    return tools
+
+
+class TestTokenize:
+    """Test term extraction."""
+
+    def test_splits_identifiers_and_drops_stop_words(self):
+        assert tokenize("listKubernetesPods get_user HTTPServer for the win") == ["list", "kubernetes", "pods", "get", "user", "http", "server", "win"]
+
+
+class TestBm25ToolIndex:
+    """Test BM25 scoring."""
+
+    def test_ranks_matching_tool_first(self):
+        tools = make_tools()
+        scores = Bm25ToolIndex(tools).score("what will the weather be in Paris")
+
+        assert scores.index(max(scores)) == 0
+        assert scores[2] == 0
+
+    def test_tags_are_indexed(self):
+        scores = Bm25ToolIndex(make_tools()).score("billing")
+
+        assert scores.index(max(scores)) == 2
+
+
+class TestToolSelector:
+    """Test tool selection."""
+
+    @pytest.mark.asyncio
+    async def test_small_tool_sets_are_not_pruned(self):
+        tools = make_tools()[:10]
+
+        assert await ToolSelector(min_tools=20).select(tools, "weather") == tools
+
+    @pytest.mark.asyncio
+    async def test_selects_top_k_and_pinned_tools_in_original_order(self):
+        selector = ToolSelector(top_k=2, min_tools=5, pinned_tools=["filler_3"])
+
+        selected = await selector.select(make_tools(), "show my kubernetes pods and the weather")
+
+        assert [t.name for t in selected] == ["get_weather_forecast", "listKubernetesPods", "filler_3"]
+
+    @pytest.mark.asyncio
+    async def test_recent_history_joins_the_query(self):
+        selector = ToolSelector(top_k=1, min_tools=5)
+        history = [LlmMessage.user("I need to bill a customer"), LlmMessage.assistant("Which invoice amount?")]
+
+        selected = await selector.select(make_tools(), "100 euros", history)
+
+        assert [t.name for t in selected] == ["create_invoice"]
+
+    @pytest.mark.asyncio
+    async def test_no_match_reuses_previous_selection(self):
+        selector = ToolSelector(top_k=3, min_tools=5)
+
+        selected = await selector.select(make_tools(), "yes, go ahead", previous=["search_documents"])
+
+        assert [t.name for t in selected] == ["search_documents"]
+
+    @pytest.mark.asyncio
+    async def test_no_match_without_previous_selection_keeps_all_tools(self):
+        tools = make_tools()
+        selector = ToolSelector(top_k=3, min_tools=5, pinned_tools=["filler_3"])
+
+        assert await selector.select(tools, "yes, go ahead") == tools
+
+    @pytest.mark.asyncio
+    async def test_index_is_reused_for_same_tool_set(self):
+        selector = ToolSelector(top_k=3, min_tools=5)
+
+        await selector.select(make_tools(), "weather")
+        await selector.select(make_tools(), "pods")
+
+        assert len(selector._indexes) == 1
+
+
+class FakeEmbeddingBackend:
+    """Embeds texts on two axes: 'finance' and everything else."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.calls = 0
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("backend down")
+        return [[1.0, 0.0] if ("invoice" in text or "money" in text) else [0.0, 1.0] for text in texts]
+
+
+class TestToolSelectorEmbeddings:
+    """Test hybrid ranking."""
+
+    @pytest.mark.asyncio
+    async def test_embedding_similarity_finds_tools_without_lexical_match(self):
+        backend = FakeEmbeddingBackend()
+        selector = ToolSelector(top_k=1, min_tools=5, embedding_backend=backend, embedding_weight=0.9)
+
+        selected = await selector.select(make_tools(), "I owe them money")
+
+        assert selected[0].name == "create_invoice"
+
+    @pytest.mark.asyncio
+    async def test_tool_embeddings_are_cached_and_failures_fall_back_to_bm25(self):
+        backend = FakeEmbeddingBackend()
+        selector = ToolSelector(top_k=1, min_tools=5, embedding_backend=backend)
+        await selector.select(make_tools(), "weather")
+        cached = len(selector._embeddings)
+        await selector.select(make_tools(), "pods")
+
+        assert cached == 30
+        assert len(selector._embeddings) == 30
+
+        backend.fail = True
+        selected = await selector.select(make_tools(), "weather")
+        assert [t.name for t in selected] == ["get_weather_forecast"]
+
+    @pytest.mark.asyncio
+    async def test_embedding_cache_keeps_the_most_recently_used_tools(self):
+        backend = FakeEmbeddingBackend()
+        selector = ToolSelector(top_k=1, min_tools=5, embedding_backend=backend, embedding_weight=0.9, max_embeddings=20)
+        tools = make_tools()
+
+        selected = await selector.select(tools, "I owe them money")
+
+        assert selected[0].name == "create_invoice"
+        assert list(selector._embeddings) == [f"{tool.name}: {tool.description}" for tool in tools[-20:]]
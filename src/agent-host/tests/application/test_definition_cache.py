@@ -0,0 +1,126 @@
+"""Unit tests for DefinitionCache and its invalidation handlers.
+
+Tests cover:
+- Cache hits and misses
+- Versioned writes
+- Invalidation racing with a load
+- Invalidation by definition and template domain events
+"""
+
+import asyncio
+from dataclasses import dataclass
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.events.domain.definition_cache_invalidation_handlers import (
+    AgentDefinitionCacheInvalidationHandler,
+    ConversationTemplateCacheInvalidationHandler,
+)
+from application.services.definition_cache import DEFINITION, TEMPLATE, DefinitionCache
+
+
+@dataclass
+class FakeDto:
+    id: str
+    version: int
+
+
+class TestDefinitionCache:
+    """Tests for DefinitionCache."""
+
+    @pytest.mark.asyncio
+    async def test_second_get_is_served_from_cache(self) -> None:
+        """Only the first lookup invokes the loader."""
+        cache = DefinitionCache()
+        loader = AsyncMock(return_value=FakeDto("def-1", 1))
+
+        first = await cache.get_or_load(DEFINITION, "def-1", loader)
+        second = await cache.get_or_load(DEFINITION, "def-1", loader)
+
+        assert first is second
+        assert loader.await_count == 1
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_dto_is_not_cached(self) -> None:
+        """A lookup that finds nothing is retried next time."""
+        cache = DefinitionCache()
+        loader = AsyncMock(return_value=None)
+
+        await cache.get_or_load(TEMPLATE, "tpl-1", loader)
+        await cache.get_or_load(TEMPLATE, "tpl-1", loader)
+
+        assert loader.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_caching(self) -> None:
+        """With ttl_seconds=0 every lookup reloads."""
+        cache = DefinitionCache(ttl_seconds=0)
+        loader = AsyncMock(return_value=FakeDto("def-1", 1))
+
+        await cache.get_or_load(DEFINITION, "def-1", loader)
+        await cache.get_or_load(DEFINITION, "def-1", loader)
+
+        assert loader.await_count == 2
+
+    def test_older_version_does_not_replace_newer(self) -> None:
+        """A late write of an older DTO keeps the newer one."""
+        cache = DefinitionCache()
+        cache._put((DEFINITION, "def-1"), FakeDto("def-1", 3))
+        cache._put((DEFINITION, "def-1"), FakeDto("def-1", 2))
+
+        assert cache._entries[(DEFINITION, "def-1")][1].version == 3
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_not_cached(self) -> None:
+        """A DTO loaded before an invalidation is returned but not cached."""
+        cache = DefinitionCache()
+        release = asyncio.Event()
+
+        async def slow_loader() -> FakeDto:
+            await release.wait()
+            return FakeDto("def-1", 1)
+
+        pending = asyncio.create_task(cache.get_or_load(DEFINITION, "def-1", slow_loader))
+        await asyncio.sleep(0)
+        cache.invalidate(DEFINITION, "def-1")
+        release.set()
+
+        assert (await pending).version == 1
+        assert cache.get_stats()["entries"] == 0
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry is evicted past max_entries."""
+        cache = DefinitionCache(max_entries=2)
+        for i in range(3):
+            cache._put((DEFINITION, f"def-{i}"), FakeDto(f"def-{i}", 1))
+
+        assert (DEFINITION, "def-0") not in cache._entries
+        assert len(cache._entries) == 2
+
+
+class TestDefinitionCacheInvalidationHandlers:
+    """Tests for the domain event handlers that invalidate the cache."""
+
+    @pytest.mark.asyncio
+    async def test_definition_event_drops_only_the_definition(self) -> None:
+        cache = DefinitionCache()
+        cache._put((DEFINITION, "id-1"), FakeDto("id-1", 1))
+        cache._put((TEMPLATE, "id-1"), FakeDto("id-1", 1))
+
+        event = type("Event", (), {"aggregate_id": "id-1"})()
+        await AgentDefinitionCacheInvalidationHandler(cache).handle_async(event)
+
+        assert (DEFINITION, "id-1") not in cache._entries
+        assert (TEMPLATE, "id-1") in cache._entries
+
+    @pytest.mark.asyncio
+    async def test_template_event_drops_the_template(self) -> None:
+        cache = DefinitionCache()
+        cache._put((TEMPLATE, "tpl-1"), FakeDto("tpl-1", 1))
+
+        event = type("Event", (), {"aggregate_id": "tpl-1"})()
+        await ConversationTemplateCacheInvalidationHandler(cache).handle_async(event)
+
+        assert cache.get_stats()["entries"] == 0
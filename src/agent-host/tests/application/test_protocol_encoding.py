@@ -0,0 +1,94 @@
+"""Tests for the JSON encoding of protocol messages."""
+
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel, Field
+
+from application.orchestrator.agent.stream_handler import StreamHandler
+from application.orchestrator.context import ConversationContext
+from application.protocol.core import create_message
+from application.protocol.data import ContentChunkPayload
+from application.protocol.encoding import encode_message, message_to_dict
+from application.websocket.manager import ConnectionManager
+
+
+class Mood(str, Enum):
+    HAPPY = "happy"
+
+
+class Nested(BaseModel):
+    label: str | None = None
+    display_name: str = Field("n", alias="displayName")
+    mood: Mood = Mood.HAPPY
+
+
+@dataclass
+class Record:
+    id: int
+    note: str | None = None
+
+
+def starlette_frame(message: Any) -> str:
+    """The text WebSocket.send_json writes for a message."""
+    return json.dumps(message_to_dict(message), separators=(",", ":"), ensure_ascii=False)
+
+
+PAYLOADS: list[Any] = [
+    ContentChunkPayload(content="Héllo 😀 <b>", messageId="msg_1", final=False).model_dump(by_alias=True, exclude_none=True),
+    {"items": [{"id": 1, "score": 0.5, "missing": None}], "total": 2**63 - 1, "ratio": 1e16, "tuple": (1, 2)},
+    {"model": Nested(), "records": [Record(1), Record(2, "x")], "mood": Mood.HAPPY},
+    {"big": 2**70, 1: "non-string key"},
+    "plain text",
+    None,
+]
+
+
+class TestEncodeMessage:
+    """Test encode_message."""
+
+    @pytest.mark.parametrize("payload", PAYLOADS)
+    def test_fast_path_writes_the_starlette_frame(self, payload: Any) -> None:
+        message = create_message("data.test", payload, conversation_id="conv-1" if payload else None)
+
+        assert encode_message(message) == starlette_frame(message)
+        assert encode_message(message, fast=False) == starlette_frame(message)
+
+    def test_unencodable_payload_raises_like_send_json(self) -> None:
+        message = create_message("data.test", {"tags": {"a"}})
+
+        with pytest.raises(TypeError):
+            encode_message(message)
+
+
+class TestConnectionManagerFrames:
+    """Test the frames ConnectionManager writes, with and without the fast path."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fast_json", [True, False])
+    async def test_stream_handler_frames_match_send_json(self, fast_json: bool) -> None:
+        """Test content chunks streamed by StreamHandler are sent as send_json would send them."""
+        manager = ConnectionManager(fast_json=fast_json)
+        websocket = MagicMock()
+        websocket.accept = AsyncMock()
+        websocket.send_text = AsyncMock()
+        connection = await manager.connect(websocket, user_id="user-1", conversation_id="conv-1")
+
+        sent: list[Any] = []
+        send_to_connection = manager.send_to_connection
+
+        async def record(connection_id: str, message: Any) -> bool:
+            sent.append(message)
+            return await send_to_connection(connection_id, message)
+
+        manager.send_to_connection = record  # type: ignore[method-assign]
+        handler = StreamHandler(manager, chunk_size=8, chunk_delay=0)
+        await handler.stream_response(connection, ConversationContext(connection_id=connection.connection_id, conversation_id="conv-1", user_id="user-1"), "Streamed ✓ content")
+
+        frames = [call.args[0] for call in websocket.send_text.await_args_list[1:]]  # After system.connection.established
+        assert frames == [starlette_frame(message) for message in sent]
+        assert json.loads(frames[-1])["type"] == "data.content.complete"
@@ -0,0 +1,77 @@
+"""Unit tests for the ToolProviderClient tool manifest cache.
+
+Tests cover:
+- Fresh entries served without a request
+- ETag revalidation (304 Not Modified)
+- Per-token isolation
+- Eviction on HTTP errors
+"""
+
+import httpx
+import pytest
+
+from application.services.tool_provider_client import ToolProviderClient
+
+TOOLS = [{"tool_id": "src:get_users", "name": "get_users"}]
+
+
+def make_client(responses: list[httpx.Response], ttl_seconds: float = 30.0) -> tuple[ToolProviderClient, list[httpx.Request]]:
+    """Create a client whose HTTP calls are answered from `responses` in order."""
+    requests: list[httpx.Request] = []
+    pending = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return pending.pop(0)
+
+    client = ToolProviderClient(base_url="http://tools-provider", manifest_cache_ttl_seconds=ttl_seconds)
+    client._client = httpx.AsyncClient(base_url="http://tools-provider", transport=httpx.MockTransport(handler))
+    return client, requests
+
+
+class TestToolManifestCache:
+    """Tests for ToolProviderClient.get_tools caching."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_manifest_is_reused_without_request(self) -> None:
+        client, requests = make_client([httpx.Response(200, json=TOOLS, headers={"ETag": '"v1"'})])
+
+        assert await client.get_tools("token-a") == TOOLS
+        assert await client.get_tools("token-a") == TOOLS
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_manifest_is_revalidated_with_etag(self) -> None:
+        client, requests = make_client(
+            [httpx.Response(200, json=TOOLS, headers={"ETag": '"v1"'}), httpx.Response(304, headers={"ETag": '"v1"'})],
+            ttl_seconds=0,
+        )
+
+        await client.get_tools("token-a")
+        tools = await client.get_tools("token-a")
+
+        assert tools == TOOLS
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_manifests_are_cached_per_token(self) -> None:
+        other = [{"tool_id": "src:get_orders", "name": "get_orders"}]
+        client, requests = make_client([httpx.Response(200, json=TOOLS), httpx.Response(200, json=other)])
+
+        assert await client.get_tools("token-a") == TOOLS
+        assert await client.get_tools("token-b") == other
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_http_error_drops_cached_manifest(self) -> None:
+        client, requests = make_client(
+            [httpx.Response(200, json=TOOLS, headers={"ETag": '"v1"'}), httpx.Response(401), httpx.Response(200, json=[])],
+            ttl_seconds=0,
+        )
+
+        await client.get_tools("token-a")
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_tools("token-a")
+        assert await client.get_tools("token-a") == []
+        assert "If-None-Match" not in requests[2].headers
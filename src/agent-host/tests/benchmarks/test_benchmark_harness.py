@@ -0,0 +1,118 @@
+"""Tests for the WebSocket load-test harness.
+
+Tests cover:
+- Percentile and summary statistics
+- Baseline comparison and regression detection
+- Server resource sampling
+- The in-memory stand-ins (sessions, definitions, tools provider)
+"""
+
+import os
+
+import pytest
+
+from benchmarks.runner import compare, percentile, sample_process, summarize
+from benchmarks.stand_ins import BENCH_DEFINITION_ID, BenchToolProviderClient, InMemoryAgentDefinitionRepository, InMemorySessionStore, bench_definition, create_bench_session
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+def make_report(**steps: tuple[float, float, float]) -> dict:
+    """Report with one step per ``ws<N>=(ttft_p95, cpu_ms_per_message, rss_kb_per_connection)``."""
+    return {
+        "steps": [
+            {"connections": int(key[2:]), "message_ms": {"first_token": {"p95": ttft}}, "server": {"cpu_ms_per_message": cpu, "rss_kb_per_connection": rss}} for key, (ttft, cpu, rss) in steps.items()
+        ]
+    }
+
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+
+class TestStatistics:
+    def test_percentile_uses_nearest_rank(self) -> None:
+        samples = [float(value) for value in range(1, 101)]
+
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 95) == 95.0
+        assert percentile([], 95) == 0.0
+
+    def test_summarize(self) -> None:
+        assert summarize([4.0, 1.0, 3.0, 2.0]) == {"count": 4, "mean": 2.5, "p50": 2.0, "p95": 4.0, "p99": 4.0, "max": 4.0}
+
+
+# ============================================================================
+# BASELINE COMPARISON
+# ============================================================================
+
+
+class TestCompare:
+    def test_within_threshold_is_not_a_regression(self) -> None:
+        rows = compare(make_report(ws100=(310.0, 10.5, 100.0)), make_report(ws100=(300.0, 10.0, 100.0)), threshold=0.10)
+
+        assert rows == [{"step": "ws@100", "ttft_p95_change": pytest.approx(1 / 30), "cpu_change": pytest.approx(0.05), "memory_change": 0.0, "regressed": False}]
+
+    @pytest.mark.parametrize("current", [(400.0, 10.0, 100.0), (300.0, 12.0, 100.0), (300.0, 10.0, 120.0)])
+    def test_growth_regresses(self, current: tuple[float, float, float]) -> None:
+        rows = compare(make_report(ws100=current), make_report(ws100=(300.0, 10.0, 100.0)), threshold=0.10)
+
+        assert rows[0]["regressed"] is True
+
+    def test_steps_missing_from_baseline_are_skipped(self) -> None:
+        rows = compare(make_report(ws100=(300.0, 10.0, 100.0), ws500=(300.0, 10.0, 100.0)), make_report(ws100=(300.0, 10.0, 100.0)))
+
+        assert [row["step"] for row in rows] == ["ws@100"]
+
+
+# ============================================================================
+# RESOURCE SAMPLING
+# ============================================================================
+
+
+class TestSampleProcess:
+    def test_samples_own_process(self) -> None:
+        rss_kb, cpu_seconds = sample_process(os.getpid())
+
+        assert rss_kb > 0
+        assert cpu_seconds > 0
+
+
+# ============================================================================
+# STAND-INS
+# ============================================================================
+
+
+class TestStandIns:
+    def test_bench_sessions_hold_valid_tokens(self) -> None:
+        store = InMemorySessionStore()
+
+        session = store.get_session(create_bench_session(store, 3))
+
+        assert session is not None
+        assert session["user_info"]["sub"] == "bench-user-3"
+        assert session["tokens"]["access_token"] and session["tokens"]["refresh_token"]
+
+    @pytest.mark.asyncio
+    async def test_definition_repository(self) -> None:
+        repository = InMemoryAgentDefinitionRepository()
+        definition = bench_definition("scripted:bench")
+        repository.entities[definition.id()] = definition
+
+        assert definition.id() == BENCH_DEFINITION_ID
+        assert [d.id() for d in await repository.get_public_async()] == [BENCH_DEFINITION_ID]
+        assert (await repository.get_async(BENCH_DEFINITION_ID)).state.model == "scripted:bench"
+
+    @pytest.mark.asyncio
+    async def test_tool_provider_client_serves_synthetic_catalog(self) -> None:
+        client = BenchToolProviderClient(tool_count=3, latency_ms=0.0)
+
+        tools = await client.get_tools("token")
+        result = await client.execute_tool(tools[0]["name"], {"query": "pizza"}, "token")
+
+        assert len(tools) == 3
+        assert result["success"] is True
+        assert client.call_count == 1
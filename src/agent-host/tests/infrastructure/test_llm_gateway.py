@@ -0,0 +1,203 @@
+"""Unit tests for the LLM gateway.
+
+Tests cover:
+- Per-model concurrency limits
+- Priority and weighted fair admission
+- Retries on 429/503 (and only before a stream started)
+- Queue timeout
+- LlmProviderFactory integration
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from application.agents.llm_provider import (
+    LlmConfig,
+    LlmMessage,
+    LlmPriority,
+    LlmProvider,
+    LlmProviderError,
+    LlmProviderType,
+    LlmResponse,
+    LlmStreamChunk,
+)
+from infrastructure.llm_gateway import GatewayLlmProvider, LlmGateway
+from infrastructure.llm_provider_factory import LlmProviderFactory
+
+
+def http_error(status_code: int) -> LlmProviderError:
+    return LlmProviderError(message="error", error_code="http_error", provider="fake", is_retryable=status_code >= 500, details={"status_code": status_code})
+
+
+class FakeProvider(LlmProvider):
+    """Provider that records concurrency and the model of each call."""
+
+    def __init__(self, delay: float = 0.0, failures: list[LlmProviderError] | None = None) -> None:
+        super().__init__(LlmConfig(model="base-model"))
+        self.delay = delay
+        self.failures = failures or []
+        self.running = 0
+        self.peak = 0
+        self.models: list[str] = []
+        self.calls = 0
+
+    @property
+    def provider_type(self) -> LlmProviderType:
+        return LlmProviderType.OLLAMA
+
+    async def chat(self, messages, tools=None) -> LlmResponse:
+        self.calls += 1
+        self.models.append(self.current_model)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                raise self.failures.pop(0)
+            return LlmResponse(content=messages[-1].content)
+        finally:
+            self.running -= 1
+
+    async def chat_stream(self, messages, tools=None) -> AsyncIterator[LlmStreamChunk]:
+        self.calls += 1
+        yield LlmStreamChunk(content="partial")
+        if self.failures:
+            raise self.failures.pop(0)
+        yield LlmStreamChunk(content="", done=True)
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        pass
+
+
+def no_wait_gateway(**kwargs) -> LlmGateway:
+    return LlmGateway(retry_base_delay_seconds=0, retry_max_delay_seconds=0, **kwargs)
+
+
+class TestLlmGatewayAdmission:
+    """Tests for concurrency limits and queueing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_limited_per_model(self) -> None:
+        provider = FakeProvider(delay=0.01)
+        view = no_wait_gateway(max_concurrency=2).bind(provider, "qwen")
+
+        await asyncio.gather(*(view.chat([LlmMessage.user(str(i))]) for i in range(6)))
+
+        assert provider.peak == 2
+        assert provider.calls == 6
+
+    @pytest.mark.asyncio
+    async def test_model_override_limit(self) -> None:
+        provider = FakeProvider(delay=0.01)
+        gateway = no_wait_gateway(max_concurrency=4, model_concurrency={"ollama:small": 1})
+
+        await asyncio.gather(*(gateway.bind(provider, "small").chat([LlmMessage.user("x")]) for _ in range(3)))
+
+        assert provider.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_interactive_admitted_before_background_with_weighted_fairness(self) -> None:
+        """With weight 2, two interactive requests are admitted per background one."""
+        gateway = no_wait_gateway(max_concurrency=1, interactive_weight=2)
+        admitted: list[str] = []
+        blocker = asyncio.Event()
+
+        async def request(name: str, priority: LlmPriority, hold: asyncio.Event | None = None) -> None:
+            async with gateway.admit("ollama:m", priority):
+                admitted.append(name)
+                if hold is not None:
+                    await hold.wait()
+
+        first = asyncio.create_task(request("first", LlmPriority.INTERACTIVE, blocker))
+        await asyncio.sleep(0)
+        queued = [asyncio.create_task(request("b1", LlmPriority.BACKGROUND))]
+        queued += [asyncio.create_task(request(f"i{i}", LlmPriority.INTERACTIVE)) for i in range(1, 5)]
+        await asyncio.sleep(0)
+        blocker.set()
+        await asyncio.gather(first, *queued)
+
+        assert admitted == ["first", "i1", "i2", "b1", "i3", "i4"]
+        assert gateway.get_stats()["ollama:m"] == {"limit": 1, "active": 0, "waiting": 0}
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_raises_retryable_error(self) -> None:
+        gateway = no_wait_gateway(max_concurrency=1, queue_timeout_seconds=0.01)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with gateway.admit("ollama:m", LlmPriority.INTERACTIVE):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(LlmProviderError) as exc:
+            async with gateway.admit("ollama:m", LlmPriority.BACKGROUND):
+                pass
+        release.set()
+        await holder
+
+        assert exc.value.error_code == "llm_queue_timeout"
+        assert exc.value.is_retryable is True
+        assert gateway.get_stats()["ollama:m"]["active"] == 0
+
+
+class TestLlmGatewayRetries:
+    """Tests for 429/503 retries."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_chat_is_retried(self) -> None:
+        provider = FakeProvider(failures=[http_error(429), http_error(503)])
+
+        response = await no_wait_gateway().bind(provider).chat([LlmMessage.user("hi")])
+
+        assert response.content == "hi"
+        assert provider.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_other_errors_and_exhausted_budget_are_raised(self) -> None:
+        provider = FakeProvider(failures=[http_error(400)])
+        with pytest.raises(LlmProviderError):
+            await no_wait_gateway().bind(provider).chat([LlmMessage.user("hi")])
+        assert provider.calls == 1
+
+        provider = FakeProvider(failures=[http_error(429)] * 3)
+        with pytest.raises(LlmProviderError):
+            await no_wait_gateway(max_retries=2).bind(provider).chat([LlmMessage.user("hi")])
+        assert provider.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_is_not_retried_after_first_chunk(self) -> None:
+        provider = FakeProvider(failures=[http_error(503)])
+        chunks: list[str] = []
+
+        with pytest.raises(LlmProviderError):
+            async for chunk in no_wait_gateway().bind(provider).chat_stream([LlmMessage.user("hi")]):
+                chunks.append(chunk.content)
+
+        assert chunks == ["partial"]
+        assert provider.calls == 1
+
+
+class TestLlmProviderFactoryGateway:
+    """Tests for LlmProviderFactory with a gateway."""
+
+    @pytest.mark.asyncio
+    async def test_views_keep_their_own_model(self) -> None:
+        provider = FakeProvider()
+        factory = LlmProviderFactory(gateway=no_wait_gateway())
+        factory.register_provider(LlmProviderType.OLLAMA, provider)
+
+        small = factory.get_provider_for_model("ollama:small")
+        large = factory.get_provider_for_model("ollama:large", priority=LlmPriority.BACKGROUND)
+        await small.chat([LlmMessage.user("a")])
+        await large.chat([LlmMessage.user("b")])
+        await small.chat([LlmMessage.user("c")])
+
+        assert isinstance(large, GatewayLlmProvider)
+        assert large.priority == LlmPriority.BACKGROUND
+        assert provider.models == ["small", "large", "small"]
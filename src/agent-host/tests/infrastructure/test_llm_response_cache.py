@@ -0,0 +1,142 @@
+"""Unit tests for LlmResponseCache.
+
+Tests cover:
+- Determinism gating (temperature 0 or fixed seed)
+- Local and Redis tier hits
+- Key normalization and separation
+- Uncacheable responses
+- Per-template enablement
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from application.agents.llm_provider import (
+    LlmConfig,
+    LlmMessage,
+    LlmProvider,
+    LlmProviderType,
+    LlmResponse,
+    LlmToolCall,
+    LlmToolDefinition,
+)
+from infrastructure.llm_response_cache import LlmResponseCache
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the async Redis client."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.data[key] = value
+
+
+class StubProvider(LlmProvider):
+    """Provider returning a fixed response."""
+
+    def __init__(self, temperature: float = 0.0, seed: int | None = None, response: LlmResponse | None = None) -> None:
+        super().__init__(LlmConfig(model="qwen", temperature=temperature, seed=seed))
+        self.chat = AsyncMock(return_value=response or LlmResponse(content="generated"))  # type: ignore[method-assign]
+
+    @property
+    def provider_type(self) -> LlmProviderType:
+        return LlmProviderType.OLLAMA
+
+    async def chat(self, messages, tools=None):  # pragma: no cover - replaced in __init__
+        raise NotImplementedError
+
+    async def chat_stream(self, messages, tools=None):  # pragma: no cover
+        raise NotImplementedError
+        yield
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        pass
+
+
+MESSAGES = [LlmMessage.system("You generate items."), LlmMessage.user("What is 2 + 2?")]
+
+
+class TestLlmResponseCache:
+    """Tests for LlmResponseCache.chat."""
+
+    @pytest.mark.asyncio
+    async def test_non_deterministic_provider_is_not_cached(self) -> None:
+        cache = LlmResponseCache()
+        provider = StubProvider(temperature=0.7)
+
+        await cache.chat(provider, MESSAGES)
+        await cache.chat(provider, MESSAGES)
+
+        assert provider.chat.await_count == 2
+        assert cache.get_stats()["misses"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("temperature, seed", [(0.0, None), (0.7, 42)])
+    async def test_deterministic_provider_is_served_from_local_tier(self, temperature: float, seed: int | None) -> None:
+        cache = LlmResponseCache()
+        provider = StubProvider(temperature=temperature, seed=seed)
+
+        first = await cache.chat(provider, MESSAGES)
+        second = await cache.chat(provider, [LlmMessage.system("You generate items.\n"), LlmMessage.user("  What is 2 + 2?")])
+
+        assert provider.chat.await_count == 1
+        assert first.content == second.content == "generated"
+        assert cache.get_stats()["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_is_shared_between_instances(self) -> None:
+        redis = FakeRedis()
+        provider = StubProvider()
+
+        await LlmResponseCache(redis_client=redis).chat(provider, MESSAGES)
+        response = await LlmResponseCache(redis_client=redis).chat(provider, MESSAGES)
+
+        assert provider.chat.await_count == 1
+        assert response.content == "generated"
+        assert all(key.startswith(LlmResponseCache.KEY_PREFIX) for key in redis.data)
+
+    @pytest.mark.asyncio
+    async def test_key_separates_models_seeds_and_tools(self) -> None:
+        tool = LlmToolDefinition(name="calc", description="Calculator")
+        base = StubProvider(seed=1)
+        keys = {
+            LlmResponseCache.make_key(base, MESSAGES),
+            LlmResponseCache.make_key(base, MESSAGES, [tool]),
+            LlmResponseCache.make_key(StubProvider(seed=2), MESSAGES),
+        }
+        base.set_model_override("llama")
+        keys.add(LlmResponseCache.make_key(base, MESSAGES))
+
+        assert len(keys) == 4
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "response",
+        [
+            LlmResponse(content="", tool_calls=[LlmToolCall(id="1", name="calc", arguments={})], finish_reason="tool_calls"),
+            LlmResponse(content="truncated", finish_reason="length"),
+        ],
+    )
+    async def test_incomplete_responses_are_not_cached(self, response: LlmResponse) -> None:
+        cache = LlmResponseCache()
+        provider = StubProvider(response=response)
+
+        await cache.chat(provider, MESSAGES)
+        await cache.chat(provider, MESSAGES)
+
+        assert provider.chat.await_count == 2
+
+    def test_template_enablement(self) -> None:
+        assert LlmResponseCache(template_ids=["math-quiz"]).is_enabled_for_template("math-quiz")
+        assert not LlmResponseCache(template_ids=["math-quiz"]).is_enabled_for_template("other")
+        assert not LlmResponseCache().is_enabled_for_template("math-quiz")
+        assert LlmResponseCache(template_ids=["*"]).is_enabled_for_template(None)
@@ -0,0 +1,113 @@
+"""Unit tests for the scripted LLM provider.
+
+Tests cover:
+- Token count and timing of streamed responses
+- Reproducible tokens for a given user message
+- Tool calls on every Nth user turn, with placeholder arguments
+- Registration with the LlmProviderFactory
+"""
+
+import time
+
+import pytest
+
+from application.agents.llm_provider import LlmConfig, LlmMessage, LlmProviderType, LlmToolDefinition
+from infrastructure.adapters.scripted_llm_provider import ScriptedLlmProvider
+from infrastructure.llm_provider_factory import LlmProviderFactory
+
+LOOKUP = LlmToolDefinition(
+    name="lookup",
+    description="Look up records",
+    parameters={"type": "object", "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}}, "required": ["query", "limit"]},
+)
+
+
+def make_provider(**kwargs) -> ScriptedLlmProvider:
+    options = {"response_tokens": 5, "first_token_ms": 0.0, "token_interval_ms": 0.0, **kwargs}
+    return ScriptedLlmProvider(LlmConfig(model="scripted"), **options)
+
+
+async def collect(provider: ScriptedLlmProvider, messages: list[LlmMessage], tools: list[LlmToolDefinition] | None = None) -> list:
+    return [chunk async for chunk in provider.chat_stream(messages, tools)]
+
+
+class TestStreaming:
+    @pytest.mark.asyncio
+    async def test_streams_configured_tokens_then_done(self) -> None:
+        chunks = await collect(make_provider(), [LlmMessage.user("Hello")])
+
+        assert [chunk.done for chunk in chunks] == [False] * 5 + [True]
+        assert all(chunk.content for chunk in chunks[:-1])
+        assert chunks[-1].finish_reason == "stop"
+
+    @pytest.mark.asyncio
+    async def test_tokens_depend_only_on_the_user_message(self) -> None:
+        provider = make_provider()
+
+        first = "".join(chunk.content for chunk in await collect(provider, [LlmMessage.user("Hello")]))
+        again = "".join(chunk.content for chunk in await collect(provider, [LlmMessage.user("Hello")]))
+        other = "".join(chunk.content for chunk in await collect(provider, [LlmMessage.user("Something else")]))
+
+        assert first == again
+        assert first != other
+
+    @pytest.mark.asyncio
+    async def test_streaming_follows_configured_timing(self) -> None:
+        provider = make_provider(response_tokens=3, first_token_ms=50.0, token_interval_ms=20.0)
+
+        started = time.perf_counter()
+        await collect(provider, [LlmMessage.user("Hello")])
+
+        assert time.perf_counter() - started >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_chat_returns_whole_response(self) -> None:
+        response = await make_provider().chat([LlmMessage.user("Hello")])
+
+        assert len(response.content.split()) == 5
+        assert response.usage["completion_tokens"] == 5
+
+
+class TestToolCalls:
+    @pytest.mark.asyncio
+    async def test_calls_tool_on_every_nth_user_turn(self) -> None:
+        provider = make_provider(tool_call_every=2)
+        first_turn = [LlmMessage.user("one")]
+        second_turn = [*first_turn, LlmMessage.assistant("answer"), LlmMessage.user("two")]
+
+        assert not (await collect(provider, first_turn, [LOOKUP]))[-1].tool_calls
+        chunks = await collect(provider, second_turn, [LOOKUP])
+
+        assert len(chunks) == 1
+        assert chunks[0].finish_reason == "tool_calls"
+        assert chunks[0].tool_calls[0].name == "lookup"
+        assert chunks[0].tool_calls[0].arguments == {"query": "sample", "limit": 1}
+
+    @pytest.mark.asyncio
+    async def test_answers_with_text_after_tool_result(self) -> None:
+        provider = make_provider(tool_call_every=1)
+        call = (await provider.chat([LlmMessage.user("one")], [LOOKUP])).tool_calls[0]
+        messages = [LlmMessage.user("one"), LlmMessage.assistant("", tool_calls=[call]), LlmMessage.tool_result(call.id, call.name, "{}")]
+
+        response = await provider.chat(messages, [LOOKUP])
+
+        assert not response.tool_calls
+        assert response.content
+
+    @pytest.mark.asyncio
+    async def test_no_tool_call_without_tools(self) -> None:
+        response = await make_provider(tool_call_every=1).chat([LlmMessage.user("one")])
+
+        assert not response.tool_calls
+
+
+class TestFactoryIntegration:
+    def test_factory_resolves_scripted_models(self) -> None:
+        provider = make_provider()
+        factory = LlmProviderFactory(default_provider=LlmProviderType.SCRIPTED)
+        factory.register_provider(LlmProviderType.SCRIPTED, provider)
+
+        resolved = factory.get_provider_for_model("scripted:bench-model")
+
+        assert resolved.provider_type == LlmProviderType.SCRIPTED
+        assert resolved.current_model == "bench-model"
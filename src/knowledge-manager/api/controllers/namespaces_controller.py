@@ -14,7 +14,9 @@ from application.commands import (
     AddTermCommand,
     CreateNamespaceCommand,
     DeleteNamespaceCommand,
+    ReindexNamespaceEmbeddingsCommand,
     RemoveTermCommand,
+    SyncNamespaceGraphCommand,
     UpdateNamespaceCommand,
     UpdateTermCommand,
 )
@@ -24,7 +26,7 @@ from application.queries import (
     GetTermQuery,
     GetTermsQuery,
 )
-from integration.models import KnowledgeNamespaceDto, KnowledgeTermDto
+from integration.models import KnowledgeNamespaceDto, KnowledgeTermDto, KnowledgeTermPageDto
 
 log = logging.getLogger(__name__)
 
@@ -273,6 +275,61 @@ class NamespacesController(ControllerBase):
     # Term CRUD
     # =========================================================================
 
+    @post("/{namespace_id}/embeddings/reindex")
+    async def reindex_embeddings(
+        self,
+        namespace_id: str,
+        force: bool = Query(False, description="Re-embed terms even when their content did not change"),
+        mediator: Mediator = Depends(get_mediator),
+        user: dict[str, Any] = Depends(require_roles("admin")),
+    ):
+        """Re-embed all active terms of a namespace into the vector store.
+
+        Args:
+            namespace_id: The namespace ID
+            force: Whether to bypass content-hash deduplication
+            mediator: Command mediator
+            user: Current user info (must have admin role)
+
+        Returns:
+            Counts of embedded, skipped, deleted and failed terms
+        """
+        command = ReindexNamespaceEmbeddingsCommand(
+            namespace_id=namespace_id,
+            force=force,
+            user_info=user,
+        )
+
+        result = await mediator.execute_async(command)
+        return self.process(result)
+
+    @post("/{namespace_id}/graph/sync")
+    async def sync_graph(
+        self,
+        namespace_id: str,
+        mediator: Mediator = Depends(get_mediator),
+        user: dict[str, Any] = Depends(require_roles("admin")),
+    ):
+        """Sync a namespace's terms and relationships to the knowledge graph.
+
+        Only new, changed and removed elements are written.
+
+        Args:
+            namespace_id: The namespace ID
+            mediator: Command mediator
+            user: Current user info (must have admin role)
+
+        Returns:
+            Counts of upserted, deleted and unchanged terms and relationships
+        """
+        command = SyncNamespaceGraphCommand(
+            namespace_id=namespace_id,
+            user_info=user,
+        )
+
+        result = await mediator.execute_async(command)
+        return self.process(result)
+
     @post("/{namespace_id}/terms", status_code=201, response_model=KnowledgeTermDto)
     async def add_term(
         self,
@@ -307,13 +364,14 @@ class NamespacesController(ControllerBase):
         result = await mediator.execute_async(command)
         return self.process(result)
 
-    @get("/{namespace_id}/terms", response_model=list[KnowledgeTermDto])
+    @get("/{namespace_id}/terms", response_model=KnowledgeTermPageDto)
     async def get_terms(
         self,
         namespace_id: str,
-        search: str | None = Query(None, description="Search filter"),
+        search: str | None = Query(None, description="Full-text search over term, aliases and definition"),
         limit: int = Query(100, ge=1, le=500, description="Maximum results"),
         offset: int = Query(0, ge=0, description="Results offset"),
+        include_inactive: bool = Query(False, description="Include removed terms"),
         mediator: Mediator = Depends(get_mediator),
         user: dict[str, Any] = Depends(get_current_user),
     ):
@@ -321,20 +379,22 @@ class NamespacesController(ControllerBase):
 
         Args:
             namespace_id: The namespace ID
-            search: Optional search filter
+            search: Optional full-text search (results ranked by relevance)
             limit: Maximum number of results
             offset: Number of results to skip
+            include_inactive: Whether to include removed terms
             mediator: Query mediator
             user: Current user info
 
         Returns:
-            List of term DTOs
+            Page of term DTOs with the total number of matches
         """
         query = GetTermsQuery(
             namespace_id=namespace_id,
             search=search,
             limit=limit,
             offset=offset,
+            include_inactive=include_inactive,
             user_info=user,
         )
 
@@ -3,7 +3,9 @@
 from application.commands.namespace.add_term_command import AddTermCommand, AddTermCommandHandler
 from application.commands.namespace.create_namespace_command import CreateNamespaceCommand, CreateNamespaceCommandHandler
 from application.commands.namespace.delete_namespace_command import DeleteNamespaceCommand, DeleteNamespaceCommandHandler
+from application.commands.namespace.reindex_namespace_embeddings_command import ReindexNamespaceEmbeddingsCommand, ReindexNamespaceEmbeddingsCommandHandler
 from application.commands.namespace.remove_term_command import RemoveTermCommand, RemoveTermCommandHandler
+from application.commands.namespace.sync_namespace_graph_command import SyncNamespaceGraphCommand, SyncNamespaceGraphCommandHandler
 from application.commands.namespace.update_namespace_command import UpdateNamespaceCommand, UpdateNamespaceCommandHandler
 from application.commands.namespace.update_term_command import UpdateTermCommand, UpdateTermCommandHandler
 
@@ -22,4 +24,10 @@ __all__ = [
     "UpdateTermCommandHandler",
     "RemoveTermCommand",
     "RemoveTermCommandHandler",
+    # Embedding commands
+    "ReindexNamespaceEmbeddingsCommand",
+    "ReindexNamespaceEmbeddingsCommandHandler",
+    # Graph commands
+    "SyncNamespaceGraphCommand",
+    "SyncNamespaceGraphCommandHandler",
 ]
@@ -0,0 +1,84 @@
+"""Reindex namespace embeddings command with handler."""
+
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from neuroglia.core import OperationResult
+from neuroglia.data.infrastructure.abstractions import Repository
+from neuroglia.eventing.cloud_events.infrastructure.cloud_event_bus import CloudEventBus
+from neuroglia.eventing.cloud_events.infrastructure.cloud_event_publisher import CloudEventPublishingOptions
+from neuroglia.mapping import Mapper
+from neuroglia.mediation import Command, CommandHandler, Mediator
+
+from application.commands.command_handler_base import CommandHandlerBase
+from application.services.term_embedding_pipeline import TermEmbeddingPipeline, TermEmbeddingRequest
+from domain.entities import KnowledgeNamespace
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class ReindexNamespaceEmbeddingsCommand(Command[OperationResult[dict[str, Any]]]):
+    """Command to (re-)embed all active terms of a namespace."""
+
+    namespace_id: str
+    """The namespace to reindex."""
+
+    force: bool = False
+    """Re-embed terms even when their content did not change."""
+
+    # Context
+    user_info: dict[str, Any] | None = None
+    """User information from authentication context."""
+
+
+class ReindexNamespaceEmbeddingsCommandHandler(CommandHandlerBase, CommandHandler[ReindexNamespaceEmbeddingsCommand, OperationResult[dict[str, Any]]]):
+    """Handler for ReindexNamespaceEmbeddingsCommand."""
+
+    def __init__(
+        self,
+        mediator: Mediator,
+        mapper: Mapper,
+        cloud_event_bus: CloudEventBus,
+        cloud_event_publishing_options: CloudEventPublishingOptions,
+        repository: Repository[KnowledgeNamespace, str],
+        pipeline: TermEmbeddingPipeline,
+    ):
+        super().__init__(mediator, mapper, cloud_event_bus, cloud_event_publishing_options)
+        self._repository = repository
+        self._pipeline = pipeline
+
+    async def handle_async(self, command: ReindexNamespaceEmbeddingsCommand) -> OperationResult[dict[str, Any]]:
+        """Handle the reindex command.
+
+        Args:
+            command: The command to handle
+
+        Returns:
+            OperationResult with embedded/skipped/failed counts
+        """
+        log.info(f"Reindexing embeddings for namespace: {command.namespace_id} (force={command.force})")
+
+        if not self._pipeline.enabled:
+            return self.bad_request("The embedding pipeline is disabled (EMBEDDING_PIPELINE_ENABLED=false)")
+
+        namespace = await self._repository.get_async(command.namespace_id)
+        if namespace is None:
+            return self.not_found(KnowledgeNamespace, command.namespace_id)
+
+        requests = [
+            TermEmbeddingRequest(
+                namespace_id=command.namespace_id,
+                term_id=term.id,
+                term=term.term,
+                definition=term.definition,
+                aliases=list(term.aliases),
+                context_hint=term.context_hint,
+            )
+            for term in namespace.get_active_terms()
+        ]
+        result = await self._pipeline.reindex_async(requests, force=command.force)
+
+        log.info(f"Reindexed namespace '{command.namespace_id}': {result}")
+        return self.ok({"namespace_id": command.namespace_id, "terms": len(requests), **asdict(result)})
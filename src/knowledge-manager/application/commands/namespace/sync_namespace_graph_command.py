@@ -0,0 +1,75 @@
+"""Sync namespace graph command with handler."""
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from neuroglia.core import OperationResult
+from neuroglia.data.infrastructure.abstractions import Repository
+from neuroglia.eventing.cloud_events.infrastructure.cloud_event_bus import CloudEventBus
+from neuroglia.eventing.cloud_events.infrastructure.cloud_event_publisher import CloudEventPublishingOptions
+from neuroglia.mapping import Mapper
+from neuroglia.mediation import Command, CommandHandler, Mediator
+
+from application.commands.command_handler_base import CommandHandlerBase
+from application.settings import app_settings
+from domain.entities import KnowledgeNamespace
+from infrastructure.clients import Neo4jClient
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class SyncNamespaceGraphCommand(Command[OperationResult[dict[str, Any]]]):
+    """Command to sync a namespace's terms and relationships to the knowledge graph."""
+
+    namespace_id: str
+    """The namespace to sync."""
+
+    # Context
+    user_info: dict[str, Any] | None = None
+    """User information from authentication context."""
+
+
+class SyncNamespaceGraphCommandHandler(CommandHandlerBase, CommandHandler[SyncNamespaceGraphCommand, OperationResult[dict[str, Any]]]):
+    """Handler for SyncNamespaceGraphCommand."""
+
+    def __init__(
+        self,
+        mediator: Mediator,
+        mapper: Mapper,
+        cloud_event_bus: CloudEventBus,
+        cloud_event_publishing_options: CloudEventPublishingOptions,
+        repository: Repository[KnowledgeNamespace, str],
+        graph_client: Neo4jClient,
+    ):
+        super().__init__(mediator, mapper, cloud_event_bus, cloud_event_publishing_options)
+        self._repository = repository
+        self._graph_client = graph_client
+
+    async def handle_async(self, command: SyncNamespaceGraphCommand) -> OperationResult[dict[str, Any]]:
+        """Handle the sync command.
+
+        Args:
+            command: The command to handle
+
+        Returns:
+            OperationResult with upserted/deleted/unchanged counts
+        """
+        log.info(f"Syncing namespace graph: {command.namespace_id}")
+
+        namespace = await self._repository.get_async(command.namespace_id)
+        if namespace is None:
+            return self.not_found(KnowledgeNamespace, command.namespace_id)
+
+        terms = [term.to_dict() for term in namespace.get_active_terms()]
+        relationships = [relationship for relationship in namespace.state.relationships.values() if relationship.get("is_active", True)]
+
+        await self._graph_client.ensure_connected()
+        summary = await self._graph_client.sync_namespace(
+            namespace_id=command.namespace_id,
+            terms=terms,
+            relationships=relationships,
+            chunk_size=app_settings.neo4j_batch_size,
+        )
+        return self.ok({"namespace_id": command.namespace_id, **summary})
@@ -0,0 +1 @@
+"""Event handlers for Knowledge Manager."""
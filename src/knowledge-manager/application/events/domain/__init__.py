@@ -0,0 +1,29 @@
+"""Domain event handlers package.
+
+Contains projection handlers that sync the read models with the aggregate state.
+These handlers are automatically discovered by the Mediator.
+"""
+
+from application.events.domain.term_embedding_handlers import (
+    KnowledgeNamespaceDeletedEmbeddingHandler,
+    KnowledgeTermAddedEmbeddingHandler,
+    KnowledgeTermRemovedEmbeddingHandler,
+    KnowledgeTermUpdatedEmbeddingHandler,
+)
+from application.events.domain.term_projection_handlers import (
+    KnowledgeNamespaceDeletedTermsProjectionHandler,
+    KnowledgeTermAddedProjectionHandler,
+    KnowledgeTermRemovedProjectionHandler,
+    KnowledgeTermUpdatedProjectionHandler,
+)
+
+__all__ = [
+    "KnowledgeTermAddedProjectionHandler",
+    "KnowledgeTermUpdatedProjectionHandler",
+    "KnowledgeTermRemovedProjectionHandler",
+    "KnowledgeNamespaceDeletedTermsProjectionHandler",
+    "KnowledgeTermAddedEmbeddingHandler",
+    "KnowledgeTermUpdatedEmbeddingHandler",
+    "KnowledgeTermRemovedEmbeddingHandler",
+    "KnowledgeNamespaceDeletedEmbeddingHandler",
+]
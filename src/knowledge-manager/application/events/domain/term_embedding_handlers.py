@@ -0,0 +1,99 @@
+"""Embedding ingestion handlers for KnowledgeTerm domain events.
+
+These handlers feed the TermEmbeddingPipeline, which batches the work and
+keeps the Qdrant term vectors in sync with the namespace aggregates.
+"""
+
+import logging
+
+from neuroglia.data.infrastructure.abstractions import Repository
+from neuroglia.mediation import DomainEventHandler
+
+from application.services.term_embedding_pipeline import TermEmbeddingPipeline, TermEmbeddingRequest
+from domain.entities import KnowledgeNamespace
+from domain.events import (
+    KnowledgeNamespaceDeletedDomainEvent,
+    KnowledgeTermAddedDomainEvent,
+    KnowledgeTermRemovedDomainEvent,
+    KnowledgeTermUpdatedDomainEvent,
+)
+
+log = logging.getLogger(__name__)
+
+
+class KnowledgeTermAddedEmbeddingHandler(DomainEventHandler[KnowledgeTermAddedDomainEvent]):
+    """Queues newly added terms for embedding."""
+
+    def __init__(self, pipeline: TermEmbeddingPipeline):
+        super().__init__()
+        self._pipeline = pipeline
+
+    async def handle_async(self, event: KnowledgeTermAddedDomainEvent) -> None:
+        """Handle term added event - queues the term for embedding."""
+        self._pipeline.enqueue_upsert(
+            TermEmbeddingRequest(
+                namespace_id=event.aggregate_id,
+                term_id=event.term_id,
+                term=event.term,
+                definition=event.definition,
+                aliases=list(event.aliases),
+                context_hint=event.context_hint,
+            )
+        )
+
+
+class KnowledgeTermUpdatedEmbeddingHandler(DomainEventHandler[KnowledgeTermUpdatedDomainEvent]):
+    """Queues updated terms for re-embedding.
+
+    The update event only carries changed fields, so the full term is read
+    from the (already persisted) namespace aggregate.
+    """
+
+    def __init__(self, pipeline: TermEmbeddingPipeline, repository: Repository[KnowledgeNamespace, str]):
+        super().__init__()
+        self._pipeline = pipeline
+        self._repository = repository
+
+    async def handle_async(self, event: KnowledgeTermUpdatedDomainEvent) -> None:
+        """Handle term updated event - queues the full term for re-embedding."""
+        namespace = await self._repository.get_async(event.aggregate_id)
+        term = namespace.get_term(event.term_id) if namespace else None
+        if term is None:
+            log.warning(f"Term {event.term_id} not found for embedding update")
+            return
+
+        self._pipeline.enqueue_upsert(
+            TermEmbeddingRequest(
+                namespace_id=event.aggregate_id,
+                term_id=term.id,
+                term=term.term,
+                definition=term.definition,
+                aliases=list(term.aliases),
+                context_hint=term.context_hint,
+            )
+        )
+
+
+class KnowledgeTermRemovedEmbeddingHandler(DomainEventHandler[KnowledgeTermRemovedDomainEvent]):
+    """Queues removed terms for embedding deletion."""
+
+    def __init__(self, pipeline: TermEmbeddingPipeline):
+        super().__init__()
+        self._pipeline = pipeline
+
+    async def handle_async(self, event: KnowledgeTermRemovedDomainEvent) -> None:
+        """Handle term removed event - queues the embedding for deletion."""
+        self._pipeline.enqueue_delete(event.term_id)
+
+
+class KnowledgeNamespaceDeletedEmbeddingHandler(DomainEventHandler[KnowledgeNamespaceDeletedDomainEvent]):
+    """Deletes all embeddings of a deleted namespace."""
+
+    def __init__(self, pipeline: TermEmbeddingPipeline):
+        super().__init__()
+        self._pipeline = pipeline
+
+    async def handle_async(self, event: KnowledgeNamespaceDeletedDomainEvent) -> None:
+        """Handle namespace deleted event - deletes the namespace's embeddings."""
+        if not await self._pipeline.delete_namespace_async(event.aggregate_id):
+            log.error(f"Failed to delete embeddings of namespace {event.aggregate_id}")
@@ -0,0 +1,134 @@
+"""Projection handlers for KnowledgeTerm domain events.
+
+These handlers project term events raised by the KnowledgeNamespace aggregate
+into the per-term read model (KnowledgeTermDto, one document per term).
+The MotorRepository publishes the aggregate's domain events through the
+Mediator after each successful persist.
+
+Following the tools-provider projection handler pattern:
+- DomainEventHandler[TEvent] base class
+- Idempotency checks before updates
+- Handles creation, updates, and soft deletes
+"""
+
+import logging
+
+from neuroglia.mediation import DomainEventHandler
+
+from domain.events import (
+    KnowledgeNamespaceDeletedDomainEvent,
+    KnowledgeTermAddedDomainEvent,
+    KnowledgeTermRemovedDomainEvent,
+    KnowledgeTermUpdatedDomainEvent,
+)
+from domain.repositories import KnowledgeTermDtoRepository
+from integration.models import KnowledgeTermDto
+
+log = logging.getLogger(__name__)
+
+
+class KnowledgeTermAddedProjectionHandler(DomainEventHandler[KnowledgeTermAddedDomainEvent]):
+    """Projects KnowledgeTermAddedDomainEvent to the term read model."""
+
+    def __init__(self, repository: KnowledgeTermDtoRepository):
+        super().__init__()
+        self._repository = repository
+
+    async def handle_async(self, event: KnowledgeTermAddedDomainEvent) -> None:
+        """Handle term added event - creates new KnowledgeTermDto."""
+        log.debug(f"Projecting KnowledgeTermAddedDomainEvent: {event.aggregate_id}/{event.term_id}")
+
+        # Idempotency check
+        existing = await self._repository.get_async(event.term_id)
+        if existing:
+            log.debug(f"Term {event.term_id} already exists, skipping projection")
+            return
+
+        dto = KnowledgeTermDto(
+            id=event.term_id,
+            namespace_id=event.aggregate_id,
+            term=event.term,
+            definition=event.definition,
+            aliases=list(event.aliases),
+            examples=list(event.examples),
+            context_hint=event.context_hint,
+            created_at=event.created_at,
+            updated_at=event.created_at,
+            is_active=True,
+        )
+        await self._repository.add_async(dto)
+        log.info(f"Projected new term: {event.term_id}")
+
+
+class KnowledgeTermUpdatedProjectionHandler(DomainEventHandler[KnowledgeTermUpdatedDomainEvent]):
+    """Projects KnowledgeTermUpdatedDomainEvent to the term read model."""
+
+    def __init__(self, repository: KnowledgeTermDtoRepository):
+        super().__init__()
+        self._repository = repository
+
+    async def handle_async(self, event: KnowledgeTermUpdatedDomainEvent) -> None:
+        """Handle term updated event - applies partial updates."""
+        log.debug(f"Projecting KnowledgeTermUpdatedDomainEvent: {event.aggregate_id}/{event.term_id}")
+
+        existing = await self._repository.get_async(event.term_id)
+        if not existing:
+            log.warning(f"Term {event.term_id} not found for update projection")
+            return
+
+        if event.term is not None:
+            existing.term = event.term
+        if event.definition is not None:
+            existing.definition = event.definition
+        if event.aliases is not None:
+            existing.aliases = list(event.aliases)
+        if event.examples is not None:
+            existing.examples = list(event.examples)
+        if event.context_hint is not None:
+            existing.context_hint = event.context_hint
+        existing.updated_at = event.updated_at
+
+        await self._repository.update_async(existing)
+        log.info(f"Projected term update: {event.term_id}")
+
+
+class KnowledgeTermRemovedProjectionHandler(DomainEventHandler[KnowledgeTermRemovedDomainEvent]):
+    """Projects KnowledgeTermRemovedDomainEvent to the term read model."""
+
+    def __init__(self, repository: KnowledgeTermDtoRepository):
+        super().__init__()
+        self._repository = repository
+
+    async def handle_async(self, event: KnowledgeTermRemovedDomainEvent) -> None:
+        """Handle term removed event - soft deletes the term."""
+        log.debug(f"Projecting KnowledgeTermRemovedDomainEvent: {event.aggregate_id}/{event.term_id}")
+
+        existing = await self._repository.get_async(event.term_id)
+        if not existing:
+            log.warning(f"Term {event.term_id} not found for removal projection")
+            return
+
+        if not existing.is_active:
+            log.debug(f"Term {event.term_id} already inactive, skipping projection")
+            return
+
+        existing.is_active = False
+        existing.updated_at = event.removed_at
+
+        await self._repository.update_async(existing)
+        log.info(f"Projected term removal: {event.term_id}")
+
+
+class KnowledgeNamespaceDeletedTermsProjectionHandler(DomainEventHandler[KnowledgeNamespaceDeletedDomainEvent]):
+    """Deactivates all projected terms when their namespace is deleted."""
+
+    def __init__(self, repository: KnowledgeTermDtoRepository):
+        super().__init__()
+        self._repository = repository
+
+    async def handle_async(self, event: KnowledgeNamespaceDeletedDomainEvent) -> None:
+        """Handle namespace deleted event - soft deletes all its terms."""
+        log.debug(f"Projecting KnowledgeNamespaceDeletedDomainEvent to terms: {event.aggregate_id}")
+
+        count = await self._repository.deactivate_by_namespace_async(event.aggregate_id, event.deleted_at)
+        log.info(f"Deactivated {count} terms of deleted namespace: {event.aggregate_id}")
@@ -1,6 +1,7 @@
 """Get terms query with handler.
 
-Uses the aggregate repository directly.
+Uses the per-term read model so that search, filtering and pagination
+run in the database instead of loading the whole namespace aggregate.
 """
 
 import logging
@@ -8,24 +9,24 @@ from dataclasses import dataclass
 from typing import Any
 
 from neuroglia.core import OperationResult
-from neuroglia.data.infrastructure.abstractions import Repository
 from neuroglia.mediation import Query, QueryHandler
 
 from domain.entities import KnowledgeNamespace
-from integration.models import KnowledgeTermDto
+from domain.repositories import KnowledgeNamespaceRepository, KnowledgeTermDtoRepository
+from integration.models import KnowledgeTermPageDto
 
 log = logging.getLogger(__name__)
 
 
 @dataclass
-class GetTermsQuery(Query[OperationResult[list[KnowledgeTermDto]]]):
-    """Query to get all terms in a namespace."""
+class GetTermsQuery(Query[OperationResult[KnowledgeTermPageDto]]):
+    """Query to get a page of terms in a namespace."""
 
     namespace_id: str
     """The namespace to get terms from."""
 
     search: str | None = None
-    """Optional search filter."""
+    """Optional full-text search over term, aliases and definition."""
 
     limit: int = 100
     """Maximum number of results."""
@@ -33,62 +34,52 @@ class GetTermsQuery(Query[OperationResult[list[KnowledgeTermDto]]]):
     offset: int = 0
     """Number of results to skip."""
 
+    include_inactive: bool = False
+    """Whether to include removed terms."""
+
     # Context
     user_info: dict[str, Any] | None = None
     """User information from authentication context."""
 
 
-class GetTermsQueryHandler(QueryHandler[GetTermsQuery, OperationResult[list[KnowledgeTermDto]]]):
+class GetTermsQueryHandler(QueryHandler[GetTermsQuery, OperationResult[KnowledgeTermPageDto]]):
     """Handler for GetTermsQuery."""
 
     def __init__(
         self,
-        repository: Repository[KnowledgeNamespace, str],
+        namespace_repository: KnowledgeNamespaceRepository,
+        term_repository: KnowledgeTermDtoRepository,
     ):
-        self._repository = repository
+        self._namespace_repository = namespace_repository
+        self._term_repository = term_repository
 
-    async def handle_async(self, query: GetTermsQuery) -> OperationResult[list[KnowledgeTermDto]]:
+    async def handle_async(self, query: GetTermsQuery) -> OperationResult[KnowledgeTermPageDto]:
         """Handle the get terms query.
 
         Args:
             query: The query to handle
 
         Returns:
-            OperationResult containing list of term DTOs
+            OperationResult containing a page of term DTOs and the total match count
         """
         log.debug(f"Getting terms from namespace: {query.namespace_id}")
 
-        # Load the namespace
-        namespace = await self._repository.get_async(query.namespace_id)
-        if namespace is None:
+        if not await self._namespace_repository.contains_async(query.namespace_id):
             return self.not_found(KnowledgeNamespace, query.namespace_id)
 
-        # Get active terms
-        terms = namespace.get_active_terms()
-
-        # Apply search filter if provided
-        if query.search:
-            search_lower = query.search.lower()
-            terms = [t for t in terms if t.matches(search_lower)]
-
-        # Apply pagination
-        paginated_terms = terms[query.offset : query.offset + query.limit]
-
-        # Map to DTOs
-        dtos = [
-            KnowledgeTermDto(
-                id=term.id,
-                namespace_id=query.namespace_id,
-                term=term.term,
-                definition=term.definition,
-                aliases=list(term.aliases),
-                examples=list(term.examples),
-                context_hint=term.context_hint,
-                created_at=term.created_at,
-                updated_at=term.updated_at,
-                is_active=term.is_active,
+        terms, total = await self._term_repository.search_async(
+            namespace_id=query.namespace_id,
+            search=query.search,
+            limit=query.limit,
+            offset=query.offset,
+            include_inactive=query.include_inactive,
+        )
+
+        return self.ok(
+            KnowledgeTermPageDto(
+                items=terms,
+                total=total,
+                limit=query.limit,
+                offset=query.offset,
             )
-            for term in paginated_terms
-        ]
-
-        return self.ok(dtos)
+        )
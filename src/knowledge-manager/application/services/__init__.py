@@ -1,7 +1,14 @@
 """Application services for Knowledge Manager."""
 
 from application.services.logging_config import configure_logging
+from application.services.term_embedding_pipeline import EmbeddingIngestionResult, TermEmbeddingPipeline, TermEmbeddingRequest
+from application.services.term_read_model_backfill import TermReadModelBackfill, namespace_term_dtos
 
 __all__ = [
     "configure_logging",
+    "EmbeddingIngestionResult",
+    "TermEmbeddingPipeline",
+    "TermEmbeddingRequest",
+    "TermReadModelBackfill",
+    "namespace_term_dtos",
 ]
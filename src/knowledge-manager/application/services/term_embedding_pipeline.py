@@ -0,0 +1,429 @@
+"""Batched embedding ingestion pipeline for knowledge terms.
+
+Term domain events enqueue work items; a background worker drains the
+queue in batches, computes embeddings through the configured
+EmbeddingProvider and upserts them into Qdrant.
+
+- Coalescing: several changes to the same term before a flush produce one embedding
+- Deduplication: a content hash (model + embedded text) is stored in the
+  point payload; terms whose hash did not change are not re-embedded
+- Retry: failed upserts/deletes are retried with exponential backoff
+
+Implemented as a HostedService for proper lifecycle management.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from neuroglia.hosting.abstractions import HostedService
+
+from infrastructure.clients import QdrantVectorClient
+from infrastructure.embeddings import EmbeddingProvider, create_embedding_provider
+from observability.metrics import track_embedding_operation
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class TermEmbeddingRequest:
+    """A term to (re-)embed."""
+
+    namespace_id: str
+    term_id: str
+    term: str
+    definition: str
+    aliases: list[str] = field(default_factory=list)
+    context_hint: str | None = None
+
+    def to_text(self) -> str:
+        """Build the text that is embedded for this term."""
+        parts = [self.term]
+        if self.aliases:
+            parts.append(f"Also known as: {', '.join(self.aliases)}")
+        parts.append(self.definition)
+        if self.context_hint:
+            parts.append(self.context_hint)
+        return "\n".join(parts)
+
+    def content_hash(self, model_name: str) -> str:
+        """Hash of the embedded text and model, used to skip unchanged terms."""
+        return hashlib.sha256(f"{model_name}\n{self.to_text()}".encode()).hexdigest()
+
+
+@dataclass
+class EmbeddingIngestionResult:
+    """Outcome of an ingestion run."""
+
+    embedded: int = 0
+    """Terms embedded and upserted."""
+
+    skipped: int = 0
+    """Terms skipped because their content hash did not change."""
+
+    deleted: int = 0
+    """Embeddings deleted."""
+
+    failed: int = 0
+    """Terms that could not be embedded, upserted or deleted after retries."""
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class TermEmbeddingPipeline(HostedService):
+    """Event-driven, batched term embedding ingestion into Qdrant.
+
+    Implements HostedService for automatic lifecycle management:
+    - start_async(): connects to Qdrant, ensures the collection, starts the worker
+    - stop_async(): flushes pending work and closes the connection
+    """
+
+    MAX_CACHED_HASHES = 50_000
+
+    def __init__(
+        self,
+        vector_client: QdrantVectorClient,
+        embedding_provider: EmbeddingProvider | None,
+        collection_name: str,
+        batch_size: int = 32,
+        flush_interval_seconds: float = 2.0,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+        deduplicate: bool = True,
+        enabled: bool = True,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            vector_client: Qdrant client
+            embedding_provider: Embedding backend (may be None when disabled)
+            collection_name: Qdrant collection for term vectors
+            batch_size: Maximum number of terms per embedding/upsert call
+            flush_interval_seconds: Maximum delay before queued work is flushed
+            max_retries: Retries for failed Qdrant operations
+            retry_backoff_seconds: Base delay for exponential backoff
+            deduplicate: Skip terms whose content hash did not change
+            enabled: When False, enqueued work is ignored
+
+        Raises:
+            ValueError: If enabled without an embedding provider
+        """
+        if enabled and embedding_provider is None:
+            raise ValueError("An enabled TermEmbeddingPipeline requires an embedding provider")
+        self._vector_client = vector_client
+        self._embedding_provider = embedding_provider
+        self._collection_name = collection_name
+        self._batch_size = max(1, batch_size)
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._deduplicate = deduplicate
+        self._enabled = enabled
+
+        self._pending_upserts: dict[str, TermEmbeddingRequest] = {}
+        self._pending_deletes: set[str] = set()
+        self._known_hashes: OrderedDict[str, str] = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._worker_task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether term embeddings are computed and stored."""
+        return self._enabled
+
+    @property
+    def pending_count(self) -> int:
+        """Number of queued upserts and deletes."""
+        return len(self._pending_upserts) + len(self._pending_deletes)
+
+    # =========================================================================
+    # HostedService Lifecycle Methods
+    # =========================================================================
+
+    async def start_async(self) -> None:
+        """Connect to Qdrant and start the background worker.
+
+        Connection failures are logged but don't prevent application startup;
+        the worker keeps retrying on each flush.
+        """
+        if not self._enabled:
+            log.info("TermEmbeddingPipeline disabled")
+            return
+
+        try:
+            await self._vector_client.connect()
+            await self._vector_client.ensure_collection(self._collection_name)
+            log.info("✅ TermEmbeddingPipeline started")
+        except Exception as e:
+            log.warning(f"⚠️ TermEmbeddingPipeline failed to connect to Qdrant: {e}")
+
+        self._worker_task = asyncio.create_task(self._run())
+
+    async def stop_async(self) -> None:
+        """Flush pending work and stop the background worker."""
+        if self._worker_task:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+
+        try:
+            if self.pending_count:
+                await self.flush_async()
+            await self._vector_client.close()
+            log.info("✅ TermEmbeddingPipeline stopped")
+        except Exception as e:
+            log.warning(f"⚠️ TermEmbeddingPipeline shutdown error: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval_seconds)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            if not self.pending_count:
+                continue
+            try:
+                await self.flush_async()
+            except Exception as e:
+                log.error(f"Term embedding flush failed: {e}")
+
+    # =========================================================================
+    # Queueing
+    # =========================================================================
+
+    def enqueue_upsert(self, request: TermEmbeddingRequest) -> None:
+        """Queue a term for embedding.
+
+        Args:
+            request: The term to embed
+        """
+        if not self._enabled:
+            return
+        self._pending_deletes.discard(request.term_id)
+        self._pending_upserts[request.term_id] = request
+        if len(self._pending_upserts) >= self._batch_size:
+            self._wakeup.set()
+
+    def enqueue_delete(self, term_id: str) -> None:
+        """Queue a term embedding for deletion.
+
+        Args:
+            term_id: The term whose embedding to delete
+        """
+        if not self._enabled:
+            return
+        self._pending_upserts.pop(term_id, None)
+        self._pending_deletes.add(term_id)
+        if len(self._pending_deletes) >= self._batch_size:
+            self._wakeup.set()
+
+    # =========================================================================
+    # Processing
+    # =========================================================================
+
+    async def flush_async(self) -> EmbeddingIngestionResult:
+        """Process all queued work now.
+
+        Returns:
+            The ingestion result
+        """
+        async with self._flush_lock:
+            upserts = list(self._pending_upserts.values())
+            deletes = list(self._pending_deletes)
+            self._pending_upserts.clear()
+            self._pending_deletes.clear()
+
+            result = EmbeddingIngestionResult()
+            if deletes:
+                await self._delete(deletes, result)
+            if upserts:
+                await self._ingest(upserts, result, force=False)
+            return result
+
+    async def reindex_async(self, requests: list[TermEmbeddingRequest], force: bool = False) -> EmbeddingIngestionResult:
+        """Embed a set of terms immediately (bulk re-index).
+
+        Args:
+            requests: Terms to embed
+            force: Re-embed even when the content hash did not change
+
+        Returns:
+            The ingestion result
+        """
+        if not self._enabled:
+            return EmbeddingIngestionResult()
+        async with self._flush_lock:
+            for request in requests:
+                self._pending_upserts.pop(request.term_id, None)
+            result = EmbeddingIngestionResult()
+            await self._ingest(requests, result, force=force)
+            return result
+
+    async def delete_namespace_async(self, namespace_id: str) -> bool:
+        """Delete all embeddings of a namespace.
+
+        Args:
+            namespace_id: The namespace
+
+        Returns:
+            True if successful
+        """
+        if not self._enabled:
+            return True
+        async with self._flush_lock:
+            for term_id in [t for t, r in self._pending_upserts.items() if r.namespace_id == namespace_id]:
+                del self._pending_upserts[term_id]
+            # Term ids of the namespace are unknown here; drop the whole hash cache
+            self._known_hashes.clear()
+            success = await self._with_retry(lambda: self._vector_client.delete_namespace_embeddings(self._collection_name, namespace_id))
+            track_embedding_operation("delete_namespace", "success" if success else "failure")
+            return success
+
+    async def _ingest(self, requests: list[TermEmbeddingRequest], result: EmbeddingIngestionResult, force: bool) -> None:
+        model_name = self._embedding_provider.model_name
+        hashes = {request.term_id: request.content_hash(model_name) for request in requests}
+
+        if self._deduplicate and not force:
+            stored = await self._get_stored_hashes(list(hashes))
+            changed = [request for request in requests if stored.get(request.term_id) != hashes[request.term_id]]
+            skipped = len(requests) - len(changed)
+            if skipped:
+                result.skipped += skipped
+                track_embedding_operation("embed", "skipped", skipped)
+            requests = changed
+
+        for chunk in _chunks(requests, self._batch_size):
+            try:
+                vectors = await self._embedding_provider.embed_async([request.to_text() for request in chunk])
+            except Exception as e:
+                log.error(f"Failed to compute {len(chunk)} embeddings: {e}")
+                result.failed += len(chunk)
+                track_embedding_operation("embed", "failure", len(chunk))
+                continue
+
+            points = [
+                {
+                    "term_id": request.term_id,
+                    "namespace_id": request.namespace_id,
+                    "embedding": vector,
+                    "metadata": {
+                        "term": request.term,
+                        "content_hash": hashes[request.term_id],
+                        "embedding_model": model_name,
+                    },
+                }
+                for request, vector in zip(chunk, vectors, strict=True)
+            ]
+            if await self._with_retry(lambda: self._vector_client.upsert_term_embeddings(self._collection_name, points)):
+                for request in chunk:
+                    self._remember_hash(request.term_id, hashes[request.term_id])
+                result.embedded += len(chunk)
+                track_embedding_operation("embed", "success", len(chunk))
+            else:
+                result.failed += len(chunk)
+                track_embedding_operation("embed", "failure", len(chunk))
+
+    async def _delete(self, term_ids: list[str], result: EmbeddingIngestionResult) -> None:
+        for chunk in _chunks(term_ids, self._batch_size):
+            if await self._with_retry(lambda: self._vector_client.delete_term_embeddings(self._collection_name, chunk)):
+                for term_id in chunk:
+                    self._known_hashes.pop(term_id, None)
+                result.deleted += len(chunk)
+                track_embedding_operation("delete", "success", len(chunk))
+            else:
+                result.failed += len(chunk)
+                track_embedding_operation("delete", "failure", len(chunk))
+
+    async def _get_stored_hashes(self, term_ids: list[str]) -> dict[str, str]:
+        stored = {term_id: self._known_hashes[term_id] for term_id in term_ids if term_id in self._known_hashes}
+        missing = [term_id for term_id in term_ids if term_id not in stored]
+        if missing:
+            try:
+                fetched = await self._vector_client.get_payload_values(self._collection_name, missing, "content_hash")
+            except Exception as e:
+                log.warning(f"Could not fetch stored content hashes: {e}")
+                fetched = {}
+            for term_id, content_hash in fetched.items():
+                self._remember_hash(term_id, content_hash)
+            stored.update(fetched)
+        return stored
+
+    def _remember_hash(self, term_id: str, content_hash: str) -> None:
+        self._known_hashes[term_id] = content_hash
+        self._known_hashes.move_to_end(term_id)
+        while len(self._known_hashes) > self.MAX_CACHED_HASHES:
+            self._known_hashes.popitem(last=False)
+
+    async def _with_retry(self, operation: Callable[[], Awaitable[bool]]) -> bool:
+        for attempt in range(self._max_retries + 1):
+            try:
+                if await operation():
+                    return True
+            except Exception as e:
+                log.warning(f"Vector store operation failed (attempt {attempt + 1}): {e}")
+            if attempt < self._max_retries:
+                await asyncio.sleep(self._retry_backoff_seconds * (2**attempt))
+        return False
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Configure and register the term embedding pipeline.
+
+        Registers the pipeline as both a singleton (for DI injection into the
+        event handlers and commands) and a HostedService (for lifecycle management).
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from application.settings import app_settings
+
+        log.info("🔧 Configuring TermEmbeddingPipeline...")
+
+        pipeline = TermEmbeddingPipeline(
+            vector_client=QdrantVectorClient(
+                url=f"http://{app_settings.qdrant_host}:{app_settings.qdrant_port}",
+                api_key=app_settings.qdrant_api_key,
+                embedding_dimension=app_settings.qdrant_vector_size,
+            ),
+            embedding_provider=create_embedding_provider(
+                provider=app_settings.embedding_provider,
+                model_name=app_settings.embedding_model,
+                dimension=app_settings.qdrant_vector_size,
+            )
+            if app_settings.embedding_pipeline_enabled
+            else None,
+            collection_name=app_settings.qdrant_collection_name,
+            batch_size=app_settings.embedding_batch_size,
+            flush_interval_seconds=app_settings.embedding_flush_interval_seconds,
+            max_retries=app_settings.embedding_max_retries,
+            retry_backoff_seconds=app_settings.embedding_retry_backoff_seconds,
+            deduplicate=app_settings.embedding_cache_enabled,
+            enabled=app_settings.embedding_pipeline_enabled,
+        )
+        builder.services.add_singleton(TermEmbeddingPipeline, singleton=pipeline)
+        builder.services.add_singleton(HostedService, singleton=pipeline)
+        log.info(f"✅ TermEmbeddingPipeline configured (enabled={app_settings.embedding_pipeline_enabled})")
+        return builder
@@ -0,0 +1,150 @@
+"""Backfill of the per-term read model from existing namespaces.
+
+The terms collection is maintained by the KnowledgeTerm* projection handlers,
+so terms added before the read model existed (or while a projection failed)
+are missing from it. At startup, this service walks the namespaces and inserts
+every term of their state that has no read model document yet.
+
+Existing documents are never overwritten, so the backfill is idempotent and
+safe to run on every start and on several replicas at once.
+
+Implemented as a HostedService for proper lifecycle management.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from neuroglia.dependency_injection import ServiceProviderBase
+from neuroglia.hosting.abstractions import HostedService
+
+from domain.entities import KnowledgeNamespace
+from domain.repositories import KnowledgeNamespaceRepository, KnowledgeTermDtoRepository
+from integration.models import KnowledgeTermDto
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+log = logging.getLogger(__name__)
+
+
+def _as_datetime(value: datetime | str | None) -> datetime | None:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def namespace_term_dtos(namespace: KnowledgeNamespace) -> list[KnowledgeTermDto]:
+    """Build the read model documents of the terms held in a namespace's state.
+
+    Terms of a deleted namespace are already inactive in its state.
+
+    Args:
+        namespace: The namespace aggregate
+
+    Returns:
+        One KnowledgeTermDto per term, active or not
+    """
+    return [
+        KnowledgeTermDto(
+            id=term_id,
+            namespace_id=namespace.id(),
+            term=term.get("term", ""),
+            definition=term.get("definition", ""),
+            aliases=list(term.get("aliases") or []),
+            examples=list(term.get("examples") or []),
+            context_hint=term.get("context_hint"),
+            created_at=_as_datetime(term.get("created_at")),
+            updated_at=_as_datetime(term.get("updated_at")),
+            is_active=term.get("is_active", True),
+        )
+        for term_id, term in namespace.state.terms.items()
+    ]
+
+
+class TermReadModelBackfill(HostedService):
+    """Inserts the terms missing from the per-term read model at startup.
+
+    Implements HostedService for automatic lifecycle management:
+    - start_async(): starts the backfill in the background (startup is not delayed)
+    - stop_async(): cancels a backfill still running
+    """
+
+    def __init__(self, service_provider: ServiceProviderBase, enabled: bool = True):
+        """Initialize the backfill.
+
+        Args:
+            service_provider: The root service provider for creating scopes
+            enabled: When False, start_async does nothing
+        """
+        self._service_provider = service_provider
+        self._enabled = enabled
+        self._task: asyncio.Task | None = None
+
+    # =========================================================================
+    # HostedService Lifecycle Methods
+    # =========================================================================
+
+    async def start_async(self) -> None:
+        """Start the backfill in the background."""
+        if not self._enabled:
+            log.info("TermReadModelBackfill disabled")
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop_async(self) -> None:
+        """Cancel the backfill if it is still running."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def backfill_async(self) -> int:
+        """Insert the terms of all namespaces that are missing from the read model.
+
+        Returns:
+            Number of terms inserted
+        """
+        inserted = 0
+        async with self._service_provider.create_async_scope() as scope:
+            namespace_repository = scope.get_required_service(KnowledgeNamespaceRepository)
+            term_repository = scope.get_required_service(KnowledgeTermDtoRepository)
+            for namespace in await namespace_repository.get_all_async():
+                inserted += await term_repository.add_missing_async(namespace_term_dtos(namespace))
+        return inserted
+
+    async def _run(self) -> None:
+        try:
+            inserted = await self.backfill_async()
+            log.info(f"✅ Term read model backfill done ({inserted} terms inserted)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.warning(f"⚠️ Term read model backfill failed: {e}")
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Register the term read model backfill as a HostedService.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from application.settings import app_settings
+
+        def create_backfill(sp: ServiceProviderBase) -> TermReadModelBackfill:
+            return TermReadModelBackfill(service_provider=sp, enabled=app_settings.term_read_model_backfill_enabled)
+
+        builder.services.add_singleton(HostedService, implementation_factory=create_backfill)
+        log.info(f"✅ TermReadModelBackfill configured (enabled={app_settings.term_read_model_backfill_enabled})")
+        return builder
@@ -120,6 +120,11 @@ class Settings(ApplicationSettings):
     expected_audience: list[str] = ["knowledge-manager"]  # Expected audience(s)
     refresh_auto_leeway_seconds: int = 60
 
+    # ==========================================================================
+    # Read Models
+    # ==========================================================================
+    term_read_model_backfill_enabled: bool = True  # Insert terms missing from the terms collection at startup
+
     # ==========================================================================
     # Neo4j Configuration (Graph Database - Phase 2)
     # ==========================================================================
@@ -129,6 +134,7 @@ class Settings(ApplicationSettings):
     neo4j_database: str = "neo4j"
     neo4j_max_connection_pool_size: int = 50
     neo4j_connection_timeout: float = 30.0
+    neo4j_batch_size: int = 500  # Rows per UNWIND statement in bulk graph writes
 
     # ==========================================================================
     # Qdrant Configuration (Vector Database - Phase 3)
@@ -143,9 +149,14 @@ class Settings(ApplicationSettings):
     # ==========================================================================
     # Embedding Configuration (Phase 3)
     # ==========================================================================
+    embedding_pipeline_enabled: bool = False  # Embed terms on add/update/remove events
+    embedding_provider: str = "sentence-transformers"  # "sentence-transformers" or "hashing" (deterministic stub, tests/dev only)
     embedding_model: str = "all-MiniLM-L6-v2"  # Sentence-transformers model
-    embedding_batch_size: int = 32
-    embedding_cache_enabled: bool = True
+    embedding_batch_size: int = 32  # Terms per embedding + Qdrant upsert call
+    embedding_cache_enabled: bool = True  # Skip terms whose content hash did not change
+    embedding_flush_interval_seconds: float = 2.0  # Max delay before queued terms are embedded
+    embedding_max_retries: int = 3  # Retries for failed Qdrant upserts/deletes
+    embedding_retry_backoff_seconds: float = 0.5  # Base delay for exponential backoff
 
     # ==========================================================================
     # Agent-Host Integration
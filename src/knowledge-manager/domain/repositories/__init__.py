@@ -5,9 +5,11 @@ from domain.repositories.namespace_repositories import (
     KnowledgeNamespaceRepository,
     KnowledgeVectorRepository,
 )
+from domain.repositories.term_dto_repository import KnowledgeTermDtoRepository
 
 __all__ = [
     "KnowledgeNamespaceRepository",
+    "KnowledgeTermDtoRepository",
     "KnowledgeGraphRepository",
     "KnowledgeVectorRepository",
 ]
@@ -0,0 +1,80 @@
+"""Repository interface for the KnowledgeTermDto read model.
+
+Terms are projected into their own collection (one document per term) from
+the KnowledgeTerm* domain events, so that search, filtering and pagination
+can run in the database instead of loading the whole namespace aggregate.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from neuroglia.data.infrastructure.abstractions import Repository
+
+if TYPE_CHECKING:
+    from integration.models import KnowledgeTermDto
+
+
+class KnowledgeTermDtoRepository(Repository["KnowledgeTermDto", str], ABC):
+    """Repository interface for the per-term read model.
+
+    Implementations use MongoDB via MotorRepository.
+    Standard CRUD operations are inherited from the base Repository interface.
+    """
+
+    @abstractmethod
+    async def search_async(
+        self,
+        namespace_id: str,
+        search: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        include_inactive: bool = False,
+    ) -> tuple[list["KnowledgeTermDto"], int]:
+        """Search and paginate terms of a namespace.
+
+        Without a search string, terms are returned ordered by term name.
+        With a search string, a full-text search over term, aliases and
+        definition is performed and results are ranked by relevance.
+
+        Args:
+            namespace_id: The namespace to search in
+            search: Optional full-text search string
+            limit: Maximum number of results
+            offset: Number of results to skip
+            include_inactive: Whether to include removed terms
+
+        Returns:
+            Tuple of (page of terms, total number of matching terms)
+        """
+        ...
+
+    @abstractmethod
+    async def deactivate_by_namespace_async(self, namespace_id: str, deactivated_at: datetime) -> int:
+        """Mark all terms of a namespace as inactive.
+
+        Called when a namespace is deleted.
+
+        Args:
+            namespace_id: The namespace whose terms to deactivate
+            deactivated_at: When the terms were deactivated
+
+        Returns:
+            Number of terms updated
+        """
+        ...
+
+    @abstractmethod
+    async def add_missing_async(self, terms: list["KnowledgeTermDto"]) -> int:
+        """Insert the terms that are not in the read model yet.
+
+        Existing documents are left untouched, so the call is idempotent and
+        never overwrites a document maintained by the projection handlers.
+
+        Args:
+            terms: The terms to insert when missing
+
+        Returns:
+            Number of terms inserted
+        """
+        ...
@@ -1,12 +1,36 @@
 """Neo4j graph database client for semantic relationships (Phase 2 scaffold)."""
 
+import hashlib
+import json
 import logging
+import re
+from collections import defaultdict
 from typing import Any
 
-from neo4j import AsyncDriver, AsyncGraphDatabase
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncManagedTransaction
 
 log = logging.getLogger(__name__)
 
+_RELATIONSHIP_TYPE_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_REVERSE_SUFFIX = ":reverse"
+
+
+def _sync_hash(properties: dict[str, Any]) -> str:
+    """Stable hash of node/relationship properties used to detect changes."""
+    return hashlib.sha256(json.dumps(properties, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _relationship_label(relationship_type: str) -> str:
+    """Validate and normalize a relationship type for use as a Cypher label."""
+    label = relationship_type.upper()
+    if not _RELATIONSHIP_TYPE_PATTERN.fullmatch(label):
+        raise ValueError(f"Invalid relationship type: {relationship_type!r}")
+    return label
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
 
 class Neo4jClient:
     """Neo4j client for knowledge graph operations.
@@ -50,6 +74,17 @@ class Neo4jClient:
         await self._driver.verify_connectivity()
         log.info("Neo4j connection established")
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the driver has been created."""
+        return self._driver is not None
+
+    async def ensure_connected(self) -> None:
+        """Connect and create the graph constraints on first use."""
+        if self._driver is None:
+            await self.connect()
+            await self.ensure_constraints()
+
     async def close(self) -> None:
         """Close Neo4j connection."""
         if self._driver:
@@ -258,3 +293,318 @@ class Neo4jClient:
                     "edges": [dict(e) for e in record["edges"] if e],
                 }
             return {"nodes": [], "edges": []}
+
+    # =========================================================================
+    # Batch Operations (UNWIND, single write transaction)
+    # =========================================================================
+
+    async def ensure_constraints(self) -> None:
+        """Create the uniqueness constraint and indexes that MERGE relies on."""
+        if not self._driver:
+            raise RuntimeError("Neo4j not connected")
+
+        statements = [
+            "CREATE CONSTRAINT term_id_unique IF NOT EXISTS FOR (t:Term) REQUIRE t.id IS UNIQUE",
+            "CREATE INDEX term_namespace_id IF NOT EXISTS FOR (t:Term) ON (t.namespace_id)",
+        ]
+        async with self._driver.session(database=self._database) as session:
+            for statement in statements:
+                await session.run(statement)
+
+    async def upsert_term_nodes(
+        self,
+        namespace_id: str,
+        terms: list[dict[str, Any]],
+        chunk_size: int = 500,
+    ) -> int:
+        """Create or update many term nodes in one write transaction.
+
+        Each term is a dictionary with ``id``, ``term``, ``definition`` and
+        optional extra properties. Nodes are matched by id (idempotent MERGE).
+
+        Args:
+            namespace_id: Parent namespace
+            terms: Terms to upsert
+            chunk_size: Maximum rows per UNWIND statement
+
+        Returns:
+            Number of nodes written
+        """
+        if not self._driver:
+            raise RuntimeError("Neo4j not connected")
+        if not terms:
+            return 0
+
+        rows = [self._term_row(namespace_id, term) for term in terms]
+        async with self._driver.session(database=self._database) as session:
+            await session.execute_write(self._write_term_nodes, rows, chunk_size)
+        return len(rows)
+
+    async def upsert_relationships(
+        self,
+        namespace_id: str,
+        relationships: list[dict[str, Any]],
+        chunk_size: int = 500,
+    ) -> int:
+        """Create or update many relationships in one write transaction.
+
+        Each relationship is a dictionary with ``id``, ``source_term_id``,
+        ``target_term_id``, ``relationship_type`` and optional ``weight``,
+        ``bidirectional`` and ``description``. Relationships are matched by id
+        (idempotent MERGE); bidirectional ones also get a reverse edge.
+
+        Args:
+            namespace_id: Parent namespace
+            relationships: Relationships to upsert
+            chunk_size: Maximum rows per UNWIND statement
+
+        Returns:
+            Number of edges written (reverse edges included)
+        """
+        if not self._driver:
+            raise RuntimeError("Neo4j not connected")
+        if not relationships:
+            return 0
+
+        rows_by_label = self._relationship_rows_by_label(namespace_id, relationships)
+        async with self._driver.session(database=self._database) as session:
+            await session.execute_write(self._write_relationships, rows_by_label, chunk_size)
+        return sum(len(rows) for rows in rows_by_label.values())
+
+    async def delete_term_nodes(self, term_ids: list[str], chunk_size: int = 500) -> int:
+        """Delete many term nodes (and their relationships) in one write transaction.
+
+        Args:
+            term_ids: Term identifiers
+            chunk_size: Maximum ids per UNWIND statement
+
+        Returns:
+            Number of ids processed
+        """
+        if not self._driver:
+            raise RuntimeError("Neo4j not connected")
+        if not term_ids:
+            return 0
+
+        async with self._driver.session(database=self._database) as session:
+            await session.execute_write(self._delete_term_nodes, term_ids, chunk_size)
+        return len(term_ids)
+
+    async def delete_relationships(self, namespace_id: str, relationship_ids: list[str], chunk_size: int = 500) -> int:
+        """Delete many relationships (and their reverse edges) in one write transaction.
+
+        Args:
+            namespace_id: Parent namespace
+            relationship_ids: Relationship identifiers
+            chunk_size: Maximum ids per UNWIND statement
+
+        Returns:
+            Number of ids processed
+        """
+        if not self._driver:
+            raise RuntimeError("Neo4j not connected")
+        if not relationship_ids:
+            return 0
+
+        async with self._driver.session(database=self._database) as session:
+            await session.execute_write(self._delete_relationships, namespace_id, relationship_ids, chunk_size)
+        return len(relationship_ids)
+
+    # =========================================================================
+    # Transaction Functions (UNWIND batches, shared by the bulk writes and sync)
+    # =========================================================================
+
+    @staticmethod
+    async def _write_term_nodes(tx: AsyncManagedTransaction, rows: list[dict[str, Any]], chunk_size: int) -> None:
+        query = """
+        UNWIND $rows AS row
+        MERGE (t:Term {id: row.id})
+        SET t += row.properties
+        """
+        for chunk in _chunks(rows, chunk_size):
+            result = await tx.run(query, rows=chunk)
+            await result.consume()
+
+    @staticmethod
+    async def _write_relationships(tx: AsyncManagedTransaction, rows_by_label: dict[str, list[dict[str, Any]]], chunk_size: int) -> None:
+        for label, rows in rows_by_label.items():
+            # Relationship types cannot be parameterized; labels are validated by _relationship_label
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (s:Term {{id: row.source_id}})
+            MATCH (t:Term {{id: row.target_id}})
+            MERGE (s)-[r:{label} {{id: row.id}}]->(t)
+            SET r += row.properties
+            """
+            for chunk in _chunks(rows, chunk_size):
+                result = await tx.run(query, rows=chunk)
+                await result.consume()
+
+    @staticmethod
+    async def _delete_term_nodes(tx: AsyncManagedTransaction, term_ids: list[str], chunk_size: int) -> None:
+        query = """
+        UNWIND $ids AS id
+        MATCH (t:Term {id: id})
+        DETACH DELETE t
+        """
+        for chunk in _chunks(term_ids, chunk_size):
+            result = await tx.run(query, ids=chunk)
+            await result.consume()
+
+    @staticmethod
+    async def _delete_relationships(tx: AsyncManagedTransaction, namespace_id: str, relationship_ids: list[str], chunk_size: int) -> None:
+        ids = [rid for relationship_id in relationship_ids for rid in (relationship_id, f"{relationship_id}{_REVERSE_SUFFIX}")]
+        query = """
+        MATCH (s:Term {namespace_id: $namespace_id})-[r]->(:Term)
+        WHERE r.id IN $ids
+        DELETE r
+        """
+        for chunk in _chunks(ids, chunk_size):
+            result = await tx.run(query, namespace_id=namespace_id, ids=chunk)
+            await result.consume()
+
+    async def get_namespace_sync_state(self, namespace_id: str) -> tuple[dict[str, str], dict[str, str]]:
+        """Get the sync hashes of a namespace's nodes and relationships.
+
+        Args:
+            namespace_id: Namespace to query
+
+        Returns:
+            Tuple of (term_id -> sync_hash, relationship_id -> sync_hash);
+            reverse edges of bidirectional relationships are folded into their forward id
+        """
+        if not self._driver:
+            raise RuntimeError("Neo4j not connected")
+
+        async with self._driver.session(database=self._database) as session:
+            result = await session.run(
+                "MATCH (t:Term {namespace_id: $namespace_id}) RETURN t.id AS id, t.sync_hash AS sync_hash",
+                namespace_id=namespace_id,
+            )
+            nodes = {record["id"]: record["sync_hash"] async for record in result}
+
+            result = await session.run(
+                """
+                MATCH (:Term {namespace_id: $namespace_id})-[r]->(:Term)
+                WHERE r.id IS NOT NULL
+                RETURN r.id AS id, r.sync_hash AS sync_hash
+                """,
+                namespace_id=namespace_id,
+            )
+            edges: dict[str, str] = {}
+            async for record in result:
+                relationship_id = record["id"].removesuffix(_REVERSE_SUFFIX)
+                edges.setdefault(relationship_id, record["sync_hash"])
+
+        return nodes, edges
+
+    async def sync_namespace(
+        self,
+        namespace_id: str,
+        terms: list[dict[str, Any]],
+        relationships: list[dict[str, Any]],
+        chunk_size: int = 500,
+    ) -> dict[str, int]:
+        """Sync a namespace's terms and relationships to the graph.
+
+        Diffs the desired state against the graph using per-element sync
+        hashes and only writes the deltas: new/changed elements are MERGEd,
+        elements missing from the desired state are deleted. All deltas are
+        written in one transaction, so a failed sync leaves the graph as it was.
+
+        Args:
+            namespace_id: Namespace to sync
+            terms: Active terms of the namespace
+            relationships: Active relationships of the namespace
+            chunk_size: Maximum rows per UNWIND statement
+
+        Returns:
+            Counts of upserted/deleted terms and relationships
+        """
+        existing_nodes, existing_edges = await self.get_namespace_sync_state(namespace_id)
+
+        changed_terms = [term for term in terms if existing_nodes.get(term["id"]) != self._term_row(namespace_id, term)["properties"]["sync_hash"]]
+        desired_term_ids = {term["id"] for term in terms}
+        removed_term_ids = [term_id for term_id in existing_nodes if term_id not in desired_term_ids]
+
+        changed_relationships = [
+            relationship for relationship in relationships if existing_edges.get(relationship["id"]) != self._relationship_rows(namespace_id, relationship)[0]["properties"]["sync_hash"]
+        ]
+        desired_relationship_ids = {relationship["id"] for relationship in relationships}
+        removed_relationship_ids = [relationship_id for relationship_id in existing_edges if relationship_id not in desired_relationship_ids]
+
+        # Changed relationships are rewritten from scratch so that type or direction changes do not leave stale edges
+        deleted_relationship_ids = removed_relationship_ids + [r["id"] for r in changed_relationships if r["id"] in existing_edges]
+        term_rows = [self._term_row(namespace_id, term) for term in changed_terms]
+        relationship_rows_by_label = self._relationship_rows_by_label(namespace_id, changed_relationships)
+
+        async def write(tx: AsyncManagedTransaction) -> None:
+            await self._delete_relationships(tx, namespace_id, deleted_relationship_ids, chunk_size)
+            await self._delete_term_nodes(tx, removed_term_ids, chunk_size)
+            await self._write_term_nodes(tx, term_rows, chunk_size)
+            await self._write_relationships(tx, relationship_rows_by_label, chunk_size)
+
+        if deleted_relationship_ids or removed_term_ids or term_rows or relationship_rows_by_label:
+            if not self._driver:
+                raise RuntimeError("Neo4j not connected")
+            async with self._driver.session(database=self._database) as session:
+                await session.execute_write(write)
+
+        summary = {
+            "terms_upserted": len(changed_terms),
+            "terms_deleted": len(removed_term_ids),
+            "terms_unchanged": len(terms) - len(changed_terms),
+            "relationships_upserted": len(changed_relationships),
+            "relationships_deleted": len(removed_relationship_ids),
+            "relationships_unchanged": len(relationships) - len(changed_relationships),
+        }
+        log.info(f"Synced namespace '{namespace_id}' to graph: {summary}")
+        return summary
+
+    @staticmethod
+    def _term_row(namespace_id: str, term: dict[str, Any]) -> dict[str, Any]:
+        properties = {
+            "namespace_id": namespace_id,
+            "term": term["term"],
+            "definition": term.get("definition", ""),
+            "aliases": list(term.get("aliases") or []),
+        }
+        properties["sync_hash"] = _sync_hash(properties)
+        return {"id": term["id"], "properties": properties}
+
+    @classmethod
+    def _relationship_rows_by_label(cls, namespace_id: str, relationships: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+        rows_by_label: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for relationship in relationships:
+            label = _relationship_label(relationship["relationship_type"])
+            rows_by_label[label].extend(cls._relationship_rows(namespace_id, relationship))
+        return rows_by_label
+
+    @staticmethod
+    def _relationship_rows(namespace_id: str, relationship: dict[str, Any]) -> list[dict[str, Any]]:
+        properties = {
+            "namespace_id": namespace_id,
+            "relationship_type": relationship["relationship_type"],
+            "weight": relationship.get("weight", 1.0),
+            "bidirectional": bool(relationship.get("bidirectional", False)),
+            "description": relationship.get("description"),
+        }
+        properties["sync_hash"] = _sync_hash({**properties, "source": relationship["source_term_id"], "target": relationship["target_term_id"]})
+        rows = [
+            {
+                "id": relationship["id"],
+                "source_id": relationship["source_term_id"],
+                "target_id": relationship["target_term_id"],
+                "properties": properties,
+            }
+        ]
+        if properties["bidirectional"]:
+            rows.append(
+                {
+                    "id": f"{relationship['id']}{_REVERSE_SUFFIX}",
+                    "source_id": relationship["target_term_id"],
+                    "target_id": relationship["source_term_id"],
+                    "properties": properties,
+                }
+            )
+        return rows
@@ -8,6 +8,7 @@ from qdrant_client.http.models import (
     Distance,
     FieldCondition,
     Filter,
+    FilterSelector,
     MatchValue,
     PointStruct,
     VectorParams,
@@ -156,6 +157,85 @@ class QdrantVectorClient:
             log.error(f"Failed to upsert embedding for {term_id}: {e}")
             return False
 
+    async def upsert_term_embeddings(
+        self,
+        collection_name: str,
+        points: list[dict[str, Any]],
+    ) -> bool:
+        """Upsert a batch of term embeddings in a single request.
+
+        Each point is a dictionary with ``term_id``, ``namespace_id``,
+        ``embedding`` and optional ``metadata`` keys.
+
+        Args:
+            collection_name: Target collection
+            points: Term embeddings to upsert
+
+        Returns:
+            True if successful
+        """
+        if not self._client:
+            raise RuntimeError("Qdrant not connected")
+        if not points:
+            return True
+
+        try:
+            await self._client.upsert(
+                collection_name=collection_name,
+                points=[
+                    PointStruct(
+                        id=point["term_id"],
+                        vector=point["embedding"],
+                        payload={
+                            "term_id": point["term_id"],
+                            "namespace_id": point["namespace_id"],
+                            **(point.get("metadata") or {}),
+                        },
+                    )
+                    for point in points
+                ],
+                wait=True,
+            )
+            return True
+        except Exception as e:
+            log.error(f"Failed to upsert {len(points)} embeddings: {e}")
+            return False
+
+    async def get_payload_values(
+        self,
+        collection_name: str,
+        term_ids: list[str],
+        key: str,
+    ) -> dict[str, Any]:
+        """Get a single payload value for several term embeddings.
+
+        Vectors are not transferred.
+
+        Args:
+            collection_name: Collection name
+            term_ids: Term identifiers to look up
+            key: Payload key to return
+
+        Returns:
+            Mapping of term_id to payload value (missing points are omitted)
+        """
+        if not self._client:
+            raise RuntimeError("Qdrant not connected")
+        if not term_ids:
+            return {}
+
+        try:
+            records = await self._client.retrieve(
+                collection_name=collection_name,
+                ids=term_ids,
+                with_payload=[key],
+                with_vectors=False,
+            )
+            return {str(record.id): record.payload[key] for record in records if record.payload and key in record.payload}
+        except Exception as e:
+            log.error(f"Failed to retrieve payloads for {len(term_ids)} embeddings: {e}")
+            return {}
+
     async def search_similar_terms(
         self,
         collection_name: str,
@@ -239,6 +319,71 @@ class QdrantVectorClient:
             log.error(f"Failed to delete embedding for {term_id}: {e}")
             return False
 
+    async def delete_term_embeddings(
+        self,
+        collection_name: str,
+        term_ids: list[str],
+    ) -> bool:
+        """Delete a batch of term embeddings.
+
+        Args:
+            collection_name: Collection name
+            term_ids: Term identifiers
+
+        Returns:
+            True if successful
+        """
+        if not self._client:
+            raise RuntimeError("Qdrant not connected")
+        if not term_ids:
+            return True
+
+        try:
+            await self._client.delete(
+                collection_name=collection_name,
+                points_selector=term_ids,
+            )
+            return True
+        except Exception as e:
+            log.error(f"Failed to delete {len(term_ids)} embeddings: {e}")
+            return False
+
+    async def delete_namespace_embeddings(
+        self,
+        collection_name: str,
+        namespace_id: str,
+    ) -> bool:
+        """Delete all embeddings of a namespace.
+
+        Args:
+            collection_name: Collection name
+            namespace_id: Namespace identifier
+
+        Returns:
+            True if successful
+        """
+        if not self._client:
+            raise RuntimeError("Qdrant not connected")
+
+        try:
+            await self._client.delete(
+                collection_name=collection_name,
+                points_selector=FilterSelector(
+                    filter=Filter(
+                        must=[
+                            FieldCondition(
+                                key="namespace_id",
+                                match=MatchValue(value=namespace_id),
+                            )
+                        ]
+                    )
+                ),
+            )
+            return True
+        except Exception as e:
+            log.error(f"Failed to delete embeddings of namespace {namespace_id}: {e}")
+            return False
+
     async def get_namespace_embeddings_count(
         self,
         collection_name: str,
@@ -0,0 +1,15 @@
+"""Embedding providers for term vectorization."""
+
+from infrastructure.embeddings.embedding_provider import (
+    EmbeddingProvider,
+    HashingEmbeddingProvider,
+    SentenceTransformerEmbeddingProvider,
+    create_embedding_provider,
+)
+
+__all__ = [
+    "EmbeddingProvider",
+    "HashingEmbeddingProvider",
+    "SentenceTransformerEmbeddingProvider",
+    "create_embedding_provider",
+]
@@ -0,0 +1,151 @@
+"""Pluggable embedding providers.
+
+Two backends are available:
+- ``sentence-transformers``: real semantic embeddings (optional dependency)
+- ``hashing``: deterministic, dependency-free feature hashing. Vectors only
+  capture shared words, not meaning: for tests and local development only
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import re
+from abc import ABC, abstractmethod
+from typing import Any
+
+try:
+    from sentence_transformers import SentenceTransformer  # type: ignore[import]
+
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SentenceTransformer = None  # type: ignore[assignment,misc]
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class EmbeddingProvider(ABC):
+    """Computes vector embeddings for batches of texts."""
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Size of the produced vectors."""
+        ...
+
+    @property
+    @abstractmethod
+    def model_name(self) -> str:
+        """Identifier of the embedding model (stored with each vector)."""
+        ...
+
+    @abstractmethod
+    async def embed_async(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per input text, in the same order
+        """
+        ...
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """Deterministic feature-hashing embeddings.
+
+    Tokens are hashed into ``dimension`` buckets with a signed count and the
+    vector is L2-normalized. Texts sharing words end up close in cosine space,
+    which is enough for tests and local development without a model download.
+    """
+
+    def __init__(self, dimension: int = 384):
+        self._dimension = dimension
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    @property
+    def model_name(self) -> str:
+        return f"hashing-{self._dimension}"
+
+    async def embed_async(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text) for text in texts]
+
+    def _embed(self, text: str) -> list[float]:
+        vector = [0.0] * self._dimension
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "big")
+            index = value % self._dimension
+            sign = 1.0 if (value >> 63) & 1 == 0 else -1.0
+            vector[index] += sign
+
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm == 0.0:
+            return vector
+        return [v / norm for v in vector]
+
+
+class SentenceTransformerEmbeddingProvider(EmbeddingProvider):
+    """Embeddings computed by a sentence-transformers model.
+
+    The model is loaded lazily on first use and inference runs in a worker
+    thread so it does not block the event loop.
+    """
+
+    def __init__(self, model_name: str, dimension: int):
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise RuntimeError("sentence-transformers is not installed (required by the 'sentence-transformers' embedding provider)")
+        self._model_name = model_name
+        self._dimension = dimension
+        self._model: Any = None
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    async def embed_async(self, texts: list[str]) -> list[list[float]]:
+        return await asyncio.to_thread(self._embed_batch, texts)
+
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        if self._model is None:
+            log.info(f"Loading embedding model: {self._model_name}")
+            self._model = SentenceTransformer(self._model_name)  # type: ignore[misc]
+        vectors = self._model.encode(texts, normalize_embeddings=True)
+        return [[float(v) for v in vector] for vector in vectors]
+
+
+def create_embedding_provider(provider: str, model_name: str, dimension: int) -> EmbeddingProvider:
+    """Create the configured embedding provider.
+
+    There is no fallback: storing hashing vectors in place of semantic ones
+    would silently degrade search, so a misconfiguration fails at startup.
+
+    Args:
+        provider: Provider name ('sentence-transformers' or 'hashing')
+        model_name: Model name for sentence-transformers
+        dimension: Vector dimension
+
+    Returns:
+        The embedding provider
+
+    Raises:
+        ValueError: If the provider name is unknown
+        RuntimeError: If sentence-transformers is requested but not installed
+    """
+    if provider == "sentence-transformers":
+        return SentenceTransformerEmbeddingProvider(model_name=model_name, dimension=dimension)
+    if provider == "hashing":
+        log.warning("Using hashing embeddings: vectors are not semantic, use them for tests and local development only")
+        return HashingEmbeddingProvider(dimension=dimension)
+    raise ValueError(f"Unknown embedding provider '{provider}' (expected 'sentence-transformers' or 'hashing')")
@@ -1,14 +1,16 @@
 """Integration layer models and repositories."""
 
-from integration.models import KnowledgeNamespaceDto, KnowledgeRelationshipDto, KnowledgeRuleDto, KnowledgeTermDto
-from integration.repositories import MotorKnowledgeNamespaceRepository
+from integration.models import KnowledgeNamespaceDto, KnowledgeRelationshipDto, KnowledgeRuleDto, KnowledgeTermDto, KnowledgeTermPageDto
+from integration.repositories import MotorKnowledgeNamespaceRepository, MotorKnowledgeTermDtoRepository
 
 __all__ = [
     # DTOs
     "KnowledgeNamespaceDto",
     "KnowledgeTermDto",
+    "KnowledgeTermPageDto",
     "KnowledgeRelationshipDto",
     "KnowledgeRuleDto",
     # Repositories
     "MotorKnowledgeNamespaceRepository",
+    "MotorKnowledgeTermDtoRepository",
 ]
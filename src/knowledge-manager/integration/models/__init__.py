@@ -1,10 +1,11 @@
 """Integration layer DTOs."""
 
-from integration.models.namespace_dto import KnowledgeNamespaceDto, KnowledgeRelationshipDto, KnowledgeRuleDto, KnowledgeTermDto
+from integration.models.namespace_dto import KnowledgeNamespaceDto, KnowledgeRelationshipDto, KnowledgeRuleDto, KnowledgeTermDto, KnowledgeTermPageDto
 
 __all__ = [
     "KnowledgeNamespaceDto",
     "KnowledgeTermDto",
+    "KnowledgeTermPageDto",
     "KnowledgeRelationshipDto",
     "KnowledgeRuleDto",
 ]
@@ -44,6 +44,26 @@ class KnowledgeTermDto:
     is_active: bool = True
     """Whether the term is active."""
 
+    score: float | None = None
+    """Text search relevance score (only set on search results)."""
+
+
+@dataclass
+class KnowledgeTermPageDto:
+    """A page of knowledge terms with the total number of matches."""
+
+    items: list[KnowledgeTermDto] = field(default_factory=list)
+    """Terms in this page (ranked by relevance when searching)."""
+
+    total: int = 0
+    """Total number of terms matching the filter, across all pages."""
+
+    limit: int = 100
+    """Maximum number of results requested."""
+
+    offset: int = 0
+    """Number of results skipped."""
+
 
 @queryable
 @dataclass
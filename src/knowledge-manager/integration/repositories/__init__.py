@@ -1,7 +1,9 @@
 """Integration layer repositories."""
 
 from integration.repositories.motor_knowledge_namespace_repository import MotorKnowledgeNamespaceRepository
+from integration.repositories.motor_knowledge_term_dto_repository import MotorKnowledgeTermDtoRepository
 
 __all__ = [
     "MotorKnowledgeNamespaceRepository",
+    "MotorKnowledgeTermDtoRepository",
 ]
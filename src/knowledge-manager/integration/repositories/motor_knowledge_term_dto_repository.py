@@ -0,0 +1,146 @@
+"""MongoDB repository implementation for the KnowledgeTermDto read model."""
+
+import logging
+from datetime import datetime
+from typing import ClassVar
+
+from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, TEXT, IndexModel, UpdateOne
+
+from domain.repositories import KnowledgeTermDtoRepository
+from integration.models import KnowledgeTermDto
+
+log = logging.getLogger(__name__)
+
+
+class MotorKnowledgeTermDtoRepository(MotorRepository[KnowledgeTermDto, str], KnowledgeTermDtoRepository):
+    """MongoDB-based repository for the per-term read model.
+
+    One document per term, maintained by the term projection handlers.
+    Two indexes back the queries:
+
+    - ``namespace_active_term``: compound index for listing a namespace's
+      terms ordered by name (equality on namespace_id/is_active, sort on term)
+    - ``namespace_term_text``: compound text index prefixed by namespace_id,
+      weighting term > aliases > definition for relevance ranking
+
+    Indexes are created lazily (once per process) on first query.
+
+    Configured via MotorRepository.configure() in main.py.
+    """
+
+    _indexes_ensured: ClassVar[bool] = False
+
+    async def ensure_indexes_async(self) -> None:
+        """Create the read model indexes if they do not exist yet."""
+        if MotorKnowledgeTermDtoRepository._indexes_ensured:
+            return
+
+        await self.collection.create_indexes(
+            [
+                IndexModel([("id", ASCENDING)], name="id", unique=True),
+                IndexModel(
+                    [("namespace_id", ASCENDING), ("is_active", ASCENDING), ("term", ASCENDING)],
+                    name="namespace_active_term",
+                ),
+                IndexModel(
+                    [("namespace_id", ASCENDING), ("term", TEXT), ("aliases", TEXT), ("definition", TEXT)],
+                    name="namespace_term_text",
+                    weights={"term": 10, "aliases": 5, "definition": 1},
+                ),
+            ]
+        )
+        MotorKnowledgeTermDtoRepository._indexes_ensured = True
+        log.info("Ensured indexes on knowledge term read model")
+
+    async def search_async(
+        self,
+        namespace_id: str,
+        search: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        include_inactive: bool = False,
+    ) -> tuple[list[KnowledgeTermDto], int]:
+        """Search and paginate terms of a namespace.
+
+        Args:
+            namespace_id: The namespace to search in
+            search: Optional full-text search string
+            limit: Maximum number of results
+            offset: Number of results to skip
+            include_inactive: Whether to include removed terms
+
+        Returns:
+            Tuple of (page of terms, total number of matching terms)
+        """
+        await self.ensure_indexes_async()
+
+        mongo_query: dict = {"namespace_id": namespace_id}
+        if not include_inactive:
+            mongo_query["is_active"] = True
+
+        if search and search.strip():
+            mongo_query["$text"] = {"$search": search.strip()}
+            projection: dict | None = {"score": {"$meta": "textScore"}}
+            sort = [("score", {"$meta": "textScore"}), ("term", ASCENDING)]
+        else:
+            projection = None
+            sort = [("term", ASCENDING)]
+
+        total = await self.collection.count_documents(mongo_query)
+        if total <= offset:
+            return [], total
+
+        cursor = self.collection.find(mongo_query, projection).sort(sort).skip(offset).limit(limit)
+        results = []
+        async for doc in cursor:
+            results.append(self._deserialize(doc))
+        return results, total
+
+    async def deactivate_by_namespace_async(self, namespace_id: str, deactivated_at: datetime) -> int:
+        """Mark all terms of a namespace as inactive.
+
+        Args:
+            namespace_id: The namespace whose terms to deactivate
+            deactivated_at: When the terms were deactivated
+
+        Returns:
+            Number of terms updated
+        """
+        result = await self.collection.update_many(
+            {"namespace_id": namespace_id, "is_active": True},
+            {"$set": {"is_active": False, "updated_at": deactivated_at}},
+        )
+        return result.modified_count
+
+    async def add_missing_async(self, terms: list[KnowledgeTermDto]) -> int:
+        """Insert the terms that are not in the read model yet.
+
+        Args:
+            terms: The terms to insert when missing
+
+        Returns:
+            Number of terms inserted
+        """
+        if not terms:
+            return 0
+        await self.ensure_indexes_async()
+        operations = [UpdateOne({"id": term.id}, {"$setOnInsert": self._serialize_entity(term)}, upsert=True) for term in terms]
+        result = await self.collection.bulk_write(operations, ordered=False)
+        return result.upserted_count
+
+    def _deserialize(self, doc: dict) -> KnowledgeTermDto:
+        """Deserialize MongoDB document to KnowledgeTermDto."""
+        return KnowledgeTermDto(
+            id=doc.get("id", str(doc["_id"])),
+            namespace_id=doc.get("namespace_id", ""),
+            term=doc.get("term", ""),
+            definition=doc.get("definition", ""),
+            aliases=doc.get("aliases", []),
+            examples=doc.get("examples", []),
+            context_hint=doc.get("context_hint"),
+            created_at=doc.get("created_at"),
+            updated_at=doc.get("updated_at"),
+            is_active=doc.get("is_active", True),
+            score=doc.get("score"),
+        )
@@ -23,19 +23,22 @@ from neuroglia.serialization.json import JsonSerializer
 
 from api.services.auth_service import DualAuthService
 from api.services.openapi_config import configure_mounted_apps_openapi_prefix, setup_openapi
+from application.services import TermEmbeddingPipeline, TermReadModelBackfill
 from application.settings import app_settings, configure_logging
 
 # Domain entities (aggregates)
 from domain.entities import KnowledgeNamespace
 
 # Domain repository interfaces
-from domain.repositories import KnowledgeNamespaceRepository
+from domain.repositories import KnowledgeNamespaceRepository, KnowledgeTermDtoRepository
 
 # Infrastructure
+from infrastructure.clients import Neo4jClient
 from infrastructure.session_store import RedisSessionStore
 
-# Integration layer - Motor repository implementations
-from integration.repositories import MotorKnowledgeNamespaceRepository
+# Integration layer - read models and Motor repository implementations
+from integration.models import KnowledgeTermDto
+from integration.repositories import MotorKnowledgeNamespaceRepository, MotorKnowledgeTermDtoRepository
 
 configure_logging(log_level=app_settings.log_level)
 log = logging.getLogger(__name__)
@@ -61,6 +64,7 @@ def create_app() -> FastAPI:
         [
             "application.commands",
             "application.queries",
+            "application.events.domain",
         ],
     )
     Mapper.configure(
@@ -88,7 +92,9 @@ def create_app() -> FastAPI:
     # ==========================================================================
     # All aggregates are persisted directly to MongoDB.
     # Domain events are still emitted via CloudEventPublisher for external consumers.
-    # Query handlers read directly from aggregates and map to response models.
+    # Query handlers read directly from aggregates and map to response models,
+    # except term listing/search which reads the per-term read model projected
+    # from KnowledgeTerm* domain events (application.events.domain).
     #
     MotorRepository.configure(
         builder,
@@ -99,10 +105,25 @@ def create_app() -> FastAPI:
         domain_repository_type=KnowledgeNamespaceRepository,
         implementation_type=MotorKnowledgeNamespaceRepository,
     )
+    MotorRepository.configure(
+        builder,
+        entity_type=KnowledgeTermDto,
+        key_type=str,
+        database_name=app_settings.database_name,
+        collection_name="terms",
+        domain_repository_type=KnowledgeTermDtoRepository,
+        implementation_type=MotorKnowledgeTermDtoRepository,
+    )
 
     # Configure infrastructure services
     _configure_infrastructure_services(builder)
 
+    # Term embedding ingestion into Qdrant (fed by term domain events)
+    TermEmbeddingPipeline.configure(builder)
+
+    # Insert terms missing from the per-term read model (e.g. added before it existed)
+    TermReadModelBackfill.configure(builder)
+
     # Add SubApp for API with controllers
     def api_sub_app_setup(app: FastAPI, settings) -> None:
         """Configure API sub-app with OpenAPI and auth dependencies."""
@@ -195,6 +216,15 @@ def _configure_infrastructure_services(builder: WebApplicationBuilder) -> None:
     )
     builder.services.add_singleton(DualAuthService, singleton=auth_service)
 
+    # Neo4j Graph Client (connects lazily on first graph sync)
+    neo4j_client = Neo4jClient(
+        uri=app_settings.neo4j_uri,
+        username=app_settings.neo4j_user,
+        password=app_settings.neo4j_password,
+        database=app_settings.neo4j_database,
+    )
+    builder.services.add_singleton(Neo4jClient, singleton=neo4j_client)
+
     log.info("✅ Infrastructure services configured")
 
 
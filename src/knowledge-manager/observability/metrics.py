@@ -35,6 +35,13 @@ TERM_COUNT = Gauge(
     ["namespace_id"],
 )
 
+# Embedding metrics
+EMBEDDING_OPERATIONS = Counter(
+    "knowledge_manager_embedding_operations_total",
+    "Total term embedding operations (terms processed)",
+    ["operation", "status"],
+)
+
 # API metrics
 REQUEST_LATENCY = Histogram(
     "knowledge_manager_request_duration_seconds",
@@ -156,3 +163,14 @@ def track_event_published(event_type: str) -> None:
         event_type: CloudEvent type
     """
     EVENTS_PUBLISHED.labels(event_type=event_type).inc()
+
+
+def track_embedding_operation(operation: str, status: str, count: int = 1) -> None:
+    """Track term embedding operations.
+
+    Args:
+        operation: Operation type (embed, delete, delete_namespace)
+        status: Operation status (success, failure, skipped)
+        count: Number of terms processed
+    """
+    EMBEDDING_OPERATIONS.labels(operation=operation, status=status).inc(count)
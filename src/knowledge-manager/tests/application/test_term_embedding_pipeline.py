@@ -0,0 +1,187 @@
+"""Tests for the batched term embedding ingestion pipeline."""
+
+from typing import Any
+
+import pytest
+
+from application.services import TermEmbeddingPipeline, TermEmbeddingRequest
+from infrastructure.embeddings import HashingEmbeddingProvider, create_embedding_provider, embedding_provider as embedding_provider_module
+
+
+class FakeVectorClient:
+    """In-memory stand-in for QdrantVectorClient."""
+
+    def __init__(self, fail_upserts: int = 0):
+        self.points: dict[str, dict[str, Any]] = {}
+        self.upsert_calls: list[int] = []
+        self.fail_upserts = fail_upserts
+
+    async def upsert_term_embeddings(self, collection_name: str, points: list[dict[str, Any]]) -> bool:
+        if self.fail_upserts:
+            self.fail_upserts -= 1
+            return False
+        self.upsert_calls.append(len(points))
+        for point in points:
+            self.points[point["term_id"]] = {"namespace_id": point["namespace_id"], "vector": point["embedding"], **point["metadata"]}
+        return True
+
+    async def get_payload_values(self, collection_name: str, term_ids: list[str], key: str) -> dict[str, Any]:
+        return {term_id: self.points[term_id][key] for term_id in term_ids if term_id in self.points}
+
+    async def delete_term_embeddings(self, collection_name: str, term_ids: list[str]) -> bool:
+        for term_id in term_ids:
+            self.points.pop(term_id, None)
+        return True
+
+    async def delete_namespace_embeddings(self, collection_name: str, namespace_id: str) -> bool:
+        self.points = {k: v for k, v in self.points.items() if v["namespace_id"] != namespace_id}
+        return True
+
+
+def _request(index: int, definition: str = "A definition", namespace_id: str = "ns-1") -> TermEmbeddingRequest:
+    return TermEmbeddingRequest(namespace_id=namespace_id, term_id=f"term-{index}", term=f"Term {index}", definition=definition)
+
+
+def _pipeline(client: FakeVectorClient, batch_size: int = 2) -> TermEmbeddingPipeline:
+    return TermEmbeddingPipeline(
+        vector_client=client,  # type: ignore[arg-type]
+        embedding_provider=HashingEmbeddingProvider(dimension=16),
+        collection_name="terms",
+        batch_size=batch_size,
+        retry_backoff_seconds=0,
+    )
+
+
+@pytest.mark.unit
+class TestHashingEmbeddingProvider:
+    """Tests for the deterministic embedding stub."""
+
+    @pytest.mark.asyncio
+    async def test_embeddings_are_deterministic_and_normalized(self):
+        provider = HashingEmbeddingProvider(dimension=32)
+
+        first, second = await provider.embed_async(["exam blueprint", "exam blueprint"])
+
+        assert first == second
+        assert len(first) == 32
+        assert sum(v * v for v in first) == pytest.approx(1.0)
+
+
+@pytest.mark.unit
+class TestCreateEmbeddingProvider:
+    """Tests for the embedding provider factory."""
+
+    def test_hashing_is_created_when_requested(self):
+        provider = create_embedding_provider("hashing", model_name="unused", dimension=16)
+
+        assert isinstance(provider, HashingEmbeddingProvider)
+        assert provider.dimension == 16
+
+    def test_unknown_provider_raises(self):
+        with pytest.raises(ValueError, match="Unknown embedding provider"):
+            create_embedding_provider("openai", model_name="unused", dimension=16)
+
+    def test_missing_sentence_transformers_raises(self, monkeypatch):
+        """No silent fallback to hashing vectors when the real provider is unavailable."""
+        monkeypatch.setattr(embedding_provider_module, "SENTENCE_TRANSFORMERS_AVAILABLE", False)
+
+        with pytest.raises(RuntimeError, match="sentence-transformers is not installed"):
+            create_embedding_provider("sentence-transformers", model_name="all-MiniLM-L6-v2", dimension=384)
+
+    def test_enabled_pipeline_requires_a_provider(self):
+        with pytest.raises(ValueError):
+            TermEmbeddingPipeline(vector_client=FakeVectorClient(), embedding_provider=None, collection_name="terms")  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestTermEmbeddingPipeline:
+    """Tests for TermEmbeddingPipeline."""
+
+    @pytest.mark.asyncio
+    async def test_flush_upserts_in_batches(self):
+        client = FakeVectorClient()
+        pipeline = _pipeline(client, batch_size=2)
+        for i in range(5):
+            pipeline.enqueue_upsert(_request(i))
+
+        result = await pipeline.flush_async()
+
+        assert result.embedded == 5
+        assert client.upsert_calls == [2, 2, 1]
+        assert pipeline.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_updates_are_coalesced(self):
+        client = FakeVectorClient()
+        pipeline = _pipeline(client)
+        pipeline.enqueue_upsert(_request(1, definition="first"))
+        pipeline.enqueue_upsert(_request(1, definition="second"))
+
+        result = await pipeline.flush_async()
+
+        assert result.embedded == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_terms_are_not_reembedded(self):
+        client = FakeVectorClient()
+        pipeline = _pipeline(client)
+        await pipeline.reindex_async([_request(1), _request(2)])
+
+        result = await pipeline.reindex_async([_request(1), _request(2, definition="changed")])
+
+        assert result.skipped == 1
+        assert result.embedded == 1
+
+    @pytest.mark.asyncio
+    async def test_dedup_uses_stored_hashes_after_restart(self):
+        client = FakeVectorClient()
+        await _pipeline(client).reindex_async([_request(1)])
+
+        result = await _pipeline(client).reindex_async([_request(1)])
+
+        assert result.skipped == 1
+
+    @pytest.mark.asyncio
+    async def test_force_reindex_bypasses_dedup(self):
+        client = FakeVectorClient()
+        pipeline = _pipeline(client)
+        await pipeline.reindex_async([_request(1)])
+
+        result = await pipeline.reindex_async([_request(1)], force=True)
+
+        assert result.embedded == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_upserts_are_retried(self):
+        client = FakeVectorClient(fail_upserts=2)
+        pipeline = _pipeline(client)
+        pipeline.enqueue_upsert(_request(1))
+
+        result = await pipeline.flush_async()
+
+        assert result.embedded == 1
+        assert "term-1" in client.points
+
+    @pytest.mark.asyncio
+    async def test_delete_cancels_pending_upsert(self):
+        client = FakeVectorClient()
+        pipeline = _pipeline(client)
+        await pipeline.reindex_async([_request(1)])
+        pipeline.enqueue_upsert(_request(1, definition="changed"))
+        pipeline.enqueue_delete("term-1")
+
+        result = await pipeline.flush_async()
+
+        assert result.deleted == 1
+        assert result.embedded == 0
+        assert client.points == {}
+
+    @pytest.mark.asyncio
+    async def test_delete_namespace(self):
+        client = FakeVectorClient()
+        pipeline = _pipeline(client)
+        await pipeline.reindex_async([_request(1, namespace_id="a"), _request(2, namespace_id="b")])
+
+        assert await pipeline.delete_namespace_async("a")
+
+        assert list(client.points) == ["term-2"]
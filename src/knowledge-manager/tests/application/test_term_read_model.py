@@ -0,0 +1,197 @@
+"""Tests for the per-term read model projections and GetTermsQuery."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.events.domain import (
+    KnowledgeNamespaceDeletedTermsProjectionHandler,
+    KnowledgeTermAddedProjectionHandler,
+    KnowledgeTermRemovedProjectionHandler,
+    KnowledgeTermUpdatedProjectionHandler,
+)
+from application.queries import GetTermsQuery, GetTermsQueryHandler
+from application.services import TermReadModelBackfill, namespace_term_dtos
+from domain.entities import KnowledgeNamespace
+from domain.events import (
+    KnowledgeNamespaceDeletedDomainEvent,
+    KnowledgeTermAddedDomainEvent,
+    KnowledgeTermRemovedDomainEvent,
+    KnowledgeTermUpdatedDomainEvent,
+)
+from domain.repositories import KnowledgeNamespaceRepository, KnowledgeTermDtoRepository
+from integration.models import KnowledgeTermDto
+
+
+def _term_dto(**overrides) -> KnowledgeTermDto:
+    values = {
+        "id": "term-1",
+        "namespace_id": "ns-1",
+        "term": "API",
+        "definition": "Application Programming Interface",
+        "aliases": ["interface"],
+    }
+    values.update(overrides)
+    return KnowledgeTermDto(**values)
+
+
+@pytest.fixture
+def term_repository() -> MagicMock:
+    """Create a mock term read model repository."""
+    repository = MagicMock()
+    repository.get_async = AsyncMock(return_value=None)
+    repository.add_async = AsyncMock()
+    repository.update_async = AsyncMock()
+    repository.search_async = AsyncMock(return_value=([], 0))
+    repository.deactivate_by_namespace_async = AsyncMock(return_value=0)
+    return repository
+
+
+@pytest.mark.unit
+class TestTermProjectionHandlers:
+    """Tests for term projection handlers."""
+
+    @pytest.mark.asyncio
+    async def test_added_creates_term_document(self, term_repository):
+        """Term added event creates a read model document keyed by term id."""
+        now = datetime.now(UTC)
+        event = KnowledgeTermAddedDomainEvent(
+            aggregate_id="ns-1",
+            term_id="term-1",
+            term="API",
+            definition="Application Programming Interface",
+            aliases=["interface"],
+            created_at=now,
+        )
+
+        await KnowledgeTermAddedProjectionHandler(term_repository).handle_async(event)
+
+        dto = term_repository.add_async.await_args.args[0]
+        assert dto.id == "term-1"
+        assert dto.namespace_id == "ns-1"
+        assert dto.aliases == ["interface"]
+        assert dto.is_active is True
+        assert dto.updated_at == now
+
+    @pytest.mark.asyncio
+    async def test_added_is_idempotent(self, term_repository):
+        """Term added event is skipped when the document already exists."""
+        term_repository.get_async.return_value = _term_dto()
+        event = KnowledgeTermAddedDomainEvent(aggregate_id="ns-1", term_id="term-1", term="API", definition="x", created_at=datetime.now(UTC))
+
+        await KnowledgeTermAddedProjectionHandler(term_repository).handle_async(event)
+
+        term_repository.add_async.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_updated_applies_partial_changes(self, term_repository):
+        """Only fields present on the update event are changed."""
+        term_repository.get_async.return_value = _term_dto()
+        event = KnowledgeTermUpdatedDomainEvent(aggregate_id="ns-1", term_id="term-1", updated_at=datetime.now(UTC), definition="New definition")
+
+        await KnowledgeTermUpdatedProjectionHandler(term_repository).handle_async(event)
+
+        dto = term_repository.update_async.await_args.args[0]
+        assert dto.term == "API"
+        assert dto.definition == "New definition"
+        assert dto.aliases == ["interface"]
+
+    @pytest.mark.asyncio
+    async def test_removed_soft_deletes_term(self, term_repository):
+        """Term removed event marks the document inactive."""
+        term_repository.get_async.return_value = _term_dto()
+        event = KnowledgeTermRemovedDomainEvent(aggregate_id="ns-1", term_id="term-1", removed_at=datetime.now(UTC))
+
+        await KnowledgeTermRemovedProjectionHandler(term_repository).handle_async(event)
+
+        dto = term_repository.update_async.await_args.args[0]
+        assert dto.is_active is False
+
+    @pytest.mark.asyncio
+    async def test_namespace_deleted_deactivates_terms(self, term_repository):
+        """Namespace deletion deactivates all of its terms in one update."""
+        deleted_at = datetime.now(UTC)
+        event = KnowledgeNamespaceDeletedDomainEvent(aggregate_id="ns-1", deleted_by="user-1", deleted_at=deleted_at)
+
+        await KnowledgeNamespaceDeletedTermsProjectionHandler(term_repository).handle_async(event)
+
+        term_repository.deactivate_by_namespace_async.assert_awaited_once_with("ns-1", deleted_at)
+
+
+@pytest.mark.unit
+@pytest.mark.query
+class TestGetTermsQueryHandler:
+    """Tests for GetTermsQueryHandler."""
+
+    @pytest.mark.asyncio
+    async def test_returns_page_from_read_model(self, term_repository):
+        """Search and pagination are delegated to the read model repository."""
+        namespace_repository = MagicMock()
+        namespace_repository.contains_async = AsyncMock(return_value=True)
+        term_repository.search_async.return_value = ([_term_dto(score=1.5)], 42)
+        handler = GetTermsQueryHandler(namespace_repository, term_repository)
+
+        result = await handler.handle_async(GetTermsQuery(namespace_id="ns-1", search="api", limit=10, offset=20))
+
+        assert result.is_success
+        assert result.data.total == 42
+        assert result.data.items[0].score == 1.5
+        assert (result.data.limit, result.data.offset) == (10, 20)
+        term_repository.search_async.assert_awaited_once_with(namespace_id="ns-1", search="api", limit=10, offset=20, include_inactive=False)
+
+    @pytest.mark.asyncio
+    async def test_unknown_namespace_is_not_found(self, term_repository):
+        """Unknown namespaces return 404 without querying terms."""
+        namespace_repository = MagicMock()
+        namespace_repository.contains_async = AsyncMock(return_value=False)
+        handler = GetTermsQueryHandler(namespace_repository, term_repository)
+
+        result = await handler.handle_async(GetTermsQuery(namespace_id="missing"))
+
+        assert result.status == 404
+        term_repository.search_async.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestTermReadModelBackfill:
+    """Tests for the term read model backfill."""
+
+    def test_namespace_terms_are_mapped_to_read_model_documents(self):
+        """Every term of the namespace state becomes a document, removed terms inactive."""
+        namespace = KnowledgeNamespace(namespace_id="ns-1", name="Namespace")
+        kept = namespace.add_term("API", "Application Programming Interface", aliases=["interface"])
+        removed = namespace.add_term("SDK", "Software Development Kit")
+        namespace.remove_term(removed)
+
+        dtos = {dto.id: dto for dto in namespace_term_dtos(namespace)}
+
+        assert set(dtos) == {kept, removed}
+        assert dtos[kept].namespace_id == "ns-1"
+        assert dtos[kept].aliases == ["interface"]
+        assert isinstance(dtos[kept].created_at, datetime)
+        assert dtos[kept].is_active is True
+        assert dtos[removed].is_active is False
+
+    @pytest.mark.asyncio
+    async def test_backfill_inserts_missing_terms_of_all_namespaces(self, term_repository):
+        """The backfill hands the terms of every namespace to add_missing_async."""
+        first = KnowledgeNamespace(namespace_id="ns-1", name="First")
+        first.add_term("API", "Application Programming Interface")
+        second = KnowledgeNamespace(namespace_id="ns-2", name="Second")
+        second.add_term("SDK", "Software Development Kit")
+        namespace_repository = MagicMock()
+        namespace_repository.get_all_async = AsyncMock(return_value=[first, second])
+        term_repository.add_missing_async = AsyncMock(side_effect=[1, 0])
+        services = {KnowledgeNamespaceRepository: namespace_repository, KnowledgeTermDtoRepository: term_repository}
+        scope = MagicMock()
+        scope.get_required_service.side_effect = services.__getitem__
+        service_provider = MagicMock()
+        service_provider.create_async_scope.return_value.__aenter__ = AsyncMock(return_value=scope)
+        service_provider.create_async_scope.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        inserted = await TermReadModelBackfill(service_provider).backfill_async()
+
+        assert inserted == 1
+        namespaces = [call.args[0][0].namespace_id for call in term_repository.add_missing_async.await_args_list]
+        assert namespaces == ["ns-1", "ns-2"]
@@ -0,0 +1,173 @@
+"""Tests for Neo4jClient batched UNWIND writes and namespace graph sync."""
+
+from typing import Any
+
+import pytest
+
+from infrastructure.clients import Neo4jClient
+
+
+class FakeResult:
+    async def consume(self) -> None:
+        return None
+
+
+class FakeTransaction:
+    def __init__(self, calls: list[tuple[str, dict[str, Any]]]):
+        self._calls = calls
+
+    async def run(self, query: str, **params: Any) -> FakeResult:
+        self._calls.append((query, params))
+        return FakeResult()
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver"):
+        self._driver = driver
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def execute_write(self, work: Any, *args: Any) -> Any:
+        self._driver.transactions += 1
+        return await work(FakeTransaction(self._driver.calls), *args)
+
+
+class FakeDriver:
+    """Records the statements sent through write transactions."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.transactions = 0
+
+    def session(self, database: str) -> FakeSession:
+        return FakeSession(self)
+
+
+def make_client() -> tuple[Neo4jClient, FakeDriver]:
+    client = Neo4jClient(uri="bolt://localhost:7687", username="neo4j", password="secret")
+    driver = FakeDriver()
+    client._driver = driver  # type: ignore[assignment]
+    return client, driver
+
+
+def term(term_id: str, name: str, definition: str = "A definition") -> dict[str, Any]:
+    return {"id": term_id, "term": name, "definition": definition, "aliases": []}
+
+
+def relationship(rel_id: str, source: str, target: str, rel_type: str = "related_to", bidirectional: bool = False) -> dict[str, Any]:
+    return {
+        "id": rel_id,
+        "source_term_id": source,
+        "target_term_id": target,
+        "relationship_type": rel_type,
+        "bidirectional": bidirectional,
+        "weight": 1.0,
+    }
+
+
+class TestBatchWrites:
+    @pytest.mark.asyncio
+    async def test_upsert_term_nodes_chunks_in_single_transaction(self):
+        client, driver = make_client()
+
+        written = await client.upsert_term_nodes("ns-1", [term(f"t{i}", f"Term {i}") for i in range(5)], chunk_size=2)
+
+        assert written == 5
+        assert driver.transactions == 1
+        assert [len(params["rows"]) for _, params in driver.calls] == [2, 2, 1]
+        assert all("UNWIND $rows" in query and "MERGE (t:Term {id: row.id})" in query for query, _ in driver.calls)
+
+    @pytest.mark.asyncio
+    async def test_upsert_relationships_groups_by_type_and_adds_reverse_edges(self):
+        client, driver = make_client()
+
+        written = await client.upsert_relationships(
+            "ns-1",
+            [
+                relationship("r1", "t1", "t2", "related_to", bidirectional=True),
+                relationship("r2", "t2", "t3", "is_a"),
+            ],
+        )
+
+        assert written == 3
+        assert driver.transactions == 1
+        rows_by_label = {("RELATED_TO" if ":RELATED_TO" in query else "IS_A"): params["rows"] for query, params in driver.calls}
+        assert [(row["id"], row["source_id"], row["target_id"]) for row in rows_by_label["RELATED_TO"]] == [
+            ("r1", "t1", "t2"),
+            ("r1:reverse", "t2", "t1"),
+        ]
+        assert [row["id"] for row in rows_by_label["IS_A"]] == ["r2"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_relationships_rejects_unsafe_type(self):
+        client, driver = make_client()
+
+        with pytest.raises(ValueError):
+            await client.upsert_relationships("ns-1", [relationship("r1", "t1", "t2", "x]->() DETACH DELETE n //")])
+        assert driver.calls == []
+
+
+class TestSyncNamespace:
+    @pytest.mark.asyncio
+    async def test_sync_only_writes_deltas(self):
+        client, driver = make_client()
+        unchanged = term("t1", "Unchanged")
+        changed = term("t2", "Changed", definition="New definition")
+        new = term("t3", "New")
+        kept_rel = relationship("r1", "t1", "t2")
+
+        existing_nodes = {
+            "t1": Neo4jClient._term_row("ns-1", unchanged)["properties"]["sync_hash"],
+            "t2": "stale-hash",
+            "t-gone": "whatever",
+        }
+        existing_edges = {
+            "r1": Neo4jClient._relationship_rows("ns-1", kept_rel)[0]["properties"]["sync_hash"],
+            "r-gone": "whatever",
+        }
+
+        async def fake_state(namespace_id: str) -> tuple[dict[str, str], dict[str, str]]:
+            return existing_nodes, existing_edges
+
+        client.get_namespace_sync_state = fake_state  # type: ignore[method-assign]
+
+        summary = await client.sync_namespace("ns-1", [unchanged, changed, new], [kept_rel])
+
+        assert driver.transactions == 1
+        assert summary == {
+            "terms_upserted": 2,
+            "terms_deleted": 1,
+            "terms_unchanged": 1,
+            "relationships_upserted": 0,
+            "relationships_deleted": 1,
+            "relationships_unchanged": 1,
+        }
+        upserted_ids = [row["id"] for query, params in driver.calls if "MERGE (t:Term" in query for row in params["rows"]]
+        assert upserted_ids == ["t2", "t3"]
+        deleted_terms = [params["ids"] for query, params in driver.calls if "DETACH DELETE" in query]
+        assert deleted_terms == [["t-gone"]]
+        deleted_edges = [params["ids"] for query, params in driver.calls if "DELETE r" in query]
+        assert deleted_edges == [["r-gone", "r-gone:reverse"]]
+
+    @pytest.mark.asyncio
+    async def test_sync_is_noop_when_graph_matches(self):
+        client, driver = make_client()
+        terms = [term("t1", "One"), term("t2", "Two")]
+        rels = [relationship("r1", "t1", "t2", bidirectional=True)]
+
+        async def fake_state(namespace_id: str) -> tuple[dict[str, str], dict[str, str]]:
+            nodes = {t["id"]: Neo4jClient._term_row(namespace_id, t)["properties"]["sync_hash"] for t in terms}
+            edges = {r["id"]: Neo4jClient._relationship_rows(namespace_id, r)[0]["properties"]["sync_hash"] for r in rels}
+            return nodes, edges
+
+        client.get_namespace_sync_state = fake_state  # type: ignore[method-assign]
+
+        summary = await client.sync_namespace("ns-1", terms, rels)
+
+        assert summary["terms_upserted"] == 0 and summary["relationships_upserted"] == 0
+        assert driver.transactions == 0
+        assert driver.calls == []
@@ -287,7 +287,8 @@ export class ApiService {
         if (!response.ok) {
             throw new Error(`Failed to fetch terms: ${response.status}`);
         }
-        return response.json();
+        const page = await response.json();
+        return page.items;
     }
 
     /**
@@ -3,6 +3,7 @@
 This controller provides administrative endpoints for:
 - Circuit breaker monitoring and reset
 - System health checks
+- MongoDB index diagnostics
 - Cache management
 
 All endpoints require admin or manager role.
@@ -22,6 +23,7 @@ from pydantic import BaseModel
 from api.dependencies import require_roles
 from application.services.tool_executor import ToolExecutor
 from infrastructure.adapters.keycloak_token_exchanger import KeycloakTokenExchanger
+from infrastructure.mongo_index_bootstrapper import MongoIndexBootstrapper
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,7 @@ class CircuitBreakerState(BaseModel):
     state: str
     failure_count: int
     last_failure_time: float | None = None
+    shared: bool = False
 
 
 class CircuitBreakersResponse(BaseModel):
@@ -113,12 +116,15 @@ class AdminController(ControllerBase):
         - **closed**: Normal operation, requests flow through
         - **open**: Circuit tripped, requests are rejected immediately
         - **half_open**: Testing if the service has recovered
+
+        With shared circuit breaker state enabled, states are read from Redis and
+        reflect the whole cluster (``shared`` is true).
         """
         token_exchanger = self._get_token_exchanger()
         tool_executor = self._get_tool_executor()
 
-        token_exchange_state = token_exchanger.get_circuit_state()
-        tool_execution_states = tool_executor.get_circuit_states()
+        token_exchange_state = await token_exchanger.refresh_circuit_state()
+        tool_execution_states = await tool_executor.refresh_circuit_states()
 
         return CircuitBreakersResponse(
             token_exchange=CircuitBreakerState(**token_exchange_state),
@@ -208,3 +214,29 @@ class AdminController(ControllerBase):
         """
         token_exchanger = self._get_token_exchanger()
         return await token_exchanger.health_check()
+
+    @get(
+        "/diagnostics/indexes",
+        summary="MongoDB index diagnostics",
+        description="Report read-model index usage and explain the representative repository queries.",
+    )
+    async def index_diagnostics(
+        self,
+        user: dict = Depends(require_roles("admin")),
+    ) -> dict[str, Any]:
+        """Get MongoDB index usage and query plans.
+
+        Returns:
+        - usage: per-index access counters, keyed by collection
+        - queries: winning plan of each representative query, flagging collection scans
+        """
+        bootstrapper = self.service_provider.get_service(MongoIndexBootstrapper)
+        if bootstrapper is None:
+            raise HTTPException(status_code=503, detail="MongoDB index management is disabled")
+
+        queries = await bootstrapper.explain_queries_async()
+        return {
+            "usage": await bootstrapper.get_index_usage_async(),
+            "queries": queries,
+            "collection_scans": [f"{q['collection']}.{q['query']}" for q in queries if q.get("collection_scan")],
+        }
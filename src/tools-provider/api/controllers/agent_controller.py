@@ -4,21 +4,25 @@ This controller provides the REST API that Host Applications use to interact
 with the MCP Tools Provider on behalf of authenticated end users.
 
 Endpoints:
-1. GET /agent/tools - List tools accessible to the authenticated user
+1. GET /agent/tools - List tools accessible to the authenticated user (ETag / If-None-Match)
 2. POST /agent/tools/call - Execute a tool with identity delegation
-3. GET /agent/sse - SSE stream for real-time tool updates
+3. POST /agent/tools/call/batch - Execute several tools, streaming results as they finish
+4. GET /agent/jobs/{job_id} - Status and result of a background (ASYNC_POLL) tool job
+5. GET /agent/sse - SSE stream for real-time tool and job updates
 
 See docs/architecture/mcp-protocol-decision.md for why this is NOT MCP-compliant.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import time
-from typing import Any
+from collections.abc import AsyncIterator
+from typing import Any, Literal
 
 from classy_fastapi.decorators import get, post
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 from neuroglia.dependency_injection import ServiceProviderBase
 from neuroglia.mapping import Mapper
@@ -27,8 +31,11 @@ from neuroglia.mvc import ControllerBase
 from pydantic import BaseModel, Field
 
 from api.dependencies import get_current_user
+from api.services.json_encoding import encode_json
 from application.commands import ExecuteToolCommand
-from application.queries import GetAgentToolsQuery, ToolManifestEntry
+from application.queries import GetAgentToolsQuery, GetToolJobQuery, ToolManifestEntry
+from application.services.tool_job_runner import job_updated_channel
+from application.settings import app_settings
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +72,20 @@ class ToolCallResponse(BaseModel):
     upstream_status: int | None = Field(None, description="HTTP status from upstream service")
 
 
+class ToolCallBatchRequest(BaseModel):
+    """Request model for executing several tools in one request."""
+
+    calls: list[ToolCallRequest] = Field(..., min_length=1, description="Tool calls to execute")
+    max_concurrency: int | None = Field(None, ge=1, description="Maximum calls running at once (capped by server setting)")
+    stream_format: Literal["ndjson", "sse"] | None = Field(None, description="Result stream format (None = from Accept header, default ndjson)")
+
+
+class ToolCallBatchResult(ToolCallResponse):
+    """A single result line of a batch execution."""
+
+    index: int = Field(..., description="Position of the call in the request's calls array")
+
+
 class SSEEvent(BaseModel):
     """SSE event structure."""
 
@@ -111,6 +132,7 @@ class AgentController(ControllerBase):
     @get("/tools")
     async def get_tools(
         self,
+        request: Request,
         user: dict = Depends(get_current_user),
     ):
         """Get the list of available tools for the authenticated end user.
@@ -119,10 +141,16 @@ class AgentController(ControllerBase):
         - Access policies matching the user's JWT claims
         - Enabled tool groups and sources
 
+        The response carries an ETag derived from the manifest. Clients that
+        cache the list send it back in If-None-Match and get an empty
+        304 Not Modified while their tools are unchanged. The body is compact
+        JSON, encoded with orjson unless FAST_JSON_ENABLED is false (same bytes).
+
         **Usage:**
         ```
         GET /api/agent/tools
         Authorization: Bearer <user_jwt>
+        If-None-Match: "<etag>"   (optional)
         ```
 
         Returns:
@@ -130,7 +158,14 @@ class AgentController(ControllerBase):
         """
         query = GetAgentToolsQuery(claims=user)
         result = await self.mediator.execute_async(query)
-        return self.process(result)
+        if result.status != 200:
+            return self.process(result)
+
+        body = encode_json(result.data, fast=app_settings.fast_json_enabled)
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
     @get("/sse", response_class=StreamingResponse)
     async def sse_endpoint(
@@ -153,6 +188,7 @@ class AgentController(ControllerBase):
         **Event Types:**
         - `connected`: Initial connection acknowledgment
         - `tool_list`: List of available tools (sent on connect and on updates)
+        - `tool_job`: A background tool job of this user finished (fetch it from /agent/jobs/{job_id})
         - `heartbeat`: Keep-alive signal (every 30 seconds)
         - `error`: Error notification
 
@@ -214,7 +250,8 @@ class AgentController(ControllerBase):
 
                 if redis_cache:
                     try:
-                        pubsub = await redis_cache.subscribe_to_updates("group_updated:*", "source_updated:*", "tool_updated:*")
+                        job_channel = job_updated_channel(user.get("sub", ""))
+                        pubsub = await redis_cache.subscribe_to_updates("group_updated:*", "source_updated:*", "tool_updated:*", job_channel)
 
                         # Listen for updates with heartbeat
                         last_heartbeat = time.time()
@@ -232,6 +269,12 @@ class AgentController(ControllerBase):
                                 if message and message["type"] == "pmessage":
                                     logger.debug(f"Received update notification: {message['channel']}")
 
+                                    channel = message["channel"].decode() if isinstance(message["channel"], bytes) else str(message["channel"])
+                                    if channel.endswith(job_channel):
+                                        data = message["data"].decode() if isinstance(message["data"], bytes) else str(message["data"])
+                                        yield SSEEvent(event="tool_job", data=data).format()
+                                        continue
+
                                     # Re-fetch tool list
                                     query = GetAgentToolsQuery(claims=user, skip_cache=True)
                                     result = await self.mediator.execute_async(query)
@@ -352,7 +395,235 @@ class AgentController(ControllerBase):
         - 503: Upstream service unavailable
         - 500: Internal server error
         """
-        # Extract the raw bearer token for token exchange
+        agent_token = self._get_bearer_token(fastapi_request)
+
+        # Get the effective tool_id (supports both tool_id and name fields)
+        effective_tool_id = request.get_tool_id()
+        logger.debug(f"Tool call request: tool_id={request.tool_id}, name={request.name}, effective={effective_tool_id}")
+
+        # Step 1: Verify agent has access to the tool
+        allowed_tools = await self._resolve_allowed_tools(user)
+        matched_tool_id = self._match_tool(effective_tool_id, allowed_tools)
+
+        if not matched_tool_id:
+            logger.warning(f"Agent attempted to execute unauthorized tool: {effective_tool_id}")
+            raise HTTPException(
+                status_code=403,
+                detail=f"Access denied: Tool '{effective_tool_id}' is not available to this agent",
+            )
+
+        logger.debug(f"Tool matched: effective={effective_tool_id} -> matched_tool_id={matched_tool_id}")
+
+        # Step 2: Execute the tool via command
+        return await self._execute_call(matched_tool_id, request, agent_token, user)
+
+    @post("/tools/call/batch", response_class=StreamingResponse)
+    async def execute_tools_batch(
+        self,
+        request: ToolCallBatchRequest,
+        fastapi_request: Request,
+        user: dict = Depends(get_current_user),
+    ):
+        """Execute several tools on behalf of the authenticated end user.
+
+        Access is resolved once for the whole batch and the calls run
+        concurrently (at most ``agent_batch_max_concurrency`` at a time).
+        Each result is streamed back as soon as its call finishes, so the
+        order of results follows completion, not the request; use ``index``
+        to correlate. Token exchanges for calls sharing an upstream audience
+        are coalesced by the token broker, so each audience is exchanged once.
+
+        **Usage:**
+        ```
+        POST /api/agent/tools/call/batch
+        Authorization: Bearer <user_jwt>
+        Content-Type: application/json
+        Accept: application/x-ndjson
+
+        {
+            "calls": [
+                {"tool_id": "source123:get_users", "arguments": {"page": 1}},
+                {"name": "get_orders", "arguments": {"status": "open"}}
+            ]
+        }
+        ```
+
+        **Response (NDJSON, one object per line):**
+        ```
+        {"index": 1, "tool_id": "source123:get_orders", "status": "completed", ...}
+        {"index": 0, "tool_id": "source123:get_users", "status": "completed", ...}
+        {"done": true, "total": 2, "succeeded": 2, "failed": 0, "execution_time_ms": 153.2}
+        ```
+
+        With ``Accept: text/event-stream`` (or ``"stream_format": "sse"``) the same
+        payloads are sent as ``tool_result`` events followed by a ``done`` event.
+
+        A call to a tool the user cannot access yields a failed result with
+        ``error_code`` ``access_denied``; it does not fail the batch.
+
+        **Error Responses:**
+        - 400: Too many calls in one batch
+        - 401: Missing bearer token
+        """
+        agent_token = self._get_bearer_token(fastapi_request)
+
+        max_calls = app_settings.agent_batch_max_calls
+        if len(request.calls) > max_calls:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Batch contains {len(request.calls)} calls, the maximum is {max_calls}",
+            )
+
+        allowed_tools = await self._resolve_allowed_tools(user)
+
+        concurrency = app_settings.agent_batch_max_concurrency
+        if request.max_concurrency:
+            concurrency = min(concurrency, request.max_concurrency)
+
+        stream_format = request.stream_format
+        if stream_format is None:
+            stream_format = "sse" if "text/event-stream" in fastapi_request.headers.get("Accept", "") else "ndjson"
+
+        logger.debug(f"Tool batch request: calls={len(request.calls)}, concurrency={concurrency}, format={stream_format}")
+
+        results = self._run_batch(request.calls, allowed_tools, agent_token, user, concurrency)
+
+        if stream_format == "sse":
+            media_type = "text/event-stream"
+            body = self._format_sse(results)
+        else:
+            media_type = "application/x-ndjson"
+            body = self._format_ndjson(results)
+
+        return StreamingResponse(
+            body,
+            media_type=media_type,
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",  # Disable nginx buffering
+            },
+        )
+
+    @get("/jobs/{job_id}")
+    async def get_tool_job(
+        self,
+        job_id: str,
+        user: dict = Depends(get_current_user),
+    ):
+        """Get the status and result of a background tool job.
+
+        ASYNC_POLL tools return ``status: "pending"`` with a ``job_id`` in
+        ``result`` as soon as the upstream accepted the request; the job is
+        then polled in the background. Its completion is announced on
+        ``/agent/sse`` as a ``tool_job`` event, or it can be fetched here.
+
+        **Usage:**
+        ```
+        GET /api/agent/jobs/{job_id}
+        Authorization: Bearer <user_jwt>
+        ```
+
+        **Response:**
+        ```json
+        {
+            "job_id": "...",
+            "tool_id": "source123:generate_report",
+            "status": "completed",
+            "result": {...},
+            "error": null,
+            "poll_attempts": 4
+        }
+        ```
+
+        **Error Responses:**
+        - 404: Unknown job, or a job of another user
+        """
+        query = GetToolJobQuery(job_id=job_id, user_info=user)
+        result = await self.mediator.execute_async(query)
+        return self.process(result)
+
+    async def _run_batch(
+        self,
+        calls: list[ToolCallRequest],
+        allowed_tools: list[ToolManifestEntry],
+        agent_token: str,
+        user: dict,
+        concurrency: int,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Execute the calls of a batch concurrently, yielding results as they complete.
+
+        The final item is a summary dict with ``done`` set. Calls still running
+        when the consumer stops iterating (client disconnect) are cancelled.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        start_time = time.time()
+
+        async def run(index: int, call: ToolCallRequest) -> ToolCallBatchResult:
+            effective_tool_id = call.get_tool_id()
+            matched_tool_id = self._match_tool(effective_tool_id, allowed_tools)
+            if not matched_tool_id:
+                logger.warning(f"Agent attempted to execute unauthorized tool in batch: {effective_tool_id}")
+                return ToolCallBatchResult(
+                    index=index,
+                    tool_id=effective_tool_id,
+                    status="failed",
+                    error={
+                        "message": f"Access denied: Tool '{effective_tool_id}' is not available to this agent",
+                        "error_code": "access_denied",
+                    },
+                    execution_time_ms=0,
+                )
+
+            async with semaphore:
+                try:
+                    response = await self._execute_call(matched_tool_id, call, agent_token, user)
+                except Exception:
+                    logger.exception(f"Unexpected error executing tool {matched_tool_id} in batch")
+                    response = ToolCallResponse(
+                        tool_id=matched_tool_id,
+                        status="failed",
+                        error={"message": "An unexpected error occurred", "error_code": "internal_error"},
+                        execution_time_ms=0,
+                    )
+            return ToolCallBatchResult(index=index, **response.model_dump())
+
+        tasks = [asyncio.create_task(run(index, call)) for index, call in enumerate(calls)]
+        succeeded = 0
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                if result.status != "failed":
+                    succeeded += 1
+                yield result.model_dump()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        yield {
+            "done": True,
+            "total": len(calls),
+            "succeeded": succeeded,
+            "failed": len(calls) - succeeded,
+            "execution_time_ms": round((time.time() - start_time) * 1000, 2),
+        }
+
+    @staticmethod
+    async def _format_ndjson(results: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+        """Format batch results as newline-delimited JSON."""
+        async for item in results:
+            yield json.dumps(item, default=str) + "\n"
+
+    @staticmethod
+    async def _format_sse(results: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+        """Format batch results as Server-Sent Events."""
+        async for item in results:
+            if item.get("done"):
+                yield SSEEvent(event="done", data=json.dumps(item)).format()
+            else:
+                yield SSEEvent(event="tool_result", id=str(item["index"]), data=json.dumps(item, default=str)).format()
+
+    def _get_bearer_token(self, fastapi_request: Request) -> str:
+        """Extract the raw bearer token used for token exchange."""
         auth_header = fastapi_request.headers.get("Authorization", "")
         agent_token: str = ""  # nosec B105 - not a password, initializing token variable
         if auth_header.startswith("Bearer "):
@@ -363,13 +634,10 @@ class AgentController(ControllerBase):
                 status_code=401,
                 detail="Bearer token required for tool execution",
             )
+        return agent_token
 
-        # Get the effective tool_id (supports both tool_id and name fields)
-        effective_tool_id = request.get_tool_id()
-        logger.debug(f"Tool call request: tool_id={request.tool_id}, name={request.name}, effective={effective_tool_id}")
-
-        # Step 1: Verify agent has access to the tool
-        # First, resolve which tools the agent can access
+    async def _resolve_allowed_tools(self, user: dict) -> list[ToolManifestEntry]:
+        """Resolve the tools the agent can access."""
         tools_query = GetAgentToolsQuery(claims=user)
         tools_result = await self.mediator.execute_async(tools_query)
 
@@ -378,33 +646,21 @@ class AgentController(ControllerBase):
                 status_code=tools_result.status,
                 detail="Failed to resolve agent tools",
             )
-
-        # Check if requested tool is in the allowed list
-        allowed_tools = tools_result.data or []
-        tool_ids = [t.tool_id for t in allowed_tools]
-        tool_names = [t.name for t in allowed_tools]
-
-        # Match by tool_id first, then by name
-        matched_tool_id = None
-        if effective_tool_id in tool_ids:
-            matched_tool_id = effective_tool_id
-        elif effective_tool_id in tool_names:
-            # Find the tool_id by name
-            for t in allowed_tools:
-                if t.name == effective_tool_id:
-                    matched_tool_id = t.tool_id
-                    break
-
-        if not matched_tool_id:
-            logger.warning(f"Agent attempted to execute unauthorized tool: {effective_tool_id}")
-            raise HTTPException(
-                status_code=403,
-                detail=f"Access denied: Tool '{effective_tool_id}' is not available to this agent",
-            )
-
-        logger.debug(f"Tool matched: effective={effective_tool_id} -> matched_tool_id={matched_tool_id}")
-
-        # Step 2: Execute the tool via command
+        return tools_result.data or []
+
+    @staticmethod
+    def _match_tool(effective_tool_id: str, allowed_tools: list[ToolManifestEntry]) -> str | None:
+        """Match a requested tool against the allowed list, by tool_id first, then by name."""
+        for t in allowed_tools:
+            if t.tool_id == effective_tool_id:
+                return t.tool_id
+        for t in allowed_tools:
+            if t.name == effective_tool_id:
+                return t.tool_id
+        return None
+
+    async def _execute_call(self, matched_tool_id: str, request: ToolCallRequest, agent_token: str, user: dict) -> ToolCallResponse:
+        """Execute an authorized tool call and build its response."""
         command = ExecuteToolCommand(
             tool_id=matched_tool_id,
             arguments=request.arguments,
@@ -415,7 +671,7 @@ class AgentController(ControllerBase):
 
         result = await self.mediator.execute_async(command)
 
-        # Step 3: Build response based on result
+        # Build response based on result
         if result.status == 200 and result.data:
             data = result.data
             return ToolCallResponse(
@@ -14,10 +14,10 @@ Security:
 - File size limits enforced (10MB upload, 50MB download)
 """
 
+import asyncio
 import logging
 import mimetypes
 import os
-import tempfile
 from datetime import UTC, datetime, timedelta
 
 from classy_fastapi.decorators import get, post
@@ -29,12 +29,12 @@ from neuroglia.mediation import Mediator
 from neuroglia.mvc import ControllerBase
 
 from api.dependencies import get_current_user
+from application.services.builtin_tools.workspace import AGENT_WORKSPACE_BASE_DIR, WORKSPACE_FILE_TTL_HOURS, get_workspace_index
 
 log = logging.getLogger(__name__)
 
 # Configuration
-WORKSPACE_BASE_DIR = os.path.join(tempfile.gettempdir(), "agent_workspace")
-WORKSPACE_FILE_TTL_HOURS = 24
+WORKSPACE_BASE_DIR = AGENT_WORKSPACE_BASE_DIR
 MAX_UPLOAD_SIZE_BYTES = 10 * 1024 * 1024  # 10MB
 MAX_DOWNLOAD_SIZE_BYTES = 50 * 1024 * 1024  # 50MB
 
@@ -122,6 +122,22 @@ def validate_filename(filename: str) -> str:
     return safe_filename
 
 
+def _save_upload(workspace_dir: str, file_path: str, content: bytes) -> bool:
+    """Write an uploaded file unless it would exceed the workspace quota (blocking).
+
+    Returns:
+        False if the workspace quota would be exceeded
+    """
+    workspace_index = get_workspace_index()
+    if workspace_index.exceeds_quota(workspace_dir, file_path, len(content)):
+        return False
+
+    with open(file_path, "wb") as f:
+        f.write(content)
+    workspace_index.record_write(workspace_dir, file_path)
+    return True
+
+
 class FilesController(ControllerBase):
     """Controller for workspace file operations.
 
@@ -312,8 +328,8 @@ Files are stored temporarily (24h TTL) in your personal workspace.
         workspace_dir = get_user_workspace_dir(user_id)
         file_path = os.path.join(workspace_dir, safe_filename)
 
-        with open(file_path, "wb") as f:
-            f.write(content)
+        if not await asyncio.to_thread(_save_upload, workspace_dir, file_path, content):
+            raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="Workspace quota exceeded. Delete files or wait for them to expire.")
 
         # Calculate expiry
         expires_at = datetime.now(UTC) + timedelta(hours=WORKSPACE_FILE_TTL_HOURS)
@@ -17,7 +17,7 @@ from pydantic import BaseModel, Field
 
 from api.dependencies import get_current_user, require_roles
 from application.commands import AddLabelToToolCommand, DeleteToolCommand, DisableToolCommand, EnableToolCommand, RemoveLabelFromToolCommand, UpdateToolCommand
-from application.queries import GetSourceByIdQuery, GetSourceToolsQuery, GetToolByIdQuery, GetToolSummariesQuery, SearchToolsQuery
+from application.queries import GetSourceByIdQuery, GetSourceToolsQuery, GetToolByIdQuery, GetToolSummariesQuery, SearchToolsPageQuery, SearchToolsQuery
 
 # ============================================================================
 # REQUEST MODELS
@@ -141,12 +141,19 @@ class ToolsController(ControllerBase):
         source_id: str | None = Query(None, description="Filter by source ID"),
         tags: str | None = Query(None, description="Comma-separated tags to filter by"),
         include_disabled: bool = Query(False, description="Include disabled tools"),
+        offset: int = Query(0, ge=0, description="Number of ranked results to skip"),
+        limit: int | None = Query(None, ge=1, le=500, description="Maximum number of results (default: all)"),
+        facets: bool = Query(False, description="Return {items, total, offset, limit, facets} instead of a plain list"),
         user: dict = Depends(get_current_user),
     ):
-        """Search tools by name, description, or tags.
+        """Search tools by name, description, tags, path or label names.
 
-        Performs text search across tool names and descriptions.
-        Optionally filter by source and/or tags.
+        Results are ranked by relevance. Terms match by prefix and tolerate
+        one typo. Optionally filter by source and/or tags, and page through
+        the results with offset/limit.
+
+        With facets=true the response is an object holding the page, the
+        total number of matches and match counts by source and tag.
 
         Supports authentication via:
         - Session cookie (from OAuth2 login)
@@ -155,11 +162,26 @@ class ToolsController(ControllerBase):
         # Parse comma-separated tags
         tag_list = [t.strip() for t in tags.split(",")] if tags else None
 
+        if facets:
+            page_query = SearchToolsPageQuery(
+                query=q,
+                source_id=source_id,
+                tags=tag_list,
+                include_disabled=include_disabled,
+                offset=offset,
+                limit=limit,
+                user_info=user,
+            )
+            result = await self.mediator.execute_async(page_query)
+            return self.process(result)
+
         query = SearchToolsQuery(
             query=q,
             source_id=source_id,
             tags=tag_list,
             include_disabled=include_disabled,
+            offset=offset,
+            limit=limit,
             user_info=user,
         )
         result = await self.mediator.execute_async(query)
@@ -1,6 +1,7 @@
 """API services package."""
 
 from .auth import DualAuthService
+from .json_encoding import encode_json
 from .openapi_config import (
     OpenAPIConfigService,
     configure_api_openapi,
@@ -9,6 +10,7 @@ from .openapi_config import (
 
 __all__ = [
     "DualAuthService",
+    "encode_json",
     "OpenAPIConfigService",
     "configure_api_openapi",
     "configure_mounted_apps_openapi_prefix",
@@ -0,0 +1,64 @@
+"""Compact JSON encoding of large API responses.
+
+JsonSerializer (behind ControllerBase.process) encodes responses with the
+json module and a Python ``default`` hook called for every object. For tool
+manifests of several hundred entries with full input schemas, that shows up in
+profiles.
+
+``encode_json`` writes the same JSON document with orjson, without whitespace
+and with non-ASCII characters as UTF-8. Objects are encoded as JsonSerializer
+encodes them (public attributes whose value is not ``None``, dates and times in
+ISO 8601, anything else, such as a Decimal or a set, as its ``str()``), except
+enum members, which are written by value as orjson writes them. The json
+module fallback (``fast=False``, or a value orjson does not encode like the
+json module, e.g. non-string keys or integers beyond 64 bits) produces the
+same bytes, so the setting never changes a response body or its ETag.
+
+Two float renderings differ between the encoders, both equivalent JSON:
+magnitudes between 1e-9 and 1e-4 (``0.00001`` instead of ``1e-05``), and
+non-finite values (``null`` instead of the invalid ``NaN`` / ``Infinity``).
+"""
+
+import json
+from datetime import date, time
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a regular dependency
+    orjson = None  # type: ignore[assignment]
+
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+
+def encode_json(content: Any, fast: bool = True) -> bytes:
+    """Encode ``content`` as compact UTF-8 JSON.
+
+    Args:
+        content: Value to encode (plain values, dataclasses and other objects)
+        fast: Use orjson when it is installed (``False`` always uses the json module)
+
+    Returns:
+        The JSON document
+    """
+    if fast and orjson is not None:
+        try:
+            return orjson.dumps(content, default=_encode_object, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass  # Not encodable like the json module would: let the json module decide
+    return json.dumps(content, default=_encode_object, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _encode_object(value: Any) -> Any:
+    # Called by both encoders for values they do not encode themselves (mirrors neuroglia's JsonEncoder)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date | time):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if hasattr(value, "__dict__"):
+        return {key: item for key, item in vars(value).items() if not key.startswith("_") and item is not None}
+    return str(value)
@@ -21,6 +21,7 @@ from opentelemetry import trace
 from application.commands.command_handler_base import CommandHandlerBase
 from application.services.mcp_tool_executor import McpToolExecutor
 from application.services.tool_executor import ToolExecutionError, ToolExecutor
+from application.services.tool_job_runner import ToolJobRunner
 from domain.enums import AuthMode, ExecutionMode
 from domain.models import McpSourceConfig, ToolDefinition
 from domain.repositories import SourceDtoRepository, SourceToolDtoRepository
@@ -102,7 +103,8 @@ class ExecuteToolCommandHandler(
     1. Loads the tool definition from the read model
     2. Validates the agent has access to the tool
     3. Delegates execution to ToolExecutor or McpToolExecutor based on mode
-    4. Returns the result as an OperationResult
+    4. Hands triggered ASYNC_POLL executions over to ToolJobRunner
+    5. Returns the result as an OperationResult
 
     Note: Access validation should be done at the controller level
     before invoking this command.
@@ -119,6 +121,7 @@ class ExecuteToolCommandHandler(
         source_dto_repository: SourceDtoRepository,
         source_secrets_store: SourceSecretsStore,
         mcp_tool_executor: McpToolExecutor,
+        tool_job_runner: ToolJobRunner,
     ):
         super().__init__(
             mediator,
@@ -131,6 +134,7 @@ class ExecuteToolCommandHandler(
         self._source_dto_repository = source_dto_repository
         self._secrets_store = source_secrets_store
         self._mcp_tool_executor = mcp_tool_executor
+        self._tool_job_runner = tool_job_runner
 
     async def handle_async(self, request: ExecuteToolCommand) -> OperationResult[dict[str, Any]]:
         """Handle the execute tool command."""
@@ -247,8 +251,25 @@ class ExecuteToolCommandHandler(
                     auth_config=auth_config,
                     default_audience=default_audience,
                     validate_schema=command.validate_schema,
+                    background_poll=self._tool_job_runner.enabled,
                 )
 
+                # ASYNC_POLL tools return after the trigger; polling continues as a background job
+                if result.status == "pending" and "status_url" in result.metadata and definition.execution_profile.poll_config:
+                    span.add_event("Submitting background job")
+                    job = await self._tool_job_runner.submit(
+                        tool_id=command.tool_id,
+                        source_id=tool_dto.source_id,
+                        owner_id=str((command.user_info or {}).get("sub", "")),
+                        status_url=result.metadata["status_url"],
+                        poll_config=definition.execution_profile.poll_config,
+                        agent_token=command.agent_token,
+                        auth_mode=auth_mode,
+                        default_audience=default_audience,
+                        required_scopes=definition.execution_profile.required_scopes,
+                    )
+                    result.result = {"job_id": job.id, "trigger": result.result}
+
                 # Record success metrics
                 processing_time_ms = (time.time() - start_time) * 1000
                 tool_execution_time.record(processing_time_ms, {"tool_id": command.tool_id, "status": result.status})
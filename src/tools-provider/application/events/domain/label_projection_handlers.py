@@ -2,6 +2,7 @@
 
 These handlers project domain events to the MongoDB read model (LabelDto).
 They subscribe to events from EventStoreDB and update the MongoDB projections.
+Label names are searchable, so changes are also applied to the ToolSearchIndex.
 """
 
 import logging
@@ -9,6 +10,7 @@ import logging
 from neuroglia.data.infrastructure.abstractions import Repository
 from neuroglia.mediation import DomainEventHandler
 
+from application.services.tool_search_index import ToolSearchIndex
 from domain.events.label import LabelCreatedDomainEvent, LabelDeletedDomainEvent, LabelUpdatedDomainEvent
 from integration.models.label_dto import LabelDto
 
@@ -18,9 +20,10 @@ logger = logging.getLogger(__name__)
 class LabelCreatedProjectionHandler(DomainEventHandler[LabelCreatedDomainEvent]):
     """Projects LabelCreatedDomainEvent to MongoDB Read Model."""
 
-    def __init__(self, repository: Repository[LabelDto, str]):
+    def __init__(self, repository: Repository[LabelDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: LabelCreatedDomainEvent) -> None:
         """Handle label created event - creates new LabelDto."""
@@ -45,15 +48,17 @@ class LabelCreatedProjectionHandler(DomainEventHandler[LabelCreatedDomainEvent])
         )
 
         await self._repository.add_async(dto)
+        self._search_index.set_label(dto.id, dto.name)
         logger.info(f"✅ Projected LabelCreated to Read Model: {event.aggregate_id}")
 
 
 class LabelUpdatedProjectionHandler(DomainEventHandler[LabelUpdatedDomainEvent]):
     """Projects LabelUpdatedDomainEvent to MongoDB Read Model."""
 
-    def __init__(self, repository: Repository[LabelDto, str]):
+    def __init__(self, repository: Repository[LabelDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: LabelUpdatedDomainEvent) -> None:
         """Handle label updated event - updates name/description/color."""
@@ -70,6 +75,7 @@ class LabelUpdatedProjectionHandler(DomainEventHandler[LabelUpdatedDomainEvent])
             label.updated_at = event.updated_at
 
             await self._repository.update_async(label)
+            self._search_index.set_label(label.id, label.name)
             logger.info(f"✅ Projected LabelUpdated to Read Model: {event.aggregate_id}")
         else:
             logger.warning(f"Label {event.aggregate_id} not found for update projection")
@@ -81,9 +87,10 @@ class LabelDeletedProjectionHandler(DomainEventHandler[LabelDeletedDomainEvent])
     Performs soft delete by setting is_deleted=True.
     """
 
-    def __init__(self, repository: Repository[LabelDto, str]):
+    def __init__(self, repository: Repository[LabelDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: LabelDeletedDomainEvent) -> None:
         """Handle label deleted event - soft deletes label."""
@@ -95,6 +102,7 @@ class LabelDeletedProjectionHandler(DomainEventHandler[LabelDeletedDomainEvent])
             label.updated_at = event.deleted_at
 
             await self._repository.update_async(label)
+            self._search_index.set_label(label.id, None)
             logger.info(f"✅ Projected LabelDeleted (soft) to Read Model: {event.aggregate_id}")
         else:
             logger.warning(f"Label {event.aggregate_id} not found for deletion projection")
@@ -7,6 +7,7 @@ Following the Task projection handler pattern:
 - DomainEventHandler[TEvent] base class
 - Idempotency checks before updates
 - Handles creation, updates, and soft deletes
+- Keeps the in-memory ToolSearchIndex in step with the read model
 """
 
 import logging
@@ -14,6 +15,7 @@ import logging
 from neuroglia.data.infrastructure.abstractions import Repository
 from neuroglia.mediation import DomainEventHandler
 
+from application.services.tool_search_index import ToolSearchIndex
 from domain.events.source_tool import (
     LabelAddedToToolDomainEvent,
     LabelRemovedFromToolDomainEvent,
@@ -27,7 +29,7 @@ from domain.events.source_tool import (
 )
 from domain.models import ToolDefinition
 from integration.models.source_dto import SourceDto
-from integration.models.source_tool_dto import SourceToolDto
+from integration.models.source_tool_dto import SourceToolDto, tool_name_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -39,10 +41,12 @@ class SourceToolDiscoveredProjectionHandler(DomainEventHandler[SourceToolDiscove
         self,
         tool_repository: Repository[SourceToolDto, str],
         source_repository: Repository[SourceDto, str],
+        search_index: ToolSearchIndex,
     ):
         super().__init__()
         self._tool_repository = tool_repository
         self._source_repository = source_repository
+        self._search_index = search_index
 
     async def handle_async(self, event: SourceToolDiscoveredDomainEvent) -> None:
         """Handle tool discovered event - creates new SourceToolDto."""
@@ -69,6 +73,8 @@ class SourceToolDiscoveredProjectionHandler(DomainEventHandler[SourceToolDiscove
             source_id=event.source_id,
             source_name=source_name,
             tool_name=event.tool_name,
+            name_lower=event.tool_name.lower(),
+            name_tokens=tool_name_tokens(event.tool_name),
             operation_id=event.operation_id,
             description=definition.description if definition else "",
             input_schema=definition.input_schema if definition else {},
@@ -88,15 +94,17 @@ class SourceToolDiscoveredProjectionHandler(DomainEventHandler[SourceToolDiscove
         )
 
         await self._tool_repository.add_async(dto)
+        self._search_index.upsert(dto)
         logger.info(f"Projected new SourceTool: {event.aggregate_id}")
 
 
 class SourceToolEnabledProjectionHandler(DomainEventHandler[SourceToolEnabledDomainEvent]):
     """Projects SourceToolEnabledDomainEvent to MongoDB Read Model."""
 
-    def __init__(self, repository: Repository[SourceToolDto, str]):
+    def __init__(self, repository: Repository[SourceToolDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: SourceToolEnabledDomainEvent) -> None:
         """Handle tool enabled event - updates is_enabled flag."""
@@ -114,15 +122,17 @@ class SourceToolEnabledProjectionHandler(DomainEventHandler[SourceToolEnabledDom
         existing.updated_at = event.enabled_at
 
         await self._repository.update_async(existing)
+        self._search_index.upsert(existing)
         logger.info(f"Projected SourceTool enabled: {event.aggregate_id}")
 
 
 class SourceToolDisabledProjectionHandler(DomainEventHandler[SourceToolDisabledDomainEvent]):
     """Projects SourceToolDisabledDomainEvent to MongoDB Read Model."""
 
-    def __init__(self, repository: Repository[SourceToolDto, str]):
+    def __init__(self, repository: Repository[SourceToolDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: SourceToolDisabledDomainEvent) -> None:
         """Handle tool disabled event - updates is_enabled flag."""
@@ -139,15 +149,17 @@ class SourceToolDisabledProjectionHandler(DomainEventHandler[SourceToolDisabledD
         existing.updated_at = event.disabled_at
 
         await self._repository.update_async(existing)
+        self._search_index.upsert(existing)
         logger.info(f"Projected SourceTool disabled: {event.aggregate_id}")
 
 
 class SourceToolDefinitionUpdatedProjectionHandler(DomainEventHandler[SourceToolDefinitionUpdatedDomainEvent]):
     """Projects SourceToolDefinitionUpdatedDomainEvent to MongoDB Read Model."""
 
-    def __init__(self, repository: Repository[SourceToolDto, str]):
+    def __init__(self, repository: Repository[SourceToolDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: SourceToolDefinitionUpdatedDomainEvent) -> None:
         """Handle definition updated event - updates tool details."""
@@ -177,15 +189,17 @@ class SourceToolDefinitionUpdatedProjectionHandler(DomainEventHandler[SourceTool
         existing.updated_at = event.updated_at
 
         await self._repository.update_async(existing)
+        self._search_index.upsert(existing)
         logger.info(f"Projected SourceTool definition updated: {event.aggregate_id}")
 
 
 class SourceToolDeprecatedProjectionHandler(DomainEventHandler[SourceToolDeprecatedDomainEvent]):
     """Projects SourceToolDeprecatedDomainEvent to MongoDB Read Model."""
 
-    def __init__(self, repository: Repository[SourceToolDto, str]):
+    def __init__(self, repository: Repository[SourceToolDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: SourceToolDeprecatedDomainEvent) -> None:
         """Handle tool deprecated event - marks as deprecated."""
@@ -201,15 +215,17 @@ class SourceToolDeprecatedProjectionHandler(DomainEventHandler[SourceToolDepreca
         existing.updated_at = event.deprecated_at
 
         await self._repository.update_async(existing)
+        self._search_index.upsert(existing)
         logger.info(f"Projected SourceTool deprecated: {event.aggregate_id}")
 
 
 class SourceToolRestoredProjectionHandler(DomainEventHandler[SourceToolRestoredDomainEvent]):
     """Projects SourceToolRestoredDomainEvent to MongoDB Read Model."""
 
-    def __init__(self, repository: Repository[SourceToolDto, str]):
+    def __init__(self, repository: Repository[SourceToolDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: SourceToolRestoredDomainEvent) -> None:
         """Handle tool restored event - reactivates deprecated tool."""
@@ -240,15 +256,17 @@ class SourceToolRestoredProjectionHandler(DomainEventHandler[SourceToolRestoredD
         existing.updated_at = event.restored_at
 
         await self._repository.update_async(existing)
+        self._search_index.upsert(existing)
         logger.info(f"Projected SourceTool restored: {event.aggregate_id}")
 
 
 class LabelAddedToToolProjectionHandler(DomainEventHandler[LabelAddedToToolDomainEvent]):
     """Projects LabelAddedToToolDomainEvent to MongoDB Read Model."""
 
-    def __init__(self, repository: Repository[SourceToolDto, str]):
+    def __init__(self, repository: Repository[SourceToolDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: LabelAddedToToolDomainEvent) -> None:
         """Handle label added event - adds label_id to tool's label_ids list."""
@@ -268,6 +286,7 @@ class LabelAddedToToolProjectionHandler(DomainEventHandler[LabelAddedToToolDomai
             existing.label_ids.append(event.label_id)
             existing.updated_at = event.added_at
             await self._repository.update_async(existing)
+            self._search_index.upsert(existing)
             logger.info(f"Projected label {event.label_id} added to tool: {event.aggregate_id}")
         else:
             logger.debug(f"Label {event.label_id} already on tool {event.aggregate_id}, skipping")
@@ -276,9 +295,10 @@ class LabelAddedToToolProjectionHandler(DomainEventHandler[LabelAddedToToolDomai
 class LabelRemovedFromToolProjectionHandler(DomainEventHandler[LabelRemovedFromToolDomainEvent]):
     """Projects LabelRemovedFromToolDomainEvent to MongoDB Read Model."""
 
-    def __init__(self, repository: Repository[SourceToolDto, str]):
+    def __init__(self, repository: Repository[SourceToolDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: LabelRemovedFromToolDomainEvent) -> None:
         """Handle label removed event - removes label_id from tool's label_ids list."""
@@ -299,6 +319,7 @@ class LabelRemovedFromToolProjectionHandler(DomainEventHandler[LabelRemovedFromT
             existing.label_ids.remove(event.label_id)
             existing.updated_at = event.removed_at
             await self._repository.update_async(existing)
+            self._search_index.upsert(existing)
             logger.info(f"Projected label {event.label_id} removed from tool: {event.aggregate_id}")
         else:
             logger.debug(f"Label {event.label_id} not on tool {event.aggregate_id}, skipping")
@@ -307,9 +328,10 @@ class LabelRemovedFromToolProjectionHandler(DomainEventHandler[LabelRemovedFromT
 class SourceToolUpdatedProjectionHandler(DomainEventHandler[SourceToolUpdatedDomainEvent]):
     """Projects SourceToolUpdatedDomainEvent to MongoDB Read Model."""
 
-    def __init__(self, repository: Repository[SourceToolDto, str]):
+    def __init__(self, repository: Repository[SourceToolDto, str], search_index: ToolSearchIndex):
         super().__init__()
         self._repository = repository
+        self._search_index = search_index
 
     async def handle_async(self, event: SourceToolUpdatedDomainEvent) -> None:
         """Handle tool updated event - updates tool_name and/or description."""
@@ -323,9 +345,12 @@ class SourceToolUpdatedProjectionHandler(DomainEventHandler[SourceToolUpdatedDom
         # Apply updates (only non-None fields)
         if event.tool_name is not None:
             existing.tool_name = event.tool_name
+            existing.name_lower = event.tool_name.lower()
+            existing.name_tokens = tool_name_tokens(event.tool_name)
         if event.description is not None:
             existing.description = event.description
         existing.updated_at = event.updated_at
 
         await self._repository.update_async(existing)
+        self._search_index.upsert(existing)
         logger.info(f"Projected SourceTool updated: {event.aggregate_id}")
@@ -26,6 +26,8 @@ from .access_policy import (
 from .agent import (
     GetAgentToolsQuery,
     GetAgentToolsQueryHandler,
+    GetToolJobQuery,
+    GetToolJobQueryHandler,
     ToolManifestEntry,
 )
 
@@ -63,8 +65,11 @@ from .tool import (
     GetToolByIdQueryHandler,
     GetToolSummariesQuery,
     GetToolSummariesQueryHandler,
+    SearchToolsPageQuery,
+    SearchToolsPageQueryHandler,
     SearchToolsQuery,
     SearchToolsQueryHandler,
+    ToolSearchPage,
     ToolSyncStatus,
 )
 
@@ -96,6 +101,9 @@ __all__ = [
     "GetToolByIdQueryHandler",
     "SearchToolsQuery",
     "SearchToolsQueryHandler",
+    "SearchToolsPageQuery",
+    "SearchToolsPageQueryHandler",
+    "ToolSearchPage",
     "GetToolSummariesQuery",
     "GetToolSummariesQueryHandler",
     "CheckToolSyncStatusQuery",
@@ -116,6 +124,8 @@ __all__ = [
     # Agent queries
     "GetAgentToolsQuery",
     "GetAgentToolsQueryHandler",
+    "GetToolJobQuery",
+    "GetToolJobQueryHandler",
     "ToolManifestEntry",
     # Label queries
     "GetLabelsQuery",
@@ -1,9 +1,12 @@
 """Agent queries submodule."""
 
 from .get_agent_tools_query import GetAgentToolsQuery, GetAgentToolsQueryHandler, ToolManifestEntry
+from .get_tool_job_query import GetToolJobQuery, GetToolJobQueryHandler
 
 __all__ = [
     "GetAgentToolsQuery",
     "GetAgentToolsQueryHandler",
     "ToolManifestEntry",
+    "GetToolJobQuery",
+    "GetToolJobQueryHandler",
 ]
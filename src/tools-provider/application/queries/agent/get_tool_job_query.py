@@ -0,0 +1,52 @@
+"""Get background tool job query with handler."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from neuroglia.core import OperationResult
+from neuroglia.mediation import Query, QueryHandler
+
+from domain.repositories import ToolJobDtoRepository
+from integration.models.tool_job_dto import ToolJobDto
+
+
+@dataclass
+class GetToolJobQuery(Query[OperationResult[dict[str, Any]]]):
+    """Query to retrieve a background tool job by ID."""
+
+    job_id: str
+    user_info: dict[str, Any]
+
+
+class GetToolJobQueryHandler(QueryHandler[GetToolJobQuery, OperationResult[dict[str, Any]]]):
+    """Handle background tool job retrieval.
+
+    Jobs are only visible to the user who triggered them; other users get
+    a not-found result so job IDs cannot be probed.
+    """
+
+    def __init__(self, tool_job_repository: ToolJobDtoRepository):
+        super().__init__()
+        self.tool_job_repository = tool_job_repository
+
+    async def handle_async(self, request: GetToolJobQuery) -> OperationResult[dict[str, Any]]:
+        """Handle get tool job query."""
+        job = await self.tool_job_repository.get_async(request.job_id)
+
+        if not job or job.owner_id != request.user_info.get("sub"):
+            return self.not_found(ToolJobDto, request.job_id)
+
+        return self.ok(
+            {
+                "job_id": job.id,
+                "tool_id": job.tool_id,
+                "status": job.status,
+                "result": job.result,
+                "error": job.error,
+                "upstream_status": job.upstream_status,
+                "poll_attempts": job.attempts,
+                "created_at": job.created_at.isoformat() if job.created_at else None,
+                "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+            }
+        )
@@ -8,8 +8,11 @@ from .get_source_tools_query import (
     GetToolByIdQueryHandler,
     GetToolSummariesQuery,
     GetToolSummariesQueryHandler,
+    SearchToolsPageQuery,
+    SearchToolsPageQueryHandler,
     SearchToolsQuery,
     SearchToolsQueryHandler,
+    ToolSearchPage,
 )
 
 __all__ = [
@@ -24,4 +27,7 @@ __all__ = [
     "GetToolSummariesQueryHandler",
     "SearchToolsQuery",
     "SearchToolsQueryHandler",
+    "SearchToolsPageQuery",
+    "SearchToolsPageQueryHandler",
+    "ToolSearchPage",
 ]
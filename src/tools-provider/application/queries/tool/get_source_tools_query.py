@@ -3,14 +3,18 @@
 Retrieves tools for a specific source from the read model.
 """
 
-from dataclasses import dataclass
+import time
+from collections import Counter
+from dataclasses import dataclass, field
 from typing import Any
 
 from neuroglia.core import OperationResult
 from neuroglia.mediation import Query, QueryHandler
 
+from application.services.tool_search_index import ToolSearchIndex
 from domain.repositories import SourceToolDtoRepository
 from integration.models.source_tool_dto import SourceToolDto, SourceToolSummaryDto
+from observability import tool_search_time
 
 
 @dataclass
@@ -84,7 +88,10 @@ class GetToolByIdQueryHandler(QueryHandler[GetToolByIdQuery, OperationResult[Sou
 
 @dataclass
 class SearchToolsQuery(Query[OperationResult[list[SourceToolDto]]]):
-    """Query to search tools by name, description, or tags."""
+    """Query to search tools by name, description, or tags.
+
+    Results are ranked by relevance (best match first).
+    """
 
     query: str
     """Search query string."""
@@ -98,27 +105,131 @@ class SearchToolsQuery(Query[OperationResult[list[SourceToolDto]]]):
     include_disabled: bool = False
     """Whether to include disabled tools. Default is enabled only."""
 
+    offset: int = 0
+    """Number of ranked results to skip."""
+
+    limit: int | None = None
+    """Maximum number of results to return. Default is all."""
+
     user_info: dict[str, Any] | None = None
     """User information from authentication context."""
 
 
-class SearchToolsQueryHandler(QueryHandler[SearchToolsQuery, OperationResult[list[SourceToolDto]]]):
-    """Handler for searching tools across sources."""
+@dataclass
+class ToolSearchPage:
+    """One page of tool search results with facet counts."""
 
-    def __init__(self, tool_repository: SourceToolDtoRepository):
-        super().__init__()
-        self.tool_repository = tool_repository
+    items: list[SourceToolDto] = field(default_factory=list)
+    """Tools of the page, best match first."""
 
-    async def handle_async(self, request: SearchToolsQuery) -> OperationResult[list[SourceToolDto]]:
-        """Handle search tools query."""
-        tools = await self.tool_repository.search_async(
+    total: int = 0
+    """Number of matching tools (all pages)."""
+
+    offset: int = 0
+    """Number of ranked results skipped."""
+
+    limit: int | None = None
+    """Requested page size (None = all)."""
+
+    facets: dict[str, dict[str, int]] = field(default_factory=dict)
+    """Match counts by "source_id" and by "tags"."""
+
+
+@dataclass
+class SearchToolsPageQuery(Query[OperationResult[ToolSearchPage]]):
+    """Query to search tools, returning a page with the total and facet counts."""
+
+    query: str
+    """Search query string."""
+
+    source_id: str | None = None
+    """Optional: filter to specific source."""
+
+    tags: list[str] | None = None
+    """Optional: filter by tags (all must match)."""
+
+    include_disabled: bool = False
+    """Whether to include disabled tools. Default is enabled only."""
+
+    offset: int = 0
+    """Number of ranked results to skip."""
+
+    limit: int | None = None
+    """Maximum number of results to return. Default is all."""
+
+    user_info: dict[str, Any] | None = None
+    """User information from authentication context."""
+
+
+async def _search_tools(
+    tool_repository: SourceToolDtoRepository,
+    search_index: ToolSearchIndex,
+    request: SearchToolsQuery | SearchToolsPageQuery,
+) -> ToolSearchPage:
+    """Rank matching tools with the search index, or MongoDB until the index is loaded."""
+    end = None if request.limit is None else request.offset + request.limit
+    if search_index.ready:
+        hits = search_index.search(
             query=request.query,
             source_id=request.source_id,
             tags=request.tags,
             include_disabled=request.include_disabled,
+            offset=request.offset,
+            limit=request.limit,
         )
+        tools = {tool.id: tool for tool in await tool_repository.get_by_ids_async(hits.ids)}
+        items = [tools[tool_id] for tool_id in hits.ids if tool_id in tools]
+        return ToolSearchPage(items=items, total=hits.total, offset=request.offset, limit=request.limit, facets=hits.facets)
+
+    started = time.perf_counter()
+    matches = await tool_repository.search_async(
+        query=request.query,
+        source_id=request.source_id,
+        tags=request.tags,
+        include_disabled=request.include_disabled,
+    )
+    tool_search_time.record((time.perf_counter() - started) * 1000, {"backend": "mongo"})
+    tag_counts: Counter[str] = Counter(tag for tool in matches for tag in tool.tags)
+    return ToolSearchPage(
+        items=matches[request.offset : end],
+        total=len(matches),
+        offset=request.offset,
+        limit=request.limit,
+        facets={"source_id": dict(Counter(tool.source_id for tool in matches).most_common()), "tags": dict(tag_counts.most_common())},
+    )
 
-        return self.ok(tools)
+
+class SearchToolsQueryHandler(QueryHandler[SearchToolsQuery, OperationResult[list[SourceToolDto]]]):
+    """Handler for searching tools across sources.
+
+    Uses the in-memory ToolSearchIndex once it is loaded, MongoDB before.
+    """
+
+    def __init__(self, tool_repository: SourceToolDtoRepository, search_index: ToolSearchIndex):
+        super().__init__()
+        self.tool_repository = tool_repository
+        self.search_index = search_index
+
+    async def handle_async(self, request: SearchToolsQuery) -> OperationResult[list[SourceToolDto]]:
+        """Handle search tools query."""
+        page = await _search_tools(self.tool_repository, self.search_index, request)
+
+        return self.ok(page.items)
+
+
+class SearchToolsPageQueryHandler(QueryHandler[SearchToolsPageQuery, OperationResult[ToolSearchPage]]):
+    """Handler for paged tool search with facet counts."""
+
+    def __init__(self, tool_repository: SourceToolDtoRepository, search_index: ToolSearchIndex):
+        super().__init__()
+        self.tool_repository = tool_repository
+        self.search_index = search_index
+
+    async def handle_async(self, request: SearchToolsPageQuery) -> OperationResult[ToolSearchPage]:
+        """Handle search tools page query."""
+        page = await _search_tools(self.tool_repository, self.search_index, request)
+
+        return self.ok(page)
 
 
 @dataclass
@@ -5,12 +5,17 @@ Contains domain services and adapters for external integrations.
 
 from .builtin_source_adapter import BuiltinSourceAdapter, get_builtin_tools, is_builtin_source, is_builtin_tool_url
 from .builtin_tool_executor import BuiltinToolExecutor, BuiltinToolResult, UserContext
+from .execution_timings import ExecutionTimings
+from .inventory_refresh_scheduler import InventoryRefreshScheduler
 from .logger import configure_logging
 from .mcp_source_adapter import McpSourceAdapter
 from .mcp_tool_executor import McpExecutionResult, McpToolExecutor
 from .openapi_source_adapter import OpenAPISourceAdapter
 from .source_adapter import IngestionResult, SourceAdapter, get_adapter_for_type
 from .tool_executor import ToolExecutionError, ToolExecutionResult, ToolExecutor
+from .tool_job_runner import ToolJobRunner
+from .tool_response_cache import ToolResponseCache
+from .tool_search_index import ToolSearchHits, ToolSearchIndex
 
 __all__ = [
     "configure_logging",
@@ -28,9 +33,17 @@ __all__ = [
     "ToolExecutor",
     "ToolExecutionResult",
     "ToolExecutionError",
+    "ExecutionTimings",
+    "ToolResponseCache",
     "BuiltinToolExecutor",
     "BuiltinToolResult",
     "UserContext",
     "McpToolExecutor",
     "McpExecutionResult",
+    # Catalog search
+    "ToolSearchIndex",
+    "ToolSearchHits",
+    # Background services
+    "InventoryRefreshScheduler",
+    "ToolJobRunner",
 ]
@@ -57,6 +57,8 @@ Use cases:
 - Downloading PDFs, images, or other binary files
 - Fetching JSON data from APIs
 
+Responses are cached according to their HTTP caching headers, so repeated fetches of the same URL are cheap.
+
 Security: Only HTTP/HTTPS URLs allowed. Size limited to 10MB. Timeout: 30 seconds.""",
         input_schema={
             "type": "object",
@@ -581,7 +583,8 @@ Capabilities:
 
 Limitations:
 - 30 second timeout
-- 100MB memory limit
+- Memory limit per run (256MB by default)
+- Runs in an isolated process; no state is kept between calls
 - No external packages (no numpy, pandas, etc.)
 - Cannot import os, sys, subprocess, socket, etc.
 
@@ -728,7 +731,8 @@ Use cases:
 - Converting spreadsheet data to other formats
 
 Returns sheet names, headers, row data, and optional summary statistics.
-Supports large files by limiting rows returned (use offset/limit for pagination).""",
+Statistics (count, nulls, min, max, mean, distinct) cover the whole sheet and are cached,
+so paging through a large file with offset/max_rows stays cheap.""",
         input_schema={
             "type": "object",
             "properties": {
@@ -742,7 +746,7 @@ Supports large files by limiting rows returned (use offset/limit for pagination)
                 },
                 "include_stats": {
                     "type": "boolean",
-                    "description": "Include summary statistics (row count, column types, min/max values). Default: true",
+                    "description": "Include whole-sheet column statistics (count, nulls, type, min/max, mean, distinct estimate). Default: true",
                     "default": True,
                 },
                 "max_rows": {
@@ -3,11 +3,14 @@
 This module provides modular implementations of built-in tools organized by category:
 - base: Shared types (BuiltinToolResult, UserContext) and utilities
 - fetch_tools: URL fetching, web search, Wikipedia
+- http_client: Shared pooled HTTP client and response cache used by fetch_tools
 - utility_tools: DateTime, calculations, UUID, encoding, regex, JSON, text stats
 - file_tools: File read/write, spreadsheet operations
 - memory_tools: Key-value storage with Redis/file fallback
 - code_tools: Python code execution in sandbox
+- python_sandbox: Pre-warmed worker process pool used by code_tools
 - human_tools: Human-in-the-loop interactions
+- workspace: Workspace TTL index, quotas and background janitor
 
 All tools are re-exported here for convenient access.
 """
@@ -18,7 +21,6 @@ from .base import (
     MAX_CONTENT_SIZE,
     BuiltinToolResult,
     UserContext,
-    cleanup_old_files,
     extract_filename,
     get_workspace_dir,
     is_json_content,
@@ -45,12 +47,18 @@ from .file_tools import (
     execute_spreadsheet_write,
 )
 
+# Shared fetch client
+from .http_client import CachingHttpClient, get_http_client
+
 # Human interaction tools
 from .human_tools import execute_ask_human
 
 # Memory tools
 from .memory_tools import execute_memory_retrieve, execute_memory_store
 
+# Sandbox process pool
+from .python_sandbox import PythonSandboxPool, get_python_sandbox_pool
+
 # Utility tools
 from .utility_tools import (
     execute_calculate,
@@ -62,6 +70,9 @@ from .utility_tools import (
     execute_text_stats,
 )
 
+# Workspace management
+from .workspace import WorkspaceIndex, WorkspaceJanitor, get_workspace_index
+
 __all__ = [
     # Base types
     "BuiltinToolResult",
@@ -69,7 +80,6 @@ __all__ = [
     "FETCH_TIMEOUT",
     "MAX_CONTENT_SIZE",
     "get_workspace_dir",
-    "cleanup_old_files",
     "is_text_content",
     "is_json_content",
     "extract_filename",
@@ -97,6 +107,15 @@ __all__ = [
     "execute_memory_retrieve",
     # Code tools
     "execute_python",
+    "PythonSandboxPool",
+    "get_python_sandbox_pool",
     # Human tools
     "execute_ask_human",
+    # Shared fetch client
+    "CachingHttpClient",
+    "get_http_client",
+    # Workspace management
+    "WorkspaceIndex",
+    "WorkspaceJanitor",
+    "get_workspace_index",
 ]
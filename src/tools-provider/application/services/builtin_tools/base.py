@@ -11,7 +11,6 @@ import logging
 import os
 import re
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
 from typing import Any, Protocol
 from urllib.parse import urlparse
 
@@ -31,12 +30,9 @@ MAX_CONTENT_SIZE = 10 * 1024 * 1024
 # Request timeout for fetch_url
 FETCH_TIMEOUT = 30.0
 
-# Workspace directory for file operations
+# Workspace directory for file operations (expired files are removed by the WorkspaceJanitor)
 WORKSPACE_BASE_DIR = "/tmp/tools-provider-workspace"  # nosec B108 - controlled temp directory for workspace files
 
-# Maximum file age in workspace (24 hours)
-MAX_FILE_AGE_SECONDS = 86400
-
 
 # =============================================================================
 # Result Type
@@ -107,24 +103,6 @@ def get_workspace_dir(user_context: UserContext | None = None) -> str:
     return workspace_dir
 
 
-def cleanup_old_files(workspace_dir: str, max_age_seconds: int = MAX_FILE_AGE_SECONDS) -> None:
-    """Remove files older than max_age_seconds from the workspace directory."""
-    if not os.path.exists(workspace_dir):
-        return
-
-    now = datetime.now(UTC).timestamp()
-    for filename in os.listdir(workspace_dir):
-        file_path = os.path.join(workspace_dir, filename)
-        if os.path.isfile(file_path):
-            try:
-                file_age = now - os.path.getmtime(file_path)
-                if file_age > max_age_seconds:
-                    os.remove(file_path)
-                    logger.debug(f"Cleaned up old file: {filename}")
-            except OSError as e:
-                logger.warning(f"Failed to clean up file {filename}: {e}")
-
-
 def is_text_content(content_type: str) -> bool:
     """Check if content type indicates text content."""
     text_types = [
@@ -5,8 +5,11 @@ Tools for fetching web content and performing searches:
 - web_search: Search the web using DuckDuckGo
 - wikipedia_query: Query Wikipedia for information
 - browser_navigate: Navigate with headless browser (requires Playwright)
+
+HTTP requests go through the shared, cached client in http_client.py.
 """
 
+import asyncio
 import html
 import logging
 import os
@@ -21,16 +24,37 @@ from .base import (
     MAX_CONTENT_SIZE,
     BuiltinToolResult,
     UserContext,
-    cleanup_old_files,
     extract_filename,
     get_workspace_dir,
     is_json_content,
     is_text_content,
 )
+from .http_client import ContentTooLargeError, get_http_client
+from .workspace import get_workspace_index
 
 logger = logging.getLogger(__name__)
 
 
+def _save_to_workspace(user_context: UserContext | None, filename: str, content: bytes) -> str | None:
+    """Save fetched content to the user's workspace (blocking, run in a worker thread).
+
+    Returns:
+        The file path, or None if the workspace quota would be exceeded
+    """
+    workspace_dir = get_workspace_dir(user_context)
+    file_path = os.path.join(workspace_dir, filename)
+
+    workspace_index = get_workspace_index()
+    if workspace_index.exceeds_quota(workspace_dir, file_path, len(content)):
+        return None
+
+    os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else workspace_dir, exist_ok=True)
+    with open(file_path, "wb") as f:
+        f.write(content)
+    workspace_index.record_write(workspace_dir, file_path)
+    return file_path
+
+
 async def execute_fetch_url(arguments: dict[str, Any], user_context: UserContext | None = None) -> BuiltinToolResult:
     """Execute the fetch_url tool."""
     url = arguments.get("url", "")
@@ -49,105 +73,91 @@ async def execute_fetch_url(arguments: dict[str, Any], user_context: UserContext
     logger.info(f"Fetching URL: {url}")
 
     try:
-        async with httpx.AsyncClient(timeout=FETCH_TIMEOUT, follow_redirects=True, max_redirects=5) as client:
-            try:
-                head_response = await client.head(url)
-                content_length = head_response.headers.get("content-length")
-                if content_length and int(content_length) > MAX_CONTENT_SIZE:
-                    return BuiltinToolResult(
-                        success=False,
-                        error=f"Content too large: {int(content_length)} bytes (max: {MAX_CONTENT_SIZE})",
-                    )
-            except Exception:  # nosec B110 - HEAD request failure is non-critical, continue to GET
-                pass
-
-            response = await client.get(url)
-            response.raise_for_status()
-
-            content_type = response.headers.get("content-type", "").lower()
-            content_length = len(response.content)
-
-            if content_length > MAX_CONTENT_SIZE:
-                return BuiltinToolResult(
-                    success=False,
-                    error=f"Content too large: {content_length} bytes (max: {MAX_CONTENT_SIZE})",
-                )
+        client = await get_http_client()
+        response = await client.fetch(url, max_bytes=MAX_CONTENT_SIZE)
+        response.raise_for_status()
 
-            if is_text_content(content_type):
-                content = response.text
-                if extract_text and "html" in content_type:
-                    content = _extract_text_from_html(content)
+        content_type = response.headers.get("content-type", "").lower()
+        content_length = len(response.content)
+        cache_status = response.extensions.get("fetch_cache", "miss")
 
+        if is_text_content(content_type):
+            content = response.text
+            if extract_text and "html" in content_type:
+                content = _extract_text_from_html(content)
+
+            return BuiltinToolResult(
+                success=True,
+                result=content,
+                metadata={
+                    "url": str(response.url),
+                    "status_code": response.status_code,
+                    "content_length": content_length,
+                    "content_type": content_type.split(";")[0].strip(),
+                    "cache": cache_status,
+                },
+            )
+
+        elif is_json_content(content_type):
+            try:
+                json_content = response.json()
                 return BuiltinToolResult(
                     success=True,
-                    result=content,
+                    result=json_content,
                     metadata={
                         "url": str(response.url),
                         "status_code": response.status_code,
                         "content_length": content_length,
-                        "content_type": content_type.split(";")[0].strip(),
+                        "content_type": "application/json",
+                        "cache": cache_status,
                     },
                 )
-
-            elif is_json_content(content_type):
-                try:
-                    json_content = response.json()
-                    return BuiltinToolResult(
-                        success=True,
-                        result=json_content,
-                        metadata={
-                            "url": str(response.url),
-                            "status_code": response.status_code,
-                            "content_length": content_length,
-                            "content_type": "application/json",
-                        },
-                    )
-                except Exception:
-                    return BuiltinToolResult(
-                        success=True,
-                        result=response.text,
-                        metadata={
-                            "url": str(response.url),
-                            "status_code": response.status_code,
-                            "content_length": content_length,
-                            "content_type": content_type.split(";")[0].strip(),
-                        },
-                    )
-
-            else:
-                # Binary content
-                filename = save_as_file or extract_filename(response, url)
-                workspace_dir = get_workspace_dir(user_context)
-                cleanup_old_files(workspace_dir)
-                file_path = os.path.join(workspace_dir, filename)
-
-                os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else workspace_dir, exist_ok=True)
-
-                with open(file_path, "wb") as f:
-                    f.write(response.content)
-
-                logger.info(f"Auto-saved binary file: {filename} ({content_length} bytes)")
-
+            except Exception:
                 return BuiltinToolResult(
                     success=True,
-                    result={
-                        "message": f"Binary file saved to workspace: {filename}",
-                        "filename": filename,
-                        "path": file_path,
-                        "size_bytes": content_length,
-                        "content_type": content_type.split(";")[0].strip(),
-                    },
+                    result=response.text,
                     metadata={
                         "url": str(response.url),
                         "status_code": response.status_code,
                         "content_length": content_length,
-                        "filename": filename,
-                        "is_binary": True,
-                        "saved_to_workspace": True,
                         "content_type": content_type.split(";")[0].strip(),
+                        "cache": cache_status,
                     },
                 )
 
+        else:
+            # Binary content
+            filename = save_as_file or extract_filename(response, url)
+            saved_path = await asyncio.to_thread(_save_to_workspace, user_context, filename, response.content)
+            if saved_path is None:
+                return BuiltinToolResult(success=False, error="Workspace quota exceeded. Delete or overwrite files, or wait for them to expire.")
+            file_path = saved_path
+
+            logger.info(f"Auto-saved binary file: {filename} ({content_length} bytes)")
+
+            return BuiltinToolResult(
+                success=True,
+                result={
+                    "message": f"Binary file saved to workspace: {filename}",
+                    "filename": filename,
+                    "path": file_path,
+                    "size_bytes": content_length,
+                    "content_type": content_type.split(";")[0].strip(),
+                },
+                metadata={
+                    "url": str(response.url),
+                    "status_code": response.status_code,
+                    "content_length": content_length,
+                    "filename": filename,
+                    "is_binary": True,
+                    "saved_to_workspace": True,
+                    "content_type": content_type.split(";")[0].strip(),
+                    "cache": cache_status,
+                },
+            )
+
+    except ContentTooLargeError as e:
+        return BuiltinToolResult(success=False, error=str(e))
     except httpx.TimeoutException:
         return BuiltinToolResult(success=False, error=f"Request timed out after {FETCH_TIMEOUT} seconds")
     except httpx.HTTPStatusError as e:
@@ -172,20 +182,20 @@ async def execute_web_search(arguments: dict[str, Any], user_context: UserContex
     logger.info(f"Web search: {query}")
 
     try:
-        async with httpx.AsyncClient(timeout=FETCH_TIMEOUT) as client:
-            response = await client.get(
-                "https://html.duckduckgo.com/html/",
-                params={"q": query, "kl": region},
-                headers={"User-Agent": "Mozilla/5.0 (compatible; MCPToolsProvider/1.0)"},
-            )
-            response.raise_for_status()
+        client = await get_http_client()
+        response = await client.fetch(
+            "https://html.duckduckgo.com/html/",
+            params={"q": query, "kl": region},
+            headers={"User-Agent": "Mozilla/5.0 (compatible; MCPToolsProvider/1.0)"},
+        )
+        response.raise_for_status()
 
-            results = _parse_ddg_results(response.text, max_results)
+        results = _parse_ddg_results(response.text, max_results)
 
-            return BuiltinToolResult(
-                success=True,
-                result={"query": query, "results": results, "result_count": len(results)},
-            )
+        return BuiltinToolResult(
+            success=True,
+            result={"query": query, "results": results, "result_count": len(results)},
+        )
 
     except Exception as e:
         logger.exception(f"Web search failed: {e}")
@@ -204,48 +214,48 @@ async def execute_wikipedia_query(arguments: dict[str, Any], user_context: UserC
     logger.info(f"Wikipedia query: {query}")
 
     try:
-        async with httpx.AsyncClient(timeout=FETCH_TIMEOUT) as client:
-            search_url = f"https://{language}.wikipedia.org/api/rest_v1/page/summary/{quote(query)}"
-            response = await client.get(
-                search_url,
-                headers={"User-Agent": "MCPToolsProvider/1.0 (https://github.com/tools-provider)"},
+        client = await get_http_client()
+        search_url = f"https://{language}.wikipedia.org/api/rest_v1/page/summary/{quote(query)}"
+        response = await client.fetch(
+            search_url,
+            headers={"User-Agent": "MCPToolsProvider/1.0 (https://github.com/tools-provider)"},
+        )
+
+        if response.status_code == 404:
+            search_api = f"https://{language}.wikipedia.org/w/api.php"
+            search_response = await client.fetch(
+                search_api,
+                params={"action": "opensearch", "search": query, "limit": 1, "format": "json"},
             )
+            search_data = search_response.json()
 
-            if response.status_code == 404:
-                search_api = f"https://{language}.wikipedia.org/w/api.php"
-                search_response = await client.get(
-                    search_api,
-                    params={"action": "opensearch", "search": query, "limit": 1, "format": "json"},
+            if len(search_data) >= 4 and search_data[1]:
+                actual_title = search_data[1][0]
+                response = await client.fetch(
+                    f"https://{language}.wikipedia.org/api/rest_v1/page/summary/{quote(actual_title)}",
+                    headers={"User-Agent": "MCPToolsProvider/1.0"},
                 )
-                search_data = search_response.json()
-
-                if len(search_data) >= 4 and search_data[1]:
-                    actual_title = search_data[1][0]
-                    response = await client.get(
-                        f"https://{language}.wikipedia.org/api/rest_v1/page/summary/{quote(actual_title)}",
-                        headers={"User-Agent": "MCPToolsProvider/1.0"},
-                    )
-                else:
-                    return BuiltinToolResult(success=False, error=f"No Wikipedia article found for: {query}")
+            else:
+                return BuiltinToolResult(success=False, error=f"No Wikipedia article found for: {query}")
 
-            response.raise_for_status()
-            data = response.json()
+        response.raise_for_status()
+        data = response.json()
 
-            extract = data.get("extract", "")
-            if sentences < 10 and extract:
-                sentence_list = re.split(r"(?<=[.!?])\s+", extract)
-                extract = " ".join(sentence_list[:sentences])
+        extract = data.get("extract", "")
+        if sentences < 10 and extract:
+            sentence_list = re.split(r"(?<=[.!?])\s+", extract)
+            extract = " ".join(sentence_list[:sentences])
 
-            return BuiltinToolResult(
-                success=True,
-                result={
-                    "title": data.get("title", ""),
-                    "summary": extract,
-                    "description": data.get("description", ""),
-                    "url": data.get("content_urls", {}).get("desktop", {}).get("page", ""),
-                    "thumbnail": data.get("thumbnail", {}).get("source", ""),
-                },
-            )
+        return BuiltinToolResult(
+            success=True,
+            result={
+                "title": data.get("title", ""),
+                "summary": extract,
+                "description": data.get("description", ""),
+                "url": data.get("content_urls", {}).get("desktop", {}).get("page", ""),
+                "thumbnail": data.get("thumbnail", {}).get("source", ""),
+            },
+        )
 
     except Exception as e:
         logger.exception(f"Wikipedia query failed: {e}")
@@ -5,30 +5,41 @@ Tools for file operations:
 - file_reader: Read content from files
 - spreadsheet_read: Read Excel spreadsheets
 - spreadsheet_write: Write Excel spreadsheets
+
+All workspace file I/O runs in a worker thread, off the event loop. Expired
+files are removed by the WorkspaceJanitor, not by the tools.
 """
 
+import asyncio
 import base64
+import hashlib
+import heapq
 import json
 import logging
 import os
-import tempfile
-import time
+import threading
+from collections import OrderedDict
 from typing import Any
 from urllib.parse import quote
 
 from .base import BuiltinToolResult, UserContext
+from .workspace import AGENT_WORKSPACE_BASE_DIR, WORKSPACE_FILE_TTL_HOURS, get_workspace_index
 
 logger = logging.getLogger(__name__)
 
-# Workspace TTL in hours
-WORKSPACE_FILE_TTL_HOURS = 24
 # Maximum cell value length
 MAX_CELL_VALUE_LENGTH = 500
+# Number of minimum hashes kept per column for the distinct-count estimate
+DISTINCT_SKETCH_SIZE = 1024
+# Number of (file, mtime, sheet) entries kept in the spreadsheet stats cache
+SPREADSHEET_STATS_CACHE_SIZE = 64
+
+_HASH_SPACE = float(2**64)
 
 
 def _get_workspace_dir(user_context: UserContext | None) -> str:
     """Get the agent workspace directory for the current user."""
-    base_dir = os.path.join(tempfile.gettempdir(), "agent_workspace")
+    base_dir = AGENT_WORKSPACE_BASE_DIR
 
     if user_context:
         safe_user_id = "".join(c for c in user_context.user_id if c.isalnum() or c in "-_")
@@ -48,25 +59,9 @@ def _get_download_url(filename: str) -> str:
     return f"/api/files/{quote(filename)}"
 
 
-def _cleanup_old_files(workspace_dir: str, ttl_hours: int = 24) -> int:
-    """Remove files older than TTL from workspace."""
-    removed = 0
-    now = time.time()
-    ttl_seconds = ttl_hours * 3600
-
-    try:
-        for filename in os.listdir(workspace_dir):
-            filepath = os.path.join(workspace_dir, filename)
-            if os.path.isfile(filepath):
-                file_age = now - os.path.getmtime(filepath)
-                if file_age > ttl_seconds:
-                    os.remove(filepath)
-                    removed += 1
-                    logger.debug(f"Cleaned up old file: {filename}")
-    except Exception as e:
-        logger.warning(f"Workspace cleanup error: {e}")
-
-    return removed
+def _quota_error() -> BuiltinToolResult:
+    quota_mb = get_workspace_index().quota_bytes / (1024 * 1024)
+    return BuiltinToolResult(success=False, error=f"Workspace quota of {quota_mb:g} MB exceeded. Delete or overwrite files, or wait for them to expire.")
 
 
 def _truncate_cell_value(value: Any, max_length: int | None = None) -> Any:
@@ -82,8 +77,111 @@ def _truncate_cell_value(value: Any, max_length: int | None = None) -> Any:
     return value
 
 
+class _ColumnStats:
+    """Single-pass accumulator for one spreadsheet column.
+
+    Tracks count, nulls, min/max, average and a distinct-count estimate without
+    keeping the column values. The distinct count uses a K-Minimum-Values
+    sketch, which is exact up to DISTINCT_SKETCH_SIZE distinct values.
+    """
+
+    __slots__ = ("count", "nulls", "numeric_count", "numeric_sum", "numeric_min", "numeric_max", "text_min", "text_max", "_sketch", "_sketch_members")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.nulls = 0
+        self.numeric_count = 0
+        self.numeric_sum = 0.0
+        self.numeric_min: int | float | None = None
+        self.numeric_max: int | float | None = None
+        self.text_min: str | None = None
+        self.text_max: str | None = None
+        self._sketch: list[int] = []  # max-heap (negated) of the smallest hashes seen
+        self._sketch_members: set[int] = set()
+
+    def add(self, value: Any) -> None:
+        if value is None or value == "":
+            self.nulls += 1
+            return
+
+        self.count += 1
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            self.numeric_count += 1
+            self.numeric_sum += value
+            if self.numeric_min is None or value < self.numeric_min:
+                self.numeric_min = value
+            if self.numeric_max is None or value > self.numeric_max:
+                self.numeric_max = value
+            text = repr(value)
+        else:
+            text = str(value)
+            if self.text_min is None or text < self.text_min:
+                self.text_min = text
+            if self.text_max is None or text > self.text_max:
+                self.text_max = text
+
+        self._add_to_sketch(int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big"))
+
+    def _add_to_sketch(self, value_hash: int) -> None:
+        if value_hash in self._sketch_members:
+            return
+        if len(self._sketch) < DISTINCT_SKETCH_SIZE:
+            heapq.heappush(self._sketch, -value_hash)
+            self._sketch_members.add(value_hash)
+        elif value_hash < -self._sketch[0]:
+            evicted = -heapq.heapreplace(self._sketch, -value_hash)
+            self._sketch_members.discard(evicted)
+            self._sketch_members.add(value_hash)
+
+    def distinct_estimate(self) -> int:
+        if len(self._sketch) < DISTINCT_SKETCH_SIZE:
+            return len(self._sketch)
+        kth_smallest = -self._sketch[0]
+        return int((DISTINCT_SKETCH_SIZE - 1) * _HASH_SPACE / (kth_smallest + 1))
+
+    def to_dict(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {"count": self.count, "nulls": self.nulls, "unique_count": self.distinct_estimate()}
+        if self.numeric_count and self.numeric_count == self.count:
+            stats["type"] = "numeric"
+            stats["min"] = self.numeric_min
+            stats["max"] = self.numeric_max
+            stats["avg"] = self.numeric_sum / self.numeric_count
+        else:
+            stats["type"] = "text" if not self.numeric_count else "mixed"
+            if self.text_min is not None:
+                stats["min"] = _truncate_cell_value(self.text_min)
+                stats["max"] = _truncate_cell_value(self.text_max)
+        return stats
+
+
+# (file_path, mtime_ns, size, sheet_name, columns) -> {"total_rows": int, "stats": dict}
+_spreadsheet_stats_cache: "OrderedDict[tuple, dict[str, Any]]" = OrderedDict()
+_spreadsheet_stats_lock = threading.Lock()
+
+
+def _get_cached_sheet_stats(key: tuple) -> dict[str, Any] | None:
+    with _spreadsheet_stats_lock:
+        entry = _spreadsheet_stats_cache.get(key)
+        if entry is not None:
+            _spreadsheet_stats_cache.move_to_end(key)
+        return entry
+
+
+def _cache_sheet_stats(key: tuple, entry: dict[str, Any]) -> None:
+    with _spreadsheet_stats_lock:
+        _spreadsheet_stats_cache[key] = entry
+        _spreadsheet_stats_cache.move_to_end(key)
+        while len(_spreadsheet_stats_cache) > SPREADSHEET_STATS_CACHE_SIZE:
+            _spreadsheet_stats_cache.popitem(last=False)
+
+
 async def execute_file_writer(arguments: dict[str, Any], user_context: UserContext | None = None) -> BuiltinToolResult:
     """Execute the file_writer tool."""
+    return await asyncio.to_thread(_write_file, arguments, user_context)
+
+
+def _write_file(arguments: dict[str, Any], user_context: UserContext | None = None) -> BuiltinToolResult:
+    """Blocking implementation of file_writer, run in a worker thread."""
     filename = arguments.get("filename", "")
     content = arguments.get("content", "")
     mode = arguments.get("mode", "overwrite")
@@ -123,28 +221,27 @@ async def execute_file_writer(arguments: dict[str, Any], user_context: UserConte
 
     try:
         workspace_dir = _get_workspace_dir(user_context)
-        _cleanup_old_files(workspace_dir)
         file_path = os.path.join(workspace_dir, filename)
 
         os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else workspace_dir, exist_ok=True)
 
         if is_binary:
             try:
-                binary_content = base64.b64decode(content)
+                payload: bytes = base64.b64decode(content)
             except Exception as e:
                 return BuiltinToolResult(success=False, error=f"Invalid base64 content: {str(e)}")
-
-            write_mode = "ab" if mode == "append" else "wb"
-            with open(file_path, write_mode) as f:
-                f.write(binary_content)
-
-            size_bytes = len(binary_content)
         else:
-            write_mode = "a" if mode == "append" else "w"
-            with open(file_path, write_mode, encoding="utf-8") as f:
-                f.write(content)
+            payload = content.encode("utf-8")
+        size_bytes = len(payload)
 
-            size_bytes = len(content.encode("utf-8"))
+        workspace_index = get_workspace_index()
+        existing_size = os.path.getsize(file_path) if mode == "append" and os.path.exists(file_path) else 0
+        if workspace_index.exceeds_quota(workspace_dir, file_path, existing_size + size_bytes):
+            return _quota_error()
+
+        with open(file_path, "ab" if mode == "append" else "wb") as f:
+            f.write(payload)
+        workspace_index.record_write(workspace_dir, file_path)
 
         download_url = _get_download_url(filename)
 
@@ -169,6 +266,11 @@ async def execute_file_writer(arguments: dict[str, Any], user_context: UserConte
 
 async def execute_file_reader(arguments: dict[str, Any], user_context: UserContext | None = None) -> BuiltinToolResult:
     """Execute the file_reader tool."""
+    return await asyncio.to_thread(_read_file, arguments, user_context)
+
+
+def _read_file(arguments: dict[str, Any], user_context: UserContext | None = None) -> BuiltinToolResult:
+    """Blocking implementation of file_reader, run in a worker thread."""
     filename = arguments.get("filename", "")
     encoding = arguments.get("encoding", "utf-8")
 
@@ -264,6 +366,11 @@ async def execute_file_reader(arguments: dict[str, Any], user_context: UserConte
 
 async def execute_spreadsheet_read(arguments: dict[str, Any], user_context: UserContext | None = None) -> BuiltinToolResult:
     """Execute the spreadsheet_read tool."""
+    return await asyncio.to_thread(_read_spreadsheet, arguments, user_context)
+
+
+def _read_spreadsheet(arguments: dict[str, Any], user_context: UserContext | None = None) -> BuiltinToolResult:
+    """Blocking implementation of spreadsheet_read, run in a worker thread."""
     filename = arguments.get("filename", "")
     sheet_name = arguments.get("sheet_name")
     include_stats = arguments.get("include_stats", True)
@@ -288,7 +395,6 @@ async def execute_spreadsheet_read(arguments: dict[str, Any], user_context: User
         from openpyxl import load_workbook
 
         workspace_dir = _get_workspace_dir(user_context)
-        _cleanup_old_files(workspace_dir)
         file_path = os.path.join(workspace_dir, filename)
 
         if not os.path.exists(file_path):
@@ -304,10 +410,9 @@ async def execute_spreadsheet_read(arguments: dict[str, Any], user_context: User
             ws = wb.active
             sheet_name = ws.title
 
-        all_rows = list(ws.iter_rows(values_only=True))
-        total_rows = len(all_rows)
+        header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
 
-        if total_rows == 0:
+        if header_row is None:
             wb.close()
             return BuiltinToolResult(
                 success=True,
@@ -321,9 +426,9 @@ async def execute_spreadsheet_read(arguments: dict[str, Any], user_context: User
                 },
             )
 
-        headers = [str(h) if h is not None else f"Column_{i + 1}" for i, h in enumerate(all_rows[0])]
+        headers = [str(h) if h is not None else f"Column_{i + 1}" for i, h in enumerate(header_row)]
 
-        column_indices = None
+        column_indices = list(range(len(headers)))
         if columns_filter:
             column_indices = [i for i, h in enumerate(headers) if h in columns_filter]
             if not column_indices:
@@ -331,22 +436,45 @@ async def execute_spreadsheet_read(arguments: dict[str, Any], user_context: User
                 return BuiltinToolResult(success=False, error=f"No matching columns found. Available: {headers}")
             headers = [headers[i] for i in column_indices]
 
-        data_rows = all_rows[1:]
-        total_data_rows = len(data_rows)
-
-        start_idx = offset
-        end_idx = min(offset + max_rows, total_data_rows)
-        paginated_rows = data_rows[start_idx:end_idx]
+        # Stats cover the whole sheet and are cached per file version, so paging is cheap
+        file_stat = os.stat(file_path)
+        cache_key = (file_path, file_stat.st_mtime_ns, file_stat.st_size, sheet_name, tuple(headers))
+        cached = _get_cached_sheet_stats(cache_key)
+        collect_stats = include_stats and cached is None
+        # Without cached stats the read-only dimension gives the row count; a full pass is only needed if it is missing
+        needs_full_pass = collect_stats or (cached is None and ws.max_row is None)
+
+        page_end = offset + max_rows
+        paginated_rows: list[tuple] = []
+
+        if needs_full_pass:
+            column_stats = [_ColumnStats() for _ in headers] if collect_stats else []
+            total_data_rows = 0
+            for row in ws.iter_rows(min_row=2, values_only=True):
+                if collect_stats:
+                    for accumulator, i in zip(column_stats, column_indices, strict=True):
+                        accumulator.add(row[i] if i < len(row) else None)
+                if offset <= total_data_rows < page_end:
+                    paginated_rows.append(row)
+                total_data_rows += 1
+
+            if collect_stats:
+                cached = {
+                    "total_rows": total_data_rows,
+                    "stats": {"columns": {header: acc.to_dict() for header, acc in zip(headers, column_stats, strict=True)}},
+                }
+                _cache_sheet_stats(cache_key, cached)
+        else:
+            # Rows before min_row are skipped by the reader without building cell values
+            paginated_rows = list(ws.iter_rows(min_row=offset + 2, max_row=page_end + 1, values_only=True))
+            total_data_rows = cached["total_rows"] if cached is not None else max(ws.max_row - 1, 0)
 
         data = []
         current_size = 0
         truncated_at_row = None
 
         for row_idx, row in enumerate(paginated_rows):
-            if column_indices:
-                row_data = {headers[j]: _truncate_cell_value(row[i]) for j, i in enumerate(column_indices)}
-            else:
-                row_data = {headers[i]: _truncate_cell_value(val) for i, val in enumerate(row)}
+            row_data = {headers[j]: _truncate_cell_value(row[i] if i < len(row) else None) for j, i in enumerate(column_indices)}
 
             row_json = json.dumps(row_data, default=str)
             row_size = len(row_json)
@@ -373,26 +501,8 @@ async def execute_spreadsheet_read(arguments: dict[str, Any], user_context: User
             result["truncated"] = True
             result["note"] = f"Results truncated to {len(data)} rows due to size limits. Use 'offset' parameter to paginate through remaining rows."
 
-        if include_stats and data:
-            stats = {"columns": {}}
-            for header in headers:
-                col_values = [row.get(header) for row in data if row.get(header) is not None]
-                col_stats = {"count": len(col_values)}
-
-                numeric_values = [v for v in col_values if isinstance(v, int | float)]
-
-                if numeric_values:
-                    col_stats["type"] = "numeric"
-                    col_stats["min"] = min(numeric_values)
-                    col_stats["max"] = max(numeric_values)
-                    col_stats["avg"] = sum(numeric_values) / len(numeric_values)
-                else:
-                    col_stats["type"] = "text"
-                    col_stats["unique_count"] = len(set(str(v) for v in col_values))
-
-                stats["columns"][header] = col_stats
-
-            result["stats"] = stats
+        if include_stats and cached is not None:
+            result["stats"] = cached["stats"]
 
         wb.close()
 
@@ -409,6 +519,11 @@ async def execute_spreadsheet_read(arguments: dict[str, Any], user_context: User
 
 async def execute_spreadsheet_write(arguments: dict[str, Any], user_context: UserContext | None = None) -> BuiltinToolResult:
     """Execute the spreadsheet_write tool."""
+    return await asyncio.to_thread(_write_spreadsheet, arguments, user_context)
+
+
+def _write_spreadsheet(arguments: dict[str, Any], user_context: UserContext | None = None) -> BuiltinToolResult:
+    """Blocking implementation of spreadsheet_write, run in a worker thread."""
     filename = arguments.get("filename", "")
     operation = arguments.get("operation", "create")
     sheet_name = arguments.get("sheet_name", "Sheet1")
@@ -431,9 +546,13 @@ async def execute_spreadsheet_write(arguments: dict[str, Any], user_context: Use
         from openpyxl import Workbook, load_workbook
 
         workspace_dir = _get_workspace_dir(user_context)
-        _cleanup_old_files(workspace_dir)
         file_path = os.path.join(workspace_dir, filename)
 
+        # Workbook sizes are only known after saving, so refuse writes once the quota is used up
+        workspace_index = get_workspace_index()
+        if workspace_index.exceeds_quota(workspace_dir, file_path, 0):
+            return _quota_error()
+
         if operation == "create":
             wb = Workbook()
             ws = wb.active
@@ -450,6 +569,7 @@ async def execute_spreadsheet_write(arguments: dict[str, Any], user_context: Use
 
             wb.save(file_path)
             wb.close()
+            workspace_index.record_write(workspace_dir, file_path)
 
             download_url = _get_download_url(filename)
 
@@ -489,6 +609,7 @@ async def execute_spreadsheet_write(arguments: dict[str, Any], user_context: Use
 
             wb.save(file_path)
             wb.close()
+            workspace_index.record_write(workspace_dir, file_path)
 
             download_url = _get_download_url(filename)
 
@@ -523,6 +644,7 @@ async def execute_spreadsheet_write(arguments: dict[str, Any], user_context: Use
 
             wb.save(file_path)
             wb.close()
+            workspace_index.record_write(workspace_dir, file_path)
 
             download_url = _get_download_url(filename)
 
@@ -564,6 +686,7 @@ async def execute_spreadsheet_write(arguments: dict[str, Any], user_context: Use
 
             wb.save(file_path)
             wb.close()
+            workspace_index.record_write(workspace_dir, file_path)
 
             download_url = _get_download_url(filename)
 
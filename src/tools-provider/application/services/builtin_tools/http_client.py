@@ -0,0 +1,531 @@
+"""Shared HTTP client and response cache for the fetch tools.
+
+- One pooled ``httpx.AsyncClient`` is shared by fetch_url, web_search and
+  wikipedia_query instead of opening a client (and connections) per call
+- Bodies are streamed and the read is aborted as soon as the size limit is
+  crossed, instead of buffering the whole body first
+- Successful GET responses are kept in an HTTP cache shared by all users
+  (Redis or a bounded local disk LRU) that honours Cache-Control, Expires,
+  ETag and Last-Modified: fresh entries are served without a request and
+  stale ones are revalidated with a conditional request. As a shared cache,
+  it never stores ``private`` responses and prefers ``s-maxage``
+
+``fetch()`` returns a fully read ``httpx.Response``; whether it came from the
+cache is reported in ``response.extensions["fetch_cache"]`` ("hit",
+"revalidated" or "miss").
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from neuroglia.hosting.abstractions import HostedService
+
+from application.settings import Settings
+
+from .base import FETCH_TIMEOUT, MAX_CONTENT_SIZE
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+logger = logging.getLogger(__name__)
+
+# Directory of the local disk cache backend
+FETCH_CACHE_DIR = os.path.join(tempfile.gettempdir(), "tools-provider-fetch-cache")
+# Status codes whose responses are stored
+CACHEABLE_STATUS_CODES = {200, 203}
+# How long a stale entry with validators is kept for revalidation
+STALE_RETENTION_SECONDS = 86400
+
+
+class ContentTooLargeError(Exception):
+    """Raised when a response body exceeds the size limit."""
+
+    def __init__(self, size: int, max_bytes: int):
+        super().__init__(f"Content too large: {size} bytes (max: {max_bytes})")
+        self.size = size
+        self.max_bytes = max_bytes
+
+
+# =============================================================================
+# Cache entries and freshness
+# =============================================================================
+
+
+@dataclass
+class CachedResponse:
+    """A stored response.
+
+    Attributes:
+        url: Final URL (after redirects)
+        status_code: HTTP status code
+        headers: Response headers as (name, value) pairs
+        body: Response body
+        stored_at: When the response was stored or last revalidated (epoch seconds)
+        fresh_until: Until when the response may be served without revalidation (epoch seconds)
+    """
+
+    url: str
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    stored_at: float
+    fresh_until: float
+
+    @property
+    def etag(self) -> str | None:
+        return _header(self.headers, "etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return _header(self.headers, "last-modified")
+
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.fresh_until
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["body"] = base64.b64encode(self.body).decode("ascii")
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "CachedResponse":
+        data = json.loads(raw)
+        data["body"] = base64.b64decode(data["body"])
+        data["headers"] = [tuple(pair) for pair in data["headers"]]
+        return cls(**data)
+
+    def to_response(self, cache_status: str) -> httpx.Response:
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.body,
+            request=httpx.Request("GET", self.url),
+            extensions={"fetch_cache": cache_status},
+        )
+
+
+def _header(headers: list[tuple[str, str]], name: str) -> str | None:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _parse_cache_control(value: str | None) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: httpx.Headers, now: float, heuristic_max_age: float) -> float | None:
+    """Compute how long a response stays fresh (RFC 9111, shared cache).
+
+    Returns:
+        Lifetime in seconds, or None if the response must not be stored
+    """
+    cache_control = _parse_cache_control(headers.get("cache-control"))
+    if "no-store" in cache_control or "private" in cache_control or headers.get("vary", "").strip() == "*":
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+
+    max_age = cache_control.get("s-maxage", cache_control.get("max-age"))
+    if max_age is not None:
+        try:
+            return max(float(max_age) - float(headers.get("age", 0) or 0), 0.0)
+        except ValueError:
+            return 0.0
+
+    date = _parse_http_date(headers.get("date")) or now
+    expires = _parse_http_date(headers.get("expires"))
+    if headers.get("expires") is not None:
+        return max(expires - date, 0.0) if expires is not None else 0.0
+
+    last_modified = _parse_http_date(headers.get("last-modified"))
+    if last_modified is not None:
+        # Heuristic freshness: 10% of the time since the last modification
+        return min(max(date - last_modified, 0.0) * 0.1, heuristic_max_age)
+    return 0.0
+
+
+# =============================================================================
+# Cache backends
+# =============================================================================
+
+
+class DiskHttpCacheBackend:
+    """Local disk cache bounded by total size, evicting least recently used entries."""
+
+    def __init__(self, directory: str = FETCH_CACHE_DIR, max_bytes: int = 100 * 1024 * 1024):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] | None = None
+        self._total_bytes = 0
+
+    async def get(self, key: str) -> CachedResponse | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, entry: CachedResponse, ttl_seconds: float) -> None:
+        await asyncio.to_thread(self._set, key, entry.to_json())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.json")
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        if self._entries is None:
+            os.makedirs(self._directory, exist_ok=True)
+            files = []
+            for entry in os.scandir(self._directory):
+                if entry.name.endswith(".json") and entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+            self._entries = OrderedDict((key, size) for _, key, size in sorted(files))
+            self._total_bytes = sum(self._entries.values())
+        return self._entries
+
+    def _get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entries = self._load_index()
+            if key not in entries:
+                return None
+            entries.move_to_end(key)
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return CachedResponse.from_json(f.read())
+        except (OSError, ValueError, KeyError, TypeError):
+            self._remove(key)
+            return None
+
+    def _set(self, key: str, raw: str) -> None:
+        size = len(raw)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            entries = self._load_index()
+            tmp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(raw)
+            os.replace(tmp_path, self._path(key))
+            self._total_bytes += size - entries.pop(key, 0)
+            entries[key] = size
+            while self._total_bytes > self._max_bytes and entries:
+                evicted, evicted_size = entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+                try:
+                    os.remove(self._path(evicted))
+                except OSError:
+                    pass
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            entries = self._load_index()
+            self._total_bytes -= entries.pop(key, 0)
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+
+class RedisHttpCacheBackend:
+    """Redis cache on the shared RedisCacheService connection; entries expire with the Redis key TTL."""
+
+    def __init__(self, cache_service: Any, key_prefix: str = "mcp:fetch:"):
+        self._cache_service = cache_service
+        self._key_prefix = key_prefix
+
+    async def get(self, key: str) -> CachedResponse | None:
+        try:
+            raw = await self._cache_service.client.get(f"{self._key_prefix}{key}")
+            return CachedResponse.from_json(raw) if raw else None
+        except Exception as e:
+            logger.warning(f"Fetch cache read failed: {e}")
+            return None
+
+    async def set(self, key: str, entry: CachedResponse, ttl_seconds: float) -> None:
+        try:
+            await self._cache_service.client.set(f"{self._key_prefix}{key}", entry.to_json(), ex=max(int(ttl_seconds), 1))
+        except Exception as e:
+            logger.warning(f"Fetch cache write failed: {e}")
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+
+class CachingHttpClient(HostedService):
+    """Pooled HTTP client with streaming size limits and a shared response cache.
+
+    Implements HostedService for automatic lifecycle management:
+    - start_async(): Nothing to do, the pool is opened on first use
+    - stop_async(): Closes the pooled connections
+    """
+
+    def __init__(
+        self,
+        cache_backend: DiskHttpCacheBackend | RedisHttpCacheBackend | None = None,
+        max_connections: int = 100,
+        heuristic_max_age_seconds: float = 3600,
+        max_entry_bytes: int = MAX_CONTENT_SIZE,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            cache_backend: Where responses are cached (None disables caching)
+            max_connections: Connection pool size
+            heuristic_max_age_seconds: Cap on freshness derived from Last-Modified
+            max_entry_bytes: Larger responses are not cached
+            transport: Optional custom transport (e.g. for tests)
+        """
+        self._cache = cache_backend
+        self._limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max(max_connections // 5, 1))
+        self._heuristic_max_age = heuristic_max_age_seconds
+        self._max_entry_bytes = max_entry_bytes
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled client; connections are loop-specific, so a new loop gets a new pool."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=FETCH_TIMEOUT, follow_redirects=True, max_redirects=5, limits=self._limits, transport=self._transport)
+            self._loop = loop
+        return self._client
+
+    async def fetch(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        max_bytes: int = MAX_CONTENT_SIZE,
+        use_cache: bool = True,
+    ) -> httpx.Response:
+        """GET a URL through the cache.
+
+        Args:
+            url: URL to fetch
+            params: Query parameters
+            headers: Request headers
+            max_bytes: Abort the read once the body exceeds this size
+            use_cache: Whether to read and write the response cache
+
+        Returns:
+            A fully read response (any status code)
+
+        Raises:
+            ContentTooLargeError: If the body exceeds max_bytes
+            httpx.HTTPError: On transport errors
+        """
+        request_url = str(httpx.URL(url, params=params))
+        cache = self._cache if use_cache else None
+        key = self._cache_key(request_url, headers)
+        cached = await cache.get(key) if cache else None
+        now = time.time()
+
+        if cached is not None and cached.is_fresh(now):
+            return cached.to_response("hit")
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        status_code, response_headers, body, final_url = await self._stream(request_url, request_headers, max_bytes)
+
+        if cached is not None and status_code == 304:
+            # Not modified: keep the body, refresh the headers and freshness
+            merged = httpx.Headers(cached.headers)
+            merged.update(response_headers)
+            lifetime = freshness_lifetime(merged, now, self._heuristic_max_age) or 0.0
+            cached.headers = list(merged.multi_items())
+            cached.stored_at = now
+            cached.fresh_until = now + lifetime
+            await self._store(cache, key, cached, lifetime)
+            return cached.to_response("revalidated")
+
+        response = httpx.Response(
+            status_code=status_code,
+            headers=response_headers,
+            content=body,
+            request=httpx.Request("GET", final_url),
+            extensions={"fetch_cache": "miss"},
+        )
+        if cache is not None and status_code in CACHEABLE_STATUS_CODES and len(body) <= self._max_entry_bytes:
+            lifetime = freshness_lifetime(response_headers, now, self._heuristic_max_age)
+            if lifetime is not None:
+                entry = CachedResponse(
+                    url=final_url,
+                    status_code=status_code,
+                    headers=list(response_headers.multi_items()),
+                    body=body,
+                    stored_at=now,
+                    fresh_until=now + lifetime,
+                )
+                if lifetime > 0 or entry.has_validators():
+                    await self._store(cache, key, entry, lifetime)
+        return response
+
+    async def _stream(self, url: str, headers: dict[str, str], max_bytes: int) -> tuple[int, httpx.Headers, bytes, str]:
+        client = self._get_client()
+        async with client.stream("GET", url, headers=headers) as response:
+            declared = response.headers.get("content-length")
+            if declared and declared.isdigit() and int(declared) > max_bytes:
+                raise ContentTooLargeError(int(declared), max_bytes)
+
+            chunks: list[bytes] = []
+            size = 0
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ContentTooLargeError(size, max_bytes)
+                chunks.append(chunk)
+
+            # Decoded body: drop the encoding headers that described the wire format
+            response_headers = httpx.Headers([(k, v) for k, v in response.headers.multi_items() if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")])
+            return response.status_code, response_headers, b"".join(chunks), str(response.url)
+
+    async def _store(self, cache: Any, key: str, entry: CachedResponse, lifetime: float) -> None:
+        ttl = lifetime + (STALE_RETENTION_SECONDS if entry.has_validators() else 0)
+        if ttl > 0:
+            await cache.set(key, entry, ttl)
+
+    @staticmethod
+    def _cache_key(url: str, headers: dict[str, str] | None) -> str:
+        material = json.dumps([url, sorted((k.lower(), v) for k, v in (headers or {}).items())])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def aclose(self) -> None:
+        """Close the pooled client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # =========================================================================
+    # HostedService Lifecycle Methods
+    # =========================================================================
+
+    async def start_async(self) -> None:
+        """Nothing to start: the connection pool is opened on first use."""
+
+    async def stop_async(self) -> None:
+        """Close the pooled connections on shutdown."""
+        await self.aclose()
+        logger.info("✅ CachingHttpClient stopped")
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def create(settings: Settings, cache_service: Any | None = None) -> "CachingHttpClient":
+        """Create a fetch client from settings.
+
+        The cache backend is Redis (through ``cache_service``) when ``fetch_cache_backend``
+        is "redis" and a RedisCacheService is available, otherwise the local disk
+        cache (or none if set to "none").
+
+        Args:
+            settings: Application settings
+            cache_service: Optional RedisCacheService for the "redis" backend
+
+        Returns:
+            The client
+        """
+        backend: DiskHttpCacheBackend | RedisHttpCacheBackend | None = None
+        if settings.fetch_cache_backend == "redis":
+            if cache_service is not None:
+                backend = RedisHttpCacheBackend(cache_service)
+            else:
+                logger.warning("Redis fetch cache requested but RedisCacheService is not available, using disk cache")
+        if backend is None and settings.fetch_cache_backend != "none":
+            backend = DiskHttpCacheBackend(max_bytes=settings.fetch_cache_max_mb * 1024 * 1024)
+
+        return CachingHttpClient(
+            cache_backend=backend,
+            max_connections=settings.fetch_max_connections,
+            heuristic_max_age_seconds=settings.fetch_cache_heuristic_max_age_seconds,
+        )
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Configure the process-wide fetch client and register it as a HostedService.
+
+        Resolves RedisCacheService from the DI container if available.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        global _http_client
+        from application.settings import app_settings
+        from infrastructure.cache import RedisCacheService
+
+        logger.info("🔧 Configuring CachingHttpClient...")
+
+        cache_service: RedisCacheService | None = None
+        for desc in builder.services:
+            if desc.service_type == RedisCacheService and desc.singleton is not None:
+                cache_service = desc.singleton
+                break
+
+        _http_client = CachingHttpClient.create(app_settings, cache_service)
+        builder.services.add_singleton(CachingHttpClient, singleton=_http_client)
+        builder.services.add_singleton(HostedService, singleton=_http_client)
+        logger.info(f"✅ CachingHttpClient configured (fetch_cache_backend={app_settings.fetch_cache_backend})")
+
+        return builder
+
+
+_http_client: CachingHttpClient | None = None
+_http_client_lock = asyncio.Lock()
+
+
+async def get_http_client() -> CachingHttpClient:
+    """Get the process-wide fetch client.
+
+    The client registered by ``CachingHttpClient.configure`` is returned; outside
+    the application (scripts, tests) one is created from settings on first use,
+    without the Redis backend.
+    """
+    global _http_client
+
+    if _http_client is not None:
+        return _http_client
+    async with _http_client_lock:
+        if _http_client is None:
+            _http_client = CachingHttpClient.create(Settings())
+    return _http_client
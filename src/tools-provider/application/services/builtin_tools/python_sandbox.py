@@ -0,0 +1,249 @@
+"""Process pool for the execute_python sandbox.
+
+Agent code runs in separate, single-use interpreter processes
+(see python_sandbox_worker.py) instead of threads of the server process:
+- Workers are started ahead of time with RestrictedPython and the allowed
+  modules already imported, so a run does not pay the interpreter startup
+- Results are awaited asynchronously; the event loop is never blocked
+- A run that exceeds its timeout is killed, not abandoned
+- Each worker has an address-space (memory) and CPU-time limit
+- Runs execute in parallel across cores, one process per run
+
+The pool is registered as a HostedService: the idle workers are started
+with the application and stopped on shutdown.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING, Any
+
+from neuroglia.hosting.abstractions import HostedService
+
+from application.settings import Settings
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "python_sandbox_worker.py")
+
+# Seconds to wait for a new worker to report readiness
+WORKER_STARTUP_TIMEOUT = 15.0
+# Extra seconds granted on top of the run timeout before the worker is killed
+KILL_GRACE_SECONDS = 0.5
+# Maximum size of a worker response line
+MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+
+
+class PythonSandboxPool(HostedService):
+    """Pool of pre-warmed, single-use sandbox worker processes.
+
+    The pool keeps ``size`` idle workers ready. Each run takes one, and a
+    replacement is started in the background once the run finishes. At most
+    ``max_concurrency`` runs execute at the same time.
+
+    Implements HostedService for automatic lifecycle management:
+    - start_async(): Starts the idle workers (warm_up)
+    - stop_async(): Stops the idle workers (close)
+    """
+
+    def __init__(self, size: int = 2, max_concurrency: int = 4, memory_limit_mb: int = 256):
+        """Initialize the pool.
+
+        Args:
+            size: Number of idle workers kept ready
+            max_concurrency: Maximum number of concurrent runs
+            memory_limit_mb: Address-space limit per worker (0 disables the limit)
+        """
+        self._size = size
+        self._max_concurrency = max_concurrency
+        self._memory_limit_mb = memory_limit_mb
+        self._idle: list[asyncio.subprocess.Process] = []
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._replenish_task: asyncio.Task | None = None
+
+    def _bind_loop(self) -> None:
+        """Bind the pool to the running loop; subprocess transports are loop-specific."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        for process in self._idle:
+            _kill_quietly(process)
+        self._idle = []
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._replenish_task = None
+
+    async def _spawn_worker(self) -> asyncio.subprocess.Process:
+        """Start a worker and wait until its imports are done."""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-I",
+            WORKER_SCRIPT,
+            str(self._memory_limit_mb),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=MAX_RESPONSE_BYTES,
+        )
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), timeout=WORKER_STARTUP_TIMEOUT)  # type: ignore[union-attr]
+            if not line or not json.loads(line).get("ready"):
+                raise RuntimeError("Sandbox worker failed to start")
+        except BaseException:
+            await _kill(process)
+            raise
+        return process
+
+    async def _replenish(self) -> None:
+        try:
+            while len(self._idle) < self._size:
+                self._idle.append(await self._spawn_worker())
+        except Exception as e:
+            logger.warning(f"Failed to pre-warm sandbox worker: {e}")
+
+    def _schedule_replenish(self) -> None:
+        if self._size > 0 and (self._replenish_task is None or self._replenish_task.done()):
+            self._replenish_task = asyncio.create_task(self._replenish())
+
+    async def warm_up(self) -> None:
+        """Start the idle workers now instead of on first use."""
+        self._bind_loop()
+        await self._replenish()
+
+    async def start_async(self) -> None:
+        """Start the idle workers with the application."""
+        await self.warm_up()
+        logger.info(f"✅ PythonSandboxPool started ({len(self._idle)} idle workers)")
+
+    async def stop_async(self) -> None:
+        """Stop the idle workers on shutdown."""
+        await self.close()
+        logger.info("✅ PythonSandboxPool stopped")
+
+    async def execute(self, code: str, timeout: float) -> dict[str, Any]:
+        """Run code in a sandbox worker.
+
+        Args:
+            code: Python source code
+            timeout: Wall-clock limit in seconds
+
+        Returns:
+            Dictionary with success, stdout, result and error
+        """
+        self._bind_loop()
+        assert self._semaphore is not None  # nosec B101
+
+        async with self._semaphore:
+            process = self._idle.pop() if self._idle else await self._spawn_worker()
+            self._schedule_replenish()
+            try:
+                job = json.dumps({"code": code, "timeout": timeout}).encode("utf-8") + b"\n"
+                process.stdin.write(job)  # type: ignore[union-attr]
+                await process.stdin.drain()  # type: ignore[union-attr]
+                try:
+                    line = await asyncio.wait_for(process.stdout.readline(), timeout=timeout + KILL_GRACE_SECONDS)  # type: ignore[union-attr]
+                except TimeoutError:
+                    return {"success": False, "error": f"Execution timed out after {timeout} seconds"}
+
+                if not line:
+                    # The worker died: usually the CPU or memory limit was hit
+                    return_code = await process.wait()
+                    return {"success": False, "error": f"Execution aborted: sandbox process exited with code {return_code} (resource limit exceeded?)"}
+                return json.loads(line)
+            finally:
+                await _kill(process)
+
+    async def close(self) -> None:
+        """Stop all idle workers."""
+        if self._replenish_task is not None:
+            self._replenish_task.cancel()
+            try:
+                await self._replenish_task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+            self._replenish_task = None
+        idle, self._idle = self._idle, []
+        for process in idle:
+            await _kill(process)
+
+    @staticmethod
+    def create(settings: Settings) -> "PythonSandboxPool":
+        """Create a sandbox pool from settings.
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            The pool
+        """
+        return PythonSandboxPool(
+            size=settings.python_sandbox_pool_size,
+            max_concurrency=settings.python_sandbox_max_concurrency,
+            memory_limit_mb=settings.python_sandbox_memory_limit_mb,
+        )
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Configure the process-wide sandbox pool and register it as a HostedService.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        global _sandbox_pool
+        from application.settings import app_settings
+
+        _sandbox_pool = PythonSandboxPool.create(app_settings)
+        builder.services.add_singleton(PythonSandboxPool, singleton=_sandbox_pool)
+        builder.services.add_singleton(HostedService, singleton=_sandbox_pool)
+        logger.info(f"✅ PythonSandboxPool configured (size={app_settings.python_sandbox_pool_size}, max_concurrency={app_settings.python_sandbox_max_concurrency})")
+
+        return builder
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
+def _kill_quietly(process: asyncio.subprocess.Process) -> None:
+    """Kill a worker owned by another (possibly closed) event loop."""
+    try:
+        os.kill(process.pid, 9)
+    except OSError:
+        pass
+
+
+_sandbox_pool: PythonSandboxPool | None = None
+
+
+def get_python_sandbox_pool() -> PythonSandboxPool:
+    """Get the process-wide sandbox pool.
+
+    The pool registered by ``PythonSandboxPool.configure`` is returned; outside
+    the application (scripts, tests) one is created from the application
+    settings on first use, and warms up on its first run.
+    """
+    global _sandbox_pool
+
+    if _sandbox_pool is None:
+        from application.settings import app_settings
+
+        _sandbox_pool = PythonSandboxPool.create(app_settings)
+    return _sandbox_pool
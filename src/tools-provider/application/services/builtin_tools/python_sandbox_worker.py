@@ -0,0 +1,262 @@
+"""Standalone worker process for the execute_python sandbox.
+
+This script is started by PythonSandboxPool as a separate interpreter
+(``python -I python_sandbox_worker.py``) and must not import anything from
+the application packages. Lifecycle of a worker:
+
+1. Pre-import RestrictedPython and the allowed modules, apply the memory limit
+2. Print a ``{"ready": true}`` line and wait for a single job on stdin
+3. Apply the CPU limit for the job, run it, print the JSON result and exit
+
+Workers are single-use so no state leaks between runs (or users).
+"""
+
+import ast
+import collections
+import datetime as dt
+import io
+import itertools
+import json
+import math
+import os
+import random
+import re
+import statistics
+import string
+import sys
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+from RestrictedPython import compile_restricted_eval, compile_restricted_exec, limited_builtins, safe_builtins, utility_builtins
+from RestrictedPython.Eval import default_guarded_getitem, default_guarded_getiter
+from RestrictedPython.Guards import guarded_iter_unpack_sequence, safer_getattr
+from RestrictedPython.PrintCollector import PrintCollector
+
+# Maximum captured stdout returned to the caller
+MAX_STDOUT_CHARS = 100_000
+
+ALLOWED_MODULES: dict[str, Any] = {
+    "math": math,
+    "json": json,
+    "re": re,
+    "datetime": dt,
+    "collections": collections,
+    "itertools": itertools,
+    "random": random,
+    "string": string,
+    "statistics": statistics,
+}
+
+ADDITIONAL_SAFE_BUILTINS: dict[str, Any] = {
+    "len": len,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "abs": abs,
+    "round": round,
+    "pow": pow,
+    "divmod": divmod,
+    "ord": ord,
+    "chr": chr,
+    "hex": hex,
+    "oct": oct,
+    "bin": bin,
+    "isinstance": isinstance,
+    "issubclass": issubclass,
+    "callable": callable,
+    "hash": hash,
+    "id": id,
+    "type": type,
+    "zip": zip,
+    "map": map,
+    "sum": sum,
+    "min": min,
+    "max": max,
+    "sorted": sorted,
+    "reversed": reversed,
+    "list": list,
+    "dict": dict,
+    "set": set,
+    "frozenset": frozenset,
+    "tuple": tuple,
+    "range": range,
+    "filter": filter,
+    "all": all,
+    "any": any,
+    "enumerate": enumerate,
+    "iter": iter,
+    "next": next,
+    "slice": slice,
+    "repr": repr,
+    "ascii": ascii,
+    "format": format,
+    "bytes": bytes,
+    "bytearray": bytearray,
+    "memoryview": memoryview,
+    "complex": complex,
+    "object": object,
+    "staticmethod": staticmethod,
+    "classmethod": classmethod,
+    "property": property,
+    "super": super,
+    "Exception": Exception,
+    "ValueError": ValueError,
+    "TypeError": TypeError,
+    "KeyError": KeyError,
+    "IndexError": IndexError,
+    "AttributeError": AttributeError,
+    "RuntimeError": RuntimeError,
+    "StopIteration": StopIteration,
+    "ZeroDivisionError": ZeroDivisionError,
+}
+
+
+def _guarded_import(name: str, globals: Any = None, locals: Any = None, fromlist: Any = (), level: int = 0) -> Any:
+    """Allow ``import`` of the pre-imported modules only."""
+    module_name = name.split(".")[0]
+    if level != 0 or module_name not in ALLOWED_MODULES:
+        raise ImportError(f"Import of '{name}' is not allowed. Allowed modules: {', '.join(sorted(ALLOWED_MODULES))}")
+    return ALLOWED_MODULES[module_name]
+
+
+def _build_builtins() -> dict[str, Any]:
+    combined: dict[str, Any] = {}
+    combined.update(safe_builtins)
+    combined.update(limited_builtins)
+    combined.update(utility_builtins)
+    combined.update(ADDITIONAL_SAFE_BUILTINS)
+    combined["__import__"] = _guarded_import
+    return combined
+
+
+def _to_json_safe(value: Any) -> Any:
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+def run_job(code: str) -> dict[str, Any]:
+    """Compile and run one piece of agent code.
+
+    Args:
+        code: Python source code
+
+    Returns:
+        Dictionary with success, stdout, result and error
+    """
+    stdout_capture = io.StringIO()
+
+    class StdoutPrinter(PrintCollector):
+        """Routes the restricted ``print`` to the captured stdout."""
+
+        def write(self, text: str) -> None:
+            stdout_capture.write(text)
+
+    main_code = None
+    expr_code_str = None
+    try:
+        tree = ast.parse(code)
+        if tree.body and isinstance(tree.body[-1], ast.Expr):
+            last_expr = tree.body.pop()
+            expr_code_str = ast.unparse(last_expr.value)
+        source = ast.unparse(tree) if tree.body else None
+    except SyntaxError:
+        source = code
+
+    if source is not None:
+        compile_result = compile_restricted_exec(source, "<agent_code>")
+        if compile_result.errors:
+            return {"success": False, "error": f"Compilation errors: {compile_result.errors}"}
+        main_code = compile_result.code
+
+    exec_globals: dict[str, Any] = {
+        "__builtins__": _build_builtins(),
+        "_getattr_": safer_getattr,
+        "_getitem_": default_guarded_getitem,
+        "_getiter_": default_guarded_getiter,
+        "_iter_unpack_sequence_": guarded_iter_unpack_sequence,
+        "_print_": StdoutPrinter,
+        **ALLOWED_MODULES,
+    }
+    local_vars: dict[str, Any] = {}
+    result_value: Any = None
+    has_expr_value = False
+
+    try:
+        if main_code is not None:
+            exec(main_code, exec_globals, local_vars)  # noqa: S102  # nosec B102
+
+        if expr_code_str is not None:
+            expr_result = compile_restricted_eval(expr_code_str, "<agent_expr>")
+            if expr_result.code and not expr_result.errors:
+                result_value = eval(expr_result.code, {**exec_globals, **local_vars}, local_vars)  # noqa: S307  # nosec B307
+                has_expr_value = True
+    except MemoryError:
+        return {"success": False, "error": "Execution exceeded the memory limit"}
+    except Exception as e:
+        return {"success": False, "error": f"Execution failed: {type(e).__name__}: {e}", "stdout": stdout_capture.getvalue()[:MAX_STDOUT_CHARS]}
+
+    if "result" in local_vars:
+        result_value = local_vars["result"]
+    elif not has_expr_value:
+        for var_name in ["output", "answer", "return_value", "res"]:
+            if var_name in local_vars:
+                result_value = local_vars[var_name]
+                break
+
+    return {"success": True, "stdout": stdout_capture.getvalue()[:MAX_STDOUT_CHARS], "result": _to_json_safe(result_value)}
+
+
+def _set_limit(limit: int, value: int) -> None:
+    if resource is None or value <= 0:
+        return
+    try:
+        _, hard = resource.getrlimit(limit)
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        resource.setrlimit(limit, (value, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def main() -> None:
+    memory_limit_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+
+    # Keep the protocol channel private and send anything else written to fd 1 to /dev/null
+    protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    sys.stdout = io.TextIOWrapper(os.fdopen(1, "wb"), encoding="utf-8")
+
+    if resource is not None:
+        _set_limit(resource.RLIMIT_AS, memory_limit_mb * 1024 * 1024)
+
+    protocol.write(json.dumps({"ready": True}) + "\n")
+    protocol.flush()
+
+    line = sys.stdin.readline()
+    if not line:
+        return
+    job = json.loads(line)
+
+    if resource is not None:
+        _set_limit(resource.RLIMIT_CPU, math.ceil(job.get("timeout", 30)) + 1)
+
+    try:
+        response = run_job(job["code"])
+    except MemoryError:
+        response = {"success": False, "error": "Execution exceeded the memory limit"}
+
+    protocol.write(json.dumps(response) + "\n")
+    protocol.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+"""Workspace file index, per-user quotas and background janitor.
+
+File tools no longer scan the user's workspace on every call to delete
+expired files. Instead:
+- WorkspaceIndex keeps a TTL index of workspace files (an expiry heap) and the
+  byte usage of each workspace; tools record every file they write
+- WorkspaceJanitor is a HostedService that deletes expired files on a schedule
+  and periodically rebuilds the index from disk to pick up files written by
+  other means
+
+Index methods do blocking file-system calls and are meant to be run in a worker
+thread (``asyncio.to_thread``), together with the tool's own file I/O.
+"""
+
+import asyncio
+import heapq
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from neuroglia.hosting.abstractions import HostedService
+
+from application.settings import Settings
+
+from .base import WORKSPACE_BASE_DIR
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+logger = logging.getLogger(__name__)
+
+# Root of the per-user workspaces used by the file tools and the files API
+AGENT_WORKSPACE_BASE_DIR = os.path.join(tempfile.gettempdir(), "agent_workspace")
+# Files are deleted this long after their last write
+WORKSPACE_FILE_TTL_HOURS = 24
+
+
+@dataclass
+class _IndexedFile:
+    """A workspace file known to the index.
+
+    Attributes:
+        workspace_dir: Workspace the file belongs to (quota accounting unit)
+        size: File size in bytes
+        expires_at: When the file expires (epoch seconds)
+    """
+
+    workspace_dir: str
+    size: int
+    expires_at: float
+
+
+class WorkspaceIndex:
+    """Thread-safe TTL index and usage accounting for user workspaces.
+
+    Workspaces are loaded lazily (one directory walk per workspace per process)
+    the first time their usage is needed, so quotas are accurate even before
+    the janitor's first rescan.
+    """
+
+    def __init__(self, ttl_seconds: float = WORKSPACE_FILE_TTL_HOURS * 3600, quota_bytes: int = 0):
+        """Initialize the index.
+
+        Args:
+            ttl_seconds: Lifetime of a file after its last write
+            quota_bytes: Maximum total size of one workspace (0 = unlimited)
+        """
+        self._ttl_seconds = ttl_seconds
+        self._quota_bytes = quota_bytes
+        self._lock = threading.Lock()
+        self._files: dict[str, _IndexedFile] = {}
+        self._usage: dict[str, int] = {}
+        self._loaded: set[str] = set()
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    @property
+    def quota_bytes(self) -> int:
+        return self._quota_bytes
+
+    # =========================================================================
+    # Accounting
+    # =========================================================================
+
+    def record_write(self, workspace_dir: str, file_path: str) -> None:
+        """Record that a file was (re)written, using its current size and mtime."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            self.forget(file_path)
+            return
+        self._track(workspace_dir, file_path, stat.st_size, stat.st_mtime + self._ttl_seconds)
+
+    def forget(self, file_path: str) -> None:
+        """Remove a file from the index (after it was deleted)."""
+        with self._lock:
+            self._untrack_locked(file_path)
+
+    def usage(self, workspace_dir: str) -> int:
+        """Get the total size in bytes of the files in a workspace."""
+        self._ensure_loaded(workspace_dir)
+        with self._lock:
+            return self._usage.get(workspace_dir, 0)
+
+    def exceeds_quota(self, workspace_dir: str, file_path: str, final_size: int) -> bool:
+        """Check whether writing ``file_path`` with ``final_size`` bytes would exceed the workspace quota.
+
+        The file's current size (if any) is not counted, since it is replaced.
+        """
+        if self._quota_bytes <= 0:
+            return False
+        self._ensure_loaded(workspace_dir)
+        with self._lock:
+            current = self._files.get(file_path)
+            usage = self._usage.get(workspace_dir, 0) - (current.size if current else 0)
+        return usage + final_size > self._quota_bytes
+
+    # =========================================================================
+    # Loading and sweeping
+    # =========================================================================
+
+    def load_workspace(self, workspace_dir: str) -> None:
+        """(Re)index all files of a workspace from disk."""
+        found: list[tuple[str, int, float]] = []
+        for dirpath, _, filenames in os.walk(workspace_dir):
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                found.append((file_path, stat.st_size, stat.st_mtime + self._ttl_seconds))
+
+        with self._lock:
+            for file_path in [path for path, entry in self._files.items() if entry.workspace_dir == workspace_dir]:
+                self._untrack_locked(file_path)
+            for file_path, size, expires_at in found:
+                self._track_locked(workspace_dir, file_path, size, expires_at)
+            self._loaded.add(workspace_dir)
+
+    def rebuild(self, roots: list[str]) -> int:
+        """Re-index every workspace under the given roots.
+
+        Returns:
+            Number of workspaces indexed
+        """
+        count = 0
+        for root in roots:
+            try:
+                entries = list(os.scandir(root))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    self.load_workspace(entry.path)
+                    count += 1
+        return count
+
+    def sweep(self, now: float | None = None) -> int:
+        """Delete expired files.
+
+        Files touched since they were indexed are re-indexed instead of deleted.
+
+        Returns:
+            Number of files deleted
+        """
+        now = time.time() if now is None else now
+        removed = 0
+        for file_path, workspace_dir in self._pop_expired(now):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                self.forget(file_path)
+                continue
+            if stat.st_mtime + self._ttl_seconds > now:
+                self._track(workspace_dir, file_path, stat.st_size, stat.st_mtime + self._ttl_seconds)
+                continue
+            try:
+                os.remove(file_path)
+                removed += 1
+                logger.debug(f"Cleaned up expired workspace file: {file_path}")
+            except OSError as e:
+                logger.warning(f"Failed to clean up workspace file {file_path}: {e}")
+            self.forget(file_path)
+        return removed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index statistics for monitoring."""
+        with self._lock:
+            return {
+                "files": len(self._files),
+                "workspaces": len(self._loaded),
+                "bytes": sum(self._usage.values()),
+                "quota_bytes": self._quota_bytes,
+            }
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _ensure_loaded(self, workspace_dir: str) -> None:
+        if workspace_dir not in self._loaded:
+            self.load_workspace(workspace_dir)
+
+    def _track(self, workspace_dir: str, file_path: str, size: int, expires_at: float) -> None:
+        with self._lock:
+            self._track_locked(workspace_dir, file_path, size, expires_at)
+
+    def _track_locked(self, workspace_dir: str, file_path: str, size: int, expires_at: float) -> None:
+        self._untrack_locked(file_path)
+        self._files[file_path] = _IndexedFile(workspace_dir=workspace_dir, size=size, expires_at=expires_at)
+        self._usage[workspace_dir] = self._usage.get(workspace_dir, 0) + size
+        heapq.heappush(self._expiry_heap, (expires_at, file_path))
+
+    def _untrack_locked(self, file_path: str) -> None:
+        entry = self._files.pop(file_path, None)
+        if entry is not None:
+            self._usage[entry.workspace_dir] = self._usage.get(entry.workspace_dir, 0) - entry.size
+
+    def _pop_expired(self, now: float) -> list[tuple[str, str]]:
+        """Pop expired heap entries, skipping stale ones left by re-writes."""
+        expired: list[tuple[str, str]] = []
+        with self._lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                expires_at, file_path = heapq.heappop(self._expiry_heap)
+                entry = self._files.get(file_path)
+                if entry is not None and entry.expires_at == expires_at:
+                    expired.append((file_path, entry.workspace_dir))
+        return expired
+
+
+class WorkspaceJanitor(HostedService):
+    """Hosted service that sweeps expired workspace files in the background.
+
+    Implements HostedService for automatic lifecycle management:
+    - start_async(): Starts the sweep loop (first iteration rebuilds the index)
+    - stop_async(): Cancels the sweep loop
+    """
+
+    def __init__(
+        self,
+        index: WorkspaceIndex,
+        roots: list[str],
+        interval_seconds: float = 300,
+        rescan_interval_seconds: float = 3600,
+    ):
+        """Initialize the janitor.
+
+        Args:
+            index: Workspace index to sweep
+            roots: Directories containing the per-user workspaces
+            interval_seconds: Delay between sweeps
+            rescan_interval_seconds: Delay between full index rebuilds from disk
+        """
+        self._index = index
+        self._roots = roots
+        self._interval = interval_seconds
+        self._rescan_interval = rescan_interval_seconds
+        self._last_rescan = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def start_async(self) -> None:
+        """Start the sweep loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("✅ WorkspaceJanitor started")
+
+    async def stop_async(self) -> None:
+        """Stop the sweep loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("✅ WorkspaceJanitor stopped")
+
+    async def sweep_once(self) -> int:
+        """Rebuild the index if due, then delete expired files.
+
+        Returns:
+            Number of files deleted
+        """
+        now = time.time()
+        if now - self._last_rescan >= self._rescan_interval:
+            workspaces = await asyncio.to_thread(self._index.rebuild, self._roots)
+            self._last_rescan = now
+            logger.debug(f"Workspace index rebuilt ({workspaces} workspaces)")
+        removed = await asyncio.to_thread(self._index.sweep, now)
+        if removed:
+            logger.info(f"WorkspaceJanitor removed {removed} expired files")
+        return removed
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep_once()
+            except Exception as e:
+                logger.warning(f"Workspace sweep failed: {e}")
+            await asyncio.sleep(self._interval)
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Register the workspace janitor as a HostedService.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from application.settings import app_settings
+
+        log = logging.getLogger(__name__)
+        log.info("🔧 Configuring WorkspaceJanitor...")
+
+        janitor = WorkspaceJanitor(
+            index=get_workspace_index(),
+            roots=[AGENT_WORKSPACE_BASE_DIR, WORKSPACE_BASE_DIR],
+            interval_seconds=app_settings.workspace_janitor_interval_seconds,
+            rescan_interval_seconds=app_settings.workspace_rescan_interval_seconds,
+        )
+        builder.services.add_singleton(WorkspaceJanitor, singleton=janitor)
+        builder.services.add_singleton(HostedService, singleton=janitor)
+        log.info("✅ WorkspaceJanitor configured")
+
+        return builder
+
+
+_workspace_index: WorkspaceIndex | None = None
+
+
+def get_workspace_index() -> WorkspaceIndex:
+    """Get the process-wide workspace index, created from settings on first use."""
+    global _workspace_index
+
+    if _workspace_index is None:
+        settings = Settings()
+        _workspace_index = WorkspaceIndex(
+            ttl_seconds=WORKSPACE_FILE_TTL_HOURS * 3600,
+            quota_bytes=settings.workspace_quota_mb * 1024 * 1024,
+        )
+    return _workspace_index
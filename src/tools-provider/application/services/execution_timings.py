@@ -0,0 +1,156 @@
+"""Per-stage latency breakdown of a tool execution.
+
+ToolExecutor walks every call through a fixed sequence of stages. For a
+sampled call, ExecutionTimings records how long each stage took:
+
+- validation: argument schema and scope checks
+- token: upstream token acquisition (token exchange, client credentials)
+- render: URL, header and body templates
+- circuit: admission through the source's circuit breaker
+- connect: connection pool wait, TCP connect and TLS handshake
+- ttfb: from sending the request to the response headers
+- download: reading the response body
+- parse: response decoding and mapping
+- builtin / poll: local built-in tools, and in-request ASYNC_POLL polling
+
+When the call finishes, each stage is recorded in the
+``tools_provider.execution.stage_time`` histogram (labelled by stage, source
+and tool), and emitted as a child span of the ``execute_tool`` span. The
+breakdown is returned for ``ToolExecutionResult.metadata["timings_ms"]``.
+
+Calls that are not sampled get a disabled instance, whose methods return
+immediately.
+"""
+
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from opentelemetry import trace
+
+from observability import tool_execution_stage_time
+
+tracer = trace.get_tracer(__name__)
+
+
+class ExecutionTimings:
+    """Stage timings of one tool execution.
+
+    Stages are sequential: entering a stage ends the current one. A stage
+    entered more than once (e.g. several HTTP requests) accumulates.
+
+    Usage:
+        timings = ExecutionTimings.sampled("src:get_user", "src", sample_rate=0.1)
+        with timings.stage("validation"):
+            validate()
+        breakdown = timings.finish()  # {"validation": 0.42, "total": 0.42}
+    """
+
+    def __init__(self, tool_id: str, source_id: str | None, enabled: bool = True) -> None:
+        """Initialize the timings of one execution.
+
+        Args:
+            tool_id: Tool being executed (metric and span label)
+            source_id: Source of the tool (metric and span label)
+            enabled: Record stages (False for calls that are not sampled)
+        """
+        self.enabled = enabled
+        self._attributes = {"tool_id": tool_id, "source_id": source_id or "none"}
+        self._origin_ns = time.perf_counter_ns()
+        self._epoch_ns = time.time_ns()
+        self._intervals: list[tuple[str, int, int]] = []
+        self._current: tuple[str, int] | None = None
+        self._breakdown: dict[str, float] | None = None
+
+    @classmethod
+    def sampled(cls, tool_id: str, source_id: str | None, sample_rate: float) -> "ExecutionTimings":
+        """Create the timings of an execution, enabled for a ``sample_rate`` fraction of calls."""
+        enabled = sample_rate >= 1.0 or (sample_rate > 0.0 and random.random() < sample_rate)  # nosec B311 - sampling, not security
+        return cls(tool_id, source_id, enabled)
+
+    def enter(self, stage: str) -> None:
+        """End the current stage (if any) and start ``stage``."""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        self._close(now)
+        self._current = (stage, now)
+
+    def exit(self) -> None:
+        """End the current stage (if any)."""
+        if self.enabled:
+            self._close(time.perf_counter_ns())
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as ``name``."""
+        self.enter(name)
+        try:
+            yield
+        finally:
+            self.exit()
+
+    def httpx_extensions(self) -> dict[str, Any] | None:
+        """Request extensions splitting an httpx request into connect, ttfb and download.
+
+        The request must be sent inside the ``connect`` stage; the response
+        body has been read once the ``download`` stage is exited.
+        """
+        return {"trace": self._on_http_event} if self.enabled else None
+
+    async def _on_http_event(self, event: str, info: dict[str, Any]) -> None:
+        # Events are "<http11|http2>.<step>.<started|complete|failed>" (see httpcore's trace extension)
+        if event.endswith("send_request_headers.started"):
+            self.enter("ttfb")
+        elif event.endswith("receive_response_headers.complete"):
+            self.enter("download")
+
+    def breakdown(self) -> dict[str, float]:
+        """Milliseconds per completed stage, plus their ``total``."""
+        stages: dict[str, float] = {}
+        for stage, start, end in self._intervals:
+            stages[stage] = stages.get(stage, 0.0) + (end - start) / 1e6
+        breakdown = {stage: round(ms, 3) for stage, ms in stages.items()}
+        breakdown["total"] = round(sum(stages.values()), 3)
+        return breakdown
+
+    def finish(self) -> dict[str, float]:
+        """End the current stage, then record the stage histograms and child spans.
+
+        Only the first call records; later calls return the same breakdown.
+
+        Returns:
+            The breakdown (empty when the execution was not sampled)
+        """
+        if not self.enabled:
+            return {}
+        if self._breakdown is not None:
+            return self._breakdown
+
+        self.exit()
+        self._breakdown = self.breakdown()
+        for stage, ms in self._breakdown.items():
+            if stage != "total":
+                tool_execution_stage_time.record(ms, {**self._attributes, "stage": stage})
+
+        # Spans are created after the fact, with the recorded start and end times, under the current (execute_tool) span
+        span_attributes = {"tool.id": self._attributes["tool_id"], "tool.source_id": self._attributes["source_id"]}
+        for stage, start, end in self._intervals:
+            span = tracer.start_span(f"tool.{stage}", start_time=self._to_epoch(start), attributes=span_attributes)
+            span.end(end_time=self._to_epoch(end))
+        return self._breakdown
+
+    def _close(self, now: int) -> None:
+        if self._current is not None:
+            stage, start = self._current
+            self._intervals.append((stage, start, now))
+            self._current = None
+
+    def _to_epoch(self, perf_ns: int) -> int:
+        return self._epoch_ns + perf_ns - self._origin_ns
+
+
+# Shared disabled instance for code paths that are never timed (e.g. background polls)
+UNTIMED = ExecutionTimings("", None, enabled=False)
@@ -0,0 +1,376 @@
+"""Scheduled background refresh of upstream source inventories.
+
+InventoryRefreshScheduler is a HostedService that periodically dispatches
+RefreshInventoryCommand for every enabled UpstreamSource:
+- Each source has its own interval (settings default, overridable per source ID
+  or source type) plus random jitter, so refreshes are spread out instead of
+  hitting all upstreams at once
+- At most ``max_concurrency`` refreshes run at the same time
+- Failing sources back off exponentially (capped)
+- A per-source Redis lock (SET NX EX) makes sure only one replica refreshes a
+  given source; without Redis the scheduler runs unlocked (single instance)
+- Scheduler lag (how late a refresh starts compared to its due time) and run
+  outcomes are published as metrics
+"""
+
+import asyncio
+import logging
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from neuroglia.dependency_injection import ServiceProviderBase
+from neuroglia.hosting.abstractions import HostedService
+from neuroglia.mediation import Mediator
+
+from integration.models.source_dto import SourceDto
+from observability import inventory_refresh_lag, inventory_refresh_runs
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+    from infrastructure.cache import RedisCacheService
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix of the per-source refresh locks
+LOCK_KEY_PREFIX = "mcp:inventory_refresh:lock:"
+
+# Identity recorded as the trigger of scheduled refreshes
+SCHEDULER_USER_INFO = {"sub": "inventory-refresh-scheduler"}
+
+# Deletes the lock only if it is still ours (it may have expired and been taken over)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _epoch(value: datetime | None) -> float | None:
+    """Convert a read-model timestamp to epoch seconds (naive values are UTC, as stored by MongoDB)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+@dataclass
+class _SourceSchedule:
+    """Scheduling state of one source.
+
+    Attributes:
+        interval: Refresh interval of the source (seconds)
+        next_run_at: When the next refresh is due (epoch seconds)
+        failures: Consecutive failed scheduled refreshes
+        last_sync_at: Last successful sync seen in the read model (epoch seconds)
+    """
+
+    interval: float
+    next_run_at: float
+    failures: int = 0
+    last_sync_at: float | None = None
+
+
+class InventoryRefreshScheduler(HostedService):
+    """Hosted service that keeps source inventories fresh in the background.
+
+    Implements HostedService for automatic lifecycle management:
+    - start_async(): Starts the scheduling loop
+    - stop_async(): Cancels the loop and any in-flight refreshes
+    """
+
+    def __init__(
+        self,
+        service_provider: ServiceProviderBase,
+        cache_service: "RedisCacheService | None" = None,
+        interval_seconds: float = 3600,
+        source_intervals: dict[str, float] | None = None,
+        jitter_fraction: float = 0.1,
+        max_concurrency: int = 4,
+        max_backoff_seconds: float = 6 * 3600,
+        tick_seconds: float = 30,
+        lock_ttl_seconds: int = 300,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            service_provider: Root service provider (a scope is created per mediator call)
+            cache_service: Redis cache used for the per-source leader locks
+            interval_seconds: Default refresh interval of a source
+            source_intervals: Interval overrides keyed by source ID or source type (0 disables)
+            jitter_fraction: Random delay added to each run, as a fraction of the interval
+            max_concurrency: Maximum refreshes running at the same time
+            max_backoff_seconds: Upper bound of the delay after repeated failures
+            tick_seconds: How often the source list is reloaded and due sources dispatched
+            lock_ttl_seconds: Lifetime of a refresh lock (must exceed the slowest refresh)
+        """
+        self._service_provider = service_provider
+        self._cache_service = cache_service
+        self._interval = interval_seconds
+        self._source_intervals = source_intervals or {}
+        self._jitter_fraction = jitter_fraction
+        self._max_backoff = max_backoff_seconds
+        self._tick = tick_seconds
+        self._lock_ttl = lock_ttl_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._schedules: dict[str, _SourceSchedule] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._task: asyncio.Task | None = None
+
+    async def start_async(self) -> None:
+        """Start the scheduling loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("✅ InventoryRefreshScheduler started")
+
+    async def stop_async(self) -> None:
+        """Stop the scheduling loop and cancel in-flight refreshes."""
+        if self._task is not None:
+            tasks = [self._task, *self._inflight.values()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._task = None
+            self._inflight.clear()
+            logger.info("✅ InventoryRefreshScheduler stopped")
+
+    # =========================================================================
+    # Scheduling
+    # =========================================================================
+
+    async def tick(self) -> list[str]:
+        """Reload the source list and dispatch every due refresh.
+
+        Returns:
+            IDs of the sources whose refresh was dispatched
+        """
+        sources = await self._list_sources()
+        now = time.time()
+        self._reconcile(sources, now)
+
+        dispatched: list[str] = []
+        for source_id, schedule in self._schedules.items():
+            if schedule.next_run_at <= now and source_id not in self._inflight:
+                task = asyncio.create_task(self._refresh_source(source_id, schedule))
+                self._inflight[source_id] = task
+                task.add_done_callback(lambda _, sid=source_id: self._inflight.pop(sid, None))
+                dispatched.append(source_id)
+        return dispatched
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics for monitoring."""
+        now = time.time()
+        overdue = [now - s.next_run_at for s in self._schedules.values() if s.next_run_at <= now]
+        return {
+            "sources": len(self._schedules),
+            "in_flight": len(self._inflight),
+            "overdue": len(overdue),
+            "max_lag_seconds": max(overdue, default=0.0),
+            "backing_off": sum(1 for s in self._schedules.values() if s.failures),
+        }
+
+    def _reconcile(self, sources: list[SourceDto], now: float) -> None:
+        """Add new sources, drop removed ones and follow syncs done elsewhere."""
+        seen: set[str] = set()
+        for source in sources:
+            interval = self._interval_for(source)
+            if interval <= 0:
+                continue
+            seen.add(source.id)
+            last_sync_at = _epoch(source.last_sync_at)
+            schedule = self._schedules.get(source.id)
+
+            if schedule is None:
+                # First sight: resume from the last sync, or spread never-synced sources over the jitter window
+                base = last_sync_at + self._delay(interval, source.consecutive_failures) if last_sync_at else now
+                self._schedules[source.id] = _SourceSchedule(
+                    interval=interval,
+                    next_run_at=base + self._jitter(interval),
+                    failures=source.consecutive_failures,
+                    last_sync_at=last_sync_at,
+                )
+                continue
+
+            schedule.interval = interval
+            if last_sync_at and (schedule.last_sync_at is None or last_sync_at > schedule.last_sync_at):
+                # Synced by another replica or a manual refresh since we last looked
+                schedule.last_sync_at = last_sync_at
+                schedule.failures = 0
+                if source.id not in self._inflight:
+                    schedule.next_run_at = max(schedule.next_run_at, last_sync_at + interval + self._jitter(interval))
+
+        for source_id in list(self._schedules):
+            if source_id not in seen:
+                del self._schedules[source_id]
+
+    def _interval_for(self, source: SourceDto) -> float:
+        """Get the refresh interval of a source (overrides by ID, then by type)."""
+        if source.id in self._source_intervals:
+            return self._source_intervals[source.id]
+        source_type = source.source_type.value if hasattr(source.source_type, "value") else str(source.source_type)
+        return self._source_intervals.get(source_type, self._interval)
+
+    def _delay(self, interval: float, failures: int) -> float:
+        """Delay until the next run: the interval, doubled per consecutive failure (capped)."""
+        if failures <= 0:
+            return interval
+        return min(interval * (2 ** min(failures, 16)), max(self._max_backoff, interval))
+
+    def _jitter(self, interval: float) -> float:
+        return random.uniform(0, interval * self._jitter_fraction)  # nosec B311 - scheduling jitter, not security
+
+    # =========================================================================
+    # Refresh
+    # =========================================================================
+
+    async def _refresh_source(self, source_id: str, schedule: _SourceSchedule) -> None:
+        """Refresh one source under the concurrency limit and its leader lock."""
+        async with self._semaphore:
+            inventory_refresh_lag.record(max(0.0, time.time() - schedule.next_run_at))
+            interval = schedule.interval
+
+            token = await self._acquire_lock(source_id)
+            if token is False:
+                # Another replica is refreshing this source; its sync will show up in the read model
+                inventory_refresh_runs.add(1, {"status": "skipped"})
+                schedule.next_run_at = time.time() + interval + self._jitter(interval)
+                return
+
+            try:
+                success = await self._refresh(source_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Scheduled refresh of source {source_id} raised: {e}")
+                success = False
+            finally:
+                await self._release_lock(source_id, token)
+
+            if success:
+                schedule.failures = 0
+                inventory_refresh_runs.add(1, {"status": "success"})
+            else:
+                schedule.failures += 1
+                inventory_refresh_runs.add(1, {"status": "failed"})
+            schedule.next_run_at = time.time() + self._delay(interval, schedule.failures) + self._jitter(interval)
+
+    async def _list_sources(self) -> list[SourceDto]:
+        """Load the enabled sources from the read model."""
+        from application.queries import GetSourcesQuery
+
+        async with self._service_provider.create_async_scope() as scope:
+            mediator = scope.get_required_service(Mediator)
+            result = await mediator.execute_async(GetSourcesQuery(user_info=SCHEDULER_USER_INFO))
+        if not result.is_success:
+            raise RuntimeError(f"Failed to list sources: {result.detail}")
+        return result.data or []
+
+    async def _refresh(self, source_id: str) -> bool:
+        """Run RefreshInventoryCommand for a source.
+
+        Returns:
+            True if the inventory was refreshed (or unchanged)
+        """
+        from application.commands import RefreshInventoryCommand
+
+        async with self._service_provider.create_async_scope() as scope:
+            mediator = scope.get_required_service(Mediator)
+            result = await mediator.execute_async(RefreshInventoryCommand(source_id=source_id, user_info=SCHEDULER_USER_INFO))
+        if not result.is_success or not result.data.success:
+            error = result.data.error if result.is_success else result.detail
+            logger.warning(f"Scheduled refresh of source {source_id} failed: {error}")
+            return False
+        return True
+
+    # =========================================================================
+    # Leader Lock
+    # =========================================================================
+
+    async def _acquire_lock(self, source_id: str) -> str | bool | None:
+        """Try to take the refresh lock of a source.
+
+        Returns:
+            The lock token, False if another replica holds it, or None when
+            Redis is unavailable (refresh proceeds unlocked)
+        """
+        if self._cache_service is None:
+            return None
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._cache_service.client.set(f"{LOCK_KEY_PREFIX}{source_id}", token, nx=True, ex=self._lock_ttl)
+        except Exception as e:
+            logger.debug(f"Refresh lock unavailable, refreshing {source_id} unlocked: {e}")
+            return None
+        return token if acquired else False
+
+    async def _release_lock(self, source_id: str, token: str | bool | None) -> None:
+        if not isinstance(token, str) or self._cache_service is None:
+            return
+        try:
+            await self._cache_service.client.eval(_RELEASE_LOCK_SCRIPT, 1, f"{LOCK_KEY_PREFIX}{source_id}", token)
+        except Exception as e:
+            logger.debug(f"Failed to release refresh lock of {source_id}: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.warning(f"Inventory refresh scheduling failed: {e}")
+            await asyncio.sleep(self._tick)
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Register the inventory refresh scheduler as a HostedService.
+
+        Resolves RedisCacheService from the DI container if available.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from application.settings import app_settings
+        from infrastructure.cache import RedisCacheService
+
+        log = logging.getLogger(__name__)
+        if not app_settings.inventory_refresh_enabled:
+            log.info("⏭️ InventoryRefreshScheduler disabled")
+            return builder
+
+        log.info("🔧 Configuring InventoryRefreshScheduler...")
+
+        cache_service: RedisCacheService | None = None
+        for desc in builder.services:
+            if desc.service_type == RedisCacheService and desc.singleton is not None:
+                cache_service = desc.singleton
+                break
+
+        def create_scheduler(sp: ServiceProviderBase) -> InventoryRefreshScheduler:
+            return InventoryRefreshScheduler(
+                service_provider=sp,
+                cache_service=cache_service,
+                interval_seconds=app_settings.inventory_refresh_interval_seconds,
+                source_intervals=app_settings.inventory_refresh_source_intervals,
+                jitter_fraction=app_settings.inventory_refresh_jitter_fraction,
+                max_concurrency=app_settings.inventory_refresh_max_concurrency,
+                max_backoff_seconds=app_settings.inventory_refresh_max_backoff_seconds,
+                tick_seconds=app_settings.inventory_refresh_tick_seconds,
+                lock_ttl_seconds=app_settings.inventory_refresh_lock_ttl_seconds,
+            )
+
+        builder.services.add_singleton(HostedService, implementation_factory=create_scheduler)
+        log.info("✅ InventoryRefreshScheduler configured")
+
+        return builder
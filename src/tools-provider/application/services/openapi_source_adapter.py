@@ -9,11 +9,24 @@ Supports:
 - Bearer token, API key, and OAuth2 authentication
 - Path parameters, query parameters, and request bodies
 - JSON Schema extraction for tool input schemas
+
+Refreshes are incremental:
+- The spec is fetched with a conditional GET (ETag / If-Modified-Since) using
+  the validators stored from the previous ingestion of the same URL
+- A 304, or a body whose hash matches the previous one, replays the previous
+  IngestionResult without parsing the spec again
+- $ref targets are resolved once per spec
+- Very large specs are parsed in chunks on a process pool
 """
 
+import asyncio
 import hashlib
 import json
 import logging
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from typing import Any
 from urllib.parse import urlparse
 
@@ -21,7 +34,7 @@ import httpx
 import yaml
 
 from domain.enums import ExecutionMode, SourceType
-from domain.models import AuthConfig, ExecutionProfile, ToolDefinition
+from domain.models import AuthConfig, CachePolicy, ExecutionProfile, ToolDefinition
 
 from .source_adapter import IngestionResult, SourceAdapter
 
@@ -33,6 +46,91 @@ METHODS_WITH_BODY = {"post", "put", "patch"}
 # HTTP methods to expose as tools (HEAD and OPTIONS typically not useful for agents)
 SUPPORTED_METHODS = {"get", "post", "put", "patch", "delete"}
 
+# Maximum number of spec snapshots (validators + last result) kept in memory
+SPEC_SNAPSHOT_CACHE_SIZE = 256
+
+
+@dataclass
+class SpecValidators:
+    """HTTP cache validators for a conditional spec fetch.
+
+    Sent as If-None-Match / If-Modified-Since and updated in place from the
+    response by ``_fetch_spec``.
+    """
+
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+    """Set when the server answered 304 Not Modified."""
+
+
+@dataclass
+class _SpecSnapshot:
+    """What is remembered about the last successful ingestion of a spec URL."""
+
+    validators: SpecValidators
+    spec_hash: str
+    result: IngestionResult
+
+
+class SpecSnapshotCache:
+    """Bounded (LRU) in-memory store of spec snapshots, keyed per source."""
+
+    def __init__(self, max_entries: int = SPEC_SNAPSHOT_CACHE_SIZE):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _SpecSnapshot] = OrderedDict()
+
+    def get(self, key: str) -> _SpecSnapshot | None:
+        snapshot = self._entries.get(key)
+        if snapshot is not None:
+            self._entries.move_to_end(key)
+        return snapshot
+
+    def put(self, key: str, snapshot: _SpecSnapshot) -> None:
+        self._entries[key] = snapshot
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_spec_snapshots = SpecSnapshotCache()
+_parse_pool: ProcessPoolExecutor | None = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor | None:
+    """Get the process pool used to parse very large specs (None when disabled)."""
+    global _parse_pool
+
+    from application.settings import app_settings
+
+    if app_settings.openapi_parse_workers <= 0:
+        return None
+    if _parse_pool is None:
+        # spawn: forking an asyncio process with live threads is unsafe
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=app_settings.openapi_parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
+
+def _parse_operations_chunk(
+    spec: dict[str, Any],
+    operations: list[tuple[str, str, dict[str, Any]]],
+    base_url: str,
+    default_audience: str,
+    timeout_seconds: int,
+) -> tuple[list[ToolDefinition], list[str]]:
+    """Process-pool entry point: parse a chunk of operations of one spec."""
+    adapter = OpenAPISourceAdapter(timeout_seconds=timeout_seconds)
+    return adapter._parse_operations(spec, operations, base_url, default_audience)
+
 
 class OpenAPISourceAdapter(SourceAdapter):
     """Adapter for parsing OpenAPI 3.x specifications into ToolDefinitions.
@@ -51,15 +149,26 @@ class OpenAPISourceAdapter(SourceAdapter):
         self,
         timeout_seconds: int = 30,
         default_audience: str = "",
+        snapshot_cache: SpecSnapshotCache | None = None,
+        parallel_min_operations: int | None = None,
     ):
         """Initialize the OpenAPI adapter.
 
         Args:
             timeout_seconds: Default timeout for HTTP requests
             default_audience: Default audience for token exchange
+            snapshot_cache: Store of validators and last results per spec URL
+                (defaults to the process-wide cache)
+            parallel_min_operations: Operation count from which a spec is parsed on
+                the process pool (defaults to settings; 0 disables)
         """
         self._timeout = timeout_seconds
         self._default_audience = default_audience
+        self._snapshots = snapshot_cache if snapshot_cache is not None else _spec_snapshots
+        self._parallel_min_operations = parallel_min_operations
+        # $ref memoization, valid for the spec object it was built for
+        self._ref_cache: dict[str, Any] = {}
+        self._ref_cache_spec: dict[str, Any] | None = None
 
     @property
     def source_type(self) -> SourceType:
@@ -75,6 +184,9 @@ class OpenAPISourceAdapter(SourceAdapter):
     ) -> IngestionResult:
         """Fetch an OpenAPI spec and convert it to ToolDefinitions.
 
+        The previous result for the same URL is replayed when the server answers
+        304 Not Modified or returns an identical spec.
+
         Args:
             url: URL to the OpenAPI specification (JSON or YAML)
             auth_config: Optional authentication for fetching the spec
@@ -86,84 +198,113 @@ class OpenAPISourceAdapter(SourceAdapter):
             IngestionResult with parsed tools or error information
         """
         logger.info(f"Fetching OpenAPI spec from: {url}")
-        warnings: list[str] = []
 
         # Use provided default_audience or fall back to instance default
         effective_audience = default_audience or self._default_audience
 
+        # Tools depend on the audience and timeout too, so they are part of the key
+        snapshot_key = f"{url}|{effective_audience}|{self._timeout}"
+        snapshot = self._snapshots.get(snapshot_key)
+
         try:
-            # Fetch the specification
-            spec_content, fetch_error = await self._fetch_spec(url, auth_config)
+            # Fetch the specification (conditionally when we have a previous snapshot)
+            validators = SpecValidators()
+            if snapshot is not None:
+                validators = SpecValidators(etag=snapshot.validators.etag, last_modified=snapshot.validators.last_modified)
+            spec_content, fetch_error = await self._fetch_spec(url, auth_config, validators)
             if fetch_error:
                 return IngestionResult.failure(fetch_error)
 
-            # Parse the specification (JSON or YAML)
-            spec, parse_error = self._parse_spec(spec_content, url)
-            if parse_error:
-                return IngestionResult.failure(parse_error)
+            if validators.not_modified:
+                if snapshot is None:
+                    return IngestionResult.failure("Server answered 304 Not Modified to an unconditional request")
+                logger.info(f"OpenAPI spec not modified since last ingestion: {url}")
+                return self._replay(snapshot)
 
-            # Validate it's an OpenAPI spec
-            validation_error = self._validate_openapi_spec(spec)
-            if validation_error:
-                return IngestionResult.failure(validation_error)
+            spec_hash = hashlib.sha256(spec_content.encode()).hexdigest()
+            if snapshot is not None and snapshot.spec_hash == spec_hash:
+                logger.info(f"OpenAPI spec unchanged (same content hash) since last ingestion: {url}")
+                snapshot.validators = validators
+                return self._replay(snapshot)
 
-            # Extract base URL from spec
-            base_url = self._extract_base_url(spec, url)
+            result = await self._normalize(spec_content, url, effective_audience)
+            if result.success:
+                self._snapshots.put(snapshot_key, _SpecSnapshot(validators=validators, spec_hash=spec_hash, result=result))
+            return result
 
-            # Extract version for metadata
-            source_version = spec.get("info", {}).get("version")
+        except Exception as e:
+            logger.exception(f"Unexpected error parsing OpenAPI spec: {e}")
+            return IngestionResult.failure(f"Unexpected error: {str(e)}")
+
+    async def _normalize(self, spec_content: str, url: str, effective_audience: str) -> IngestionResult:
+        """Parse, validate and convert a fetched spec into an IngestionResult.
 
-            # Parse all operations into ToolDefinitions
-            tools: list[ToolDefinition] = []
-            paths = spec.get("paths", {})
+        Args:
+            spec_content: Raw specification content
+            url: URL the spec was fetched from
+            effective_audience: Default audience for token exchange
 
-            for path, path_item in paths.items():
-                if not isinstance(path_item, dict):
+        Returns:
+            IngestionResult with parsed tools or error information
+        """
+        # Parse the specification (JSON or YAML)
+        spec, parse_error = self._parse_spec(spec_content, url)
+        if parse_error:
+            return IngestionResult.failure(parse_error)
+
+        # Validate it's an OpenAPI spec
+        validation_error = self._validate_openapi_spec(spec)
+        if validation_error:
+            return IngestionResult.failure(validation_error)
+
+        # Extract base URL from spec
+        base_url = self._extract_base_url(spec, url)
+
+        # Extract version for metadata
+        source_version = spec.get("info", {}).get("version")
+
+        # Collect all operations, then parse them into ToolDefinitions
+        operations: list[tuple[str, str, dict[str, Any]]] = []
+        for path, path_item in spec.get("paths", {}).items():
+            if not isinstance(path_item, dict):
+                continue
+
+            for method, operation in path_item.items():
+                # Skip non-operation fields (parameters, servers, etc.)
+                if method.lower() not in SUPPORTED_METHODS:
                     continue
 
-                for method, operation in path_item.items():
-                    # Skip non-operation fields (parameters, servers, etc.)
-                    if method.lower() not in SUPPORTED_METHODS:
-                        continue
+                if not isinstance(operation, dict):
+                    continue
 
-                    if not isinstance(operation, dict):
-                        continue
+                operations.append((path, method.upper(), operation))
 
-                    try:
-                        tool = self._parse_operation(
-                            spec=spec,
-                            path=path,
-                            method=method.upper(),
-                            operation=operation,
-                            base_url=base_url,
-                            default_audience=effective_audience,
-                        )
-                        if tool:
-                            tools.append(tool)
-                    except Exception as e:
-                        warning = f"Failed to parse operation {method.upper()} {path}: {str(e)}"
-                        logger.warning(warning)
-                        warnings.append(warning)
-
-            if not tools:
-                return IngestionResult.failure("No valid operations found in OpenAPI spec")
-
-            # Compute inventory hash
-            inventory_hash = self._compute_inventory_hash(tools)
-
-            logger.info(f"Successfully parsed {len(tools)} tools from OpenAPI spec")
-
-            return IngestionResult(
-                tools=tools,
-                inventory_hash=inventory_hash,
-                success=True,
-                source_version=source_version,
-                warnings=warnings,
-            )
+        tools, warnings = await self._parse_all_operations(spec, operations, base_url, effective_audience)
 
-        except Exception as e:
-            logger.exception(f"Unexpected error parsing OpenAPI spec: {e}")
-            return IngestionResult.failure(f"Unexpected error: {str(e)}")
+        if not tools:
+            return IngestionResult.failure("No valid operations found in OpenAPI spec")
+
+        # Compute inventory hash
+        inventory_hash = self._compute_inventory_hash(tools)
+
+        logger.info(f"Successfully parsed {len(tools)} tools from OpenAPI spec")
+
+        return IngestionResult(
+            tools=tools,
+            inventory_hash=inventory_hash,
+            success=True,
+            source_version=source_version,
+            warnings=warnings,
+        )
+
+    def _replay(self, snapshot: _SpecSnapshot) -> IngestionResult:
+        """Return a fresh copy of a snapshot's result (new ingestion timestamp)."""
+        return replace(
+            snapshot.result,
+            tools=list(snapshot.result.tools),
+            warnings=list(snapshot.result.warnings),
+            ingested_at=None,
+        )
 
     async def validate_url(
         self,
@@ -204,23 +345,35 @@ class OpenAPISourceAdapter(SourceAdapter):
         self,
         url: str,
         auth_config: AuthConfig | None = None,
+        validators: SpecValidators | None = None,
     ) -> tuple[str, str | None]:
         """Fetch the OpenAPI specification from a URL.
 
         Args:
             url: URL to fetch
             auth_config: Optional authentication
+            validators: Optional cache validators. When given, the request is made
+                conditional and the validators are updated from the response
+                (``not_modified`` is set on 304, in which case content is empty).
 
         Returns:
             Tuple of (content, error_message). Error is None on success.
         """
         headers = self._build_auth_headers(auth_config)
+        if validators is not None:
+            if validators.etag:
+                headers["If-None-Match"] = validators.etag
+            if validators.last_modified:
+                headers["If-Modified-Since"] = validators.last_modified
 
         try:
             async with httpx.AsyncClient(timeout=self._timeout) as client:
                 response = await client.get(url, headers=headers, follow_redirects=True)
 
-                if response.status_code == 401:
+                if response.status_code == 304 and validators is not None:
+                    validators.not_modified = True
+                    return "", None
+                elif response.status_code == 401:
                     return "", "Authentication required but credentials invalid or missing"
                 elif response.status_code == 403:
                     return "", "Access forbidden - insufficient permissions"
@@ -229,6 +382,9 @@ class OpenAPISourceAdapter(SourceAdapter):
                 elif response.status_code >= 400:
                     return "", f"HTTP error {response.status_code}: {response.reason_phrase}"
 
+                if validators is not None:
+                    validators.etag = response.headers.get("etag")
+                    validators.last_modified = response.headers.get("last-modified")
                 return response.text, None
 
         except httpx.TimeoutException:
@@ -355,6 +511,90 @@ class OpenAPISourceAdapter(SourceAdapter):
     # Private Methods - Operation Parsing
     # =========================================================================
 
+    async def _parse_all_operations(
+        self,
+        spec: dict[str, Any],
+        operations: list[tuple[str, str, dict[str, Any]]],
+        base_url: str,
+        default_audience: str,
+    ) -> tuple[list[ToolDefinition], list[str]]:
+        """Parse operations, on the process pool when the spec is very large.
+
+        Args:
+            spec: Full OpenAPI spec
+            operations: (path, METHOD, operation) triples
+            base_url: Base URL for the API
+            default_audience: Default audience for token exchange
+
+        Returns:
+            Tuple of (tools, warnings), in operation order
+        """
+        from application.settings import app_settings
+
+        min_operations = self._parallel_min_operations
+        if min_operations is None:
+            min_operations = app_settings.openapi_parallel_parse_min_operations
+
+        pool = _get_parse_pool() if 0 < min_operations <= len(operations) else None
+        if pool is None:
+            return self._parse_operations(spec, operations, base_url, default_audience)
+
+        chunk_size = -(-len(operations) // app_settings.openapi_parse_workers)
+        chunks = [operations[i : i + chunk_size] for i in range(0, len(operations), chunk_size)]
+        logger.info(f"Parsing {len(operations)} operations in {len(chunks)} chunks on the process pool")
+
+        loop = asyncio.get_running_loop()
+        try:
+            results = await asyncio.gather(*(loop.run_in_executor(pool, _parse_operations_chunk, spec, chunk, base_url, default_audience, self._timeout) for chunk in chunks))
+        except Exception as e:
+            logger.warning(f"Parallel OpenAPI parsing failed, parsing serially: {e}")
+            return self._parse_operations(spec, operations, base_url, default_audience)
+
+        tools: list[ToolDefinition] = []
+        warnings: list[str] = []
+        for chunk_tools, chunk_warnings in results:
+            tools.extend(chunk_tools)
+            warnings.extend(chunk_warnings)
+        return tools, warnings
+
+    def _parse_operations(
+        self,
+        spec: dict[str, Any],
+        operations: list[tuple[str, str, dict[str, Any]]],
+        base_url: str,
+        default_audience: str,
+    ) -> tuple[list[ToolDefinition], list[str]]:
+        """Parse operations serially, collecting a warning for each failing one.
+
+        Args:
+            spec: Full OpenAPI spec
+            operations: (path, METHOD, operation) triples
+            base_url: Base URL for the API
+            default_audience: Default audience for token exchange
+
+        Returns:
+            Tuple of (tools, warnings)
+        """
+        tools: list[ToolDefinition] = []
+        warnings: list[str] = []
+        for path, method, operation in operations:
+            try:
+                tool = self._parse_operation(
+                    spec=spec,
+                    path=path,
+                    method=method,
+                    operation=operation,
+                    base_url=base_url,
+                    default_audience=default_audience,
+                )
+                if tool:
+                    tools.append(tool)
+            except Exception as e:
+                warning = f"Failed to parse operation {method} {path}: {str(e)}"
+                logger.warning(warning)
+                warnings.append(warning)
+        return tools, warnings
+
     def _parse_operation(
         self,
         spec: dict[str, Any],
@@ -421,6 +661,7 @@ class OpenAPISourceAdapter(SourceAdapter):
             required_audience=required_audience or default_audience or self._default_audience,
             required_scopes=required_scopes,
             timeout_seconds=self._timeout,
+            cache_policy=self._extract_cache_policy(method, operation, operation_id),
         )
 
         return ToolDefinition(
@@ -433,6 +674,29 @@ class OpenAPISourceAdapter(SourceAdapter):
             deprecated=operation.get("deprecated", False),
         )
 
+    def _extract_cache_policy(self, method: str, operation: dict[str, Any], operation_id: str) -> CachePolicy | None:
+        """Read the opt-in response cache policy from the x-cache extension.
+
+        Only GET operations can be cached. The extension value uses the
+        CachePolicy fields, e.g. ``x-cache: {ttl_seconds: 60, scope: tenant}``.
+
+        Args:
+            method: HTTP method
+            operation: Operation object from spec
+            operation_id: Operation ID (for logging)
+
+        Returns:
+            CachePolicy or None if the operation is not cacheable
+        """
+        extension = operation.get("x-cache")
+        if not extension or method.upper() != "GET":
+            return None
+        try:
+            return CachePolicy.from_dict(extension)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring invalid x-cache extension on operation '{operation_id}': {e}")
+            return None
+
     def _generate_operation_id(self, method: str, path: str) -> str:
         """Generate an operation ID from method and path.
 
@@ -621,7 +885,7 @@ class OpenAPISourceAdapter(SourceAdapter):
         }
 
         if required:
-            schema["required"] = list(set(required))  # Deduplicate
+            schema["required"] = list(dict.fromkeys(required))  # Deduplicate, keeping order (stable across processes)
 
         return schema
 
@@ -884,15 +1148,25 @@ class OpenAPISourceAdapter(SourceAdapter):
             # External refs not supported
             return obj
 
+        # Targets are memoized per spec; the same component is typically referenced many times
+        if spec is not self._ref_cache_spec:
+            self._ref_cache = {}
+            self._ref_cache_spec = spec
+        if ref_path in self._ref_cache:
+            target = self._ref_cache[ref_path]
+            return target if target else obj
+
         # Navigate to referenced object
         parts = ref_path[2:].split("/")
-        current = spec
+        current: Any = spec
         for part in parts:
             if isinstance(current, dict):
                 current = current.get(part, {})
             else:
-                return obj
+                current = None
+                break
 
+        self._ref_cache[ref_path] = current
         return current if current else obj
 
     # =========================================================================
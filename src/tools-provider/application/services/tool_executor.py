@@ -11,7 +11,8 @@ Key Features:
 - Jinja2 template rendering for URL, headers, and body
 - JSON Schema validation (configurable per tool)
 - Circuit breaker per upstream source
-- Comprehensive tracing and metrics
+- Opt-in response caching for idempotent GET tools
+- Comprehensive tracing and metrics, with a sampled per-stage latency breakdown
 - Request/response logging at DEBUG level with truncation
 """
 
@@ -31,12 +32,15 @@ from jsonschema import Draft7Validator, ValidationError as JsonSchemaValidationE
 from opentelemetry import trace
 
 from domain.enums import AuthMode, ExecutionMode
-from domain.models import AuthConfig, ExecutionProfile, PollConfig, ToolDefinition
+from domain.models import AuthConfig, CachePolicy, ExecutionProfile, PollConfig, ToolDefinition
+from infrastructure.adapters.circuit_breaker_store import CircuitBreakerStateStore
 from infrastructure.adapters.keycloak_token_exchanger import CircuitBreaker, KeycloakTokenExchanger, TokenExchangeError
 from infrastructure.adapters.oauth2_client import ClientCredentialsError, OAuth2ClientCredentialsService
 
 from .builtin_source_adapter import is_builtin_tool_url
 from .builtin_tool_executor import BuiltinToolExecutor, UserContext
+from .execution_timings import UNTIMED, ExecutionTimings
+from .tool_response_cache import ToolResponseCache
 
 if TYPE_CHECKING:
     from neuroglia.hosting.web import WebApplicationBuilder
@@ -138,7 +142,8 @@ class ToolExecutionResult:
         result: Response data from the upstream service
         execution_time_ms: Total execution time in milliseconds
         upstream_status: HTTP status code from upstream
-        metadata: Additional execution metadata
+        metadata: Additional execution metadata (``timings_ms`` holds the stage
+            breakdown of sampled executions, see ExecutionTimings)
     """
 
     tool_id: str
@@ -177,6 +182,11 @@ class ToolExecutor:
         max_poll_attempts: int = 60,
         enable_schema_validation: bool = True,
         on_circuit_state_change: Callable[[Any], Awaitable[None]] | None = None,
+        circuit_store: CircuitBreakerStateStore | None = None,
+        circuit_state_cache_seconds: float = 1.0,
+        response_cache: ToolResponseCache | None = None,
+        source_cache_policies: dict[str, CachePolicy] | None = None,
+        timing_sample_rate: float = 1.0,
     ):
         """Initialize the tool executor.
 
@@ -187,6 +197,11 @@ class ToolExecutor:
             max_poll_attempts: Maximum polling attempts for async tools
             enable_schema_validation: Global toggle for input validation
             on_circuit_state_change: Optional callback for circuit breaker events
+            circuit_store: Optional cluster-shared circuit breaker state
+            circuit_state_cache_seconds: How long breakers trust their local copy of the shared state
+            response_cache: Optional cache for tools with a cache policy
+            source_cache_policies: Default cache policies keyed by source ID
+            timing_sample_rate: Fraction of executions recorded with per-stage timings (0 disables)
         """
         self._token_exchanger = token_exchanger
         self._client_credentials_service = client_credentials_service
@@ -194,6 +209,11 @@ class ToolExecutor:
         self._max_poll_attempts = max_poll_attempts
         self._enable_schema_validation = enable_schema_validation
         self._on_circuit_state_change = on_circuit_state_change
+        self._circuit_store = circuit_store
+        self._circuit_state_cache_seconds = circuit_state_cache_seconds
+        self._response_cache = response_cache
+        self._source_cache_policies = source_cache_policies or {}
+        self._timing_sample_rate = timing_sample_rate
 
         # Built-in tool executor for local tool execution
         self._builtin_executor = BuiltinToolExecutor()
@@ -307,6 +327,7 @@ class ToolExecutor:
         auth_config: AuthConfig | None = None,
         default_audience: str | None = None,
         validate_schema: bool | None = None,
+        background_poll: bool = False,
     ) -> ToolExecutionResult:
         """Execute a tool with the given arguments.
 
@@ -320,6 +341,8 @@ class ToolExecutor:
             auth_config: Optional auth config for API key or source-specific OAuth2
             default_audience: Target audience for token exchange (Level 3)
             validate_schema: Override global schema validation setting
+            background_poll: For ASYNC_POLL tools, return a pending result right after
+                the trigger request instead of polling in-request (see ToolJobRunner)
 
         Returns:
             ToolExecutionResult with the tool's response
@@ -328,6 +351,7 @@ class ToolExecutor:
             ToolExecutionError: If execution fails
         """
         start_time = time.time()
+        timings = ExecutionTimings.sampled(tool_id, source_id, self._timing_sample_rate)
 
         with tracer.start_as_current_span("execute_tool") as span:
             span.set_attribute("tool.id", tool_id)
@@ -337,82 +361,78 @@ class ToolExecutor:
             span.set_attribute("tool.auth_mode", auth_mode.value)
 
             try:
-                # Step 1: Validate arguments
-                should_validate = validate_schema if validate_schema is not None else self._enable_schema_validation
-                if should_validate:
-                    span.add_event("Validating arguments")
-                    self._validate_arguments(tool_id, definition.input_schema, arguments)
-
-                # Step 1.5: Validate user scopes (fail early before token exchange)
-                profile = definition.execution_profile
-                required_scopes = profile.required_scopes
-                if required_scopes:
-                    span.add_event("Validating scopes", {"required_scopes": required_scopes})
-                    user_scopes = self._extract_user_scopes(agent_token)
-                    self._validate_scopes(tool_id, required_scopes, user_scopes)
+                with timings.stage("validation"):
+                    # Step 1: Validate arguments
+                    should_validate = validate_schema if validate_schema is not None else self._enable_schema_validation
+                    if should_validate:
+                        span.add_event("Validating arguments")
+                        self._validate_arguments(tool_id, definition.input_schema, arguments)
+
+                    # Step 1.5: Validate user scopes (fail early before token exchange)
+                    profile = definition.execution_profile
+                    required_scopes = profile.required_scopes
+                    if required_scopes:
+                        span.add_event("Validating scopes", {"required_scopes": required_scopes})
+                        user_scopes = self._extract_user_scopes(agent_token)
+                        self._validate_scopes(tool_id, required_scopes, user_scopes)
 
                 # Step 2: Check if this is a built-in tool (executes locally)
                 if is_builtin_tool_url(profile.url_template):
                     span.add_event("Executing built-in tool locally")
                     # Extract user context from agent token for scoped operations
                     user_context = self._extract_user_context(agent_token)
-                    result = await self._execute_builtin(
-                        tool_id=tool_id,
-                        definition=definition,
-                        arguments=arguments,
-                        user_context=user_context,
-                    )
+                    with timings.stage("builtin"):
+                        result = await self._execute_builtin(
+                            tool_id=tool_id,
+                            definition=definition,
+                            arguments=arguments,
+                            user_context=user_context,
+                        )
                     execution_time_ms = (time.time() - start_time) * 1000
                     span.set_attribute("tool.execution_time_ms", execution_time_ms)
                     span.set_attribute("tool.status", result.status)
                     result.execution_time_ms = execution_time_ms
+                    self._attach_timings(result, timings)
                     return result
 
-                # Step 3: Get upstream token based on auth mode
-                span.add_event("Getting upstream token", {"auth_mode": auth_mode.value})
-                upstream_token = await self._get_upstream_token(
-                    agent_token=agent_token,
-                    auth_mode=auth_mode,
-                    auth_config=auth_config,
-                    default_audience=default_audience,
-                    required_scopes=required_scopes if required_scopes else None,
-                )
-
-                # Step 3: Execute based on mode
-                if profile.mode == ExecutionMode.SYNC_HTTP:
-                    span.add_event("Executing sync HTTP request")
-                    result = await self._execute_sync(
+                # Step 3: Execute upstream, through the response cache if the tool opted in
+                async def execute_upstream() -> ToolExecutionResult:
+                    return await self._execute_upstream(
                         tool_id=tool_id,
                         profile=profile,
                         arguments=arguments,
-                        upstream_token=upstream_token,
+                        agent_token=agent_token,
+                        source_id=source_id,
                         auth_mode=auth_mode,
                         auth_config=auth_config,
-                        source_id=source_id,
+                        default_audience=default_audience,
+                        background_poll=background_poll,
+                        timings=timings,
                     )
-                elif profile.mode == ExecutionMode.ASYNC_POLL:
-                    span.add_event("Executing async poll request")
-                    result = await self._execute_async_poll(
+
+                cache_policy = self._resolve_cache_policy(profile, source_id)
+                if cache_policy is not None and self._response_cache is not None:
+                    result = await self._execute_cached(
+                        cache=self._response_cache,
+                        policy=cache_policy,
                         tool_id=tool_id,
-                        profile=profile,
+                        definition=definition,
                         arguments=arguments,
-                        upstream_token=upstream_token,
+                        agent_token=agent_token,
                         auth_mode=auth_mode,
-                        auth_config=auth_config,
-                        source_id=source_id,
+                        default_audience=default_audience,
+                        execute_upstream=execute_upstream,
                     )
+                    span.set_attribute("tool.cache", result.metadata["cache"])
                 else:
-                    raise ToolExecutionError(
-                        message=f"Unsupported execution mode: {profile.mode}",
-                        error_code="unsupported_mode",
-                        tool_id=tool_id,
-                    )
+                    result = await execute_upstream()
 
                 execution_time_ms = (time.time() - start_time) * 1000
                 span.set_attribute("tool.execution_time_ms", execution_time_ms)
                 span.set_attribute("tool.status", result.status)
 
                 result.execution_time_ms = execution_time_ms
+                self._attach_timings(result, timings)
                 return result
 
             except ToolExecutionError:
@@ -447,6 +467,161 @@ class ToolExecutor:
                     tool_id=tool_id,
                     is_retryable=False,
                 )
+            finally:
+                # Failed executions are recorded too (no-op when already attached to the result)
+                timings.finish()
+
+    @staticmethod
+    def _attach_timings(result: ToolExecutionResult, timings: ExecutionTimings) -> None:
+        """Record the stage timings and add the breakdown to the result's metadata (sampled executions only)."""
+        breakdown = timings.finish()
+        if breakdown:
+            result.metadata["timings_ms"] = breakdown
+
+    async def _execute_upstream(
+        self,
+        tool_id: str,
+        profile: ExecutionProfile,
+        arguments: dict[str, Any],
+        agent_token: str,
+        source_id: str | None,
+        auth_mode: AuthMode,
+        auth_config: AuthConfig | None,
+        default_audience: str | None,
+        background_poll: bool = False,
+        timings: ExecutionTimings = UNTIMED,
+    ) -> ToolExecutionResult:
+        """Get the upstream token and execute the request according to the execution mode.
+
+        Runs in its own span, since stale cache entries are revalidated after
+        the request that triggered the revalidation has finished.
+
+        Raises:
+            ToolExecutionError: If the execution mode is not supported or the request fails
+            TokenExchangeError: If token exchange fails
+        """
+        with tracer.start_as_current_span("execute_upstream") as span:
+            # Get upstream token based on auth mode
+            span.add_event("Getting upstream token", {"auth_mode": auth_mode.value})
+            with timings.stage("token"):
+                upstream_token = await self._get_upstream_token(
+                    agent_token=agent_token,
+                    auth_mode=auth_mode,
+                    auth_config=auth_config,
+                    default_audience=default_audience,
+                    required_scopes=profile.required_scopes if profile.required_scopes else None,
+                )
+
+            # Execute based on mode
+            if profile.mode == ExecutionMode.SYNC_HTTP:
+                span.add_event("Executing sync HTTP request")
+                return await self._execute_sync(
+                    tool_id=tool_id,
+                    profile=profile,
+                    arguments=arguments,
+                    upstream_token=upstream_token,
+                    auth_mode=auth_mode,
+                    auth_config=auth_config,
+                    source_id=source_id,
+                    timings=timings,
+                )
+            elif profile.mode == ExecutionMode.ASYNC_POLL:
+                span.add_event("Executing async poll request")
+                return await self._execute_async_poll(
+                    tool_id=tool_id,
+                    profile=profile,
+                    arguments=arguments,
+                    upstream_token=upstream_token,
+                    auth_mode=auth_mode,
+                    auth_config=auth_config,
+                    source_id=source_id,
+                    background=background_poll,
+                    timings=timings,
+                )
+            raise ToolExecutionError(
+                message=f"Unsupported execution mode: {profile.mode}",
+                error_code="unsupported_mode",
+                tool_id=tool_id,
+            )
+
+    async def _execute_cached(
+        self,
+        cache: ToolResponseCache,
+        policy: CachePolicy,
+        tool_id: str,
+        definition: ToolDefinition,
+        arguments: dict[str, Any],
+        agent_token: str,
+        auth_mode: AuthMode,
+        default_audience: str | None,
+        execute_upstream: Callable[[], Awaitable[ToolExecutionResult]],
+    ) -> ToolExecutionResult:
+        """Serve a tool call from the response cache, executing upstream on a miss.
+
+        Only completed responses are stored. The result's ``metadata["cache"]``
+        is ``hit``, ``stale``, ``miss`` or ``bypass`` (no key for this caller).
+        """
+        key = ToolResponseCache.make_key(
+            tool_id=tool_id,
+            definition_hash=definition.compute_hash(),
+            policy=policy,
+            arguments=arguments,
+            claims=self._extract_claims(agent_token),
+            auth_context=f"{auth_mode.value}|{default_audience or ''}",
+            identity_bound=auth_mode == AuthMode.TOKEN_EXCHANGE,
+        )
+        if key is None:
+            result = await execute_upstream()
+            result.metadata["cache"] = "bypass"
+            return result
+
+        async def fetch_payload() -> dict[str, Any]:
+            return self._result_to_cache_payload(await execute_upstream())
+
+        payload, outcome = await cache.get_or_fetch(
+            key=key,
+            tool_id=tool_id,
+            policy=policy,
+            fetch=fetch_payload,
+            should_store=lambda p: p["status"] == "completed",
+        )
+        result = self._result_from_cache_payload(tool_id, payload)
+        result.metadata["cache"] = outcome
+        return result
+
+    def _resolve_cache_policy(self, profile: ExecutionProfile, source_id: str | None) -> CachePolicy | None:
+        """Get the cache policy of a tool: its own, else its source's default.
+
+        Only synchronous GET requests are idempotent enough to be cached.
+        """
+        if profile.mode != ExecutionMode.SYNC_HTTP or profile.method.upper() != "GET":
+            return None
+        if profile.cache_policy is not None:
+            return profile.cache_policy
+        return self._source_cache_policies.get(source_id) if source_id else None
+
+    def _extract_claims(self, agent_token: str) -> dict[str, Any]:
+        """Decode JWT claims without verification (already verified at the API layer)."""
+        try:
+            return cast(dict[str, Any], jwt.decode(agent_token, options={"verify_signature": False}))
+        except Exception as e:
+            logger.warning(f"Failed to extract claims from token: {e}")
+            return {}
+
+    @staticmethod
+    def _result_to_cache_payload(result: ToolExecutionResult) -> dict[str, Any]:
+        return {"status": result.status, "result": result.result, "upstream_status": result.upstream_status, "metadata": dict(result.metadata)}
+
+    @staticmethod
+    def _result_from_cache_payload(tool_id: str, payload: dict[str, Any]) -> ToolExecutionResult:
+        return ToolExecutionResult(
+            tool_id=tool_id,
+            status=payload["status"],
+            result=payload["result"],
+            execution_time_ms=0,  # Will be set by caller
+            upstream_status=payload.get("upstream_status"),
+            metadata=dict(payload.get("metadata") or {}),
+        )
 
     def _validate_arguments(
         self,
@@ -609,6 +784,7 @@ class ToolExecutor:
         auth_mode: AuthMode = AuthMode.TOKEN_EXCHANGE,
         auth_config: AuthConfig | None = None,
         source_id: str | None = None,
+        timings: ExecutionTimings = UNTIMED,
     ) -> ToolExecutionResult:
         """Execute a synchronous HTTP request.
 
@@ -620,14 +796,16 @@ class ToolExecutor:
             auth_mode: Authentication mode
             auth_config: Optional auth config for API key
             source_id: Source ID for circuit breaker grouping
+            timings: Stage timings of the execution
 
         Returns:
             ToolExecutionResult with response data
         """
         # Render request components
-        url = self._render_template(profile.url_template, arguments, "url")
-        headers = self._render_headers(profile.headers_template, arguments, upstream_token, auth_mode, auth_config)
-        body = self._render_body(profile.body_template, arguments) if profile.body_template else None
+        with timings.stage("render"):
+            url = self._render_template(profile.url_template, arguments, "url")
+            headers = self._render_headers(profile.headers_template, arguments, upstream_token, auth_mode, auth_config)
+            body = self._render_body(profile.body_template, arguments) if profile.body_template else None
 
         # Get circuit breaker for this source
         circuit = self._get_circuit_breaker(source_id or url)
@@ -636,6 +814,8 @@ class ToolExecutor:
         self._log_request(profile.method, url, headers, body)
 
         try:
+            # The circuit stage lasts until the breaker lets the request through
+            timings.enter("circuit")
             response = cast(
                 httpx.Response,
                 await circuit.call(
@@ -646,14 +826,16 @@ class ToolExecutor:
                     body=body,
                     content_type=profile.content_type,
                     timeout=profile.timeout_seconds or self._default_timeout,
+                    timings=timings,
                 ),
             )
 
-            # Log response (DEBUG level, truncated)
-            self._log_response(response.status_code, response.text)
+            with timings.stage("parse"):
+                # Log response (DEBUG level, truncated)
+                self._log_response(response.status_code, response.text)
 
-            # Parse response
-            result_data = self._parse_response(response, profile.response_mapping)
+                # Parse response
+                result_data = self._parse_response(response, profile.response_mapping)
 
             # Determine status based on HTTP code
             if 200 <= response.status_code < 300:
@@ -755,6 +937,8 @@ class ToolExecutor:
         auth_mode: AuthMode = AuthMode.TOKEN_EXCHANGE,
         auth_config: AuthConfig | None = None,
         source_id: str | None = None,
+        background: bool = False,
+        timings: ExecutionTimings = UNTIMED,
     ) -> ToolExecutionResult:
         """Execute an async request with polling for completion.
 
@@ -766,9 +950,12 @@ class ToolExecutor:
             auth_mode: Authentication mode
             auth_config: Optional auth config for API key
             source_id: Source ID for circuit breaker grouping
+            background: Return a pending result after the trigger instead of polling;
+                its metadata carries the rendered ``status_url``
+            timings: Stage timings of the execution (in-request polling is timed as one ``poll`` stage)
 
         Returns:
-            ToolExecutionResult with final response data
+            ToolExecutionResult with final response data (or pending in background mode)
         """
         poll_config = profile.poll_config
         if not poll_config:
@@ -787,23 +974,40 @@ class ToolExecutor:
             auth_mode=auth_mode,
             auth_config=auth_config,
             source_id=source_id,
+            timings=timings,
         )
 
         # Extract job ID or status URL from trigger response
         if trigger_result.status == "failed":
             return trigger_result
 
+        if background:
+            status_url = self._render_template(
+                poll_config.status_url_template,
+                self._poll_arguments(arguments, trigger_result.result),
+                "status_url",
+            )
+            return ToolExecutionResult(
+                tool_id=tool_id,
+                status="pending",
+                result=trigger_result.result,
+                execution_time_ms=0,
+                upstream_status=trigger_result.upstream_status,
+                metadata={"status_url": status_url},
+            )
+
         # Step 2: Poll for completion
-        return await self._poll_for_completion(
-            tool_id=tool_id,
-            poll_config=poll_config,
-            trigger_result=trigger_result.result,
-            arguments=arguments,
-            upstream_token=upstream_token,
-            auth_mode=auth_mode,
-            auth_config=auth_config,
-            source_id=source_id,
-        )
+        with timings.stage("poll"):
+            return await self._poll_for_completion(
+                tool_id=tool_id,
+                poll_config=poll_config,
+                trigger_result=trigger_result.result,
+                arguments=arguments,
+                upstream_token=upstream_token,
+                auth_mode=auth_mode,
+                auth_config=auth_config,
+                source_id=source_id,
+            )
 
     async def _poll_for_completion(
         self,
@@ -832,9 +1036,7 @@ class ToolExecutor:
             ToolExecutionResult with final response
         """
         # Merge trigger result into arguments for status URL templating
-        poll_args = {**arguments}
-        if isinstance(trigger_result, dict):
-            poll_args.update(trigger_result)
+        poll_args = self._poll_arguments(arguments, trigger_result)
 
         interval = poll_config.poll_interval_seconds
         max_interval = poll_config.max_interval_seconds
@@ -844,6 +1046,11 @@ class ToolExecutor:
 
         # Prepare headers for polling requests
         poll_headers = self._render_headers({}, poll_args, upstream_token, auth_mode, auth_config)
+        status_url = self._render_template(
+            poll_config.status_url_template,
+            poll_args,
+            "status_url",
+        )
 
         for attempt in range(poll_config.max_poll_attempts):
             # Wait before polling (except first attempt)
@@ -851,81 +1058,148 @@ class ToolExecutor:
                 await asyncio.sleep(interval)
                 interval = min(interval * backoff, max_interval)
 
-            # Render status URL
-            status_url = self._render_template(
-                poll_config.status_url_template,
-                poll_args,
-                "status_url",
+            result = await self._poll_status_once(tool_id, poll_config, status_url, poll_headers, circuit, attempt)
+            if result is not None:
+                return result
+
+        # Max attempts reached
+        raise ToolExecutionError(
+            message=f"Async operation did not complete within {poll_config.max_poll_attempts} attempts",
+            error_code="poll_timeout",
+            tool_id=tool_id,
+            is_retryable=True,
+            details={"max_attempts": poll_config.max_poll_attempts},
+        )
+
+    async def poll_status(
+        self,
+        tool_id: str,
+        poll_config: PollConfig,
+        status_url: str,
+        agent_token: str,
+        attempt: int,
+        source_id: str | None = None,
+        auth_mode: AuthMode = AuthMode.TOKEN_EXCHANGE,
+        auth_config: AuthConfig | None = None,
+        default_audience: str | None = None,
+        required_scopes: list[str] | None = None,
+    ) -> ToolExecutionResult | None:
+        """Make one status request for a background ASYNC_POLL execution.
+
+        Used by ToolJobRunner, which owns the schedule and the attempt budget.
+
+        Args:
+            tool_id: Tool identifier
+            poll_config: Polling configuration
+            status_url: Status URL rendered when the operation was triggered
+            agent_token: Caller's access token (only needed for token exchange)
+            attempt: Zero-based poll attempt number
+            source_id: Source ID for circuit breaker grouping
+            auth_mode: Authentication mode for upstream requests
+            auth_config: Optional auth config for source-specific credentials
+            default_audience: Target audience for token exchange
+            required_scopes: Scopes to request during token exchange
+
+        Returns:
+            Completed or failed result, or None while the operation is still pending
+            (or the status request did not succeed)
+
+        Raises:
+            TokenExchangeError: If token exchange fails
+            ClientCredentialsError: If client credentials acquisition fails
+        """
+        upstream_token = await self._get_upstream_token(
+            agent_token=agent_token,
+            auth_mode=auth_mode,
+            auth_config=auth_config,
+            default_audience=default_audience,
+            required_scopes=required_scopes or None,
+        )
+        poll_headers = self._render_headers({}, {}, upstream_token, auth_mode, auth_config)
+        circuit = self._get_circuit_breaker(source_id or "poll")
+        return await self._poll_status_once(tool_id, poll_config, status_url, poll_headers, circuit, attempt)
+
+    @staticmethod
+    def _poll_arguments(arguments: dict[str, Any], trigger_result: Any) -> dict[str, Any]:
+        """Merge the trigger response into the arguments used to render the status URL."""
+        poll_args = {**arguments}
+        if isinstance(trigger_result, dict):
+            poll_args.update(trigger_result)
+        return poll_args
+
+    async def _poll_status_once(
+        self,
+        tool_id: str,
+        poll_config: PollConfig,
+        status_url: str,
+        poll_headers: dict[str, str],
+        circuit: CircuitBreaker,
+        attempt: int,
+    ) -> ToolExecutionResult | None:
+        """Make one status request and interpret it.
+
+        Returns:
+            Completed or failed result, or None if still pending or the request failed
+        """
+        try:
+            response = cast(
+                httpx.Response,
+                await circuit.call(
+                    self._do_http_request,
+                    method="GET",
+                    url=status_url,
+                    headers=dict(poll_headers),
+                    body=None,
+                    content_type="application/json",
+                    timeout=self._default_timeout,
+                ),
             )
 
-            # Make status request
-            try:
-                response = cast(
-                    httpx.Response,
-                    await circuit.call(
-                        self._do_http_request,
-                        method="GET",
-                        url=status_url,
-                        headers=poll_headers,
-                        body=None,
-                        content_type="application/json",
-                        timeout=self._default_timeout,
-                    ),
-                )
+            if response.status_code != 200:
+                logger.warning(f"Poll status request returned {response.status_code}")
+                return None
 
-                if response.status_code != 200:
-                    logger.warning(f"Poll status request returned {response.status_code}")
-                    continue
+            status_data = response.json()
 
-                status_data = response.json()
+            # Extract status value
+            status_value = self._extract_json_path(
+                status_data,
+                poll_config.status_field_path,
+            )
 
-                # Extract status value
-                status_value = self._extract_json_path(
+            if status_value in poll_config.completed_values:
+                # Success - extract result
+                result_data = self._extract_json_path(
                     status_data,
-                    poll_config.status_field_path,
+                    poll_config.result_field_path,
+                )
+                return ToolExecutionResult(
+                    tool_id=tool_id,
+                    status="completed",
+                    result=result_data,
+                    execution_time_ms=0,
+                    upstream_status=200,
+                    metadata={"poll_attempts": attempt + 1},
                 )
 
-                if status_value in poll_config.completed_values:
-                    # Success - extract result
-                    result_data = self._extract_json_path(
-                        status_data,
-                        poll_config.result_field_path,
-                    )
-                    return ToolExecutionResult(
-                        tool_id=tool_id,
-                        status="completed",
-                        result=result_data,
-                        execution_time_ms=0,
-                        upstream_status=200,
-                        metadata={"poll_attempts": attempt + 1},
-                    )
-
-                if status_value in poll_config.failed_values:
-                    # Operation failed
-                    return ToolExecutionResult(
-                        tool_id=tool_id,
-                        status="failed",
-                        result=status_data,
-                        execution_time_ms=0,
-                        upstream_status=200,
-                        metadata={"poll_attempts": attempt + 1},
-                    )
+            if status_value in poll_config.failed_values:
+                # Operation failed
+                return ToolExecutionResult(
+                    tool_id=tool_id,
+                    status="failed",
+                    result=status_data,
+                    execution_time_ms=0,
+                    upstream_status=200,
+                    metadata={"poll_attempts": attempt + 1},
+                )
 
-                # Still pending, continue polling
-                logger.debug(f"Poll attempt {attempt + 1}: status={status_value}")
+            # Still pending, continue polling
+            logger.debug(f"Poll attempt {attempt + 1}: status={status_value}")
 
-            except Exception as e:
-                logger.warning(f"Poll attempt {attempt + 1} failed: {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"Poll attempt {attempt + 1} failed: {e}")
 
-        # Max attempts reached
-        raise ToolExecutionError(
-            message=f"Async operation did not complete within {poll_config.max_poll_attempts} attempts",
-            error_code="poll_timeout",
-            tool_id=tool_id,
-            is_retryable=True,
-            details={"max_attempts": poll_config.max_poll_attempts},
-        )
+        return None
 
     async def _do_http_request(
         self,
@@ -935,6 +1209,7 @@ class ToolExecutor:
         body: str | None,
         content_type: str,
         timeout: float,
+        timings: ExecutionTimings = UNTIMED,
     ) -> httpx.Response:
         """Execute an HTTP request.
 
@@ -945,20 +1220,26 @@ class ToolExecutor:
             body: Request body (JSON string or None)
             content_type: Content-Type header value
             timeout: Request timeout in seconds
+            timings: Stage timings of the execution (split into connect, ttfb and download)
 
         Returns:
             httpx.Response object
         """
         headers["Content-Type"] = content_type
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                content=body.encode() if body else None,
-            )
-            return response
+        timings.enter("connect")
+        try:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                response = await client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    content=body.encode() if body else None,
+                    extensions=timings.httpx_extensions(),
+                )
+                return response
+        finally:
+            timings.exit()
 
     def _render_template(
         self,
@@ -1180,6 +1461,8 @@ class ToolExecutor:
                 circuit_type="tool_execution",
                 source_id=key,
                 on_state_change=self._on_circuit_state_change,
+                store=self._circuit_store,
+                state_cache_seconds=self._circuit_state_cache_seconds,
             )
         return self._circuit_breakers[key]
 
@@ -1250,6 +1533,16 @@ class ToolExecutor:
         """
         return {key: cb.get_state() for key, cb in self._circuit_breakers.items()}
 
+    async def refresh_circuit_states(self) -> dict[str, dict[str, Any]]:
+        """Get all circuit breaker states after syncing them from the shared store (if any).
+
+        Returns:
+            Dict mapping source keys to circuit breaker states
+        """
+        for cb in list(self._circuit_breakers.values()):
+            await cb.refresh_state()
+        return self.get_circuit_states()
+
     async def reset_circuit_breaker(self, key: str, reset_by: str | None = None) -> dict[str, Any] | None:
         """Reset a specific circuit breaker to closed state.
 
@@ -1291,7 +1584,7 @@ class ToolExecutor:
         This method follows the Neuroglia pattern for service configuration,
         creating a singleton instance and registering it in the DI container.
 
-        Resolves KeycloakTokenExchanger and CircuitBreakerEventPublisher from the DI container.
+        Resolves KeycloakTokenExchanger, TokenBroker, CircuitBreakerEventPublisher and ToolResponseCache from the DI container.
         Creates OAuth2ClientCredentialsService if service account is configured.
 
         Args:
@@ -1304,6 +1597,7 @@ class ToolExecutor:
             RuntimeError: If KeycloakTokenExchanger is not registered
         """
         from application.settings import app_settings
+        from infrastructure.adapters.token_broker import TokenBroker
         from infrastructure.services import CircuitBreakerEventPublisher
 
         log = logging.getLogger(__name__)
@@ -1328,6 +1622,34 @@ class ToolExecutor:
 
         on_circuit_state_change = event_publisher.publish_event if event_publisher else None
 
+        # Resolve optional cluster-shared circuit breaker state
+        circuit_store: CircuitBreakerStateStore | None = None
+        for desc in builder.services:
+            if desc.service_type == CircuitBreakerStateStore and desc.singleton is not None:
+                circuit_store = desc.singleton
+                break
+
+        # Resolve optional shared token broker
+        token_broker: TokenBroker | None = None
+        for desc in builder.services:
+            if desc.service_type == TokenBroker and desc.singleton is not None:
+                token_broker = desc.singleton
+                break
+
+        # Resolve optional response cache and per-source default cache policies
+        response_cache: ToolResponseCache | None = None
+        for desc in builder.services:
+            if desc.service_type == ToolResponseCache and desc.singleton is not None:
+                response_cache = desc.singleton
+                break
+
+        source_cache_policies: dict[str, CachePolicy] = {}
+        for policy_source_id, policy_data in app_settings.tool_response_cache_source_policies.items():
+            try:
+                source_cache_policies[policy_source_id] = CachePolicy.from_dict(policy_data)
+            except (KeyError, TypeError, ValueError) as e:
+                log.warning(f"Ignoring invalid cache policy for source {policy_source_id}: {e}")
+
         # Always create OAuth2ClientCredentialsService for source-specific OAuth2 credentials
         # Default service account credentials are optional - sources can provide their own
         # Build token URL if not explicitly set (used as default when sources don't specify one)
@@ -1342,6 +1664,7 @@ class ToolExecutor:
             default_client_secret=app_settings.service_account_client_secret or "",
             http_timeout=app_settings.token_exchange_timeout,
             cache_buffer_seconds=app_settings.service_account_cache_buffer_seconds,
+            token_broker=token_broker,
         )
         builder.services.add_singleton(OAuth2ClientCredentialsService, singleton=client_credentials_service)
 
@@ -1357,6 +1680,11 @@ class ToolExecutor:
             max_poll_attempts=app_settings.tool_execution_max_poll_attempts,
             enable_schema_validation=app_settings.tool_execution_validate_schema,
             on_circuit_state_change=on_circuit_state_change,
+            circuit_store=circuit_store,
+            circuit_state_cache_seconds=app_settings.circuit_breaker_state_cache_seconds,
+            response_cache=response_cache,
+            source_cache_policies=source_cache_policies,
+            timing_sample_rate=app_settings.tool_execution_timing_sample_rate,
         )
         builder.services.add_singleton(ToolExecutor, singleton=tool_executor)
         log.info("✅ ToolExecutor configured")
@@ -0,0 +1,411 @@
+"""Durable background execution of ASYNC_POLL tools.
+
+Instead of holding the agent's request open while ToolExecutor polls the
+upstream status endpoint, the trigger request returns a job handle and
+ToolJobRunner finishes the job in the background:
+- Jobs are persisted (ToolJobDto in MongoDB), so they survive the request
+  and are visible to every replica
+- Every replica runs one scheduling loop; due jobs are claimed with a
+  short lease so each poll is made by exactly one replica, and a job whose
+  replica died is picked up again once its lease expires
+- At most ``max_concurrency`` polls run at the same time per replica
+- The poll interval, backoff and attempt budget come from the tool's PollConfig
+- Terminal states are published on Redis (``tool_job_updated:{owner_id}``),
+  which the agent SSE stream forwards; jobs can also be fetched by ID
+
+Token-exchange tools need the caller's token for every poll. Tokens are
+never persisted: they are kept in memory on the replica that accepted the
+job, which is recorded as the job's pinned instance. If that replica goes
+away, the job fails with ``credentials_unavailable`` once another replica
+takes it over.
+"""
+
+import asyncio
+import json
+import logging
+import socket
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from neuroglia.dependency_injection import ServiceProviderBase
+from neuroglia.hosting.abstractions import HostedService
+
+from domain.enums import AuthMode, ToolJobStatus
+from domain.models import PollConfig
+from domain.repositories import ToolJobDtoRepository
+from infrastructure.adapters.keycloak_token_exchanger import TokenExchangeError
+from integration.models import ToolJobDto
+from observability import tool_job_polls, tool_jobs_finished
+
+from .tool_executor import ToolExecutionResult, ToolExecutor
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+    from infrastructure.cache import RedisCacheService
+    from infrastructure.secrets import SourceSecretsStore
+
+logger = logging.getLogger(__name__)
+
+
+def job_updated_channel(owner_id: str) -> str:
+    """Redis channel (without the events prefix) on which an owner's job updates are published."""
+    return f"tool_job_updated:{owner_id}"
+
+
+class ToolJobRunner(HostedService):
+    """Hosted service that polls background ASYNC_POLL jobs to completion.
+
+    Implements HostedService for automatic lifecycle management:
+    - start_async(): Starts the scheduling loop
+    - stop_async(): Cancels the loop and any in-flight polls
+    """
+
+    def __init__(
+        self,
+        service_provider: ServiceProviderBase,
+        tool_executor: ToolExecutor,
+        secrets_store: "SourceSecretsStore | None" = None,
+        cache_service: "RedisCacheService | None" = None,
+        enabled: bool = True,
+        max_concurrency: int = 16,
+        tick_seconds: float = 2.0,
+        lease_seconds: float = 60.0,
+        orphan_after_seconds: float = 300.0,
+    ):
+        """Initialize the runner.
+
+        Args:
+            service_provider: Root service provider (a scope is created per repository use)
+            tool_executor: Executor making the status requests
+            secrets_store: Source credentials (API key, basic auth, OAuth2 client)
+            cache_service: Redis cache used to publish job updates
+            enabled: Whether tools are executed as background jobs at all
+            max_concurrency: Maximum polls running at the same time on this replica
+            tick_seconds: How often due jobs are claimed
+            lease_seconds: How long a claimed job is reserved for this replica
+            orphan_after_seconds: Overdue time after which another replica takes over a pinned job
+        """
+        self._service_provider = service_provider
+        self._tool_executor = tool_executor
+        self._secrets_store = secrets_store
+        self._cache_service = cache_service
+        self._enabled = enabled
+        self._max_concurrency = max_concurrency
+        self._tick = tick_seconds
+        self._lease = lease_seconds
+        self._orphan_after = orphan_after_seconds
+        self._instance_id = f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+
+        self._caller_tokens: dict[str, str] = {}
+        self._caller_tokens_checked_at = 0.0
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether ASYNC_POLL tools are executed as background jobs."""
+        return self._enabled
+
+    async def start_async(self) -> None:
+        """Start the scheduling loop."""
+        if self._enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"✅ ToolJobRunner started (instance={self._instance_id})")
+
+    async def stop_async(self) -> None:
+        """Stop the scheduling loop and cancel in-flight polls.
+
+        Cancelled jobs keep their state; their lease expires and they are
+        polled again by whichever replica claims them next.
+        """
+        if self._task is not None:
+            tasks = [self._task, *self._inflight.values()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._task = None
+            self._inflight.clear()
+            logger.info("✅ ToolJobRunner stopped")
+
+    # =========================================================================
+    # Submission
+    # =========================================================================
+
+    async def submit(
+        self,
+        tool_id: str,
+        source_id: str,
+        owner_id: str,
+        status_url: str,
+        poll_config: PollConfig,
+        agent_token: str,
+        auth_mode: AuthMode,
+        default_audience: str | None = None,
+        required_scopes: list[str] | None = None,
+    ) -> ToolJobDto:
+        """Persist a triggered ASYNC_POLL execution as a background job.
+
+        Args:
+            tool_id: Tool identifier
+            source_id: Source of the tool (credentials and circuit breaker)
+            owner_id: User who triggered the job (``sub`` claim)
+            status_url: Status URL rendered from the trigger response
+            poll_config: Polling configuration of the tool
+            agent_token: Caller's access token (kept in memory for token exchange only)
+            auth_mode: Authentication mode of the source
+            default_audience: Target audience for token exchange
+            required_scopes: Scopes to request during token exchange
+
+        Returns:
+            The created job
+        """
+        now = time.time()
+        needs_caller_token = auth_mode == AuthMode.TOKEN_EXCHANGE
+        job = ToolJobDto(
+            id=str(uuid.uuid4()),
+            tool_id=tool_id,
+            source_id=source_id,
+            owner_id=owner_id,
+            status=ToolJobStatus.RUNNING,
+            status_url=status_url,
+            poll_config=poll_config.to_dict(),
+            auth_mode=auth_mode.value,
+            default_audience=default_audience,
+            required_scopes=list(required_scopes or []),
+            interval_seconds=poll_config.poll_interval_seconds,
+            next_poll_at=now + poll_config.poll_interval_seconds,
+            pinned_instance=self._instance_id if needs_caller_token else None,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+        if needs_caller_token:
+            self._caller_tokens[job.id] = agent_token
+
+        async with self._repository() as repository:
+            await repository.add_async(job)
+        logger.info(f"Submitted background job {job.id} for tool {tool_id}")
+        return job
+
+    # =========================================================================
+    # Scheduling
+    # =========================================================================
+
+    async def tick(self) -> list[str]:
+        """Claim due jobs up to the free concurrency and poll them.
+
+        Returns:
+            IDs of the jobs whose poll was dispatched
+        """
+        await self._release_caller_tokens()
+        free = self._max_concurrency - len(self._inflight)
+        if free <= 0:
+            return []
+
+        async with self._repository() as repository:
+            jobs = await repository.claim_due_async(self._instance_id, time.time(), self._lease, free, self._orphan_after)
+
+        dispatched: list[str] = []
+        for job in jobs:
+            if job.id in self._inflight:
+                continue
+            task = asyncio.create_task(self._poll_job(job))
+            self._inflight[job.id] = task
+            task.add_done_callback(lambda _, jid=job.id: self._inflight.pop(jid, None))
+            dispatched.append(job.id)
+        return dispatched
+
+    async def _release_caller_tokens(self) -> None:
+        """Drop the caller tokens of jobs that finished elsewhere.
+
+        A pinned job overdue by more than ``orphan_after_seconds`` is taken
+        over (and finished) by another replica, so its token would otherwise
+        stay in this replica's memory. Checked at most once per lease period.
+        """
+        now = time.time()
+        if not self._caller_tokens or now - self._caller_tokens_checked_at < self._lease:
+            return
+        self._caller_tokens_checked_at = now
+
+        held = [job_id for job_id in self._caller_tokens if job_id not in self._inflight]
+        async with self._repository() as repository:
+            running = set(await repository.get_running_ids_async(held))
+        for job_id in held:
+            if job_id not in running:
+                self._caller_tokens.pop(job_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get runner statistics for monitoring."""
+        return {
+            "enabled": self._enabled,
+            "instance_id": self._instance_id,
+            "in_flight": len(self._inflight),
+            "held_caller_tokens": len(self._caller_tokens),
+        }
+
+    async def _poll_job(self, job: ToolJobDto) -> None:
+        """Make one status request for a job and record the outcome."""
+        poll_config = PollConfig.from_dict(job.poll_config)
+        auth_mode = AuthMode(job.auth_mode)
+
+        agent_token = self._caller_tokens.get(job.id, "")
+        if auth_mode == AuthMode.TOKEN_EXCHANGE and not agent_token:
+            # The replica holding the caller's token is gone
+            await self._finish(job, ToolJobStatus.FAILED, error={"error_code": "credentials_unavailable", "message": "Caller credentials for this job are no longer available"})
+            return
+
+        auth_config = self._secrets_store.get_auth_config(job.source_id) if self._secrets_store else None
+        try:
+            outcome = await self._tool_executor.poll_status(
+                tool_id=job.tool_id,
+                poll_config=poll_config,
+                status_url=job.status_url,
+                agent_token=agent_token,
+                attempt=job.attempts,
+                source_id=job.source_id,
+                auth_mode=auth_mode,
+                auth_config=auth_config,
+                default_audience=job.default_audience,
+                required_scopes=job.required_scopes,
+            )
+        except asyncio.CancelledError:
+            raise
+        except TokenExchangeError as e:
+            if not e.is_retryable:
+                tool_job_polls.add(1, {"outcome": "error"})
+                await self._finish(job, ToolJobStatus.FAILED, error={"error_code": "token_exchange_failed", "message": e.message})
+                return
+            logger.warning(f"Token exchange for job {job.id} failed, will retry: {e.message}")
+            outcome = None
+        except Exception as e:
+            logger.warning(f"Poll of job {job.id} failed: {e}")
+            outcome = None
+
+        job.attempts += 1
+        if outcome is not None:
+            tool_job_polls.add(1, {"outcome": outcome.status})
+            status = ToolJobStatus.COMPLETED if outcome.status == "completed" else ToolJobStatus.FAILED
+            await self._finish(job, status, outcome=outcome)
+            return
+
+        tool_job_polls.add(1, {"outcome": "pending"})
+        if job.attempts >= poll_config.max_poll_attempts:
+            await self._finish(
+                job,
+                ToolJobStatus.FAILED,
+                error={"error_code": "poll_timeout", "message": f"Async operation did not complete within {poll_config.max_poll_attempts} attempts"},
+            )
+            return
+
+        job.next_poll_at = time.time() + job.interval_seconds
+        job.interval_seconds = min(job.interval_seconds * poll_config.backoff_multiplier, poll_config.max_interval_seconds)
+        await self._save(job)
+
+    async def _finish(
+        self,
+        job: ToolJobDto,
+        status: ToolJobStatus,
+        outcome: ToolExecutionResult | None = None,
+        error: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a terminal state, release the caller's token and notify the owner."""
+        job.status = status
+        job.completed_at = datetime.now(UTC)
+        if outcome is not None:
+            job.result = outcome.result
+            job.upstream_status = outcome.upstream_status
+        job.error = error
+        await self._save(job)
+
+        self._caller_tokens.pop(job.id, None)
+        tool_jobs_finished.add(1, {"status": status.value, "error_code": (error or {}).get("error_code", "")})
+        logger.info(f"Background job {job.id} for tool {job.tool_id} finished: {status.value}")
+        await self._publish(job)
+
+    async def _save(self, job: ToolJobDto) -> None:
+        job.lease_owner = None
+        job.lease_expires_at = 0.0
+        job.updated_at = datetime.now(UTC)
+        async with self._repository() as repository:
+            await repository.update_async(job)
+
+    async def _publish(self, job: ToolJobDto) -> None:
+        if self._cache_service is None:
+            return
+        message = json.dumps({"job_id": job.id, "tool_id": job.tool_id, "status": job.status.value})
+        try:
+            await self._cache_service.publish_update(job_updated_channel(job.owner_id), message)
+        except Exception as e:
+            logger.debug(f"Failed to publish update of job {job.id}: {e}")
+
+    @asynccontextmanager
+    async def _repository(self) -> AsyncIterator[ToolJobDtoRepository]:
+        """Resolve the job repository in its own scope."""
+        async with self._service_provider.create_async_scope() as scope:
+            yield scope.get_required_service(ToolJobDtoRepository)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.warning(f"Tool job scheduling failed: {e}")
+            await asyncio.sleep(self._tick)
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Register the tool job runner and its HostedService.
+
+        The runner is always registered (ExecuteToolCommandHandler depends on
+        it); its scheduling loop is only started when ``tool_jobs_enabled``.
+        Resolves RedisCacheService from the DI container if available.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from application.settings import app_settings
+        from infrastructure.cache import RedisCacheService
+        from infrastructure.secrets import SourceSecretsStore
+
+        log = logging.getLogger(__name__)
+        log.info("🔧 Configuring ToolJobRunner...")
+
+        cache_service: RedisCacheService | None = None
+        for desc in builder.services:
+            if desc.service_type == RedisCacheService and desc.singleton is not None:
+                cache_service = desc.singleton
+                break
+
+        def create_runner(sp: ServiceProviderBase) -> ToolJobRunner:
+            return ToolJobRunner(
+                service_provider=sp,
+                tool_executor=sp.get_required_service(ToolExecutor),
+                secrets_store=sp.get_service(SourceSecretsStore),
+                cache_service=cache_service,
+                enabled=app_settings.tool_jobs_enabled,
+                max_concurrency=app_settings.tool_jobs_max_concurrency,
+                tick_seconds=app_settings.tool_jobs_tick_seconds,
+                lease_seconds=app_settings.tool_jobs_lease_seconds,
+                orphan_after_seconds=app_settings.tool_jobs_orphan_after_seconds,
+            )
+
+        builder.services.add_singleton(ToolJobRunner, implementation_factory=create_runner)
+        if not app_settings.tool_jobs_enabled:
+            log.info("⏭️ ToolJobRunner disabled (ASYNC_POLL tools are polled in-request)")
+            return builder
+
+        builder.services.add_singleton(HostedService, implementation_factory=lambda sp: sp.get_required_service(ToolJobRunner))
+        log.info("✅ ToolJobRunner configured")
+
+        return builder
@@ -0,0 +1,353 @@
+"""Tool Response Cache: opt-in caching of idempotent tool responses.
+
+Read-only GET tools whose execution profile (or source) carries a
+CachePolicy have their successful responses cached, so an agent asking
+the same question repeatedly does not hit the upstream every time.
+
+Key Features:
+- Two tiers: bounded LRU per instance (L1) and optional Redis (L2)
+- Stale-while-revalidate: a stale entry is served while one background
+  fetch refreshes it
+- Single-flight: concurrent misses for the same key share one upstream call
+- Keys include the tool definition hash, so a changed definition never
+  serves responses produced by the old one
+- Per-tool hit/miss/revalidation metrics
+
+Usage:
+    key = ToolResponseCache.make_key(tool_id, definition_hash, policy, arguments, claims, auth_context, identity_bound)
+    payload, outcome = await cache.get_or_fetch(key, tool_id, policy, fetch)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from opentelemetry import trace
+
+from domain.models import CachePolicy
+from observability import tool_response_cache_hits, tool_response_cache_misses, tool_response_cache_revalidations
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+
+@dataclass
+class _CachedResponse:
+    """A cached tool response with its freshness window.
+
+    Attributes:
+        payload: JSON-serializable response payload
+        fresh_until: Served without revalidation until then (epoch seconds)
+        stale_until: Served while revalidating until then (epoch seconds)
+    """
+
+    payload: dict[str, Any]
+    fresh_until: float
+    stale_until: float
+
+
+class ToolResponseCache:
+    """Two-tier, single-flight response cache for idempotent tools.
+
+    Payloads are plain JSON-serializable dicts; callers convert to and from
+    their result types. Keys are built by ``make_key`` and never contain
+    raw argument values or user identifiers.
+    """
+
+    def __init__(
+        self,
+        cache_service: Any | None = None,
+        max_local_entries: int = 5000,
+        max_entry_bytes: int = 512 * 1024,
+        redis_key_prefix: str = "mcp:tool_cache:",
+    ) -> None:
+        """Initialize the response cache.
+
+        Args:
+            cache_service: Optional RedisCacheService for the shared tier
+            max_local_entries: Maximum responses kept in the local LRU tier
+            max_entry_bytes: Responses larger than this (serialized) are not cached
+            redis_key_prefix: Prefix for shared-tier keys
+        """
+        self._cache_service = cache_service
+        self._max_local_entries = max_local_entries
+        self._max_entry_bytes = max_entry_bytes
+        self._redis_key_prefix = redis_key_prefix
+
+        self._local: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._revalidating: set[str] = set()
+        self._background_tasks: set[asyncio.Task] = set()
+
+        logger.info(f"ToolResponseCache initialized (max_local_entries={max_local_entries}, shared_tier={'redis' if cache_service else 'disabled'})")
+
+    @staticmethod
+    def make_key(
+        tool_id: str,
+        definition_hash: str,
+        policy: CachePolicy,
+        arguments: dict[str, Any],
+        claims: dict[str, Any],
+        auth_context: str = "",
+        identity_bound: bool = False,
+    ) -> str | None:
+        """Build the cache key of a tool call.
+
+        Args:
+            tool_id: Tool identifier
+            definition_hash: Hash of the tool definition (changes invalidate entries)
+            policy: Cache policy of the tool
+            arguments: Call arguments
+            claims: End user's JWT claims (for user and tenant scope)
+            auth_context: Upstream credential context (auth mode, audience)
+            identity_bound: Whether the upstream sees the end user's identity
+
+        Returns:
+            The key, or None if the call cannot be cached (missing scope claim)
+        """
+        scope = policy.scope
+        if identity_bound and policy.vary_by_auth:
+            scope = "user"
+
+        if scope == "user":
+            scope_value = claims.get("sub")
+        elif scope == "tenant":
+            scope_value = claims.get(policy.tenant_claim)
+        else:
+            scope_value = ""
+        if scope_value is None or (scope != "shared" and not scope_value):
+            return None
+
+        selected = {name: value for name, value in arguments.items() if (policy.key_arguments is None or name in policy.key_arguments) and name not in policy.exclude_arguments}
+        arguments_hash = hashlib.sha256(json.dumps(selected, sort_keys=True, default=str).encode()).hexdigest()[:32]
+        scope_hash = hashlib.sha256(f"{scope_value}|{auth_context}".encode()).hexdigest()[:16]
+        return f"{tool_id}:{definition_hash}:{scope}:{scope_hash}:{arguments_hash}"
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        tool_id: str,
+        policy: CachePolicy,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+        should_store: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> tuple[dict[str, Any], str]:
+        """Get a response from cache, or fetch it once for all concurrent callers.
+
+        Args:
+            key: Cache key from ``make_key``
+            tool_id: Tool identifier (metric attribute)
+            policy: Cache policy (TTL and stale window)
+            fetch: Coroutine factory calling the upstream and returning the payload
+            should_store: Payloads for which this returns False are not cached
+
+        Returns:
+            Tuple of payload and outcome: "hit", "stale" or "miss"
+
+        Raises:
+            Whatever ``fetch`` raises on a miss
+        """
+        now = time.time()
+        entry = self._get_local(key)
+        tier = "local"
+        if entry is None or entry.stale_until <= now:
+            entry = await self._get_shared(key)
+            tier = "shared"
+            if entry is not None and entry.stale_until > now:
+                self._put_local(key, entry)
+            else:
+                entry = None
+
+        if entry is not None:
+            if now < entry.fresh_until:
+                tool_response_cache_hits.add(1, {"tool_id": tool_id, "tier": tier, "freshness": "fresh"})
+                return entry.payload, "hit"
+            tool_response_cache_hits.add(1, {"tool_id": tool_id, "tier": tier, "freshness": "stale"})
+            self._schedule_revalidation(key, tool_id, policy, fetch, should_store)
+            return entry.payload, "stale"
+
+        tool_response_cache_misses.add(1, {"tool_id": tool_id})
+        return await self._fetch_single_flight(key, policy, fetch, should_store), "miss"
+
+    async def _fetch_single_flight(
+        self,
+        key: str,
+        policy: CachePolicy,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+        should_store: Callable[[dict[str, Any]], bool] | None,
+    ) -> dict[str, Any]:
+        """Fetch a response, joining an in-flight fetch for the same key if there is one."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_store(key, policy, fetch, should_store))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._on_fetch_done(key, done))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        policy: CachePolicy,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+        should_store: Callable[[dict[str, Any]], bool] | None,
+    ) -> dict[str, Any]:
+        payload = await fetch()
+        if should_store is None or should_store(payload):
+            await self._store(key, policy, payload)
+        return payload
+
+    def _on_fetch_done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away
+            task.exception()
+
+    def _schedule_revalidation(
+        self,
+        key: str,
+        tool_id: str,
+        policy: CachePolicy,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+        should_store: Callable[[dict[str, Any]], bool] | None,
+    ) -> None:
+        """Refresh a stale entry in the background; callers keep getting the stale copy."""
+        if key in self._revalidating or key in self._inflight:
+            return
+        self._revalidating.add(key)
+
+        async def revalidate() -> None:
+            try:
+                await self._fetch_single_flight(key, policy, fetch, should_store)
+                tool_response_cache_revalidations.add(1, {"tool_id": tool_id, "status": "success"})
+            except Exception as e:
+                tool_response_cache_revalidations.add(1, {"tool_id": tool_id, "status": "failure"})
+                logger.warning(f"Background revalidation of cached response for tool {tool_id} failed: {e}")
+            finally:
+                self._revalidating.discard(key)
+
+        task = asyncio.create_task(revalidate())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _store(self, key: str, policy: CachePolicy, payload: dict[str, Any]) -> None:
+        try:
+            data = json.dumps(payload, default=str)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Tool response not cacheable: {e}")
+            return
+        if len(data) > self._max_entry_bytes:
+            return
+
+        now = time.time()
+        entry = _CachedResponse(payload=payload, fresh_until=now + policy.ttl_seconds, stale_until=now + policy.ttl_seconds + policy.stale_while_revalidate_seconds)
+        self._put_local(key, entry)
+        await self._put_shared(key, entry, data)
+
+    # =========================================================================
+    # Local (LRU) tier
+    # =========================================================================
+
+    def _get_local(self, key: str) -> _CachedResponse | None:
+        entry = self._local.get(key)
+        if entry is not None:
+            self._local.move_to_end(key)
+        return entry
+
+    def _put_local(self, key: str, entry: _CachedResponse) -> None:
+        self._local[key] = entry
+        self._local.move_to_end(key)
+        while len(self._local) > self._max_local_entries:
+            self._local.popitem(last=False)
+
+    # =========================================================================
+    # Shared (Redis) tier
+    # =========================================================================
+
+    async def _get_shared(self, key: str) -> _CachedResponse | None:
+        if not self._cache_service:
+            return None
+        try:
+            data = await self._cache_service.client.get(f"{self._redis_key_prefix}{key}")
+            if not data:
+                return None
+            stored = json.loads(data)
+            return _CachedResponse(payload=stored["payload"], fresh_until=stored["fresh_until"], stale_until=stored["stale_until"])
+        except Exception as e:
+            logger.warning(f"Tool response cache shared tier read failed: {e}")
+            return None
+
+    async def _put_shared(self, key: str, entry: _CachedResponse, payload_json: str) -> None:
+        if not self._cache_service:
+            return
+        ttl = int(entry.stale_until - time.time()) + 1
+        try:
+            data = f'{{"payload": {payload_json}, "fresh_until": {entry.fresh_until}, "stale_until": {entry.stale_until}}}'
+            await self._cache_service.client.set(f"{self._redis_key_prefix}{key}", data, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Tool response cache shared tier write failed: {e}")
+
+    # =========================================================================
+    # Monitoring
+    # =========================================================================
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics for health checks."""
+        return {
+            "local_entries": len(self._local),
+            "max_local_entries": self._max_local_entries,
+            "inflight_fetches": len(self._inflight),
+            "pending_revalidations": len(self._revalidating),
+            "shared_tier": self._cache_service is not None,
+        }
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Configure and register the tool response cache.
+
+        Resolves RedisCacheService from the DI container if available.
+        Does nothing when ``tool_response_cache_enabled`` is off.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from application.settings import app_settings
+        from infrastructure.cache import RedisCacheService
+
+        log = logging.getLogger(__name__)
+        if not app_settings.tool_response_cache_enabled:
+            log.info("⏭️ ToolResponseCache disabled")
+            return builder
+
+        log.info("🔧 Configuring ToolResponseCache...")
+
+        cache_service: RedisCacheService | None = None
+        for desc in builder.services:
+            if desc.service_type == RedisCacheService and desc.singleton is not None:
+                cache_service = desc.singleton
+                break
+
+        cache = ToolResponseCache(
+            cache_service=cache_service,
+            max_local_entries=app_settings.tool_response_cache_max_local_entries,
+            max_entry_bytes=app_settings.tool_response_cache_max_entry_kb * 1024,
+        )
+        builder.services.add_singleton(ToolResponseCache, singleton=cache)
+        log.info("✅ ToolResponseCache configured")
+
+        return builder
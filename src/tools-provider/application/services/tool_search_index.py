@@ -0,0 +1,558 @@
+"""In-memory ranked search over the tools catalog.
+
+GET /tools/search used to run a prefix regex plus a MongoDB ``$text`` query
+per request, which ranks poorly (no prefix or typo tolerance, no field
+weights) and costs a database round trip per keystroke in the UI.
+ToolSearchIndex keeps an inverted index of the SourceToolDto read model in
+process instead:
+- Built from MongoDB at startup (HostedService), then kept current by the
+  SourceTool and Label projection handlers, and refreshed periodically from
+  the tools changed since the last refresh (``updated_at``), so replicas
+  that did not project a change catch up
+- Okapi BM25 over tool name and operation ID, tags, label names, path and
+  description (name terms weigh 3x, tags and labels 2x)
+- Prefix matching ("wea" finds "weather") through a sorted vocabulary, and
+  typo tolerance (one edit) through a symmetric-delete map, used when a
+  term has no exact or prefix match
+- Filters by source, tags (all must match) and enabled state; deprecated
+  tools are never returned
+- Facet counts by source and tag over the filtered matches
+
+Until the index is loaded (or when it is disabled) search falls back to
+the MongoDB query.
+"""
+
+import asyncio
+import bisect
+import heapq
+import logging
+import math
+import re
+import time
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+
+from neuroglia.hosting.abstractions import HostedService
+
+from integration.models.source_tool_dto import SourceToolDto
+from observability import tool_search_time
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"[A-Z]+(?![a-z])\d*|[A-Z]?[a-z]+\d*|\d+")
+
+# Field weights: a term in the name counts as three description terms
+_NAME_WEIGHT = 3
+_TAG_WEIGHT = 2
+_LABEL_WEIGHT = 2
+
+# Score multipliers of expanded query terms relative to an exact match
+_PREFIX_WEIGHT = 0.7
+_FUZZY_WEIGHT = 0.5
+_FUZZY_MIN_LENGTH = 4
+
+# Read-model fields the index needs (also the projection used when loading from MongoDB)
+_INDEXED_FIELDS = ("id", "source_id", "tool_name", "operation_id", "description", "path", "tags", "label_ids", "is_enabled", "status")
+
+# Changes are re-read from slightly before the previous refresh: updated_at is
+# the event time, which precedes the moment another replica projects it
+_REFRESH_OVERLAP = timedelta(minutes=1)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase terms (snake_case, camelCase, paths and dotted names are split, "oauth2" is kept)."""
+    return [term for term in (word.lower() for word in _WORD_PATTERN.findall(text or "")) if len(term) > 1]
+
+
+def _deletes(term: str) -> set[str]:
+    """Variants of a term with one character deleted, plus the term itself."""
+    return {term, *(term[:i] + term[i + 1 :] for i in range(len(term)))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Check whether two terms differ by at most one insertion, deletion or substitution."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1 :] == b[i + 1 :]
+    return a[i:] == b[i + 1 :]
+
+
+@dataclass
+class _IndexedTool:
+    """What the index keeps of one tool."""
+
+    tool_name: str
+    source_id: str
+    tags: frozenset[str]
+    label_ids: tuple[str, ...]
+    is_enabled: bool
+    status: str
+    base_terms: Counter[str]
+    """Weighted term frequencies of every field but labels."""
+    terms: Counter[str] = field(default_factory=Counter)
+    """Weighted term frequencies including label names."""
+
+
+@dataclass
+class ToolSearchHits:
+    """One page of ranked search results."""
+
+    ids: list[str]
+    """Tool IDs of the page, best match first."""
+
+    total: int
+    """Number of matching tools (all pages)."""
+
+    facets: dict[str, dict[str, int]]
+    """Match counts by "source_id" and by "tags"."""
+
+
+class ToolSearchIndex(HostedService):
+    """Inverted BM25 index of the SourceToolDto read model.
+
+    Implements HostedService for automatic lifecycle management:
+    - start_async(): Loads the read model, then refreshes it, in the background
+    - stop_async(): Cancels loading and refreshing
+    """
+
+    def __init__(
+        self,
+        client: "AsyncIOMotorClient | None" = None,
+        database_name: str = "",
+        tool_collection: str = "sourcetool",
+        label_collection: str = "label",
+        max_expansions: int = 32,
+        refresh_seconds: float = 30.0,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        """Initialize the index.
+
+        Args:
+            client: Motor client used to load the read model (None = index fed only through load())
+            database_name: Read-model database
+            tool_collection: Collection of SourceToolDto documents
+            label_collection: Collection of LabelDto documents
+            max_expansions: Maximum vocabulary terms a query term expands to by prefix or typo
+            refresh_seconds: How often changes are re-read from MongoDB (0 = only at startup)
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self._client = client
+        self._database_name = database_name
+        self._tool_collection = tool_collection
+        self._label_collection = label_collection
+        self._max_expansions = max_expansions
+        self._refresh_seconds = refresh_seconds
+        self._k1 = k1
+        self._b = b
+        self._task: asyncio.Task | None = None
+        self._ready = False
+        self._loading = False
+        self._pending: dict[str, Mapping[str, Any] | None] = {}
+        self._refreshed_at: datetime | None = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._tools: dict[str, _IndexedTool] = {}
+        self._labels: dict[str, str] = {}
+        self._label_tools: dict[str, set[str]] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._fuzzy: dict[str, set[str]] = {}
+        self._total_length = 0
+        self._vocabulary: list[str] = []
+        self._vocabulary_dirty = False
+        self._norms: dict[str, float] = {}
+        self._norms_dirty = False
+        self._term_scores: dict[str, dict[str, float]] = {}
+
+    @property
+    def ready(self) -> bool:
+        """Whether the index holds the whole read model and can serve searches."""
+        return self._ready
+
+    async def start_async(self) -> None:
+        """Load the read model, then refresh it periodically, in the background."""
+        if self._task is None and self._client is not None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop_async(self) -> None:
+        """Cancel loading and refreshing."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    # =========================================================================
+    # Loading and Maintenance
+    # =========================================================================
+
+    async def load_async(self) -> None:
+        """Build the index from the MongoDB read model.
+
+        Changes projected while loading are replayed on top of the loaded
+        documents, so none are lost to the race with the initial read.
+        """
+        if self._client is None:
+            return
+        started = time.perf_counter()
+        refreshed_at = datetime.now(UTC)
+        self._loading = True
+        self._pending.clear()
+        try:
+            database = self._client[self._database_name]
+            labels = {doc["id"]: doc.get("name", "") async for doc in database[self._label_collection].find({"is_deleted": {"$ne": True}}, {"id": 1, "name": 1})}
+            documents = [doc async for doc in database[self._tool_collection].find({}, {name: 1 for name in _INDEXED_FIELDS})]
+        except Exception as e:
+            self._loading = False
+            logger.warning(f"Could not load the tool search index, searching MongoDB instead: {e}")
+            return
+        self.load(documents, labels)
+        self._refreshed_at = refreshed_at
+        logger.info(f"✅ Tool search index loaded: {len(self._tools)} tools, {len(self._postings)} terms in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    async def refresh_async(self) -> None:
+        """Apply the read-model changes made since the previous load or refresh.
+
+        Re-indexes the tools whose ``updated_at`` is recent, drops the tools
+        no longer in the read model and picks up label renames. Does nothing
+        until the index is loaded.
+        """
+        if self._client is None or not self._ready or self._refreshed_at is None:
+            return
+        refreshed_at = datetime.now(UTC)
+        database = self._client[self._database_name]
+        labels = {doc["id"]: doc.get("name", "") async for doc in database[self._label_collection].find({"is_deleted": {"$ne": True}}, {"id": 1, "name": 1})}
+        tools = database[self._tool_collection]
+        changed = [doc async for doc in tools.find({"updated_at": {"$gte": self._refreshed_at - _REFRESH_OVERLAP}}, {name: 1 for name in _INDEXED_FIELDS})]
+        present = {doc["id"] async for doc in tools.find({}, {"id": 1, "_id": 0})}
+        self.apply_changes(changed, present, labels)
+        self._refreshed_at = refreshed_at
+
+    def apply_changes(self, documents: Iterable[Mapping[str, Any]], present_ids: set[str], labels: Mapping[str, str]) -> None:
+        """Re-index changed tools, drop deleted ones and sync label names.
+
+        Args:
+            documents: Read-model documents changed since the previous refresh
+            present_ids: IDs of all tools in the read model
+            labels: Label names keyed by label ID (all labels)
+        """
+        for label_id in [label_id for label_id in self._labels if label_id not in labels]:
+            self.set_label(label_id, None)
+        for label_id, name in labels.items():
+            if self._labels.get(label_id) != name:
+                self.set_label(label_id, name)
+        for document in documents:
+            self._remove(document["id"])
+            self._add(document)
+        for tool_id in [tool_id for tool_id in self._tools if tool_id not in present_ids]:
+            self._remove(tool_id)
+
+    async def _run(self) -> None:
+        await self.load_async()
+        if self._refresh_seconds <= 0:
+            return
+        while True:
+            await asyncio.sleep(self._refresh_seconds)
+            try:
+                await self.refresh_async()
+            except Exception as e:
+                logger.warning(f"Could not refresh the tool search index: {e}")
+
+    def load(self, documents: Iterable[Mapping[str, Any]], labels: Mapping[str, str] | None = None) -> None:
+        """Replace the index content and mark it ready.
+
+        Args:
+            documents: Read-model documents (or dicts with the same fields)
+            labels: Label names keyed by label ID
+        """
+        pending, self._pending = self._pending, {}
+        self._reset()
+        self._labels = dict(labels or {})
+        for document in documents:
+            self._add(document)
+        for tool_id, document in pending.items():
+            self._remove(tool_id)
+            if document is not None:
+                self._add(document)
+        self._loading = False
+        self._ready = True
+
+    def upsert(self, tool: SourceToolDto) -> None:
+        """Index a new or changed tool (no-op until the index is loaded)."""
+        document = {name: getattr(tool, name, None) for name in _INDEXED_FIELDS}
+        if self._loading:
+            self._pending[tool.id] = document
+        if self._ready:
+            self._remove(tool.id)
+            self._add(document)
+
+    def remove(self, tool_id: str) -> None:
+        """Drop a tool from the index."""
+        if self._loading:
+            self._pending[tool_id] = None
+        if self._ready:
+            self._remove(tool_id)
+
+    def set_label(self, label_id: str, name: str | None) -> None:
+        """Create, rename (name) or delete (None) a label and re-index its tools."""
+        if name is None:
+            self._labels.pop(label_id, None)
+        else:
+            self._labels[label_id] = name
+        for tool_id in list(self._label_tools.get(label_id, ())):
+            self._reindex(tool_id)
+
+    def _add(self, document: Mapping[str, Any]) -> None:
+        tool_id = document["id"]
+        base_terms = Counter(
+            tokenize(f"{document.get('tool_name') or ''} {document.get('operation_id') or ''}") * _NAME_WEIGHT
+            + tokenize(" ".join(document.get("tags") or [])) * _TAG_WEIGHT
+            + tokenize(document.get("path") or "")
+            + tokenize(document.get("description") or "")
+        )
+        entry = _IndexedTool(
+            tool_name=document.get("tool_name") or "",
+            source_id=document.get("source_id") or "",
+            tags=frozenset(document.get("tags") or []),
+            label_ids=tuple(document.get("label_ids") or []),
+            is_enabled=bool(document.get("is_enabled", True)),
+            status=document.get("status") or "active",
+            base_terms=base_terms,
+        )
+        self._tools[tool_id] = entry
+        for label_id in entry.label_ids:
+            self._label_tools.setdefault(label_id, set()).add(tool_id)
+        self._index_terms(tool_id, entry)
+
+    def _remove(self, tool_id: str) -> None:
+        entry = self._tools.pop(tool_id, None)
+        if entry is None:
+            return
+        for label_id in entry.label_ids:
+            tools = self._label_tools.get(label_id)
+            if tools is not None:
+                tools.discard(tool_id)
+                if not tools:
+                    del self._label_tools[label_id]
+        self._unindex_terms(tool_id, entry)
+
+    def _reindex(self, tool_id: str) -> None:
+        entry = self._tools[tool_id]
+        self._unindex_terms(tool_id, entry)
+        self._index_terms(tool_id, entry)
+
+    def _index_terms(self, tool_id: str, entry: _IndexedTool) -> None:
+        label_names = " ".join(self._labels.get(label_id, "") for label_id in entry.label_ids)
+        entry.terms = entry.base_terms + Counter(tokenize(label_names) * _LABEL_WEIGHT)
+        for term, frequency in entry.terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary_dirty = True
+                if len(term) >= _FUZZY_MIN_LENGTH:
+                    for variant in _deletes(term):
+                        self._fuzzy.setdefault(variant, set()).add(term)
+            postings[tool_id] = frequency
+        self._total_length += sum(entry.terms.values())
+        self._norms_dirty = True
+
+    def _unindex_terms(self, tool_id: str, entry: _IndexedTool) -> None:
+        for term in entry.terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(tool_id, None)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+                if len(term) >= _FUZZY_MIN_LENGTH:
+                    for variant in _deletes(term):
+                        terms = self._fuzzy.get(variant)
+                        if terms is not None:
+                            terms.discard(term)
+                            if not terms:
+                                del self._fuzzy[variant]
+        self._total_length -= sum(entry.terms.values())
+        self._norms.pop(tool_id, None)
+        self._norms_dirty = True
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    def search(
+        self,
+        query: str,
+        source_id: str | None = None,
+        tags: list[str] | None = None,
+        include_disabled: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> ToolSearchHits:
+        """Rank the tools matching a query.
+
+        Args:
+            query: Free-text query (terms are OR-ed, each may match by prefix or with one typo)
+            source_id: Optional filter by source
+            tags: Optional filter by tags (all must match)
+            include_disabled: Whether to include disabled tools
+            offset: Number of ranked results to skip
+            limit: Maximum results to return (None = all)
+
+        Returns:
+            The requested page, the total number of matches and facet counts
+        """
+        started = time.perf_counter()
+        self._refresh_statistics()
+        scores: dict[str, float] = {}
+        for term in dict.fromkeys(tokenize(query)):
+            expansions = self._expand(term)
+            if len(expansions) == 1 and expansions[0][1] == 1.0 and not scores:
+                scores = dict(self._scores_of(term))
+                continue
+            term_scores: dict[str, float] = {}
+            for candidate, weight in expansions:
+                for tool_id, score in self._scores_of(candidate).items():
+                    score *= weight
+                    if score > term_scores.get(tool_id, 0.0):
+                        term_scores[tool_id] = score
+            for tool_id, score in term_scores.items():
+                scores[tool_id] = scores.get(tool_id, 0.0) + score
+
+        required_tags = set(tags or [])
+        tools = self._tools
+        matches: list[tuple[float, str, str]] = []
+        matched: list[_IndexedTool] = []
+        for tool_id, score in scores.items():
+            entry = tools[tool_id]
+            if entry.status != "active" or (not include_disabled and not entry.is_enabled):
+                continue
+            if (source_id and entry.source_id != source_id) or (required_tags and not required_tags <= entry.tags):
+                continue
+            matches.append((score, entry.tool_name, tool_id))
+            matched.append(entry)
+
+        def rank(match: tuple[float, str, str]) -> tuple[float, str]:
+            return -match[0], match[1]
+
+        end = None if limit is None else offset + limit
+        ranked = sorted(matches, key=rank) if end is None else heapq.nsmallest(end, matches, key=rank)
+        source_counts = Counter(entry.source_id for entry in matched)
+        tag_counts = Counter(chain.from_iterable(entry.tags for entry in matched))
+        tool_search_time.record((time.perf_counter() - started) * 1000, {"backend": "index"})
+        return ToolSearchHits(
+            ids=[tool_id for _, _, tool_id in ranked[offset:end]],
+            total=len(matches),
+            facets={"source_id": dict(source_counts.most_common()), "tags": dict(tag_counts.most_common())},
+        )
+
+    def _scores_of(self, term: str) -> dict[str, float]:
+        """Get the BM25 score of a vocabulary term for every tool containing it (cached until the index changes)."""
+        scores = self._term_scores.get(term)
+        if scores is None:
+            postings = self._postings[term]
+            idf = math.log(1 + (len(self._tools) - len(postings) + 0.5) / (len(postings) + 0.5))
+            saturation = self._k1 + 1
+            norms = self._norms
+            scores = self._term_scores[term] = {tool_id: idf * frequency * saturation / (frequency + norms[tool_id]) for tool_id, frequency in postings.items()}
+        return scores
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """Get the vocabulary terms a query term matches, with their score weights."""
+        expansions = [(term, 1.0)] if term in self._postings else []
+        start = bisect.bisect_left(self._vocabulary, term)
+        for candidate in self._vocabulary[start : start + self._max_expansions + 1]:
+            if not candidate.startswith(term):
+                break
+            if candidate != term:
+                expansions.append((candidate, _PREFIX_WEIGHT))
+        if expansions or len(term) < _FUZZY_MIN_LENGTH:
+            return expansions[: self._max_expansions]
+
+        candidates: set[str] = set()
+        for variant in _deletes(term):
+            candidates.update(self._fuzzy.get(variant, ()))
+        return [(candidate, _FUZZY_WEIGHT) for candidate in sorted(candidates) if _within_one_edit(term, candidate)][: self._max_expansions]
+
+    def _refresh_statistics(self) -> None:
+        """Rebuild the sorted vocabulary and length norms after changes."""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        if self._norms_dirty:
+            average = self._total_length / len(self._tools) if self._tools else 1.0
+            self._norms = {tool_id: self._k1 * (1 - self._b + self._b * sum(entry.terms.values()) / average) for tool_id, entry in self._tools.items()}
+            self._norms_dirty = False
+            self._term_scores.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index statistics for monitoring."""
+        return {
+            "ready": self._ready,
+            "tools": len(self._tools),
+            "terms": len(self._postings),
+            "labels": len(self._labels),
+        }
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Register the search index as a singleton and HostedService.
+
+        Must be called after the read model is configured (it registers the
+        shared AsyncIOMotorClient). The singleton is registered even when the
+        index is disabled, since projection handlers depend on it; it then
+        never becomes ready and searches go to MongoDB.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        from application.settings import app_settings
+
+        log = logging.getLogger(__name__)
+        client: AsyncIOMotorClient | None = None
+        if app_settings.tool_search_index_enabled:
+            for desc in builder.services:
+                if desc.service_type == AsyncIOMotorClient and desc.singleton is not None:
+                    client = desc.singleton
+                    break
+            if client is None:
+                log.warning("AsyncIOMotorClient not registered, tool search uses MongoDB")
+        else:
+            log.info("⏭️ ToolSearchIndex disabled")
+
+        index = ToolSearchIndex(
+            client=client,
+            database_name=app_settings.database_name,
+            max_expansions=app_settings.tool_search_max_expansions,
+            refresh_seconds=app_settings.tool_search_index_refresh_seconds,
+        )
+        builder.services.add_singleton(ToolSearchIndex, singleton=index)
+        if client is not None:
+            builder.services.add_singleton(HostedService, singleton=index)
+            log.info("✅ ToolSearchIndex configured")
+
+        return builder
@@ -0,0 +1,7 @@
+"""Load-test harness for the tools-provider tool proxy path.
+
+Boots tools-provider against local stand-ins (upstream-sample as the
+upstream API, a fake token exchanger, in-memory Redis and read model) and
+measures ``GET /agent/tools`` and ``POST /agent/tools/call`` under
+configurable concurrency profiles. See docs/development/benchmarks.md.
+"""
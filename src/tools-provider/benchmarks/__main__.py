@@ -0,0 +1,65 @@
+"""Run the tool proxy benchmark.
+
+Usage:
+    PYTHONPATH=. python -m benchmarks --profile baseline --save main
+    PYTHONPATH=. python -m benchmarks --profile baseline --compare main
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+from benchmarks.runner import PROFILES, SCENARIOS, baseline_path, build_report, compare, format_comparison, format_results, free_port, run_benchmark, save_report, service_process
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the tools-provider tool proxy path against local stand-ins")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="smoke", help="Concurrency profile (default: smoke)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"Comma-separated scenarios (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--concurrency", help="Comma-separated concurrency levels, overriding the profile")
+    parser.add_argument("--tools", type=int, default=200, help="Filler tools in the catalog (default: 200)")
+    parser.add_argument("--sources", type=int, default=10, help="Filler sources, one group each (default: 10)")
+    parser.add_argument("--exchange-latency-ms", type=float, default=20.0, help="Simulated Keycloak latency of a token exchange cache miss (default: 20)")
+    parser.add_argument("--server-log-level", default="WARNING", help="LOG_LEVEL of the benchmark server (default: WARNING)")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this path")
+    parser.add_argument("--save", metavar="NAME", help="Save the report as baseline NAME")
+    parser.add_argument("--compare", metavar="NAME", help="Compare to baseline NAME and exit 1 on regression")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed p95 growth / RPS drop before a step regresses (default: 0.10)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    profile = PROFILES[args.profile]
+    scenarios = [SCENARIOS[name] for name in args.scenarios.split(",")]
+    concurrency = tuple(int(level) for level in args.concurrency.split(",")) if args.concurrency else None
+    settings = {"tools": args.tools, "sources": args.sources, "exchange_latency_ms": args.exchange_latency_ms, "concurrency": list(concurrency or profile.concurrency)}
+
+    upstream_port, server_port = free_port(), free_port()
+    upstream_url = f"http://127.0.0.1:{upstream_port}"
+    server_url = f"http://127.0.0.1:{server_port}"
+    env = {"PYTHONPATH": os.pathsep.join(filter(None, [".", os.getenv("PYTHONPATH")])), "LOG_LEVEL": args.server_log_level, "OTEL_ENABLED": os.getenv("OTEL_ENABLED", "false")}
+    server_args = ["--port", str(server_port), "--upstream-url", upstream_url, "--tools", str(args.tools), "--sources", str(args.sources), "--exchange-latency-ms", str(args.exchange_latency_ms)]
+
+    with service_process("benchmarks.upstream", ["--port", str(upstream_port)], f"{upstream_url}/", env), service_process("benchmarks.server", server_args, f"{server_url}/bench/ready", env):
+        results = asyncio.run(run_benchmark(server_url, profile, scenarios, concurrency))
+
+    report = build_report(results, profile, settings)
+    print(format_results(results))
+    if args.output:
+        save_report(report, args.output)
+    if args.save:
+        print(f"\nSaved baseline {save_report(report, baseline_path(args.save))}")
+    if args.compare:
+        rows = compare(report, json.loads(baseline_path(args.compare).read_text()), args.threshold)
+        print(f"\nCompared to baseline '{args.compare}' (threshold {args.threshold:.0%}):\n{format_comparison(rows)}")
+        if any(row["regressed"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Synthetic read model seeded into the benchmark server.
+
+The catalog holds one real source, ``pizzeria``, whose tools proxy to
+upstream-sample. It also holds filler sources, so access resolution and the
+tool manifest run at a realistic size. Every group is reachable through a
+policy on the benchmark user's role. The same number of policies require a
+role the user lacks, so the resolver evaluates both outcomes.
+"""
+
+from dataclasses import dataclass, field
+
+from domain.enums import AuthMode, ExecutionMode, HealthStatus, SourceType
+from domain.models import ClaimMatcher, ExecutionProfile, ToolDefinition, ToolSelector
+from integration.models.access_policy_dto import AccessPolicyDto
+from integration.models.source_dto import SourceDto
+from integration.models.source_tool_dto import SourceToolDto
+from integration.models.tool_group_dto import ToolGroupDto
+
+UPSTREAM_SOURCE_ID = "pizzeria"
+UPSTREAM_AUDIENCE = "pizzeria-backend"
+BENCH_ROLE = "user"
+BENCH_SCOPES = ["openid", "menu:read"]
+
+
+@dataclass
+class Catalog:
+    """Read-model content for one benchmark run."""
+
+    sources: list[SourceDto] = field(default_factory=list)
+    tools: list[SourceToolDto] = field(default_factory=list)
+    groups: list[ToolGroupDto] = field(default_factory=list)
+    policies: list[AccessPolicyDto] = field(default_factory=list)
+
+
+def _source(source_id: str, name: str, url: str) -> SourceDto:
+    return SourceDto(
+        id=source_id,
+        name=name,
+        url=url,
+        source_type=SourceType.OPENAPI,
+        health_status=HealthStatus.HEALTHY,
+        is_enabled=True,
+        default_audience=UPSTREAM_AUDIENCE,
+        auth_mode=AuthMode.TOKEN_EXCHANGE,
+    )
+
+
+def _tool(source: SourceDto, operation_id: str, path: str, input_schema: dict, description: str) -> SourceToolDto:
+    profile = ExecutionProfile(mode=ExecutionMode.SYNC_HTTP, method="GET", url_template=f"{source.url}{path}", required_audience=UPSTREAM_AUDIENCE, required_scopes=["menu:read"])
+    definition = ToolDefinition(name=operation_id, description=description, input_schema=input_schema, execution_profile=profile, source_path=path, tags=["benchmark"])
+    return SourceToolDto(
+        id=f"{source.id}:{operation_id}",
+        source_id=source.id,
+        source_name=source.name,
+        tool_name=operation_id,
+        operation_id=operation_id,
+        description=description,
+        method="GET",
+        path=path,
+        execution_mode="sync_http",
+        input_schema=input_schema,
+        tags=["benchmark"],
+        required_audience=UPSTREAM_AUDIENCE,
+        required_scopes=["menu:read"],
+        definition=definition.to_dict(),
+    )
+
+
+def _group(group_id: str, source: SourceDto) -> ToolGroupDto:
+    selector = ToolSelector(id=f"{group_id}-selector", source_pattern=source.name)
+    return ToolGroupDto(id=group_id, name=source.name, description=f"All tools of {source.name}", selector_count=1, selectors=[selector.to_dict()])
+
+
+def _policy(policy_id: str, group_id: str, role: str, priority: int) -> AccessPolicyDto:
+    matcher = ClaimMatcher.role_equals(role, path="roles")
+    return AccessPolicyDto(id=policy_id, name=policy_id, claim_matchers=[matcher.to_dict()], allowed_group_ids=[group_id], priority=priority, matcher_count=1, group_count=1)
+
+
+def build_catalog(upstream_url: str, tool_count: int = 200, source_count: int = 10) -> Catalog:
+    """Build the benchmark catalog.
+
+    Args:
+        upstream_url: Base URL of the running upstream-sample
+        tool_count: Number of filler tools spread over the filler sources
+        source_count: Number of filler sources (one group and two policies each)
+
+    Returns:
+        Catalog with the pizzeria tools and the filler
+    """
+    catalog = Catalog()
+    upstream_url = upstream_url.rstrip("/")
+
+    pizzeria = _source(UPSTREAM_SOURCE_ID, "Pizzeria", upstream_url)
+    catalog.sources.append(pizzeria)
+    catalog.tools += [
+        _tool(pizzeria, "list_menu_items", "/api/menu", {"type": "object", "properties": {}}, "List all menu items"),
+        _tool(
+            pizzeria,
+            "get_menu_item",
+            "/api/menu/{{ item_id }}",
+            {"type": "object", "properties": {"item_id": {"type": "string"}}, "required": ["item_id"]},
+            "Get a menu item by ID",
+        ),
+    ]
+
+    fillers = [_source(f"catalog-{n}", f"Catalog {n}", upstream_url) for n in range(source_count)]
+    catalog.sources += fillers
+    for n in range(tool_count if fillers else 0):
+        source = fillers[n % len(fillers)]
+        catalog.tools.append(_tool(source, f"operation_{n}", f"/api/items/{n}", {"type": "object", "properties": {"page": {"type": "integer"}}}, f"Filler operation {n} of {source.name}"))
+
+    for n, source in enumerate([pizzeria, *fillers]):
+        group_id = f"group-{source.id}"
+        catalog.groups.append(_group(group_id, source))
+        catalog.policies.append(_policy(f"policy-{source.id}", group_id, BENCH_ROLE, priority=n))
+        catalog.policies.append(_policy(f"policy-{source.id}-restricted", group_id, "auditor", priority=n))
+    return catalog
@@ -0,0 +1,89 @@
+"""Micro-benchmark of the GET /agent/tools response encoding.
+
+Encodes a synthetic tool manifest three ways:
+
+- ``serializer``: JsonSerializer.serialize_to_text, as ControllerBase.process does
+- ``json``: encode_json(fast=False), the json module fallback
+- ``orjson``: encode_json(), the default
+
+and checks that ``json`` and ``orjson`` write the same bytes.
+
+Usage:
+    PYTHONPATH=. python -m benchmarks.json_encoding --tools 50,200,1000
+"""
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+
+from neuroglia.serialization.json import JsonSerializer
+
+from api.services.json_encoding import encode_json
+from application.queries import ToolManifestEntry
+
+
+def build_manifest(tool_count: int) -> list[ToolManifestEntry]:
+    """A manifest of ``tool_count`` tools with OpenAPI-sized input schemas."""
+    return [
+        ToolManifestEntry(
+            tool_id=f"source_{index % 10}:list_records_{index}",
+            name=f"list_records_{index}",
+            description=f"List the records of collection {index}, filtered and paginated. Returns the matching records and the total count (« {index} »).",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Full-text search terms"},
+                    "status": {"type": "string", "enum": ["draft", "active", "archived"], "default": "active"},
+                    "page": {"type": "integer", "minimum": 1, "default": 1},
+                    "page_size": {"type": "integer", "minimum": 1, "maximum": 100, "default": 20},
+                    "min_score": {"type": "number", "minimum": 0.0, "maximum": 1.0, "default": None},
+                    "filters": {
+                        "type": "object",
+                        "properties": {"owner": {"type": "string"}, "tags": {"type": "array", "items": {"type": "string"}}},
+                        "additionalProperties": False,
+                    },
+                },
+                "required": ["query"],
+            },
+            source_id=f"source_{index % 10}",
+            source_path=f"/api/v1/collections/{index}/records",
+            tags=["records", f"collection-{index % 5}"],
+            version="1.2.0" if index % 2 else None,
+        )
+        for index in range(tool_count)
+    ]
+
+
+def measure(encode: Callable[[], object]) -> float:
+    """Best time per call in milliseconds, over five repeats of about 0.2 s each."""
+    timer = timeit.Timer(encode)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1000
+
+
+def run(tool_counts: list[int]) -> bool:
+    """Print the encoding times per manifest size. Returns whether both encoders wrote the same bytes."""
+    serializer = JsonSerializer()
+    identical = True
+    print(f"{'tools':>6}  {'KB':>7}  {'serializer ms':>13}  {'json ms':>8}  {'orjson ms':>9}  {'speedup':>7}  identical")
+    for tool_count in tool_counts:
+        manifest = build_manifest(tool_count)
+        fast, slow = encode_json(manifest), encode_json(manifest, fast=False)
+        identical &= fast == slow
+        serializer_ms = measure(lambda: serializer.serialize_to_text(manifest))
+        json_ms = measure(lambda: encode_json(manifest, fast=False))
+        orjson_ms = measure(lambda: encode_json(manifest))
+        print(f"{tool_count:>6}  {len(fast) / 1024:>7.1f}  {serializer_ms:>13.3f}  {json_ms:>8.3f}  {orjson_ms:>9.3f}  {serializer_ms / orjson_ms:>6.1f}x  {'yes' if fast == slow else 'NO'}")
+    return identical
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.json_encoding", description="Benchmark the GET /agent/tools response encoding")
+    parser.add_argument("--tools", default="50,200,1000", help="Comma-separated manifest sizes (default: 50,200,1000)")
+    args = parser.parse_args()
+    sys.exit(0 if run([int(count) for count in args.tools.split(",")]) else 1)
+
+
+if __name__ == "__main__":
+    main()
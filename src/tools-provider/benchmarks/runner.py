@@ -0,0 +1,274 @@
+"""Load generation, statistics and baselines for the tool proxy benchmark.
+
+The runner starts upstream-sample and the benchmark server as subprocesses,
+so the load generator doesn't share an event loop or a GIL with the code it
+measures. For each scenario and concurrency level, it runs closed-loop
+workers: each worker sends its next request as soon as the previous one
+completes. Each step has a warmup, then a measured window. Results hold
+client-side latency percentiles, throughput, and the server-side stage
+breakdown of the measured window.
+"""
+
+import asyncio
+import json
+import math
+import os
+import socket
+import subprocess  # nosec B404 - starts the benchmark's own server processes
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.catalog import BENCH_ROLE, BENCH_SCOPES
+from benchmarks.stand_ins import mint_token
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASELINES_DIR = BENCHMARKS_DIR / "baselines"
+
+
+@dataclass(frozen=True)
+class Profile:
+    """A concurrency profile: the levels to step through and how long to hold each."""
+
+    name: str
+    concurrency: tuple[int, ...]
+    duration_seconds: float
+    warmup_seconds: float
+
+
+PROFILES: dict[str, Profile] = {
+    "smoke": Profile("smoke", concurrency=(1, 4), duration_seconds=3, warmup_seconds=1),
+    "baseline": Profile("baseline", concurrency=(1, 8, 32), duration_seconds=15, warmup_seconds=3),
+    "stress": Profile("stress", concurrency=(16, 64, 128, 256), duration_seconds=30, warmup_seconds=5),
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One request shape sent by every worker."""
+
+    name: str
+    method: str
+    path: str
+    body: dict[str, Any] | None = None
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "list_tools": Scenario("list_tools", "GET", "/api/agent/tools"),
+    "call_tool": Scenario("call_tool", "POST", "/api/agent/tools/call", {"tool_id": "pizzeria:get_menu_item", "arguments": {"item_id": "menu_0001"}}),
+    "call_tool_large": Scenario("call_tool_large", "POST", "/api/agent/tools/call", {"tool_id": "pizzeria:list_menu_items", "arguments": {}}),
+}
+
+
+@dataclass
+class StepResult:
+    """Measurements of one scenario at one concurrency level."""
+
+    scenario: str
+    concurrency: int
+    requests: int
+    errors: int
+    duration_seconds: float
+    rps: float
+    latency_ms: dict[str, float]
+    stages_ms: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.scenario}@{self.concurrency}"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (0 when empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Count, mean, p50/p95/p99 and max of a list of durations."""
+    return {
+        "count": len(samples),
+        "mean": round(sum(samples) / len(samples), 3) if samples else 0.0,
+        "p50": round(percentile(samples, 50), 3),
+        "p95": round(percentile(samples, 95), 3),
+        "p99": round(percentile(samples, 99), 3),
+        "max": round(max(samples), 3) if samples else 0.0,
+    }
+
+
+def bench_token() -> str:
+    """Agent token of the benchmark user (accepted by DualAuthService's HS256 path)."""
+    return mint_token({"sub": "bench-user", "preferred_username": "bench", "realm_access": {"roles": [BENCH_ROLE]}, "scope": " ".join(BENCH_SCOPES)})
+
+
+# =============================================================================
+# Load generation
+# =============================================================================
+
+
+async def _drive(client: httpx.AsyncClient, scenario: Scenario, concurrency: int, duration_seconds: float) -> tuple[list[float], int, float]:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration_seconds
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, scenario.path, json=scenario.body)
+                ok = response.status_code < 400 and not (scenario.body and response.json().get("status") == "failed")
+            except httpx.HTTPError:
+                ok = False
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += 0 if ok else 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+async def run_step(client: httpx.AsyncClient, scenario: Scenario, concurrency: int, profile: Profile) -> StepResult:
+    """Run one scenario at one concurrency level and collect its stage timings."""
+    await _drive(client, scenario, concurrency, profile.warmup_seconds)
+    await client.get("/bench/stages")  # Discard warmup samples
+
+    latencies, errors, elapsed = await _drive(client, scenario, concurrency, profile.duration_seconds)
+    stages = (await client.get("/bench/stages")).json()["stages"]
+    return StepResult(
+        scenario=scenario.name,
+        concurrency=concurrency,
+        requests=len(latencies),
+        errors=errors,
+        duration_seconds=round(elapsed, 3),
+        rps=round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        latency_ms=summarize(latencies),
+        stages_ms={stage: summarize(samples) for stage, samples in sorted(stages.items())},
+    )
+
+
+async def run_benchmark(base_url: str, profile: Profile, scenarios: list[Scenario], concurrency: tuple[int, ...] | None = None) -> list[StepResult]:
+    """Run every scenario at every concurrency level of the profile."""
+    levels = concurrency or profile.concurrency
+    results: list[StepResult] = []
+    headers = {"Authorization": f"Bearer {bench_token()}"}
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=60.0) as client:
+        for scenario in scenarios:
+            for level in levels:
+                results.append(await run_step(client, scenario, level, profile))
+    return results
+
+
+# =============================================================================
+# Processes
+# =============================================================================
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def service_process(module: str, args: list[str], ready_url: str, env: dict[str, str] | None = None, timeout_seconds: float = 60.0) -> Iterator[subprocess.Popen]:
+    """Run ``python -m module`` until the context exits, once ``ready_url`` answers 200."""
+    process = subprocess.Popen([sys.executable, "-m", module, *args], cwd=BENCHMARKS_DIR.parent, env={**os.environ, **(env or {})})  # nosec B603
+    try:
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"{module} exited with code {process.returncode} during startup")
+            try:
+                if httpx.get(ready_url, timeout=1.0).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{module} not ready after {timeout_seconds}s")
+            time.sleep(0.2)
+        yield process
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+# =============================================================================
+# Reports and baselines
+# =============================================================================
+
+
+def build_report(results: list[StepResult], profile: Profile, settings: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "profile": profile.name,
+        "settings": settings,
+        "python": sys.version.split()[0],
+        "steps": [asdict(result) for result in results],
+    }
+
+
+def save_report(report: dict[str, Any], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
+    return path
+
+
+def baseline_path(name: str) -> Path:
+    return BASELINES_DIR / f"{name}.json"
+
+
+def format_results(results: list[StepResult]) -> str:
+    """Render results as a table with one row per step and its stage p50/p95."""
+    lines = [f"{'step':<24}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'errors':>8}  stages p50/p95 (ms)"]
+    for result in results:
+        latency = result.latency_ms
+        stages = "  ".join(f"{stage}={s['p50']:.1f}/{s['p95']:.1f}" for stage, s in result.stages_ms.items())
+        lines.append(f"{result.key:<24}{result.rps:>9.1f}{latency['p50']:>9.2f}{latency['p95']:>9.2f}{latency['p99']:>9.2f}{result.errors:>8}  {stages}")
+    return "\n".join(lines)
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.10) -> list[dict[str, Any]]:
+    """Compare a report to a baseline, step by step.
+
+    A step regresses when its p95 latency grew, or its throughput dropped,
+    by more than ``threshold`` (a fraction). Steps missing from either side
+    are skipped.
+    """
+    previous = {f"{step['scenario']}@{step['concurrency']}": step for step in baseline["steps"]}
+    rows = []
+    for step in report["steps"]:
+        key = f"{step['scenario']}@{step['concurrency']}"
+        if key not in previous:
+            continue
+        before = previous[key]
+        p95_change = _relative_change(before["latency_ms"]["p95"], step["latency_ms"]["p95"])
+        rps_change = _relative_change(before["rps"], step["rps"])
+        rows.append({"step": key, "p95_change": p95_change, "rps_change": rps_change, "regressed": p95_change > threshold or rps_change < -threshold})
+    return rows
+
+
+def _relative_change(before: float, after: float) -> float:
+    return (after - before) / before if before else 0.0
+
+
+def format_comparison(rows: list[dict[str, Any]]) -> str:
+    lines = [f"{'step':<24}{'p95':>10}{'rps':>10}"]
+    for row in rows:
+        flag = "  REGRESSED" if row["regressed"] else ""
+        lines.append(f"{row['step']:<24}{row['p95_change']:>+10.1%}{row['rps_change']:>+10.1%}{flag}")
+    return "\n".join(lines)
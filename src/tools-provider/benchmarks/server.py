@@ -0,0 +1,144 @@
+"""Benchmark build of the tools-provider application.
+
+Composes the same services as ``main.create_app`` for the agent API. A few
+of them are swapped for the stand-ins in ``benchmarks.stand_ins``:
+
+- the read-model repositories are in memory and seeded from ``benchmarks.catalog``
+- RedisCacheService is backed by fakeredis
+- KeycloakTokenExchanger mints tokens locally (TokenBroker and circuit breaker unchanged)
+
+The agent API itself is the real one: DualAuthService, AgentController, the
+mediator and its handlers, AccessResolver and ToolExecutor. ``/bench/*``
+routes expose readiness and the stage timings recorded by
+``benchmarks.stages``.
+
+Usage:
+    PYTHONPATH=. python -m benchmarks.server --port 8020 --upstream-url http://127.0.0.1:8051
+"""
+
+import argparse
+import logging
+
+import uvicorn
+from fastapi import FastAPI
+from neuroglia.eventing.cloud_events.infrastructure.cloud_event_publisher import CloudEventPublisher
+from neuroglia.hosting.abstractions import HostedService
+from neuroglia.hosting.web import SubAppConfig, WebApplicationBuilder
+from neuroglia.mapping import Mapper
+from neuroglia.mediation import Mediator, PipelineBehavior
+from neuroglia.serialization.json import JsonSerializer
+
+from api.services import DualAuthService
+from application.services import McpToolExecutor, ToolExecutor, ToolJobRunner, ToolResponseCache, configure_logging
+from application.settings import app_settings
+from benchmarks.catalog import build_catalog
+from benchmarks.stages import StageRecorder, StageTimingBehavior
+from benchmarks.stand_ins import (
+    FAKEREDIS_AVAILABLE,
+    FakeTokenExchanger,
+    InMemoryAccessPolicyDtoRepository,
+    InMemoryRedisCacheService,
+    InMemorySourceDtoRepository,
+    InMemorySourceToolDtoRepository,
+    InMemoryToolGroupDtoRepository,
+)
+from domain.repositories import AccessPolicyDtoRepository, SourceDtoRepository, SourceToolDtoRepository, ToolGroupDtoRepository
+from infrastructure import InMemorySessionStore, KeycloakTokenExchanger, RedisCacheService, SessionStore, SourceSecretsStore, TokenBroker
+
+log = logging.getLogger(__name__)
+
+
+def create_bench_app(upstream_url: str, tool_count: int = 200, source_count: int = 10, exchange_latency_ms: float = 0.0) -> FastAPI:
+    """Create the tools-provider app wired to the benchmark stand-ins.
+
+    Args:
+        upstream_url: Base URL of the running upstream-sample
+        tool_count: Number of filler tools in the catalog
+        source_count: Number of filler sources (groups) in the catalog
+        exchange_latency_ms: Simulated Keycloak latency of a token exchange cache miss
+
+    Returns:
+        The FastAPI application
+    """
+    recorder = StageRecorder()
+    builder = WebApplicationBuilder(app_settings=app_settings)
+
+    # Tool execution services, in main.create_app order, with the stand-ins
+    if FAKEREDIS_AVAILABLE:
+        redis_cache = InMemoryRedisCacheService()
+        builder.services.add_singleton(RedisCacheService, singleton=redis_cache)
+        builder.services.add_singleton(HostedService, singleton=redis_cache)
+    else:
+        log.warning("⚠️ fakeredis is not installed, benchmarking without the Redis cache tier")
+        builder.services.add_singleton(RedisCacheService, singleton=None)  # type: ignore[arg-type]
+    TokenBroker.configure(builder)
+    token_broker = next(desc.singleton for desc in builder.services if desc.service_type == TokenBroker)
+    token_exchanger = FakeTokenExchanger(latency_ms=exchange_latency_ms, token_broker=token_broker)
+    recorder.instrument(token_exchanger, "exchange_token", "token_exchange")
+    builder.services.add_singleton(KeycloakTokenExchanger, singleton=token_exchanger)
+    ToolResponseCache.configure(builder)
+    ToolExecutor.configure(builder)
+    tool_executor = next(desc.singleton for desc in builder.services if desc.service_type == ToolExecutor)
+    recorder.instrument(tool_executor, "_do_http_request", "upstream")
+    McpToolExecutor.configure(builder)
+    app_settings.tool_jobs_enabled = False  # Benchmark tools are SYNC_HTTP, and there is no job store
+    ToolJobRunner.configure(builder)
+
+    # Core services
+    Mediator.configure(builder, ["application.commands", "application.queries"])
+    Mapper.configure(builder, ["application.commands", "application.queries", "application.mapping", "integration.models"])
+    JsonSerializer.configure(builder, ["domain.entities", "domain.models", "integration.models"])
+    CloudEventPublisher.configure(builder)
+    builder.services.add_singleton(PipelineBehavior, singleton=StageTimingBehavior(recorder))
+
+    # Read model
+    catalog = build_catalog(upstream_url, tool_count=tool_count, source_count=source_count)
+    repositories = (
+        (SourceDtoRepository, InMemorySourceDtoRepository(), catalog.sources),
+        (SourceToolDtoRepository, InMemorySourceToolDtoRepository(), catalog.tools),
+        (ToolGroupDtoRepository, InMemoryToolGroupDtoRepository(), catalog.groups),
+        (AccessPolicyDtoRepository, InMemoryAccessPolicyDtoRepository(), catalog.policies),
+    )
+    for service_type, repository, items in repositories:
+        repository.seed(items)
+        builder.services.add_singleton(service_type, singleton=repository)
+
+    # Authentication (no JWKS pre-warm: benchmark tokens use the HS256 path) and source secrets
+    session_store = InMemorySessionStore(session_timeout_minutes=app_settings.session_timeout_hours * 60)
+    builder.services.add_singleton(SessionStore, singleton=session_store)
+    builder.services.add_singleton(DualAuthService, singleton=DualAuthService(session_store))
+    SourceSecretsStore.configure(builder)
+
+    builder.add_sub_app(SubAppConfig(path="/api", name="api", title="tools-provider benchmark API", controllers=["api.controllers"], docs_url=None))
+    app = builder.build_app_with_lifespan(title="tools-provider benchmark", version=app_settings.app_version)
+    DualAuthService.configure_middleware(app)
+
+    @app.get("/bench/ready")
+    async def ready() -> dict:
+        return {"tools": len(catalog.tools), "groups": len(catalog.groups), "policies": len(catalog.policies), "redis": FAKEREDIS_AVAILABLE}
+
+    @app.get("/bench/stages")
+    async def stages() -> dict:
+        """Stage samples (ms) recorded since the previous call."""
+        return {"stages": recorder.drain(), "token_exchanges": token_exchanger.exchange_count}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve tools-provider against the benchmark stand-ins")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8020)
+    parser.add_argument("--upstream-url", required=True)
+    parser.add_argument("--tools", type=int, default=200)
+    parser.add_argument("--sources", type=int, default=10)
+    parser.add_argument("--exchange-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    configure_logging(log_level=app_settings.log_level)
+    app = create_bench_app(args.upstream_url, tool_count=args.tools, source_count=args.sources, exchange_latency_ms=args.exchange_latency_ms)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
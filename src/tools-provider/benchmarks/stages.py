@@ -0,0 +1,70 @@
+"""Server-side stage timings for the benchmark server.
+
+Stages are recorded inside the tools-provider process, and the runner
+collects them over ``GET /bench/stages``:
+
+- ``resolve_tools``: GetAgentToolsQuery, i.e. access resolution plus manifest build
+- ``execute_tool``: ExecuteToolCommand, i.e. read-model lookups plus ToolExecutor
+- ``token_exchange``: KeycloakTokenExchanger.exchange_token, including the TokenBroker cache
+- ``upstream``: the HTTP request to upstream-sample
+"""
+
+import functools
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from neuroglia.core import OperationResult
+from neuroglia.mediation import PipelineBehavior
+
+from application.commands import ExecuteToolCommand
+from application.queries import GetAgentToolsQuery
+
+
+class StageRecorder:
+    """Collects per-stage durations in milliseconds."""
+
+    def __init__(self) -> None:
+        self._samples: dict[str, list[float]] = defaultdict(list)
+
+    def record(self, stage: str, duration_ms: float) -> None:
+        self._samples[stage].append(duration_ms)
+
+    def drain(self) -> dict[str, list[float]]:
+        """Return the samples recorded since the last drain and start over."""
+        samples, self._samples = dict(self._samples), defaultdict(list)
+        return samples
+
+    def instrument(self, target: Any, method_name: str, stage: str) -> None:
+        """Time every call of an async method of ``target`` as ``stage``."""
+        method: Callable[..., Awaitable[Any]] = getattr(target, method_name)
+
+        @functools.wraps(method)
+        async def timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self.record(stage, (time.perf_counter() - started) * 1000)
+
+        setattr(target, method_name, timed)
+
+
+class StageTimingBehavior(PipelineBehavior[Any, OperationResult]):
+    """Mediator pipeline behavior timing the requests on the tool proxy path."""
+
+    STAGES: dict[type, str] = {GetAgentToolsQuery: "resolve_tools", ExecuteToolCommand: "execute_tool"}
+
+    def __init__(self, recorder: StageRecorder):
+        self._recorder = recorder
+
+    async def handle_async(self, request: Any, next_handler: Callable[[], Awaitable[OperationResult]]) -> OperationResult:
+        stage = self.STAGES.get(type(request))
+        if stage is None:
+            return await next_handler()
+        started = time.perf_counter()
+        try:
+            return await next_handler()
+        finally:
+            self._recorder.record(stage, (time.perf_counter() - started) * 1000)
@@ -0,0 +1,311 @@
+"""In-process stand-ins for the infrastructure the tool proxy path depends on.
+
+The benchmark server swaps these in for MongoDB, Redis and Keycloak so the
+proxy path can be measured on a laptop or CI runner:
+
+- In-memory read-model repositories implementing the domain repository interfaces
+- A Redis cache backed by fakeredis (when installed)
+- A token exchanger that mints tokens locally instead of calling Keycloak
+- A minimal Motor-like database for running upstream-sample without MongoDB
+"""
+
+import asyncio
+import copy
+import logging
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, Generic, TypeVar
+
+import jwt
+from neuroglia.data.infrastructure.memory import MemoryRepository
+
+from application.settings import app_settings
+from domain.enums import HealthStatus
+from domain.repositories import AccessPolicyDtoRepository, SourceDtoRepository, SourceToolDtoRepository, ToolGroupDtoRepository
+from infrastructure.adapters.keycloak_token_exchanger import KeycloakTokenExchanger, TokenExchangeResult
+from infrastructure.cache import RedisCacheService
+from integration.models.access_policy_dto import AccessPolicyDto
+from integration.models.source_dto import SourceDto
+from integration.models.source_tool_dto import SourceToolDto, SourceToolSummaryDto
+from integration.models.tool_group_dto import ToolGroupDto
+
+try:
+    from fakeredis import FakeAsyncRedis
+
+    FAKEREDIS_AVAILABLE = True
+except ImportError:
+    FakeAsyncRedis = None  # type: ignore[assignment,misc]
+    FAKEREDIS_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+TDto = TypeVar("TDto")
+
+
+# =============================================================================
+# Read model
+# =============================================================================
+
+
+class InMemoryDtoRepository(MemoryRepository[TDto, str], Generic[TDto]):
+    """Base for in-memory read-model repositories."""
+
+    def seed(self, items: Iterable[TDto]) -> None:
+        """Replace the repository content."""
+        self.entities = {item.id: item for item in items}  # type: ignore[attr-defined]
+
+    def _where(self, predicate: Callable[[TDto], bool], sort_key: Callable[[TDto], Any] | None = None, reverse: bool = False) -> list[TDto]:
+        items = list(self.find(predicate))
+        if sort_key is not None:
+            items.sort(key=sort_key, reverse=reverse)
+        return items
+
+    async def get_by_ids_async(self, ids: list[str]) -> list[TDto]:
+        return [self.entities[item_id] for item_id in ids if item_id in self.entities]
+
+
+class InMemorySourceToolDtoRepository(InMemoryDtoRepository[SourceToolDto], SourceToolDtoRepository):
+    """In-memory SourceToolDto read model."""
+
+    @staticmethod
+    def _visible(tool: SourceToolDto, include_disabled: bool, include_deprecated: bool = False) -> bool:
+        return (include_disabled or tool.is_enabled) and (include_deprecated or tool.status == "active")
+
+    async def get_by_source_id_async(self, source_id: str, include_disabled: bool = False, include_deprecated: bool = False) -> list[SourceToolDto]:
+        return self._where(lambda t: t.source_id == source_id and self._visible(t, include_disabled, include_deprecated), lambda t: t.tool_name)
+
+    async def get_enabled_async(self) -> list[SourceToolDto]:
+        return self._where(lambda t: self._visible(t, False), lambda t: t.tool_name)
+
+    async def search_async(self, query: str, source_id: str | None = None, tags: list[str] | None = None, include_disabled: bool = False) -> list[SourceToolDto]:
+        needle = query.lower()
+        return self._where(
+            lambda t: (
+                self._visible(t, include_disabled)
+                and (source_id is None or t.source_id == source_id)
+                and all(tag in t.tags for tag in tags or [])
+                and (needle in t.tool_name.lower() or needle in t.description.lower())
+            ),
+            lambda t: t.tool_name,
+        )
+
+    async def get_summaries_async(self, source_id: str | None = None, include_disabled: bool = False) -> list[SourceToolSummaryDto]:
+        tools = self._where(lambda t: self._visible(t, include_disabled) and (source_id is None or t.source_id == source_id), lambda t: t.tool_name)
+        return [
+            SourceToolSummaryDto(
+                id=t.id,
+                source_id=t.source_id,
+                source_name=t.source_name,
+                tool_name=t.tool_name,
+                description=t.description,
+                method=t.method,
+                path=t.path,
+                tags=t.tags,
+                label_ids=t.label_ids,
+                params_count=len(t.input_schema.get("properties", {})),
+                required_scopes=t.required_scopes,
+                is_enabled=t.is_enabled,
+                status=t.status,
+            )
+            for t in tools
+        ]
+
+    async def count_by_source_async(self, source_id: str, include_disabled: bool = False) -> int:
+        return len(await self.get_by_source_id_async(source_id, include_disabled))
+
+    async def bulk_update_source_name_async(self, source_id: str, source_name: str) -> int:
+        tools = self._where(lambda t: t.source_id == source_id)
+        for tool in tools:
+            tool.source_name = source_name
+        return len(tools)
+
+    async def get_orphaned_tools_async(self, valid_source_ids: list[str]) -> list[SourceToolDto]:
+        return self._where(lambda t: t.source_id not in valid_source_ids)
+
+
+class InMemorySourceDtoRepository(InMemoryDtoRepository[SourceDto], SourceDtoRepository):
+    """In-memory SourceDto read model."""
+
+    async def get_all_async(self) -> list[SourceDto]:
+        return self._where(lambda s: True, lambda s: s.name)
+
+    async def get_enabled_async(self) -> list[SourceDto]:
+        return self._where(lambda s: s.is_enabled, lambda s: s.name)
+
+    async def get_by_health_status_async(self, status: HealthStatus) -> list[SourceDto]:
+        return self._where(lambda s: s.health_status == status, lambda s: s.name)
+
+    async def get_by_source_type_async(self, source_type: str) -> list[SourceDto]:
+        return self._where(lambda s: s.source_type == source_type, lambda s: s.name)
+
+
+class InMemoryToolGroupDtoRepository(InMemoryDtoRepository[ToolGroupDto], ToolGroupDtoRepository):
+    """In-memory ToolGroupDto read model."""
+
+    async def get_all_async(self) -> list[ToolGroupDto]:
+        return self._where(lambda g: True, lambda g: g.name)
+
+    async def get_active_async(self) -> list[ToolGroupDto]:
+        return self._where(lambda g: g.is_active, lambda g: g.name)
+
+    async def search_by_name_async(self, name_pattern: str) -> list[ToolGroupDto]:
+        return self._where(lambda g: name_pattern.lower() in g.name.lower(), lambda g: g.name)
+
+
+class InMemoryAccessPolicyDtoRepository(InMemoryDtoRepository[AccessPolicyDto], AccessPolicyDtoRepository):
+    """In-memory AccessPolicyDto read model."""
+
+    async def get_all_async(self) -> list[AccessPolicyDto]:
+        return self._where(lambda p: True, lambda p: p.priority, reverse=True)
+
+    async def get_active_async(self) -> list[AccessPolicyDto]:
+        return self._where(lambda p: p.is_active, lambda p: p.priority, reverse=True)
+
+    async def get_by_priority_async(self, min_priority: int = 0) -> list[AccessPolicyDto]:
+        return self._where(lambda p: p.is_active and p.priority >= min_priority, lambda p: p.priority, reverse=True)
+
+    async def get_by_group_id_async(self, group_id: str) -> list[AccessPolicyDto]:
+        return self._where(lambda p: group_id in p.allowed_group_ids, lambda p: p.priority, reverse=True)
+
+    async def search_by_name_async(self, name_pattern: str) -> list[AccessPolicyDto]:
+        return self._where(lambda p: name_pattern.lower() in p.name.lower(), lambda p: p.priority, reverse=True)
+
+
+# =============================================================================
+# Redis
+# =============================================================================
+
+
+class InMemoryRedisCacheService(RedisCacheService):
+    """RedisCacheService whose client is an in-process fakeredis server."""
+
+    def __init__(self, key_prefix: str = "mcp"):
+        super().__init__(redis_url="redis://in-memory", key_prefix=key_prefix)
+
+    async def connect(self) -> None:
+        if self._redis is None:
+            self._redis = FakeAsyncRedis(decode_responses=True)
+
+
+# =============================================================================
+# Token exchange
+# =============================================================================
+
+
+def mint_token(claims: dict[str, Any], ttl_seconds: int = 3600) -> str:
+    """Sign a JWT accepted by DualAuthService's HS256 path (no Keycloak JWKS needed)."""
+    now = int(time.time())
+    return jwt.encode({"iat": now, "exp": now + ttl_seconds, **claims}, app_settings.jwt_secret_key, algorithm=app_settings.jwt_algorithm)
+
+
+class FakeTokenExchanger(KeycloakTokenExchanger):
+    """Token exchanger that mints exchanged tokens locally.
+
+    Only the Keycloak round trip is replaced: caching through the TokenBroker
+    and the circuit breaker run unchanged. ``latency_ms`` simulates the
+    Keycloak response time of an exchange that misses the cache.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, **kwargs: Any):
+        super().__init__(keycloak_url="http://keycloak.invalid", realm="benchmark", client_id="benchmark", client_secret="benchmark", **kwargs)  # nosec B106
+        self._latency_seconds = latency_ms / 1000
+        self.exchange_count = 0
+
+    async def _do_exchange(self, subject_token: str, audience: str, requested_scopes: list[str] | None = None) -> TokenExchangeResult:
+        self.exchange_count += 1
+        if self._latency_seconds:
+            await asyncio.sleep(self._latency_seconds)
+        claims = jwt.decode(subject_token, options={"verify_signature": False})
+        claims.pop("exp", None)
+        claims.pop("iat", None)
+        claims["aud"] = audience
+        if requested_scopes:
+            claims["scope"] = " ".join(requested_scopes)
+        return TokenExchangeResult(access_token=mint_token(claims, ttl_seconds=300), expires_in=300)
+
+
+# =============================================================================
+# MongoDB (upstream-sample)
+# =============================================================================
+
+
+def _matches(document: dict[str, Any], filter_query: dict[str, Any]) -> bool:
+    return all(document.get(key) == value for key, value in filter_query.items())
+
+
+class InMemoryCursor:
+    """Async iterable cursor supporting ``sort``."""
+
+    def __init__(self, documents: list[dict[str, Any]]):
+        self._documents = documents
+
+    def sort(self, key: str, direction: int = 1) -> "InMemoryCursor":
+        self._documents.sort(key=lambda d: (d.get(key) is None, d.get(key)), reverse=direction < 0)
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self._documents:
+            yield document
+
+
+class InMemoryCollection:
+    """The subset of AsyncIOMotorCollection used by upstream-sample (equality filters only)."""
+
+    def __init__(self) -> None:
+        self._documents: list[dict[str, Any]] = []
+
+    def find(self, filter_query: dict[str, Any] | None = None) -> InMemoryCursor:
+        return InMemoryCursor([copy.deepcopy(d) for d in self._documents if _matches(d, filter_query or {})])
+
+    async def find_one(self, filter_query: dict[str, Any]) -> dict[str, Any] | None:
+        document = next((d for d in self._documents if _matches(d, filter_query)), None)
+        return copy.deepcopy(document) if document is not None else None
+
+    async def count_documents(self, filter_query: dict[str, Any]) -> int:
+        return sum(1 for d in self._documents if _matches(d, filter_query))
+
+    async def insert_one(self, document: dict[str, Any]) -> None:
+        self._documents.append(copy.deepcopy(document))
+
+    async def update_one(self, filter_query: dict[str, Any], update: dict[str, Any]) -> None:
+        document = next((d for d in self._documents if _matches(d, filter_query)), None)
+        if document is not None:
+            document.update(copy.deepcopy(update.get("$set", {})))
+
+    async def replace_one(self, filter_query: dict[str, Any], replacement: dict[str, Any]) -> None:
+        for index, document in enumerate(self._documents):
+            if _matches(document, filter_query):
+                self._documents[index] = copy.deepcopy(replacement)
+                return
+
+    async def delete_one(self, filter_query: dict[str, Any]) -> Any:
+        for index, document in enumerate(self._documents):
+            if _matches(document, filter_query):
+                del self._documents[index]
+                return type("DeleteResult", (), {"deleted_count": 1})()
+        return type("DeleteResult", (), {"deleted_count": 0})()
+
+    async def find_one_and_update(self, filter_query: dict[str, Any], update: dict[str, Any], upsert: bool = False, return_document: bool = False) -> dict[str, Any] | None:
+        document = next((d for d in self._documents if _matches(d, filter_query)), None)
+        if document is None:
+            if not upsert:
+                return None
+            document = dict(filter_query)
+            self._documents.append(document)
+        for key, amount in update.get("$inc", {}).items():
+            document[key] = document.get(key, 0) + amount
+        return copy.deepcopy(document)
+
+    async def create_index(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+class InMemoryDatabase(dict):
+    """Motor-like database creating collections on first access."""
+
+    def __missing__(self, name: str) -> InMemoryCollection:
+        collection = self[name] = InMemoryCollection()
+        return collection
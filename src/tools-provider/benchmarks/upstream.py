@@ -0,0 +1,75 @@
+"""Run upstream-sample as the benchmark upstream, without MongoDB or Keycloak.
+
+The pizzeria app is served unchanged, except for two things:
+
+- Its database is an in-memory Motor substitute, seeded with the sample menu.
+- ``get_current_user`` reads the claims of the token minted by the
+  benchmark's FakeTokenExchanger, without JWKS signature verification.
+
+Usage:
+    PYTHONPATH=. python -m benchmarks.upstream --port 8051
+"""
+
+import argparse
+import os
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import jwt
+import uvicorn
+from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from benchmarks.stand_ins import InMemoryDatabase
+
+DEFAULT_UPSTREAM_DIR = Path(__file__).resolve().parents[2] / "upstream-sample"
+
+
+def create_upstream_app(upstream_dir: Path = DEFAULT_UPSTREAM_DIR) -> FastAPI:
+    """Create the upstream-sample app wired to in-memory stand-ins."""
+    sys.path.insert(0, str(upstream_dir))
+    from app import database
+    from app.auth.dependencies import UserInfo, get_current_user
+    from app.main import create_app
+    from app.routers.menu import init_sample_menu
+
+    app = create_app()
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI):
+        database._db = InMemoryDatabase()
+        await init_sample_menu()
+        yield
+
+    async def benchmark_user(credentials: HTTPAuthorizationCredentials | None = Depends(HTTPBearer(auto_error=False))) -> UserInfo:
+        if credentials is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+        claims = jwt.decode(credentials.credentials, options={"verify_signature": False})
+        return UserInfo(
+            sub=claims.get("sub", ""),
+            username=claims.get("preferred_username", claims.get("sub", "")),
+            email=claims.get("email"),
+            name=claims.get("name"),
+            roles=[*claims.get("realm_access", {}).get("roles", []), *claims.get("roles", [])],
+            scopes=claims.get("scope", "").split(),
+            raw_token=credentials.credentials,
+        )
+
+    app.router.lifespan_context = lifespan
+    app.dependency_overrides[get_current_user] = benchmark_user
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve upstream-sample for the tool proxy benchmark")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8051)
+    parser.add_argument("--upstream-dir", type=Path, default=Path(os.getenv("UPSTREAM_SAMPLE_DIR", DEFAULT_UPSTREAM_DIR)))
+    args = parser.parse_args()
+
+    uvicorn.run(create_upstream_app(args.upstream_dir), host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
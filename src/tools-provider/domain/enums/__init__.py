@@ -15,11 +15,14 @@ from .source import (
     ToolStatus,
 )
 from .task import TaskPriority, TaskStatus
+from .tool_job import ToolJobStatus
 
 __all__ = [
     # Task enums
     "TaskStatus",
     "TaskPriority",
+    # Tool job enums
+    "ToolJobStatus",
     # Source/Tool enums
     "SourceType",
     "HealthStatus",
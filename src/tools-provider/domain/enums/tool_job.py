@@ -0,0 +1,14 @@
+"""Tool job enumerations.
+
+These enums are used by background jobs of ASYNC_POLL tools.
+"""
+
+from enum import Enum
+
+
+class ToolJobStatus(str, Enum):
+    """Status values for a background tool job."""
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
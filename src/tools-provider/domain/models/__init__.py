@@ -7,6 +7,7 @@ All value objects use @dataclass(frozen=True) for immutability.
 """
 
 from .auth_config import AuthConfig
+from .cache_policy import CachePolicy
 from .claim_matcher import ClaimMatcher
 from .execution_profile import ExecutionProfile
 from .mcp_config import McpEnvironmentVariable, McpSourceConfig
@@ -18,6 +19,7 @@ from .tool_selector import ToolSelector
 
 __all__ = [
     "AuthConfig",
+    "CachePolicy",
     "ClaimMatcher",
     "ExecutionProfile",
     "McpEnvironmentVariable",
@@ -0,0 +1,72 @@
+"""CachePolicy value object.
+
+Opt-in response caching for idempotent (GET) tools.
+"""
+
+from dataclasses import dataclass, field
+
+CACHE_SCOPES = ("user", "tenant", "shared")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Response cache policy for an idempotent tool.
+
+    Responses are cached for ``ttl_seconds`` and may then be served stale for
+    up to ``stale_while_revalidate_seconds`` while a fresh copy is fetched in
+    the background.
+
+    The cache key is built from the tool, its definition, the selected
+    arguments and the scope:
+    - ``user``: one entry per end user (``sub`` claim)
+    - ``tenant``: one entry per value of ``tenant_claim``
+    - ``shared``: one entry for everybody
+
+    With ``vary_by_auth`` (the default), tools whose upstream sees the end
+    user's identity (token exchange) are never cached wider than per user,
+    whatever the scope says.
+
+    This is an immutable value object used within ExecutionProfile.
+    """
+
+    ttl_seconds: int
+    stale_while_revalidate_seconds: int = 0
+    key_arguments: list[str] | None = None  # Arguments included in the key (None = all)
+    scope: str = "user"  # user, tenant or shared
+    tenant_claim: str = "tenant_id"  # JWT claim identifying the tenant for tenant scope
+    vary_by_auth: bool = True
+    exclude_arguments: list[str] = field(default_factory=list)  # Arguments never included in the key
+
+    def __post_init__(self) -> None:
+        """Validate the cache policy configuration."""
+        if self.ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if self.stale_while_revalidate_seconds < 0:
+            raise ValueError("stale_while_revalidate_seconds must not be negative")
+        if self.scope not in CACHE_SCOPES:
+            raise ValueError(f"scope must be one of {', '.join(CACHE_SCOPES)}")
+
+    def to_dict(self) -> dict:
+        """Serialize to dictionary for storage."""
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "stale_while_revalidate_seconds": self.stale_while_revalidate_seconds,
+            "key_arguments": list(self.key_arguments) if self.key_arguments is not None else None,
+            "scope": self.scope,
+            "tenant_claim": self.tenant_claim,
+            "vary_by_auth": self.vary_by_auth,
+            "exclude_arguments": list(self.exclude_arguments),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CachePolicy":
+        """Deserialize from dictionary."""
+        return cls(
+            ttl_seconds=int(data["ttl_seconds"]),
+            stale_while_revalidate_seconds=int(data.get("stale_while_revalidate_seconds", 0)),
+            key_arguments=data.get("key_arguments"),
+            scope=data.get("scope", "user"),
+            tenant_claim=data.get("tenant_claim", "tenant_id"),
+            vary_by_auth=data.get("vary_by_auth", True),
+            exclude_arguments=data.get("exclude_arguments", []),
+        )
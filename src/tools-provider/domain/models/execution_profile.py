@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 
 from domain.enums import ExecutionMode
 
+from .cache_policy import CachePolicy
 from .poll_config import PollConfig
 
 
@@ -42,6 +43,9 @@ class ExecutionProfile:
     # Async polling configuration (only if mode == ASYNC_POLL)
     poll_config: PollConfig | None = None
 
+    # Response caching (only honoured for SYNC_HTTP GET requests)
+    cache_policy: CachePolicy | None = None
+
     def __post_init__(self) -> None:
         """Validate the execution profile configuration."""
         if self.mode == ExecutionMode.ASYNC_POLL and self.poll_config is None:
@@ -49,7 +53,7 @@ class ExecutionProfile:
 
     def to_dict(self) -> dict:
         """Serialize to dictionary for storage."""
-        return {
+        data: dict = {
             "mode": self.mode.value,
             "method": self.method,
             "url_template": self.url_template,
@@ -62,6 +66,10 @@ class ExecutionProfile:
             "timeout_seconds": self.timeout_seconds,
             "poll_config": self.poll_config.to_dict() if self.poll_config else None,
         }
+        # Only present when set, so definition hashes of uncached tools are unchanged
+        if self.cache_policy:
+            data["cache_policy"] = self.cache_policy.to_dict()
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "ExecutionProfile":
@@ -69,6 +77,9 @@ class ExecutionProfile:
         poll_config = None
         if data.get("poll_config"):
             poll_config = PollConfig.from_dict(data["poll_config"])
+        cache_policy = None
+        if data.get("cache_policy"):
+            cache_policy = CachePolicy.from_dict(data["cache_policy"])
 
         return cls(
             mode=ExecutionMode(data["mode"]),
@@ -82,6 +93,7 @@ class ExecutionProfile:
             required_scopes=data.get("required_scopes", []),
             timeout_seconds=data.get("timeout_seconds", 30),
             poll_config=poll_config,
+            cache_policy=cache_policy,
         )
 
     @classmethod
@@ -14,6 +14,7 @@ from .source_dto_repository import SourceDtoRepository
 from .source_tool_dto_repository import SourceToolDtoRepository
 from .task_dto_repository import TaskDtoRepository
 from .tool_group_dto_repository import ToolGroupDtoRepository
+from .tool_job_dto_repository import ToolJobDtoRepository
 
 __all__: list[str] = [
     "TaskDtoRepository",
@@ -22,4 +23,5 @@ __all__: list[str] = [
     "ToolGroupDtoRepository",
     "AccessPolicyDtoRepository",
     "LabelDtoRepository",
+    "ToolJobDtoRepository",
 ]
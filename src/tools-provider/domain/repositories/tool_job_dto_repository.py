@@ -0,0 +1,55 @@
+"""Abstract repository for background tool jobs."""
+
+from abc import ABC, abstractmethod
+
+from neuroglia.data.infrastructure.abstractions import Repository
+
+from integration.models.tool_job_dto import ToolJobDto
+
+
+class ToolJobDtoRepository(Repository[ToolJobDto, str], ABC):
+    """Abstract repository for background ASYNC_POLL tool jobs.
+
+    Jobs are plain state documents (no event sourcing): every replica's
+    ToolJobRunner claims due jobs through ``claim_due_async`` so that each
+    poll is made by exactly one replica.
+    """
+
+    @abstractmethod
+    async def claim_due_async(
+        self,
+        instance_id: str,
+        now: float,
+        lease_seconds: float,
+        limit: int,
+        orphan_after_seconds: float,
+    ) -> list[ToolJobDto]:
+        """Atomically lease running jobs whose next poll is due.
+
+        A job is claimable when its lease is free or expired, and it is
+        either not pinned, pinned to ``instance_id``, or overdue by more than
+        ``orphan_after_seconds`` (its pinned replica is presumed gone).
+
+        Args:
+            instance_id: Identifier of the claiming replica
+            now: Current time (epoch seconds)
+            lease_seconds: How long the claim is held
+            limit: Maximum number of jobs to claim
+            orphan_after_seconds: Grace period before another replica takes over a pinned job
+
+        Returns:
+            The claimed jobs, with their lease set
+        """
+        pass
+
+    @abstractmethod
+    async def get_running_ids_async(self, job_ids: list[str]) -> list[str]:
+        """Get which of the given jobs are still running.
+
+        Args:
+            job_ids: IDs of the jobs to check
+
+        Returns:
+            The IDs of the jobs that exist and are still running
+        """
+        pass
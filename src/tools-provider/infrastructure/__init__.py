@@ -1,6 +1,6 @@
 """Infrastructure layer for cross-cutting concerns."""
 
-from .adapters import KeycloakTokenExchanger, TokenExchangeError, TokenExchangeResult
+from .adapters import CircuitBreakerStateStore, KeycloakTokenExchanger, RedisCircuitBreakerStore, TokenBroker, TokenExchangeError, TokenExchangeResult
 from .cache import RedisCacheService
 from .mcp import (
     IMcpTransport,
@@ -16,6 +16,7 @@ from .mcp import (
     StdioTransport,
     TransportFactory,
 )
+from .mongo_index_bootstrapper import MongoIndexBootstrapper
 from .secrets import SourceSecretsStore
 from .services import CircuitBreakerEventPublisher
 from .session_store import InMemorySessionStore, RedisSessionStore, SessionStore
@@ -27,10 +28,16 @@ __all__ = [
     "RedisSessionStore",
     # Caching
     "RedisCacheService",
+    # Persistence
+    "MongoIndexBootstrapper",
     # Authentication
     "KeycloakTokenExchanger",
     "TokenExchangeResult",
     "TokenExchangeError",
+    "TokenBroker",
+    # Circuit breaker state
+    "CircuitBreakerStateStore",
+    "RedisCircuitBreakerStore",
     # Event publishing
     "CircuitBreakerEventPublisher",
     # Secrets
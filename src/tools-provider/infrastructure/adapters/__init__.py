@@ -5,12 +5,16 @@ Contains adapters for external service integrations:
 - OAuth2ClientCredentialsService: Client credentials grant for service-to-service auth
 - OIDCDiscoveryService: OIDC Discovery for external identity providers
 - ExternalIdpTokenProvider: Token acquisition from external IDPs
+- TokenBroker: Shared single-flight token cache used by the adapters above
+- RedisCircuitBreakerStore: Cluster-shared circuit breaker state
 """
 
+from .circuit_breaker_store import CircuitBreakerStateStore, InMemoryCircuitBreakerStore, RedisCircuitBreakerStore, SharedCircuitState
 from .external_idp_token_provider import ExternalIdpError, ExternalIdpToken, ExternalIdpTokenProvider
 from .keycloak_token_exchanger import KeycloakTokenExchanger, TokenExchangeError, TokenExchangeResult
 from .oauth2_client import ClientCredentialsError, ClientCredentialsToken, OAuth2ClientCredentialsService
 from .oidc_discovery import OIDCDiscoveryDocument, OIDCDiscoveryError, OIDCDiscoveryService
+from .token_broker import TokenBroker
 
 __all__ = [
     "KeycloakTokenExchanger",
@@ -25,4 +29,9 @@ __all__ = [
     "ExternalIdpTokenProvider",
     "ExternalIdpToken",
     "ExternalIdpError",
+    "TokenBroker",
+    "CircuitBreakerStateStore",
+    "InMemoryCircuitBreakerStore",
+    "RedisCircuitBreakerStore",
+    "SharedCircuitState",
 ]
@@ -0,0 +1,321 @@
+"""Cluster-shared circuit breaker state.
+
+By default every CircuitBreaker keeps its state in process memory, so with N
+replicas a dead upstream has to trip N breakers. A CircuitBreakerStateStore
+moves the state to a shared backend:
+- Failure counters are incremented atomically and the CLOSED -> OPEN transition
+  happens exactly once, cluster-wide
+- OPEN -> HALF_OPEN is taken by a single replica, which also gets the (only)
+  half-open probe lease; other replicas keep rejecting until the probe reports
+- Every operation returns the transition it caused (if any), so only the
+  replica that caused it publishes the circuit breaker event
+
+Breakers keep a short-lived local copy of the shared state, so calls through a
+closed circuit do not need a round-trip.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+    from infrastructure.cache import RedisCacheService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SharedCircuitState:
+    """Snapshot of a shared circuit returned by every store operation.
+
+    Attributes:
+        state: "closed", "open" or "half_open"
+        failure_count: Consecutive failures recorded cluster-wide
+        last_failure_time: Epoch seconds of the last failure
+        allowed: Whether the caller may make the call (acquire only)
+        transition: State change caused by the operation: "opened", "reopened",
+            "half_opened" or "closed" (None if unchanged)
+    """
+
+    state: str = "closed"
+    failure_count: int = 0
+    last_failure_time: float | None = None
+    allowed: bool = True
+    transition: str | None = None
+
+
+class CircuitBreakerStateStore(ABC):
+    """Backend holding circuit breaker state shared by all replicas."""
+
+    @abstractmethod
+    async def acquire(self, circuit_id: str, recovery_timeout: float, now: float | None = None) -> SharedCircuitState:
+        """Check whether a call may go through.
+
+        Closed circuits always allow. Open circuits move to half-open once the
+        recovery timeout has elapsed since the last failure, and the caller gets
+        the probe lease. Half-open circuits allow only the holder of the lease.
+        """
+
+    @abstractmethod
+    async def record_success(self, circuit_id: str) -> SharedCircuitState:
+        """Record a successful call (closes a half-open circuit)."""
+
+    @abstractmethod
+    async def record_failure(self, circuit_id: str, failure_threshold: int, now: float | None = None) -> SharedCircuitState:
+        """Record a failed call (opens the circuit at the threshold or after a failed probe)."""
+
+    @abstractmethod
+    async def reset(self, circuit_id: str) -> SharedCircuitState:
+        """Force the circuit closed; ``transition`` is "closed" if it was not."""
+
+    @abstractmethod
+    async def get(self, circuit_id: str) -> SharedCircuitState:
+        """Read the current state without changing it."""
+
+
+class InMemoryCircuitBreakerStore(CircuitBreakerStateStore):
+    """Process-local store with the same semantics as the Redis store.
+
+    Useful to share state between breakers of one process and as a reference
+    implementation of the store contract.
+    """
+
+    def __init__(self, probe_lease_seconds: float = 30.0):
+        self._probe_lease = probe_lease_seconds
+        self._circuits: dict[str, dict[str, Any]] = {}
+
+    def _circuit(self, circuit_id: str) -> dict[str, Any]:
+        return self._circuits.setdefault(circuit_id, {"state": "closed", "failures": 0, "last_failure": None, "lease_until": 0.0})
+
+    @staticmethod
+    def _snapshot(circuit: dict[str, Any], allowed: bool = True, transition: str | None = None) -> SharedCircuitState:
+        return SharedCircuitState(circuit["state"], circuit["failures"], circuit["last_failure"], allowed, transition)
+
+    async def acquire(self, circuit_id: str, recovery_timeout: float, now: float | None = None) -> SharedCircuitState:
+        now = time.time() if now is None else now
+        circuit = self._circuit(circuit_id)
+        if circuit["state"] == "closed":
+            return self._snapshot(circuit)
+        if circuit["state"] == "open":
+            if now - (circuit["last_failure"] or 0) < recovery_timeout:
+                return self._snapshot(circuit, allowed=False)
+            circuit["state"] = "half_open"
+            circuit["lease_until"] = now + self._probe_lease
+            return self._snapshot(circuit, transition="half_opened")
+        if circuit["lease_until"] <= now:
+            circuit["lease_until"] = now + self._probe_lease
+            return self._snapshot(circuit)
+        return self._snapshot(circuit, allowed=False)
+
+    async def record_success(self, circuit_id: str) -> SharedCircuitState:
+        circuit = self._circuit(circuit_id)
+        transition = None
+        if circuit["state"] == "half_open":
+            circuit["state"] = "closed"
+            transition = "closed"
+        if circuit["state"] == "closed":
+            circuit["failures"] = 0
+            circuit["lease_until"] = 0.0
+        return self._snapshot(circuit, transition=transition)
+
+    async def record_failure(self, circuit_id: str, failure_threshold: int, now: float | None = None) -> SharedCircuitState:
+        now = time.time() if now is None else now
+        circuit = self._circuit(circuit_id)
+        circuit["failures"] += 1
+        circuit["last_failure"] = now
+        transition = None
+        if circuit["state"] == "half_open":
+            circuit["state"] = "open"
+            circuit["lease_until"] = 0.0
+            transition = "reopened"
+        elif circuit["state"] == "closed" and circuit["failures"] >= failure_threshold:
+            circuit["state"] = "open"
+            transition = "opened"
+        return self._snapshot(circuit, transition=transition)
+
+    async def reset(self, circuit_id: str) -> SharedCircuitState:
+        previous = self._circuits.pop(circuit_id, None)
+        was_open = previous is not None and previous["state"] != "closed"
+        return SharedCircuitState(transition="closed" if was_open else None)
+
+    async def get(self, circuit_id: str) -> SharedCircuitState:
+        return self._snapshot(self._circuit(circuit_id))
+
+
+# KEYS[1] = state hash, KEYS[2] = probe lease; ARGV[1] = now, ARGV[2] = recovery timeout, ARGV[3] = lease ms
+_ACQUIRE_SCRIPT = """
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+local failures = redis.call('HGET', KEYS[1], 'failures') or '0'
+local last_failure = redis.call('HGET', KEYS[1], 'last_failure') or ''
+if state == 'closed' then
+    return {state, failures, last_failure, 1, ''}
+end
+if state == 'open' then
+    if tonumber(ARGV[1]) - tonumber(last_failure ~= '' and last_failure or '0') < tonumber(ARGV[2]) then
+        return {state, failures, last_failure, 0, ''}
+    end
+    redis.call('HSET', KEYS[1], 'state', 'half_open')
+    redis.call('SET', KEYS[2], '1', 'PX', ARGV[3])
+    return {'half_open', failures, last_failure, 1, 'half_opened'}
+end
+if redis.call('SET', KEYS[2], '1', 'NX', 'PX', ARGV[3]) then
+    return {state, failures, last_failure, 1, ''}
+end
+return {state, failures, last_failure, 0, ''}
+"""
+
+# KEYS[1] = state hash, KEYS[2] = probe lease
+_SUCCESS_SCRIPT = """
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+local transition = ''
+if state == 'half_open' then
+    state = 'closed'
+    transition = 'closed'
+end
+if state == 'closed' then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return {state, '0', '', 1, transition}
+end
+return {state, redis.call('HGET', KEYS[1], 'failures') or '0', redis.call('HGET', KEYS[1], 'last_failure') or '', 1, transition}
+"""
+
+# KEYS[1] = state hash, KEYS[2] = probe lease; ARGV[1] = threshold, ARGV[2] = now, ARGV[3] = key ttl seconds
+_FAILURE_SCRIPT = """
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+local failures = redis.call('HINCRBY', KEYS[1], 'failures', 1)
+local transition = ''
+if state == 'half_open' then
+    state = 'open'
+    transition = 'reopened'
+    redis.call('DEL', KEYS[2])
+elseif state == 'closed' and failures >= tonumber(ARGV[1]) then
+    state = 'open'
+    transition = 'opened'
+end
+redis.call('HSET', KEYS[1], 'state', state, 'last_failure', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return {state, tostring(failures), ARGV[2], 1, transition}
+"""
+
+
+class RedisCircuitBreakerStore(CircuitBreakerStateStore):
+    """Redis-backed store; every transition is a single Lua script (atomic).
+
+    Key layout:
+    - mcp:circuit:{circuit_id} - hash with state, failures and last_failure
+    - mcp:circuit:{circuit_id}:probe - half-open probe lease (expires on its own
+      if the probing replica dies)
+    """
+
+    KEY_PREFIX = "mcp:circuit:"
+
+    def __init__(
+        self,
+        cache_service: "RedisCacheService",
+        probe_lease_seconds: float = 30.0,
+        key_ttl_seconds: int = 86400,
+    ):
+        """Initialize the store.
+
+        Args:
+            cache_service: Redis cache whose client is used
+            probe_lease_seconds: How long a half-open probe lease is held at most
+            key_ttl_seconds: Idle lifetime of a circuit's state after its last failure
+        """
+        self._cache_service = cache_service
+        self._probe_lease_ms = int(probe_lease_seconds * 1000)
+        self._key_ttl = key_ttl_seconds
+
+    def _keys(self, circuit_id: str) -> tuple[str, str]:
+        key = f"{self.KEY_PREFIX}{circuit_id}"
+        return key, f"{key}:probe"
+
+    @staticmethod
+    def _parse(reply: list[Any]) -> SharedCircuitState:
+        state, failures, last_failure, allowed, transition = reply
+        return SharedCircuitState(
+            state=str(state),
+            failure_count=int(failures or 0),
+            last_failure_time=float(last_failure) if last_failure else None,
+            allowed=bool(int(allowed)),
+            transition=str(transition) or None,
+        )
+
+    async def acquire(self, circuit_id: str, recovery_timeout: float, now: float | None = None) -> SharedCircuitState:
+        now = time.time() if now is None else now
+        reply = await self._cache_service.client.eval(_ACQUIRE_SCRIPT, 2, *self._keys(circuit_id), now, recovery_timeout, self._probe_lease_ms)
+        return self._parse(reply)
+
+    async def record_success(self, circuit_id: str) -> SharedCircuitState:
+        reply = await self._cache_service.client.eval(_SUCCESS_SCRIPT, 2, *self._keys(circuit_id))
+        return self._parse(reply)
+
+    async def record_failure(self, circuit_id: str, failure_threshold: int, now: float | None = None) -> SharedCircuitState:
+        now = time.time() if now is None else now
+        reply = await self._cache_service.client.eval(_FAILURE_SCRIPT, 2, *self._keys(circuit_id), failure_threshold, now, self._key_ttl)
+        return self._parse(reply)
+
+    async def reset(self, circuit_id: str) -> SharedCircuitState:
+        state_key, probe_key = self._keys(circuit_id)
+        client = self._cache_service.client
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hget(state_key, "state")
+            pipe.delete(state_key, probe_key)
+            previous, _ = await pipe.execute()
+        was_open = previous is not None and previous != "closed"
+        return SharedCircuitState(transition="closed" if was_open else None)
+
+    async def get(self, circuit_id: str) -> SharedCircuitState:
+        data = await self._cache_service.client.hgetall(self._keys(circuit_id)[0])
+        return SharedCircuitState(
+            state=data.get("state", "closed"),
+            failure_count=int(data.get("failures", 0)),
+            last_failure_time=float(data["last_failure"]) if data.get("last_failure") else None,
+        )
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Register the shared circuit breaker store when enabled in settings.
+
+        Requires RedisCacheService to be registered first.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from application.settings import app_settings
+        from infrastructure.cache import RedisCacheService
+
+        log = logging.getLogger(__name__)
+        if not app_settings.circuit_breaker_shared_state:
+            log.debug("Shared circuit breaker state disabled, breakers are per-process")
+            return builder
+
+        cache_service: RedisCacheService | None = None
+        for desc in builder.services:
+            if desc.service_type == RedisCacheService and desc.singleton is not None:
+                cache_service = desc.singleton
+                break
+
+        if cache_service is None:
+            log.warning("RedisCacheService not found in DI container. Circuit breakers will stay per-process.")
+            return builder
+
+        store = RedisCircuitBreakerStore(
+            cache_service=cache_service,
+            probe_lease_seconds=app_settings.circuit_breaker_probe_lease_seconds,
+        )
+        builder.services.add_singleton(CircuitBreakerStateStore, singleton=store)
+        log.info("✅ RedisCircuitBreakerStore configured (cluster-shared circuit breaker state)")
+
+        return builder
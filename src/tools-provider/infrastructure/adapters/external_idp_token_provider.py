@@ -10,7 +10,7 @@ Supports two authentication flows:
 
 Key Features:
 - OIDC Discovery for automatic endpoint resolution
-- Token caching with automatic refresh
+- Token caching via the shared TokenBroker (single-flight, proactive refresh)
 - Support for both flows with external IDPs
 - Async-safe with proper error handling
 - Comprehensive observability (tracing, logging)
@@ -36,7 +36,6 @@ Usage:
     )
 """
 
-import asyncio
 import hashlib
 import logging
 from dataclasses import dataclass
@@ -47,6 +46,7 @@ import httpx
 from opentelemetry import trace
 
 from .oidc_discovery import OIDCDiscoveryService
+from .token_broker import TokenBroker, jwt_expires_at
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -163,11 +163,16 @@ class ExternalIdpTokenProvider:
     ACCESS_TOKEN_TYPE = "urn:ietf:params:oauth:token-type:access_token"  # nosec B105
     REFRESH_TOKEN_TYPE = "urn:ietf:params:oauth:token-type:refresh_token"  # nosec B105
 
+    # Token broker key namespaces
+    CLIENT_CREDENTIALS_KEY_PREFIX = "external_idp_cc:"
+    TOKEN_EXCHANGE_KEY_PREFIX = "external_idp_exchange:"
+
     def __init__(
         self,
         discovery_service: OIDCDiscoveryService | None = None,
         http_timeout: float = 10.0,
         cache_buffer_seconds: int = 60,
+        token_broker: TokenBroker | None = None,
     ) -> None:
         """Initialize the external IDP token provider.
 
@@ -175,15 +180,14 @@ class ExternalIdpTokenProvider:
             discovery_service: Optional shared OIDC discovery service (creates new if None)
             http_timeout: HTTP request timeout in seconds
             cache_buffer_seconds: Refresh tokens this many seconds before expiry
+            token_broker: Shared token broker (creates a private one if None)
         """
         self._discovery = discovery_service or OIDCDiscoveryService(http_timeout=http_timeout)
         self._http_timeout = http_timeout
         self._cache_buffer = cache_buffer_seconds
 
-        # Token cache: keyed by cache key (issuer + client_id + hash)
-        self._client_credentials_cache: dict[str, ExternalIdpToken] = {}
-        self._token_exchange_cache: dict[str, ExternalIdpToken] = {}
-        self._lock = asyncio.Lock()
+        # Tokens are cached in the broker's local tier only (keyed by flow + issuer + client_id + hash)
+        self._broker = token_broker or TokenBroker(default_min_ttl_seconds=cache_buffer_seconds)
 
         logger.info(f"ExternalIdpTokenProvider initialized (cache buffer: {cache_buffer_seconds}s)")
 
@@ -257,38 +261,40 @@ class ExternalIdpTokenProvider:
             span.set_attribute("external_idp.client_id", client_id)
             span.set_attribute("external_idp.scopes", ",".join(scopes) if scopes else "")
 
-            # Check cache first
-            cache_key = self._generate_cache_key(issuer_url, client_id, scopes=scopes)
-            if not skip_cache:
-                async with self._lock:
-                    cached = self._client_credentials_cache.get(cache_key)
-                    if cached and not cached.is_expired(self._cache_buffer):
-                        span.set_attribute("external_idp.cache_hit", True)
-                        logger.debug(f"External IDP client credentials cache hit for {issuer_url}")
-                        return cached
-
-            span.set_attribute("external_idp.cache_hit", False)
-
-            # Discover token endpoint
-            discovery = await self._discovery.get_discovery_document(issuer_url)
-            token_endpoint = discovery.token_endpoint
-            span.set_attribute("external_idp.token_endpoint", token_endpoint)
-
-            # Acquire token
-            token = await self._do_client_credentials(
-                token_endpoint=token_endpoint,
-                client_id=client_id,
-                client_secret=client_secret,
-                scopes=scopes,
-                issuer_url=issuer_url,
+            cache_key = self.CLIENT_CREDENTIALS_KEY_PREFIX + self._generate_cache_key(issuer_url, client_id, scopes=scopes)
+
+            async def fetch() -> ExternalIdpToken:
+                # Own span: background refreshes run after the request span has ended
+                with tracer.start_as_current_span("external_idp.client_credentials.fetch") as fetch_span:
+                    fetch_span.set_attribute("external_idp.issuer_url", issuer_url)
+
+                    # Discover token endpoint
+                    discovery = await self._discovery.get_discovery_document(issuer_url)
+                    token_endpoint = discovery.token_endpoint
+                    fetch_span.set_attribute("external_idp.token_endpoint", token_endpoint)
+
+                    # Acquire token
+                    acquired = await self._do_client_credentials(
+                        token_endpoint=token_endpoint,
+                        client_id=client_id,
+                        client_secret=client_secret,
+                        scopes=scopes,
+                        issuer_url=issuer_url,
+                    )
+                logger.info(f"External IDP client credentials token acquired from {issuer_url}")
+                return acquired
+
+            token = await self._broker.get_token(
+                key=cache_key,
+                fetch=fetch,
+                token_type=ExternalIdpToken,
+                provider="external_idp_client_credentials",
+                skip_cache=skip_cache,
+                min_ttl_seconds=self._cache_buffer,
+                shared=False,
             )
 
-            # Cache the token
-            async with self._lock:
-                self._client_credentials_cache[cache_key] = token
-
             span.set_attribute("external_idp.expires_in", token.expires_in)
-            logger.info(f"External IDP client credentials token acquired from {issuer_url}")
             return token
 
     async def _do_client_credentials(
@@ -411,49 +417,52 @@ class ExternalIdpTokenProvider:
             span.set_attribute("external_idp.audience", audience or "")
             span.set_attribute("external_idp.skip_cache", skip_cache)
 
-            # Check cache first
-            cache_key = self._generate_cache_key(
+            cache_key = self.TOKEN_EXCHANGE_KEY_PREFIX + self._generate_cache_key(
                 issuer_url,
                 client_id,
                 subject_token=subject_token,
                 audience=audience,
             )
-            if not skip_cache:
-                async with self._lock:
-                    cached = self._token_exchange_cache.get(cache_key)
-                    if cached and not cached.is_expired(self._cache_buffer):
-                        span.set_attribute("external_idp.cache_hit", True)
-                        logger.debug(f"External IDP token exchange cache hit for {issuer_url}")
-                        return cached
-
-            span.set_attribute("external_idp.cache_hit", False)
-
-            # Discover token endpoint and verify token exchange support
-            discovery = await self._discovery.get_discovery_document(issuer_url)
-            token_endpoint = discovery.token_endpoint
-            span.set_attribute("external_idp.token_endpoint", token_endpoint)
-
-            if not discovery.supports_token_exchange():
-                logger.warning(f"External IDP may not support token exchange: {issuer_url}")
-                span.add_event("token_exchange_not_advertised")
-
-            # Perform token exchange
-            token = await self._do_token_exchange(
-                token_endpoint=token_endpoint,
-                subject_token=subject_token,
-                client_id=client_id,
-                client_secret=client_secret,
-                audience=audience,
-                requested_scopes=requested_scopes,
-                issuer_url=issuer_url,
-            )
 
-            # Cache the token
-            async with self._lock:
-                self._token_exchange_cache[cache_key] = token
+            async def fetch() -> ExternalIdpToken:
+                # Own span: background refreshes run after the request span has ended
+                with tracer.start_as_current_span("external_idp.token_exchange.fetch") as fetch_span:
+                    fetch_span.set_attribute("external_idp.issuer_url", issuer_url)
+
+                    # Discover token endpoint and verify token exchange support
+                    discovery = await self._discovery.get_discovery_document(issuer_url)
+                    token_endpoint = discovery.token_endpoint
+                    fetch_span.set_attribute("external_idp.token_endpoint", token_endpoint)
+
+                    if not discovery.supports_token_exchange():
+                        logger.warning(f"External IDP may not support token exchange: {issuer_url}")
+                        fetch_span.add_event("token_exchange_not_advertised")
+
+                    # Perform token exchange
+                    exchanged = await self._do_token_exchange(
+                        token_endpoint=token_endpoint,
+                        subject_token=subject_token,
+                        client_id=client_id,
+                        client_secret=client_secret,
+                        audience=audience,
+                        requested_scopes=requested_scopes,
+                        issuer_url=issuer_url,
+                    )
+                logger.info(f"External IDP token exchange successful at {issuer_url}")
+                return exchanged
+
+            token = await self._broker.get_token(
+                key=cache_key,
+                fetch=fetch,
+                token_type=ExternalIdpToken,
+                provider="external_idp_token_exchange",
+                skip_cache=skip_cache,
+                min_ttl_seconds=self._cache_buffer,
+                shared=False,
+                refresh_until=jwt_expires_at(subject_token),
+            )
 
             span.set_attribute("external_idp.expires_in", token.expires_in)
-            logger.info(f"External IDP token exchange successful at {issuer_url}")
             return token
 
     async def _do_token_exchange(
@@ -562,20 +571,15 @@ class ExternalIdpTokenProvider:
         Args:
             issuer_url: Specific issuer to clear, or None to clear all
         """
+        prefixes = (self.CLIENT_CREDENTIALS_KEY_PREFIX, self.TOKEN_EXCHANGE_KEY_PREFIX)
         if issuer_url:
             issuer_prefix = issuer_url.rstrip("/")
-            keys_to_remove = [k for k in self._client_credentials_cache if k.startswith(issuer_prefix)]
-            for key in keys_to_remove:
-                del self._client_credentials_cache[key]
-
-            keys_to_remove = [k for k in self._token_exchange_cache if k.startswith(issuer_prefix)]
-            for key in keys_to_remove:
-                del self._token_exchange_cache[key]
+            prefixes = tuple(f"{prefix}{issuer_prefix}" for prefix in prefixes)
+        self._broker.invalidate_local(lambda key: key.startswith(prefixes))
 
+        if issuer_url:
             logger.debug(f"Cleared external IDP token cache for {issuer_url}")
         else:
-            self._client_credentials_cache.clear()
-            self._token_exchange_cache.clear()
             logger.debug("Cleared all external IDP token cache entries")
 
     def get_cache_stats(self) -> dict[str, Any]:
@@ -585,7 +589,7 @@ class ExternalIdpTokenProvider:
             Dictionary with cache statistics
         """
         return {
-            "client_credentials_entries": len(self._client_credentials_cache),
-            "token_exchange_entries": len(self._token_exchange_cache),
+            "client_credentials_entries": self._broker.count_local(self.CLIENT_CREDENTIALS_KEY_PREFIX),
+            "token_exchange_entries": self._broker.count_local(self.TOKEN_EXCHANGE_KEY_PREFIX),
             "cache_buffer_seconds": self._cache_buffer,
         }
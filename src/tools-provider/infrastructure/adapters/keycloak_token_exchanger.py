@@ -5,7 +5,7 @@ enabling secure delegation of identity when proxying tool execution requests.
 
 Key Features:
 - RFC 8693 compliant token exchange
-- Token caching with configurable TTL
+- Token caching via the shared TokenBroker (single-flight, proactive refresh)
 - Circuit breaker for resilience
 - Comprehensive observability (tracing, metrics, logging)
 - CloudEvent emission for circuit breaker state changes
@@ -18,7 +18,6 @@ Security Considerations:
 
 import asyncio
 import hashlib
-import json
 import logging
 import time
 from collections.abc import Awaitable, Callable
@@ -32,6 +31,9 @@ from opentelemetry import trace
 
 from domain.events.circuit_breaker import CircuitBreakerClosedDomainEvent, CircuitBreakerHalfOpenedDomainEvent, CircuitBreakerOpenedDomainEvent, CircuitBreakerTransitionReason
 
+from .circuit_breaker_store import CircuitBreakerStateStore, SharedCircuitState
+from .token_broker import TokenBroker, jwt_expires_at
+
 if TYPE_CHECKING:
     from neuroglia.hosting.web import WebApplicationBuilder
 
@@ -122,11 +124,16 @@ class CircuitBreaker:
     requests when the external service is consistently failing.
 
     Supports event callbacks for CloudEvent emission on state transitions.
+
+    When a ``store`` is set the state is shared by all replicas (see
+    circuit_breaker_store): this instance only mirrors it, refreshing the
+    mirror at most every ``state_cache_seconds`` while the circuit is closed
+    without failures, and half-open allows a single probe cluster-wide.
     """
 
     failure_threshold: int = 5  # Failures before opening
     recovery_timeout: float = 30.0  # Seconds before trying again
-    half_open_max_calls: int = 3  # Test calls in half-open state
+    half_open_max_calls: int = 3  # Test calls in half-open state (per-process state only)
 
     # Identity for event emission
     circuit_id: str = field(default="unknown")
@@ -136,11 +143,16 @@ class CircuitBreaker:
     # Event callback (set by containing service to publish events)
     on_state_change: Callable[[Any], Awaitable[None]] | None = field(default=None, repr=False)
 
+    # Optional cluster-shared state
+    store: CircuitBreakerStateStore | None = field(default=None, repr=False)
+    state_cache_seconds: float = 1.0  # How long a closed mirror of the shared state is trusted
+
     state: CircuitState = field(default=CircuitState.CLOSED, init=False)
     failure_count: int = field(default=0, init=False)
     last_failure_time: float | None = field(default=None, init=False)
     half_open_calls: int = field(default=0, init=False)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    _synced_at: float = field(default=float("-inf"), init=False, repr=False)
 
     async def _emit_event(self, event: Any) -> None:
         """Emit a circuit breaker state change event."""
@@ -163,6 +175,12 @@ class CircuitBreaker:
         Raises:
             TokenExchangeError: If circuit is open or call fails
         """
+        if self.store is not None:
+            return await self._call_shared(func, *args, **kwargs)
+        return await self._call_local(func, *args, **kwargs)
+
+    async def _call_local(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Execute a function against the per-process circuit state."""
         async with self._lock:
             if self.state == CircuitState.OPEN:
                 if self._should_attempt_reset():
@@ -205,6 +223,117 @@ class CircuitBreaker:
             await self._on_failure()
             raise
 
+    async def _call_shared(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Execute a function against the cluster-shared circuit state."""
+        assert self.store is not None  # nosec B101 - only called with a store
+        if self.state == CircuitState.OPEN and not self._should_attempt_reset():
+            # Still within the recovery window: reject without a round-trip
+            raise self._open_error()
+
+        # Only a healthy (closed, no recent failures) mirror is trusted without asking the store
+        healthy = self.state == CircuitState.CLOSED and self.failure_count == 0
+        if not healthy or time.monotonic() - self._synced_at >= self.state_cache_seconds:
+            try:
+                shared = await self.store.acquire(self.circuit_id, self.recovery_timeout)
+            except Exception as e:
+                logger.warning(f"Shared state of circuit '{self.circuit_id}' unavailable, using local state: {e}")
+                return await self._call_local(func, *args, **kwargs)
+            await self._apply_shared(shared)
+            if not shared.allowed:
+                raise self._open_error()
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            await self._record_shared(failed=True)
+            raise
+        if self.state != CircuitState.CLOSED or self.failure_count:
+            await self._record_shared(failed=False)
+        return result
+
+    async def _record_shared(self, failed: bool) -> None:
+        """Report a call outcome to the shared store (falls back to local state)."""
+        assert self.store is not None  # nosec B101 - only called with a store
+        try:
+            if failed:
+                shared = await self.store.record_failure(self.circuit_id, self.failure_threshold)
+            else:
+                shared = await self.store.record_success(self.circuit_id)
+        except Exception as e:
+            logger.warning(f"Failed to record outcome on shared circuit '{self.circuit_id}': {e}")
+            await (self._on_failure() if failed else self._on_success())
+            return
+        await self._apply_shared(shared)
+
+    async def _apply_shared(self, shared: SharedCircuitState) -> None:
+        """Update the local mirror and emit the event for the transition this replica caused."""
+        self.state = CircuitState(shared.state)
+        self.failure_count = shared.failure_count
+        self.last_failure_time = shared.last_failure_time
+        self._synced_at = time.monotonic()
+
+        if shared.transition in ("opened", "reopened"):
+            logger.warning(f"Circuit breaker '{self.circuit_id}' opened cluster-wide after {self.failure_count} failures")
+            await self._emit_event(
+                CircuitBreakerOpenedDomainEvent(
+                    circuit_id=self.circuit_id,
+                    circuit_type=self.circuit_type,
+                    source_id=self.source_id,
+                    failure_count=self.failure_count,
+                    failure_threshold=self.failure_threshold,
+                    last_failure_time=datetime.now(UTC),
+                    reason=CircuitBreakerTransitionReason.TEST_CALL_FAILED if shared.transition == "reopened" else CircuitBreakerTransitionReason.FAILURE_THRESHOLD_REACHED,
+                )
+            )
+        elif shared.transition == "half_opened":
+            logger.info(f"Circuit breaker '{self.circuit_id}' entering half-open state (this instance probes)")
+            await self._emit_event(
+                CircuitBreakerHalfOpenedDomainEvent(
+                    circuit_id=self.circuit_id,
+                    circuit_type=self.circuit_type,
+                    source_id=self.source_id,
+                    recovery_timeout=self.recovery_timeout,
+                    opened_at=datetime.now(UTC),
+                )
+            )
+        elif shared.transition == "closed":
+            logger.info(f"Circuit breaker '{self.circuit_id}' closing cluster-wide after successful test call")
+            await self._emit_event(
+                CircuitBreakerClosedDomainEvent(
+                    circuit_id=self.circuit_id,
+                    circuit_type=self.circuit_type,
+                    source_id=self.source_id,
+                    reason=CircuitBreakerTransitionReason.TEST_CALL_SUCCEEDED,
+                    closed_at=datetime.now(UTC),
+                    was_manual=False,
+                    closed_by=None,
+                )
+            )
+
+    def _open_error(self) -> TokenExchangeError:
+        if self.state == CircuitState.HALF_OPEN:
+            return TokenExchangeError(
+                message="Circuit breaker is testing - please wait",
+                error_code="circuit_testing",
+                is_retryable=True,
+            )
+        return TokenExchangeError(
+            message="Circuit breaker is open - token exchange temporarily unavailable",
+            error_code="circuit_open",
+            is_retryable=True,
+        )
+
+    async def refresh_state(self) -> None:
+        """Refresh the local mirror from the shared store (no-op for per-process state)."""
+        if self.store is None:
+            return
+        try:
+            shared = await self.store.get(self.circuit_id)
+        except Exception as e:
+            logger.debug(f"Failed to read shared circuit '{self.circuit_id}': {e}")
+            return
+        await self._apply_shared(shared)
+
     async def _on_success(self) -> None:
         """Record successful call."""
         async with self._lock:
@@ -284,6 +413,7 @@ class CircuitBreaker:
             "circuit_id": self.circuit_id,
             "circuit_type": self.circuit_type,
             "source_id": self.source_id,
+            "shared": self.store is not None,
         }
 
     async def reset(self, manual: bool = False, reset_by: str | None = None) -> None:
@@ -300,6 +430,13 @@ class CircuitBreaker:
         async with self._lock:
             previous_state = self.state.value
             was_open = self.state != CircuitState.CLOSED
+            if self.store is not None:
+                try:
+                    # The cluster-wide state decides whether this reset closed anything
+                    was_open = (await self.store.reset(self.circuit_id)).transition == "closed"
+                except Exception as e:
+                    logger.warning(f"Failed to reset shared circuit '{self.circuit_id}': {e}")
+                self._synced_at = time.monotonic()
 
             self.state = CircuitState.CLOSED
             self.failure_count = 0
@@ -343,8 +480,9 @@ class KeycloakTokenExchanger:
 
     Caching:
     - Exchanged tokens are cached by (subject_token_hash, audience) tuple
-    - Cache TTL is configurable (default: token_expiry - 60 seconds)
-    - Redis is used for distributed caching across instances
+    - Caching is delegated to the TokenBroker: concurrent misses share one
+      exchange, tokens are refreshed ahead of expiry, and Redis is used for
+      distributed caching across instances
 
     Circuit Breaker:
     - Opens after consecutive failures to protect against Keycloak outages
@@ -369,6 +507,9 @@ class KeycloakTokenExchanger:
         circuit_failure_threshold: int = 5,
         circuit_recovery_timeout: float = 30.0,
         on_circuit_state_change: Callable[[Any], Awaitable[None]] | None = None,
+        token_broker: TokenBroker | None = None,
+        circuit_store: CircuitBreakerStateStore | None = None,
+        circuit_state_cache_seconds: float = 1.0,
     ):
         """Initialize the token exchanger.
 
@@ -383,12 +524,15 @@ class KeycloakTokenExchanger:
             circuit_failure_threshold: Failures before circuit opens
             circuit_recovery_timeout: Seconds before circuit retries
             on_circuit_state_change: Optional callback for circuit breaker events
+            token_broker: Shared token broker (a private one backed by cache_service is created if None)
+            circuit_store: Optional cluster-shared circuit breaker state
+            circuit_state_cache_seconds: How long the breaker trusts its local copy of the shared state
         """
         self._keycloak_url = keycloak_url.rstrip("/")
         self._realm = realm
         self._client_id = client_id
         self._client_secret = client_secret
-        self._cache = cache_service
+        self._broker = token_broker or TokenBroker(cache_service=cache_service, default_min_ttl_seconds=cache_ttl_buffer_seconds)
         self._cache_ttl_buffer = cache_ttl_buffer_seconds
         self._http_timeout = http_timeout
 
@@ -403,11 +547,10 @@ class KeycloakTokenExchanger:
             circuit_type="token_exchange",
             source_id=None,
             on_state_change=on_circuit_state_change,
+            store=circuit_store,
+            state_cache_seconds=circuit_state_cache_seconds,
         )
 
-        # In-memory cache fallback (per-instance)
-        self._local_cache: dict[str, TokenExchangeResult] = {}
-
         logger.info(f"KeycloakTokenExchanger initialized for realm '{realm}' at {keycloak_url}")
 
     async def exchange_token(
@@ -437,35 +580,36 @@ class KeycloakTokenExchanger:
             span.set_attribute("token_exchange.audience", audience)
             span.set_attribute("token_exchange.skip_cache", skip_cache)
 
-            # Generate cache key
             cache_key = self._generate_cache_key(subject_token, audience, requested_scopes)
 
-            # Try cache first
-            if not skip_cache:
-                cached = await self._get_cached_token(cache_key)
-                if cached and not cached.is_expired(leeway_seconds=self._cache_ttl_buffer):
-                    span.set_attribute("token_exchange.cache_hit", True)
-                    logger.debug(f"Token exchange cache hit for audience '{audience}'")
-                    return cached
-                span.set_attribute("token_exchange.cache_hit", False)
-
-            # Perform exchange with circuit breaker protection
-            span.add_event("Performing token exchange")
-            result: TokenExchangeResult = cast(
-                TokenExchangeResult,
-                await self._circuit.call(
-                    self._do_exchange,
-                    subject_token=subject_token,
-                    audience=audience,
-                    requested_scopes=requested_scopes,
-                ),
+            async def fetch() -> TokenExchangeResult:
+                # Own span: background refreshes run after the request span has ended
+                with tracer.start_as_current_span("exchange_token.fetch") as fetch_span:
+                    fetch_span.set_attribute("token_exchange.audience", audience)
+                    exchanged = cast(
+                        TokenExchangeResult,
+                        await self._circuit.call(
+                            self._do_exchange,
+                            subject_token=subject_token,
+                            audience=audience,
+                            requested_scopes=requested_scopes,
+                        ),
+                    )
+                    fetch_span.set_attribute("token_exchange.expires_in", exchanged.expires_in)
+                logger.info(f"Token exchange successful for audience '{audience}', expires in {exchanged.expires_in}s")
+                return exchanged
+
+            result = await self._broker.get_token(
+                key=cache_key,
+                fetch=fetch,
+                token_type=TokenExchangeResult,
+                provider="keycloak_exchange",
+                skip_cache=skip_cache,
+                min_ttl_seconds=self._cache_ttl_buffer,
+                refresh_until=jwt_expires_at(subject_token),
             )
 
-            # Cache the result
-            await self._cache_token(cache_key, result)
-
             span.set_attribute("token_exchange.expires_in", result.expires_in)
-            logger.info(f"Token exchange successful for audience '{audience}', expires in {result.expires_in}s")
             return result
 
     async def _do_exchange(
@@ -595,78 +739,6 @@ class KeycloakTokenExchanger:
         scope_str = ",".join(sorted(scopes)) if scopes else ""
         return f"token_exchange:{token_hash}:{audience}:{scope_str}"
 
-    async def _get_cached_token(self, cache_key: str) -> TokenExchangeResult | None:
-        """Retrieve token from cache.
-
-        Args:
-            cache_key: Cache key
-
-        Returns:
-            Cached TokenExchangeResult or None
-        """
-        # Try Redis cache first
-        if self._cache:
-            try:
-                key = f"mcp:exchange:{cache_key}"
-                data = await self._cache.client.get(key)
-                if data:
-                    token_dict = json.loads(data)
-                    return TokenExchangeResult(
-                        access_token=token_dict["access_token"],
-                        token_type=token_dict.get("token_type", "Bearer"),
-                        expires_in=token_dict.get("expires_in", 300),
-                        expires_at=datetime.fromisoformat(token_dict["expires_at"]) if token_dict.get("expires_at") else None,
-                        scope=token_dict.get("scope"),
-                        issued_token_type=token_dict.get("issued_token_type", self.ACCESS_TOKEN_TYPE),
-                    )
-            except Exception as e:
-                logger.warning(f"Redis cache read failed: {e}")
-
-        # Fall back to local cache
-        cached = self._local_cache.get(cache_key)
-        if cached and not cached.is_expired(leeway_seconds=self._cache_ttl_buffer):
-            return cached
-
-        return None
-
-    async def _cache_token(self, cache_key: str, result: TokenExchangeResult) -> None:
-        """Store token in cache.
-
-        Args:
-            cache_key: Cache key
-            result: Token exchange result to cache
-        """
-        # Calculate TTL (token expiry minus buffer)
-        ttl = max(result.expires_in - self._cache_ttl_buffer, 30)
-
-        # Store in local cache
-        self._local_cache[cache_key] = result
-
-        # Clean up expired entries from local cache periodically
-        self._cleanup_local_cache()
-
-        # Try Redis cache
-        if self._cache:
-            try:
-                key = f"mcp:exchange:{cache_key}"
-                token_dict = {
-                    "access_token": result.access_token,
-                    "token_type": result.token_type,
-                    "expires_in": result.expires_in,
-                    "expires_at": result.expires_at.isoformat() if result.expires_at else None,
-                    "scope": result.scope,
-                    "issued_token_type": result.issued_token_type,
-                }
-                await self._cache.client.set(key, json.dumps(token_dict), ex=ttl)
-            except Exception as e:
-                logger.warning(f"Redis cache write failed: {e}")
-
-    def _cleanup_local_cache(self) -> None:
-        """Remove expired entries from local cache."""
-        expired_keys = [key for key, result in self._local_cache.items() if result.is_expired(leeway_seconds=0)]
-        for key in expired_keys:
-            del self._local_cache[key]
-
     async def invalidate_cache(self, audience: str | None = None) -> int:
         """Invalidate cached tokens.
 
@@ -677,30 +749,13 @@ class KeycloakTokenExchanger:
         Returns:
             Number of cache entries invalidated
         """
-        count = 0
-
-        # Clear local cache
         if audience:
-            keys_to_remove = [k for k in self._local_cache.keys() if f":{audience}:" in k]
-            for key in keys_to_remove:
-                del self._local_cache[key]
-                count += 1
+            count = await self._broker.invalidate(
+                pattern=f"token_exchange:*:{audience}:*",
+                predicate=lambda key: key.startswith("token_exchange:") and f":{audience}:" in key,
+            )
         else:
-            count = len(self._local_cache)
-            self._local_cache.clear()
-
-        # Clear Redis cache
-        if self._cache:
-            try:
-                pattern = f"mcp:exchange:*{':' + audience + ':' if audience else ''}*"
-                keys = []
-                async for key in self._cache.client.scan_iter(pattern):
-                    keys.append(key)
-                if keys:
-                    await self._cache.client.delete(*keys)
-                    count += len(keys)
-            except Exception as e:
-                logger.warning(f"Redis cache invalidation failed: {e}")
+            count = await self._broker.invalidate(pattern="token_exchange:*", predicate=lambda key: key.startswith("token_exchange:"))
 
         logger.info(f"Invalidated {count} cached exchange tokens")
         return count
@@ -713,6 +768,11 @@ class KeycloakTokenExchanger:
         """
         return self._circuit.get_state()
 
+    async def refresh_circuit_state(self) -> dict[str, Any]:
+        """Get the circuit breaker state after syncing it from the shared store (if any)."""
+        await self._circuit.refresh_state()
+        return self._circuit.get_state()
+
     async def reset_circuit_breaker(self, reset_by: str | None = None) -> dict[str, Any]:
         """Manually reset the circuit breaker to closed state.
 
@@ -739,7 +799,7 @@ class KeycloakTokenExchanger:
             "healthy": circuit_state["state"] != CircuitState.OPEN.value,
             "circuit_breaker": circuit_state,
             "token_endpoint": self._token_endpoint,
-            "local_cache_size": len(self._local_cache),
+            "local_cache_size": self._broker.count_local("token_exchange:"),
         }
 
     # =========================================================================
@@ -753,7 +813,7 @@ class KeycloakTokenExchanger:
         This method follows the Neuroglia pattern for service configuration,
         creating a singleton instance and registering it in the DI container.
 
-        Resolves RedisCacheService and CircuitBreakerEventPublisher from the DI container if available.
+        Resolves TokenBroker, RedisCacheService and CircuitBreakerEventPublisher from the DI container if available.
 
         Args:
             builder: WebApplicationBuilder instance for service registration
@@ -780,6 +840,13 @@ class KeycloakTokenExchanger:
         else:
             log.debug("RedisCacheService not available, token caching will use local cache only")
 
+        # Resolve optional shared token broker
+        token_broker: TokenBroker | None = None
+        for desc in builder.services:
+            if desc.service_type == TokenBroker and desc.singleton is not None:
+                token_broker = desc.singleton
+                break
+
         # Resolve optional circuit breaker event publisher
         event_publisher: CircuitBreakerEventPublisher | None = None
         for desc in builder.services:
@@ -793,6 +860,13 @@ class KeycloakTokenExchanger:
         else:
             log.debug("CircuitBreakerEventPublisher not available, circuit breaker events will not be published")
 
+        # Resolve optional cluster-shared circuit breaker state
+        circuit_store: CircuitBreakerStateStore | None = None
+        for desc in builder.services:
+            if desc.service_type == CircuitBreakerStateStore and desc.singleton is not None:
+                circuit_store = desc.singleton
+                break
+
         token_exchanger = KeycloakTokenExchanger(
             keycloak_url=app_settings.keycloak_url_internal or app_settings.keycloak_url,
             realm=app_settings.keycloak_realm,
@@ -804,6 +878,9 @@ class KeycloakTokenExchanger:
             circuit_failure_threshold=app_settings.circuit_breaker_failure_threshold,
             circuit_recovery_timeout=app_settings.circuit_breaker_recovery_timeout,
             on_circuit_state_change=on_circuit_state_change,
+            token_broker=token_broker,
+            circuit_store=circuit_store,
+            circuit_state_cache_seconds=app_settings.circuit_breaker_state_cache_seconds,
         )
         builder.services.add_singleton(KeycloakTokenExchanger, singleton=token_exchanger)
         log.info(f"✅ KeycloakTokenExchanger configured for realm '{app_settings.keycloak_realm}'")
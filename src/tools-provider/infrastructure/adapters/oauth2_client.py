@@ -8,10 +8,10 @@ This service supports two variants:
 - Variant B: Use source-specific credentials configured per upstream source
 
 Key Features:
-- Token caching with automatic refresh
+- Token caching via the shared TokenBroker (single-flight, proactive refresh)
 - Configurable buffer before token expiry
 - Support for both default and source-specific credentials
-- Async-safe with locking
+- Concurrent requests for one client share a single token request
 - Comprehensive logging
 
 Usage:
@@ -27,7 +27,6 @@ Usage:
     )
 """
 
-import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
@@ -35,6 +34,8 @@ from datetime import UTC, datetime, timedelta
 import httpx
 from opentelemetry import trace
 
+from .token_broker import TokenBroker
+
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
@@ -103,7 +104,7 @@ class OAuth2ClientCredentialsService:
 
     Features:
     - Token caching with automatic refresh
-    - Thread-safe async operations
+    - Single-flight acquisition per (token_url, client_id, scopes)
     - Configurable expiry buffer
 
     Example:
@@ -124,6 +125,9 @@ class OAuth2ClientCredentialsService:
         )
     """
 
+    # Token broker key namespace
+    KEY_PREFIX = "client_credentials:"
+
     def __init__(
         self,
         default_token_url: str,
@@ -131,6 +135,7 @@ class OAuth2ClientCredentialsService:
         default_client_secret: str,
         http_timeout: float = 10.0,
         cache_buffer_seconds: int = 60,
+        token_broker: TokenBroker | None = None,
     ) -> None:
         """Initialize the client credentials service.
 
@@ -140,6 +145,7 @@ class OAuth2ClientCredentialsService:
             default_client_secret: Client secret for Tools Provider service account
             http_timeout: HTTP request timeout in seconds
             cache_buffer_seconds: Refresh token this many seconds before expiry
+            token_broker: Shared token broker (creates a private one if None)
         """
         self._default_token_url = default_token_url
         self._default_client_id = default_client_id
@@ -147,9 +153,8 @@ class OAuth2ClientCredentialsService:
         self._http_timeout = http_timeout
         self._cache_buffer = cache_buffer_seconds
 
-        # Token cache: keyed by (token_url, client_id)
-        self._cache: dict[tuple[str, str], ClientCredentialsToken] = {}
-        self._lock = asyncio.Lock()
+        # Tokens are cached in the broker's local tier, keyed by (token_url, client_id, scopes)
+        self._broker = token_broker or TokenBroker(default_min_ttl_seconds=cache_buffer_seconds)
 
         logger.info(
             "OAuth2ClientCredentialsService initialized",
@@ -202,29 +207,14 @@ class OAuth2ClientCredentialsService:
         if not effective_url or not effective_client_id or not effective_client_secret:
             raise ValueError("No client credentials available. Either provide credentials or configure defaults.")
 
-        cache_key = (effective_url, effective_client_id)
+        scope_str = ",".join(sorted(scopes)) if scopes else ""
+        cache_key = f"{self.KEY_PREFIX}{effective_url}|{effective_client_id}|{scope_str}"
 
         with tracer.start_as_current_span("oauth2_client_credentials.get_token") as span:
             span.set_attribute("oauth2.client_id", effective_client_id)
             span.set_attribute("oauth2.is_default", token_url is None)
 
-            async with self._lock:
-                # Check cache
-                cached = self._cache.get(cache_key)
-                if cached and not cached.is_expired(self._cache_buffer):
-                    logger.debug(
-                        "Client credentials cache hit",
-                        extra={
-                            "client_id": effective_client_id,
-                            "expires_at": cached.expires_at.isoformat(),
-                        },
-                    )
-                    span.set_attribute("oauth2.cache_hit", True)
-                    return cached.access_token
-
-                span.set_attribute("oauth2.cache_hit", False)
-
-                # Acquire new token
+            async def fetch() -> ClientCredentialsToken:
                 logger.info(
                     "Acquiring client credentials token",
                     extra={
@@ -233,19 +223,27 @@ class OAuth2ClientCredentialsService:
                         "scopes": scopes,
                     },
                 )
-
-                token = await self._acquire_token(
-                    token_url=effective_url,
-                    client_id=effective_client_id,
-                    client_secret=effective_client_secret,
-                    scopes=scopes,
-                )
-
-                # Cache it
-                self._cache[cache_key] = token
-                span.set_attribute("oauth2.expires_in", (token.expires_at - datetime.now(UTC)).total_seconds())
-
-                return token.access_token
+                # Own span: background refreshes run after the request span has ended
+                with tracer.start_as_current_span("oauth2_client_credentials.fetch") as fetch_span:
+                    fetch_span.set_attribute("oauth2.client_id", effective_client_id)
+                    acquired = await self._acquire_token(
+                        token_url=effective_url,
+                        client_id=effective_client_id,
+                        client_secret=effective_client_secret,
+                        scopes=scopes,
+                    )
+                    fetch_span.set_attribute("oauth2.expires_in", (acquired.expires_at - datetime.now(UTC)).total_seconds())
+                return acquired
+
+            token = await self._broker.get_token(
+                key=cache_key,
+                fetch=fetch,
+                token_type=ClientCredentialsToken,
+                provider="oauth2_client_credentials",
+                min_ttl_seconds=self._cache_buffer,
+                shared=False,
+            )
+            return token.access_token
 
     async def _acquire_token(
         self,
@@ -363,10 +361,8 @@ class OAuth2ClientCredentialsService:
                        If None, clear all cached tokens.
         """
         if client_id is None:
-            self._cache.clear()
+            self._broker.invalidate_local(lambda key: key.startswith(self.KEY_PREFIX))
             logger.info("Cleared all client credentials cache")
         else:
-            keys_to_remove = [key for key in self._cache if key[1] == client_id]
-            for key in keys_to_remove:
-                del self._cache[key]
-            logger.info(f"Cleared client credentials cache for {client_id}", extra={"keys_removed": len(keys_to_remove)})
+            removed = self._broker.invalidate_local(lambda key: key.startswith(self.KEY_PREFIX) and key.split("|")[1] == client_id)
+            logger.info(f"Cleared client credentials cache for {client_id}", extra={"keys_removed": removed})
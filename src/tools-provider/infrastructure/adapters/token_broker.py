@@ -0,0 +1,395 @@
+"""Token Broker: shared caching layer for upstream credentials.
+
+All token adapters (KeycloakTokenExchanger, ExternalIdpTokenProvider,
+OAuth2ClientCredentialsService) plug into this broker instead of keeping
+their own caches.
+
+Key Features:
+- Single-flight: concurrent misses for the same key share one IDP request
+- Proactive refresh: a token past ``refresh_fraction`` of its lifetime is
+  returned immediately while a replacement is fetched in the background,
+  unless the credential ``fetch`` relies on expires before the cached token
+- Bounded LRU local tier (per instance)
+- Optional shared Redis tier (across instances)
+- Hit/miss/coalesce/refresh metrics
+
+Usage:
+    token = await broker.get_token(
+        key="token_exchange:abc123:upstream-api:",
+        fetch=lambda: exchanger._do_exchange(...),
+        token_type=TokenExchangeResult,
+        provider="keycloak_exchange",
+    )
+
+Tokens must be dataclasses with ``access_token`` and ``expires_at`` (UTC datetime)
+fields; they are serialized field-by-field for the shared tier.
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import jwt
+from opentelemetry import trace
+
+from observability import token_broker_coalesced, token_broker_evictions, token_broker_hits, token_broker_misses, token_broker_refreshes
+
+if TYPE_CHECKING:
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+T = TypeVar("T")
+
+
+def jwt_expires_at(token: str) -> datetime | None:
+    """Read the ``exp`` claim of a JWT without verifying it.
+
+    Args:
+        token: The encoded JWT
+
+    Returns:
+        The expiry as a UTC datetime, or None if the token is not a JWT or has no ``exp``
+    """
+    try:
+        exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+    except jwt.PyJWTError:
+        return None
+    return datetime.fromtimestamp(exp, UTC) if isinstance(exp, int | float) else None
+
+
+@dataclass
+class _CacheEntry:
+    """A cached token with the timestamps needed for refresh decisions.
+
+    Attributes:
+        token: The adapter-specific token object
+        fetched_at: When the token was obtained (epoch seconds)
+        expires_at: When the token expires (epoch seconds)
+    """
+
+    token: Any
+    fetched_at: float
+    expires_at: float
+
+    def is_usable(self, now: float, min_ttl_seconds: float) -> bool:
+        return self.expires_at - now > min_ttl_seconds
+
+    def needs_refresh(self, now: float, refresh_fraction: float, refresh_until: datetime | None = None) -> bool:
+        if refresh_until is not None and refresh_until.timestamp() <= self.expires_at:
+            # The refreshed token could only be fetched with a credential that is gone by the time it is needed
+            return False
+        lifetime = self.expires_at - self.fetched_at
+        return now >= self.fetched_at + lifetime * refresh_fraction
+
+
+class TokenBroker:
+    """Single-flight, two-tier token cache shared by all token adapters.
+
+    Cache keys are namespaced by the calling adapter (e.g. ``keycloak_exchange:...``)
+    and must never contain raw secrets or tokens; adapters hash subject tokens.
+    """
+
+    def __init__(
+        self,
+        cache_service: Any | None = None,
+        max_local_entries: int = 10_000,
+        refresh_fraction: float = 0.8,
+        default_min_ttl_seconds: int = 60,
+        redis_key_prefix: str = "mcp:tokens:",
+    ) -> None:
+        """Initialize the token broker.
+
+        Args:
+            cache_service: Optional RedisCacheService for the shared tier
+            max_local_entries: Maximum tokens kept in the local LRU tier
+            refresh_fraction: Fraction of a token's lifetime after which it is refreshed in the background
+            default_min_ttl_seconds: Tokens expiring within this many seconds are not served
+            redis_key_prefix: Prefix for shared-tier keys
+        """
+        self._cache_service = cache_service
+        self._max_local_entries = max_local_entries
+        self._refresh_fraction = refresh_fraction
+        self._default_min_ttl = default_min_ttl_seconds
+        self._redis_key_prefix = redis_key_prefix
+
+        self._local: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._refreshing: set[str] = set()
+        self._background_tasks: set[asyncio.Task] = set()
+
+        logger.info(f"TokenBroker initialized (max_local_entries={max_local_entries}, refresh_fraction={refresh_fraction}, shared_tier={'redis' if cache_service else 'disabled'})")
+
+    async def get_token(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        token_type: type[T],
+        provider: str,
+        skip_cache: bool = False,
+        min_ttl_seconds: int | None = None,
+        shared: bool = True,
+        refresh_until: datetime | None = None,
+    ) -> T:
+        """Get a token from cache, or fetch it once for all concurrent callers.
+
+        Args:
+            key: Cache key (namespaced, without secrets)
+            fetch: Coroutine factory that obtains a fresh token from the IDP
+            token_type: Dataclass type of the token (used to restore shared-tier entries)
+            provider: Adapter name used as a metric attribute
+            skip_cache: If True, bypass cached tokens and fetch a fresh one
+            min_ttl_seconds: Do not serve tokens expiring within this many seconds
+            shared: Whether to use the shared Redis tier for this token
+            refresh_until: When the credential ``fetch`` relies on expires (e.g. the
+                subject token of an exchange). Cached tokens expiring after it are
+                not refreshed ahead, since the replacement could never be used
+
+        Returns:
+            The token
+
+        Raises:
+            Whatever ``fetch`` raises on a miss
+        """
+        min_ttl = self._default_min_ttl if min_ttl_seconds is None else min_ttl_seconds
+        attributes = {"provider": provider}
+
+        if not skip_cache:
+            now = time.time()
+            entry = self._get_local(key)
+            tier = "local"
+            if entry is None or not entry.is_usable(now, min_ttl):
+                entry = await self._get_shared(key, token_type) if shared else None
+                tier = "shared"
+                if entry is not None and entry.is_usable(now, min_ttl):
+                    self._put_local(key, entry)
+                else:
+                    entry = None
+
+            if entry is not None:
+                token_broker_hits.add(1, {**attributes, "tier": tier})
+                if entry.needs_refresh(now, self._refresh_fraction, refresh_until):
+                    self._schedule_refresh(key, fetch, provider, shared)
+                return entry.token
+
+        token_broker_misses.add(1, attributes)
+        return await self._fetch_single_flight(key, fetch, provider, shared)
+
+    async def _fetch_single_flight(self, key: str, fetch: Callable[[], Awaitable[T]], provider: str, shared: bool) -> T:
+        """Fetch a token, joining an in-flight fetch for the same key if there is one.
+
+        The fetch runs as its own task so that a cancelled caller does not
+        cancel the request for everybody else waiting on it.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            token_broker_coalesced.add(1, {"provider": provider})
+        else:
+            task = asyncio.create_task(self._fetch_and_store(key, fetch, provider, shared))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._on_fetch_done(key, done))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, key: str, fetch: Callable[[], Awaitable[T]], provider: str, shared: bool) -> T:
+        with tracer.start_as_current_span("token_broker.fetch") as span:
+            span.set_attribute("token_broker.provider", provider)
+            token = await fetch()
+        entry = self._make_entry(token)
+        self._put_local(key, entry)
+        if shared:
+            await self._put_shared(key, entry)
+        return token
+
+    def _on_fetch_done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away
+            task.exception()
+
+    def _schedule_refresh(self, key: str, fetch: Callable[[], Awaitable[Any]], provider: str, shared: bool) -> None:
+        """Refresh a token in the background; the caller keeps using the current one."""
+        if key in self._refreshing or key in self._inflight:
+            return
+        self._refreshing.add(key)
+
+        async def refresh() -> None:
+            try:
+                await self._fetch_single_flight(key, fetch, provider, shared)
+                token_broker_refreshes.add(1, {"provider": provider, "status": "success"})
+            except Exception as e:
+                token_broker_refreshes.add(1, {"provider": provider, "status": "failure"})
+                logger.warning(f"Proactive token refresh failed for {provider}: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    # =========================================================================
+    # Local (LRU) tier
+    # =========================================================================
+
+    def _get_local(self, key: str) -> _CacheEntry | None:
+        entry = self._local.get(key)
+        if entry is not None:
+            self._local.move_to_end(key)
+        return entry
+
+    def _put_local(self, key: str, entry: _CacheEntry) -> None:
+        self._local[key] = entry
+        self._local.move_to_end(key)
+        while len(self._local) > self._max_local_entries:
+            self._local.popitem(last=False)
+            token_broker_evictions.add(1)
+
+    # =========================================================================
+    # Shared (Redis) tier
+    # =========================================================================
+
+    async def _get_shared(self, key: str, token_type: type[Any]) -> _CacheEntry | None:
+        if not self._cache_service:
+            return None
+        try:
+            data = await self._cache_service.client.get(f"{self._redis_key_prefix}{key}")
+            if not data:
+                return None
+            payload = json.loads(data)
+            return _CacheEntry(
+                token=self._deserialize_token(token_type, payload["token"]),
+                fetched_at=payload["fetched_at"],
+                expires_at=payload["expires_at"],
+            )
+        except Exception as e:
+            logger.warning(f"Token broker shared tier read failed: {e}")
+            return None
+
+    async def _put_shared(self, key: str, entry: _CacheEntry) -> None:
+        if not self._cache_service:
+            return
+        ttl = int(entry.expires_at - time.time())
+        if ttl <= 0:
+            return
+        try:
+            payload = {"token": self._serialize_token(entry.token), "fetched_at": entry.fetched_at, "expires_at": entry.expires_at}
+            await self._cache_service.client.set(f"{self._redis_key_prefix}{key}", json.dumps(payload), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Token broker shared tier write failed: {e}")
+
+    @staticmethod
+    def _make_entry(token: Any) -> _CacheEntry:
+        expires_at = getattr(token, "expires_at", None)
+        now = time.time()
+        return _CacheEntry(token=token, fetched_at=now, expires_at=expires_at.timestamp() if expires_at else now)
+
+    @staticmethod
+    def _serialize_token(token: Any) -> dict[str, Any]:
+        return {name: value.isoformat() if isinstance(value, datetime) else value for name, value in dataclasses.asdict(token).items()}
+
+    @staticmethod
+    def _deserialize_token(token_type: type[Any], data: dict[str, Any]) -> Any:
+        datetime_fields = {f.name for f in dataclasses.fields(token_type) if "datetime" in str(f.type)}
+        values = {name: datetime.fromisoformat(value) if name in datetime_fields and isinstance(value, str) else value for name, value in data.items()}
+        return token_type(**values)
+
+    # =========================================================================
+    # Invalidation and monitoring
+    # =========================================================================
+
+    def invalidate_local(self, predicate: Callable[[str], bool] | None = None) -> int:
+        """Remove tokens from the local tier.
+
+        Args:
+            predicate: Keys for which this returns True are removed (all keys if None)
+
+        Returns:
+            Number of entries removed
+        """
+        keys = [key for key in self._local if predicate is None or predicate(key)]
+        for key in keys:
+            del self._local[key]
+        return len(keys)
+
+    async def invalidate(self, pattern: str = "*", predicate: Callable[[str], bool] | None = None) -> int:
+        """Remove tokens from both tiers.
+
+        Args:
+            pattern: Redis glob pattern (relative to the broker prefix) for the shared tier
+            predicate: Local-tier key filter (all keys if None)
+
+        Returns:
+            Number of entries removed
+        """
+        count = self.invalidate_local(predicate)
+        if self._cache_service:
+            try:
+                keys = [key async for key in self._cache_service.client.scan_iter(f"{self._redis_key_prefix}{pattern}")]
+                if keys:
+                    await self._cache_service.client.delete(*keys)
+                    count += len(keys)
+            except Exception as e:
+                logger.warning(f"Token broker shared tier invalidation failed: {e}")
+        return count
+
+    def count_local(self, prefix: str = "") -> int:
+        """Count local-tier entries whose key starts with ``prefix``."""
+        return sum(1 for key in self._local if key.startswith(prefix))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get broker statistics for health checks."""
+        return {
+            "local_entries": len(self._local),
+            "max_local_entries": self._max_local_entries,
+            "inflight_fetches": len(self._inflight),
+            "pending_refreshes": len(self._refreshing),
+            "refresh_fraction": self._refresh_fraction,
+            "shared_tier": self._cache_service is not None,
+        }
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(builder: "WebApplicationBuilder") -> "WebApplicationBuilder":
+        """Configure and register the token broker.
+
+        Resolves RedisCacheService from the DI container if available.
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from application.settings import app_settings
+        from infrastructure.cache import RedisCacheService
+
+        log = logging.getLogger(__name__)
+        log.info("🔧 Configuring TokenBroker...")
+
+        cache_service: RedisCacheService | None = None
+        for desc in builder.services:
+            if desc.service_type == RedisCacheService and desc.singleton is not None:
+                cache_service = desc.singleton
+                break
+
+        broker = TokenBroker(
+            cache_service=cache_service,
+            max_local_entries=app_settings.token_broker_max_local_entries,
+            refresh_fraction=app_settings.token_broker_refresh_fraction,
+            default_min_ttl_seconds=app_settings.token_exchange_cache_ttl_buffer,
+        )
+        builder.services.add_singleton(TokenBroker, singleton=broker)
+        log.info("✅ TokenBroker configured")
+
+        return builder
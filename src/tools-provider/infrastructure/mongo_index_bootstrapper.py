@@ -0,0 +1,273 @@
+"""Startup creation and diagnostics of MongoDB read-model indexes.
+
+Each Motor repository declares the indexes its queries rely on in an
+``INDEXES`` class attribute, and optionally representative queries in
+``EXPLAIN_QUERIES``. MongoIndexBootstrapper is a HostedService that:
+- Creates the declared indexes at startup, one at a time, so an index that
+  conflicts with an existing one is logged and skipped instead of blocking
+  the others (TTL indexes whose expiry changed are updated with collMod)
+- Reports per-index usage counters (``$indexStats``)
+- Explains the representative queries, to check they are served by an
+  index rather than a collection scan
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from neuroglia.hosting.abstractions import HostedService
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+    from neuroglia.hosting.web import WebApplicationBuilder
+
+logger = logging.getLogger(__name__)
+
+# MongoDB error codes raised when an index with the same name or keys exists with other options
+_INDEX_CONFLICT_CODES = (85, 86)
+
+
+def collection_name_for(repository_type: type) -> str:
+    """Get the collection of a Motor read-model repository.
+
+    Mirrors the naming used by Neuroglia's DataAccessLayer.ReadModel:
+    lowercase entity type name without a trailing "dto".
+    """
+    for base in getattr(repository_type, "__orig_bases__", []):
+        origin = getattr(base, "__origin__", None)
+        if origin is not None and origin.__name__ == "MotorRepository":
+            name = base.__args__[0].__name__.lower()
+            return name[:-3] if name.endswith("dto") else name
+    raise ValueError(f"{repository_type.__name__} does not extend MotorRepository[TEntity, TKey]")
+
+
+class MongoIndexBootstrapper(HostedService):
+    """Hosted service ensuring the indexes declared by Motor repositories.
+
+    Implements HostedService for automatic lifecycle management:
+    - start_async(): Creates the indexes in the background (startup is not blocked)
+    - stop_async(): Cancels index creation if still running
+    """
+
+    def __init__(
+        self,
+        client: "AsyncIOMotorClient",
+        database_name: str,
+        repositories: dict[str, type],
+        ttl_overrides: dict[str, int] | None = None,
+    ):
+        """Initialize the bootstrapper.
+
+        Args:
+            client: Shared Motor client
+            database_name: Read-model database
+            repositories: Repository types keyed by collection name
+            ttl_overrides: expireAfterSeconds overrides keyed by index name
+        """
+        self._client = client
+        self._database_name = database_name
+        self._repositories = repositories
+        self._ttl_overrides = ttl_overrides or {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def _database(self) -> "AsyncIOMotorDatabase":
+        return self._client[self._database_name]
+
+    async def start_async(self) -> None:
+        """Create the declared indexes in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.ensure_indexes_async())
+
+    async def stop_async(self) -> None:
+        """Cancel index creation if it is still running."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def index_models(self, collection_name: str) -> list[IndexModel]:
+        """Get the indexes declared for a collection, with TTL overrides applied."""
+        models = []
+        for model in getattr(self._repositories[collection_name], "INDEXES", []):
+            name = model.document["name"]
+            if name in self._ttl_overrides and "expireAfterSeconds" in model.document:
+                keys = list(model.document["key"].items())
+                options = {k: v for k, v in model.document.items() if k not in ("key", "expireAfterSeconds")}
+                model = IndexModel(keys, expireAfterSeconds=self._ttl_overrides[name], **options)
+            models.append(model)
+        return models
+
+    async def ensure_indexes_async(self) -> dict[str, list[str]]:
+        """Create every declared index that does not exist yet.
+
+        Returns:
+            Names of the indexes ensured, keyed by collection
+        """
+        ensured: dict[str, list[str]] = {}
+        for collection_name in self._repositories:
+            collection = self._database[collection_name]
+            for model in self.index_models(collection_name):
+                name = model.document["name"]
+                try:
+                    await collection.create_indexes([model])
+                except OperationFailure as e:
+                    if e.code in _INDEX_CONFLICT_CODES and "expireAfterSeconds" in model.document and await self._update_ttl(collection_name, model):
+                        ensured.setdefault(collection_name, []).append(name)
+                        continue
+                    logger.warning(f"Could not create index {collection_name}.{name}: {e}")
+                    continue
+                except Exception as e:
+                    logger.warning(f"Could not create index {collection_name}.{name}: {e}")
+                    continue
+                ensured.setdefault(collection_name, []).append(name)
+
+        logger.info(f"✅ Ensured {sum(len(names) for names in ensured.values())} MongoDB indexes on {len(ensured)} collections")
+        return ensured
+
+    async def _update_ttl(self, collection_name: str, model: IndexModel) -> bool:
+        """Change the expiry of an existing TTL index in place."""
+        try:
+            await self._database.command(
+                {
+                    "collMod": collection_name,
+                    "index": {"name": model.document["name"], "expireAfterSeconds": model.document["expireAfterSeconds"]},
+                }
+            )
+            return True
+        except OperationFailure as e:
+            logger.warning(f"Could not update TTL of index {collection_name}.{model.document['name']}: {e}")
+            return False
+
+    # =========================================================================
+    # Diagnostics
+    # =========================================================================
+
+    async def get_index_usage_async(self) -> dict[str, list[dict[str, Any]]]:
+        """Get usage counters of every index, keyed by collection.
+
+        Counters are per mongod and reset when it restarts.
+        """
+        usage: dict[str, list[dict[str, Any]]] = {}
+        for collection_name in self._repositories:
+            declared = {model.document["name"] for model in self.index_models(collection_name)}
+            stats = []
+            async for entry in self._database[collection_name].aggregate([{"$indexStats": {}}]):
+                accesses = entry.get("accesses", {})
+                stats.append(
+                    {
+                        "name": entry.get("name"),
+                        "key": dict(entry.get("key", {})),
+                        "declared": entry.get("name") in declared,
+                        "ops": accesses.get("ops", 0),
+                        "since": accesses.get("since").isoformat() if accesses.get("since") else None,
+                    }
+                )
+            usage[collection_name] = sorted(stats, key=lambda s: s["name"] or "")
+        return usage
+
+    async def explain_queries_async(self) -> list[dict[str, Any]]:
+        """Explain the representative queries declared by the repositories."""
+        reports = []
+        for collection_name, repository_type in self._repositories.items():
+            for query_name, spec in getattr(repository_type, "EXPLAIN_QUERIES", {}).items():
+                command: dict[str, Any] = {"find": collection_name, "filter": spec.get("filter", {})}
+                if spec.get("sort"):
+                    command["sort"] = dict(spec["sort"])
+                try:
+                    explain = await self._database.command({"explain": command, "verbosity": "executionStats"})
+                    report = summarize_explain(explain)
+                except Exception as e:
+                    report = {"error": str(e)}
+                reports.append({"collection": collection_name, "query": query_name, **report})
+        return reports
+
+    # =========================================================================
+    # Service Configuration (Neuroglia Pattern)
+    # =========================================================================
+
+    @staticmethod
+    def configure(
+        builder: "WebApplicationBuilder",
+        repositories: list[type],
+        ttl_overrides: dict[str, int] | None = None,
+    ) -> "WebApplicationBuilder":
+        """Register the index bootstrapper as a singleton and HostedService.
+
+        Must be called after the read model is configured (it registers the
+        shared AsyncIOMotorClient).
+
+        Args:
+            builder: WebApplicationBuilder instance for service registration
+            repositories: Motor repository types declaring INDEXES
+            ttl_overrides: expireAfterSeconds overrides keyed by index name
+
+        Returns:
+            The builder instance for fluent chaining
+        """
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        from application.settings import app_settings
+
+        log = logging.getLogger(__name__)
+        if not app_settings.mongo_ensure_indexes:
+            log.info("⏭️ MongoIndexBootstrapper disabled")
+            return builder
+
+        client: AsyncIOMotorClient | None = None
+        for desc in builder.services:
+            if desc.service_type == AsyncIOMotorClient and desc.singleton is not None:
+                client = desc.singleton
+                break
+        if client is None:
+            log.warning("AsyncIOMotorClient not registered, MongoDB indexes will not be ensured")
+            return builder
+
+        bootstrapper = MongoIndexBootstrapper(
+            client=client,
+            database_name=app_settings.database_name,
+            repositories={collection_name_for(repository_type): repository_type for repository_type in repositories},
+            ttl_overrides=ttl_overrides,
+        )
+        builder.services.add_singleton(MongoIndexBootstrapper, singleton=bootstrapper)
+        builder.services.add_singleton(HostedService, singleton=bootstrapper)
+        log.info("✅ MongoIndexBootstrapper configured")
+
+        return builder
+
+
+def summarize_explain(explain: dict[str, Any]) -> dict[str, Any]:
+    """Reduce an ``explain`` result to the winning plan's stages, indexes and work done.
+
+    Handles both the classic and the slot-based (``queryPlan``) plan layouts.
+    """
+    winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+    winning_plan = winning_plan.get("queryPlan", winning_plan)
+
+    stages: list[str] = []
+    indexes: list[str] = []
+    pending = [winning_plan]
+    while pending:
+        stage = pending.pop()
+        if not stage:
+            continue
+        if "stage" in stage:
+            stages.append(stage["stage"])
+        if "indexName" in stage:
+            indexes.append(stage["indexName"])
+        if "inputStage" in stage:
+            pending.append(stage["inputStage"])
+        pending.extend(stage.get("inputStages", []))
+
+    stats = explain.get("executionStats", {})
+    return {
+        "stages": stages,
+        "indexes": indexes,
+        "collection_scan": "COLLSCAN" in stages,
+        "returned": stats.get("nReturned"),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "docs_examined": stats.get("totalDocsExamined"),
+        "execution_time_ms": stats.get("executionTimeMillis"),
+    }
@@ -10,6 +10,7 @@ from .source_dto import SourceDto
 from .source_tool_dto import SourceToolDto, SourceToolSummaryDto
 from .task_dto import TaskDto
 from .tool_group_dto import ToolGroupDto, ToolGroupSummaryDto
+from .tool_job_dto import ToolJobDto
 
 __all__ = [
     "TaskDto",
@@ -22,4 +23,5 @@ __all__ = [
     "AccessPolicySummaryDto",
     "LabelDto",
     "LabelSummaryDto",
+    "ToolJobDto",
 ]
@@ -4,12 +4,30 @@ This DTO is persisted in MongoDB and projected from domain events.
 It supports efficient queries for tool listing and filtering.
 """
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 from neuroglia.data.abstractions import Identifiable, queryable
 
+_NAME_WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+
+def tool_name_tokens(tool_name: str) -> list[str]:
+    """Split a tool name into lowercased words for prefix search.
+
+    Splits on any non-alphanumeric separator and on camelCase boundaries:
+    ``getUserByID`` and ``get_user-by id`` both give get, user, by, id.
+
+    Args:
+        tool_name: The tool name
+
+    Returns:
+        The distinct words, in order of appearance
+    """
+    return list(dict.fromkeys(word.lower() for word in _NAME_WORD.findall(tool_name)))
+
 
 @queryable
 @dataclass
@@ -20,7 +38,8 @@ class SourceToolDto(Identifiable[str]):
     - Filter by source_id to list tools for a source
     - Filter by is_enabled for admin management
     - Filter by status for active vs deprecated tools
-    - Search by name/tags for tool discovery
+    - Search by name/tags for tool discovery (name_lower and name_tokens
+      are derived from tool_name by the projection handlers)
     - Filter by label_ids for label-based filtering
     """
 
@@ -46,6 +65,10 @@ class SourceToolDto(Identifiable[str]):
     # Labels
     label_ids: list[str] = field(default_factory=list)
 
+    # Name search (anchored prefix queries on indexed, normalized fields)
+    name_lower: str = ""
+    name_tokens: list[str] = field(default_factory=list)
+
     # Audit trail
     discovered_at: datetime | None = None
     last_seen_at: datetime | None = None
@@ -0,0 +1,59 @@
+"""Tool job DTO for background execution of ASYNC_POLL tools.
+
+Unlike the other read models, this document is not a projection of an
+event-sourced aggregate: it is the job's own state, written by the
+ToolJobRunner on every poll (application/services/tool_job_runner.py).
+"""
+
+import datetime
+from dataclasses import dataclass, field
+from typing import Any
+
+from neuroglia.data.abstractions import Identifiable, queryable
+
+from domain.enums import ToolJobStatus
+
+
+@queryable
+@dataclass
+class ToolJobDto(Identifiable[str]):
+    """Persisted state of a background ASYNC_POLL tool execution.
+
+    The trigger request is sent in-request; this document tracks the
+    polling that follows until the upstream reports completion, failure
+    or the poll budget is exhausted.
+
+    Scheduling fields:
+    - next_poll_at: when the next status poll is due (epoch seconds)
+    - lease_owner / lease_expires_at: replica currently polling the job,
+      so a job is polled by one replica at a time and picked up by another
+      if that replica dies
+    - pinned_instance: replica holding the caller's token in memory, for
+      token-exchange jobs (tokens are never persisted)
+    """
+
+    id: str
+    tool_id: str
+    source_id: str
+    owner_id: str
+    status: ToolJobStatus
+    status_url: str
+    poll_config: dict[str, Any]
+    auth_mode: str
+    default_audience: str | None = None
+    required_scopes: list[str] = field(default_factory=list)
+
+    attempts: int = 0
+    interval_seconds: float = 1.0
+    next_poll_at: float = 0.0
+    pinned_instance: str | None = None
+    lease_owner: str | None = None
+    lease_expires_at: float = 0.0
+
+    result: Any = None
+    error: dict[str, Any] | None = None
+    upstream_status: int | None = None
+
+    created_at: datetime.datetime | None = None
+    updated_at: datetime.datetime | None = None
+    completed_at: datetime.datetime | None = None
@@ -10,6 +10,7 @@ from .motor_source_dto_repository import MotorSourceDtoRepository
 from .motor_source_tool_dto_repository import MotorSourceToolDtoRepository
 from .motor_task_dto_repository import MotorTaskDtoRepository
 from .motor_tool_group_dto_repository import MotorToolGroupDtoRepository
+from .motor_tool_job_dto_repository import MotorToolJobDtoRepository
 
 __all__ = [
     "MotorTaskDtoRepository",
@@ -18,4 +19,5 @@ __all__ = [
     "MotorToolGroupDtoRepository",
     "MotorAccessPolicyDtoRepository",
     "MotorLabelDtoRepository",
+    "MotorToolJobDtoRepository",
 ]
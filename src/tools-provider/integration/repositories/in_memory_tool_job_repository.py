@@ -0,0 +1,65 @@
+"""In-memory implementation of ToolJobDtoRepository."""
+
+from domain.enums import ToolJobStatus
+from domain.repositories import ToolJobDtoRepository
+from integration.models import ToolJobDto
+
+
+class InMemoryToolJobDtoRepository(ToolJobDtoRepository):
+    """In-memory implementation of ToolJobDtoRepository for testing."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._jobs: dict[str, ToolJobDto] = {}
+
+    async def contains_async(self, id: str) -> bool:
+        """Check whether a job exists."""
+        return id in self._jobs
+
+    async def get_async(self, id: str) -> ToolJobDto | None:
+        """Retrieve a job by ID."""
+        return self._jobs.get(id)
+
+    async def _do_add_async(self, entity: ToolJobDto) -> ToolJobDto:
+        """Add a new job."""
+        self._jobs[entity.id] = entity
+        return entity
+
+    async def _do_update_async(self, entity: ToolJobDto) -> ToolJobDto:
+        """Update an existing job."""
+        self._jobs[entity.id] = entity
+        return entity
+
+    async def _do_remove_async(self, id: str) -> None:
+        """Delete a job by ID."""
+        self._jobs.pop(id, None)
+
+    async def get_running_ids_async(self, job_ids: list[str]) -> list[str]:
+        """Get which of the given jobs are still running."""
+        return [job_id for job_id in job_ids if job_id in self._jobs and self._jobs[job_id].status == ToolJobStatus.RUNNING]
+
+    async def claim_due_async(
+        self,
+        instance_id: str,
+        now: float,
+        lease_seconds: float,
+        limit: int,
+        orphan_after_seconds: float,
+    ) -> list[ToolJobDto]:
+        """Lease running jobs whose next poll is due, oldest due first."""
+        due = sorted(
+            (
+                job
+                for job in self._jobs.values()
+                if job.status == ToolJobStatus.RUNNING
+                and job.next_poll_at <= now
+                and (job.lease_owner is None or job.lease_expires_at <= now)
+                and (job.pinned_instance in (None, instance_id) or job.next_poll_at <= now - orphan_after_seconds)
+            ),
+            key=lambda job: job.next_poll_at,
+        )
+        claimed = due[:limit]
+        for job in claimed:
+            job.lease_owner = instance_id
+            job.lease_expires_at = now + lease_seconds
+        return claimed
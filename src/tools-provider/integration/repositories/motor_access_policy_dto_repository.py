@@ -1,8 +1,10 @@
 """MongoDB repository implementation for AccessPolicyDto read model."""
 
 import re
+from typing import Any, ClassVar
 
 from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from domain.repositories.access_policy_dto_repository import AccessPolicyDtoRepository
 from integration.models.access_policy_dto import AccessPolicyDto
@@ -23,8 +25,24 @@ class MotorAccessPolicyDtoRepository(MotorRepository[AccessPolicyDto, str], Acce
        (see notes/NEUROGLIA_MOTORQUERY_CHAINING_BUG.md)
     2. find_async() with sort - not supported
        (see notes/NEUROGLIA_MOTORREPOSITORY_FIND_ENHANCEMENT.md)
+
+    Indexes (created at startup by MongoIndexBootstrapper):
+    - id (unique)
+    - is_active + priority (policy evaluation)
+    - allowed_group_ids + priority + name (multikey, group impact lookups)
     """
 
+    INDEXES: ClassVar[list[IndexModel]] = [
+        IndexModel([("id", ASCENDING)], name="id", unique=True),
+        IndexModel([("is_active", ASCENDING), ("priority", DESCENDING)], name="active_priority"),
+        IndexModel([("allowed_group_ids", ASCENDING), ("priority", DESCENDING), ("name", ASCENDING)], name="group_priority_name"),
+    ]
+
+    EXPLAIN_QUERIES: ClassVar[dict[str, dict[str, Any]]] = {
+        "active_policies": {"filter": {"is_active": True}, "sort": [("priority", -1)]},
+        "policies_by_group": {"filter": {"allowed_group_ids": ""}, "sort": [("priority", -1), ("name", 1)]},
+    }
+
     async def _find_with_options(
         self,
         filter_dict: dict,
@@ -1,6 +1,9 @@
 """MongoDB repository implementation for LabelDto read model."""
 
+from typing import Any, ClassVar
+
 from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, IndexModel
 
 from domain.repositories.label_dto_repository import LabelDtoRepository
 from integration.models.label_dto import LabelDto
@@ -15,8 +18,21 @@ class MotorLabelDtoRepository(MotorRepository[LabelDto, str], LabelDtoRepository
 
     This follows CQRS: Query handlers use this repository to query the read model,
     while command handlers use EventSourcingRepository for the write model.
+
+    Indexes (created at startup by MongoIndexBootstrapper):
+    - id (unique)
+    - is_deleted + name (listing)
     """
 
+    INDEXES: ClassVar[list[IndexModel]] = [
+        IndexModel([("id", ASCENDING)], name="id", unique=True),
+        IndexModel([("is_deleted", ASCENDING), ("name", ASCENDING)], name="deleted_name"),
+    ]
+
+    EXPLAIN_QUERIES: ClassVar[dict[str, dict[str, Any]]] = {
+        "labels": {"filter": {"is_deleted": False}, "sort": [("name", 1)]},
+    }
+
     async def get_all_async(self, include_deleted: bool = False) -> list[LabelDto]:
         """Retrieve all labels from the read model.
 
@@ -1,6 +1,9 @@
 """MongoDB repository implementation for SourceDto read model."""
 
+from typing import Any, ClassVar
+
 from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from domain.enums import HealthStatus
 from domain.repositories.source_dto_repository import SourceDtoRepository
@@ -22,8 +25,26 @@ class MotorSourceDtoRepository(MotorRepository[SourceDto, str], SourceDtoReposit
        (see notes/NEUROGLIA_MOTORQUERY_CHAINING_BUG.md)
     2. find_async() with sort - not supported
        (see notes/NEUROGLIA_MOTORREPOSITORY_FIND_ENHANCEMENT.md)
+
+    Indexes (created at startup by MongoIndexBootstrapper):
+    - id (unique)
+    - is_enabled + name, source_type + name (listings)
+    - health_status + updated_at, health_status + consecutive_failures (health checks)
     """
 
+    INDEXES: ClassVar[list[IndexModel]] = [
+        IndexModel([("id", ASCENDING)], name="id", unique=True),
+        IndexModel([("is_enabled", ASCENDING), ("name", ASCENDING)], name="enabled_name"),
+        IndexModel([("source_type", ASCENDING), ("name", ASCENDING)], name="type_name"),
+        IndexModel([("health_status", ASCENDING), ("updated_at", ASCENDING)], name="health_updated"),
+        IndexModel([("health_status", ASCENDING), ("consecutive_failures", DESCENDING)], name="health_failures"),
+    ]
+
+    EXPLAIN_QUERIES: ClassVar[dict[str, dict[str, Any]]] = {
+        "enabled_sources": {"filter": {"is_enabled": True}, "sort": [("name", 1)]},
+        "unhealthy_sources": {"filter": {"health_status": {"$in": ["degraded", "unhealthy"]}}, "sort": [("consecutive_failures", -1)]},
+    }
+
     async def _find_with_options(
         self,
         filter_dict: dict,
@@ -1,10 +1,18 @@
 """MongoDB repository implementation for SourceToolDto read model."""
 
+import logging
+import re
+from typing import Any, ClassVar
+
 from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
 
 from domain.repositories.source_tool_dto_repository import SourceToolDtoRepository
 from integration.models.source_tool_dto import SourceToolDto, SourceToolSummaryDto
 
+logger = logging.getLogger(__name__)
+
 
 class MotorSourceToolDtoRepository(MotorRepository[SourceToolDto, str], SourceToolDtoRepository):
     """MongoDB-based repository for SourceToolDto read model queries.
@@ -16,8 +24,40 @@ class MotorSourceToolDtoRepository(MotorRepository[SourceToolDto, str], SourceTo
     while command handlers use EventSourcingRepository for the write model.
 
     Uses find_async() with sort/limit/skip options for querying.
+
+    Indexes (created at startup by MongoIndexBootstrapper):
+    - id (unique)
+    - source_id + is_enabled + status + tool_name (per-source listing)
+    - is_enabled + status + tool_name (enabled tools, summaries)
+    - name_lower and name_tokens (case-insensitive name and word prefix search)
+    - updated_at (ToolSearchIndex refresh of recently changed tools)
+    - text on tool_name, tags and description (search)
     """
 
+    INDEXES: ClassVar[list[IndexModel]] = [
+        IndexModel([("id", ASCENDING)], name="id", unique=True),
+        IndexModel([("source_id", ASCENDING), ("is_enabled", ASCENDING), ("status", ASCENDING), ("tool_name", ASCENDING)], name="source_enabled_status_name"),
+        IndexModel([("is_enabled", ASCENDING), ("status", ASCENDING), ("tool_name", ASCENDING)], name="enabled_status_name"),
+        IndexModel([("name_lower", ASCENDING)], name="name_lower"),
+        IndexModel([("name_tokens", ASCENDING)], name="name_tokens"),
+        IndexModel([("updated_at", ASCENDING)], name="updated_at"),
+        IndexModel(
+            [("tool_name", TEXT), ("tags", TEXT), ("description", TEXT)],
+            name="tool_text",
+            weights={"tool_name": 10, "tags": 5, "description": 1},
+            default_language="english",
+        ),
+    ]
+
+    EXPLAIN_QUERIES: ClassVar[dict[str, dict[str, Any]]] = {
+        "tools_by_source": {"filter": {"source_id": "", "is_enabled": True, "status": "active"}, "sort": [("tool_name", 1)]},
+        "enabled_tools": {"filter": {"is_enabled": True, "status": "active"}, "sort": [("tool_name", 1)]},
+        "tools_by_id": {"filter": {"id": {"$in": [""]}}},
+        "search_by_name_prefix": {"filter": {"name_lower": {"$regex": "^get"}, "is_enabled": True, "status": "active"}},
+        "search_by_name_word": {"filter": {"name_tokens": {"$regex": "^user"}, "is_enabled": True, "status": "active"}},
+        "search_text": {"filter": {"$text": {"$search": "get"}, "is_enabled": True, "status": "active"}},
+    }
+
     async def get_by_source_id_async(
         self,
         source_id: str,
@@ -85,6 +125,16 @@ class MotorSourceToolDtoRepository(MotorRepository[SourceToolDto, str], SourceTo
     ) -> list[SourceToolDto]:
         """Search tools by name, description, or tags.
 
+        Tools whose name, or one of its words, starts with the query
+        (case-insensitive, e.g. "user" finds getUserById and list_users)
+        come first, followed by full-text matches on name, tags and
+        description ranked by relevance. Both lookups are served by indexes;
+        if the text index is missing, falls back to an escaped
+        case-insensitive regex scan.
+
+        Tools projected before name_lower existed are matched on their
+        name with a case-insensitive regex until they are projected again.
+
         Args:
             query: Search query (matches name, description)
             source_id: Optional filter by source
@@ -95,12 +145,7 @@ class MotorSourceToolDtoRepository(MotorRepository[SourceToolDto, str], SourceTo
             List of matching tools
         """
         # Build MongoDB query
-        mongo_query: dict = {
-            "$or": [
-                {"tool_name": {"$regex": query, "$options": "i"}},
-                {"description": {"$regex": query, "$options": "i"}},
-            ]
-        }
+        mongo_query: dict = {}
 
         if source_id:
             mongo_query["source_id"] = source_id
@@ -115,11 +160,37 @@ class MotorSourceToolDtoRepository(MotorRepository[SourceToolDto, str], SourceTo
         mongo_query["status"] = "active"
 
         collection = self.collection
-        cursor = collection.find(mongo_query).sort("tool_name", 1)
+        results: list[SourceToolDto] = []
+        seen: set[str] = set()
+
+        def collect(doc: dict) -> None:
+            tool = self._deserialize(doc)
+            if tool.id not in seen:
+                seen.add(tool.id)
+                results.append(tool)
+
+        prefix = re.escape(query.strip().lower())
+        name_filter = {
+            "$or": [
+                {"name_lower": {"$regex": f"^{prefix}"}},
+                {"name_tokens": {"$regex": f"^{prefix}"}},
+                {"name_lower": {"$in": [None, ""]}, "tool_name": {"$regex": prefix, "$options": "i"}},
+            ]
+        }
+        async for doc in collection.find({**mongo_query, **name_filter}).sort("tool_name", 1):
+            collect(doc)
+
+        try:
+            cursor = collection.find({**mongo_query, "$text": {"$search": query}}, {"score": {"$meta": "textScore"}})
+            async for doc in cursor.sort([("score", {"$meta": "textScore"}), ("tool_name", ASCENDING)]):
+                doc.pop("score", None)
+                collect(doc)
+        except OperationFailure as e:
+            logger.warning(f"Text search unavailable, falling back to regex scan: {e}")
+            fallback = {**mongo_query, "$or": [{"tool_name": {"$regex": prefix, "$options": "i"}}, {"description": {"$regex": prefix, "$options": "i"}}]}
+            async for doc in collection.find(fallback).sort("tool_name", 1):
+                collect(doc)
 
-        results = []
-        async for doc in cursor:
-            results.append(self._deserialize(doc))
         return results
 
     async def get_summaries_async(
@@ -276,6 +347,8 @@ class MotorSourceToolDtoRepository(MotorRepository[SourceToolDto, str], SourceTo
             is_enabled=doc.get("is_enabled", True),
             status=doc.get("status", "active"),
             label_ids=doc.get("label_ids", []),
+            name_lower=doc.get("name_lower", ""),
+            name_tokens=doc.get("name_tokens", []),
             discovered_at=doc.get("discovered_at"),
             last_seen_at=doc.get("last_seen_at"),
             updated_at=doc.get("updated_at"),
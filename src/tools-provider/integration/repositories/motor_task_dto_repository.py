@@ -1,6 +1,9 @@
 """MongoDB repository implementation for TaskDto read model."""
 
+from typing import ClassVar
+
 from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, IndexModel
 
 from domain.repositories.task_dto_repository import TaskDtoRepository
 from integration.models.task_dto import TaskDto
@@ -15,8 +18,18 @@ class MotorTaskDtoRepository(MotorRepository[TaskDto, str], TaskDtoRepository):
 
     This follows CQRS: Query handlers use this repository to query the read model,
     while command handlers use EventSourcingRepository for the write model.
+
+    Indexes (created at startup by MongoIndexBootstrapper):
+    - id (unique)
+    - assignee_id + created_at, department + created_at
     """
 
+    INDEXES: ClassVar[list[IndexModel]] = [
+        IndexModel([("id", ASCENDING)], name="id", unique=True),
+        IndexModel([("assignee_id", ASCENDING), ("created_at", ASCENDING)], name="assignee_created"),
+        IndexModel([("department", ASCENDING), ("created_at", ASCENDING)], name="department_created"),
+    ]
+
     async def get_all_async(self) -> list[TaskDto]:
         """Retrieve all tasks from MongoDB.
 
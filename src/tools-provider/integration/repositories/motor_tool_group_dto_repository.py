@@ -1,6 +1,9 @@
 """MongoDB repository implementation for ToolGroupDto read model."""
 
+from typing import Any, ClassVar
+
 from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, IndexModel
 
 from domain.repositories.tool_group_dto_repository import ToolGroupDtoRepository
 from integration.models.tool_group_dto import ToolGroupDto
@@ -21,8 +24,25 @@ class MotorToolGroupDtoRepository(MotorRepository[ToolGroupDto, str], ToolGroupD
        (see notes/NEUROGLIA_MOTORQUERY_CHAINING_BUG.md)
     2. find_async() with sort - not supported
        (see notes/NEUROGLIA_MOTORREPOSITORY_FIND_ENHANCEMENT.md)
+
+    Indexes (created at startup by MongoIndexBootstrapper):
+    - id (unique)
+    - is_active + name (active groups)
+    - explicit_tool_ids.tool_id, excluded_tool_ids.tool_id (multikey, tool membership)
     """
 
+    INDEXES: ClassVar[list[IndexModel]] = [
+        IndexModel([("id", ASCENDING)], name="id", unique=True),
+        IndexModel([("is_active", ASCENDING), ("name", ASCENDING)], name="active_name"),
+        IndexModel([("explicit_tool_ids.tool_id", ASCENDING)], name="explicit_tool_id"),
+        IndexModel([("excluded_tool_ids.tool_id", ASCENDING)], name="excluded_tool_id"),
+    ]
+
+    EXPLAIN_QUERIES: ClassVar[dict[str, dict[str, Any]]] = {
+        "active_groups": {"filter": {"is_active": True}, "sort": [("name", 1)]},
+        "groups_containing_tool": {"filter": {"explicit_tool_ids": {"$elemMatch": {"tool_id": ""}}}, "sort": [("name", 1)]},
+    }
+
     async def _find_with_options(
         self,
         filter_dict: dict,
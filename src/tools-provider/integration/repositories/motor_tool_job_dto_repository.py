@@ -0,0 +1,67 @@
+"""MongoDB repository implementation for background tool jobs."""
+
+from typing import Any, ClassVar
+
+from neuroglia.data.infrastructure.mongo import MotorRepository
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+
+from domain.enums import ToolJobStatus
+from domain.repositories.tool_job_dto_repository import ToolJobDtoRepository
+from integration.models.tool_job_dto import ToolJobDto
+
+
+class MotorToolJobDtoRepository(MotorRepository[ToolJobDto, str], ToolJobDtoRepository):
+    """
+    MongoDB-based repository for background tool jobs.
+
+    Extends Neuroglia's MotorRepository for standard CRUD operations and
+    implements the lease-based claiming used by ToolJobRunner with
+    find_one_and_update, so concurrent replicas never claim the same job.
+
+    Indexes (created at startup by MongoIndexBootstrapper):
+    - id (unique)
+    - status + next_poll_at (claiming due jobs)
+    - completed_at (TTL: finished jobs are purged after the retention period)
+    """
+
+    INDEXES: ClassVar[list[IndexModel]] = [
+        IndexModel([("id", ASCENDING)], name="id", unique=True),
+        IndexModel([("status", ASCENDING), ("next_poll_at", ASCENDING)], name="status_next_poll"),
+        IndexModel([("completed_at", ASCENDING)], name="completed_at_ttl", expireAfterSeconds=7 * 24 * 3600),
+    ]
+
+    EXPLAIN_QUERIES: ClassVar[dict[str, dict[str, Any]]] = {
+        "due_jobs": {"filter": {"status": "running", "next_poll_at": {"$lte": 0}}, "sort": [("next_poll_at", 1)]},
+    }
+
+    async def get_running_ids_async(self, job_ids: list[str]) -> list[str]:
+        """Get which of the given jobs are still running."""
+        cursor = self.collection.find({"id": {"$in": job_ids}, "status": ToolJobStatus.RUNNING.value}, projection={"id": 1})
+        return [doc["id"] async for doc in cursor]
+
+    async def claim_due_async(
+        self,
+        instance_id: str,
+        now: float,
+        lease_seconds: float,
+        limit: int,
+        orphan_after_seconds: float,
+    ) -> list[ToolJobDto]:
+        """Atomically lease running jobs whose next poll is due, oldest due first."""
+        filter_dict = {
+            "status": ToolJobStatus.RUNNING.value,
+            "next_poll_at": {"$lte": now},
+            "$and": [
+                {"$or": [{"lease_owner": None}, {"lease_expires_at": {"$lte": now}}]},
+                {"$or": [{"pinned_instance": None}, {"pinned_instance": instance_id}, {"next_poll_at": {"$lte": now - orphan_after_seconds}}]},
+            ],
+        }
+        update = {"$set": {"lease_owner": instance_id, "lease_expires_at": now + lease_seconds}}
+
+        claimed = []
+        for _ in range(limit):
+            doc = await self.collection.find_one_and_update(filter_dict, update, sort=[("next_poll_at", 1)], return_document=ReturnDocument.AFTER)
+            if doc is None:
+                break
+            claimed.append(self._deserialize_entity(doc))
+        return claimed
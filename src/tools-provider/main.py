@@ -18,10 +18,11 @@ from neuroglia.serialization.json import JsonSerializer
 
 from api.services import DualAuthService
 from api.services.openapi_config import configure_api_openapi, configure_mounted_apps_openapi_prefix
-from application.services import McpToolExecutor, ToolExecutor, configure_logging
+from application.services import InventoryRefreshScheduler, McpToolExecutor, ToolExecutor, ToolJobRunner, ToolResponseCache, ToolSearchIndex, configure_logging
+from application.services.builtin_tools import CachingHttpClient, PythonSandboxPool, WorkspaceJanitor
 from application.settings import app_settings
-from domain.repositories import AccessPolicyDtoRepository, LabelDtoRepository, SourceDtoRepository, SourceToolDtoRepository, TaskDtoRepository, ToolGroupDtoRepository
-from infrastructure import CircuitBreakerEventPublisher, KeycloakTokenExchanger, RedisCacheService, SourceSecretsStore
+from domain.repositories import AccessPolicyDtoRepository, LabelDtoRepository, SourceDtoRepository, SourceToolDtoRepository, TaskDtoRepository, ToolGroupDtoRepository, ToolJobDtoRepository
+from infrastructure import CircuitBreakerEventPublisher, KeycloakTokenExchanger, MongoIndexBootstrapper, RedisCacheService, RedisCircuitBreakerStore, SourceSecretsStore, TokenBroker
 from integration.repositories import (
     MotorAccessPolicyDtoRepository,
     MotorLabelDtoRepository,
@@ -29,6 +30,7 @@ from integration.repositories import (
     MotorSourceToolDtoRepository,
     MotorTaskDtoRepository,
     MotorToolGroupDtoRepository,
+    MotorToolJobDtoRepository,
 )
 
 configure_logging(log_level=app_settings.log_level)
@@ -53,9 +55,17 @@ def create_app() -> FastAPI:
     # Order matters - dependencies resolved from DI in sequence
     RedisCacheService.configure(builder)  # Cache service (database 1, isolated from sessions)
     CircuitBreakerEventPublisher.configure(builder)  # Event publisher for circuit breaker state changes
-    KeycloakTokenExchanger.configure(builder)  # Token exchange (depends on RedisCacheService, CircuitBreakerEventPublisher)
-    ToolExecutor.configure(builder)  # Tool execution (depends on KeycloakTokenExchanger)
+    TokenBroker.configure(builder)  # Shared upstream token cache (depends on RedisCacheService)
+    RedisCircuitBreakerStore.configure(builder)  # Optional cluster-shared circuit breaker state (depends on RedisCacheService)
+    KeycloakTokenExchanger.configure(builder)  # Token exchange (depends on TokenBroker, CircuitBreakerEventPublisher, RedisCircuitBreakerStore)
+    ToolResponseCache.configure(builder)  # Opt-in response cache for idempotent tools (depends on RedisCacheService)
+    ToolExecutor.configure(builder)  # Tool execution (depends on KeycloakTokenExchanger, TokenBroker, ToolResponseCache)
     McpToolExecutor.configure(builder)  # MCP tool execution (for MCP protocol tools)
+    WorkspaceJanitor.configure(builder)  # Background sweep of expired workspace files
+    CachingHttpClient.configure(builder)  # Pooled client and response cache of the fetch tools (depends on RedisCacheService)
+    PythonSandboxPool.configure(builder)  # Pre-warmed worker processes of execute_python
+    InventoryRefreshScheduler.configure(builder)  # Background source refresh (depends on RedisCacheService)
+    ToolJobRunner.configure(builder)  # Background polling of ASYNC_POLL tools (depends on ToolExecutor, RedisCacheService)
 
     # Configure core services
     Mediator.configure(builder, ["application.commands", "application.queries", "application.events.domain", "application.events.integration"])
@@ -71,18 +81,26 @@ def create_app() -> FastAPI:
         consumer_group=app_settings.consumer_group,
         delete_mode=DeleteMode.HARD,
     ).configure(builder, ["domain.entities"])
+    read_model_repositories: dict[type, type] = {
+        TaskDtoRepository: MotorTaskDtoRepository,
+        SourceDtoRepository: MotorSourceDtoRepository,
+        SourceToolDtoRepository: MotorSourceToolDtoRepository,
+        ToolGroupDtoRepository: MotorToolGroupDtoRepository,
+        AccessPolicyDtoRepository: MotorAccessPolicyDtoRepository,
+        LabelDtoRepository: MotorLabelDtoRepository,
+        ToolJobDtoRepository: MotorToolJobDtoRepository,
+    }
     DataAccessLayer.ReadModel(
         database_name=app_settings.database_name,
         repository_type="motor",
-        repository_mappings={
-            TaskDtoRepository: MotorTaskDtoRepository,
-            SourceDtoRepository: MotorSourceDtoRepository,
-            SourceToolDtoRepository: MotorSourceToolDtoRepository,
-            ToolGroupDtoRepository: MotorToolGroupDtoRepository,
-            AccessPolicyDtoRepository: MotorAccessPolicyDtoRepository,
-            LabelDtoRepository: MotorLabelDtoRepository,
-        },
+        repository_mappings=read_model_repositories,
     ).configure(builder, ["integration.models", "application.events.domain"])
+    MongoIndexBootstrapper.configure(  # Read-model indexes (depends on the read model's AsyncIOMotorClient)
+        builder,
+        list(read_model_repositories.values()),
+        ttl_overrides={"completed_at_ttl": app_settings.tool_jobs_retention_seconds},
+    )
+    ToolSearchIndex.configure(builder)  # In-memory catalog search, loaded from the read model (depends on the AsyncIOMotorClient)
 
     # Configure authentication services (session store + auth service)
     DualAuthService.configure(builder)
@@ -14,6 +14,8 @@ from .metrics import (
     agent_resolution_time,
     agent_tools_resolved,
     circuit_breaker_opens,
+    inventory_refresh_lag,
+    inventory_refresh_runs,
     source_processing_time,
     source_refresh_failures,
     sources_deleted,
@@ -23,12 +25,18 @@ from .metrics import (
     tasks_completed,
     tasks_created,
     tasks_failed,
+    token_broker_coalesced,
+    token_broker_evictions,
+    token_broker_hits,
+    token_broker_misses,
+    token_broker_refreshes,
     token_exchange_cache_hits,
     token_exchange_cache_misses,
     token_exchange_count,
     token_exchange_errors,
     tool_execution_count,
     tool_execution_errors,
+    tool_execution_stage_time,
     tool_execution_time,
     tool_group_processing_time,
     tool_group_resolution_time,
@@ -43,7 +51,13 @@ from .metrics import (
     tool_groups_deactivated,
     tool_groups_deleted,
     tool_groups_updated,
+    tool_job_polls,
+    tool_jobs_finished,
     tool_processing_time,
+    tool_response_cache_hits,
+    tool_response_cache_misses,
+    tool_response_cache_revalidations,
+    tool_search_time,
     tools_deleted,
     tools_deprecated,
     tools_disabled,
@@ -104,6 +118,7 @@ __all__ = [
     "tool_execution_count",
     "tool_execution_errors",
     "tool_execution_time",
+    "tool_execution_stage_time",
     "token_exchange_count",
     "token_exchange_errors",
     "token_exchange_cache_hits",
@@ -111,4 +126,22 @@ __all__ = [
     "circuit_breaker_opens",
     "upstream_request_count",
     "upstream_request_time",
+    # Token broker metrics
+    "token_broker_hits",
+    "token_broker_misses",
+    "token_broker_coalesced",
+    "token_broker_refreshes",
+    "token_broker_evictions",
+    # Inventory refresh scheduler metrics
+    "inventory_refresh_runs",
+    "inventory_refresh_lag",
+    # Tool response cache metrics
+    "tool_response_cache_hits",
+    "tool_response_cache_misses",
+    "tool_response_cache_revalidations",
+    # Tool job runner metrics
+    "tool_job_polls",
+    "tool_jobs_finished",
+    # Tool search metrics
+    "tool_search_time",
 ]
@@ -297,6 +297,12 @@ tool_execution_time = meter.create_histogram(
     unit="ms",
 )
 
+tool_execution_stage_time = meter.create_histogram(
+    name="tools_provider.execution.stage_time",
+    description="Sampled tool execution time by stage (validation, token, render, circuit, connect, ttfb, download, parse), source and tool",
+    unit="ms",
+)
+
 token_exchange_count = meter.create_counter(
     name="tools_provider.token_exchange.count",
     description="Total token exchange operations",
@@ -338,3 +344,101 @@ upstream_request_time = meter.create_histogram(
     description="Upstream HTTP request latency",
     unit="ms",
 )
+
+# =============================================================================
+# TOKEN BROKER METRICS
+# =============================================================================
+
+token_broker_hits = meter.create_counter(
+    name="tools_provider.token_broker.hits",
+    description="Token broker cache hits by tier (local, shared)",
+    unit="1",
+)
+
+token_broker_misses = meter.create_counter(
+    name="tools_provider.token_broker.misses",
+    description="Token broker cache misses (token fetched from the IDP)",
+    unit="1",
+)
+
+token_broker_coalesced = meter.create_counter(
+    name="tools_provider.token_broker.coalesced",
+    description="Token requests that joined an in-flight fetch for the same key",
+    unit="1",
+)
+
+token_broker_refreshes = meter.create_counter(
+    name="tools_provider.token_broker.refreshes",
+    description="Proactive background token refreshes by status",
+    unit="1",
+)
+
+token_broker_evictions = meter.create_counter(
+    name="tools_provider.token_broker.evictions",
+    description="Tokens evicted from the local LRU tier",
+    unit="1",
+)
+
+# =============================================================================
+# INVENTORY REFRESH SCHEDULER METRICS
+# =============================================================================
+
+inventory_refresh_runs = meter.create_counter(
+    name="tools_provider.inventory_refresh.runs",
+    description="Scheduled inventory refreshes by status (success, failed, skipped)",
+    unit="1",
+)
+
+inventory_refresh_lag = meter.create_histogram(
+    name="tools_provider.inventory_refresh.lag",
+    description="Delay between a scheduled refresh being due and starting",
+    unit="s",
+)
+
+# =============================================================================
+# TOOL RESPONSE CACHE METRICS
+# =============================================================================
+
+tool_response_cache_hits = meter.create_counter(
+    name="tools_provider.tool_response_cache.hits",
+    description="Tool responses served from cache by tool, tier (local, shared) and freshness (fresh, stale)",
+    unit="1",
+)
+
+tool_response_cache_misses = meter.create_counter(
+    name="tools_provider.tool_response_cache.misses",
+    description="Cacheable tool calls that went to the upstream, by tool",
+    unit="1",
+)
+
+tool_response_cache_revalidations = meter.create_counter(
+    name="tools_provider.tool_response_cache.revalidations",
+    description="Background refreshes of stale tool responses by tool and status",
+    unit="1",
+)
+
+# =============================================================================
+# TOOL JOB RUNNER METRICS
+# =============================================================================
+
+tool_job_polls = meter.create_counter(
+    name="tools_provider.tool_jobs.polls",
+    description="Status polls of background ASYNC_POLL jobs by outcome (pending, completed, failed, error)",
+    unit="1",
+)
+
+tool_jobs_finished = meter.create_counter(
+    name="tools_provider.tool_jobs.finished",
+    description="Background ASYNC_POLL jobs reaching a terminal state by status and error code",
+    unit="1",
+)
+
+# =============================================================================
+# TOOL SEARCH METRICS
+# =============================================================================
+
+tool_search_time = meter.create_histogram(
+    name="tools_provider.tool_search.time",
+    description="Time to rank catalog search results by backend (index, mongo)",
+    unit="ms",
+)
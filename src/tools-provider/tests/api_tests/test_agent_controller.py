@@ -0,0 +1,199 @@
+"""Tests for Agent API controller."""
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from neuroglia.core import OperationResult
+
+from api.controllers.agent_controller import AgentController, ToolCallBatchRequest, ToolCallRequest
+from application.commands import ExecuteToolCommand
+from application.queries import ToolManifestEntry
+
+
+def make_result(status: int, data: Any) -> MagicMock:
+    result = MagicMock(spec=OperationResult)
+    result.status = status
+    result.data = data
+    result.errors = []
+    return result
+
+
+def make_tool(tool_id: str, name: str) -> ToolManifestEntry:
+    return ToolManifestEntry(
+        tool_id=tool_id,
+        name=name,
+        description=name,
+        input_schema={"type": "object"},
+        source_id=tool_id.split(":")[0],
+        source_path="/",
+    )
+
+
+def make_http_request(accept: str = "application/x-ndjson", token: str = "user-jwt") -> MagicMock:  # nosec B107
+    request = MagicMock()
+    request.headers = {"Authorization": f"Bearer {token}", "Accept": accept}
+    return request
+
+
+async def read_body(response: Any) -> str:
+    return "".join([chunk async for chunk in response.body_iterator])
+
+
+class TestAgentControllerBatch:
+    """Test POST /agent/tools/call/batch."""
+
+    @pytest.fixture
+    def mock_mediator(self) -> MagicMock:
+        """Create a mock mediator resolving two tools and echoing executions."""
+        tools = [make_tool("src:get_users", "get_users"), make_tool("src:get_orders", "get_orders")]
+        delays = {"src:get_users": 0.05, "src:get_orders": 0.0}
+
+        async def execute_async(request: Any) -> MagicMock:
+            if isinstance(request, ExecuteToolCommand):
+                await asyncio.sleep(delays[request.tool_id])
+                return make_result(200, {"tool_id": request.tool_id, "status": "completed", "result": request.arguments})
+            return make_result(200, tools)
+
+        mock = MagicMock()
+        mock.execute_async = AsyncMock(side_effect=execute_async)
+        return mock
+
+    @pytest.fixture
+    def controller(self, mock_mediator: MagicMock) -> AgentController:
+        """Create an AgentController with mocked dependencies."""
+        return AgentController(service_provider=MagicMock(), mapper=MagicMock(), mediator=mock_mediator)
+
+    @pytest.mark.asyncio
+    async def test_results_stream_as_ndjson_in_completion_order(self, controller: AgentController, mock_mediator: MagicMock) -> None:
+        """Test each call yields one line tagged with its index, followed by a summary."""
+        batch = ToolCallBatchRequest(calls=[ToolCallRequest(tool_id="src:get_users", arguments={"page": 1}), ToolCallRequest(name="get_orders")])
+
+        response = await controller.execute_tools_batch(batch, make_http_request(), user={"sub": "u1"})
+        lines = [json.loads(line) for line in (await read_body(response)).splitlines()]
+
+        assert response.media_type == "application/x-ndjson"
+        assert [line.get("index") for line in lines[:2]] == [1, 0]
+        assert lines[1]["result"] == {"page": 1}
+        assert lines[2]["done"] is True
+        assert lines[2]["succeeded"] == 2
+        # Access is resolved once for the whole batch
+        assert sum(1 for c in mock_mediator.execute_async.await_args_list if not isinstance(c.args[0], ExecuteToolCommand)) == 1
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_call_fails_alone(self, controller: AgentController) -> None:
+        """Test a tool outside the allowed list produces a failed result, not a failed batch."""
+        batch = ToolCallBatchRequest(calls=[ToolCallRequest(tool_id="src:delete_all"), ToolCallRequest(tool_id="src:get_orders")])
+
+        response = await controller.execute_tools_batch(batch, make_http_request(), user={"sub": "u1"})
+        lines = [json.loads(line) for line in (await read_body(response)).splitlines()]
+        by_index = {line["index"]: line for line in lines if "index" in line}
+
+        assert by_index[0]["status"] == "failed"
+        assert by_index[0]["error"]["error_code"] == "access_denied"
+        assert by_index[1]["status"] == "completed"
+        assert lines[-1]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self, controller: AgentController, mock_mediator: MagicMock) -> None:
+        """Test no more than max_concurrency calls execute at the same time."""
+        running = peak = 0
+
+        async def execute_async(request: Any) -> MagicMock:
+            nonlocal running, peak
+            if not isinstance(request, ExecuteToolCommand):
+                return make_result(200, [make_tool("src:get_users", "get_users")])
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return make_result(200, {"tool_id": request.tool_id, "status": "completed"})
+
+        mock_mediator.execute_async.side_effect = execute_async
+        batch = ToolCallBatchRequest(calls=[ToolCallRequest(tool_id="src:get_users") for _ in range(6)], max_concurrency=2)
+
+        response = await controller.execute_tools_batch(batch, make_http_request(), user={"sub": "u1"})
+        await read_body(response)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_sse_format_from_accept_header(self, controller: AgentController) -> None:
+        """Test results are sent as tool_result events and a final done event."""
+        batch = ToolCallBatchRequest(calls=[ToolCallRequest(tool_id="src:get_orders")])
+
+        response = await controller.execute_tools_batch(batch, make_http_request(accept="text/event-stream"), user={"sub": "u1"})
+        body = await read_body(response)
+
+        assert response.media_type == "text/event-stream"
+        assert body.startswith("id: 0\nevent: tool_result\n")
+        assert "event: done\n" in body
+
+    @pytest.mark.asyncio
+    async def test_too_many_calls_is_rejected(self, controller: AgentController, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test batches over the configured size are rejected up front."""
+        monkeypatch.setattr("api.controllers.agent_controller.app_settings.agent_batch_max_calls", 1)
+        batch = ToolCallBatchRequest(calls=[ToolCallRequest(tool_id="src:get_users"), ToolCallRequest(tool_id="src:get_orders")])
+
+        with pytest.raises(HTTPException) as exc:
+            await controller.execute_tools_batch(batch, make_http_request(), user={"sub": "u1"})
+
+        assert exc.value.status_code == 400
+
+
+class TestAgentControllerTools:
+    """Test GET /agent/tools revalidation."""
+
+    @pytest.fixture
+    def controller(self) -> AgentController:
+        """Create an AgentController returning a fixed tool manifest."""
+        from neuroglia.serialization.json import JsonSerializer
+
+        mediator = MagicMock()
+        mediator.execute_async = AsyncMock(return_value=make_result(200, [make_tool("src:get_users", "get_users")]))
+        controller = AgentController(service_provider=MagicMock(), mapper=MagicMock(), mediator=mediator)
+        controller.json_serializer = JsonSerializer()
+        return controller
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_not_modified(self, controller: AgentController) -> None:
+        """Test the manifest carries an ETag and sending it back yields an empty 304."""
+        first = await controller.get_tools(make_http_request(), user={"sub": "u1"})
+        etag = first.headers["ETag"]
+
+        request = make_http_request()
+        request.headers["if-none-match"] = etag
+        second = await controller.get_tools(request, user={"sub": "u1"})
+
+        assert first.status_code == 200 and json.loads(first.body)[0]["tool_id"] == "src:get_users"
+        assert second.status_code == 304
+        assert second.body == b""
+        assert second.headers["ETag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_returns_manifest(self, controller: AgentController) -> None:
+        """Test a client holding an outdated ETag gets the full list."""
+        request = make_http_request()
+        request.headers["if-none-match"] = '"outdated"'
+
+        response = await controller.get_tools(request, user={"sub": "u1"})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != '"outdated"'
+
+    @pytest.mark.asyncio
+    async def test_manifest_bytes_do_not_depend_on_fast_json(self, controller: AgentController, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the orjson and json module encoders return the same body, hence the same ETag."""
+        from application.settings import app_settings
+
+        responses = []
+        for fast in (True, False):
+            monkeypatch.setattr(app_settings, "fast_json_enabled", fast)
+            responses.append(await controller.get_tools(make_http_request(), user={"sub": "u1"}))
+
+        assert responses[0].body == responses[1].body
+        assert responses[0].headers["ETag"] == responses[1].headers["ETag"]
+        assert json.loads(responses[0].body) == json.loads(controller.json_serializer.serialize_to_text([make_tool("src:get_users", "get_users")]))
@@ -0,0 +1,60 @@
+"""Tests for the compact JSON encoding of API responses."""
+
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import pytest
+from neuroglia.serialization.json import JsonSerializer
+
+from api.services.json_encoding import encode_json
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+@dataclass
+class Entry:
+    name: str
+    schema: dict[str, Any]
+    tags: list[str] = field(default_factory=list)
+    version: str | None = None
+    _internal: str = "hidden"
+
+
+VALUES: list[Any] = [
+    [Entry("é 😀 <&>", {"type": "object", "properties": {"a": {"default": None, "minimum": 0.5, "maximum": 1e16}}}, ["x"])],
+    {"when": datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=UTC), "id": UUID(int=1), "color": Color.RED, "entry": Entry("n", {}, version="1")},
+    {"big": 2**70, "nested": [[1, 2.5, True, None]]},
+    {1: "non-string key"},
+]
+
+
+class TestEncodeJson:
+    """Test encode_json."""
+
+    @pytest.mark.parametrize("value", VALUES)
+    def test_orjson_and_json_module_write_the_same_bytes(self, value: Any) -> None:
+        assert encode_json(value) == encode_json(value, fast=False)
+
+    def test_document_matches_json_serializer(self) -> None:
+        """Test the document is JsonSerializer's, without whitespace (private and None attributes dropped)."""
+        entries = VALUES[0]
+
+        encoded = encode_json(entries)
+
+        assert json.loads(encoded) == json.loads(JsonSerializer().serialize_to_text(entries))
+        assert b'"name":"\xc3\xa9 \xf0\x9f\x98\x80 <&>"' in encoded
+        assert b"_internal" not in encoded and b"version" not in encoded
+
+    def test_other_values_are_written_as_strings(self) -> None:
+        """Test values without a JSON form are written as their str() on both paths, as JsonSerializer writes them."""
+        value = {"price": Decimal("9.90"), "items": {1, 2}}
+
+        assert encode_json(value) == encode_json(value, fast=False) == b'{"price":"9.90","items":"{1, 2}"}'
+        assert json.loads(encode_json(value)) == json.loads(JsonSerializer().serialize_to_text(value))
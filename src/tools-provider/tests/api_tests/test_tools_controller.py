@@ -7,6 +7,7 @@ import pytest
 from neuroglia.core import OperationResult
 
 from api.controllers.tools_controller import ToolsController
+from application.queries import SearchToolsPageQuery, SearchToolsQuery, ToolSearchPage
 from integration.models.source_tool_dto import SourceToolDto, SourceToolSummaryDto
 
 
@@ -237,11 +238,15 @@ class TestToolsController:
             source_id=None,
             tags=None,
             include_disabled=False,
+            offset=0,
+            limit=None,
+            facets=False,
             user=sample_user,
         )
 
         # Assert
         call_args = mock_mediator.execute_async.call_args[0][0]
+        assert isinstance(call_args, SearchToolsQuery)
         assert call_args.query == "users"
         assert call_args.source_id is None
         assert call_args.tags is None
@@ -267,6 +272,9 @@ class TestToolsController:
             source_id="source123",
             tags="users,admin",
             include_disabled=True,
+            offset=0,
+            limit=None,
+            facets=False,
             user=sample_user,
         )
 
@@ -277,6 +285,40 @@ class TestToolsController:
         assert call_args.tags == ["users", "admin"]
         assert call_args.include_disabled is True
 
+    @pytest.mark.asyncio
+    async def test_search_tools_page_with_facets(
+        self,
+        controller: ToolsController,
+        mock_mediator: MagicMock,
+        sample_user: dict[str, Any],
+    ) -> None:
+        """Test paged search returning facet counts."""
+        # Arrange
+        mock_result = MagicMock(spec=OperationResult)
+        mock_result.is_success = True
+        mock_result.data = ToolSearchPage(total=0, offset=20, limit=10)
+        mock_result.status = 200
+        mock_mediator.execute_async.return_value = mock_result
+
+        # Act
+        await controller.search_tools(
+            q="weather",
+            source_id=None,
+            tags=None,
+            include_disabled=False,
+            offset=20,
+            limit=10,
+            facets=True,
+            user=sample_user,
+        )
+
+        # Assert
+        call_args = mock_mediator.execute_async.call_args[0][0]
+        assert isinstance(call_args, SearchToolsPageQuery)
+        assert call_args.query == "weather"
+        assert call_args.offset == 20
+        assert call_args.limit == 10
+
     # =========================================================================
     # GET /tools/{tool_id}
     # =========================================================================
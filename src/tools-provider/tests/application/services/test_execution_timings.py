@@ -0,0 +1,138 @@
+"""Tests for the per-stage latency breakdown of tool executions."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import jwt
+import pytest
+
+from application.services.execution_timings import ExecutionTimings
+from application.services.tool_executor import ToolExecutionResult, ToolExecutor
+from domain.enums import AuthMode, ExecutionMode
+from domain.models import ExecutionProfile, ToolDefinition
+
+TOKEN = jwt.encode({"sub": "u1"}, "test-secret-key-with-enough-length!", algorithm="HS256")
+
+
+def make_definition(url: str) -> ToolDefinition:
+    return ToolDefinition(
+        name="get_user",
+        description="Get a user",
+        input_schema={"type": "object", "properties": {"id": {"type": "string"}}},
+        execution_profile=ExecutionProfile(mode=ExecutionMode.SYNC_HTTP, method="GET", url_template=url),
+        source_path="/users/{id}",
+    )
+
+
+async def run(executor: ToolExecutor, definition: ToolDefinition) -> ToolExecutionResult:
+    return await executor.execute(tool_id="src:get_user", definition=definition, arguments={"id": "42"}, agent_token=TOKEN, source_id="src", auth_mode=AuthMode.NONE)
+
+
+@pytest.fixture
+async def upstream() -> AsyncIterator[str]:
+    """A minimal HTTP server answering every request with a small JSON body."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.readuntil(b"\r\n\r\n")
+        body = b'{"id": "42", "name": "Ada"}'
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\nConnection: close\r\n\r\n%s" % (len(body), body))
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.close()
+    await server.wait_closed()
+
+
+class TestExecutionTimings:
+    """Tests for ExecutionTimings."""
+
+    def test_stages_accumulate_and_total(self):
+        """A stage entered twice is summed, and the total covers every stage."""
+        timings = ExecutionTimings("src:get_user", "src")
+        for _ in range(2):
+            with timings.stage("connect"):
+                time.sleep(0.002)
+        timings.enter("parse")
+        time.sleep(0.001)
+
+        breakdown = timings.finish()
+
+        assert set(breakdown) == {"connect", "parse", "total"}
+        assert breakdown["connect"] >= 4
+        assert breakdown["total"] == pytest.approx(breakdown["connect"] + breakdown["parse"], abs=0.01)
+
+    def test_finish_records_once(self):
+        """Only the first finish records the histogram, later calls return the same breakdown."""
+        timings = ExecutionTimings("src:get_user", "src")
+        with timings.stage("validation"):
+            pass
+
+        with patch("application.services.execution_timings.tool_execution_stage_time") as histogram:
+            first = timings.finish()
+            second = timings.finish()
+
+        assert first is second
+        histogram.record.assert_called_once()
+        assert histogram.record.call_args.args[1] == {"tool_id": "src:get_user", "source_id": "src", "stage": "validation"}
+
+    def test_disabled_timings_record_nothing(self):
+        """Unsampled executions have no breakdown and no request extensions."""
+        timings = ExecutionTimings("src:get_user", "src", enabled=False)
+        with timings.stage("validation"):
+            pass
+
+        assert timings.httpx_extensions() is None
+        assert timings.finish() == {}
+
+    @pytest.mark.parametrize(("rate", "expected"), [(0.0, False), (1.0, True)])
+    def test_sampling_bounds(self, rate: float, expected: bool):
+        assert ExecutionTimings.sampled("t", "s", rate).enabled is expected
+
+    def test_sampling_rate(self):
+        with patch("application.services.execution_timings.random.random", side_effect=[0.05, 0.5]):
+            assert ExecutionTimings.sampled("t", "s", 0.1).enabled is True
+            assert ExecutionTimings.sampled("t", "s", 0.1).enabled is False
+
+
+class TestToolExecutorTimings:
+    """Tests for the stage breakdown of ToolExecutor.execute."""
+
+    @pytest.mark.asyncio
+    async def test_http_execution_reports_every_stage(self, upstream: str):
+        """A sampled HTTP execution carries the stage breakdown in its metadata."""
+        executor = ToolExecutor(token_exchanger=MagicMock())
+
+        result = await run(executor, make_definition(f"{upstream}/users/{{id}}"))
+
+        assert result.status == "completed"
+        assert result.result == {"id": "42", "name": "Ada"}
+        timings = result.metadata["timings_ms"]
+        assert {"validation", "token", "render", "circuit", "connect", "ttfb", "download", "parse", "total"} <= set(timings)
+        assert all(ms >= 0 for ms in timings.values())
+
+    @pytest.mark.asyncio
+    async def test_unsampled_execution_has_no_breakdown(self):
+        executor = ToolExecutor(token_exchanger=MagicMock(), timing_sample_rate=0.0)
+        executor._execute_sync = AsyncMock(side_effect=lambda **kw: ToolExecutionResult(tool_id=kw["tool_id"], status="completed", result={}, execution_time_ms=0))  # type: ignore[method-assign]
+
+        result = await run(executor, make_definition("https://api.example.com/users/{id}"))
+
+        assert "timings_ms" not in result.metadata
+
+    @pytest.mark.asyncio
+    async def test_failed_execution_is_recorded(self):
+        """Stages of a failing execution are still recorded."""
+        executor = ToolExecutor(token_exchanger=MagicMock())
+        executor._execute_sync = AsyncMock(side_effect=RuntimeError("boom"))  # type: ignore[method-assign]
+
+        with patch("application.services.execution_timings.tool_execution_stage_time") as histogram:
+            with pytest.raises(Exception):
+                await run(executor, make_definition("https://api.example.com/users/{id}"))
+
+        stages = {call.args[1]["stage"] for call in histogram.record.call_args_list}
+        assert {"validation", "token"} <= stages
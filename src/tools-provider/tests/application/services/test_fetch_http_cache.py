@@ -0,0 +1,183 @@
+"""Tests for the shared fetch client and its HTTP response cache."""
+
+import httpx
+import pytest
+
+from application.services.builtin_tools.http_client import CachingHttpClient, ContentTooLargeError, DiskHttpCacheBackend, RedisHttpCacheBackend, freshness_lifetime
+from application.settings import Settings
+
+
+class RecordingHandler:
+    """MockTransport handler returning queued responses and recording requests."""
+
+    def __init__(self, *responses: httpx.Response):
+        self.responses = list(responses)
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.responses.pop(0)
+
+
+def make_client(tmp_path, handler: RecordingHandler) -> CachingHttpClient:
+    return CachingHttpClient(cache_backend=DiskHttpCacheBackend(directory=str(tmp_path)), transport=httpx.MockTransport(handler))
+
+
+class TestCachingHttpClient:
+    """Tests for caching and size limits."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_response_is_served_from_cache(self, tmp_path):
+        """A response with max-age is served without a second request."""
+        handler = RecordingHandler(httpx.Response(200, headers={"cache-control": "max-age=60"}, text="hello"))
+        client = make_client(tmp_path, handler)
+
+        first = await client.fetch("https://example.com/page")
+        second = await client.fetch("https://example.com/page")
+
+        assert len(handler.requests) == 1
+        assert first.extensions["fetch_cache"] == "miss"
+        assert second.extensions["fetch_cache"] == "hit"
+        assert second.text == "hello"
+
+    @pytest.mark.asyncio
+    async def test_stale_response_is_revalidated_with_etag(self, tmp_path):
+        """A stale response with an ETag is revalidated and a 304 reuses the cached body."""
+        handler = RecordingHandler(
+            httpx.Response(200, headers={"cache-control": "no-cache", "etag": '"v1"'}, text="body"),
+            httpx.Response(304, headers={"etag": '"v1"'}),
+        )
+        client = make_client(tmp_path, handler)
+
+        await client.fetch("https://example.com/doc")
+        response = await client.fetch("https://example.com/doc")
+
+        assert handler.requests[1].headers["if-none-match"] == '"v1"'
+        assert response.extensions["fetch_cache"] == "revalidated"
+        assert response.status_code == 200
+        assert response.text == "body"
+
+    @pytest.mark.asyncio
+    async def test_no_store_is_not_cached(self, tmp_path):
+        """Responses marked no-store are always fetched."""
+        handler = RecordingHandler(
+            httpx.Response(200, headers={"cache-control": "no-store"}, text="a"),
+            httpx.Response(200, headers={"cache-control": "no-store"}, text="b"),
+        )
+        client = make_client(tmp_path, handler)
+
+        await client.fetch("https://example.com/private")
+        response = await client.fetch("https://example.com/private")
+
+        assert len(handler.requests) == 2
+        assert response.text == "b"
+
+    @pytest.mark.asyncio
+    async def test_streaming_read_is_aborted_over_limit(self, tmp_path):
+        """A body without Content-Length is cut off once it crosses the limit."""
+
+        async def body():
+            for _ in range(100):
+                yield b"x" * 1024
+
+        handler = RecordingHandler(httpx.Response(200, content=body()))
+        client = make_client(tmp_path, handler)
+
+        with pytest.raises(ContentTooLargeError):
+            await client.fetch("https://example.com/huge", max_bytes=10 * 1024)
+
+    @pytest.mark.asyncio
+    async def test_declared_length_over_limit_is_rejected(self, tmp_path):
+        """A Content-Length above the limit fails before the body is read."""
+        handler = RecordingHandler(httpx.Response(200, content=b"x" * 2048))
+        client = make_client(tmp_path, handler)
+
+        with pytest.raises(ContentTooLargeError):
+            await client.fetch("https://example.com/big", max_bytes=1024)
+
+
+class TestFreshness:
+    """Tests for freshness computation."""
+
+    def test_max_age_minus_age(self):
+        assert freshness_lifetime(httpx.Headers({"cache-control": "max-age=100", "age": "30"}), 0, 3600) == 70
+
+    def test_heuristic_from_last_modified_is_capped(self):
+        headers = httpx.Headers({"date": "Tue, 01 Jan 2030 00:00:00 GMT", "last-modified": "Mon, 01 Jan 2029 00:00:00 GMT"})
+        assert freshness_lifetime(headers, 0, 3600) == 3600
+
+    def test_no_store_is_not_storable(self):
+        assert freshness_lifetime(httpx.Headers({"cache-control": "no-store"}), 0, 3600) is None
+
+    def test_private_is_not_storable(self):
+        """The cache is shared by all users, so per-user responses are never stored."""
+        assert freshness_lifetime(httpx.Headers({"cache-control": "private, max-age=600"}), 0, 3600) is None
+
+    def test_s_maxage_overrides_max_age(self):
+        assert freshness_lifetime(httpx.Headers({"cache-control": "max-age=600, s-maxage=60"}), 0, 3600) == 60
+
+
+class TestDiskBackend:
+    """Tests for the disk LRU backend."""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        """The backend stays within its size bound."""
+        handler = RecordingHandler(*(httpx.Response(200, headers={"cache-control": "max-age=60"}, content=b"x" * 400) for _ in range(4)))
+        client = CachingHttpClient(cache_backend=DiskHttpCacheBackend(directory=str(tmp_path), max_bytes=2000), transport=httpx.MockTransport(handler))
+
+        for name in ("a", "b", "c"):
+            await client.fetch(f"https://example.com/{name}")
+        response = await client.fetch("https://example.com/a")
+
+        assert response.extensions["fetch_cache"] == "miss"
+        assert sum(f.stat().st_size for f in tmp_path.iterdir()) <= 2000
+
+
+class FakeCacheService:
+    """Stand-in for RedisCacheService with an in-memory client."""
+
+    def __init__(self):
+        self.client = self
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.data[key] = value
+
+
+class TestClientSetup:
+    """Tests for the backend selection and lifecycle of the shared client."""
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_uses_the_cache_service_connection(self):
+        cache_service = FakeCacheService()
+        handler = RecordingHandler(httpx.Response(200, headers={"cache-control": "max-age=60"}, text="cached"))
+        client = CachingHttpClient.create(Settings(fetch_cache_backend="redis"), cache_service)
+        client._transport = httpx.MockTransport(handler)
+
+        await client.fetch("https://example.com/shared")
+        response = await client.fetch("https://example.com/shared")
+
+        assert isinstance(client._cache, RedisHttpCacheBackend)
+        assert response.extensions["fetch_cache"] == "hit"
+        assert all(key.startswith("mcp:fetch:") for key in cache_service.data)
+
+    def test_redis_backend_falls_back_to_disk_without_cache_service(self):
+        client = CachingHttpClient.create(Settings(fetch_cache_backend="redis"))
+
+        assert isinstance(client._cache, DiskHttpCacheBackend)
+
+    @pytest.mark.asyncio
+    async def test_stop_closes_the_pool(self, tmp_path):
+        handler = RecordingHandler(httpx.Response(200, text="ok"))
+        client = make_client(tmp_path, handler)
+        await client.fetch("https://example.com/")
+        pool = client._client
+
+        await client.stop_async()
+
+        assert pool is not None and pool.is_closed
+        assert client._client is None
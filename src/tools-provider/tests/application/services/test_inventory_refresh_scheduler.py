@@ -0,0 +1,143 @@
+"""Tests for the background inventory refresh scheduler."""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.services.inventory_refresh_scheduler import LOCK_KEY_PREFIX, InventoryRefreshScheduler
+from domain.enums import HealthStatus, SourceType
+from integration.models.source_dto import SourceDto
+
+
+class FakeRedisClient:
+    """Minimal in-memory stand-in for the redis.asyncio client (locks only)."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool | None:
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+class FakeCacheService:
+    def __init__(self) -> None:
+        self.client = FakeRedisClient()
+
+
+def make_source(source_id: str, source_type: SourceType = SourceType.OPENAPI, last_sync_at: datetime | None = None) -> SourceDto:
+    return SourceDto(
+        id=source_id,
+        name=source_id,
+        url=f"https://{source_id}.example.com",
+        source_type=source_type,
+        health_status=HealthStatus.HEALTHY,
+        is_enabled=True,
+        last_sync_at=last_sync_at,
+    )
+
+
+def make_scheduler(sources: list[SourceDto], refresh: AsyncMock, **kwargs) -> InventoryRefreshScheduler:
+    scheduler = InventoryRefreshScheduler(service_provider=MagicMock(), jitter_fraction=0, **kwargs)
+    scheduler._list_sources = AsyncMock(return_value=sources)  # type: ignore[method-assign]
+    scheduler._refresh = refresh  # type: ignore[method-assign]
+    return scheduler
+
+
+async def drain(scheduler: InventoryRefreshScheduler) -> None:
+    await asyncio.gather(*list(scheduler._inflight.values()))
+
+
+class TestInventoryRefreshScheduler:
+    """Tests for scheduling, concurrency, backoff and leader locks."""
+
+    @pytest.mark.asyncio
+    async def test_due_sources_are_refreshed_within_concurrency_limit(self):
+        """Never-synced sources are dispatched, with at most max_concurrency running."""
+        running = peak = 0
+
+        async def refresh(source_id: str) -> bool:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        scheduler = make_scheduler([make_source(f"s{i}") for i in range(6)], AsyncMock(side_effect=refresh), max_concurrency=2)
+
+        dispatched = await scheduler.tick()
+        await drain(scheduler)
+
+        assert len(dispatched) == 6
+        assert peak == 2
+        assert all(s.next_run_at > time.time() + 3000 for s in scheduler._schedules.values())
+
+    @pytest.mark.asyncio
+    async def test_recently_synced_source_is_not_due(self):
+        """A source synced less than one interval ago waits for its turn."""
+        refresh = AsyncMock(return_value=True)
+        scheduler = make_scheduler([make_source("s1", last_sync_at=datetime.now(UTC) - timedelta(minutes=10))], refresh)
+
+        assert await scheduler.tick() == []
+        refresh.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failures_back_off_exponentially(self):
+        """Each consecutive failure doubles the delay, up to the cap."""
+        scheduler = make_scheduler([make_source("s1")], AsyncMock(return_value=False), interval_seconds=100, max_backoff_seconds=300)
+
+        await scheduler.tick()
+        await drain(scheduler)
+        schedule = scheduler._schedules["s1"]
+        assert schedule.failures == 1
+        assert 190 < schedule.next_run_at - time.time() <= 200
+
+        schedule.next_run_at = 0
+        await scheduler.tick()
+        await drain(scheduler)
+        assert 290 < schedule.next_run_at - time.time() <= 300
+
+    @pytest.mark.asyncio
+    async def test_source_locked_by_another_replica_is_skipped(self):
+        """Only the replica holding the Redis lock refreshes a source."""
+        cache = FakeCacheService()
+        cache.client.data[f"{LOCK_KEY_PREFIX}s1"] = "other-replica"
+        refresh = AsyncMock(return_value=True)
+        scheduler = make_scheduler([make_source("s1"), make_source("s2")], refresh, cache_service=cache)
+
+        await scheduler.tick()
+        await drain(scheduler)
+
+        refresh.assert_awaited_once_with("s2")
+        assert cache.client.data == {f"{LOCK_KEY_PREFIX}s1": "other-replica"}
+
+    @pytest.mark.asyncio
+    async def test_type_override_disables_refresh(self):
+        """An interval of 0 for a source type excludes its sources."""
+        refresh = AsyncMock(return_value=True)
+        scheduler = make_scheduler([make_source("builtin", SourceType.BUILTIN), make_source("api")], refresh, source_intervals={"builtin": 0})
+
+        assert await scheduler.tick() == ["api"]
+        await drain(scheduler)
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self):
+        """The scheduling loop starts and stops with the host."""
+        scheduler = make_scheduler([], AsyncMock(return_value=True), tick_seconds=3600)
+
+        await scheduler.start_async()
+        await scheduler.stop_async()
+
+        assert scheduler._task is None
@@ -6,14 +6,17 @@ Tests cover:
 - Handling various parameter types
 - Error handling for invalid specs
 - URL validation
+- Incremental ingestion (conditional fetch, snapshot replay, parallel parsing)
 """
 
 import json
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from application.services import OpenAPISourceAdapter
+from application.services.openapi_source_adapter import SpecSnapshotCache
 from domain.enums import ExecutionMode, SourceType
 from tests.fixtures.openapi_specs import (
     INVALID_NO_OPENAPI_VERSION,
@@ -429,3 +432,92 @@ class TestInventoryHash:
             result2 = await adapter.fetch_and_normalize("https://example.com/openapi.json")
 
             assert result1.inventory_hash != result2.inventory_hash
+
+
+# ============================================================================
+# INCREMENTAL INGESTION TESTS
+# ============================================================================
+
+
+class TestIncrementalIngestion:
+    """Test conditional fetches, snapshot replay, $ref memoization and parallel parsing."""
+
+    @pytest.fixture
+    def adapter(self) -> OpenAPISourceAdapter:
+        """Create adapter instance with its own snapshot cache."""
+        return OpenAPISourceAdapter(snapshot_cache=SpecSnapshotCache())
+
+    @pytest.mark.asyncio
+    async def test_unchanged_spec_is_not_parsed_again(self, adapter: OpenAPISourceAdapter) -> None:
+        """Test an identical spec body replays the previous result."""
+        with patch.object(adapter, "_fetch_spec", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = (json.dumps(SIMPLE_OPENAPI_SPEC), None)
+            first = await adapter.fetch_and_normalize("https://example.com/openapi.json")
+
+            with patch.object(adapter, "_parse_spec") as mock_parse:
+                second = await adapter.fetch_and_normalize("https://example.com/openapi.json")
+
+            mock_parse.assert_not_called()
+            assert second.inventory_hash == first.inventory_hash
+            assert [t.name for t in second.tools] == [t.name for t in first.tools]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_per_audience(self, adapter: OpenAPISourceAdapter) -> None:
+        """Test a different default audience is normalized again."""
+        with patch.object(adapter, "_fetch_spec", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = (json.dumps(SIMPLE_OPENAPI_SPEC), None)
+            await adapter.fetch_and_normalize("https://example.com/openapi.json", default_audience="a")
+            result = await adapter.fetch_and_normalize("https://example.com/openapi.json", default_audience="b")
+
+            assert result.tools[0].execution_profile.required_audience == "b"
+
+    @pytest.mark.asyncio
+    async def test_conditional_fetch_replays_on_304(self, adapter: OpenAPISourceAdapter) -> None:
+        """Test stored validators are sent and a 304 replays the previous result."""
+        requests: list[httpx.Request] = []
+        responses = [
+            httpx.Response(200, headers={"etag": '"v1"', "last-modified": "Mon, 01 Jan 2029 00:00:00 GMT"}, json=SIMPLE_OPENAPI_SPEC),
+            httpx.Response(304),
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return responses.pop(0)
+
+        real_client = httpx.AsyncClient
+        with patch("application.services.openapi_source_adapter.httpx.AsyncClient", lambda **kwargs: real_client(transport=httpx.MockTransport(handler))):
+            first = await adapter.fetch_and_normalize("https://example.com/openapi.json")
+            second = await adapter.fetch_and_normalize("https://example.com/openapi.json")
+
+        assert "if-none-match" not in requests[0].headers
+        assert requests[1].headers["if-none-match"] == '"v1"'
+        assert requests[1].headers["if-modified-since"] == "Mon, 01 Jan 2029 00:00:00 GMT"
+        assert second.success is True
+        assert second.inventory_hash == first.inventory_hash
+        assert len(second.tools) == 5
+
+    def test_ref_resolution_is_memoized_per_spec(self, adapter: OpenAPISourceAdapter) -> None:
+        """Test a $ref is resolved once per spec object."""
+        spec = {"components": {"schemas": {"User": {"type": "object"}}}}
+        ref = {"$ref": "#/components/schemas/User"}
+
+        assert adapter._resolve_ref(spec, ref) is spec["components"]["schemas"]["User"]
+        spec["components"]["schemas"]["User"] = {"type": "string"}
+        assert adapter._resolve_ref(spec, ref) == {"type": "object"}
+
+        other = {"components": {"schemas": {"User": {"type": "integer"}}}}
+        assert adapter._resolve_ref(other, ref) == {"type": "integer"}
+
+    @pytest.mark.asyncio
+    async def test_large_spec_is_parsed_on_process_pool(self) -> None:
+        """Test chunked parsing on the process pool matches serial parsing."""
+        adapter = OpenAPISourceAdapter(snapshot_cache=SpecSnapshotCache(), parallel_min_operations=1)
+        serial = OpenAPISourceAdapter(snapshot_cache=SpecSnapshotCache(), parallel_min_operations=0)
+
+        with patch.object(adapter, "_fetch_spec", new_callable=AsyncMock) as mock_fetch, patch.object(serial, "_fetch_spec", new_callable=AsyncMock) as serial_fetch:
+            mock_fetch.return_value = serial_fetch.return_value = (json.dumps(OPENAPI_SPEC_WITH_REFS), None)
+            parallel_result = await adapter.fetch_and_normalize("https://example.com/openapi.json")
+            serial_result = await serial.fetch_and_normalize("https://example.com/openapi.json")
+
+        assert parallel_result.success is True
+        assert parallel_result.tools == serial_result.tools
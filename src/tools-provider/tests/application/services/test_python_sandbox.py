@@ -0,0 +1,122 @@
+"""Tests for the process-isolated execute_python sandbox."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from application.services.builtin_tools.python_sandbox import PythonSandboxPool
+
+
+@pytest.fixture
+async def pool():
+    sandbox = PythonSandboxPool(size=1, max_concurrency=4, memory_limit_mb=256)
+    yield sandbox
+    await sandbox.close()
+
+
+class TestPythonSandboxPool:
+    """Tests for PythonSandboxPool."""
+
+    @pytest.mark.asyncio
+    async def test_stdout_and_last_expression(self, pool):
+        """Printed output is captured and the last expression is returned."""
+        response = await pool.execute("print('hello')\nx = 21\nx * 2", timeout=5)
+
+        assert response == {"success": True, "stdout": "hello\n", "result": 42}
+
+    @pytest.mark.asyncio
+    async def test_allowed_import(self, pool):
+        """Pre-imported modules can be imported."""
+        response = await pool.execute("import math\nresult = math.sqrt(16)", timeout=5)
+
+        assert response["result"] == 4.0
+
+    @pytest.mark.asyncio
+    async def test_disallowed_import(self, pool):
+        """Modules outside the allow-list cannot be imported."""
+        response = await pool.execute("import os\nos.getcwd()", timeout=5)
+
+        assert response["success"] is False
+        assert "not allowed" in response["error"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_worker_without_blocking_loop(self, pool):
+        """A runaway run is killed on timeout while the event loop stays responsive."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        start = time.monotonic()
+        response = await pool.execute("while True:\n    pass", timeout=1)
+        elapsed = time.monotonic() - start
+        ticker_task.cancel()
+
+        assert response["success"] is False
+        assert "timed out" in response["error"]
+        assert elapsed < 5
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_memory_limit(self, pool):
+        """Allocations above the memory limit fail instead of growing the server."""
+        response = await pool.execute("data = 'x' * (1024 * 1024 * 1024)", timeout=5)
+
+        assert response["success"] is False
+        assert "memory" in response["error"]
+
+    @pytest.mark.asyncio
+    async def test_workers_are_isolated(self, pool):
+        """State from one run is not visible to the next."""
+        await pool.execute("import math\nmath.tau = 0", timeout=5)
+        response = await pool.execute("import math\nmath.tau > 6", timeout=5)
+
+        assert response["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs(self, pool):
+        """Concurrent runs each get their own worker."""
+        responses = await asyncio.gather(*[pool.execute(f"{i} * 10", timeout=5) for i in range(5)])
+
+        assert [response["result"] for response in responses] == [0, 10, 20, 30, 40]
+
+
+class TestPythonSandboxPoolLifecycle:
+    """Tests for the HostedService lifecycle of PythonSandboxPool."""
+
+    @pytest.mark.asyncio
+    async def test_start_warms_up_and_stop_closes_idle_workers(self):
+        """Idle workers are started with the application and stopped on shutdown."""
+        sandbox = PythonSandboxPool(size=2)
+
+        await sandbox.start_async()
+        workers = list(sandbox._idle)
+        await sandbox.stop_async()
+
+        assert len(workers) == 2
+        assert sandbox._idle == []
+        assert all(worker.returncode is not None for worker in workers)
+
+    def test_configure_registers_the_process_wide_pool(self, monkeypatch):
+        """configure() builds the pool from the application settings and registers it as a HostedService."""
+        from neuroglia.hosting.abstractions import HostedService
+
+        from application.services.builtin_tools import python_sandbox
+        from application.settings import app_settings
+
+        monkeypatch.setattr(python_sandbox, "_sandbox_pool", None)
+        monkeypatch.setattr(app_settings, "python_sandbox_pool_size", 3)
+        builder = MagicMock()
+
+        python_sandbox.PythonSandboxPool.configure(builder)
+
+        pool = python_sandbox.get_python_sandbox_pool()
+        assert pool._size == 3
+        builder.services.add_singleton.assert_any_call(python_sandbox.PythonSandboxPool, singleton=pool)
+        builder.services.add_singleton.assert_any_call(HostedService, singleton=pool)
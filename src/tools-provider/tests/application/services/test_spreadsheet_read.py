@@ -0,0 +1,121 @@
+"""Tests for the streaming spreadsheet_read tool."""
+
+import os
+import shutil
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from openpyxl import Workbook
+
+from application.services.builtin_tool_executor import BuiltinToolExecutor
+from application.services.builtin_tools import UserContext, file_tools
+
+
+@pytest.fixture
+def executor():
+    return BuiltinToolExecutor()
+
+
+@pytest.fixture
+def user_context():
+    context = UserContext(user_id=f"spreadsheet-test-{uuid4().hex[:8]}")
+    yield context
+    shutil.rmtree(file_tools._get_workspace_dir(context), ignore_errors=True)
+
+
+def _write_workbook(user_context: UserContext, filename: str, rows: int) -> str:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["id", "name", "score"])
+    for i in range(rows):
+        ws.append([i, f"name-{i % 10}", None if i % 5 == 0 else float(i)])
+    path = os.path.join(file_tools._get_workspace_dir(user_context), filename)
+    wb.save(path)
+    return path
+
+
+class TestSpreadsheetRead:
+    """Tests for spreadsheet_read pagination and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_offset_page_and_total(self, executor, user_context):
+        """A page at an offset returns only the requested rows and the sheet total."""
+        _write_workbook(user_context, "big.xlsx", rows=200)
+
+        result = await executor.execute("spreadsheet_read", {"filename": "big.xlsx", "offset": 150, "max_rows": 10, "include_stats": False}, user_context)
+
+        assert result.success is True
+        assert result.result["total_rows"] == 200
+        assert [row["id"] for row in result.result["data"]] == list(range(150, 160))
+        assert "stats" not in result.result
+
+    @pytest.mark.asyncio
+    async def test_stats_cover_whole_sheet(self, executor, user_context):
+        """Stats are computed over every row, not only the returned page."""
+        _write_workbook(user_context, "stats.xlsx", rows=100)
+
+        result = await executor.execute("spreadsheet_read", {"filename": "stats.xlsx", "max_rows": 5}, user_context)
+
+        columns = result.result["stats"]["columns"]
+        assert columns["id"] == {"count": 100, "nulls": 0, "unique_count": 100, "type": "numeric", "min": 0, "max": 99, "avg": 49.5}
+        assert columns["score"]["nulls"] == 20
+        assert columns["score"]["count"] == 80
+        assert columns["name"]["type"] == "text"
+        assert columns["name"]["unique_count"] == 10
+        assert len(result.result["data"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_stats_are_cached_per_file_version(self, executor, user_context):
+        """Paging with stats reuses the cached stats until the file changes."""
+        path = _write_workbook(user_context, "paged.xlsx", rows=50)
+
+        first = await executor.execute("spreadsheet_read", {"filename": "paged.xlsx", "max_rows": 10}, user_context)
+        with patch.object(file_tools._ColumnStats, "add", side_effect=AssertionError("stats recomputed")):
+            second = await executor.execute("spreadsheet_read", {"filename": "paged.xlsx", "offset": 10, "max_rows": 10}, user_context)
+
+        assert second.success is True
+        assert second.result["stats"] == first.result["stats"]
+        assert second.result["data"][0]["id"] == 10
+
+        _write_workbook(user_context, "paged.xlsx", rows=60)
+        os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000))
+        third = await executor.execute("spreadsheet_read", {"filename": "paged.xlsx", "max_rows": 10}, user_context)
+
+        assert third.result["total_rows"] == 60
+        assert third.result["stats"]["columns"]["id"]["count"] == 60
+
+    @pytest.mark.asyncio
+    async def test_columns_filter(self, executor, user_context):
+        """Only the requested columns are returned and summarized."""
+        _write_workbook(user_context, "cols.xlsx", rows=3)
+
+        result = await executor.execute("spreadsheet_read", {"filename": "cols.xlsx", "columns": ["name"]}, user_context)
+
+        assert result.result["headers"] == ["name"]
+        assert result.result["data"][0] == {"name": "name-0"}
+        assert list(result.result["stats"]["columns"]) == ["name"]
+
+
+class TestColumnStats:
+    """Tests for the single-pass column accumulator."""
+
+    def test_distinct_estimate_beyond_sketch_size(self):
+        """The KMV sketch estimates large distinct counts within a reasonable error."""
+        stats = file_tools._ColumnStats()
+        for i in range(20_000):
+            stats.add(f"value-{i}")
+
+        estimate = stats.distinct_estimate()
+
+        assert 17_000 < estimate < 23_000
+
+    def test_mixed_column(self):
+        """Columns mixing numbers and text are reported as mixed."""
+        stats = file_tools._ColumnStats()
+        for value in [1, "a", 2, None, ""]:
+            stats.add(value)
+
+        assert stats.to_dict()["type"] == "mixed"
+        assert stats.to_dict()["nulls"] == 2
@@ -0,0 +1,207 @@
+"""Tests for durable background execution of ASYNC_POLL tools."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.queries import GetToolJobQuery, GetToolJobQueryHandler
+from application.services.tool_executor import ToolExecutionResult, ToolExecutor
+from application.services.tool_job_runner import ToolJobRunner
+from domain.enums import AuthMode, ExecutionMode, ToolJobStatus
+from domain.models import ExecutionProfile, PollConfig, ToolDefinition
+from integration.repositories.in_memory_tool_job_repository import InMemoryToolJobDtoRepository
+
+
+def make_poll_config(**kwargs: Any) -> PollConfig:
+    return PollConfig(
+        status_url_template="https://api.example.com/jobs/{{ job_id }}",
+        status_field_path="$.status",
+        completed_values=["done"],
+        failed_values=["error"],
+        result_field_path="$.result",
+        **kwargs,
+    )
+
+
+def make_runner(repository: InMemoryToolJobDtoRepository, outcomes: list[ToolExecutionResult | None] | None = None, **kwargs: Any) -> ToolJobRunner:
+    executor = MagicMock(spec=ToolExecutor)
+    executor.poll_status = AsyncMock(side_effect=outcomes or [None] * 10)
+    runner = ToolJobRunner(service_provider=MagicMock(), tool_executor=executor, **kwargs)
+
+    @asynccontextmanager
+    async def shared_repository() -> AsyncIterator[InMemoryToolJobDtoRepository]:
+        yield repository
+
+    runner._repository = shared_repository  # type: ignore[method-assign]
+    return runner
+
+
+def completed(value: Any = "report") -> ToolExecutionResult:
+    return ToolExecutionResult(tool_id="src:report", status="completed", result=value, execution_time_ms=0, upstream_status=200)
+
+
+async def submit(runner: ToolJobRunner, auth_mode: AuthMode = AuthMode.API_KEY, **kwargs: Any) -> str:
+    job = await runner.submit(
+        tool_id="src:report",
+        source_id="src",
+        owner_id="u1",
+        status_url="https://api.example.com/jobs/42",
+        poll_config=make_poll_config(**kwargs),
+        agent_token="user-jwt",  # nosec B106
+        auth_mode=auth_mode,
+    )
+    job.next_poll_at = 0.0
+    return job.id
+
+
+async def run_tick(runner: ToolJobRunner) -> list[str]:
+    dispatched = await runner.tick()
+    await asyncio.gather(*list(runner._inflight.values()))
+    return dispatched
+
+
+class TestToolJobRunner:
+    """Tests for ToolJobRunner scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_pending_poll_reschedules_with_backoff(self):
+        """A pending status keeps the job running, releases the lease and backs off."""
+        repository = InMemoryToolJobDtoRepository()
+        runner = make_runner(repository)
+        job_id = await submit(runner, poll_interval_seconds=2.0, backoff_multiplier=2.0)
+
+        assert await run_tick(runner) == [job_id]
+
+        job = await repository.get_async(job_id)
+        assert job.status == ToolJobStatus.RUNNING
+        assert job.attempts == 1
+        assert job.interval_seconds == 4.0
+        assert job.next_poll_at > 0
+        assert job.lease_owner is None
+
+    @pytest.mark.asyncio
+    async def test_completed_poll_finishes_job_and_notifies_owner(self):
+        """A completed status stores the result and publishes an update for the owner."""
+        repository = InMemoryToolJobDtoRepository()
+        cache = MagicMock()
+        cache.publish_update = AsyncMock()
+        runner = make_runner(repository, [completed({"rows": 3})], cache_service=cache)
+        job_id = await submit(runner, auth_mode=AuthMode.TOKEN_EXCHANGE)
+
+        await run_tick(runner)
+
+        job = await repository.get_async(job_id)
+        assert job.status == ToolJobStatus.COMPLETED
+        assert job.result == {"rows": 3}
+        assert job.completed_at is not None
+        assert runner._caller_tokens == {}
+        assert cache.publish_update.await_args.args[0] == "tool_job_updated:u1"
+
+    @pytest.mark.asyncio
+    async def test_each_due_job_is_claimed_by_one_replica(self):
+        """Replicas sharing the store never poll the same job concurrently."""
+        repository = InMemoryToolJobDtoRepository()
+        first, second = make_runner(repository), make_runner(repository)
+        job_id = await submit(first)
+
+        claimed = await first.tick()
+        assert await second.tick() == []
+        await asyncio.gather(*list(first._inflight.values()))
+
+        assert claimed == [job_id]
+        assert first._tool_executor.poll_status.await_count == 1  # type: ignore[attr-defined]
+        assert second._tool_executor.poll_status.await_count == 0  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_poll_budget_exhaustion_fails_job(self):
+        """The job fails with poll_timeout after max_poll_attempts pending polls."""
+        repository = InMemoryToolJobDtoRepository()
+        runner = make_runner(repository)
+        job_id = await submit(runner, max_poll_attempts=2, poll_interval_seconds=0.0)
+
+        await run_tick(runner)
+        await run_tick(runner)
+
+        job = await repository.get_async(job_id)
+        assert job.status == ToolJobStatus.FAILED
+        assert job.error["error_code"] == "poll_timeout"
+
+    @pytest.mark.asyncio
+    async def test_token_exchange_job_is_only_taken_over_when_orphaned(self):
+        """Jobs needing the caller's token stay on their replica until it is presumed gone."""
+        repository = InMemoryToolJobDtoRepository()
+        owner, other = make_runner(repository), make_runner(repository, orphan_after_seconds=60)
+        job_id = await submit(owner, auth_mode=AuthMode.TOKEN_EXCHANGE)
+        job = await repository.get_async(job_id)
+        job.next_poll_at = time.time() - 1
+
+        assert await run_tick(other) == []
+
+        job.next_poll_at = time.time() - 120
+        await run_tick(other)
+
+        assert job.status == ToolJobStatus.FAILED
+        assert job.error["error_code"] == "credentials_unavailable"
+        other._tool_executor.poll_status.assert_not_awaited()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_caller_token_of_job_finished_elsewhere_is_released(self):
+        """The accepting replica drops the token of a job another replica took over and finished."""
+        repository = InMemoryToolJobDtoRepository()
+        owner, other = make_runner(repository, lease_seconds=0), make_runner(repository, orphan_after_seconds=60)
+        finished_id = await submit(owner, auth_mode=AuthMode.TOKEN_EXCHANGE)
+        running_id = await submit(owner, auth_mode=AuthMode.TOKEN_EXCHANGE)
+        (await repository.get_async(finished_id)).next_poll_at = time.time() - 120
+        (await repository.get_async(running_id)).next_poll_at = time.time() + 60
+
+        await run_tick(other)
+        assert set(owner._caller_tokens) == {finished_id, running_id}
+
+        await run_tick(owner)
+
+        assert set(owner._caller_tokens) == {running_id}
+
+    @pytest.mark.asyncio
+    async def test_job_is_only_visible_to_its_owner(self):
+        """Other users get not found for a job ID."""
+        repository = InMemoryToolJobDtoRepository()
+        job_id = await submit(make_runner(repository))
+        handler = GetToolJobQueryHandler(tool_job_repository=repository)
+
+        own = await handler.handle_async(GetToolJobQuery(job_id=job_id, user_info={"sub": "u1"}))
+        other = await handler.handle_async(GetToolJobQuery(job_id=job_id, user_info={"sub": "u2"}))
+
+        assert own.status == 200
+        assert own.data["status"] == ToolJobStatus.RUNNING
+        assert other.status == 404
+
+
+class TestToolExecutorBackgroundPoll:
+    """Tests for the background mode of ASYNC_POLL execution."""
+
+    @pytest.mark.asyncio
+    async def test_background_mode_returns_after_trigger(self):
+        """Only the trigger request is made; the status URL is rendered from its response."""
+        executor = ToolExecutor(token_exchanger=MagicMock())
+        executor._execute_sync = AsyncMock(  # type: ignore[method-assign]
+            return_value=ToolExecutionResult(tool_id="src:report", status="completed", result={"job_id": "42"}, execution_time_ms=0, upstream_status=202)
+        )
+        executor._do_http_request = AsyncMock()  # type: ignore[method-assign]
+        definition = ToolDefinition(
+            name="report",
+            description="Generate a report",
+            input_schema={"type": "object"},
+            execution_profile=ExecutionProfile(mode=ExecutionMode.ASYNC_POLL, method="POST", url_template="https://api.example.com/reports", poll_config=make_poll_config()),
+            source_path="/reports",
+        )
+
+        result = await executor.execute(tool_id="src:report", definition=definition, arguments={}, agent_token="user-jwt", auth_mode=AuthMode.NONE, background_poll=True)  # nosec B106
+
+        assert result.status == "pending"
+        assert result.metadata["status_url"] == "https://api.example.com/jobs/42"
+        executor._do_http_request.assert_not_awaited()
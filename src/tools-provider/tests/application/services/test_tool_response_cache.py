@@ -0,0 +1,208 @@
+"""Tests for opt-in response caching of idempotent tools."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import jwt
+import pytest
+
+from application.services.openapi_source_adapter import OpenAPISourceAdapter
+from application.services.tool_executor import ToolExecutionResult, ToolExecutor
+from application.services.tool_response_cache import ToolResponseCache
+from domain.enums import AuthMode, ExecutionMode
+from domain.models import CachePolicy, ExecutionProfile, ToolDefinition
+
+
+def make_token(**claims: Any) -> str:
+    return jwt.encode(claims, "test-secret-key-with-enough-length!", algorithm="HS256")
+
+
+def make_definition(method: str = "GET", policy: CachePolicy | None = None, url: str = "https://api.example.com/users") -> ToolDefinition:
+    return ToolDefinition(
+        name="list_users",
+        description="List users",
+        input_schema={"type": "object"},
+        execution_profile=ExecutionProfile(mode=ExecutionMode.SYNC_HTTP, method=method, url_template=url, cache_policy=policy),
+        source_path="/users",
+    )
+
+
+def make_executor(cache: ToolResponseCache, upstream: AsyncMock, **kwargs: Any) -> ToolExecutor:
+    executor = ToolExecutor(token_exchanger=MagicMock(), response_cache=cache, **kwargs)
+    executor._execute_sync = upstream  # type: ignore[method-assign]
+    return executor
+
+
+def completed(value: Any = "ok", status: str = "completed") -> AsyncMock:
+    return AsyncMock(side_effect=lambda **kw: ToolExecutionResult(tool_id=kw["tool_id"], status=status, result={"value": value}, execution_time_ms=0, upstream_status=200))
+
+
+async def run(executor: ToolExecutor, definition: ToolDefinition, token: str, auth_mode: AuthMode = AuthMode.NONE, **arguments: Any) -> ToolExecutionResult:
+    return await executor.execute(tool_id="src:list_users", definition=definition, arguments=arguments, agent_token=token, source_id="src", auth_mode=auth_mode)
+
+
+class TestToolResponseCache:
+    """Tests for caching in ToolExecutor.execute."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_is_served_from_cache(self):
+        """A second identical call within the TTL does not reach the upstream."""
+        upstream = completed()
+        executor = make_executor(ToolResponseCache(), upstream)
+        definition = make_definition(policy=CachePolicy(ttl_seconds=60))
+        token = make_token(sub="u1")
+
+        first = await run(executor, definition, token, page=1)
+        second = await run(executor, definition, token, page=1)
+
+        assert upstream.await_count == 1
+        assert first.metadata["cache"] == "miss"
+        assert second.metadata["cache"] == "hit"
+        assert second.result == {"value": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_while_revalidating(self):
+        """Past the TTL but within the stale window, the old value is returned and refreshed in the background."""
+        upstream = completed("v1")
+        cache = ToolResponseCache()
+        executor = make_executor(cache, upstream)
+        definition = make_definition(policy=CachePolicy(ttl_seconds=60, stale_while_revalidate_seconds=60))
+        token = make_token(sub="u1")
+
+        await run(executor, definition, token)
+        for entry in cache._local.values():
+            entry.fresh_until = 0
+        upstream.side_effect = completed("v2").side_effect
+
+        stale = await run(executor, definition, token)
+        await asyncio.gather(*cache._background_tasks)
+        fresh = await run(executor, definition, token)
+
+        assert stale.metadata["cache"] == "stale"
+        assert stale.result == {"value": "v1"}
+        assert fresh.metadata["cache"] == "hit"
+        assert fresh.result == {"value": "v2"}
+        assert upstream.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_upstream_call(self):
+        """Concurrent identical calls are coalesced."""
+
+        async def slow(**kw: Any) -> ToolExecutionResult:
+            await asyncio.sleep(0.01)
+            return ToolExecutionResult(tool_id=kw["tool_id"], status="completed", result=1, execution_time_ms=0, upstream_status=200)
+
+        upstream = AsyncMock(side_effect=slow)
+        executor = make_executor(ToolResponseCache(), upstream)
+        definition = make_definition(policy=CachePolicy(ttl_seconds=60))
+        token = make_token(sub="u1")
+
+        await asyncio.gather(*(run(executor, definition, token) for _ in range(5)))
+
+        assert upstream.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_user_scope_separates_users(self):
+        """Different users never share entries under user scope."""
+        upstream = completed()
+        executor = make_executor(ToolResponseCache(), upstream)
+        definition = make_definition(policy=CachePolicy(ttl_seconds=60))
+
+        await run(executor, definition, make_token(sub="u1"))
+        result = await run(executor, definition, make_token(sub="u2"))
+
+        assert result.metadata["cache"] == "miss"
+        assert upstream.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_scope_is_narrowed_for_identity_bound_upstreams(self):
+        """With vary_by_auth, token-exchange tools are cached per user even if the scope is shared."""
+        upstream = completed()
+        executor = make_executor(ToolResponseCache(), upstream)
+        executor._get_upstream_token = AsyncMock(return_value="upstream-token")  # type: ignore[method-assign]
+        definition = make_definition(policy=CachePolicy(ttl_seconds=60, scope="shared"))
+
+        await run(executor, definition, make_token(sub="u1"), auth_mode=AuthMode.TOKEN_EXCHANGE)
+        other_user = await run(executor, definition, make_token(sub="u2"), auth_mode=AuthMode.TOKEN_EXCHANGE)
+        await run(executor, definition, make_token(sub="u1"), auth_mode=AuthMode.API_KEY)
+        shared = await run(executor, definition, make_token(sub="u2"), auth_mode=AuthMode.API_KEY)
+
+        assert other_user.metadata["cache"] == "miss"
+        assert shared.metadata["cache"] == "hit"
+
+    @pytest.mark.asyncio
+    async def test_changed_definition_does_not_serve_old_entries(self):
+        """Entries are keyed by the definition hash."""
+        upstream = completed()
+        executor = make_executor(ToolResponseCache(), upstream)
+        token = make_token(sub="u1")
+
+        await run(executor, make_definition(policy=CachePolicy(ttl_seconds=60)), token)
+        result = await run(executor, make_definition(policy=CachePolicy(ttl_seconds=60), url="https://api.example.com/v2/users"), token)
+
+        assert result.metadata["cache"] == "miss"
+
+    @pytest.mark.asyncio
+    async def test_key_arguments_select_the_key(self):
+        """Arguments outside key_arguments do not split entries."""
+        upstream = completed()
+        executor = make_executor(ToolResponseCache(), upstream)
+        definition = make_definition(policy=CachePolicy(ttl_seconds=60, key_arguments=["page"]))
+        token = make_token(sub="u1")
+
+        await run(executor, definition, token, page=1, trace_id="a")
+        result = await run(executor, definition, token, page=1, trace_id="b")
+
+        assert result.metadata["cache"] == "hit"
+
+    @pytest.mark.asyncio
+    async def test_non_get_and_failed_responses_are_not_cached(self):
+        """POST tools bypass the cache and failed responses are not stored."""
+        upstream = completed(status="failed")
+        executor = make_executor(ToolResponseCache(), upstream)
+        token = make_token(sub="u1")
+
+        await run(executor, make_definition(policy=CachePolicy(ttl_seconds=60)), token)
+        await run(executor, make_definition(policy=CachePolicy(ttl_seconds=60)), token)
+        post = await run(executor, make_definition(method="POST", policy=CachePolicy(ttl_seconds=60)), token)
+
+        assert upstream.await_count == 3
+        assert "cache" not in post.metadata
+
+    @pytest.mark.asyncio
+    async def test_source_policy_applies_to_tools_without_their_own(self):
+        """A per-source default policy caches tools that did not opt in individually."""
+        upstream = completed()
+        executor = make_executor(ToolResponseCache(), upstream, source_cache_policies={"src": CachePolicy(ttl_seconds=60)})
+        token = make_token(sub="u1")
+
+        await run(executor, make_definition(), token)
+        result = await run(executor, make_definition(), token)
+
+        assert result.metadata["cache"] == "hit"
+
+
+class TestCachePolicy:
+    """Tests for the CachePolicy value object."""
+
+    def test_round_trip_through_execution_profile(self):
+        profile = ExecutionProfile(mode=ExecutionMode.SYNC_HTTP, method="GET", url_template="https://x", cache_policy=CachePolicy(ttl_seconds=30, scope="tenant"))
+
+        assert ExecutionProfile.from_dict(profile.to_dict()).cache_policy == profile.cache_policy
+
+    def test_uncached_profile_serialization_is_unchanged(self):
+        profile = ExecutionProfile(mode=ExecutionMode.SYNC_HTTP, method="GET", url_template="https://x")
+
+        assert "cache_policy" not in profile.to_dict()
+
+    def test_invalid_scope_is_rejected(self):
+        with pytest.raises(ValueError):
+            CachePolicy(ttl_seconds=30, scope="global")
+
+    def test_openapi_x_cache_extension_on_get_only(self):
+        adapter = OpenAPISourceAdapter()
+
+        assert adapter._extract_cache_policy("GET", {"x-cache": {"ttl_seconds": 30}}, "op") == CachePolicy(ttl_seconds=30)
+        assert adapter._extract_cache_policy("POST", {"x-cache": {"ttl_seconds": 30}}, "op") is None
+        assert adapter._extract_cache_policy("GET", {"x-cache": {"ttl_seconds": 0}}, "op") is None
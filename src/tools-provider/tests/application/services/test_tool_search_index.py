@@ -0,0 +1,202 @@
+"""Tests for the in-memory ranked tool search index."""
+
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.queries.tool.get_source_tools_query import SearchToolsPageQuery, SearchToolsPageQueryHandler, SearchToolsQuery, SearchToolsQueryHandler
+from application.services.tool_search_index import ToolSearchIndex, tokenize
+from integration.models.source_tool_dto import SourceToolDto
+
+
+def doc(tool_id: str, description: str = "", tags: list[str] | None = None, path: str = "", **fields: Any) -> dict[str, Any]:
+    source_id, operation_id = tool_id.split(":")
+    return {
+        "id": tool_id,
+        "source_id": source_id,
+        "tool_name": operation_id,
+        "operation_id": operation_id,
+        "description": description,
+        "path": path,
+        "tags": tags or [],
+        "label_ids": [],
+        "is_enabled": True,
+        "status": "active",
+        **fields,
+    }
+
+
+def dto(document: dict[str, Any]) -> SourceToolDto:
+    return SourceToolDto(method="GET", execution_mode="sync_http", source_name="", **document)
+
+
+CATALOG = [
+    doc("weather:get_forecast", "Get the weather forecast for a city", ["weather"], "/forecast/{city}"),
+    doc("weather:get_alerts", "Severe weather alerts", ["weather", "alerts"], "/alerts"),
+    doc("crm:list_customers", "List customers of the CRM", ["crm"], "/customers"),
+    doc("crm:create_invoice", "Create an invoice for a customer", ["billing", "crm"], "/invoices"),
+    doc("crm:delete_customer", "Delete a customer", ["crm"], "/customers/{id}", is_enabled=False),
+    doc("legacy:get_weather", "Old weather endpoint", ["weather"], "/weather", status="deprecated"),
+]
+
+
+class FakeMotorClient:
+    """Serves ``find`` from in-memory collections (filters other than the projection are ignored)."""
+
+    def __init__(self, collections: dict[str, list[dict[str, Any]]]):
+        self.collections = collections
+        self.finds: list[tuple[dict[str, Any], dict[str, Any]]] = []
+
+    def __getitem__(self, name: str) -> "FakeMotorClient":
+        return self
+
+    def find(self, filter_dict: dict[str, Any], projection: dict[str, Any]):
+        self.finds.append((filter_dict, projection))
+        documents = self.collections["label" if "name" in projection else "sourcetool"]
+
+        async def iterate():
+            for document in list(documents):
+                yield document
+
+        return iterate()
+
+
+def loaded_index(documents: list[dict[str, Any]] = CATALOG, labels: dict[str, str] | None = None) -> ToolSearchIndex:
+    index = ToolSearchIndex()
+    index.load(documents, labels)
+    return index
+
+
+class TestTokenize:
+    def test_splits_identifiers_and_paths(self):
+        assert tokenize("getForecast get_city_weather /v2/cities/{cityId}") == ["get", "forecast", "get", "city", "weather", "v2", "cities", "city", "id"]
+
+
+class TestToolSearchIndex:
+    """Tests for ranking, matching and filters."""
+
+    def test_name_matches_rank_before_description_matches(self):
+        hits = loaded_index().search("forecast")
+
+        assert hits.ids == ["weather:get_forecast"]
+
+        hits = loaded_index().search("customer")
+        assert hits.ids == ["crm:list_customers", "crm:create_invoice"]
+
+    def test_prefix_and_typo_matching(self):
+        index = loaded_index()
+
+        assert index.search("forec").ids == ["weather:get_forecast"]
+        assert index.search("invoce").ids == ["crm:create_invoice"]
+        assert index.search("xyzzy").total == 0
+
+    def test_filters_exclude_disabled_deprecated_and_other_sources(self):
+        index = loaded_index()
+
+        assert "legacy:get_weather" not in index.search("weather", include_disabled=True).ids
+        assert "crm:delete_customer" not in index.search("customer").ids
+        assert "crm:delete_customer" in index.search("customer", include_disabled=True).ids
+        assert index.search("weather", tags=["weather", "alerts"]).ids == ["weather:get_alerts"]
+        assert index.search("customer", source_id="weather").total == 0
+
+    def test_pagination_and_facets(self):
+        index = loaded_index()
+
+        everything = index.search("weather customer")
+        page = index.search("weather customer", offset=1, limit=2)
+
+        assert everything.total == page.total == 4
+        assert page.ids == everything.ids[1:3]
+        assert page.facets["source_id"] == {"weather": 2, "crm": 2}
+        assert page.facets["tags"]["crm"] == 2
+
+    def test_projection_updates_and_label_renames(self):
+        index = loaded_index(labels={"lbl-1": "Finance"})
+        tool = dto(doc("crm:export_ledger", "Export the ledger", ["crm"], "/ledger", label_ids=["lbl-1"]))
+
+        index.upsert(tool)
+        assert index.search("finance").ids == ["crm:export_ledger"]
+
+        index.set_label("lbl-1", "Accounting")
+        assert index.search("finance").total == 0
+        assert index.search("accounting").ids == ["crm:export_ledger"]
+
+        tool.is_enabled = False
+        index.upsert(tool)
+        assert index.search("ledger").total == 0
+
+        index.remove("crm:export_ledger")
+        assert index.search("ledger", include_disabled=True).total == 0
+
+    def test_changes_before_load_are_replayed(self):
+        index = ToolSearchIndex()
+        index._loading = True
+        index.upsert(dto(doc("crm:list_customers", "Renamed while loading", ["crm"])))
+
+        index.load(CATALOG)
+
+        assert index.ready
+        assert index.search("renamed").ids == ["crm:list_customers"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_applies_changes_projected_elsewhere(self):
+        """Changed, deleted and relabelled tools in MongoDB reach the index on refresh."""
+        documents = [*CATALOG[:3], doc("crm:export_ledger", "Export the ledger", label_ids=["lbl-1"])]
+        labels = [{"id": "lbl-1", "name": "Finance"}]
+        index = ToolSearchIndex(client=FakeMotorClient({"sourcetool": documents, "label": labels}), database_name="db")
+        await index.load_async()
+
+        documents[0] = {**CATALOG[0], "description": "Hourly weather outlook"}
+        del documents[1]
+        labels[0] = {"id": "lbl-1", "name": "Accounting"}
+        await index.refresh_async()
+
+        assert index.search("outlook").ids == ["weather:get_forecast"]
+        assert index.search("alerts").total == 0
+        assert index.search("finance").total == 0
+        assert index.search("accounting").ids == ["crm:export_ledger"]
+        assert "updated_at" in index._client.finds[-2][0]  # type: ignore[union-attr]
+
+    def test_query_latency_on_large_catalog(self):
+        verbs = ["get", "list", "create", "update", "delete", "search"]
+        nouns = [f"resource{i}" for i in range(1700)]
+        documents = [doc(f"src{n % 20}:{verb}_{noun}", f"{verb.title()} a {noun} record", [f"tag{n % 50}"]) for n, noun in enumerate(nouns) for verb in verbs]
+        index = loaded_index(documents)
+        index.search("warmup")
+
+        started = time.perf_counter()
+        for _ in range(20):
+            hits = index.search("resource123 update", limit=20)
+        elapsed_ms = (time.perf_counter() - started) * 1000 / 20
+
+        assert len(documents) > 10_000
+        assert hits.ids[0] == "src3:update_resource123"
+        assert elapsed_ms < 50
+
+
+class TestSearchToolsQueryHandler:
+    """Tests for index and MongoDB backed search."""
+
+    @pytest.mark.asyncio
+    async def test_uses_index_when_loaded(self):
+        repository = MagicMock()
+        repository.get_by_ids_async = AsyncMock(side_effect=lambda ids: [dto(d) for d in CATALOG if d["id"] in ids])
+        handler = SearchToolsPageQueryHandler(repository, loaded_index())
+
+        result = await handler.handle_async(SearchToolsPageQuery(query="weather", limit=1))
+
+        assert [tool.id for tool in result.data.items] == ["weather:get_alerts"]
+        assert result.data.total == 2
+        repository.search_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_mongodb_until_loaded(self):
+        repository = MagicMock()
+        repository.search_async = AsyncMock(return_value=[dto(d) for d in CATALOG[:3]])
+        handler = SearchToolsQueryHandler(repository, ToolSearchIndex())
+
+        result = await handler.handle_async(SearchToolsQuery(query="weather", offset=1, limit=1))
+
+        assert [tool.id for tool in result.data] == ["weather:get_alerts"]
@@ -0,0 +1,113 @@
+"""Tests for the workspace TTL index, quotas and janitor."""
+
+import os
+import shutil
+import time
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from application.services.builtin_tool_executor import BuiltinToolExecutor
+from application.services.builtin_tools import UserContext, file_tools
+from application.services.builtin_tools.workspace import WorkspaceIndex, WorkspaceJanitor
+
+
+def _write(path, content: bytes, age_seconds: float = 0) -> str:
+    path = str(path)
+    with open(path, "wb") as f:
+        f.write(content)
+    if age_seconds:
+        mtime = time.time() - age_seconds
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestWorkspaceIndex:
+    """Tests for TTL tracking and usage accounting."""
+
+    def test_usage_loads_existing_files_lazily(self, tmp_path):
+        """Files already on disk are counted the first time usage is needed."""
+        _write(tmp_path / "a.txt", b"x" * 10)
+        _write(tmp_path / "b.txt", b"x" * 5)
+
+        assert WorkspaceIndex().usage(str(tmp_path)) == 15
+
+    def test_quota_excludes_replaced_file(self, tmp_path):
+        """Overwriting a file only counts the new size against the quota."""
+        index = WorkspaceIndex(quota_bytes=100)
+        path = _write(tmp_path / "a.txt", b"x" * 80)
+        index.record_write(str(tmp_path), path)
+
+        assert index.exceeds_quota(str(tmp_path), path, 90) is False
+        assert index.exceeds_quota(str(tmp_path), str(tmp_path / "b.txt"), 30) is True
+
+    def test_sweep_removes_only_expired_files(self, tmp_path):
+        """Expired files are deleted and their bytes released."""
+        index = WorkspaceIndex(ttl_seconds=60)
+        old = _write(tmp_path / "old.txt", b"x" * 10, age_seconds=120)
+        fresh = _write(tmp_path / "fresh.txt", b"x" * 10)
+        index.load_workspace(str(tmp_path))
+
+        assert index.sweep() == 1
+        assert not os.path.exists(old)
+        assert os.path.exists(fresh)
+        assert index.usage(str(tmp_path)) == 10
+
+    def test_sweep_keeps_rewritten_file(self, tmp_path):
+        """A file rewritten after being indexed gets a new expiry."""
+        index = WorkspaceIndex(ttl_seconds=60)
+        path = _write(tmp_path / "a.txt", b"x", age_seconds=120)
+        index.load_workspace(str(tmp_path))
+        _write(path, b"xy")
+
+        assert index.sweep() == 0
+        assert os.path.exists(path)
+        assert index.usage(str(tmp_path)) == 2
+
+
+class TestWorkspaceJanitor:
+    """Tests for the background janitor."""
+
+    @pytest.mark.asyncio
+    async def test_sweep_once_rebuilds_index_from_disk(self, tmp_path):
+        """The first sweep indexes all workspaces under the roots and deletes expired files."""
+        workspace = tmp_path / "user-1"
+        workspace.mkdir()
+        expired = _write(workspace / "old.txt", b"x", age_seconds=7200)
+        janitor = WorkspaceJanitor(WorkspaceIndex(ttl_seconds=3600), roots=[str(tmp_path)])
+
+        assert await janitor.sweep_once() == 1
+        assert not os.path.exists(expired)
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, tmp_path):
+        """The sweep loop starts and stops with the host."""
+        janitor = WorkspaceJanitor(WorkspaceIndex(), roots=[str(tmp_path)], interval_seconds=3600)
+
+        await janitor.start_async()
+        await janitor.stop_async()
+
+        assert janitor._task is None
+
+
+class TestFileWriterQuota:
+    """Tests for quota enforcement in file_writer."""
+
+    @pytest.mark.asyncio
+    async def test_write_over_quota_is_rejected(self):
+        """file_writer refuses content that would exceed the workspace quota."""
+        user_context = UserContext(user_id=f"quota-test-{uuid4().hex[:8]}")
+        index = WorkspaceIndex(quota_bytes=10)
+        try:
+            with patch.object(file_tools, "get_workspace_index", return_value=index):
+                executor = BuiltinToolExecutor()
+                ok = await executor.execute("file_writer", {"filename": "a.txt", "content": "12345"}, user_context)
+                rejected = await executor.execute("file_writer", {"filename": "b.txt", "content": "123456"}, user_context)
+
+            assert ok.success is True
+            assert rejected.success is False
+            assert "quota" in rejected.error
+            assert index.usage(file_tools._get_workspace_dir(user_context)) == 5
+        finally:
+            shutil.rmtree(file_tools._get_workspace_dir(user_context), ignore_errors=True)
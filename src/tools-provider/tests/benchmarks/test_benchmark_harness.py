@@ -0,0 +1,168 @@
+"""Tests for the tool proxy load-test harness.
+
+Tests cover:
+- Percentile and summary statistics
+- Baseline comparison and regression detection
+- Catalog generation and the in-memory read-model repositories
+- Stage recording around instrumented methods
+- The Motor-like collection used to run upstream-sample
+"""
+
+import jwt
+import pytest
+
+from application.settings import app_settings
+from benchmarks.catalog import UPSTREAM_SOURCE_ID, build_catalog
+from benchmarks.runner import compare, percentile, summarize
+from benchmarks.stages import StageRecorder
+from benchmarks.stand_ins import InMemoryCollection, InMemorySourceToolDtoRepository, mint_token
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+def make_report(**steps: tuple[float, float]) -> dict:
+    """Report with one step per ``key=(p95, rps)``."""
+    return {"steps": [{"scenario": key, "concurrency": 1, "latency_ms": {"p95": p95}, "rps": rps} for key, (p95, rps) in steps.items()]}
+
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+
+class TestStatistics:
+    def test_percentile_uses_nearest_rank(self) -> None:
+        samples = [float(value) for value in range(1, 101)]
+
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 95) == 95.0
+        assert percentile(samples, 100) == 100.0
+        assert percentile([7.0], 99) == 7.0
+
+    def test_percentile_of_no_samples_is_zero(self) -> None:
+        assert percentile([], 95) == 0.0
+
+    def test_summarize(self) -> None:
+        summary = summarize([4.0, 1.0, 3.0, 2.0])
+
+        assert summary == {"count": 4, "mean": 2.5, "p50": 2.0, "p95": 4.0, "p99": 4.0, "max": 4.0}
+        assert summarize([])["count"] == 0
+
+
+# ============================================================================
+# BASELINE COMPARISON
+# ============================================================================
+
+
+class TestCompare:
+    def test_within_threshold_is_not_a_regression(self) -> None:
+        rows = compare(make_report(list_tools=(10.5, 95.0)), make_report(list_tools=(10.0, 100.0)), threshold=0.10)
+
+        assert rows == [{"step": "list_tools@1", "p95_change": pytest.approx(0.05), "rps_change": pytest.approx(-0.05), "regressed": False}]
+
+    def test_p95_growth_regresses(self) -> None:
+        rows = compare(make_report(list_tools=(12.0, 100.0)), make_report(list_tools=(10.0, 100.0)), threshold=0.10)
+
+        assert rows[0]["regressed"] is True
+
+    def test_throughput_drop_regresses(self) -> None:
+        rows = compare(make_report(list_tools=(10.0, 80.0)), make_report(list_tools=(10.0, 100.0)), threshold=0.10)
+
+        assert rows[0]["regressed"] is True
+
+    def test_steps_missing_from_baseline_are_skipped(self) -> None:
+        rows = compare(make_report(list_tools=(10.0, 100.0), call_tool=(5.0, 50.0)), make_report(list_tools=(10.0, 100.0)))
+
+        assert [row["step"] for row in rows] == ["list_tools@1"]
+
+
+# ============================================================================
+# CATALOG AND READ MODEL
+# ============================================================================
+
+
+class TestCatalog:
+    def test_build_catalog_sizes(self) -> None:
+        catalog = build_catalog("http://upstream", tool_count=20, source_count=4)
+
+        assert len(catalog.sources) == 5  # pizzeria + filler
+        assert len(catalog.tools) == 22  # two pizzeria tools + filler
+        assert len(catalog.groups) == 5
+        assert len(catalog.policies) == 10
+        assert {tool.id for tool in catalog.tools if tool.source_id == UPSTREAM_SOURCE_ID} == {"pizzeria:list_menu_items", "pizzeria:get_menu_item"}
+
+    @pytest.mark.asyncio
+    async def test_seeded_tool_repository(self) -> None:
+        catalog = build_catalog("http://upstream", tool_count=20, source_count=4)
+        repository = InMemorySourceToolDtoRepository()
+        repository.seed(catalog.tools)
+
+        pizzeria_tools = await repository.get_by_source_id_async(UPSTREAM_SOURCE_ID)
+        found = await repository.get_by_ids_async(["pizzeria:get_menu_item", "missing"])
+
+        assert {tool.tool_name for tool in pizzeria_tools} == {"list_menu_items", "get_menu_item"}
+        assert [tool.id for tool in found] == ["pizzeria:get_menu_item"]
+        assert await repository.count_by_source_async(UPSTREAM_SOURCE_ID) == 2
+
+    def test_mint_token_is_decodable(self) -> None:
+        token = mint_token({"sub": "bench-user"})
+        claims = jwt.decode(token, app_settings.jwt_secret_key, algorithms=[app_settings.jwt_algorithm], options={"verify_aud": False})
+
+        assert claims["sub"] == "bench-user"
+        assert claims["exp"] > claims["iat"]
+
+
+# ============================================================================
+# STAGES
+# ============================================================================
+
+
+class TestStageRecorder:
+    @pytest.mark.asyncio
+    async def test_instrument_records_every_call_and_drain_resets(self) -> None:
+        class Target:
+            async def work(self, value: int) -> int:
+                return value * 2
+
+        recorder = StageRecorder()
+        target = Target()
+        recorder.instrument(target, "work", "stage")
+
+        assert await target.work(2) == 4
+        assert await target.work(3) == 6
+
+        samples = recorder.drain()
+        assert len(samples["stage"]) == 2
+        assert recorder.drain() == {}
+
+
+# ============================================================================
+# UPSTREAM DATABASE STAND-IN
+# ============================================================================
+
+
+class TestInMemoryCollection:
+    @pytest.mark.asyncio
+    async def test_crud_and_queries(self) -> None:
+        collection = InMemoryCollection()
+        await collection.insert_one({"id": "b", "category": "pizza", "price": 12})
+        await collection.insert_one({"id": "a", "category": "pizza", "price": 9})
+        await collection.insert_one({"id": "c", "category": "drink", "price": 3})
+
+        await collection.update_one({"id": "a"}, {"$set": {"price": 10}})
+        await collection.delete_one({"id": "c"})
+
+        assert [doc["id"] async for doc in collection.find({"category": "pizza"}).sort("id")] == ["a", "b"]
+        assert (await collection.find_one({"id": "a"}))["price"] == 10
+        assert await collection.count_documents({}) == 2
+
+    @pytest.mark.asyncio
+    async def test_find_one_and_update_increments_with_upsert(self) -> None:
+        collection = InMemoryCollection()
+
+        await collection.find_one_and_update({"_id": "orders"}, {"$inc": {"seq": 1}}, upsert=True)
+        counter = await collection.find_one_and_update({"_id": "orders"}, {"$inc": {"seq": 1}}, upsert=True, return_document=True)
+
+        assert counter is not None and counter["seq"] == 2
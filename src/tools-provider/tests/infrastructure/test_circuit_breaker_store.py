@@ -0,0 +1,165 @@
+"""Tests for cluster-shared circuit breaker state.
+
+Two CircuitBreaker instances sharing one store stand in for two replicas.
+
+Tests cover:
+- Failures counted cluster-wide and a single OPEN transition/event
+- Local rejection while open and no round-trip on the closed happy path
+- Single half-open probe and its outcome
+- Manual reset and fallback to local state when the store fails
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from domain.events.circuit_breaker import CircuitBreakerClosedDomainEvent, CircuitBreakerHalfOpenedDomainEvent, CircuitBreakerOpenedDomainEvent
+from infrastructure.adapters.circuit_breaker_store import InMemoryCircuitBreakerStore
+from infrastructure.adapters.keycloak_token_exchanger import CircuitBreaker, CircuitState, TokenExchangeError
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+async def ok() -> str:
+    return "ok"
+
+
+async def fail() -> None:
+    raise RuntimeError("upstream down")
+
+
+def make_replicas(store: InMemoryCircuitBreakerStore, events: list[Any], count: int = 2, **kwargs: Any) -> list[CircuitBreaker]:
+    async def on_state_change(event: Any) -> None:
+        events.append(event)
+
+    return [CircuitBreaker(failure_threshold=3, recovery_timeout=30.0, circuit_id="source:s1", store=store, on_state_change=on_state_change, **kwargs) for _ in range(count)]
+
+
+async def trip(breakers: list[CircuitBreaker], failures: int) -> None:
+    for i in range(failures):
+        with pytest.raises(RuntimeError):
+            await breakers[i % len(breakers)].call(fail)
+
+
+# ============================================================================
+# SHARED CIRCUIT BREAKER TESTS
+# ============================================================================
+
+
+class TestSharedCircuitBreaker:
+    """Test CircuitBreaker backed by a shared state store."""
+
+    @pytest.mark.asyncio
+    async def test_failures_from_all_replicas_open_the_circuit_once(self) -> None:
+        """Test the threshold counts failures cluster-wide and only one replica emits the event."""
+        events: list[Any] = []
+        first, second = make_replicas(InMemoryCircuitBreakerStore(), events)
+
+        await trip([first, second], 3)
+
+        assert [type(e) for e in events] == [CircuitBreakerOpenedDomainEvent]
+        with pytest.raises(TokenExchangeError) as exc:
+            await first.call(ok)
+        assert exc.value.error_code == "circuit_open"
+        with pytest.raises(TokenExchangeError):
+            await second.call(ok)
+
+    @pytest.mark.asyncio
+    async def test_closed_circuit_does_not_hit_store_while_mirror_is_fresh(self) -> None:
+        """Test the happy path uses the local copy of the shared state."""
+        store = InMemoryCircuitBreakerStore()
+        (breaker,) = make_replicas(store, [], count=1, state_cache_seconds=60)
+
+        with patch.object(store, "acquire", wraps=store.acquire) as acquire:
+            for _ in range(5):
+                assert await breaker.call(ok) == "ok"
+
+        assert acquire.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_rejects_without_store_round_trip(self) -> None:
+        """Test calls within the recovery window are rejected locally."""
+        store = InMemoryCircuitBreakerStore()
+        (breaker,) = make_replicas(store, [], count=1)
+        await trip([breaker], 3)
+
+        with patch.object(store, "acquire", AsyncMock()) as acquire:
+            with pytest.raises(TokenExchangeError):
+                await breaker.call(ok)
+
+        acquire.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_single_probe_closes_circuit_for_everyone(self) -> None:
+        """Test only one replica probes after the recovery timeout and its success closes the circuit."""
+        events: list[Any] = []
+        first, second = make_replicas(InMemoryCircuitBreakerStore(), events, state_cache_seconds=0)
+        await trip([first, second], 3)
+        for breaker in (first, second):
+            breaker.last_failure_time = 0.0
+        first.store._circuits["source:s1"]["last_failure"] = 0.0  # type: ignore[union-attr]
+
+        probe_started = asyncio.Event()
+        release_probe = asyncio.Event()
+
+        async def slow_probe() -> str:
+            probe_started.set()
+            await release_probe.wait()
+            return "ok"
+
+        probe = asyncio.create_task(first.call(slow_probe))
+        await probe_started.wait()
+        with pytest.raises(TokenExchangeError) as exc:
+            await second.call(ok)
+        assert exc.value.error_code == "circuit_testing"
+
+        release_probe.set()
+        assert await probe == "ok"
+        assert await second.call(ok) == "ok"
+        assert second.state == CircuitState.CLOSED
+        assert [type(e) for e in events] == [CircuitBreakerOpenedDomainEvent, CircuitBreakerHalfOpenedDomainEvent, CircuitBreakerClosedDomainEvent]
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens_circuit(self) -> None:
+        """Test a failing probe puts the circuit back to open."""
+        events: list[Any] = []
+        store = InMemoryCircuitBreakerStore()
+        (breaker,) = make_replicas(store, events, count=1)
+        await trip([breaker], 3)
+        breaker.last_failure_time = 0.0
+        store._circuits["source:s1"]["last_failure"] = 0.0
+
+        with pytest.raises(RuntimeError):
+            await breaker.call(fail)
+
+        assert breaker.state == CircuitState.OPEN
+        assert (await store.get("source:s1")).state == "open"
+        assert isinstance(events[-1], CircuitBreakerOpenedDomainEvent)
+
+    @pytest.mark.asyncio
+    async def test_manual_reset_closes_shared_circuit(self) -> None:
+        """Test reset clears the shared state and emits a closed event."""
+        events: list[Any] = []
+        store = InMemoryCircuitBreakerStore()
+        first, second = make_replicas(store, events, state_cache_seconds=0)
+        await trip([first, second], 3)
+
+        await second.reset(manual=True, reset_by="admin")
+
+        assert isinstance(events[-1], CircuitBreakerClosedDomainEvent)
+        assert events[-1].closed_by == "admin"
+        await first.refresh_state()
+        assert first.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_store_failure_falls_back_to_local_state(self) -> None:
+        """Test calls still go through when the shared store is unavailable."""
+        store = InMemoryCircuitBreakerStore()
+        (breaker,) = make_replicas(store, [], count=1)
+
+        with patch.object(store, "acquire", AsyncMock(side_effect=ConnectionError("redis down"))):
+            assert await breaker.call(ok) == "ok"
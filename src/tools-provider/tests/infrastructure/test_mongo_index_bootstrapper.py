@@ -0,0 +1,173 @@
+"""Tests for read-model index management and indexed tool search."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from infrastructure.mongo_index_bootstrapper import MongoIndexBootstrapper, collection_name_for, summarize_explain
+from integration.models.source_tool_dto import tool_name_tokens
+from integration.repositories import MotorSourceToolDtoRepository, MotorToolJobDtoRepository
+
+
+class FakeCursor:
+    def __init__(self, docs: list[dict[str, Any]]):
+        self._docs = docs
+
+    def sort(self, *args: Any) -> "FakeCursor":
+        return self
+
+    def __aiter__(self):
+        async def iterate():
+            for doc in self._docs:
+                yield dict(doc)
+
+        return iterate()
+
+
+class FakeCollection:
+    """Returns prefix matches for anchored regex filters and text hits for $text filters."""
+
+    def __init__(self, prefix_docs: list[dict[str, Any]], text_docs: list[dict[str, Any]] | Exception):
+        self.prefix_docs = prefix_docs
+        self.text_docs = text_docs
+        self.filters: list[dict[str, Any]] = []
+
+    def find(self, filter_dict: dict[str, Any], projection: dict[str, Any] | None = None) -> FakeCursor:
+        self.filters.append(filter_dict)
+        if "$text" in filter_dict:
+            if isinstance(self.text_docs, Exception):
+                raise self.text_docs
+            return FakeCursor(self.text_docs)
+        return FakeCursor(self.prefix_docs)
+
+
+def make_tool_repository(collection: FakeCollection) -> MotorSourceToolDtoRepository:
+    repository = MotorSourceToolDtoRepository(client=MagicMock(), database_name="db", collection_name="sourcetool", serializer=MagicMock())
+    repository._collection = collection  # type: ignore[assignment]
+    return repository
+
+
+def tool_doc(tool_id: str) -> dict[str, Any]:
+    return {"_id": tool_id, "id": tool_id, "tool_name": tool_id.split(":")[1], "source_id": "src"}
+
+
+class TestMongoIndexBootstrapper:
+    """Tests for MongoIndexBootstrapper."""
+
+    def test_collection_names_follow_read_model_convention(self):
+        assert collection_name_for(MotorSourceToolDtoRepository) == "sourcetool"
+        assert collection_name_for(MotorToolJobDtoRepository) == "tooljob"
+
+    def test_ttl_override_replaces_expiry_only(self):
+        bootstrapper = MongoIndexBootstrapper(client=MagicMock(), database_name="db", repositories={"tooljob": MotorToolJobDtoRepository}, ttl_overrides={"completed_at_ttl": 60})
+
+        models = {m.document["name"]: m.document for m in bootstrapper.index_models("tooljob")}
+
+        assert models["completed_at_ttl"]["expireAfterSeconds"] == 60
+        assert dict(models["completed_at_ttl"]["key"]) == {"completed_at": ASCENDING}
+        assert "expireAfterSeconds" not in models["status_next_poll"]
+
+    @pytest.mark.asyncio
+    async def test_conflicting_index_does_not_block_the_others(self):
+        """A failing index is skipped; a TTL conflict is resolved with collMod."""
+
+        class Repo:
+            INDEXES = [
+                IndexModel([("a", ASCENDING)], name="a"),
+                IndexModel([("b", ASCENDING)], name="b"),
+                IndexModel([("c", ASCENDING)], name="c_ttl", expireAfterSeconds=10),
+            ]
+
+        collection = MagicMock()
+        collection.create_indexes = AsyncMock(side_effect=[OperationFailure("conflict", code=86), ["b"], OperationFailure("conflict", code=85)])
+        database = MagicMock()
+        database.__getitem__.return_value = collection
+        database.command = AsyncMock(return_value={"ok": 1})
+        client = MagicMock()
+        client.__getitem__.return_value = database
+
+        ensured = await MongoIndexBootstrapper(client=client, database_name="db", repositories={"things": Repo}).ensure_indexes_async()
+
+        assert ensured == {"things": ["b", "c_ttl"]}
+        assert database.command.await_args.args[0] == {"collMod": "things", "index": {"name": "c_ttl", "expireAfterSeconds": 10}}
+
+    def test_summarize_classic_plan(self):
+        explain = {
+            "queryPlanner": {"winningPlan": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN", "indexName": "enabled_status_name"}}},
+            "executionStats": {"nReturned": 3, "totalKeysExamined": 3, "totalDocsExamined": 3, "executionTimeMillis": 1},
+        }
+
+        summary = summarize_explain(explain)
+
+        assert summary["stages"] == ["FETCH", "IXSCAN"]
+        assert summary["indexes"] == ["enabled_status_name"]
+        assert summary["collection_scan"] is False
+        assert summary["docs_examined"] == 3
+
+    def test_summarize_slot_based_plan_flags_collection_scan(self):
+        explain = {"queryPlanner": {"winningPlan": {"queryPlan": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}}}}, "executionStats": {"nReturned": 0}}
+
+        summary = summarize_explain(explain)
+
+        assert summary["collection_scan"] is True
+        assert summary["indexes"] == []
+
+
+class TestToolNameTokens:
+    """Tests for tool_name_tokens."""
+
+    @pytest.mark.parametrize(
+        ("tool_name", "tokens"),
+        [
+            ("getUserByID", ["get", "user", "by", "id"]),
+            ("get_user-by id", ["get", "user", "by", "id"]),
+            ("HTTPServer_v2", ["http", "server", "v", "2"]),
+            ("list_users_users", ["list", "users"]),
+        ],
+    )
+    def test_splits_on_separators_and_camel_case(self, tool_name: str, tokens: list[str]):
+        assert tool_name_tokens(tool_name) == tokens
+
+
+class TestSourceToolSearch:
+    """Tests for MotorSourceToolDtoRepository.search_async."""
+
+    @pytest.mark.asyncio
+    async def test_name_prefix_matches_come_first_without_duplicates(self):
+        collection = FakeCollection(prefix_docs=[tool_doc("src:get_user")], text_docs=[tool_doc("src:list_users"), tool_doc("src:get_user")])
+
+        tools = await make_tool_repository(collection).search_async("get_user")
+
+        assert [t.id for t in tools] == ["src:get_user", "src:list_users"]
+        assert collection.filters[0]["$or"][:2] == [{"name_lower": {"$regex": "^get_user"}}, {"name_tokens": {"$regex": "^get_user"}}]
+        assert collection.filters[1]["$text"] == {"$search": "get_user"}
+        assert collection.filters[1]["status"] == "active" and collection.filters[1]["is_enabled"] is True
+
+    @pytest.mark.asyncio
+    async def test_query_is_normalized_and_escaped_in_name_prefix(self):
+        collection = FakeCollection(prefix_docs=[], text_docs=[])
+
+        await make_tool_repository(collection).search_async(" A.b( ")
+
+        assert collection.filters[0]["$or"][0] == {"name_lower": {"$regex": r"^a\.b\("}}
+
+    @pytest.mark.asyncio
+    async def test_tools_without_normalized_name_are_matched_case_insensitively(self):
+        collection = FakeCollection(prefix_docs=[], text_docs=[])
+
+        await make_tool_repository(collection).search_async("User")
+
+        assert collection.filters[0]["$or"][2] == {"name_lower": {"$in": [None, ""]}, "tool_name": {"$regex": "user", "$options": "i"}}
+
+    @pytest.mark.asyncio
+    async def test_missing_text_index_falls_back_to_regex(self):
+        collection = FakeCollection(prefix_docs=[tool_doc("src:get_user")], text_docs=OperationFailure("text index required for $text query", code=27))
+
+        tools = await make_tool_repository(collection).search_async("user", source_id="src")
+
+        assert [t.id for t in tools] == ["src:get_user"]
+        assert collection.filters[-1]["source_id"] == "src"
+        assert "$or" in collection.filters[-1]
@@ -0,0 +1,244 @@
+"""Tests for TokenBroker.
+
+Tests cover:
+- Single-flight fetches for concurrent misses
+- Bounded local (LRU) tier
+- Proactive background refresh
+- Shared (Redis) tier round-trip
+- Adapter integration (OAuth2ClientCredentialsService)
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import jwt
+import pytest
+
+from infrastructure.adapters.keycloak_token_exchanger import TokenExchangeResult
+from infrastructure.adapters.oauth2_client import ClientCredentialsToken, OAuth2ClientCredentialsService
+from infrastructure.adapters.token_broker import TokenBroker, jwt_expires_at
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+
+class FakeRedisClient:
+    """Minimal in-memory stand-in for the redis.asyncio client."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.data[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def scan_iter(self, pattern: str):
+        prefix = pattern.rstrip("*")
+        for key in list(self.data):
+            if key.startswith(prefix):
+                yield key
+
+
+class FakeCacheService:
+    def __init__(self) -> None:
+        self.client = FakeRedisClient()
+
+
+def make_token(value: str, lifetime_seconds: int = 300) -> TokenExchangeResult:
+    return TokenExchangeResult(access_token=value, expires_in=lifetime_seconds, expires_at=datetime.now(UTC) + timedelta(seconds=lifetime_seconds))
+
+
+# ============================================================================
+# TOKEN BROKER TESTS
+# ============================================================================
+
+
+class TestTokenBroker:
+    """Test TokenBroker caching behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self) -> None:
+        """Test concurrent callers for the same key trigger a single fetch."""
+        broker = TokenBroker()
+        calls = 0
+
+        async def fetch() -> TokenExchangeResult:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return make_token("shared")
+
+        results = await asyncio.gather(*(broker.get_token("k", fetch, TokenExchangeResult, "test") for _ in range(20)))
+
+        assert calls == 1
+        assert {r.access_token for r in results} == {"shared"}
+
+    @pytest.mark.asyncio
+    async def test_cached_token_is_reused(self) -> None:
+        """Test a cached token is served without fetching again."""
+        broker = TokenBroker()
+        fetch = AsyncMock(return_value=make_token("t1"))
+
+        await broker.get_token("k", fetch, TokenExchangeResult, "test")
+        token = await broker.get_token("k", fetch, TokenExchangeResult, "test")
+
+        assert token.access_token == "t1"
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_skip_cache_fetches_fresh_token(self) -> None:
+        """Test skip_cache bypasses the cached token."""
+        broker = TokenBroker()
+        fetch = AsyncMock(side_effect=[make_token("t1"), make_token("t2")])
+
+        await broker.get_token("k", fetch, TokenExchangeResult, "test")
+        token = await broker.get_token("k", fetch, TokenExchangeResult, "test", skip_cache=True)
+
+        assert token.access_token == "t2"
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_is_propagated_and_not_cached(self) -> None:
+        """Test a failed fetch raises for all waiters and is retried next time."""
+        broker = TokenBroker()
+        fetch = AsyncMock(side_effect=[RuntimeError("idp down"), make_token("t1")])
+
+        with pytest.raises(RuntimeError):
+            await broker.get_token("k", fetch, TokenExchangeResult, "test")
+        token = await broker.get_token("k", fetch, TokenExchangeResult, "test")
+
+        assert token.access_token == "t1"
+
+    @pytest.mark.asyncio
+    async def test_tokens_within_min_ttl_are_not_served(self) -> None:
+        """Test tokens about to expire are refetched."""
+        broker = TokenBroker(default_min_ttl_seconds=60)
+        fetch = AsyncMock(side_effect=[make_token("short", lifetime_seconds=30), make_token("long")])
+
+        await broker.get_token("k", fetch, TokenExchangeResult, "test")
+        token = await broker.get_token("k", fetch, TokenExchangeResult, "test")
+
+        assert token.access_token == "long"
+
+    @pytest.mark.asyncio
+    async def test_local_tier_is_bounded(self) -> None:
+        """Test the least recently used tokens are evicted."""
+        broker = TokenBroker(max_local_entries=2)
+
+        for key in ("a", "b", "c"):
+            await broker.get_token(key, AsyncMock(return_value=make_token(key)), TokenExchangeResult, "test")
+
+        assert broker.count_local() == 2
+        assert broker.count_local("a") == 0
+
+    @pytest.mark.asyncio
+    async def test_aging_token_is_refreshed_in_background(self) -> None:
+        """Test a token past the refresh fraction is served while a new one is fetched."""
+        broker = TokenBroker(refresh_fraction=0.5, default_min_ttl_seconds=0)
+        await broker.get_token("k", AsyncMock(return_value=make_token("old", lifetime_seconds=100)), TokenExchangeResult, "test")
+
+        refresh_fetch = AsyncMock(return_value=make_token("new"))
+        with patch("infrastructure.adapters.token_broker.time.time", return_value=datetime.now(UTC).timestamp() + 60):
+            token = await broker.get_token("k", refresh_fetch, TokenExchangeResult, "test")
+        assert token.access_token == "old"
+
+        await asyncio.gather(*broker._background_tasks)
+        token = await broker.get_token("k", refresh_fetch, TokenExchangeResult, "test")
+
+        assert token.access_token == "new"
+        assert refresh_fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_no_refresh_when_credential_expires_before_cached_token(self) -> None:
+        """Test no refresh is fetched with a subject token that expires before the cached token."""
+        broker = TokenBroker(refresh_fraction=0.5, default_min_ttl_seconds=0)
+        await broker.get_token("k", AsyncMock(return_value=make_token("old", lifetime_seconds=100)), TokenExchangeResult, "test")
+        subject_expires_at = datetime.now(UTC) + timedelta(seconds=80)
+
+        refresh_fetch = AsyncMock(return_value=make_token("new"))
+        with patch("infrastructure.adapters.token_broker.time.time", return_value=datetime.now(UTC).timestamp() + 60):
+            token = await broker.get_token("k", refresh_fetch, TokenExchangeResult, "test", refresh_until=subject_expires_at)
+
+        assert token.access_token == "old"
+        assert broker._background_tasks == set()
+        refresh_fetch.assert_not_awaited()
+
+    def test_jwt_expires_at_reads_exp_claim(self) -> None:
+        """Test the expiry of a subject token is read without verifying it."""
+        exp = int(datetime.now(UTC).timestamp()) + 300
+        token = jwt.encode({"sub": "agent", "exp": exp}, "secret", algorithm="HS256")
+
+        assert jwt_expires_at(token) == datetime.fromtimestamp(exp, UTC)
+        assert jwt_expires_at("not-a-jwt") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_is_used_across_brokers(self) -> None:
+        """Test a token fetched by one instance is served to another via Redis."""
+        cache = FakeCacheService()
+        first = TokenBroker(cache_service=cache)
+        second = TokenBroker(cache_service=cache)
+
+        await first.get_token("k", AsyncMock(return_value=make_token("t1")), TokenExchangeResult, "test")
+        fetch = AsyncMock()
+        token = await second.get_token("k", fetch, TokenExchangeResult, "test")
+
+        assert token.access_token == "t1"
+        assert isinstance(token.expires_at, datetime)
+        fetch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_clears_both_tiers(self) -> None:
+        """Test invalidate removes matching tokens locally and in Redis."""
+        cache = FakeCacheService()
+        broker = TokenBroker(cache_service=cache)
+        await broker.get_token("token_exchange:a", AsyncMock(return_value=make_token("t1")), TokenExchangeResult, "test")
+        await broker.get_token("other:b", AsyncMock(return_value=make_token("t2")), TokenExchangeResult, "test")
+
+        removed = await broker.invalidate(pattern="token_exchange:*", predicate=lambda key: key.startswith("token_exchange:"))
+
+        assert removed == 2
+        assert broker.count_local() == 1
+        assert list(cache.client.data) == ["mcp:tokens:other:b"]
+
+
+class TestClientCredentialsWithBroker:
+    """Test OAuth2ClientCredentialsService caching through the broker."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_acquire_once(self) -> None:
+        """Test concurrent get_token calls share one token request."""
+        service = OAuth2ClientCredentialsService("https://idp/token", "client", "secret")  # pragma: allowlist secret
+        token = ClientCredentialsToken(access_token="cc", expires_at=datetime.now(UTC) + timedelta(minutes=5))
+
+        async def acquire(**kwargs: Any) -> ClientCredentialsToken:
+            await asyncio.sleep(0.01)
+            return token
+
+        with patch.object(service, "_acquire_token", AsyncMock(side_effect=acquire)) as acquire_mock:
+            results = await asyncio.gather(*(service.get_token() for _ in range(10)))
+
+        assert results == ["cc"] * 10
+        assert acquire_mock.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_for_client(self) -> None:
+        """Test clear_cache only drops the given client's tokens."""
+        broker = TokenBroker()
+        service = OAuth2ClientCredentialsService("https://idp/token", "client", "secret", token_broker=broker)  # pragma: allowlist secret
+        token = ClientCredentialsToken(access_token="cc", expires_at=datetime.now(UTC) + timedelta(minutes=5))
+
+        with patch.object(service, "_acquire_token", AsyncMock(return_value=token)):
+            await service.get_token()
+            await service.get_token(client_id="other", client_secret="secret")  # pragma: allowlist secret
+
+        service.clear_cache("other")
+
+        assert broker.count_local(OAuth2ClientCredentialsService.KEY_PREFIX) == 1